@@ -494,9 +494,12 @@ def acl():
     table.oacl.represent = lambda val: acl_represent(val,
                                                      auth.permission.PERMISSION_OPTS)
 
+    invalidate = lambda *args: auth.permission.invalidate_acls()
     s3db.configure(tablename,
                    create_next = URL(r=request),
-                   update_next = URL(r=request))
+                   update_next = URL(r=request),
+                   onaccept = invalidate,
+                   ondelete = invalidate)
 
     if "_next" in request.vars:
         next = request.vars._next
@@ -314,7 +314,10 @@ def s3_rest_controller(prefix=None, resourcename=None, **attr):
     set_handler("report", s3base.S3Report)
     set_handler("report2", s3base.S3Report2) # temporary setting for testing
     set_handler("search_ac", s3base.search_ac)
+    set_handler("lookup_options", s3base.options_lookup)
     set_handler("summary", s3base.S3Summary)
+    set_handler("tiles", s3base.S3MapTiles)
+    set_handler("clusters", s3base.S3MapClusters)
     
     # Don't load S3PDF unless needed (very slow import with Reportlab)
     method = r.method
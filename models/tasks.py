@@ -150,6 +150,31 @@ def gis_update_location_tree(feature, user_id=None):
 
 tasks["gis_update_location_tree"] = gis_update_location_tree
 
+# -----------------------------------------------------------------------------
+def gis_update_simplified(location_id=None, user_id=None):
+    """
+        Update the precomputed Simplified Geometries of a Location
+            - will normally be done Asynchronously if there is a worker alive
+            - can be scheduled without location_id to rebuild them for
+              all Locations (e.g. after bulk imports)
+
+        @param location_id: the gis_location record ID, None for all
+        @param user_id: calling request's auth.user.id or None
+    """
+    if user_id:
+        # Authenticate
+        auth.s3_impersonate(user_id)
+    # Run the Task & return the result
+    if location_id:
+        location_ids = [int(location_id)]
+    else:
+        location_ids = None
+    result = gis.update_simplified(location_ids)
+    db.commit()
+    return result
+
+tasks["gis_update_simplified"] = gis_update_simplified
+
 # -----------------------------------------------------------------------------
 def org_facility_geojson(user_id=None):
     """
@@ -252,6 +277,34 @@ def maintenance(period="daily"):
 
 tasks["maintenance"] = maintenance
 
+# -----------------------------------------------------------------------------
+def s3_audit_drain(user_id=None):
+    """
+        Move spooled audit records into the audit table
+        (settings.security.audit_mode = "spool")
+    """
+
+    # Run the Task & return the result
+    result = current.audit.drain()
+    db.commit()
+    return result
+
+tasks["s3_audit_drain"] = s3_audit_drain
+
+# -----------------------------------------------------------------------------
+def s3_journal_prune(user_id=None):
+    """
+        Remove change journal entries older than the retention period
+        (settings.base.journal_retention)
+    """
+
+    # Run the Task & return the result
+    result = s3base.S3Journal.prune()
+    db.commit()
+    return result
+
+tasks["s3_journal_prune"] = s3_journal_prune
+
 # -----------------------------------------------------------------------------
 if settings.has_module("msg"):
 
@@ -42,5 +42,10 @@ if auth.permission.format in ("html"):
         # Use custom menu
         menu.options = s3_menu_dict[controller]
 
+    # Cache the rendered options menu
+    if isinstance(menu.options, s3base.S3NavigationItem) and \
+       settings.get_ui_menu_cache():
+        menu.options.cache = True
+
     # Add breadcrumbs
     menu.breadcrumbs = S3OptionsMenu.breadcrumbs
@@ -145,6 +145,22 @@ if len(pop_list) > 0:
                          repeats=0     # unlimited
                          )
 
+    # Move spooled audit records into the database
+    if settings.get_security_audit_mode() == "spool":
+        s3task.schedule_task("s3_audit_drain",
+                             period=300,  # seconds
+                             timeout=300, # seconds
+                             repeats=0    # unlimited
+                             )
+
+    # Remove outdated change journal entries
+    if settings.get_base_journal():
+        s3task.schedule_task("s3_journal_prune",
+                             period=86400,  # seconds, i.e. 1 day
+                             timeout=600,   # seconds
+                             repeats=0      # unlimited
+                             )
+
     # =========================================================================
     # Import PrePopulate data
     #
@@ -155,6 +171,9 @@ if len(pop_list) > 0:
     # Load all Models to ensure all DB tables present
     s3db.load_all_models()
 
+    # Create the database indexes declared in the models
+    s3db.create_indexes()
+
     # Shortcuts
     path_join = os.path.join
     request_folder = request.folder
@@ -350,6 +369,14 @@ if len(pop_list) > 0:
         end = datetime.datetime.now()
         print >> sys.stdout, "Vulnerability data aggregation completed in %s" % (end - start)
 
+    # Backfill the persisted computed columns
+    # - not all imports run the onaccept which updates them
+    start = datetime.datetime.now()
+    for tablename in sorted(s3db.COMPUTED):
+        s3db.rebuild_computed(tablename)
+    end = datetime.datetime.now()
+    print >> sys.stdout, "Computed columns update completed in %s" % (end - start)
+
     grandTotalEnd = datetime.datetime.now()
     duration = grandTotalEnd - grandTotalStart
     try:
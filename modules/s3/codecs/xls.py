@@ -87,18 +87,18 @@ class S3XLS(S3Codec):
         if orderby is None:
             orderby = resource.get_config("orderby", None)
 
-        result = resource.select(list_fields,
-                                 left=left,
-                                 limit=None,
-                                 count=True,
-                                 getids=True,
-                                 orderby=orderby,
-                                 represent=True,
-                                 show_links=False)
-
-        rfields = result["rfields"]
-        rows = result["rows"]
-        
+        # Extract the data in chunks of columns, so that large exports
+        # do not need to hold the complete query result in memory
+        chunks = resource.iterselect(list_fields,
+                                     left=left,
+                                     orderby=orderby,
+                                     represent=True,
+                                     show_links=False,
+                                     raw_columns=True)
+
+        rfields = resource.resolve_selectors(list_fields,
+                                             extra_fields=False)[0]
+
         types = []
         lfields = []
         heading = {}
@@ -111,8 +111,26 @@ class S3XLS(S3Codec):
                 else:
                     types.append(rfield.ftype)
 
+        rows = self.iterrows(chunks, lfields)
+
         return (title, types, lfields, heading, rows)
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def iterrows(chunks, colnames):
+        """
+            Generator to convert chunks of columnar data into rows
+
+            @param chunks: iterable of dicts of column lists (as returned
+                           by select with raw_columns=True)
+            @param colnames: the column names to include in the rows
+        """
+
+        for columns in chunks:
+            values = [columns[colname] for colname in colnames]
+            for row in zip(*values):
+                yield dict(zip(colnames, row))
+
     # -------------------------------------------------------------------------
     def encode(self, data_source, **attr):
         """
@@ -179,18 +197,18 @@ class S3XLS(S3Codec):
             headers = data_source[0]
             types = data_source[1]
             rows = data_source[2:]
+            if len(rows) > 0 and len(headers) != len(rows[0]):
+                from ..s3utils import s3_debug
+                msg = """modules/s3/codecs/xls: There is an error in the list_items, a field doesn't exist"
+requesting url %s
+Headers = %d, Data Items = %d
+Headers     %s
+List Fields %s""" % (request.url, len(headers), len(rows[0]), headers, list_fields)
+                s3_debug(msg)
         else:
             (title, types, lfields, headers, rows) = self.extractResource(data_source,
                                                                           list_fields)
         report_groupby = lfields[group] if group else None
-        if len(rows) > 0 and len(headers) != len(rows[0]):
-            from ..s3utils import s3_debug
-            msg = """modules/s3/codecs/xls: There is an error in the list_items, a field doesn't exist"
-requesting url %s
-Headers = %d, Data Items = %d
-Headers     %s
-List Fields %s""" % (request.url, len(headers), len(items[0]), headers, list_fields)
-            s3_debug(msg)
         groupby_label = headers[report_groupby] if report_groupby else None
 
         # Date/Time formats from L10N deployment settings
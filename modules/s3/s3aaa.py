@@ -30,6 +30,7 @@
 """
 
 __all__ = ["AuthS3",
+           "S3RealmCache",
            "S3Permission",
            "S3Audit",
            "S3RoleManager",
@@ -37,8 +38,14 @@ __all__ = ["AuthS3",
            "S3PersonRoleManager",
            ]
 
+import copy
 import datetime
+import glob
+import hashlib
+import os
 #import re
+import threading
+import time
 from uuid import uuid4
 
 try:
@@ -57,6 +64,7 @@ except:
     from gluon.contrib.simplejson.ordered_dict import OrderedDict
 
 from gluon import *
+from gluon import portalocker
 from gluon.dal import Row, Rows, Query, Set, Table, Expression
 from gluon.sqlhtml import OptionsWidget
 from gluon.storage import Storage, Messages
@@ -65,9 +73,10 @@ from gluon.utils import web2py_uuid
 
 from s3error import S3PermissionError
 from s3fields import S3Represent, s3_uid, s3_timestamp, s3_deletion_status, s3_comments
+from s3resource import S3Journal
 from s3rest import S3Method
 from s3track import S3Tracker
-from s3utils import s3_mark_required
+from s3utils import S3LRUCache, s3_mark_required
 
 DEFAULT = lambda: None
 #table_field = re.compile("[\w_]+\.[\w_]+")
@@ -2705,147 +2714,178 @@ S3OptionsFilter({
 
             else:
                 # Group memberships are limited to realms (policy 6 and above)
-                realms = {}
-                delegations = {}
+                cache_key = S3RealmCache.key(self.user,
+                                             self.permission.policy,
+                                             rows)
+                cached = S3RealmCache.get(cache_key)
+                if cached is not None:
+                    realms, delegations = cached
+                else:
+                    realms, delegations = self.s3_get_realms(rows)
+                    realms, delegations = S3RealmCache.store(cache_key,
+                                                             realms,
+                                                             delegations)
+                self.user["realms"] = realms
+                self.user["delegations"] = delegations
+
+            if ANONYMOUS:
+                # Anonymous role has no realm
+                self.user["realms"][ANONYMOUS] = None
+
+        return
+
+    # -------------------------------------------------------------------------
+    def s3_get_realms(self, memberships):
+        """
+            Determine the realms and delegations of the current user
+            (security policy 6 and above)
+
+            @param memberships: the auth_membership Rows of the user
+                                (with group_id and pe_id)
 
-                # These roles can't be realm-restricted:
-                unrestrictable = [system_roles.ADMIN,
-                                  system_roles.ANONYMOUS,
-                                  system_roles.AUTHENTICATED]
+            @return: tuple (realms, delegations)
+        """
 
-                default_realm = s3db.pr_realm(self.user["pe_id"])
+        db = current.db
+        s3db = current.s3db
 
-                # Store the realms:
+        system_roles = self.get_system_roles()
+        rows = memberships
+
+        realms = {}
+        delegations = {}
+
+        # These roles can't be realm-restricted:
+        unrestrictable = [system_roles.ADMIN,
+                          system_roles.ANONYMOUS,
+                          system_roles.AUTHENTICATED]
+
+        default_realm = s3db.pr_realm(self.user["pe_id"])
+
+        # Store the realms:
+        for row in rows:
+            group_id = row.group_id
+            if group_id in realms and realms[group_id] is None:
+                continue
+            if group_id in unrestrictable:
+                realms[group_id] = None
+                continue
+            if group_id not in realms:
+                realms[group_id] = []
+            realm = realms[group_id]
+            pe_id = row.pe_id
+            if pe_id is None:
+                if default_realm:
+                    realm.extend([e for e in default_realm
+                                    if e not in realm])
+                if not realm:
+                    del realms[group_id]
+            elif pe_id == 0:
+                # Site-wide
+                realms[group_id] = None
+            elif pe_id not in realm:
+                realms[group_id].append(pe_id)
+
+        if self.permission.entity_hierarchy:
+            # Realms include subsidiaries of the realm entities
+
+            # Get all entities in realms
+            all_entities = []
+            append = all_entities.append
+            for realm in realms.values():
+                if realm is not None:
+                    for entity in realm:
+                        if entity not in all_entities:
+                            append(entity)
+
+            # Lookup all delegations to any OU ancestor of the user
+            if self.permission.delegations and self.user.pe_id:
+
+                ancestors = s3db.pr_get_ancestors(self.user.pe_id)
+
+                dtable = s3db.pr_delegation
+                rtable = s3db.pr_role
+                atable = s3db.pr_affiliation
+
+                dn = dtable._tablename
+                rn = rtable._tablename
+                an = atable._tablename
+
+                query = (dtable.deleted != True) & \
+                        (atable.role_id == dtable.role_id) & \
+                        (atable.pe_id.belongs(ancestors)) & \
+                        (rtable.id == dtable.role_id)
+                rows = db(query).select(rtable.pe_id,
+                                        dtable.group_id,
+                                        atable.pe_id,
+                                        cacheable=True)
+
+                extensions = []
+                partners = []
+                for row in rows:
+                    extensions.append(row[rn].pe_id)
+                    partners.append(row[an].pe_id)
+            else:
+                rows = []
+                extensions = []
+                partners = []
+
+            # Lookup the subsidiaries of all realms and extensions
+            entities = all_entities + extensions + partners
+            descendants = s3db.pr_descendants(entities)
+
+            pmap = {}
+            for p in partners:
+                if p in all_entities:
+                    pmap[p] = [p]
+                elif p in descendants:
+                    d = descendants[p]
+                    pmap[p] = [e for e in all_entities if e in d] or [p]
+
+            # Add the subsidiaries to the realms
+            for group_id in realms:
+                realm = realms[group_id]
+                if realm is None:
+                    continue
+                append = realm.append
+                for entity in list(realm):
+                    if entity in descendants:
+                        for subsidiary in descendants[entity]:
+                            if subsidiary not in realm:
+                                append(subsidiary)
+
+            # Process the delegations
+            if self.permission.delegations:
                 for row in rows:
-                    group_id = row.group_id
-                    if group_id in realms and realms[group_id] is None:
-                        continue
-                    if group_id in unrestrictable:
-                        realms[group_id] = None
-                        continue
-                    if group_id not in realms:
-                        realms[group_id] = []
-                    realm = realms[group_id]
-                    pe_id = row.pe_id
-                    if pe_id is None:
-                        if default_realm:
-                            realm.extend([e for e in default_realm
-                                            if e not in realm])
-                        if not realm:
-                            del realms[group_id]
-                    elif pe_id == 0:
-                        # Site-wide
-                        realms[group_id] = None
-                    elif pe_id not in realm:
-                        realms[group_id].append(pe_id)
-
-                if self.permission.entity_hierarchy:
-                    # Realms include subsidiaries of the realm entities
-
-                    # Get all entities in realms
-                    all_entities = []
-                    append = all_entities.append
-                    for realm in realms.values():
-                        if realm is not None:
-                            for entity in realm:
-                                if entity not in all_entities:
-                                    append(entity)
-
-                    # Lookup all delegations to any OU ancestor of the user
-                    if self.permission.delegations and self.user.pe_id:
-
-                        ancestors = s3db.pr_get_ancestors(self.user.pe_id)
-
-                        dtable = s3db.pr_delegation
-                        rtable = s3db.pr_role
-                        atable = s3db.pr_affiliation
-
-                        dn = dtable._tablename
-                        rn = rtable._tablename
-                        an = atable._tablename
-
-                        query = (dtable.deleted != True) & \
-                                (atable.role_id == dtable.role_id) & \
-                                (atable.pe_id.belongs(ancestors)) & \
-                                (rtable.id == dtable.role_id)
-                        rows = db(query).select(rtable.pe_id,
-                                                dtable.group_id,
-                                                atable.pe_id,
-                                                cacheable=True)
-
-                        extensions = []
-                        partners = []
-                        for row in rows:
-                            extensions.append(row[rn].pe_id)
-                            partners.append(row[an].pe_id)
-                    else:
-                        rows = []
-                        extensions = []
-                        partners = []
-
-                    # Lookup the subsidiaries of all realms and extensions
-                    entities = all_entities + extensions + partners
-                    descendants = s3db.pr_descendants(entities)
-
-                    pmap = {}
-                    for p in partners:
-                        if p in all_entities:
-                            pmap[p] = [p]
-                        elif p in descendants:
-                            d = descendants[p]
-                            pmap[p] = [e for e in all_entities if e in d] or [p]
-
-                    # Add the subsidiaries to the realms
-                    for group_id in realms:
-                        realm = realms[group_id]
-                        if realm is None:
-                            continue
-                        append = realm.append
-                        for entity in list(realm):
-                            if entity in descendants:
-                                for subsidiary in descendants[entity]:
-                                    if subsidiary not in realm:
-                                        append(subsidiary)
-
-                    # Process the delegations
-                    if self.permission.delegations:
-                        for row in rows:
-
-                            # owner == delegates group_id to ==> partner
-                            owner = row[rn].pe_id
-                            partner = row[an].pe_id
-                            group_id = row[dn].group_id
-
-                            if group_id in delegations and \
-                               owner in delegations[group_id]:
-                                # Duplicate
-                                continue
-                            if partner not in pmap:
-                                continue
 
-                            # Find the realm
-                            if group_id not in delegations:
-                                delegations[group_id] = Storage()
-                            groups = delegations[group_id]
+                    # owner == delegates group_id to ==> partner
+                    owner = row[rn].pe_id
+                    partner = row[an].pe_id
+                    group_id = row[dn].group_id
 
-                            r = [owner]
-                            if owner in descendants:
-                                r.extend(descendants[owner])
+                    if group_id in delegations and \
+                       owner in delegations[group_id]:
+                        # Duplicate
+                        continue
+                    if partner not in pmap:
+                        continue
 
-                            for p in pmap[partner]:
-                                if p not in groups:
-                                    groups[p] = []
-                                realm = groups[p]
-                                realm.extend(r)
+                    # Find the realm
+                    if group_id not in delegations:
+                        delegations[group_id] = Storage()
+                    groups = delegations[group_id]
 
-                self.user["realms"] = realms
-                self.user["delegations"] = delegations
+                    r = [owner]
+                    if owner in descendants:
+                        r.extend(descendants[owner])
 
-            if ANONYMOUS:
-                # Anonymous role has no realm
-                self.user["realms"][ANONYMOUS] = None
+                    for p in pmap[partner]:
+                        if p not in groups:
+                            groups[p] = []
+                        realm = groups[p]
+                        realm.extend(r)
 
-        return
+        return realms, delegations
 
     # -------------------------------------------------------------------------
     def s3_create_role(self, role, description=None, *acls, **args):
@@ -2900,6 +2940,7 @@ S3OptionsFilter({
         if role_id:
             for acl in acls:
                 self.permission.update_acl(role_id, **acl)
+            self.permission.invalidate_acls()
 
         return role_id
 
@@ -2933,6 +2974,7 @@ S3OptionsFilter({
             ptable = self.permission.table
             pquery = (ptable.group_id == role.id)
             db(pquery).update(deleted=True)
+            self.permission.invalidate_acls()
             # Remove the role
             db(gquery).update(role=None, deleted=True)
 
@@ -3322,6 +3364,7 @@ S3OptionsFilter({
         for role_id in roles:
             for group_id in group_ids:
                 dtable.insert(role_id=role_id, group_id=group_id)
+        S3RealmCache.invalidate()
 
         # Update roles for current user if required
         self.s3_set_roles()
@@ -3419,6 +3462,7 @@ S3OptionsFilter({
 
         # Maybe update the current user's delegations?
         if len(rmv):
+            S3RealmCache.invalidate()
             self.s3_set_roles()
         return True
 
@@ -3725,6 +3769,47 @@ S3OptionsFilter({
                 (permission.table_name == table)
         return table.id.belongs(current.db(query)._select(permission.record_id))
 
+    # -------------------------------------------------------------------------
+    def s3_permitted_ids(self, method, table, record_ids=None, c=None, f=None):
+        """
+            Returns the IDs of all records in table which are accessible
+            for the currently logged-in user (one query for all records)
+
+            @param method: the access method as string, one of:
+                           "create", "read", "update" or "delete"
+            @param table: the table or table name
+            @param record_ids: the record IDs to check (list/set), None
+                               for all records in the table
+            @param c: the controller name (overrides current.request)
+            @param f: the function name (overrides current.request)
+
+            @return: the set of accessible record IDs
+        """
+
+        if not hasattr(table, "_tablename"):
+            s3db = current.s3db
+            table = s3db[table]
+
+        policy = current.deployment_settings.get_security_policy()
+        if policy in (3, 4, 5, 6, 7, 8):
+            # ACLs: use S3Permission method
+            return self.permission.permitted_ids(method, table,
+                                                 record_ids = record_ids,
+                                                 c = c,
+                                                 f = f)
+
+        query = self.s3_accessible_query(method, table, c=c, f=f)
+        if record_ids is not None:
+            if not isinstance(record_ids, (list, tuple, set)):
+                record_ids = [record_ids]
+            record_ids = [record_id for record_id in record_ids if record_id]
+            if not record_ids:
+                return set()
+            query &= (table._id.belongs(record_ids))
+        rows = current.db(query).select(table._id)
+        pkey = table._id.name
+        return set(row[pkey] for row in rows)
+
     # -------------------------------------------------------------------------
     # S3 Variants of web2py Authorization Methods
     # -------------------------------------------------------------------------
@@ -4454,6 +4539,184 @@ S3OptionsFilter({
         else:
             return (table.organisation_id == None)
 
+# =============================================================================
+class S3RealmCache(object):
+    """
+        Cross-request cache for the realms and delegations of users
+        (see AuthS3.s3_set_roles), activated by the deployment setting
+        auth.realm_cache ("ram" for a per-process LRU cache, or "memcache"
+        to share the cache between instances).
+
+        Cache keys consist of the user ID and person entity, the security
+        policy, all role memberships of the user (so that role assignments
+        take effect immediately) and the hierarchy version, which gets
+        incremented whenever OU affiliations or delegations change (see
+        invalidate).
+
+        While the cache is active, the realms and delegations in auth.user
+        are kept out of the session (they are restored from the cache by
+        s3_set_roles in every request), so that the session only carries
+        the user record itself.
+
+        @note: with the "ram" backend, the hierarchy version is per-process,
+               i.e. affiliation changes in one process do not invalidate
+               the cache of other processes, so their realms may be outdated
+               for up to the expiry time - use "memcache" for deployments
+               with multiple processes
+    """
+
+    EXPIRE = 300
+
+    # Per-process cache and hierarchy version (ram backend)
+    _ram = None
+    _version = 0
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def backend(cls):
+        """
+            Get the cache backend according to deployment settings
+
+            @return: the backend (S3LRUCache or MemcacheClient), or
+                     None if the realm cache is disabled
+        """
+
+        settings = current.deployment_settings
+        setting = settings.get_auth_realm_cache()
+        if not setting:
+            return None
+        if setting == "memcache":
+            memcache = getattr(current.cache, "memcache", None)
+            if memcache is not None:
+                return memcache
+        if cls._ram is None:
+            cls._ram = S3LRUCache(capacity=settings.get_auth_realm_cache_size())
+        return cls._ram
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def version(cls, backend):
+        """
+            Get the current hierarchy version
+
+            @param backend: the cache backend
+        """
+
+        if isinstance(backend, S3LRUCache):
+            return cls._version
+        key = "s3_realm_version"
+        version = backend.get(key)
+        if version is None:
+            # Start from a timestamp so that version numbers do not
+            # repeat if the counter gets evicted
+            version = int(time.time() * 1000)
+            backend.set(key, version, 86400)
+        return version
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def invalidate(cls):
+        """
+            Increment the hierarchy version, to be called whenever OU
+            affiliations or delegations have been changed
+        """
+
+        backend = cls.backend()
+        if backend is None:
+            return
+        if isinstance(backend, S3LRUCache):
+            cls._version += 1
+        else:
+            key = "s3_realm_version"
+            if backend.get(key) is None:
+                backend.set(key, int(time.time() * 1000), 86400)
+            else:
+                backend.increment(key)
+        return
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def key(cls, user, policy, memberships):
+        """
+            Construct a cache key
+
+            @param user: the user record (auth.user)
+            @param policy: the security policy
+            @param memberships: the auth_membership Rows of the user
+                                (with group_id and pe_id)
+
+            @return: the key, or None if the realm cache is disabled
+        """
+
+        backend = cls.backend()
+        if backend is None:
+            return None
+        memberships = sorted(set((row.group_id, row.pe_id)
+                                 for row in memberships))
+        items = [str(user.id), str(user.pe_id), str(policy),
+                 str(memberships), str(cls.version(backend))]
+        return "s3_realms_%s" % hashlib.md5("|".join(items)).hexdigest()
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def get(cls, key):
+        """
+            Get the realms and delegations from the cache
+
+            @param key: the cache key
+            @return: tuple (realms, delegations), or None if not cached
+        """
+
+        if key is None:
+            return None
+        backend = cls.backend()
+        if backend is None:
+            return None
+        cached = backend.get(key)
+        if cached is None:
+            return None
+        realms, delegations = copy.deepcopy(cached)
+        return S3RealmMap(realms), S3RealmMap(delegations)
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def store(cls, key, realms, delegations):
+        """
+            Store the realms and delegations in the cache
+
+            @param key: the cache key
+            @param realms: the realms
+            @param delegations: the delegations
+
+            @return: tuple (realms, delegations) to store in auth.user
+        """
+
+        if key is None:
+            return realms, delegations
+        backend = cls.backend()
+        if backend is None:
+            return realms, delegations
+        cached = copy.deepcopy((dict(realms), dict(delegations)))
+        backend.set(key, cached, cls.EXPIRE)
+        return S3RealmMap(realms), S3RealmMap(delegations)
+
+# =============================================================================
+class S3RealmMap(dict):
+    """
+        Realms or delegations of the current user as restored from the
+        realm cache: pickled as an empty dict to keep them out of the
+        session (s3_set_roles restores them in every request)
+    """
+
+    def __reduce__(self):
+        return (dict, ())
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(dict(self), memo)
+
 # =============================================================================
 class S3Permission(object):
     """ S3 Class to handle permissions """
@@ -4510,6 +4773,16 @@ class S3Permission(object):
                               reduce(lambda x, y: (x[0]&y[0], x[1]&y[1]),
                                      acl, (self.ALL, self.ALL))
 
+    # Process-wide ACL index (see acl_index)
+    ACL_INDEX = None
+    ACL_TABLES = None
+    ACL_STAMP = None
+    ACL_VERSION = 0
+    ACL_LOCK = threading.Lock()
+
+    # Process-wide cache of applicable ACLs (see applicable_acls)
+    ACL_RESULTS = S3LRUCache(capacity=2000)
+
     # -------------------------------------------------------------------------
     def __init__(self, auth, tablename=None):
         """
@@ -4547,6 +4820,8 @@ class S3Permission(object):
         self.entity_hierarchy = self.policy in (7, 8)
         # Permission sets can be delegated:
         self.delegations = self.policy == 8
+        # Resolve ACL lookups from the process-wide ACL index:
+        self.acl_cache = settings.get_security_acl_cache()
 
         # Permissions table
         self.tablename = tablename or self.TABLENAME
@@ -4669,11 +4944,7 @@ class S3Permission(object):
             # ACLs not relevant to this security policy
             return None
 
-        s3 = current.response.s3
-        if "permissions" in s3:
-            del s3["permissions"]
-        if "restricted_tables" in s3:
-            del s3["restricted_tables"]
+        self.invalidate_acls()
 
         if c is None and f is None and t is None:
             return None
@@ -5244,16 +5515,6 @@ class S3Permission(object):
                     _debug("*** DENIED ***")
                 return permitted
 
-        # Do we need to check the owner role (i.e. table+record given)?
-        if t is not None and record is not None:
-            owners = self.get_owners(t, record)
-            is_owner = self.is_owner(t, record, owners=owners)
-            entity = owners[0]
-        else:
-            owners = []
-            is_owner = True
-            entity = None
-
         # Fall back to current request
         c = c or self.controller
         f = f or self.function
@@ -5272,6 +5533,16 @@ class S3Permission(object):
                 _debug("*** DENIED (cached) ***")
             return response.s3.permissions[key]
 
+        # Do we need to check the owner role (i.e. table+record given)?
+        if t is not None and record is not None:
+            owners = self.get_owners(t, record)
+            is_owner = self.is_owner(t, record, owners=owners)
+            entity = owners[0]
+        else:
+            owners = []
+            is_owner = True
+            entity = None
+
         # Get the applicable ACLs
         acls = self.applicable_acls(racl,
                                     realms=realms,
@@ -5481,6 +5752,29 @@ class S3Permission(object):
         c = c or self.controller
         f = f or self.function
 
+        # Query already built in this request?
+        if logged_in:
+            owned = None
+        else:
+            owned = current.session.get("owned_records", {}).get(table._tablename)
+        key = "%s/%s/%s/%s/%s/%s/%s/%s/%s/%s" % \
+              (method[0],
+               table._tablename,
+               c, f, deny,
+               self.policy,
+               self.realm_fingerprint(realms, delegations),
+               current.deployment_settings.get_security_strict_ownership(),
+               requires_approval,
+               owned,
+               )
+        s3 = current.response.s3
+        queries = s3.accessible_queries
+        if queries is None:
+            queries = s3.accessible_queries = {}
+        elif key in queries:
+            _debug("*** Accessible Query (cached) ***")
+            return queries[key]
+
         # Get the applicable ACLs
         acls = self.applicable_acls(racl,
                                     realms=realms,
@@ -5492,10 +5786,12 @@ class S3Permission(object):
         if acls is None:
             _debug("==> no ACLs defined for this case")
             _debug("*** ALL RECORDS ***")
+            queries[key] = ALL_RECORDS
             return ALL_RECORDS
         elif not acls:
             _debug("==> no applicable ACLs")
             _debug("*** ACCESS DENIED ***")
+            queries[key] = NO_RECORDS
             return NO_RECORDS
 
         oacls = []
@@ -5555,8 +5851,75 @@ class S3Permission(object):
 
         _debug("*** Accessible Query ***")
         _debug(str(query))
+        queries[key] = query
         return query
 
+    # -------------------------------------------------------------------------
+    def permitted_ids(self, method, table, record_ids=None, c=None, f=None):
+        """
+            Find the records in a table which are accessible for method,
+            all in one query (e.g. to render action buttons in a list)
+
+            @param method: the method as string
+            @param table: the database table or table name
+            @param record_ids: the record IDs to check (list/set), None
+                               for all records in the table
+            @param c: controller name (falls back to current request)
+            @param f: function name (falls back to current request)
+
+            @return: the set of permitted record IDs
+
+            @note: the results for record_ids are remembered for the
+                   current request, so that subsequent has_permission
+                   checks for these records (e.g. in list item renderers)
+                   do not need to look up the record owners again
+            @note: applies accessible_query semantics
+        """
+
+        # Get the table
+        if not hasattr(table, "_tablename"):
+            tablename = table
+            error = AttributeError("undefined table %s" % tablename)
+            table = current.s3db.table(tablename,
+                                       db_only = True,
+                                       default = error)
+        tablename = table._tablename
+
+        if record_ids is not None:
+            if not isinstance(record_ids, (list, tuple, set)):
+                record_ids = [record_ids]
+            record_ids = set(int(record_id) for record_id in record_ids
+                             if record_id)
+            if not record_ids:
+                return set()
+
+        query = self.accessible_query(method, table, c=c, f=f)
+        if record_ids is not None:
+            if len(record_ids) == 1:
+                query &= (table._id == list(record_ids)[0])
+            else:
+                query &= (table._id.belongs(record_ids))
+        rows = current.db(query).select(table._id)
+        pkey = table._id.name
+        permitted = set(row[pkey] for row in rows)
+
+        if record_ids is not None and isinstance(method, basestring) and \
+           not self.auth.override:
+            # Remember the results (same keys as in has_permission)
+            s3 = current.response.s3
+            if "permissions" not in s3:
+                s3.permissions = Storage()
+            permissions = s3.permissions
+            prefix = "%s/%s/%s/%s" % ([method],
+                                      c or self.controller,
+                                      f or self.function,
+                                      tablename)
+            for record_id in record_ids:
+                key = "%s/%s" % (prefix, record_id)
+                permissions[key] = record_id in permitted
+
+        return permitted
+
     # -------------------------------------------------------------------------
     def accessible_url(self,
                        c=None,
@@ -5685,6 +6048,17 @@ class S3Permission(object):
             # No roles available (deny all)
             return acls
 
+        # Known result?
+        cache_key = None
+        if self.acl_cache and not current.response.s3.acl_dirty:
+            # Make sure the ACL stamp of this request is set
+            self.acl_index()
+            cache_key = self.acl_results_key(racl, realms, delegations,
+                                             c, f, t, entity)
+            cached = self.ACL_RESULTS.get(cache_key)
+            if cached is not None:
+                return Storage(cached)
+
         # Base query
         query = (table.deleted != True) & \
                 (table.group_id.belongs(roles))
@@ -5711,7 +6085,19 @@ class S3Permission(object):
             table_restricted = self.table_restricted(t)
 
         # Retrieve the ACLs
-        if q:
+        if q and self.acl_cache and not current.response.s3.acl_dirty:
+            index = self.acl_index()
+            keys = []
+            append = keys.append
+            for role in roles:
+                if page_restricted:
+                    append((role, c, None, None))
+                    if f and self.use_facls:
+                        append((role, c, f, None))
+                if t and self.use_tacls:
+                    append((role, None, None, t))
+            rows = [row for key in keys for row in index.get(key, ())]
+        elif q:
             query &= q
             rows = db(query).select(table.group_id,
                                     table.controller,
@@ -5722,6 +6108,7 @@ class S3Permission(object):
                                     table.uacl,
                                     table.oacl,
                                     cacheable=True)
+            self.count_query()
         else:
             rows = []
 
@@ -5913,6 +6300,9 @@ class S3Permission(object):
         #for pe in result:
             #print "ACL for PE %s: %04X %04X" % (pe, result[pe][0], result[pe][1])
 
+        if cache_key is not None:
+            self.ACL_RESULTS.set(cache_key, Storage(result))
+
         return result
 
     # -------------------------------------------------------------------------
@@ -5948,16 +6338,184 @@ class S3Permission(object):
         s3 = current.response.s3
 
         if not "restricted_tables" in s3:
-            table = self.table
-            query = (table.deleted != True) & \
-                    (table.controller == None) & \
-                    (table.function == None)
-            rows = current.db(query).select(table.tablename,
-                                            groupby=table.tablename)
-            s3.restricted_tables = [row.tablename for row in rows]
+            if self.acl_cache and not s3.acl_dirty:
+                self.acl_index()
+                s3.restricted_tables = S3Permission.ACL_TABLES
+            else:
+                table = self.table
+                query = (table.deleted != True) & \
+                        (table.controller == None) & \
+                        (table.function == None)
+                rows = current.db(query).select(table.tablename,
+                                                groupby=table.tablename)
+                self.count_query()
+                s3.restricted_tables = [row.tablename for row in rows]
 
         return str(t) in s3.restricted_tables
 
+    # -------------------------------------------------------------------------
+    def acl_index(self):
+        """
+            Get the process-wide index of all active ACLs, (re-)loading
+            it from the database when it is outdated.
+
+            The index is checked for changes once per request, by comparing
+            the number of ACL records and their latest modification date
+            (to detect changes made by other processes) as well as the ACL
+            version of this process (incremented by invalidate_acls).
+
+            @return: dict {(group_id, controller, function, tablename): [Row]}
+
+            @note: after invalidate_acls, the current request falls back to
+                   querying the ACL table (so that uncommitted changes never
+                   get into the index), and the index is reloaded by the
+                   next request
+            @note: changes made to the ACL table directly via DAL (rather
+                   than with update_acl/delete_acl) should be followed by
+                   invalidate_acls
+        """
+
+        s3 = current.response.s3
+        table = self.table
+
+        stamp = s3.acl_stamp
+        if stamp is None:
+            count = table.id.count()
+            latest = table.modified_on.max()
+            row = current.db(table.id > 0).select(count, latest).first()
+            self.count_query()
+            stamp = s3.acl_stamp = (S3Permission.ACL_VERSION,
+                                    row[count],
+                                    row[latest])
+
+        with S3Permission.ACL_LOCK:
+            index = S3Permission.ACL_INDEX
+            if index is None or S3Permission.ACL_STAMP != stamp:
+                rows = current.db(table.deleted != True).select(
+                                                    table.group_id,
+                                                    table.controller,
+                                                    table.function,
+                                                    table.tablename,
+                                                    table.unrestricted,
+                                                    table.entity,
+                                                    table.uacl,
+                                                    table.oacl,
+                                                    cacheable=True)
+                self.count_query()
+                index = {}
+                tables = set()
+                for row in rows:
+                    key = (row.group_id,
+                           row.controller,
+                           row.function,
+                           row.tablename)
+                    if key in index:
+                        index[key].append(row)
+                    else:
+                        index[key] = [row]
+                    if row.controller is None and row.function is None:
+                        tables.add(row.tablename)
+                S3Permission.ACL_INDEX = index
+                S3Permission.ACL_TABLES = list(tables)
+                S3Permission.ACL_STAMP = stamp
+        return index
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def invalidate_acls():
+        """
+            Mark the ACL index (and the permission caches of the current
+            request) as outdated, to be called whenever ACLs have been
+            added, changed or removed
+        """
+
+        with S3Permission.ACL_LOCK:
+            S3Permission.ACL_VERSION += 1
+
+        s3 = current.response.s3
+        for key in ("permissions",
+                    "restricted_tables",
+                    "acl_stamp",
+                    "accessible_queries"):
+            if key in s3:
+                del s3[key]
+        s3.acl_dirty = True
+        return
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def count_query():
+        """
+            Count a query against the ACL table in the current request
+            (see response.s3.acl_queries)
+        """
+
+        s3 = current.response.s3
+        s3.acl_queries = (s3.acl_queries or 0) + 1
+        return
+
+    # -------------------------------------------------------------------------
+    def realm_fingerprint(self, realms, delegations):
+        """
+            Get a fingerprint of the realms and delegations of the current
+            user (computed once per request, unless the realms change)
+
+            @param realms: the realms
+            @param delegations: the delegations
+
+            @return: the fingerprint (string)
+        """
+
+        s3 = current.response.s3
+
+        known = s3.realm_fingerprint
+        if known and known[0] is realms and known[1] is delegations:
+            return known[2]
+
+        def items(realms):
+            if not realms:
+                return []
+            return sorted((k, sorted(v) if v is not None else None)
+                          for k, v in realms.items())
+
+        user = self.auth.user
+        user_id = user.id if user else None
+        delegated = [(group_id, items(delegations[group_id]))
+                     for group_id in sorted(delegations or [])]
+        fingerprint = hashlib.md5(repr((user_id,
+                                        items(realms),
+                                        delegated))).hexdigest()
+
+        # Keep the realms referenced, so that their IDs can not be re-used
+        s3.realm_fingerprint = (realms, delegations, fingerprint)
+        return fingerprint
+
+    # -------------------------------------------------------------------------
+    def acl_results_key(self, racl, realms, delegations, c, f, t, entity):
+        """
+            Construct the cache key for applicable ACLs
+
+            @param racl: the required ACL
+            @param realms: the realms
+            @param delegations: the delegations
+            @param c: the controller name
+            @param f: the function name
+            @param t: the table or tablename
+            @param entity: the realm entity
+
+            @return: the cache key (string)
+
+            @note: requires the ACL stamp of the request (see acl_index)
+        """
+
+        return "%s/%s/%s/%s/%s/%s/%s/%s" % \
+               (self.realm_fingerprint(realms, delegations),
+                current.response.s3.acl_stamp,
+                self.policy,
+                racl,
+                c, f, t,
+                entity if entity else None)
+
     # -------------------------------------------------------------------------
     def hidden_modules(self):
         """ List of modules to hide from the main menu """
@@ -5985,6 +6543,7 @@ class S3Permission(object):
                 else:
                     query = query & (t.group_id == None)
                 rows = current.db(query).select()
+                self.count_query()
                 acls = dict()
                 for acl in rows:
                     if acl.controller not in acls:
@@ -6106,7 +6665,22 @@ class S3Permission(object):
 
 # =============================================================================
 class S3Audit(object):
-    """ S3 Audit Trail Writer Class """
+    """
+        S3 Audit Trail Writer Class
+
+        Write modes (settings.security.audit_mode):
+            - "sync"   insert each audit record immediately (default)
+            - "batch"  buffer the audit records of the request, and write
+                       them all in one (multi-row) insert at the end of
+                       the request, right before the transaction is
+                       committed
+            - "spool"  append the audit records to a local log file
+                       (settings.security.audit_spool), to be moved into
+                       the audit table by the "s3_audit_drain" task
+    """
+
+    # Maximum number of records per multi-row insert
+    CHUNK_SIZE = 500
 
     def __init__(self,
                  tablename="s3_audit",
@@ -6154,6 +6728,24 @@ class S3Audit(object):
         else:
             self.user_id = None
 
+        # Write mode
+        mode = settings.get_security_audit_mode()
+        if mode == "batch" and not current.request.env.request_method:
+            # Not a web request (CLI or scheduler) => no request end
+            # at which the buffer would be written
+            mode = "sync"
+        self.mode = mode
+
+        self.spool_path = settings.get_security_audit_spool()
+        self.buffer = []
+        self._commit = None
+
+        if mode == "batch":
+            # Write the buffer right before the end-of-request commit
+            response = current.response
+            self._commit = response.custom_commit
+            response.custom_commit = self.commit
+
     # -------------------------------------------------------------------------
     def __call__(self, method, prefix, name,
                  form=None,
@@ -6167,21 +6759,22 @@ class S3Audit(object):
             @param prefix: the module prefix of the resource
             @param name: the name of the resource (without prefix)
             @param form: the form
-            @param record: the record ID
+            @param record: the record ID (or the Row)
             @param representation: the representation format
-        """
 
-        table = self.table
-        if not table:
-            # Auditing Disabled
-            return True
+            @note: create, update and delete are also recorded in the
+                   change journal (see S3Journal), even if auditing
+                   is disabled
+        """
 
         #if DEBUG:
         #    _debug("Audit %s: %s_%s record=%s representation=%s" % \
         #           (method, prefix, name, record, representation))
 
+        uuid = None
         if record:
             if isinstance(record, Row):
+                uuid = record.get("uuid", None)
                 record = record.get("id", None)
                 if not record:
                     return True
@@ -6208,6 +6801,19 @@ class S3Audit(object):
         now = datetime.datetime.utcnow()
         tablename = "%s_%s" % (prefix, name)
 
+        if method in ("create", "update", "delete"):
+            if uuid is None and form:
+                try:
+                    uuid = form.vars["uuid"]
+                except:
+                    uuid = None
+            S3Journal.write(tablename, record, method, uuid=uuid)
+
+        table = self.table
+        if not table:
+            # Auditing Disabled
+            return True
+
         settings = current.deployment_settings
         audit_read = settings.get_security_audit_read()
         if callable(audit_read):
@@ -6220,13 +6826,13 @@ class S3Audit(object):
 
         if method in ("list", "read"):
             if audit_read:
-                table.insert(timestmp = now,
-                             user_id = self.user_id,
-                             method = method,
-                             tablename = tablename,
-                             record_id = record,
-                             representation = representation,
-                             )
+                self.write(timestmp = now,
+                           user_id = self.user_id,
+                           method = method,
+                           tablename = tablename,
+                           record_id = record,
+                           representation = representation,
+                           )
 
         elif method == "create":
             if audit_write:
@@ -6238,14 +6844,14 @@ class S3Audit(object):
                                  for var in vars if vars[var]]
                 else:
                     new_value = []
-                table.insert(timestmp = now,
-                             user_id = self.user_id,
-                             method = method,
-                             tablename = tablename,
-                             record_id = record,
-                             representation = representation,
-                             new_value = new_value,
-                             )
+                self.write(timestmp = now,
+                           user_id = self.user_id,
+                           method = method,
+                           tablename = tablename,
+                           record_id = record,
+                           representation = representation,
+                           new_value = new_value,
+                           )
 
         elif method == "update":
             if audit_write:
@@ -6264,15 +6870,15 @@ class S3Audit(object):
                 else:
                     new_value = []
                     old_value = []
-                table.insert(timestmp = now,
-                             user_id = self.user_id,
-                             method = method,
-                             tablename = tablename,
-                             record_id = record,
-                             representation = representation,
-                             old_value = old_value,
-                             new_value = new_value,
-                             )
+                self.write(timestmp = now,
+                           user_id = self.user_id,
+                           method = method,
+                           tablename = tablename,
+                           record_id = record,
+                           representation = representation,
+                           old_value = old_value,
+                           new_value = new_value,
+                           )
 
         elif method == "delete":
             if audit_write:
@@ -6283,17 +6889,217 @@ class S3Audit(object):
                 if row:
                     old_value = ["%s:%s" % (field, row[field])
                                  for field in row]
-                table.insert(timestmp = now,
-                             user_id = self.user_id,
-                             method = method,
-                             tablename = tablename,
-                             record_id = record,
-                             representation = representation,
-                             old_value = old_value,
-                             )
+                self.write(timestmp = now,
+                           user_id = self.user_id,
+                           method = method,
+                           tablename = tablename,
+                           record_id = record,
+                           representation = representation,
+                           old_value = old_value,
+                           )
 
         return True
 
+    # -------------------------------------------------------------------------
+    def write(self, **record):
+        """
+            Write an audit record, according to the write mode
+
+            @param record: the audit record (field values)
+        """
+
+        mode = self.mode
+        if mode == "batch":
+            buffer = self.buffer
+            buffer.append(record)
+            if len(buffer) >= self.CHUNK_SIZE:
+                self.flush()
+        elif mode == "spool":
+            self.spool(record)
+        else:
+            self.table.insert(**record)
+        return
+
+    # -------------------------------------------------------------------------
+    def flush(self):
+        """
+            Write all buffered audit records to the audit table
+        """
+
+        buffer = self.buffer
+        if buffer:
+            self.buffer = []
+            self.insert(buffer)
+        return
+
+    # -------------------------------------------------------------------------
+    def commit(self, adapter=None):
+        """
+            Hook for response.custom_commit: write the audit buffer, then
+            commit the transaction (called by web2py for each DB adapter
+            at the end of the request)
+
+            @param adapter: the DB adapter to commit
+        """
+
+        table = self.table
+        if table is not None and \
+           (adapter is None or adapter is table._db._adapter):
+            self.flush()
+
+        commit = self._commit
+        if commit is not None:
+            # Chain previously configured hook
+            commit(adapter)
+        elif adapter is None:
+            current.db.commit()
+        else:
+            adapter.commit()
+        return
+
+    # -------------------------------------------------------------------------
+    def insert(self, records):
+        """
+            Insert audit records with multi-row INSERTs
+
+            @param records: list of audit records (dicts of field values)
+        """
+
+        table = self.table
+        db = table._db
+
+        if db._dbname not in ("postgres", "mysql", "sqlite"):
+            # Multi-row INSERT not supported
+            for record in records:
+                table.insert(**record)
+            return
+
+        represent = db._adapter.represent
+        fields = [table[fn] for fn in table.fields if fn != table._id.name]
+        columns = ",".join([field.name for field in fields])
+
+        sql = "INSERT INTO %s(%s) VALUES %%s;" % (table._tablename, columns)
+        chunk_size = self.CHUNK_SIZE
+        for i in xrange(0, len(records), chunk_size):
+            values = []
+            append = values.append
+            for record in records[i:i + chunk_size]:
+                row = [represent(record.get(field.name), field.type)
+                       for field in fields]
+                append("(%s)" % ",".join(row))
+            db.executesql(sql % ",".join(values))
+        return
+
+    # -------------------------------------------------------------------------
+    def spool(self, record):
+        """
+            Append an audit record to the spool file
+
+            @param record: the audit record (field values)
+        """
+
+        item = dict(record)
+        timestmp = item.get("timestmp")
+        if timestmp:
+            item["timestmp"] = timestmp.strftime("%Y-%m-%dT%H:%M:%S")
+        line = "%s\n" % json.dumps(item, default=str)
+
+        path = self.spool_path
+        folder = os.path.dirname(path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder)
+
+        while True:
+            f = open(path, "a")
+            try:
+                portalocker.lock(f, portalocker.LOCK_EX)
+                # Spool file drained while waiting for the lock?
+                try:
+                    inode = os.stat(path).st_ino
+                except OSError:
+                    inode = None
+                if inode != os.fstat(f.fileno()).st_ino:
+                    continue
+                f.write(line)
+                break
+            finally:
+                f.close()
+        return
+
+    # -------------------------------------------------------------------------
+    def drain(self, commit=True):
+        """
+            Move the spooled audit records into the audit table, to be
+            run from a scheduler task
+
+            @param commit: commit after each spool file (False to leave
+                           the transaction to the caller, e.g. in tests)
+
+            @return: the number of audit records written
+        """
+
+        if not self.table:
+            return 0
+
+        path = self.spool_path
+
+        # Files left over by failed previous runs
+        filenames = glob.glob("%s.*.drain" % path)
+
+        if os.path.exists(path):
+            filename = "%s.%s.drain" % (path, uuid4().hex)
+            try:
+                os.rename(path, filename)
+            except OSError:
+                pass
+            else:
+                # Wait for writers which still have the file open
+                f = open(filename, "r")
+                portalocker.lock(f, portalocker.LOCK_EX)
+                f.close()
+                filenames.append(filename)
+
+        db = current.db
+        encode = lambda v: v.encode("utf-8") if isinstance(v, unicode) else v
+
+        numrecords = 0
+        for filename in filenames:
+            records = []
+            append = records.append
+            f = open(filename, "r")
+            try:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        item = json.loads(line)
+                    except ValueError:
+                        # Corrupt record
+                        continue
+                    record = {}
+                    for key, value in item.items():
+                        if isinstance(value, list):
+                            value = [encode(v) for v in value]
+                        else:
+                            value = encode(value)
+                        record[str(key)] = value
+                    timestmp = record.get("timestmp")
+                    if timestmp:
+                        record["timestmp"] = datetime.datetime.strptime(
+                                                timestmp, "%Y-%m-%dT%H:%M:%S")
+                    append(record)
+            finally:
+                f.close()
+            if records:
+                self.insert(records)
+            if commit:
+                db.commit()
+            os.remove(filename)
+            numrecords += len(records)
+
+        return numrecords
+
     # -------------------------------------------------------------------------
     def represent(self, records):
         """
@@ -7098,6 +7904,7 @@ class S3RoleManager(S3Method):
                     query = (acl_table.deleted != True) & \
                             (acl_table.group_id == role_id)
                     db(query).update(deleted=True)
+                    auth.permission.invalidate_acls()
                     # Remove all memberships:
                     membership_table = db.auth_membership
                     query = (membership_table.deleted != True) & \
@@ -1158,6 +1158,12 @@ class S3CRUD(S3Method):
             # Use defaults
             start = None
 
+        # Keyset pagination
+        if get_config("keyset_pagination", False):
+            cursor = get_vars.get("cursor", "")
+        else:
+            cursor = None
+
         # Initialize output
         output = {}
 
@@ -1221,7 +1227,9 @@ class S3CRUD(S3Method):
                                                     limit=limit,
                                                     left=left,
                                                     orderby=orderby,
-                                                    distinct=distinct)
+                                                    distinct=distinct,
+                                                    cursor=cursor,
+                                                    approximate=True)
             displayrows = totalrows
 
             if dt is None:
@@ -1267,7 +1275,7 @@ class S3CRUD(S3Method):
             searchq, orderby, left = resource.datatable_filter(list_fields,
                                                                get_vars)
             if searchq is not None:
-                totalrows = resource.count()
+                totalrows = resource.count(approximate=True)
                 resource.add_filter(searchq)
             else:
                 totalrows = None
@@ -1286,7 +1294,9 @@ class S3CRUD(S3Method):
                                                           left=left,
                                                           orderby=orderby,
                                                           distinct=distinct,
-                                                          getids=False)
+                                                          getids=False,
+                                                          cursor=cursor,
+                                                          approximate=True)
             else:
                 dt, displayrows = None, 0
             if totalrows is None:
@@ -1406,6 +1416,13 @@ class S3CRUD(S3Method):
             else:
                 start = None
 
+        # Keyset pagination
+        if record_id is None and \
+           resource.get_config("keyset_pagination", False):
+            cursor = get_vars.get("cursor", "")
+        else:
+            cursor = None
+
         # Initialize output
         output = {}
 
@@ -1441,7 +1458,8 @@ class S3CRUD(S3Method):
                                                        limit=initial_limit,
                                                        orderby=orderby,
                                                        listid=listid,
-                                                       layout=layout)
+                                                       layout=layout,
+                                                       cursor=cursor)
 
             if numrows == 0:
                 # Empty table or just no match?
@@ -1474,7 +1492,7 @@ class S3CRUD(S3Method):
                 # Note: the Ajax-URL must use the .dl representation and
                 # plain.html view for pagination to work properly!
                 vars = dict([(k,v) for k, v in r.get_vars.iteritems()
-                                   if k not in ("start", "limit")])
+                                   if k not in ("start", "limit", "cursor")])
                 ajax_url = attr.get("list_ajaxurl", None)
                 if not ajax_url:
                     ajax_url = r.url(representation="dl", vars=vars)
@@ -2312,15 +2330,10 @@ class S3CRUD(S3Method):
                 delete_url = URL(args = args + ["delete"],
                                  vars = get_vars)
             if ownership_required("delete", table):
-                # Check which records can be deleted
-                query = auth.s3_accessible_query("delete", table)
-                rows = current.db(query).select(table._id)
-                restrict = []
-                rappend = restrict.append
-                for row in rows:
-                    row_id = row.get("id", None)
-                    if row_id:
-                        rappend(str(row_id))
+                # Check which records can be deleted (all of them, as
+                # the restrict list is also used for subsequent pages)
+                permitted = auth.s3_permitted_ids("delete", table)
+                restrict = [str(record_id) for record_id in permitted]
                 s3crud.action_button(labels.DELETE, delete_url,
                                      _class="delete-btn", restrict=restrict)
             else:
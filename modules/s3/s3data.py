@@ -80,21 +80,34 @@ class S3DataTable(object):
                  limit=None,
                  filterString=None,
                  orderby=None,
+                 cursor=None,
                  ):
         """
             S3DataTable constructor
 
             @param rfields: A list of S3Resourcefield
             @param data: A list of Storages the key is of the form table.field
-                         The value is the data to be displayed in the dataTable
+                         The value is the data to be displayed in the dataTable,
+                         alternatively a dict of lists of values by column
+                         name (as returned by select with raw_columns=True)
             @param start: the first row to return from the data
             @param limit: the (maximum) number of records to return
             @param filterString: The string that was used in filtering the records
             @param orderby: the DAL orderby construct
+            @param cursor: the keyset pagination cursor for the next page
         """
 
         self.data = data
         self.rfields = rfields
+        self.cursor = cursor
+
+        if isinstance(data, dict):
+            # Columnar data
+            self.columns = data
+            max = len(data.values()[0]) if data else 0
+        else:
+            self.columns = None
+            max = len(data)
 
         colnames = []
         heading = {}
@@ -108,7 +121,6 @@ class S3DataTable(object):
         self.colnames = colnames
         self.heading = heading
         
-        max = len(data)
         if start < 0:
             start == 0
         if start > max:
@@ -243,6 +255,7 @@ class S3DataTable(object):
                    '''i18n.sPrevious="%s"''' % T("Previous"),
                    '''i18n.sEmptyTable="%s"''' % T("No data available in table"),
                    '''i18n.sInfo="%s"''' % T("Showing _START_ to _END_ of _TOTAL_ entries"),
+                   '''i18n.sInfoApproximate="%s"''' % T("Showing _START_ to _END_ of about _TOTAL_ entries"),
                    '''i18n.sInfoEmpty="%s"''' % T("Showing 0 to 0 of 0 entries"),
                    '''i18n.sInfoFiltered="%s"''' % T("(filtered from _MAX_ total entries)"),
                    '''i18n.sInfoThousands="%s"''' % current.deployment_settings.get_L10n_thousands_separator(),
@@ -576,17 +589,19 @@ class S3DataTable(object):
             read_url = URL(c=c, f=f, args=args)
             S3CRUD.action_button(labels.READ, read_url)
         # Delete action
-        # @todo: does not apply selective action (renders DELETE for
-        #        all items even if the user is only permitted to delete
-        #        some of them) => should implement "restrict", see
-        #        S3CRUD.action_buttons
         deletable = current.s3db.get_config(resource.tablename, "deletable",
                                             True)
-        if deletable and \
-           has_permission("delete", table) and \
-           not ownership_required("delete", table):
+        if deletable and has_permission("delete", table):
             delete_url = URL(c=c, f=f, args=args + ["delete"])
-            S3CRUD.action_button(labels.DELETE, delete_url)
+            if ownership_required("delete", table):
+                # Check which records can be deleted (all of them, as
+                # the restrict list is also used for subsequent pages)
+                permitted = auth.s3_permitted_ids("delete", table)
+                restrict = [str(record_id) for record_id in permitted]
+                S3CRUD.action_button(labels.DELETE, delete_url,
+                                     restrict=restrict)
+            else:
+                S3CRUD.action_button(labels.DELETE, delete_url)
 
         # Append custom actions
         if custom_actions:
@@ -795,8 +810,13 @@ class S3DataTable(object):
         if data:
             # Build the body rows (the actual data)
             rc = 0
+            columns = self.columns
             for i in xrange(start, end):
-                row = data[i]
+                if columns is not None:
+                    row = Storage((colname, columns[colname][i])
+                                  for colname in columns)
+                else:
+                    row = data[i]
                 if rc % 2 == 0:
                     _class = "even"
                 else:
@@ -857,16 +877,30 @@ class S3DataTable(object):
             action_col = attr.get("dt_action_col", 0)
         structure = {}
         aadata = []
-        for i in xrange(start, end):
-            row = data[i]
-            details = []
+        bulk = "<INPUT id='select%s' type='checkbox' class='bulkcheckbox'>"
+        columns = self.columns
+        if columns is not None:
+            # Columnar data: render column by column
+            ids = columns.get(flist[action_col])
+            for i in xrange(start, end):
+                aadata.append([])
             for field in flist:
                 if field == "BULK":
-                    details.append("<INPUT id='select%s' type='checkbox' class='bulkcheckbox'>" % \
-                        row[flist[action_col]])
+                    values = [bulk % ids[i] for i in xrange(start, end)]
                 else:
-                    details.append(s3_unicode(row[field]))
-            aadata.append(details)
+                    values = [s3_unicode(v) for v in columns[field][start:end]]
+                for details, value in zip(aadata, values):
+                    details.append(value)
+        else:
+            for i in xrange(start, end):
+                row = data[i]
+                details = []
+                for field in flist:
+                    if field == "BULK":
+                        details.append(bulk % row[flist[action_col]])
+                    else:
+                        details.append(s3_unicode(row[field]))
+                aadata.append(details)
         structure["dataTable_id"] = id
         structure["dataTable_filter"] = self.filterString
         structure["dataTable_groupTotals"] = attr.get("dt_group_totals", [])
@@ -875,6 +909,12 @@ class S3DataTable(object):
         structure["iTotalRecords"] = totalrows
         structure["iTotalDisplayRecords"] = displayrows
         structure["sEcho"] = sEcho
+        if getattr(totalrows, "approximate", False) or \
+           getattr(displayrows, "approximate", False):
+            # Estimated numbers of records
+            structure["approximate"] = True
+        if self.cursor:
+            structure["cursor"] = self.cursor
         if stringify:
             from gluon.serializers import json
             return json(structure)
@@ -897,7 +937,8 @@ class S3DataList(object):
                  total=None,
                  listid=None,
                  layout=None,
-                 row_layout=None):
+                 row_layout=None,
+                 cursor=None):
         """
             Constructor
 
@@ -912,11 +953,13 @@ class S3DataList(object):
                            function(listid, resource, rfields, record)
             @param row_layout: row renderer (optional) as
                                function(listid, resource, rowsize, items)
+            @param cursor: the keyset pagination cursor for the next page
         """
 
         self.resource = resource
         self.list_fields = list_fields
         self.records = records
+        self.cursor = cursor
 
         if listid is None:
             self.listid = "datalist"
@@ -970,6 +1013,11 @@ class S3DataList(object):
         
         records = self.records
         if records is not None:
+
+            # Look up the permissions for all items at once, so that item
+            # renderers can check them without querying per record
+            self.check_permissions(("update", "delete"))
+
             items = [
                 DIV(T("Total Records: %(numrows)s") % {"numrows": self.total},
                     _class="dl-header",
@@ -1004,6 +1052,12 @@ class S3DataList(object):
 
                 items.append(row)
                 row_idx += 1
+
+            # Attach the pagination cursor to the last row (for
+            # infinite scroll, which only picks up the rows)
+            cursor = self.cursor
+            if cursor and len(items) > 1 and hasattr(items[-1], "attributes"):
+                items[-1]["_data-cursor"] = cursor
         else:
             # template
             raise NotImplementedError
@@ -1019,6 +1073,7 @@ class S3DataList(object):
                    "pagesize": pagesize,
                    "rowsize": rowsize,
                    "ajaxurl": ajaxurl,
+                   "cursor": self.cursor,
                    }
         if popup_url:
             input_class = "dl-pagination"
@@ -1044,6 +1099,41 @@ class S3DataList(object):
 
         return dl
 
+    # ---------------------------------------------------------------------
+    def check_permissions(self, methods):
+        """
+            Check the permissions for all records in this list, so that
+            subsequent permission checks for individual records (e.g. in
+            custom item renderers) can be answered without further queries
+
+            @param methods: list of access methods
+
+            @return: dict {method: set of permitted record IDs}
+        """
+
+        resource = self.resource
+        records = self.records
+
+        pkey = str(resource._id)
+        record_ids = []
+        append = record_ids.append
+        for record in records:
+            raw = record.get("_row")
+            if raw and pkey in raw:
+                append(raw[pkey])
+            elif pkey in record:
+                append(record[pkey])
+
+        permitted = {}
+        if not record_ids:
+            return permitted
+        permitted_ids = current.auth.s3_permitted_ids
+        table = resource.table
+        for method in methods:
+            permitted[method] = permitted_ids(method, table,
+                                              record_ids=record_ids)
+        return permitted
+
     # ---------------------------------------------------------------------
     @staticmethod
     def groups(iterable, length):
@@ -1167,7 +1257,14 @@ class S3PivotTable(object):
         self.records = None
         """ All records in the pivot table as a Storage like:
                 {
-                 <record_id>: <Row>
+                 <record_id>: <index in columns>
+                }
+        """
+        self.columns = None
+        """ The field values of all records in the pivot table, as a dict
+            of lists in the order of the record index:
+                {
+                 <colname>: [<value>, ...]
                 }
         """
 
@@ -1229,13 +1326,20 @@ class S3PivotTable(object):
 
         # Retrieve the records ------------------------------------------------
         #
-        data = resource.select(self.rfields.keys(), limit=None)
-        drows = data["rows"]
-        if drows:
+        key = str(resource.table._id)
+        columns = {}
+        for chunk in resource.iterselect(self.rfields.keys(),
+                                         raw_columns=True):
+            for colname, values in chunk.items():
+                if colname in columns:
+                    columns[colname].extend(values)
+                else:
+                    columns[colname] = values
+        record_ids = columns.get(key)
+        if record_ids:
+            records = Storage([(_id, idx)
+                               for idx, _id in enumerate(record_ids)])
 
-            key = str(resource.table._id)
-            records = Storage([(i[key], i) for i in drows])
-                
             # Generate the data frame -----------------------------------------
             #
             gfields = self.gfields
@@ -1256,16 +1360,18 @@ class S3PivotTable(object):
             insert = dataframe.append
             expand = self._expand
 
-            for _id in records:
-                row = records[_id]
+            row_values = columns.get(rows_colname) if rows_colname else None
+            col_values = columns.get(cols_colname) if cols_colname else None
+            for idx, _id in enumerate(record_ids):
                 item = {key: _id}
                 if rows_colname:
-                    item[rows_colname] = row[rows_colname]
+                    item[rows_colname] = row_values[idx]
                 if cols_colname:
-                    item[cols_colname] = row[cols_colname]
+                    item[cols_colname] = col_values[idx]
                 dataframe.extend(expand(item, axisfilter=axisfilter))
                 
             self.records = records
+            self.columns = columns
 
             #if DEBUG:
                 #duration = datetime.datetime.now() - _start
@@ -1541,11 +1647,7 @@ class S3PivotTable(object):
                         has_fk = field is not None and s3_has_foreign_key(field)
                         for id in cell.records:
 
-                            record = self.records[id]
-                            try:
-                                fvalue = record[colname]
-                            except AttributeError:
-                                fvalue = None
+                            fvalue = self._value(id, colname)
 
                             if fvalue is not None:
                                 if has_fk:
@@ -1857,11 +1959,7 @@ class S3PivotTable(object):
                     if method == "count":
                         keys = []
                         for record_id in cell_records:
-                            record = self.records[record_id]
-                            try:
-                                fvalue = record[rfield.colname]
-                            except AttributeError:
-                                continue
+                            fvalue = self._value(record_id, rfield.colname)
                             if fvalue is None:
                                 continue
                             if type(fvalue) is not list:
@@ -2293,7 +2391,7 @@ class S3PivotTable(object):
                     values = []
                     append = values.append
                     for i in ids:
-                        value = extract(records[i], fact)
+                        value = extract(i, fact)
                         if value is None:
                             continue
                         append(value)
@@ -2584,22 +2682,35 @@ class S3PivotTable(object):
         return totals
 
     # -------------------------------------------------------------------------
-    def _extract(self, row, field):
+    def _extract(self, record_id, field):
         """
-            Extract a field value from a DAL row
+            Extract a field value for a record
 
-            @param row: the row
+            @param record_id: the record ID
             @param field: the fieldname (list_fields syntax)
         """
 
         rfields = self.rfields
         if field not in rfields:
             raise KeyError("Invalid field name: %s" % field)
-        rfield = rfields[field]
-        try:
-            return rfield.extract(row)
-        except AttributeError:
+        return self._value(record_id, rfields[field].colname)
+
+    # -------------------------------------------------------------------------
+    def _value(self, record_id, colname):
+        """
+            Look up a field value for a record in the data columns
+
+            @param record_id: the record ID
+            @param colname: the column name
+        """
+
+        column = self.columns.get(colname)
+        if column is None:
+            return None
+        idx = self.records.get(record_id)
+        if idx is None:
             return None
+        return column[idx]
 
     # -------------------------------------------------------------------------
     def _expand(self, row, axisfilter=None):
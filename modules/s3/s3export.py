@@ -33,8 +33,14 @@
 
 __all__ = ["S3Exporter"]
 
+import csv
+
+from tempfile import TemporaryFile
+
 from gluon import current
+from gluon.serializers import json as jsons
 from gluon.storage import Storage
+from gluon.streamer import DEFAULT_CHUNK_SIZE
 
 from s3codec import S3Codec
 
@@ -77,8 +83,31 @@ class S3Exporter(object):
             response.headers["Content-Type"] = contenttype(".csv")
             response.headers["Content-disposition"] = "attachment; filename=%s" % filename
 
-        rows = resource.select(None, as_rows=True)
-        return str(rows)
+        table = resource.table
+        fields = [f.name for f in resource.readable_fields()]
+        if table._id.name not in fields:
+            # Record ID is required to re-import the file
+            fields.insert(0, table._id.name)
+        rfields = resource.resolve_selectors(fields, extra_fields=False)[0]
+        colnames = [rfield.colname for rfield in rfields]
+
+        def encode(value):
+            if value is None:
+                return "<NULL>"
+            elif isinstance(value, (list, tuple)):
+                return "|%s|" % "|".join([encode(v) for v in value])
+            elif isinstance(value, unicode):
+                return value.encode("utf-8")
+            else:
+                return str(value)
+
+        # Write the rows in chunks rather than loading them all at once
+        output = TemporaryFile()
+        writer = csv.writer(output)
+        writer.writerow(colnames)
+        for row in resource.iterselect(fields):
+            writer.writerow([encode(row[colname]) for colname in colnames])
+        return self._stream(output)
 
     # -------------------------------------------------------------------------
     def json(self, resource,
@@ -100,6 +129,34 @@ class S3Exporter(object):
         if fields is None:
             fields = [f.name for f in resource.table if f.readable]
 
+        response = current.response
+        if response:
+            response.headers["Content-Type"] = "application/json"
+
+        if limit is None and not start:
+            # Encode the rows in chunks rather than loading them all at
+            # once (only possible if all fields are in the master table)
+            tablename = resource.tablename
+            rfields = resource.resolve_selectors(fields, extra_fields=False)[0]
+            colnames = {}
+            for rfield in rfields:
+                if rfield.tname != tablename:
+                    colnames = None
+                    break
+                colnames[rfield.colname] = rfield.fname
+            if colnames:
+                output = TemporaryFile()
+                output.write("[")
+                separator = ""
+                for item in resource.iterselect(fields, orderby=orderby):
+                    output.write(separator)
+                    output.write(jsons(dict((colnames[k], v)
+                                            for k, v in item.items()
+                                            if k in colnames)))
+                    separator = ","
+                output.write("]")
+                return self._stream(output)
+
         # Get the rows and return as json
         rows = resource.select(fields,
                                start=start,
@@ -107,11 +164,28 @@ class S3Exporter(object):
                                orderby=orderby,
                                as_rows=True)
 
+        return rows.json()
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _stream(output):
+        """
+            Stream the contents of a temporary file as response body
+
+            @param output: the file (will be closed after streaming)
+        """
+
+        output.seek(0)
         response = current.response
         if response:
-            response.headers["Content-Type"] = "application/json"
-
-        return rows.json()
+            # Raises HTTP(200)
+            return response.stream(output,
+                                   chunk_size=DEFAULT_CHUNK_SIZE,
+                                   request=current.request)
+        else:
+            contents = output.read()
+            output.close()
+            return contents
 
     # -------------------------------------------------------------------------
     def pdf(self, *args, **kwargs):
@@ -30,6 +30,8 @@
 """
 
 import datetime
+import hashlib
+import re
 import sys
 from itertools import chain
 from uuid import uuid4
@@ -40,12 +42,12 @@ from gluon import *
 #from gluon.dal import Field
 #from gluon.html import *
 #from gluon.validators import *
-from gluon.dal import Query, SQLCustomType
+from gluon.dal import Expression, Query, SQLCustomType
 from gluon.storage import Storage
 from gluon.languages import lazyT
 
 from s3navigation import S3ScriptItem
-from s3utils import S3DateTime, s3_auth_user_represent, s3_auth_user_represent_name, s3_unicode
+from s3utils import S3DateTime, s3_auth_user_represent, s3_auth_user_represent_name, s3_debug, s3_unicode
 from s3validators import IS_ONE_OF, IS_UTC_DATETIME
 from s3widgets import S3AutocompleteWidget, S3DateWidget, S3DateTimeWidget
 
@@ -188,6 +190,370 @@ class S3ReusableField(object):
         else:
             return Field(name, self.__type, **ia)
 
+# =============================================================================
+class S3Computed(object):
+    """
+        Declaration of a persisted computed column, i.e. a real table
+        column holding a value which is derived from this and other
+        tables, and which is updated incrementally whenever any of the
+        records it depends on is written (rather than being recomputed
+        on every read like a virtual field).
+
+        Computed columns are declared in S3Model.define_table:
+
+        define_table(tablename,
+                     Field("total", "double"),
+                     ...,
+                     computed = {"total": S3Computed(compute,
+                                                     depends=["item.amount"],
+                                                     )})
+
+        where compute is a function taking a list of record IDs and
+        returning a dict {record_id: value} (same as batch methods for
+        virtual fields), and depends is a list of field selectors
+        (relative to the table) of the fields the value depends on.
+    """
+
+    def __init__(self, compute, depends=None):
+        """
+            Constructor
+
+            @param compute: the compute function
+            @param depends: list of field selectors of the dependencies
+        """
+
+        self.compute = compute
+        if not depends:
+            depends = []
+        elif not isinstance(depends, (list, tuple)):
+            depends = [depends]
+        self.depends = depends
+
+# =============================================================================
+class S3Index(object):
+    """
+        Declaration of a database index, declared in S3Model.define_table
+        (or with s3db.configure) like:
+
+        define_table(tablename,
+                     ...,
+                     indexes = ["name",
+                                ("pe_id", "ancestor"),
+                                S3Index("organisation_id", active=True),
+                                ])
+
+        i.e. either as a field name, a tuple of field names (composite
+        index) or an S3Index instance for further options. Indexes are
+        created by S3Model.create_indexes (at migration time).
+
+        The class also implements the index advisor, which reports the
+        filters and orderbys of S3Resource.select which lack a supporting
+        index (settings.base.index_advisor).
+    """
+
+    # Process-wide cache of the existing indexes {tablename: [columns]}
+    CATALOG = {}
+
+    # Query shapes reported by the index advisor in this process
+    ADVISED = set()
+
+    # Columns which are part of almost every filter, but too unselective
+    # to make an index on them a supporting index for the filter
+    TRIVIAL = ("deleted", "owned_by_user", "owned_by_group", "realm_entity")
+
+    def __init__(self, *fields, **options):
+        """
+            Constructor
+
+            @param fields: the field names
+            @param options: index options:
+                            - name: the index name (default: generated)
+                            - unique: unique index (default False)
+                            - active: partial index of the records which
+                                      are not deleted (WHERE deleted=False),
+                                      where supported (PostgreSQL and SQLite)
+        """
+
+        self.fields = tuple(fields)
+        self.name = options.get("name")
+        self.unique = options.get("unique", False)
+        self.active = options.get("active", False)
+
+    # -------------------------------------------------------------------------
+    def __repr__(self):
+
+        return "<S3Index %s>" % ",".join(self.fields)
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def parse(cls, spec):
+        """
+            Get the S3Index instance for an index specification
+
+            @param spec: the specification (field name, tuple of field
+                         names or S3Index instance)
+
+            @return: S3Index
+        """
+
+        if isinstance(spec, S3Index):
+            return spec
+        elif isinstance(spec, (list, tuple)):
+            return cls(*spec)
+        else:
+            return cls(spec)
+
+    # -------------------------------------------------------------------------
+    def index_name(self, tablename):
+        """
+            Get the name for this index
+
+            @param tablename: the table name
+
+            @return: the index name
+        """
+
+        name = self.name
+        if not name:
+            name = "%s_%s__idx" % (tablename, "_".join(self.fields))
+            if len(name) > 63:
+                # PostgreSQL truncates identifiers to 63 characters
+                suffix = hashlib.md5(name).hexdigest()[:8]
+                name = "%s_%s__idx" % (name[:50], suffix)
+        return name
+
+    # -------------------------------------------------------------------------
+    def covered(self, existing):
+        """
+            Check whether this index is covered by any of the existing
+            indexes (i.e. an index with the same leading columns exists)
+
+            @param existing: list of tuples of column names (from catalog)
+
+            @return: True|False
+        """
+
+        fields = self.fields
+        length = len(fields)
+        for columns in existing:
+            if tuple(columns[:length]) == fields:
+                if not self.unique or len(columns) == length:
+                    return True
+        return False
+
+    # -------------------------------------------------------------------------
+    def create(self, table):
+        """
+            Create this index in the database
+
+            @param table: the Table
+
+            @return: the index name
+        """
+
+        db = table._db
+        engine = db._dbname
+        tablename = table._tablename
+
+        sql = "CREATE %sINDEX %s ON %s (%s)" % \
+              ("UNIQUE " if self.unique else "",
+               self.index_name(tablename),
+               tablename,
+               ", ".join(self.fields))
+
+        if self.active and "deleted" in table.fields:
+            partial = False
+            if engine == "postgres":
+                partial = True
+            elif engine == "sqlite":
+                import sqlite3
+                # Partial indexes require SQLite 3.8.0 or later
+                partial = sqlite3.sqlite_version_info >= (3, 8, 0)
+            if partial:
+                # Same expression as in DAL queries for "deleted != True"
+                sql = "%s WHERE deleted <> %s" % \
+                      (sql, db._adapter.represent(True, "boolean"))
+
+        db.executesql("%s;" % sql)
+        self.CATALOG.pop(tablename, None)
+        return self.index_name(tablename)
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def existing(cls, table):
+        """
+            Get the existing indexes of a table from the database
+            catalog (cached per process)
+
+            @param table: the Table
+
+            @return: list of tuples of column names, or None if the
+                     database engine is not supported
+        """
+
+        tablename = table._tablename
+        catalog = cls.CATALOG
+        if tablename in catalog:
+            return catalog[tablename]
+
+        db = table._db
+        engine = db._dbname
+        indexes = []
+        if engine == "sqlite":
+            rows = db.executesql("PRAGMA index_list(%s);" % tablename)
+            for row in rows:
+                info = db.executesql("PRAGMA index_info(%s);" % row[1])
+                info = sorted(info, key=lambda item: item[0])
+                indexes.append(tuple(item[2] for item in info))
+        elif engine == "postgres":
+            rows = db.executesql("SELECT indexdef FROM pg_indexes "
+                                 "WHERE tablename='%s';" % tablename)
+            for row in rows:
+                match = re.search(r"USING \w+ \((.*?)\)", row[0])
+                if match:
+                    columns = [c.strip().strip('"')
+                               for c in match.group(1).split(",")]
+                    indexes.append(tuple(columns))
+        elif engine == "mysql":
+            rows = db.executesql("SHOW INDEX FROM %s;" % tablename)
+            keys = {}
+            for row in rows:
+                # Key_name, Seq_in_index, Column_name
+                keys.setdefault(row[2], []).append((row[3], row[4]))
+            for columns in keys.values():
+                indexes.append(tuple(c[1] for c in sorted(columns)))
+        else:
+            return None
+
+        # The primary key is always indexed
+        pkey = table._id.name
+        if (pkey,) not in indexes:
+            indexes.append((pkey,))
+
+        catalog[tablename] = indexes
+        return indexes
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def advise(cls, query, orderby=None):
+        """
+            Index advisor: report filters and orderbys without a supporting
+            index (i.e. where none of the selective filtered fields of a
+            table, or the first orderby field, is the leading column of an
+            index), once per query shape and process
+
+            @param query: the DAL Query
+            @param orderby: the orderby expression
+
+            @return: list of the reported shapes (kind, tablename, fieldnames)
+
+            @note: filters on boolean fields and on the TRIVIAL columns
+                   (deleted flag, ownership fields) are not selective
+                   enough to be supported by an index, and hence ignored
+        """
+
+        db = current.db
+
+        shapes = []
+
+        columns = {}
+        if query is not None:
+            cls.query_columns(query, columns)
+        for tablename, fieldnames in columns.items():
+            shapes.append(("filter", tablename, tuple(sorted(fieldnames))))
+
+        field = cls.first_field(orderby)
+        if field is not None:
+            tablename = cls.original_tablename(field)
+            shapes.append(("orderby", tablename, (field.name,)))
+
+        advised = cls.ADVISED
+        reported = []
+        for shape in shapes:
+            if shape in advised:
+                continue
+            advised.add(shape)
+
+            kind, tablename, fieldnames = shape
+            if tablename not in db:
+                continue
+            table = db[tablename]
+            if kind == "filter":
+                trivial = cls.TRIVIAL
+                fieldnames = [fn for fn in fieldnames
+                              if fn not in trivial and fn in table.fields and
+                                 table[fn].type != "boolean"]
+                if not fieldnames:
+                    continue
+            existing = cls.existing(table)
+            if existing is None:
+                continue
+            leading = set(columns[0] for columns in existing if columns)
+            if not leading.intersection(fieldnames):
+                s3_debug("S3Index Advisor",
+                         "no index for %s by %s(%s)" % \
+                         (kind, tablename, ", ".join(fieldnames)))
+                reported.append((kind, tablename, tuple(fieldnames)))
+        return reported
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def query_columns(cls, query, columns):
+        """
+            Find all fields in a query, helper for advise()
+
+            @param query: the Query (or Expression)
+            @param columns: dict to collect the field names per table
+        """
+
+        for operand in (query.first, query.second):
+            if isinstance(operand, Field):
+                tablename = cls.original_tablename(operand)
+                fieldnames = columns.setdefault(tablename, set())
+                fieldnames.add(operand.name)
+            elif isinstance(operand, (Query, Expression)):
+                cls.query_columns(operand, columns)
+        return
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def first_field(orderby):
+        """
+            Get the first field in an orderby expression, helper for
+            advise()
+
+            @param orderby: the orderby expression
+
+            @return: the Field, or None
+        """
+
+        if isinstance(orderby, (list, tuple)):
+            orderby = orderby[0] if orderby else None
+        while orderby is not None:
+            if isinstance(orderby, Field):
+                return orderby
+            elif isinstance(orderby, Expression):
+                orderby = orderby.first
+            else:
+                break
+        return None
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def original_tablename(field):
+        """
+            Get the name of the original table of a field (for aliased
+            tables)
+
+            @param field: the Field
+
+            @return: the table name
+        """
+
+        table = field.table
+        original = getattr(table, "_ot", None)
+        return original if original else table._tablename
+
 # =============================================================================
 class S3Represent(object):
     """
@@ -53,6 +53,8 @@ from gluon.validators import Validator
 
 from s3resource import S3FieldSelector
 from s3utils import s3_mark_required, s3_unicode
+from s3validators import IS_ONE_OF_EMPTY
+from s3widgets import S3OptionsLookupWidget
 
 # =============================================================================
 class S3SQLForm(object):
@@ -157,6 +159,31 @@ class S3SQLForm(object):
             buttons.append(button)
         return buttons
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _lookup_widgets(fields):
+        """
+            Render reference fields with lazy IS_ONE_OF validators (i.e.
+            with too many options for a dropdown) as lookup widgets
+
+            @param fields: the form fields
+        """
+
+        for field in fields:
+            if not field.writable or field.widget is not None:
+                continue
+            requires = field.requires
+            if isinstance(requires, (list, tuple)):
+                if len(requires) != 1:
+                    continue
+                requires = requires[0]
+            if isinstance(requires, IS_EMPTY_OR):
+                requires = requires.other
+            if isinstance(requires, IS_ONE_OF_EMPTY) and \
+               not requires.multiple and requires.is_lazy():
+                field.widget = S3OptionsLookupWidget()
+        return
+
     # -------------------------------------------------------------------------
     @staticmethod
     def _insert_subheadings(form, tablename, subheadings):
@@ -342,6 +369,10 @@ class S3SQLDefaultForm(S3SQLForm):
                              _href=response.s3.cancel,
                              _class="action-lnk"))
 
+        # Render reference fields with too many options as lookups
+        if not readonly:
+            self._lookup_widgets([table[f] for f in table.fields])
+
         # Generate the form
         if record is None:
             record = record_id
@@ -856,6 +887,10 @@ class S3SQLCustomForm(S3SQLForm):
                          _href=s3.cancel,
                          _class="action-lnk")]
 
+        # Render master table fields with too many options as lookups
+        if not readonly:
+            self._lookup_widgets([f for a, n, f in fields if a is None])
+
         # Render the form
         tablename = self.tablename
         form = SQLFORM.factory(*formfields,
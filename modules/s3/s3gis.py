@@ -31,10 +31,13 @@
 
 __all__ = ["GIS",
            "S3Map",
+           "S3MapTiles",
+           "S3MapClusters",
            "S3ExportPOI",
            "S3ImportPOI",
            ]
 
+import hashlib
 import os
 import re
 import sys
@@ -103,12 +106,20 @@ GEOM_TYPES = {"point": 1,
               "geometrycollection": 7,
               }
 
+# Levels of the Location Hierarchy
+LOCATION_LEVELS = ("L0", "L1", "L2", "L3", "L4", "L5")
+
 # km
 RADIUS_EARTH = 6371.01
 
 # Compact JSON encoding
 SEPARATORS = (",", ":")
 
+# Tolerances (in degrees) & decimal places of the precomputed
+# simplified geometries of Locations (see GIS.update_simplified)
+SIMPLIFY_TOLERANCES = (0.1, 0.01, 0.001, 0.0001)
+SIMPLIFY_DECIMALS = 4
+
 # Map Defaults
 # Also in static/S3/s3.gis.js
 # http://dev.openlayers.org/docs/files/OpenLayers/Strategy/Cluster-js.html
@@ -1663,8 +1674,15 @@ class GIS(object):
             The Polygon can be either a WKT string or the ID of a record in the
             gis_location table
 
+            Candidates are pre-filtered in the database by their bounds
+            (see query_features_by_bbox), so that the full geometry check
+            only runs for features inside the bbox of the Polygon
+
+            @param location: the Polygon (WKT or gis_location record ID)
+            @param tablename: the table to find features in (must have a
+                              location_id), None to find Locations
+
             Currently unused.
-            @ToDo: Optimise to not use try/except
         """
 
         from shapely.geos import ReadingError
@@ -1681,37 +1699,18 @@ class GIS(object):
         s3db = current.s3db
         locations = s3db.gis_location
 
-        try:
-            location_id = int(location)
+        if str(location).isdigit():
             # Check that the location is a polygon
-            query = (locations.id == location_id)
+            query = (locations.id == int(location))
             location = db(query).select(locations.wkt,
-                                        locations.lon_min,
-                                        locations.lon_max,
-                                        locations.lat_min,
-                                        locations.lat_max,
                                         limitby=(0, 1)).first()
-            if location:
-                wkt = location.wkt
-                if wkt and (wkt.startswith("POLYGON") or \
-                            wkt.startswith("MULTIPOLYGON")):
-                    # ok
-                    lon_min = location.lon_min
-                    lon_max = location.lon_max
-                    lat_min = location.lat_min
-                    lat_max = location.lat_max
-
-                else:
-                    s3_debug("Location searched within isn't a Polygon!")
-                    return None
-        except: # @ToDo: need specific exception
+            wkt = location.wkt if location else None
+        else:
             wkt = location
-            if (wkt.startswith("POLYGON") or wkt.startswith("MULTIPOLYGON")):
-                # ok
-                lon_min = None
-            else:
-                s3_debug("This isn't a Polygon!")
-                return None
+        if not wkt or \
+           not (wkt.startswith("POLYGON") or wkt.startswith("MULTIPOLYGON")):
+            s3_debug("Location searched within isn't a Polygon!")
+            return None
 
         try:
             polygon = wkt_loads(wkt)
@@ -1719,78 +1718,53 @@ class GIS(object):
             s3_debug("Invalid Polygon!")
             return None
 
-        table = s3db[tablename]
-
-        if "location_id" not in table.fields():
-            # @ToDo: Add any special cases to be able to find the linked location
-            s3_debug("This table doesn't have a location_id!")
-            return None
+        # Pre-filter by bounds
+        query = self.query_features_by_bbox(*polygon.bounds, centroids=True)
+        if "deleted" in locations.fields:
+            query &= (locations.deleted != True)
 
-        query = (table.location_id == locations.id)
-        if "deleted" in table.fields:
-            query &= (table.deleted == False)
-        # @ToDo: Check AAA (do this as a resource filter?)
+        if tablename:
+            table = s3db[tablename]
+            if "location_id" not in table.fields:
+                # @ToDo: Add any special cases to be able to find the linked location
+                s3_debug("This table doesn't have a location_id!")
+                return None
+            query &= (table.location_id == locations.id)
+            if "deleted" in table.fields:
+                query &= (table.deleted != True)
+            # @ToDo: Check AAA (do this as a resource filter?)
+            features = db(query).select(locations.id,
+                                        locations.wkt,
+                                        locations.lat,
+                                        locations.lon,
+                                        table.ALL)
+        else:
+            features = db(query).select(locations.ALL)
 
-        features = db(query).select(locations.wkt,
-                                    locations.lat,
-                                    locations.lon,
-                                    table.ALL)
-        output = Rows()
+        # Full geometry check of the remaining features
         # @ToDo: provide option to use PostGIS/Spatialite
-        # settings = current.deployment_settings
-        # if settings.gis.spatialdb and settings.database.db_type == "postgres":
-        if lon_min is None:
-            # We have no BBOX so go straight to the full geometry check
-            for row in features:
-                _location = row.gis_location
-                wkt = _location.wkt
-                if wkt is None:
-                    lat = _location.lat
-                    lon = _location.lon
-                    if lat is not None and lon is not None:
-                        wkt = self.latlon_to_wkt(lat, lon)
-                    else:
-                        continue
-                try:
-                    shape = wkt_loads(wkt)
-                    if shape.intersects(polygon):
-                        # Save Record
-                        output.records.append(row)
-                except ReadingError:
-                    s3_debug(
-                        "Error reading wkt of location with id",
-                        value=row.id
-                    )
-        else:
-            # 1st check for Features included within the bbox (faster)
-            def in_bbox(row):
-                _location = row.gis_location
-                return (_location.lon > lon_min) & \
-                       (_location.lon < lon_max) & \
-                       (_location.lat > lat_min) & \
-                       (_location.lat < lat_max)
-            for row in features.find(lambda row: in_bbox(row)):
-                # Search within this subset with a full geometry check
-                # Uses Shapely.
-                _location = row.gis_location
-                wkt = _location.wkt
-                if wkt is None:
-                    lat = _location.lat
-                    lon = _location.lon
-                    if lat is not None and lon is not None:
-                        wkt = self.latlon_to_wkt(lat, lon)
-                    else:
-                        continue
-                try:
-                    shape = wkt_loads(wkt)
-                    if shape.intersects(polygon):
-                        # Save Record
-                        output.records.append(row)
-                except ReadingError:
-                    s3_debug(
-                        "Error reading wkt of location with id",
-                        value = row.id,
-                    )
+        latlon_to_wkt = self.latlon_to_wkt
+        output = Rows()
+        for row in features:
+            _location = row.gis_location if tablename else row
+            wkt = _location.wkt
+            if wkt is None:
+                lat = _location.lat
+                lon = _location.lon
+                if lat is not None and lon is not None:
+                    wkt = latlon_to_wkt(lat, lon)
+                else:
+                    continue
+            try:
+                shape = wkt_loads(wkt)
+                if shape.intersects(polygon):
+                    # Save Record
+                    output.records.append(row)
+            except ReadingError:
+                s3_debug(
+                    "Error reading wkt of location with id",
+                    value=_location.id
+                )
 
         return output
 
@@ -1799,189 +1773,185 @@ class GIS(object):
         """
             Returns Features within a Radius (in km) of a LatLon Location
 
-            Unused
+            Candidates are pre-filtered in the database by their bounds
+            (see query_features_by_bbox), and then checked in Python:
+            Points by their Great Circle distance, other geometries by
+            intersection with the circle (requires Shapely, otherwise
+            the nearest point of their bounds is used)
+
+            @param lat: the latitude of the center
+            @param lon: the longitude of the center
+            @param radius: the radius (in km)
+            @param tablename: the table to find features in (must have a
+                              location_id), None to find Locations
+
+            @return: Rows
         """
 
         import math
 
         db = current.db
-        settings = current.deployment_settings
-
-        if settings.gis.spatialdb and settings.database.db_type == "postgres":
-            # Use PostGIS routine
-            # The ST_DWithin function call will automatically include a bounding box comparison that will make use of any indexes that are available on the geometries.
-            # @ToDo: Support optional Category (make this a generic filter?)
-
-            import psycopg2
-            import psycopg2.extras
-
-            dbname = settings.database.database
-            username = settings.database.username
-            password = settings.database.password
-            host = settings.database.host
-            port = settings.database.port or "5432"
-
-            # Convert km to degrees (since we're using the_geom not the_geog)
-            radius = math.degrees(float(radius) / RADIUS_EARTH)
-
-            connection = psycopg2.connect("dbname=%s user=%s password=%s host=%s port=%s" % (dbname, username, password, host, port))
-            cursor = connection.cursor(cursor_factory=psycopg2.extras.DictCursor)
-            info_string = "SELECT column_name, udt_name FROM information_schema.columns WHERE table_name = 'gis_location' or table_name = '%s';" % tablename
-            cursor.execute(info_string)
-            # @ToDo: Look at more optimal queries for just those fields we need
-            if tablename:
-                # Lookup the resource
-                query_string = cursor.mogrify("SELECT * FROM gis_location, %s WHERE %s.location_id = gis_location.id and ST_DWithin (ST_GeomFromText ('POINT (%s %s)', 4326), the_geom, %s);" % (tablename, tablename, lat, lon, radius))
-            else:
-                # Lookup the raw Locations
-                query_string = cursor.mogrify("SELECT * FROM gis_location WHERE ST_DWithin (ST_GeomFromText ('POINT (%s %s)', 4326), the_geom, %s);" % (lat, lon, radius))
-
-            cursor.execute(query_string)
-            # @ToDo: Export Rows?
-            features = []
-            for record in cursor:
-                d = dict(record.items())
-                row = Storage()
-                # @ToDo: Optional support for Polygons
-                if tablename:
-                    row.gis_location = Storage()
-                    row.gis_location.id = d["id"]
-                    row.gis_location.lat = d["lat"]
-                    row.gis_location.lon = d["lon"]
-                    row.gis_location.lat_min = d["lat_min"]
-                    row.gis_location.lon_min = d["lon_min"]
-                    row.gis_location.lat_max = d["lat_max"]
-                    row.gis_location.lon_max = d["lon_max"]
-                    row[tablename] = Storage()
-                    row[tablename].id = d["id"]
-                    row[tablename].name = d["name"]
-                else:
-                    row.name = d["name"]
-                    row.id = d["id"]
-                    row.lat = d["lat"]
-                    row.lon = d["lon"]
-                    row.lat_min = d["lat_min"]
-                    row.lon_min = d["lon_min"]
-                    row.lat_max = d["lat_max"]
-                    row.lon_max = d["lon_max"]
-                features.append(row)
-
-            return features
-
-        #elif settings.database.db_type == "mysql":
-            # Do the calculation in MySQL to pull back only the relevant rows
-            # Raw MySQL Formula from: http://blog.peoplesdns.com/archives/24
-            # PI = 3.141592653589793, mysql's pi() function returns 3.141593
-            #pi = math.pi
-            #query = """SELECT name, lat, lon, acos(SIN( PI()* 40.7383040 /180 )*SIN( PI()*lat/180 ))+(cos(PI()* 40.7383040 /180)*COS( PI()*lat/180) *COS(PI()*lon/180-PI()* -73.99319 /180))* 3963.191
-            #AS distance
-            #FROM gis_location
-            #WHERE 1=1
-            #AND 3963.191 * ACOS( (SIN(PI()* 40.7383040 /180)*SIN(PI() * lat/180)) + (COS(PI()* 40.7383040 /180)*cos(PI()*lat/180)*COS(PI() * lon/180-PI()* -73.99319 /180))) < = 1.5
-            #ORDER BY 3963.191 * ACOS((SIN(PI()* 40.7383040 /180)*SIN(PI()*lat/180)) + (COS(PI()* 40.7383040 /180)*cos(PI()*lat/180)*COS(PI() * lon/180-PI()* -73.99319 /180)))"""
-            # db.executesql(query)
 
+        # Calculate the bounding box
+        # http://janmatuschek.de/LatitudeLongitudeBoundingCoordinates
+        # shortcuts
+        radians = math.radians
+        degrees = math.degrees
+
+        MIN_LAT = radians(-90)     # -PI/2
+        MAX_LAT = radians(90)      # PI/2
+        MIN_LON = radians(-180)    # -PI
+        MAX_LON = radians(180)     #  PI
+
+        # Convert to radians for the calculation
+        r = float(radius) / RADIUS_EARTH
+        radLat = radians(lat)
+        radLon = radians(lon)
+
+        minLat = radLat - r
+        maxLat = radLat + r
+
+        if (minLat > MIN_LAT) and (maxLat < MAX_LAT):
+            deltaLon = math.asin(math.sin(r) / math.cos(radLat))
+            minLon = radLon - deltaLon
+            if (minLon < MIN_LON):
+                minLon += 2 * math.pi
+            maxLon = radLon + deltaLon
+            if (maxLon > MAX_LON):
+                maxLon -= 2 * math.pi
         else:
-            # Calculate in Python
-            # Pull back all the rows within a square bounding box (faster than checking all features manually)
-            # Then check each feature within this subset
-            # http://janmatuschek.de/LatitudeLongitudeBoundingCoordinates
-
+            # Special care for Poles & 180 Meridian:
+            # http://janmatuschek.de/LatitudeLongitudeBoundingCoordinates#PolesAnd180thMeridian
+            minLat = max(minLat, MIN_LAT)
+            maxLat = min(maxLat, MAX_LAT)
+            minLon = MIN_LON
+            maxLon = MAX_LON
+
+        # Convert back to degrees
+        minLat = degrees(minLat)
+        minLon = degrees(minLon)
+        maxLat = degrees(maxLat)
+        maxLon = degrees(maxLon)
+
+        # shortcut
+        locations = current.s3db.gis_location
+
+        if minLon > maxLon:
+            # Bounding box crosses the 180 Meridian
+            query = self.query_features_by_bbox(minLon, minLat, 180, maxLat,
+                                                centroids=True) | \
+                    self.query_features_by_bbox(-180, minLat, maxLon, maxLat,
+                                                centroids=True)
+        else:
+            query = self.query_features_by_bbox(minLon, minLat, maxLon, maxLat,
+                                                centroids=True)
+        query &= (locations.deleted != True)
+
+        fields = [locations.id,
+                  locations.name,
+                  locations.level,
+                  locations.gis_feature_type,
+                  locations.wkt,
+                  locations.lat,
+                  locations.lon,
+                  locations.lat_min,
+                  locations.lon_min,
+                  locations.lat_max,
+                  locations.lon_max,
+                  ]
+        if tablename:
+            # Lookup the resource
             # @ToDo: Support optional Category (make this a generic filter?)
+            table = current.s3db[tablename]
+            query &= (table.location_id == locations.id)
+            if "deleted" in table.fields:
+                query &= (table.deleted != True)
+            fields.insert(0, table.ALL)
+        records = db(query).select(*fields)
+
+        circle = None
+        try:
+            from shapely.wkt import loads as wkt_loads
+        except ImportError:
+            SHAPELY = False
+        else:
+            SHAPELY = True
 
-            # shortcuts
-            radians = math.radians
-            degrees = math.degrees
-
-            MIN_LAT = radians(-90)     # -PI/2
-            MAX_LAT = radians(90)      # PI/2
-            MIN_LON = radians(-180)    # -PI
-            MAX_LON = radians(180)     #  PI
-
-            # Convert to radians for the calculation
-            r = float(radius) / RADIUS_EARTH
-            radLat = radians(lat)
-            radLon = radians(lon)
-
-            # Calculate the bounding box
-            minLat = radLat - r
-            maxLat = radLat + r
-
-            if (minLat > MIN_LAT) and (maxLat < MAX_LAT):
-                deltaLon = math.asin(math.sin(r) / math.cos(radLat))
-                minLon = radLon - deltaLon
-                if (minLon < MIN_LON):
-                    minLon += 2 * math.pi
-                maxLon = radLon + deltaLon
-                if (maxLon > MAX_LON):
-                    maxLon -= 2 * math.pi
-            else:
-                # Special care for Poles & 180 Meridian:
-                # http://janmatuschek.de/LatitudeLongitudeBoundingCoordinates#PolesAnd180thMeridian
-                minLat = max(minLat, MIN_LAT)
-                maxLat = min(maxLat, MAX_LAT)
-                minLon = MIN_LON
-                maxLon = MAX_LON
-
-            # Convert back to degrees
-            minLat = degrees(minLat)
-            minLon = degrees(minLon)
-            maxLat = degrees(maxLat)
-            maxLon = degrees(maxLon)
-
-            # shortcut
-            locations = db.gis_location
-
-            query = (locations.lat > minLat) & (locations.lat < maxLat) & (locations.lon > minLon) & (locations.lon < maxLon)
-            deleted = (locations.deleted == False)
-            empty = (locations.lat != None) & (locations.lon != None)
-            query = deleted & empty & query
-
-            if tablename:
-                # Lookup the resource
-                table = current.s3db[tablename]
-                query &= (table.location_id == locations.id)
-                records = db(query).select(table.ALL,
-                                           locations.id,
-                                           locations.name,
-                                           locations.level,
-                                           locations.lat,
-                                           locations.lon,
-                                           locations.lat_min,
-                                           locations.lon_min,
-                                           locations.lat_max,
-                                           locations.lon_max)
-            else:
-                # Lookup the raw Locations
-                records = db(query).select(locations.id,
-                                           locations.name,
-                                           locations.level,
-                                           locations.lat,
-                                           locations.lon,
-                                           locations.lat_min,
-                                           locations.lon_min,
-                                           locations.lat_max,
-                                           locations.lon_max)
-            features = Rows()
-            for record in records:
-                # Calculate the Great Circle distance
-                if tablename:
-                    distance = self.greatCircleDistance(lat,
-                                                        lon,
-                                                        record.gis_location.lat,
-                                                        record.gis_location.lon)
-                else:
-                    distance = self.greatCircleDistance(lat,
-                                                        lon,
-                                                        record.lat,
-                                                        record.lon)
-                if distance < radius:
+        greatCircleDistance = self.greatCircleDistance
+        features = Rows()
+        for record in records:
+            location = record.gis_location if tablename else record
+            llat = location.lat
+            llon = location.lon
+            if location.gis_feature_type in (None, 1, "1") or \
+               not location.wkt:
+                # Point: calculate the Great Circle distance
+                if llat is None or llon is None:
+                    continue
+                if greatCircleDistance(lat, lon, llat, llon) < radius:
                     features.records.append(record)
-                else:
-                    # skip
+            elif SHAPELY:
+                # Check whether the geometry intersects the circle
+                if circle is None:
+                    circle = wkt_loads(self.circle_to_wkt(lat, lon, radius))
+                try:
+                    shape = wkt_loads(location.wkt)
+                except:
+                    s3_debug("Error reading wkt of location with id",
+                             value=location.id)
                     continue
+                if shape.intersects(circle):
+                    features.records.append(record)
+            elif location.lat_min is not None:
+                # Use the nearest point of the bounds
+                nlat = min(max(lat, location.lat_min), location.lat_max)
+                nlon = min(max(lon, location.lon_min), location.lon_max)
+                if greatCircleDistance(lat, lon, nlat, nlon) < radius:
+                    features.records.append(record)
 
-            return features
+        return features
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def circle_to_wkt(lat, lon, radius, segments=32):
+        """
+            Get a Polygon approximating a circle on the earth's sphere,
+            e.g. to check geometries against a radius
+
+            @param lat: the latitude of the center
+            @param lon: the longitude of the center
+            @param radius: the radius (in km)
+            @param segments: the number of segments of the Polygon
+
+            @return: WKT string
+        """
+
+        import math
+
+        # shortcuts
+        asin = math.asin
+        atan2 = math.atan2
+        cos = math.cos
+        sin = math.sin
+        degrees = math.degrees
+        radians = math.radians
+
+        d = float(radius) / RADIUS_EARTH
+        lat1 = radians(lat)
+        lon1 = radians(lon)
+
+        # Destination points along the circle
+        # Formulae from: http://www.movable-type.co.uk/scripts/latlong.html
+        points = []
+        for i in xrange(segments):
+            bearing = 2 * math.pi * i / segments
+            lat2 = asin(sin(lat1) * cos(d) + cos(lat1) * sin(d) * cos(bearing))
+            lon2 = lon1 + atan2(sin(bearing) * sin(d) * cos(lat1),
+                                cos(d) - sin(lat1) * sin(lat2))
+            points.append("%s %s" % (degrees(lon2), degrees(lat2)))
+        points.append(points[0])
+
+        return "POLYGON((%s))" % ",".join(points)
 
     # -------------------------------------------------------------------------
     def get_latlon(self, feature_id, filter=False):
@@ -2297,12 +2267,12 @@ class GIS(object):
 
             if polygons:
                 settings = current.deployment_settings
-                tolerance = settings.get_gis_simplify_tolerance()
+                tolerance, decimals = GIS.get_simplify_tolerance()
                 if settings.get_gis_spatialdb():
                     if format == "geojson":
                         # Do the Simplify & GeoJSON direct from the DB
                         rows = db(query).select(table.id,
-                                                gtable.the_geom.st_simplify(tolerance).st_asgeojson(precision=4).with_alias("geojson"))
+                                                gtable.the_geom.st_simplify(tolerance).st_asgeojson(precision=decimals).with_alias("geojson"))
                         for row in rows:
                             geojsons[row[tablename].id] = row.geojson
                     else:
@@ -2313,24 +2283,34 @@ class GIS(object):
                             wkts[row[tablename].id] = row.wkt
                 else:
                     rows = db(query).select(table.id,
-                                            gtable.wkt)
-                    simplify = GIS.simplify
+                                            gtable.id)
+                    locations = {}
+                    for row in rows:
+                        location_id = row["gis_location"].id
+                        if location_id in locations:
+                            locations[location_id].append(row[tablename].id)
+                        else:
+                            locations[location_id] = [row[tablename].id]
                     if format == "geojson":
-                        for row in rows:
-                            # Simplify the polygon to reduce download size
-                            geojson = simplify(row["gis_location"].wkt,
-                                               tolerance=tolerance,
-                                               output="geojson")
-                            if geojson:
-                                geojsons[row[tablename].id] = geojson
+                        # Simplify the polygon to reduce download size
+                        output = "geojson"
+                        items = geojsons
                     else:
-                        for row in rows:
-                            # Simplify the polygon to reduce download size
-                            # & also to work around the recursion limit in libxslt
-                            # http://blog.gmane.org/gmane.comp.python.lxml.devel/day=20120309
-                            wkt = simplify(row["gis_location"].wkt)
-                            if wkt:
-                                wkts[row[tablename].id] = wkt
+                        # Simplify the polygon to reduce download size
+                        # & also to work around the recursion limit in libxslt
+                        # http://blog.gmane.org/gmane.comp.python.lxml.devel/day=20120309
+                        output = "wkt"
+                        items = wkts
+                        tolerance = None
+                        decimals = 4
+                    # Precomputed where possible (see update_simplified)
+                    geometries = GIS.get_simplified(locations.keys(),
+                                                    tolerance=tolerance,
+                                                    decimals=decimals,
+                                                    output=output)
+                    for location_id, geometry in geometries.items():
+                        for record_id in locations[location_id]:
+                            items[record_id] = geometry
 
             else:
                 # Points
@@ -2373,8 +2353,8 @@ class GIS(object):
 
             Called by S3REST: S3Resource.export_tree()
 
-            @ToDo: Vary simplification level & precision by Zoom level
-                   - store this in the style?
+            Simplification level & precision vary by zoom level for
+            map tiles (see S3MapTiles)
         """
 
         db = current.db
@@ -2391,13 +2371,13 @@ class GIS(object):
         attributes = {}
         geojsons = {}
         settings = current.deployment_settings
-        tolerance = settings.get_gis_simplify_tolerance()
+        tolerance, decimals = GIS.get_simplify_tolerance()
         if settings.get_gis_spatialdb():
             # Do the Simplify & GeoJSON direct from the DB
             fields.remove("the_geom")
             fields.remove("wkt")
             _fields = [table[f] for f in fields]
-            rows = db(query).select(table.the_geom.st_simplify(tolerance).st_asgeojson(precision=4).with_alias("geojson"),
+            rows = db(query).select(table.the_geom.st_simplify(tolerance).st_asgeojson(precision=decimals).with_alias("geojson"),
                                     *_fields)
             for row in rows:
                 _row = row[tablename]
@@ -2415,7 +2395,7 @@ class GIS(object):
             for row in rows:
                 # Simplify the polygon to reduce download size
                 geojson = simplify(row.wkt, tolerance=tolerance,
-                                   output="geojson")
+                                   output="geojson", decimals=decimals)
                 id = row.id
                 if geojson:
                     geojsons[id] = geojson
@@ -2464,9 +2444,8 @@ class GIS(object):
         #        geojsons[row["gis_theme_data.id"]] = row.geojson
         #else:
         rows = current.db(query).select(table.id,
-                                        gtable.level,
-                                        gtable.wkt)
-        simplify = GIS.simplify
+                                        gtable.id,
+                                        gtable.level)
         tolerance = {"L0": 0.01,
                      "L1": 0.005,
                      "L2": 0.00125,
@@ -2474,14 +2453,21 @@ class GIS(object):
                      "L4": 0.0003125,
                      "L5": 0.00015625,
                      }
+        levels = {}
         for row in rows:
             grow = row.gis_location
-            # Simplify the polygon to reduce download size
-            geojson = simplify(grow.wkt,
-                               tolerance=tolerance[grow.level],
-                               output="geojson")
-            if geojson:
-                geojsons[row["gis_theme_data.id"]] = geojson
+            locations = levels.setdefault(grow.level, {})
+            locations.setdefault(grow.id, []).append(row["gis_theme_data.id"])
+        get_simplified = GIS.get_simplified
+        for level, locations in levels.items():
+            # Simplify the polygons to reduce download size
+            # (precomputed where possible, see update_simplified)
+            geometries = get_simplified(locations.keys(),
+                                        tolerance=tolerance[level],
+                                        output="geojson")
+            for location_id, geojson in geometries.items():
+                for record_id in locations[location_id]:
+                    geojsons[record_id] = geojson
 
         _geojsons = {}
         _geojsons[tablename] = geojsons
@@ -3107,6 +3093,7 @@ class GIS(object):
 
         codeField = layer["codefield"]
         code2Field = layer["code2field"]
+        polygons = []
         for feat in lyr:
             code = feat.GetField(codeField)
             if not code:
@@ -3145,6 +3132,7 @@ class GIS(object):
                         query = (table.id == id)
                         db(query).update(gis_feature_type=gis_feature_type,
                                          wkt=wkt)
+                        polygons.append(id)
                         ttable.insert(location_id = id,
                                       tag = "ISO3",
                                       value = code2)
@@ -3162,6 +3150,10 @@ class GIS(object):
 
         db.commit()
 
+        s3_debug("Simplifying Polygons...")
+        GIS.update_simplified(polygons)
+        db.commit()
+
         # Revert back to the working directory as before.
         os.chdir(cwd)
 
@@ -3427,6 +3419,7 @@ class GIS(object):
         parentEdenCodeField = layer["parentEdenCodeField"]
         parentCodeQuery = (ttable.tag == parentEdenCodeField)
         count = 0
+        polygons = []
         for row in rows:
             # Read Attributes
             feat = lyr[count]
@@ -3504,6 +3497,7 @@ class GIS(object):
                                       gis_feature_type=gis_feature_type,
                                       wkt=wkt,
                                       parent=parent.id)
+                    polygons.append(id)
                     ttable.insert(location_id = id,
                                   tag = edenCodeField,
                                   value = code)
@@ -3530,6 +3524,10 @@ class GIS(object):
 
         db.commit()
 
+        s3_debug("Simplifying Polygons...")
+        self.update_simplified(polygons)
+        db.commit()
+
         # Revert back to the working directory as before.
         os.chdir(cwd)
 
@@ -3966,11 +3964,15 @@ class GIS(object):
             Update GIS Locations' Materialized path, Lx locations, Lat/Lon & the_geom
 
             @param feature: a feature dict to update the tree for
-            - if not provided then update the whole tree
+            - if not provided then update the whole tree (set-based,
+              level by level)
 
-            returns the path of the feature
+            returns the path of the feature, or the number of locations
+            if updating the whole tree
 
             Called onaccept for locations (async, where-possible)
+            - the locations below the feature get updated set-based,
+              see update_location_descendants
         """
 
         db = current.db
@@ -4006,27 +4008,41 @@ class GIS(object):
                 db(table.id == feature.id).update(**_vars)
 
         if not feature:
-            # Do the whole database
-            # Do in chunks to save memory and also do in correct order
-            fields = [table.id, table.name, table.gis_feature_type,
-                      table.L0, table.L1, table.L2, table.L3, table.L4,
-                      table.lat, table.lon, table.wkt, table.inherited,
-                      # Handle Countries which start with Bounds set, yet are Points
-                      table.lat_min, table.lon_min, table.lat_max, table.lon_max,
-                      table.path, table.parent]
-            update_location_tree = GIS.update_location_tree
-            for level in ["L0", "L1", "L2", "L3", "L4", "L5", None]:
-                features = db(table.level == level).select(*fields)
-                for feature in features:
-                    feature["level"] = level
-                    wkt = feature["wkt"]
-                    if wkt and not wkt.startswith("POI"):
-                        # Polygons aren't inherited
-                        feature["inherited"] = False
-                    update_location_tree(feature)
-                    # Also do the Bounds/Centroid/WKT
-                    bounds_centroid_wkt(feature)
-            return
+            # Do the whole database, set-based & level by level
+            # (so that the parents are always up-to-date)
+            import time
+            start = time.time()
+
+            # Bounds & Centroids of imported Polygons (e.g. GADM)
+            polygon = (table.wkt != None) & (~table.wkt.startswith("POI"))
+            query = polygon & \
+                    ((table.lat == None) | (table.lon == None) | \
+                     (table.lat_min == None))
+            fields = [table.id, table.gis_feature_type, table.wkt,
+                      table.lat, table.lon,
+                      table.lat_min, table.lon_min, table.lat_max, table.lon_max]
+            for feature in db(query).select(*fields):
+                bounds_centroid_wkt(feature)
+
+            # Polygons aren't inherited
+            db(polygon & (table.inherited == True)).update(inherited=False)
+
+            # Top-level Locations
+            query = (table.parent == None) | (table.level == "L0")
+            GIS.update_location_roots(query)
+
+            # Lower levels from their parents
+            update_location_children = GIS.update_location_children
+            for level in ["L1", "L2", "L3", "L4", "L5", None]:
+                query = (table.level == level) & \
+                        (table.parent != None)
+                update_location_children(query)
+
+            count = db(table.id > 0).count()
+            duration = time.time() - start
+            s3_debug("Location Tree: %s locations updated in %.1fs (%.0f/s)" % \
+                     (count, duration, count / duration if duration else count))
+            return count
 
         # Single Feature
         id = str(feature["id"]) if "id" in feature else None
@@ -4063,6 +4079,8 @@ class GIS(object):
                     else:
                         db(table.id == id).update(L0=name,
                                                   path=id)
+            # Update the locations below this one
+            GIS.update_location_descendants(id)
             return id
 
         # L1
@@ -4128,7 +4146,6 @@ class GIS(object):
                 db(table.id == id).update(path=_path,
                                           L0=L0_name,
                                           L1=name)
-                return _path
             elif inherited or lat is None or lon is None:
                 vars = dict(path=_path,
                             L0=L0_name,
@@ -4148,16 +4165,8 @@ class GIS(object):
                                           inherited=False,
                                           L0=L0_name,
                                           L1=name)
-            # Ensure that any locations which inherit their latlon from this one get updated
-            query = (table.parent == id) & \
-                    (table.inherited == True)
-            fields = [table.id, table.name, table.level, table.path, table.parent,
-                      table.L0, table.L1, table.L2, table.L3, table.L4,
-                      table.lat, table.lon, table.inherited]
-            rows = db(query).select(*fields)
-            update_location_tree = GIS.update_location_tree
-            for row in rows:
-                update_location_tree(row)
+            # Update the locations below this one
+            GIS.update_location_descendants(id)
             return _path
 
         # L2
@@ -4246,7 +4255,6 @@ class GIS(object):
                                           L1=L1_name,
                                           L2=name,
                                           )
-                return _path
             elif inherited or lat is None or lon is None:
                 vars = dict(path=_path,
                             L0=L0_name,
@@ -4268,16 +4276,8 @@ class GIS(object):
                                           L0=L0_name,
                                           L1=L1_name,
                                           L2=name)
-            # Ensure that any locations which inherit their latlon from this one get updated
-            query = (table.parent == id) & \
-                    (table.inherited == True)
-            fields = [table.id, table.name, table.level, table.path, table.parent,
-                      table.L0, table.L1, table.L2, table.L3, table.L4,
-                      table.lat, table.lon, table.inherited]
-            rows = db(query).select(*fields)
-            update_location_tree = GIS.update_location_tree
-            for row in rows:
-                update_location_tree(row)
+            # Update the locations below this one
+            GIS.update_location_descendants(id)
             return _path
 
         # L3
@@ -4400,7 +4400,6 @@ class GIS(object):
                                           L2=L2_name,
                                           L3=name,
                                           )
-                return _path
             elif inherited or lat is None or lon is None:
                 vars = dict(path=_path,
                             L0=L0_name,
@@ -4424,16 +4423,8 @@ class GIS(object):
                                           L1=L1_name,
                                           L2=L2_name,
                                           L3=name)
-            # Ensure that any locations which inherit their latlon from this one get updated
-            query = (table.parent == id) & \
-                    (table.inherited == True)
-            fields = [table.id, table.name, table.level, table.path, table.parent,
-                      table.L0, table.L1, table.L2, table.L3, table.L4,
-                      table.lat, table.lon, table.inherited]
-            rows = db(query).select(*fields)
-            update_location_tree = GIS.update_location_tree
-            for row in rows:
-                update_location_tree(row)
+            # Update the locations below this one
+            GIS.update_location_descendants(id)
             return _path
 
         # L4
@@ -4590,7 +4581,6 @@ class GIS(object):
                                           L3=L3_name,
                                           L4=name,
                                           )
-                return _path
             elif inherited or lat is None or lon is None:
                 vars = dict(path=_path,
                             L0=L0_name,
@@ -4616,16 +4606,8 @@ class GIS(object):
                                           L2=L2_name,
                                           L3=L3_name,
                                           L4=name)
-            # Ensure that any locations which inherit their latlon from this one get updated
-            query = (table.parent == id) & \
-                    (table.inherited == True)
-            fields = [table.id, table.name, table.level, table.path, table.parent,
-                      table.L0, table.L1, table.L2, table.L3, table.L4,
-                      table.lat, table.lon, table.inherited]
-            rows = db(query).select(*fields)
-            update_location_tree = GIS.update_location_tree
-            for row in rows:
-                update_location_tree(row)
+            # Update the locations below this one
+            GIS.update_location_descendants(id)
             return _path
 
         # L5
@@ -4817,7 +4799,6 @@ class GIS(object):
                                           L4=L4_name,
                                           L5=name,
                                           )
-                return _path
             elif inherited or lat is None or lon is None:
                 vars = dict(path=_path,
                             L0=L0_name,
@@ -4845,16 +4826,8 @@ class GIS(object):
                                           L3=L3_name,
                                           L4=L4_name,
                                           L5=name)
-            # Ensure that any locations which inherit their latlon from this one get updated
-            query = (table.parent == id) & \
-                    (table.inherited == True)
-            fields = [table.id, table.name, table.level, table.path, table.parent,
-                      table.L0, table.L1, table.L2, table.L3, table.L4, table.L5,
-                      table.lat, table.lon, table.inherited]
-            rows = db(query).select(*fields)
-            update_location_tree = GIS.update_location_tree
-            for row in rows:
-                update_location_tree(row)
+            # Update the locations below this one
+            GIS.update_location_descendants(id)
             return _path
 
         # Specific Location
@@ -5110,6 +5083,182 @@ class GIS(object):
                                       L5=L5_name)
         return _path
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def update_location_roots(query):
+        """
+            Update the Materialized path & Lx of top-level Locations
+            (those without parent, and L0s), set-based
+
+            @param query: the query for the Locations to update
+        """
+
+        db = current.db
+        table = current.s3db.gis_location
+
+        if db._dbname == "mysql":
+            cast = "CHAR"
+        elif db._dbname == "sqlite":
+            cast = "TEXT"
+        else:
+            cast = "VARCHAR"
+        Lx = ",".join(["%s=CASE WHEN level='%s' THEN name ELSE NULL END" % \
+                       (L, L) for L in LOCATION_LEVELS])
+        sql = "UPDATE gis_location SET path=CAST(id AS %s),%s WHERE %s;" % \
+              (cast, Lx, query)
+        db.executesql(sql)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def update_location_children(query):
+        """
+            Update the Materialized path, Lx & inherited Lat/Lon of
+            Locations from their parents, set-based
+            - UPDATE...FROM/JOIN the parents on PostgreSQL and MySQL,
+              else batched updates per parent (in chunks of record IDs)
+            - the parents must be up-to-date
+            - Locations with a parent which isn't part of the hierarchy
+              (no level) are skipped
+
+            @param query: the query for the Locations to update
+        """
+
+        db = current.db
+        table = current.s3db.gis_location
+        dbname = db._dbname
+        represent = db._adapter.represent
+        LEVELS = LOCATION_LEVELS
+
+        # Locations which inherit the Lat/Lon of their parent
+        # - Polygons aren't inherited
+        inherit = ((table.inherited == True) | \
+                   (table.lat == None) | \
+                   (table.lon == None)) & \
+                  ((table.wkt == None) | (table.wkt.startswith("POI")))
+
+        if dbname in ("postgres", "mysql"):
+            TRUE = represent(True, "boolean")
+            if dbname == "postgres":
+                Lx = ",".join(["%s=CASE WHEN gis_location.level='%s' THEN gis_location.name ELSE p.%s END" % \
+                               (L, L, L) for L in LEVELS])
+                sql = "UPDATE gis_location SET path=p.path||'/'||CAST(gis_location.id AS VARCHAR),%s " \
+                      "FROM gis_location AS p " \
+                      "WHERE gis_location.parent=p.id AND p.level IS NOT NULL AND %s;" % \
+                      (Lx, query)
+                db.executesql(sql)
+                if current.deployment_settings.get_gis_spatialdb():
+                    the_geom = ",the_geom=ST_SetSRID(ST_MakePoint(p.lon,p.lat),4326)"
+                else:
+                    the_geom = ""
+                sql = "UPDATE gis_location SET lat=p.lat,lon=p.lon,inherited=%s,gis_feature_type=1," \
+                      "wkt='POINT('||p.lon||' '||p.lat||')'," \
+                      "lat_min=p.lat,lat_max=p.lat,lon_min=p.lon,lon_max=p.lon%s " \
+                      "FROM gis_location AS p " \
+                      "WHERE gis_location.parent=p.id AND p.level IS NOT NULL AND %s AND %s;" % \
+                      (TRUE, the_geom, query, inherit)
+                db.executesql(sql)
+            else:
+                Lx = ",".join(["gis_location.%s=CASE WHEN gis_location.level='%s' THEN gis_location.name ELSE p.%s END" % \
+                               (L, L, L) for L in LEVELS])
+                sql = "UPDATE gis_location JOIN gis_location AS p ON gis_location.parent=p.id " \
+                      "SET gis_location.path=CONCAT(p.path,'/',gis_location.id),%s " \
+                      "WHERE p.level IS NOT NULL AND %s;" % (Lx, query)
+                db.executesql(sql)
+                sql = "UPDATE gis_location JOIN gis_location AS p ON gis_location.parent=p.id " \
+                      "SET gis_location.lat=p.lat,gis_location.lon=p.lon," \
+                      "gis_location.inherited=%s,gis_location.gis_feature_type=1," \
+                      "gis_location.wkt=CONCAT('POINT(',p.lon,' ',p.lat,')')," \
+                      "gis_location.lat_min=p.lat,gis_location.lat_max=p.lat," \
+                      "gis_location.lon_min=p.lon,gis_location.lon_max=p.lon " \
+                      "WHERE p.level IS NOT NULL AND %s AND %s;" % \
+                      (TRUE, query, inherit)
+                db.executesql(sql)
+        else:
+            # Batched by parent
+            ptable = table.with_alias("gis_location_parent")
+            join = (table.parent == ptable.id) & (ptable.level != None)
+
+            # Group the Locations by parent, so that the UPDATEs need not
+            # repeat the query (e.g. all parents of the generation)
+            children = {}
+            rows = db(query & join).select(table.id, table.parent)
+            for row in rows:
+                parent_id = row.parent
+                if parent_id in children:
+                    children[parent_id].append(row.id)
+                else:
+                    children[parent_id] = [row.id]
+            if not children:
+                return
+
+            fields = [ptable.id, ptable.path, ptable.lat, ptable.lon] + \
+                     [ptable[L] for L in LEVELS]
+            parents = db(query & join).select(distinct=True, *fields)
+            chunk_size = 500
+            for parent in parents:
+                Lx = ",".join(["%s=CASE WHEN level='%s' THEN name ELSE %s END" % \
+                               (L, L, represent(parent[L], "string"))
+                               for L in LEVELS])
+                path = represent("%s/" % (parent.path or parent.id), "string")
+                lat = parent.lat
+                lon = parent.lon
+                if lat is None or lon is None:
+                    wkt = None
+                else:
+                    wkt = "POINT(%s %s)" % (lon, lat)
+                ids = children.get(parent.id, [])
+                for i in xrange(0, len(ids), chunk_size):
+                    pquery = table.id.belongs(ids[i:i + chunk_size])
+                    sql = "UPDATE gis_location SET path=%s||id,%s WHERE %s;" % \
+                          (path, Lx, pquery)
+                    db.executesql(sql)
+                    db(pquery & inherit).update(lat=lat,
+                                                lon=lon,
+                                                inherited=True,
+                                                gis_feature_type=1,
+                                                wkt=wkt,
+                                                lat_min=lat,
+                                                lat_max=lat,
+                                                lon_min=lon,
+                                                lon_max=lon,
+                                                )
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def update_location_descendants(location_id):
+        """
+            Update the Materialized path, Lx & inherited Lat/Lon of all
+            Locations below a Location, generation by generation
+            - called when a Location has changed
+
+            @param location_id: the gis_location record ID
+
+            @return: the number of Locations updated
+        """
+
+        db = current.db
+        table = current.s3db.gis_location
+        update_location_children = GIS.update_location_children
+
+        count = 0
+        seen = set([int(location_id)])
+        ids = [int(location_id)]
+        chunk_size = 500
+        while ids:
+            # Process the generation in chunks
+            children = []
+            for i in xrange(0, len(ids), chunk_size):
+                query = (table.parent.belongs(ids[i:i + chunk_size])) & \
+                        ((table.level == None) | (table.level != "L0"))
+                update_location_children(query)
+                rows = db(query).select(table.id)
+                children.extend([row.id for row in rows
+                                 if row.id not in seen])
+            ids = children
+            seen.update(ids)
+            count += len(ids)
+        return count
+
     # -------------------------------------------------------------------------
     @staticmethod
     def wkt_centroid(form):
@@ -5229,9 +5378,21 @@ class GIS(object):
 
     # -------------------------------------------------------------------------
     @staticmethod
-    def query_features_by_bbox(lon_min, lat_min, lon_max, lat_max):
+    def query_features_by_bbox(lon_min, lat_min, lon_max, lat_max,
+                               centroids=False):
         """
-            Returns a query of all Locations inside the given bounding box
+            Returns a query of all Locations whose bounds intersect the
+            given bounding box (uses the indexes on the bounds fields,
+            i.e. works as spatial pre-filter on all database backends)
+
+            @param lon_min: the western boundary of the bbox
+            @param lat_min: the southern boundary of the bbox
+            @param lon_max: the eastern boundary of the bbox
+            @param lat_max: the northern boundary of the bbox
+            @param centroids: also include Locations without bounds
+                              whose Lat/Lon is inside the bbox (e.g.
+                              imported without onvalidation, see
+                              set_all_bounds)
         """
 
         table = current.s3db.gis_location
@@ -5239,6 +5400,12 @@ class GIS(object):
                 (table.lat_max >= lat_min) & \
                 (table.lon_min <= lon_max) & \
                 (table.lon_max >= lon_min)
+        if centroids:
+            query |= (table.lat_min == None) & \
+                     (table.lat >= lat_min) & \
+                     (table.lat <= lat_max) & \
+                     (table.lon >= lon_min) & \
+                     (table.lon <= lon_max)
         return query
 
     # -------------------------------------------------------------------------
@@ -5458,6 +5625,195 @@ class GIS(object):
 
         return output
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def get_simplified(location_ids,
+                       tolerance=None,
+                       decimals=4,
+                       output="wkt"):
+        """
+            Get the simplified geometries of Locations, using the
+            precomputed simplifications (see update_simplified) where
+            available, and simplifying at runtime otherwise
+
+            - precomputed geometries are used at the coarsest stored
+              tolerance which does not exceed the requested tolerance,
+              and only if they have enough decimal places
+
+            @param location_ids: list of gis_location IDs
+            @param tolerance: how aggressive a simplification to perform
+                              (defaults to the simplify_tolerance setting)
+            @param decimals: the number of decimal places to include
+            @param output: whether to output as WKT or GeoJSON format
+
+            @return: dict {location_id: geometry}
+        """
+
+        geometries = {}
+        if not location_ids:
+            return geometries
+
+        if not tolerance:
+            tolerance = current.deployment_settings.get_gis_simplify_tolerance()
+
+        db = current.db
+        s3db = current.s3db
+        missing = set(location_ids)
+
+        if tolerance and decimals <= SIMPLIFY_DECIMALS:
+            tolerances = [t for t in SIMPLIFY_TOLERANCES if t <= tolerance]
+            if tolerances:
+                # Precomputed
+                stable = s3db.gis_location_simplified
+                query = (stable.location_id.belongs(missing)) & \
+                        (stable.tolerance == max(tolerances))
+                rows = db(query).select(stable.location_id,
+                                        stable[output])
+                for row in rows:
+                    geometries[row.location_id] = row[output]
+                missing -= set(geometries)
+
+        if missing:
+            # Simplify at runtime
+            table = s3db.gis_location
+            rows = db(table.id.belongs(missing)).select(table.id,
+                                                        table.wkt)
+            simplify = GIS.simplify
+            for row in rows:
+                if not row.wkt:
+                    continue
+                geometry = simplify(row.wkt,
+                                    tolerance=tolerance,
+                                    output=output,
+                                    decimals=decimals)
+                if geometry:
+                    geometries[row.id] = geometry
+
+        return geometries
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def update_simplified(location_ids=None):
+        """
+            Precompute the simplified geometries of LineString & Polygon
+            Locations at all SIMPLIFY_TOLERANCES (gis_location_simplified)
+            - called onaccept of gis_location, from the Admin Boundary
+              importers and from the gis_update_simplified task
+
+            @param location_ids: list of gis_location IDs, None to rebuild
+                                 the simplified geometries of all Locations
+
+            @return: the number of Locations with simplified geometries
+        """
+
+        from shapely.wkt import loads as wkt_loads
+        from ..geojson import dumps
+
+        db = current.db
+        s3db = current.s3db
+        table = s3db.gis_location
+        stable = s3db.gis_location_simplified
+
+        # Remove the outdated simplifications
+        if location_ids is None:
+            db(stable.id > 0).delete()
+        else:
+            if not location_ids:
+                return 0
+            db(stable.location_id.belongs(location_ids)).delete()
+
+        query = (table.deleted != True) & \
+                (table.gis_feature_type.belongs((2, 3, 5, 6, 7)))
+        if location_ids is not None:
+            query &= (table.id.belongs(location_ids))
+
+        simplify = GIS.simplify
+        count = 0
+        last_id = 0
+        # Polygons can be large, so process in chunks
+        chunk_size = 100
+        while True:
+            rows = db(query & (table.id > last_id)).select(table.id,
+                                                           table.wkt,
+                                                           orderby=table.id,
+                                                           limitby=(0, chunk_size))
+            if not rows:
+                break
+            items = []
+            for row in rows:
+                location_id = last_id = row.id
+                if not row.wkt:
+                    continue
+                for tolerance in SIMPLIFY_TOLERANCES:
+                    wkt = simplify(row.wkt,
+                                   tolerance=tolerance,
+                                   decimals=SIMPLIFY_DECIMALS)
+                    if not wkt:
+                        # Invalid Shape
+                        break
+                    geojson = dumps(wkt_loads(wkt), separators=SEPARATORS)
+                    items.append({"location_id": location_id,
+                                  "tolerance": tolerance,
+                                  "wkt": wkt,
+                                  "geojson": geojson,
+                                  })
+                else:
+                    count += 1
+            if items:
+                stable.bulk_insert(items)
+
+        return count
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def get_simplify_tolerance():
+        """
+            Get the tolerance and precision for the simplification of
+            polygons in the current request: for map tiles, the size of
+            a pixel at the zoom level of the tile (see S3MapTiles), else
+            the simplify_tolerance deployment setting
+
+            @return: tuple (tolerance, decimals)
+        """
+
+        zoom = current.response.s3.gis.tile_zoom
+        if zoom is None:
+            tolerance = current.deployment_settings.get_gis_simplify_tolerance()
+            return tolerance, 4
+
+        import math
+
+        # Degrees per pixel of a 256px tile at the Equator
+        tolerance = 360.0 / (256 << zoom)
+        decimals = max(1, int(math.ceil(-math.log10(tolerance))))
+        return tolerance, decimals
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def get_tile_bounds(z, x, y):
+        """
+            Get the bounds of a map tile in the z/x/y scheme of XYZ
+            (e.g. OpenStreetMap) tiles
+
+            @param z: the zoom level
+            @param x: the column of the tile (from the West)
+            @param y: the row of the tile (from the North)
+
+            @return: tuple (lon_min, lat_min, lon_max, lat_max)
+        """
+
+        import math
+
+        n = float(1 << z)
+        def lat(row):
+            return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / n))))
+
+        return (x / n * 360.0 - 180.0,
+                lat(y + 1),
+                (x + 1) / n * 360.0 - 180.0,
+                lat(y),
+                )
+
     # -------------------------------------------------------------------------
     def show_map(self,
                  id = "default_map",
@@ -7096,12 +7452,12 @@ class LayerFeature(Layer):
             else:
                 maxdepth = 0
                 show_ids = ""
-            url = "%s.geojson?layer=%i&components=None&maxdepth=%s%s" % \
-                (URL(self.controller, self.function), self.id, maxdepth, show_ids)
+            vars = "layer=%i&components=None&maxdepth=%s%s" % \
+                (self.id, maxdepth, show_ids)
             if self.filter:
-                url = "%s&%s" % (url, self.filter)
+                vars = "%s&%s" % (vars, self.filter)
             if self.trackable:
-                url = "%s&track=1" % url
+                vars = "%s&track=1" % vars
             style = self.style
             if style:
                 try:
@@ -7109,8 +7465,10 @@ class LayerFeature(Layer):
                     style = json.loads(style)
                 except:
                     # Fieldname to pass to URL for server-side lookup
-                    url = "%s&style=%s" % (url, style)
+                    vars = "%s&style=%s" % (vars, style)
                     style = None
+            path = URL(self.controller, self.function)
+            url = "%s.geojson?%s" % (path, vars)
 
             # Mandatory attributes
             output = {"id": self.layer_id,
@@ -7123,6 +7481,14 @@ class LayerFeature(Layer):
             # Attributes which are defaulted client-side if not set
             self.setup_folder_visibility_and_opacity(output)
             self.setup_clustering(output)
+            if self.polygons and \
+               current.deployment_settings.get_gis_feature_tiles():
+                # Load as tiles (client appends z/x/y, see S3MapTiles)
+                output["tiles"] = "%s/tiles.geojson?%s" % (path, vars)
+            elif not self.polygons and not self.trackable and \
+                 current.deployment_settings.get_gis_cluster_limit() is not None:
+                # Cluster on the server (client appends zoom, see S3MapClusters)
+                output["clusters"] = "%s/clusters.geojson?%s" % (path, vars)
             style = self.style
             if style:
                 style = json.loads(style)
@@ -8018,6 +8384,417 @@ class S3Map(S3Method):
                            )
         return map
 
+# =============================================================================
+class S3MapTiles(S3Method):
+    """
+        Tiled GeoJSON export of map layers, in the z/x/y scheme of XYZ
+        (e.g. OpenStreetMap) tiles:
+
+        /controller/function/tiles.geojson?layer=ID&z=Z&x=X&y=Y
+
+        Each tile contains the features whose bounds intersect the tile,
+        (filtered with S3ResourceFilter.parse_bbox_query), with polygons
+        simplified for the zoom level (see GIS.get_simplify_tolerance).
+        Features spanning multiple tiles are contained in each of them,
+        the client adds them only once.
+
+        Tiles are cached on disk (in cache/tiles), keyed by the table
+        version (latest modification & number of records of the table,
+        of gis_location and of the layer configuration, styles and
+        markers) and the request (URL vars, user, realms, ACLs, language),
+        outdated versions are removed when a new version is cached.
+    """
+
+    # Maximum zoom level
+    MAX_ZOOM = 22
+
+    # URL vars which are not part of the tile key
+    SKIP = ("x", "y", "z", "_")
+
+    # -------------------------------------------------------------------------
+    def apply_method(self, r, **attr):
+        """
+            Entry point to apply tiles method to S3Requests
+
+            @param r: the S3Request instance
+            @param attr: controller attributes for the request
+
+            @return: the GeoJSON of the tile
+        """
+
+        if r.http != "GET":
+            r.error(405, current.manager.ERROR.BAD_METHOD)
+        if r.representation != "geojson":
+            r.error(501, r.ERROR.BAD_FORMAT)
+
+        get_vars = r.get_vars
+        try:
+            z = int(get_vars["z"])
+            x = int(get_vars["x"])
+            y = int(get_vars["y"])
+        except (KeyError, TypeError, ValueError):
+            r.error(400, "Invalid tile")
+        if not 0 <= z <= self.MAX_ZOOM or \
+           not 0 <= x < (1 << z) or \
+           not 0 <= y < (1 << z):
+            r.error(400, "Invalid tile")
+
+        resource = r.resource
+        path = self.tile_path(r, z, x, y)
+        if os.path.exists(path):
+            # Cached tile
+            current.response.headers["Content-Type"] = "application/json"
+            f = open(path, "rb")
+            output = f.read()
+            f.close()
+            return output
+
+        # Filter by the bounds of the tile
+        from s3resource import S3ResourceFilter
+        bbox = ",".join(str(v) for v in GIS.get_tile_bounds(z, x, y))
+        query = S3ResourceFilter.parse_bbox_query(resource,
+                                                  {"bbox": bbox},
+                                                  intersects=True)
+        if query is not None:
+            resource.add_filter(query)
+
+        # Simplify polygons for the zoom level
+        current.response.s3.gis.tile_zoom = z
+
+        output = r.get_tree(r, **attr)
+        if output:
+            self.store(path, output)
+        return output
+
+    # -------------------------------------------------------------------------
+    def tile_path(self, r, z, x, y):
+        """
+            Get the path of the cache file for a tile
+
+            @param r: the S3Request
+            @param z: the zoom level
+            @param x: the column of the tile
+            @param y: the row of the tile
+
+            @return: the path
+        """
+
+        resource = r.resource
+
+        # Permissions: the tile contains only accessible records
+        auth = current.auth
+        permission = auth.permission
+        s3 = current.response.s3
+        if s3.acl_stamp is None:
+            # Determine the ACL stamp of this request
+            permission.acl_index()
+        user = auth.user
+        if user:
+            realms = permission.realm_fingerprint(user.realms,
+                                                  user.delegations)
+        else:
+            realms = permission.realm_fingerprint(None, None)
+
+        # Request key
+        skip = self.SKIP
+        get_vars = sorted((k, str(v)) for k, v in r.get_vars.items()
+                          if k not in skip)
+        key = (get_vars,
+               user.id if user else None,
+               realms,
+               s3.acl_stamp,
+               current.T.accepted_language,
+               )
+        key = hashlib.md5(repr(key)).hexdigest()
+
+        return os.path.join(current.request.folder, "cache", "tiles",
+                            resource.tablename,
+                            self.version(resource),
+                            key,
+                            str(z),
+                            str(x),
+                            "%s.geojson" % y)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def version(resource):
+        """
+            Get the current version of the table of a resource, of
+            gis_location and of the layer configuration (layer settings
+            incl. popups, styles and markers), i.e. a hash of their latest
+            modification and number of records (cached for a few seconds,
+            as a map view requests many tiles at once)
+
+            @param resource: the S3Resource
+
+            @return: the version hash
+        """
+
+        tablename = resource.tablename
+
+        def version():
+            db = current.db
+            s3db = current.s3db
+            tables = [resource.table]
+            for tn in ("gis_location",
+                       "gis_layer_feature",
+                       "gis_layer_config",
+                       "gis_layer_symbology",
+                       "gis_marker",
+                       ):
+                table = s3db.table(tn)
+                if table is not None:
+                    tables.append(table)
+            versions = []
+            for table in tables:
+                if "modified_on" not in table.fields:
+                    continue
+                latest = table.modified_on.max()
+                count = table._id.count()
+                row = db(table._id > 0).select(latest, count).first()
+                versions.append((str(row[latest]), row[count]))
+            return hashlib.md5(repr(versions)).hexdigest()[:16]
+
+        return current.cache.ram("gis_tiles_version_%s" % tablename,
+                                 version,
+                                 time_expire=5)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def store(path, output):
+        """
+            Store a tile in the cache, remove outdated versions
+
+            @param path: the path of the cache file (from tile_path)
+            @param output: the GeoJSON of the tile
+        """
+
+        import shutil
+
+        folder = os.path.dirname(path)
+        try:
+            if not os.path.exists(folder):
+                # Remove outdated versions of the table
+                dirname = os.path.dirname
+                table_folder, version = os.path.split(dirname(dirname(dirname(folder))))
+                if os.path.exists(table_folder):
+                    for name in os.listdir(table_folder):
+                        if name != version:
+                            shutil.rmtree(os.path.join(table_folder, name),
+                                          ignore_errors=True)
+                os.makedirs(folder)
+            # Write to a temporary file first, so that concurrent
+            # requests never read incomplete tiles
+            tmp = "%s.%s" % (path, os.getpid())
+            f = open(tmp, "wb")
+            f.write(output)
+            f.close()
+            os.rename(tmp, path)
+        except (IOError, OSError):
+            # Not cacheable (e.g. folder not writable) => never mind
+            s3_debug("S3MapTiles", "Could not cache tile %s" % path)
+        return
+
+# =============================================================================
+class S3MapClusters(S3Method):
+    """
+        GeoJSON export of point layers with server-side clustering:
+
+        /controller/function/clusters.geojson?layer=ID&zoom=Z&bbox=...
+
+        If the number of features (in the bbox) exceeds the cluster_limit
+        deployment setting, the points get grouped in a grid with cells
+        of DISTANCE pixels at the zoom level (SQL GROUP BY on the rounded
+        coordinates where possible), and each cell with more than one
+        point is exported as a single Point at the centroid of the cell,
+        with the number of points in the property "count". Cells with
+        only one point, and layers below the limit, are exported as
+        individual features.
+    """
+
+    # Size of the grid cells (pixels)
+    DISTANCE = 40
+
+    # Database engines which support the SQL for the clustering
+    ENGINES = ("postgres", "sqlite", "mysql")
+
+    # -------------------------------------------------------------------------
+    def apply_method(self, r, **attr):
+        """
+            Entry point to apply clusters method to S3Requests
+
+            @param r: the S3Request instance
+            @param attr: controller attributes for the request
+
+            @return: the GeoJSON
+        """
+
+        if r.http != "GET":
+            r.error(405, current.manager.ERROR.BAD_METHOD)
+        if r.representation != "geojson":
+            r.error(501, r.ERROR.BAD_FORMAT)
+
+        try:
+            zoom = int(r.get_vars["zoom"])
+        except (KeyError, TypeError, ValueError):
+            r.error(400, "Invalid zoom level")
+        zoom = max(0, min(zoom, S3MapTiles.MAX_ZOOM))
+
+        resource = r.resource
+        limit = current.deployment_settings.get_gis_cluster_limit()
+        if limit is None or self.trackable(r) or resource.count() <= limit:
+            # Individual features
+            return r.get_tree(r, **attr)
+
+        clusters = self.clusters(resource, zoom)
+        if clusters is None:
+            # Not clusterable (e.g. no location or virtual filter)
+            return r.get_tree(r, **attr)
+
+        # Individual features for cells with only one point
+        features = []
+        ids = [c[3] for c in clusters if c[0] == 1]
+        if ids:
+            table = resource.table
+            resource.add_filter(table._id.belongs(ids))
+            output = r.get_tree(r, **attr)
+            data = json.loads(output) if output else {}
+            if data.get("type") == "Feature":
+                features.append(data)
+            else:
+                items = data.get("features", [])
+                if isinstance(items, dict):
+                    items = [items]
+                features.extend(items)
+
+        # Cluster features
+        for count, lat, lon, record_id in clusters:
+            if count > 1:
+                features.append({"type": "Feature",
+                                 "geometry": {"type": "Point",
+                                              "coordinates": [lon, lat],
+                                              },
+                                 "properties": {"count": count},
+                                 })
+
+        current.response.headers["Content-Type"] = "application/json"
+        return json.dumps({"type": "FeatureCollection",
+                           "features": features,
+                           }, separators=SEPARATORS)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def trackable(r):
+        """
+            Check whether the layer is trackable (the location of the
+            features comes from S3Trackable, so can't be clustered)
+
+            @param r: the S3Request
+
+            @return: True|False
+        """
+
+        layer_id = r.get_vars.get("layer")
+        if not layer_id:
+            return False
+        table = current.s3db.gis_layer_feature
+        try:
+            query = (table.id == int(layer_id))
+        except ValueError:
+            return False
+        layer = current.db(query).select(table.trackable,
+                                         limitby=(0, 1)).first()
+        return bool(layer and layer.trackable)
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def clusters(cls, resource, zoom):
+        """
+            Group the points of a resource in grid cells
+
+            @param resource: the S3Resource (filtered by bbox)
+            @param zoom: the zoom level
+
+            @return: list of tuples (count, lat, lon, record_id) per
+                     grid cell, where lat/lon is the centroid of the
+                     points in the cell and record_id the ID of a record
+                     in the cell; or None if the resource can not be
+                     clustered
+        """
+
+        rfilter = resource.rfilter
+        if rfilter is None:
+            resource.build_query()
+            rfilter = resource.rfilter
+        if rfilter.get_filter() is not None:
+            # Virtual filter
+            return None
+
+        db = current.db
+        s3db = current.s3db
+        table = resource.table
+        tablename = resource.tablename
+        gtable = s3db.gis_location
+
+        query = rfilter.get_query()
+        if tablename == "gis_location":
+            pass
+        elif "location_id" in table.fields:
+            query &= (table.location_id == gtable.id)
+        elif "site_id" in table.fields:
+            stable = s3db.org_site
+            query &= (table.site_id == stable.site_id) & \
+                     (stable.location_id == gtable.id)
+        else:
+            return None
+        query &= (gtable.lat != None) & (gtable.lon != None)
+
+        from s3resource import S3LeftJoins
+        left_joins = S3LeftJoins(tablename)
+        left_joins.add(rfilter.get_left_joins())
+        left = left_joins.as_list()
+        # Left joins can duplicate records
+        distinct = bool(left)
+
+        # Cell size in degrees
+        size = cls.DISTANCE * 360.0 / (256 << zoom)
+
+        fields = [table._id, gtable.lat, gtable.lon]
+        if db._dbname in cls.ENGINES:
+            # Group in the database
+            sql = db(query)._select(distinct=distinct,
+                                    left=left,
+                                    *fields)
+            cell = "%.12f" % size
+            sql = "SELECT COUNT(*), AVG(lat), AVG(lon), MIN(id) " \
+                  "FROM (%s) points " \
+                  "GROUP BY ROUND(lat/%s), ROUND(lon/%s);" % \
+                  (sql.rstrip().rstrip(";"), cell, cell)
+            clusters = [(int(row[0]), float(row[1]), float(row[2]), row[3])
+                        for row in db.executesql(sql)]
+        else:
+            # Group in Python
+            rows = db(query).select(distinct=distinct,
+                                    left=left,
+                                    *fields)
+            cells = {}
+            for row in rows:
+                record_id = row[table._id]
+                lat = row[gtable.lat]
+                lon = row[gtable.lon]
+                key = (round(lat / size), round(lon / size))
+                if key in cells:
+                    count, lat_sum, lon_sum, record_id = cells[key]
+                    cells[key] = (count + 1, lat_sum + lat, lon_sum + lon,
+                                  record_id)
+                else:
+                    cells[key] = (1, lat, lon, record_id)
+            clusters = [(count, lat_sum / count, lon_sum / count, record_id)
+                        for count, lat_sum, lon_sum, record_id
+                        in cells.values()]
+
+        return clusters
+
 # =============================================================================
 class S3ExportPOI(S3Method):
     """ Export point-of-interest resources for a location """
@@ -67,7 +67,7 @@ from gluon.storage import Storage, Messages
 from gluon.tools import callback, fetch
 
 from s3rest import S3Method
-from s3resource import S3Resource
+from s3resource import S3Resource, S3SelectCache
 from s3utils import s3_debug, s3_mark_required, s3_has_foreign_key, s3_get_foreign_key, s3_unicode
 from s3xml import S3XML
 
@@ -2494,6 +2494,8 @@ class S3ImportItem(object):
             onaccept = current.deployment_settings.get_import_callback(tablename, key)
             if onaccept:
                 callback(onaccept, form, tablename=tablename)
+            # Invalidate cached select results
+            S3SelectCache.invalidate(tablename)
 
         # Update referencing items
         if self.update and self.id:
@@ -2664,6 +2666,7 @@ class S3ImportItem(object):
                         db(self.table.id == self.id).update(**{field:values})
             else:
                 db(self.table.id == self.id).update(**{field:value})
+            S3SelectCache.invalidate(self.tablename)
 
     # -------------------------------------------------------------------------
     def store(self, item_table=None):
@@ -37,8 +37,10 @@ from gluon.dal import Table
 #from gluon.validators import IS_EMPTY_OR
 from gluon.storage import Storage
 
+from s3fields import S3Index
 from s3navigation import S3ScriptItem
-from s3resource import S3Resource
+from s3resource import S3FieldPath, S3Resource, S3ResourceField, S3SelectCache
+from s3utils import s3_debug
 from s3validators import IS_ONE_OF
 
 DEFAULT = lambda: None
@@ -64,6 +66,16 @@ class S3Model(object):
     LOAD = "s3_model_load"
     DELETED = "deleted"
 
+    # Index of the model names {prefix: (names, generic, other)},
+    # built once per process (see index())
+    INDEX = None
+
+    # Names of all tables with computed columns (process-wide,
+    # tables get registered when they are defined)
+    COMPUTED = set()
+    # Names of the tables the computed columns depend on, by table name
+    DEPENDS = {}
+
     def __init__(self, module=None):
         """ Constructor """
 
@@ -207,29 +219,16 @@ class S3Model(object):
             return ogetattr(db, tablename)
         else:
             prefix, name = tablename.split("_", 1)
-            if hasattr(models, prefix):
+            index = cls.index().get(prefix)
+            if index is not None and hasattr(models, prefix):
                 module = models.__dict__[prefix]
-                loaded = False
-                generic = []
-                for n in module.__all__:
-                    model = module.__dict__[n]
-                    if hasattr(model, "_s3model"):
-                        if loaded:
-                            continue
-                        if hasattr(model, "names"):
-                            if tablename in model.names:
-                                model(prefix)
-                                loaded = True
-                            else:
-                                continue
-                        else:
-                            generic.append(n)
-                    else:
-                        if n == tablename:
-                            s3db.classes[tablename] = (prefix, n)
-                            found = model
-                            loaded = True
-                if not loaded:
+                names, generic, other = index
+                if tablename in names:
+                    module.__dict__[names[tablename]](prefix)
+                elif tablename in other:
+                    s3db.classes[tablename] = (prefix, tablename)
+                    found = module.__dict__[tablename]
+                else:
                     [module.__dict__[n](prefix) for n in generic]
         if found:
             return found
@@ -261,33 +260,66 @@ class S3Model(object):
         elif "_" in name:
             prefix = name.split("_", 1)[0]
             models = current.models
-            if hasattr(models, prefix):
+            index = cls.index().get(prefix)
+            if index is not None and hasattr(models, prefix):
                 module = models.__dict__[prefix]
-                loaded = False
+                names, generic, other = index
+                if name in names:
+                    module.__dict__[names[name]](prefix)
+                else:
+                    [module.__dict__[n](prefix) for n in generic]
+                for n in other:
+                    s3[n] = module.__dict__[n]
+        if name in s3:
+            return s3[name]
+        elif isinstance(default, Exception):
+            raise default
+        else:
+            return default
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def index(cls):
+        """
+            Get the index of all names defined by the models, which
+            is built only once per process (rather than scanning the
+            __all__ of the model modules on every lookup)
+
+            @return: a dict {prefix: (names, generic, other)}, where
+                     names is a dict {name: model class name} of all
+                     names declared by models, generic is a list of the
+                     names of the models which do not declare names, and
+                     other is a list of all other names (tables, functions
+                     and classes) exported by the module which start with
+                     the prefix
+        """
+
+        index = cls.INDEX
+        if index is None:
+            index = {}
+            models = current.models
+            if models is None:
+                return index
+            for prefix, module in models.__dict__.items():
+                if type(module).__name__ != "module" or \
+                   not hasattr(module, "__all__"):
+                    continue
+                names = {}
                 generic = []
+                other = []
                 for n in module.__all__:
                     model = module.__dict__[n]
-                    if type(model).__name__ == "type":
-                        if loaded:
-                            continue
+                    if hasattr(model, "_s3model"):
                         if hasattr(model, "names"):
-                            if name in model.names:
-                                model(prefix)
-                                loaded = True
-                                generic = []
-                            else:
-                                continue
+                            for name in model.names:
+                                names[name] = n
                         else:
                             generic.append(n)
                     elif n.startswith("%s_" % prefix):
-                        s3[n] = model
-                [module.__dict__[n](prefix) for n in generic]
-        if name in s3:
-            return s3[name]
-        elif isinstance(default, Exception):
-            raise default
-        else:
-            return default
+                        other.append(n)
+                index[prefix] = (names, generic, other)
+            cls.INDEX = index
+        return index
 
     # -------------------------------------------------------------------------
     @classmethod
@@ -342,15 +374,121 @@ class S3Model(object):
         """
             Same as db.define_table except that it does not repeat
             a table definition if the table is already defined.
+
+            Persisted computed columns can be declared with the
+            additional keyword argument "computed", a dict
+            {fieldname: S3Computed} (see S3Computed for details)
+
+            Database indexes can be declared with the additional keyword
+            argument "indexes", a list of index specifications (see
+            S3Index for details)
         """
 
+        computed = args.pop("computed", None)
+        indexes = args.pop("indexes", None)
+
         db = current.db
         if hasattr(db, tablename):
             table = ogetattr(db, tablename)
         else:
             table = db.define_table(tablename, *fields, **args)
+            cls.computed_hooks(table)
+
+        if computed:
+            cls.configure(tablename, computed=computed)
+            cls.COMPUTED.add(tablename)
+        if indexes:
+            cls.configure(tablename, indexes=indexes)
         return table
 
+    # -------------------------------------------------------------------------
+    # Database indexes
+    # -------------------------------------------------------------------------
+    @classmethod
+    def indexes(cls, tablename):
+        """
+            Get the indexes for a table: the declared indexes (table
+            setting "indexes"), and - unless the table setting
+            "auto_indexes" is False - automatic indexes for all
+            foreign keys, the deleted flag, modified_on and the
+            ownership fields used by accessible queries
+
+            @param tablename: the table name
+
+            @return: list of S3Index
+        """
+
+        table = cls.table(tablename, db_only=True)
+        if table is None:
+            return []
+        fields = table.fields
+
+        indexes = []
+        for spec in cls.get_config(tablename, "indexes") or []:
+            index = S3Index.parse(spec)
+            if all(fn in fields for fn in index.fields):
+                indexes.append(index)
+
+        if current.deployment_settings.get_base_auto_indexes() and \
+           cls.get_config(tablename, "auto_indexes", True):
+            declared = set(index.fields[0] for index in indexes)
+            auto = [fn for fn in fields
+                    if str(table[fn].type)[:10] == "reference "]
+            auto.extend(fn for fn in ("deleted",
+                                      "modified_on",
+                                      "realm_entity",
+                                      "owned_by_group",
+                                      "owned_by_user",
+                                      )
+                        if fn in fields)
+            for fn in auto:
+                if fn not in declared:
+                    indexes.append(S3Index(fn))
+                    declared.add(fn)
+
+        return indexes
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def create_indexes(cls, tablenames=None):
+        """
+            Create all missing indexes (migration step, i.e. to be run
+            after all models have been loaded, see load_all_models)
+
+            @param tablenames: the tables to create indexes for,
+                               defaults to all defined tables
+
+            @return: list of the names of the created indexes
+        """
+
+        db = current.db
+        if tablenames is None:
+            tablenames = db.tables
+
+        created = []
+        for tablename in tablenames:
+            if tablename not in db:
+                continue
+            table = db[tablename]
+            existing = S3Index.existing(table)
+            if existing is None:
+                # Database engine not supported
+                break
+            for index in cls.indexes(tablename):
+                if index.covered(existing):
+                    continue
+                try:
+                    created.append(index.create(table))
+                except Exception, e:
+                    db.rollback()
+                    s3_debug("S3Model",
+                             "Could not create index %s: %s" % \
+                             (index.index_name(tablename), e))
+                else:
+                    db.commit()
+                existing = S3Index.existing(table)
+        return created
+
     # -------------------------------------------------------------------------
     # Resource configuration
     # -------------------------------------------------------------------------
@@ -379,6 +517,10 @@ class S3Model(object):
         if tn not in config:
             config[tn] = Storage()
         config[tn].update(attr)
+
+        # Settings which affect the resolution of field selectors
+        if "context" in attr or "virtual_sql" in attr:
+            S3FieldPath.clear_cache()
         return
 
     # -------------------------------------------------------------------------
@@ -417,6 +559,10 @@ class S3Model(object):
                 del config[tn]
             else:
                 [config[tn].pop(k, None) for k in keys]
+
+        # Settings which affect the resolution of field selectors
+        if not keys or "context" in keys or "virtual_sql" in keys:
+            S3FieldPath.clear_cache()
         return
 
     # -------------------------------------------------------------------------
@@ -501,6 +647,9 @@ class S3Model(object):
 
                 hooks[alias] = component
             components[primary] = hooks
+
+        # New components may change the resolution of field selectors
+        S3FieldPath.clear_cache()
         return
 
     # -------------------------------------------------------------------------
@@ -974,8 +1123,17 @@ class S3Model(object):
 
         get_config = cls.get_config
 
-        # Get all super-entities of this table
+        # Records in this table have been written, so invalidate
+        # cached select results
         tablename = table._tablename
+        S3SelectCache.invalidate(tablename)
+
+        # Update computed columns which depend on this record
+        record_id = record.get("id", None)
+        if record_id and tablename in cls.computed_tables():
+            cls.update_computed(tablename, [record_id])
+
+        # Get all super-entities of this table
         supertables = get_config(tablename, "super_entity")
         if not supertables:
             return False
@@ -1025,6 +1183,7 @@ class S3Model(object):
 
         super_keys = Storage()
         for tn, s, key, shared in updates:
+            S3SelectCache.invalidate(tn)
             data = Storage([(fn, _record[shared[fn]]) for fn in shared])
             data.instance_type = tablename
             if has_deleted:
@@ -1103,6 +1262,269 @@ class S3Model(object):
                 resource.delete(ondelete=ondelete, cascade=True)
         return True
 
+    # -------------------------------------------------------------------------
+    # Computed columns
+    # -------------------------------------------------------------------------
+    @classmethod
+    def computed_tables(cls):
+        """
+            Get the names of all tables with computed columns, and of
+            all tables these columns depend on (the dependencies of each
+            table are resolved only once, and then kept in DEPENDS)
+
+            @return: set of table names
+        """
+
+        tablenames = set()
+        if not cls.COMPUTED:
+            return tablenames
+
+        s3db = current.s3db
+
+        for master in list(cls.COMPUTED):
+            tablenames.add(master)
+
+            depends = cls.DEPENDS.get(master)
+            if depends is None:
+                # Make sure the model is loaded
+                if cls.table(master) is None:
+                    continue
+                computed = cls.get_config(master, "computed")
+                if not computed:
+                    continue
+                resource = s3db.resource(master)
+                depends = set()
+                for spec in computed.values():
+                    for selector in spec.depends:
+                        try:
+                            rfield = S3ResourceField(resource, selector)
+                        except (AttributeError, SyntaxError):
+                            continue
+                        depends.add(rfield.tname)
+                cls.DEPENDS[master] = depends
+            tablenames |= depends
+
+        return tablenames
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def computed_dependents(cls, tablename, record_ids):
+        """
+            Find all records with computed columns which depend on
+            the given records (to be called before the given records
+            get deleted, as the dependencies can not be found after)
+
+            @param tablename: the name of the table written to
+            @param record_ids: the IDs of the records written
+
+            @return: dict {tablename: set of record IDs} of the records
+                     which need their computed columns updated
+        """
+
+        dependents = {}
+        if not record_ids or tablename not in cls.computed_tables():
+            return dependents
+
+        db = current.db
+        s3db = current.s3db
+
+        for master in list(cls.COMPUTED):
+
+            depends = cls.DEPENDS.get(master)
+            if depends is not None and tablename not in depends:
+                continue
+
+            # Make sure the model is loaded
+            if master != tablename and cls.table(master) is None:
+                continue
+            computed = cls.get_config(master, "computed")
+            if not computed:
+                continue
+
+            mtable = cls.table(master, db_only=True)
+            resource = s3db.resource(master)
+            tnames = set()
+            ids = set()
+            for spec in computed.values():
+                for selector in spec.depends:
+                    try:
+                        rfield = S3ResourceField(resource, selector)
+                    except (AttributeError, SyntaxError):
+                        continue
+                    tnames.add(rfield.tname)
+                    if rfield.tname != tablename:
+                        continue
+                    if rfield.tname == master and not rfield.join:
+                        # Field in the same record
+                        ids.update(record_ids)
+                        continue
+
+                    # Find the master records via the join path
+                    fname = rfield.fname
+                    if not fname or not selector.endswith(fname):
+                        continue
+                    path = "%sid" % selector[:-len(fname)]
+                    try:
+                        kfield = S3ResourceField(resource, path)
+                    except (AttributeError, SyntaxError):
+                        continue
+                    if kfield.field is None:
+                        continue
+                    query = kfield.field.belongs(record_ids)
+                    for join in kfield.join.values():
+                        query &= join
+                    rows = db(query).select(mtable._id, distinct=True)
+                    ids.update([row[mtable._id] for row in rows])
+
+            cls.DEPENDS[master] = tnames
+            if ids:
+                dependents[master] = ids
+
+        return dependents
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def computed_hooks(cls, table):
+        """
+            Add callbacks to a table to update the computed columns which
+            depend on its records when records are moved to another parent
+            (i.e. a foreign key changes), as the previous parent can not
+            be found after the update (update_super only finds the new one)
+
+            @param table: the Table
+        """
+
+        tablename = table._tablename
+        keys = [f.name for f in table if str(f.type)[:9] == "reference"]
+        if not keys:
+            return
+
+        pending = {}
+
+        def before_update(dbset, fields):
+            if not cls.COMPUTED:
+                return False
+            changed = [fn for fn in keys if fn in fields]
+            if not changed or tablename not in cls.computed_tables():
+                return False
+            # Find the records where a foreign key changes
+            rows = dbset.select(table._id, *[table[fn] for fn in changed])
+            pkey = table._id.name
+            record_ids = [row[pkey] for row in rows
+                          if any(str(row[fn]) != str(fields[fn])
+                                 for fn in changed)]
+            if record_ids:
+                pending[id(dbset)] = (record_ids,
+                                      cls.computed_dependents(tablename,
+                                                              record_ids))
+            return False
+
+        def after_update(dbset, fields):
+            if id(dbset) not in pending:
+                return
+            record_ids, dependents = pending.pop(id(dbset))
+            # Previous and new parents
+            for master, ids in cls.computed_dependents(tablename,
+                                                       record_ids).items():
+                if master in dependents:
+                    dependents[master] |= ids
+                else:
+                    dependents[master] = ids
+            cls.update_computed(dependents=dependents)
+
+        table._before_update.append(before_update)
+        table._after_update.append(after_update)
+        return
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def update_computed(cls, tablename=None, record_ids=None, dependents=None):
+        """
+            Update all computed columns which depend on the given records
+
+            @param tablename: the name of the table written to
+            @param record_ids: the IDs of the records written
+            @param dependents: the dependent records (as returned from
+                               computed_dependents), if determined before
+        """
+
+        if dependents is None:
+            dependents = cls.computed_dependents(tablename, record_ids)
+        for master, ids in dependents.items():
+            cls.rebuild_computed(master, record_ids=list(ids))
+        return
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def rebuild_computed(cls,
+                         tablename,
+                         record_ids=None,
+                         fieldnames=None,
+                         chunk_size=500):
+        """
+            (Re-)compute the computed columns of a table, e.g. to
+            backfill after adding a new computed column
+
+            @param tablename: the table name
+            @param record_ids: the IDs of the records to update, None
+                               for all records
+            @param fieldnames: the names of the computed columns to
+                               update, None for all computed columns
+            @param chunk_size: the number of records to compute at once
+
+            @return: the number of records updated
+        """
+
+        table = cls.table(tablename, db_only=True)
+        computed = cls.get_config(tablename, "computed")
+        if table is None or not computed:
+            return 0
+        if fieldnames:
+            computed = dict((fn, computed[fn])
+                            for fn in fieldnames if fn in computed)
+
+        db = current.db
+        pkey = table._id
+
+        def chunks():
+            if record_ids is not None:
+                for i in xrange(0, len(record_ids), chunk_size):
+                    yield record_ids[i:i + chunk_size]
+            else:
+                last = 0
+                while True:
+                    rows = db(pkey > last).select(pkey,
+                                                  orderby=pkey,
+                                                  limitby=(0, chunk_size))
+                    if not rows:
+                        break
+                    ids = [row[pkey] for row in rows]
+                    last = ids[-1]
+                    yield ids
+
+        updated = 0
+        for ids in chunks():
+            for fieldname, spec in computed.items():
+                values = spec.compute(ids) or {}
+                # Group the records by value to reduce the number of UPDATEs
+                groups = {}
+                for record_id in ids:
+                    value = values.get(record_id)
+                    key = tuple(value) if type(value) is list else value
+                    if key in groups:
+                        groups[key][1].append(record_id)
+                    else:
+                        groups[key] = (value, [record_id])
+                for value, group in groups.values():
+                    # Not using update() here as this is not a change
+                    # of the record (must not update modified_on etc.)
+                    db(pkey.belongs(group)).update_naive(**{fieldname: value})
+            updated += len(ids)
+
+        if updated:
+            S3SelectCache.invalidate(tablename)
+        return updated
+
     # -------------------------------------------------------------------------
     @classmethod
     def get_instance(cls, supertable, superid):
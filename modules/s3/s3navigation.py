@@ -41,9 +41,11 @@ __all__ = ["S3NavigationItem",
            "s3_rheader_resource",
            ]
 
+import hashlib
+
 from gluon import *
 from gluon.storage import Storage
-from s3utils import s3_unicode
+from s3utils import S3LRUCache, s3_unicode
 
 # =============================================================================
 class S3NavigationItem(object):
@@ -85,6 +87,9 @@ class S3NavigationItem(object):
         http://eden.sahanafoundation.org/wiki/S3Navigation
     """
 
+    # Process-wide cache for rendered menus (see xml)
+    RENDER_CACHE = S3LRUCache(capacity=500)
+
     # -------------------------------------------------------------------------
     # Construction
     #
@@ -242,6 +247,7 @@ class S3NavigationItem(object):
         self.link = link                # Item shall be linked
         self.mandatory = mandatory      # Item is always active
         self.ltr = ltr                  # Item is always rendered LTR
+        self.cache = False              # Rendered XML can be cached
 
         # Role restriction
         self.restrict = restrict
@@ -301,6 +307,7 @@ class S3NavigationItem(object):
         item.visible = self.visible
         item.link = self.link
         item.mandatory = self.mandatory
+        item.cache = self.cache
         if self.restrict is not None:
             item.restrict = [r for r in self.restrict]
         else:
@@ -906,15 +913,108 @@ class S3NavigationItem(object):
             Invokes the renderer and serializes the output for the web2py
             template parser, returns a string to be written to the response
             body, uses the xml() method of the renderer output, if present.
+
+            If the cache-flag is set for this item, the output is stored
+            in (and re-used from) the process-wide render cache, see
+            cache_key()
         """
 
+        key = self.cache_key() if self.cache else None
+        if key is not None:
+            cached = self.RENDER_CACHE.get(key)
+            if cached is not None:
+                return cached
+
         output = self.render()
         if output is None:
-            return ""
+            output = ""
         elif hasattr(output, "xml"):
-            return output.xml()
+            output = output.xml()
+        else:
+            output = str(output)
+
+        if key is not None:
+            self.RENDER_CACHE.set(key, output)
+        return output
+
+    # -------------------------------------------------------------------------
+    def cache_key(self):
+        """
+            Get the key for the rendered XML of this item in the render
+            cache, which consists of:
+
+                - the controller, language and template
+                - the roles and realms of the current user
+                - the ACL version (see S3Permission.acl_index)
+                - the structure of the menu (see signature), including
+                  the selected path for the current request
+
+            @return: the cache key (string), or None if the output can
+                     not be cached (ACL index disabled or outdated)
+        """
+
+        auth = current.auth
+        permission = auth.permission
+        s3 = current.response.s3
+
+        if not permission.acl_cache or s3.acl_dirty or auth.override:
+            return None
+        permission.acl_index()
+
+        user = auth.user
+        if user:
+            def items(realms):
+                if not realms:
+                    return []
+                return sorted((k, sorted(v) if v is not None else None)
+                              for k, v in realms.items())
+            delegations = user.delegations or {}
+            roles = (items(user.realms),
+                     [(group_id, items(delegations[group_id]))
+                      for group_id in sorted(delegations)])
         else:
-            return str(output)
+            session_s3 = current.session.s3
+            roles = sorted(session_s3.roles or []) if session_s3 else []
+
+        request = current.request
+        key = (request.controller,
+               current.T.accepted_language,
+               current.deployment_settings.get_theme(),
+               roles,
+               s3.acl_stamp,
+               self.signature(),
+               )
+        return hashlib.md5(repr(key)).hexdigest()
+
+    # -------------------------------------------------------------------------
+    def signature(self):
+        """
+            Get a signature of this item and its components, comprising
+            all properties that do not depend on permissions, as well as
+            the results of the enabled, hook and selected checks for the
+            current request
+
+            @return: a nested tuple
+        """
+
+        renderer = self.renderer
+        return (self.__class__.__name__,
+                getattr(renderer, "__name__", None),
+                s3_unicode(self.label),
+                self.url(),
+                self.p,
+                self.tablename,
+                self.restrict,
+                self.enabled,
+                self.mandatory,
+                self.ltr,
+                sorted(self.attr.items()),
+                sorted(self.opts.items()),
+                self.check_hook(),
+                self.check_enabled(),
+                self.check_selected(),
+                tuple(c.signature() for c in self.components),
+                )
 
     # -------------------------------------------------------------------------
     # Tree construction methods
@@ -52,6 +52,7 @@ from gluon import *
 from gluon.storage import Storage
 from gluon.tools import fetch
 
+from s3resource import S3Journal
 from s3utils import s3_truncate, s3_unicode
 
 DEBUG = False
@@ -485,6 +486,25 @@ class S3Notifications(object):
         # Select those which have updates
         resources = set()
         radd = resources.add
+
+        if current.deployment_settings.get_base_journal():
+            # Look up the latest changes in the change journal, for all
+            # resources last checked within the journal period at once
+            start = S3Journal.start()
+            if start is not None:
+                journaled = dict((row[tname], row[mtime]) for row in rows
+                                 if row[mtime] is not None and \
+                                    row[mtime] >= start)
+                if journaled:
+                    latest = S3Journal.latest(journaled.keys(),
+                                              since=min(journaled.values()))
+                    for tablename, msince in journaled.items():
+                        modified_on = latest.get(tablename)
+                        if modified_on and modified_on >= msince:
+                            radd((tablename, modified_on))
+                    rows = [row for row in rows
+                            if row[tname] not in journaled]
+
         for row in rows:
             tablename = row[tname]
             table = s3db.table(tablename)
@@ -36,8 +36,10 @@
                            S3TypeConverter
 """
 
+import base64
 import collections
 import datetime
+import hashlib
 import re
 import sys
 import time
@@ -75,8 +77,8 @@ from gluon.storage import Storage
 from gluon.tools import callback
 
 from s3data import S3DataTable, S3DataList, S3PivotTable
-from s3fields import S3Represent, S3RepresentLazy, s3_all_meta_field_names
-from s3utils import s3_has_foreign_key, s3_flatlist, s3_get_foreign_key, s3_unicode, S3MarkupStripper, S3TypeConverter
+from s3fields import S3Index, S3Represent, S3RepresentLazy, s3_all_meta_field_names
+from s3utils import s3_has_foreign_key, s3_flatlist, s3_get_foreign_key, s3_unicode, S3LRUCache, S3MarkupStripper, S3TypeConverter
 from s3validators import IS_ONE_OF
 from s3xml import S3XMLFormat
 
@@ -508,20 +510,26 @@ class S3Resource(object):
     # -------------------------------------------------------------------------
     # Data access (new API)
     # -------------------------------------------------------------------------
-    def count(self, left=None, distinct=False):
+    def count(self, left=None, distinct=False, approximate=False):
         """
             Get the total number of available records in this resource
 
             @param left: left outer joins, if required
             @param distinct: only count distinct rows
+            @param approximate: allow to return an estimate for large
+                                tables, see S3ResourceFilter.count
         """
 
         if self.rfilter is None:
             self.build_query()
-        if self._length is None:
-            self._length = self.rfilter.count(left=left,
-                                              distinct=distinct)
-        return self._length
+        length = self._length
+        if length is None or \
+           not approximate and getattr(length, "approximate", False):
+            length = self.rfilter.count(left=left,
+                                        distinct=distinct,
+                                        approximate=approximate)
+            self._length = length
+        return length
 
     # -------------------------------------------------------------------------
     def select(self,
@@ -538,7 +546,10 @@ class S3Resource(object):
                as_rows=False,
                represent=False,
                show_links=True,
-               raw_data=False):
+               raw_data=False,
+               cursor=None,
+               raw_columns=False,
+               approximate=False):
         """
             Extract data from this resource
 
@@ -555,6 +566,19 @@ class S3Resource(object):
             @param as_rows: return the rows (don't extract)
             @param represent: render field value representations
             @param raw_data: include raw data in the result
+            @param cursor: use keyset pagination, the cursor token
+                           returned for the previous page (or an empty
+                           string for the first page); the token for
+                           the next page will be returned as "cursor"
+                           in the output
+            @param raw_columns: return the data as columns rather than as
+                                rows, i.e. one list of values per column,
+                                all in the order of the record IDs in the
+                                primary key column (output["columns"]
+                                instead of output["rows"])
+            @param approximate: allow the total number of matching records
+                                to be an estimate for large tables (see
+                                count)
         """
 
         # Init
@@ -607,6 +631,42 @@ class S3Resource(object):
         dtables = left_joins.extend(l)
         distinct |= d
 
+        # Look up the result in the cross-request cache
+        cache_key = None
+        cache_expire = self.get_config("select_cache")
+        if cache_expire and \
+           not groupby and not as_rows and not raw_data and vfltr is None:
+            tablenames = [tablename] + ftables + vtables + dtables
+            for dfield in dfields:
+                tablenames.append(dfield.tname)
+                if represent:
+                    # Representations may come from referenced tables
+                    ftype = str(dfield.ftype)
+                    if ftype[:10] == "reference ":
+                        tablenames.append(ftype[10:].split(".", 1)[0])
+                    elif ftype[:15] == "list:reference ":
+                        tablenames.append(ftype[15:].split(".", 1)[0])
+            cache_key = S3SelectCache.key(tablenames,
+                                          query,
+                                          left_joins,
+                                          [f.colname for f in dfields],
+                                          start,
+                                          limit,
+                                          orderby,
+                                          distinct,
+                                          virtual,
+                                          count,
+                                          getids,
+                                          represent,
+                                          show_links,
+                                          cursor,
+                                          raw_columns)
+            if cache_key:
+                output = S3SelectCache.get(cache_key)
+                if output is not None:
+                    output["rfields"] = dfields
+                    return output
+
         # Temporarily deactivate (mandatory) virtual fields
         if not virtual:
             vf = table.virtualfields
@@ -625,6 +685,7 @@ class S3Resource(object):
 
         # Resolve ORDERBY
         orderby_aggregate = orderby_fields = None
+        orderby_keys = []
         
         if orderby:
 
@@ -653,6 +714,7 @@ class S3Resource(object):
                     if op == db._adapter.AGGREGATE:
                         # Already an aggregation
                         expression = item
+                        orderby_keys = None
                     elif isinstance(f, Field) and op == db._adapter.INVERT:
                         direction = "desc"
                     else:
@@ -690,6 +752,8 @@ class S3Resource(object):
                     direction = direction.strip().lower()[:3]
                     if fname != pkey:
                         expression = f.min() if direction == "asc" else ~(f.max())
+                    if orderby_keys is not None:
+                        orderby_keys.append((f, direction == "desc"))
                 else:
                     orderby.append(expression)
                 orderby_aggregate.append(expression)
@@ -713,8 +777,77 @@ class S3Resource(object):
         filter_joins = left_joins.as_list(tablenames=ftables,
                                           aqueries=aqueries)
 
-        if getids or count or left_joins:
-            if not groupby and not vfltr and \
+        # Keyset pagination
+        keys = None
+        if cursor is not None and limitby and \
+           not groupby and not vfltr and not getids and \
+           orderby_keys is not None:
+            keys = S3KeysetCursor.keys(table, orderby_keys)
+
+        if keys:
+
+            signature = S3KeysetCursor.sign(filter_query, keys)
+            seek = S3KeysetCursor(cursor).query(limitby[0], signature, keys)
+
+            if count:
+                totalrows = self.count(left=left,
+                                       distinct=distinct,
+                                       approximate=True)
+
+            # Retrieve the record IDs and key values of the page
+            aggregates = [f.max() if descending else f.min()
+                          for f, descending in keys if str(f) != pkey]
+            korderby = list(orderby_aggregate) if orderby_aggregate else []
+            if pkey not in [str(f) for f, descending in orderby_keys]:
+                korderby.append(table._id)
+            if seek is not None:
+                kquery = filter_query & seek
+                klimitby = (0, limitby[1] - limitby[0])
+            else:
+                kquery = filter_query
+                klimitby = limitby
+
+            if virtual:
+                vf = table.virtualfields
+                osetattr(table, "virtualfields", [])
+            rows = db(kquery).select(table._id,
+                                     left=filter_joins,
+                                     orderby=korderby,
+                                     groupby=table._id,
+                                     limitby=klimitby,
+                                     cacheable=True,
+                                     *aggregates)
+            if virtual:
+                osetattr(table, "virtualfields", vf)
+
+            page = [row[pkey] for row in rows]
+
+            # Cursor for the next page
+            if len(page) == klimitby[1] - klimitby[0]:
+                last = rows.last()
+                aggregates = iter(aggregates)
+                values = [last[pkey] if str(f) == pkey else
+                          last[aggregates.next()]
+                          for f, descending in keys]
+                next_cursor = S3KeysetCursor.encode(limitby[0] + len(page),
+                                                    signature,
+                                                    values)
+            else:
+                next_cursor = None
+
+            # Use simplified master query
+            master_query = table._id.belongs(page)
+            orderby = None
+            limitby = None
+
+        elif getids or count or left_joins:
+            if approximate and count and not getids and not left_joins and \
+               not groupby and not vfltr:
+                totalrows = self.count(left=left,
+                                       distinct=distinct,
+                                       approximate=True)
+
+            elif not groupby and not vfltr and \
                (count or limitby or vtables != ftables):
 
                 if getids or left_joins:
@@ -758,6 +891,13 @@ class S3Resource(object):
                 else:
                     totalrows = rows.first()[field]
 
+        # Virtual fields with batch methods (computed after extraction)
+        batch = {}
+        if not as_rows and not groupby:
+            for dfield in dfields:
+                if dfield.batch is not None and dfield.tname == tablename:
+                    batch[dfield.colname] = dfield.batch
+
         # Master Query:
         
         # Add joins for virtual fields
@@ -824,7 +964,7 @@ class S3Resource(object):
                     tname = rfield.tname
                     if tname == tablename or as_rows or tname in qtables:
                         colname = rfield.colname
-                        if rfield.show:
+                        if rfield.show and colname not in batch:
                             mfields[colname] = True
                         if rfield.field:
                             qfields[colname] = rfield.field
@@ -864,14 +1004,45 @@ class S3Resource(object):
         master_joins = left_joins.as_list(tablenames=qtables,
                                           aqueries=aqueries)
 
+        # Report missing indexes
+        if current.deployment_settings.get_base_index_advisor():
+            S3Index.advise(master_query, orderby=orderby)
+
         # Retrieve the master rows
-        rows = db(master_query).select(left=master_joins,
-                                       distinct=distinct,
-                                       groupby=groupby,
-                                       orderby=orderby,
-                                       limitby=limitby,
-                                       cacheable=not as_rows,
-                                       *qfields.values())
+        if vfltr is not None and not groupby:
+            # Apply the virtual fields filter in batches
+            rows, numrows = rfilter.select(master_query,
+                                           qfields.values(),
+                                           start=start,
+                                           limit=limit,
+                                           count=count,
+                                           left=master_joins,
+                                           distinct=distinct,
+                                           orderby=orderby,
+                                           cacheable=not as_rows)
+            if count:
+                totalrows = numrows
+            vfltr = None
+            if (getids or left_joins) and has_id:
+                # Unique record IDs in the order of the rows
+                ids = []
+                append = ids.append
+                seen = set()
+                for row in rows:
+                    record_id = row[pkey]
+                    if record_id not in seen:
+                        seen.add(record_id)
+                        append(record_id)
+                if not count:
+                    totalrows = len(ids)
+        else:
+            rows = db(master_query).select(left=master_joins,
+                                           distinct=distinct,
+                                           groupby=groupby,
+                                           orderby=orderby,
+                                           limitby=limitby,
+                                           cacheable=not as_rows,
+                                           *qfields.values())
 
         # Restore virtual fields (if they were deactivated before)
         if not virtual:
@@ -901,8 +1072,17 @@ class S3Resource(object):
                 rows = rfilter(rows, start=start, limit=limit)
 
             if (getids or left_joins) and has_id:
-                ids = list(set([row[pkey] for row in rows]))
-                totalrows = len(ids)
+                # Unique record IDs in the order of the rows
+                ids = []
+                append = ids.append
+                seen = set()
+                for row in rows:
+                    record_id = row[pkey]
+                    if record_id not in seen:
+                        seen.add(record_id)
+                        append(record_id)
+                if not count:
+                    totalrows = len(ids)
 
         # With GROUPBY, return the grouped rows here:
         if groupby or as_rows:
@@ -910,9 +1090,18 @@ class S3Resource(object):
 
         # Otherwise: initialize output
         output = {"rfields": dfields, "numrows": totalrows, "ids": ids}
+        if keys:
+            output["cursor"] = next_cursor
 
         if not rows:
-            output["rows"] = []
+            if raw_columns:
+                columns = dict((dfield.colname, []) for dfield in dfields)
+                columns[pkey] = []
+                output["columns"] = columns
+            else:
+                output["rows"] = []
+            if cache_key:
+                S3SelectCache.store(cache_key, output, cache_expire)
             return output
 
         # Extract master rows
@@ -922,6 +1111,14 @@ class S3Resource(object):
                                  effort=effort,
                                  represent = represent)
 
+        # Compute the batch virtual fields
+        if batch:
+            self.__extract_batch(batch,
+                                 records,
+                                 field_data=field_data,
+                                 effort=effort,
+                                 represent=represent)
+
         # Extract the page IDs
         if page is None:
             if ids is None:
@@ -1004,11 +1201,15 @@ class S3Resource(object):
         NONE = current.messages["NONE"]
         
         results = {}
+        columns = {}
         for dfield in dfields:
             
             colname = dfield.colname
             fvalues, frecords, joined, list_type, virtual = field_data[colname]
 
+            # Cell values of this column by record ID
+            cdata = {}
+
             if represent:
 
                 # Get the renderer
@@ -1041,13 +1242,7 @@ class S3Resource(object):
                 # Write representations into result
                 for record_id in frecords:
 
-                    if record_id not in results:
-                        results[record_id] = Storage() \
-                                             if not raw_data \
-                                             else Storage(_row=Storage())
-                                             
                     record = frecords[record_id]
-                    result = results[record_id]
 
                     # List type with per-row lookup?
                     if per_row_lookup:
@@ -1058,19 +1253,15 @@ class S3Resource(object):
                             text = renderer(value)
                         except:
                             text = s3_unicode(value)
-                        result[colname] = text
-                        if raw_data:
-                            result["_row"][colname] = value
+                        cdata[record_id] = (text, value)
 
                     # Single value (master record)
                     elif len(record) == 1 or \
                          not joined and not list_type:
                         value = record.keys()[0]
-                        result[colname] = fvalues[value] \
-                                          if value in fvalues else NONE
-                        if raw_data:
-                            result["_row"][colname] = value
-                        continue
+                        cdata[record_id] = (fvalues[value] \
+                                            if value in fvalues else NONE,
+                                            value)
 
                     # Multiple values (joined or list-type)
                     else:
@@ -1093,9 +1284,7 @@ class S3Resource(object):
                         else:
                             data = ", ".join([s3_unicode(v) for v in vlist])
 
-                        result[colname] = data
-                        if raw_data:
-                            result["_row"][colname] = record.keys()
+                        cdata[record_id] = (data, record.keys())
 
                 # Restore linkto
                 if linkto is not None:
@@ -1103,15 +1292,28 @@ class S3Resource(object):
 
             else:
                 for record_id in records:
-                    if record_id not in results:
-                        result = results[record_id] = Storage()
-                    else:
-                        result = results[record_id]
-
                     data = frecords[record_id].keys()
                     if len(data) == 1 and not list_type:
                         data = data[0]
+                    cdata[record_id] = (data, None)
+
+            if raw_columns:
+                # One list of values per column
+                default = (NONE, None) if represent else (None, None)
+                columns[colname] = [cdata.get(record_id, default)[0]
+                                    for record_id in page]
+            else:
+                # One dict per record
+                for record_id, (data, value) in cdata.iteritems():
+                    if record_id not in results:
+                        result = results[record_id] = \
+                            Storage(_row=Storage()) \
+                            if raw_data and represent else Storage()
+                    else:
+                        result = results[record_id]
                     result[colname] = data
+                    if raw_data and represent:
+                        result["_row"][colname] = value
 
         #if DEBUG:
         #    end = datetime.datetime.now()
@@ -1120,9 +1322,170 @@ class S3Resource(object):
         #    _debug("Representation complete after %s seconds" % duration)
         #_debug("select DONE")
 
+        if raw_columns:
+            if pkey not in columns:
+                columns[pkey] = list(page)
+            output["columns"] = columns
+            if cache_key:
+                S3SelectCache.store(cache_key, output, cache_expire)
+            return output
+
         output["rows"] = [results[record_id] for record_id in page]
+        if cache_key:
+            S3SelectCache.store(cache_key, output, cache_expire)
         return output
-        
+
+    # -------------------------------------------------------------------------
+    def iterselect(self,
+                   fields,
+                   chunk_size=500,
+                   left=None,
+                   orderby=None,
+                   distinct=False,
+                   virtual=True,
+                   represent=False,
+                   show_links=True,
+                   raw_data=False,
+                   raw_columns=False):
+        """
+            Generator to extract data from this resource in chunks of
+            limited size, so that large result sets can be processed
+            without loading them all at once.
+
+            Applies the same filters, authorization rules and joins as
+            select(), and uses keyset pagination to retrieve the chunks
+            in a stable order. If the orderby can not be used as keyset
+            (e.g. ordering by fields in other tables, or with a virtual
+            filter), it falls back to seeking by record ID, and the
+            records are then returned in the order of their IDs.
+
+            @param fields: the fields to extract (selector strings)
+            @param chunk_size: the maximum number of records per chunk
+            @param left: additional left joins required for filters
+            @param orderby: orderby-expression for DAL
+            @param distinct: select distinct rows
+            @param virtual: include mandatory virtual fields
+            @param represent: render field value representations
+            @param show_links: render links in representations
+            @param raw_data: include raw data in the result
+            @param raw_columns: yield the data in columns (one dict of
+                                column lists per chunk) rather than rows
+
+            @return: a generator yielding the records (same format as
+                     the rows returned by select), or - with raw_columns -
+                     the columns of each chunk (same format as the columns
+                     returned by select)
+        """
+
+        if chunk_size is None or chunk_size < 1:
+            chunk_size = 500
+
+        table = self.table
+        pkey = str(table._id)
+
+        # Keyset pagination
+        start = 0
+        cursor = ""
+        while cursor is not None:
+            data = self.select(fields,
+                               start=start,
+                               limit=chunk_size,
+                               left=left,
+                               orderby=orderby,
+                               distinct=distinct,
+                               virtual=virtual,
+                               represent=represent,
+                               show_links=show_links,
+                               raw_data=raw_data,
+                               cursor=cursor,
+                               raw_columns=raw_columns)
+            if "cursor" not in data:
+                # Keyset pagination not applicable
+                break
+            if raw_columns:
+                columns = data["columns"]
+                length = len(columns[pkey])
+                if length:
+                    yield columns
+            else:
+                rows = data["rows"]
+                length = len(rows)
+                for row in rows:
+                    yield row
+            if length < chunk_size:
+                return
+            start += length
+            cursor = data["cursor"]
+        else:
+            return
+
+        # Fallback: seek by record ID, so that every chunk is a cheap
+        # first page rather than an ever-growing offset
+        if self.rfilter is None:
+            self.build_query()
+        rfilter = self.rfilter
+        queries = rfilter.queries
+
+        # Make sure we get the raw record IDs to seek from
+        selectors = list(fields)
+        extra_id = not raw_columns and \
+                   pkey not in [rfield.colname for rfield in
+                                self.resolve_selectors(fields,
+                                                       extra_fields=False)[0]]
+        if extra_id:
+            selectors.append(table._id.name)
+        extra_raw = not raw_columns and represent and not raw_data
+
+        last_id = None
+        while True:
+            if last_id is not None:
+                queries.append(table._id > last_id)
+                rfilter.query = None
+            try:
+                data = self.select(selectors,
+                                   start=0,
+                                   limit=chunk_size,
+                                   left=left,
+                                   orderby=table._id,
+                                   distinct=distinct,
+                                   virtual=virtual,
+                                   represent=represent,
+                                   show_links=show_links,
+                                   raw_data=raw_data or extra_raw,
+                                   raw_columns=raw_columns)
+            finally:
+                if last_id is not None:
+                    del queries[-1]
+                    rfilter.query = None
+            # Seek from the highest record ID of the chunk, as the rows
+            # may not be in the order of their IDs (e.g. virtual filter)
+            if raw_columns:
+                columns = data["columns"]
+                page = columns[pkey]
+                length = len(page)
+                if length:
+                    last_id = max(page)
+                    yield columns
+            else:
+                rows = data["rows"]
+                length = len(rows)
+                page = []
+                append = page.append
+                for row in rows:
+                    if represent:
+                        append(row["_row"][pkey])
+                    else:
+                        append(row[pkey])
+                    if extra_raw:
+                        del row["_row"]
+                    if extra_id:
+                        del row[pkey]
+                    yield row
+                if page:
+                    last_id = max(page)
+            if length < chunk_size:
+                break
+
     # -------------------------------------------------------------------------
     @staticmethod
     def __extract(rows,
@@ -1201,6 +1564,55 @@ class S3Resource(object):
 
         return records
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def __extract_batch(batch,
+                        records,
+                        field_data=None,
+                        effort=None,
+                        represent=False):
+        """
+            Helper method for select to compute virtual fields with batch
+            methods for all extracted records, and merge the values into
+            the records
+
+            @param batch: dict of batch methods by column name
+            @param records: the records dict to merge the data into
+            @param field_data: the cumulative field data
+            @param effort: estimated effort for list:type representations
+            @param represent: collect unique values per field and estimate
+                              representation efforts for list:types
+        """
+
+        record_ids = records.keys()
+        for col, method in batch.items():
+
+            data = method(record_ids)
+            if data is None:
+                data = {}
+            fvalues, frecords, joined, list_type, virtual = field_data[col]
+
+            for k in record_ids:
+                record = records[k]
+                values = {}
+                value = data.get(k)
+                if type(value) is list:
+                    # Virtual field that returns a list
+                    if represent and value:
+                        effort[col] += 30 + len(value)
+                    for v in value:
+                        values[v] = None
+                        if represent and v not in fvalues:
+                            fvalues[v] = None
+                else:
+                    values[value] = None
+                    if represent and value not in fvalues:
+                        fvalues[value] = None
+                record[col] = values
+                frecords[k] = values
+
+        return records
+
     # -------------------------------------------------------------------------
     def insert(self, **fields):
         """
@@ -1286,6 +1698,10 @@ class S3Resource(object):
             # No rows? => that was it already :)
             return 0
 
+        # Find the records with computed columns depending on these rows
+        dependents = s3db.computed_dependents(tablename,
+                                              [row[pkey] for row in rows])
+
         numrows = 0
         deletable = []
 
@@ -1439,7 +1855,7 @@ class S3Resource(object):
                         clear_session(prefix=prefix, name=name)
                     # Audit
                     audit("delete", prefix, name,
-                          record=row[pkey], representation=format)
+                          record=row, representation=format)
                     # Delete super-entity
                     delete_super(table, row)
                     # On-delete hook
@@ -1470,7 +1886,7 @@ class S3Resource(object):
                         clear_session(prefix=prefix, name=name)
                     # Audit
                     audit("delete", prefix, name,
-                          record=row[pkey], representation=format)
+                          record=row, representation=format)
                     # Delete super-entity
                     delete_super(table, row)
                     # On-delete hook
@@ -1481,7 +1897,13 @@ class S3Resource(object):
                     if not cascade:
                         db.commit()
 
-        if numrows == 0 and not deletable:
+        if numrows:
+            # Invalidate cached select results
+            S3SelectCache.invalidate(tablename)
+            # Update dependent computed columns
+            if dependents:
+                s3db.update_computed(dependents=dependents)
+        elif not deletable:
             # No deletable rows found
             manager.error = INTEGRITY_ERROR
 
@@ -1539,6 +1961,8 @@ class S3Resource(object):
                     current.db.rollback()
                     return False
 
+        # Invalidate cached select results
+        S3SelectCache.invalidate(tablename)
         return True
 
     # -------------------------------------------------------------------------
@@ -1578,6 +2002,10 @@ class S3Resource(object):
         if not rows:
             return True
 
+        # Find the records with computed columns depending on these rows
+        dependents = s3db.computed_dependents(tablename,
+                                              [row[pkey] for row in rows])
+
         delete_super = s3db.delete_super
 
         if DELETED in table:
@@ -1695,6 +2123,12 @@ class S3Resource(object):
                     if ondelete:
                         callback(ondelete, row, tablename=tablename)
 
+        # Invalidate cached select results
+        S3SelectCache.invalidate(tablename)
+
+        # Update dependent computed columns
+        if dependents:
+            s3db.update_computed(dependents=dependents)
         return True
 
     # -------------------------------------------------------------------------
@@ -1722,7 +2156,9 @@ class S3Resource(object):
                   left=None,
                   orderby=None,
                   distinct=False,
-                  getids=False):
+                  getids=False,
+                  cursor=None,
+                  approximate=False):
         """
             Generate a data table of this resource
 
@@ -1734,6 +2170,11 @@ class S3Resource(object):
             @param distinct: distinct-flag for DB query
             @param getids: return the record IDs of all records matching the
                            query (used in search to create a filter)
+            @param cursor: the cursor token for keyset pagination (see
+                           select), the cursor for the next page will
+                           be available as S3DataTable.cursor
+            @param approximate: allow numrows to be an estimate for large
+                                tables (S3ApproximateCount)
 
             @return: tuple (S3DataTable, numrows, ids), where numrows represents
                      the total number of rows in the table that match the query;
@@ -1760,12 +2201,18 @@ class S3Resource(object):
                            distinct=distinct,
                            count=True,
                            getids=getids,
-                           represent=True)
+                           represent=True,
+                           cursor=cursor,
+                           raw_columns=True,
+                           approximate=approximate)
 
         # Generate the data table
-        if data["rows"]:
+        columns = data["columns"]
+        if columns[str(self._id)]:
             rfields = data["rfields"]
-            dt = S3DataTable(rfields, data["rows"], orderby=orderby)
+            dt = S3DataTable(rfields, columns,
+                             orderby=orderby,
+                             cursor=data.get("cursor"))
         else:
             dt = None
         return dt, data["numrows"], data["ids"]
@@ -1780,7 +2227,8 @@ class S3Resource(object):
                  distinct=False,
                  getids=False,
                  listid=None,
-                 layout=None):
+                 layout=None,
+                 cursor=None):
         """
             Generate a data list of this resource
 
@@ -1794,6 +2242,9 @@ class S3Resource(object):
                            query (used in search to create a filter)
             @param listid: the list identifier
             @param layout: custom renderer function (see S3DataList.render)
+            @param cursor: the cursor token for keyset pagination (see
+                           select), the cursor for the next page will
+                           be available as S3DataList.cursor
 
             @return: tuple (S3DataList, numrows, ids), where numrows represents
                      the total number of rows in the table that match the query;
@@ -1821,7 +2272,8 @@ class S3Resource(object):
                            count=True,
                            getids=getids,
                            raw_data=True,
-                           represent=True)
+                           represent=True,
+                           cursor=cursor)
 
         # Generate the data list
         numrows = data["numrows"]
@@ -1832,7 +2284,8 @@ class S3Resource(object):
                         start=start,
                         limit=limit,
                         total=numrows,
-                        layout=layout)
+                        layout=layout,
+                        cursor=data.get("cursor"))
                         
         return dl, numrows, data["ids"]
 
@@ -4611,6 +5064,641 @@ class S3LeftJoins(object):
         else:
             raise RuntimeError("circular left-join dependency")
 
+# =============================================================================
+class S3SelectCache(object):
+    """
+        Cross-request cache for the results of S3Resource.select
+
+        Activated per table with:
+
+            s3db.configure(tablename, select_cache=300)
+
+        where the value is the expiry time of the cache entries in seconds
+        (or True for the default). The backend is chosen by the deployment
+        setting base.select_cache ("ram" for a memory-bounded per-process
+        LRU cache, or "memcache" to share the cache between instances).
+
+        Cache keys consist of the compiled query, the selected fields, the
+        select options, the realms of the current user and the version
+        numbers of all tables involved in the query. The version number of
+        a table gets incremented whenever records are written to it (see
+        invalidate), so that outdated entries are never hit again.
+
+        @note: with the "ram" backend, the version counters are per-process
+               as well, i.e. writes in one process do not invalidate the
+               cache of other processes, so their results may be outdated
+               for up to the expiry time - use "memcache" for deployments
+               with multiple processes
+    """
+
+    EXPIRE = 300
+
+    # Per-process cache and version counters (ram backend)
+    _ram = None
+    _versions = {}
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def backend(cls):
+        """
+            Get the cache backend according to deployment settings
+
+            @return: the backend (S3LRUCache or MemcacheClient), or
+                     None if the results cache is disabled
+        """
+
+        settings = current.deployment_settings
+        setting = settings.get_base_select_cache()
+        if not setting:
+            return None
+        if setting == "memcache":
+            memcache = getattr(current.cache, "memcache", None)
+            if memcache is not None:
+                return memcache
+        if cls._ram is None:
+            cls._ram = S3LRUCache(capacity=settings.get_base_select_cache_size())
+        return cls._ram
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def versions(cls, tablenames):
+        """
+            Get the current version numbers of tables
+
+            @param tablenames: list of table names
+            @return: list of version numbers, in the same order
+        """
+
+        backend = cls.backend()
+        if backend is None:
+            return None
+        if isinstance(backend, S3LRUCache):
+            versions = cls._versions
+            return [versions.get(tn, 0) for tn in tablenames]
+
+        result = []
+        for tn in tablenames:
+            key = "s3_select_version_%s" % tn
+            version = backend.get(key)
+            if version is None:
+                # Start from a timestamp so that version numbers do not
+                # repeat if the counter gets evicted
+                version = int(time.time() * 1000)
+                backend.set(key, version, 86400)
+            result.append(version)
+        return result
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def invalidate(cls, tablename):
+        """
+            Increment the version number of a table, to be called
+            whenever records in the table have been created, updated
+            or deleted
+
+            @param tablename: the table name
+        """
+
+        if hasattr(tablename, "_tablename"):
+            tablename = tablename._tablename
+
+        backend = cls.backend()
+        if backend is None:
+            return
+        if isinstance(backend, S3LRUCache):
+            versions = cls._versions
+            versions[tablename] = versions.get(tablename, 0) + 1
+        else:
+            key = "s3_select_version_%s" % tablename
+            if backend.get(key) is None:
+                backend.set(key, int(time.time() * 1000), 86400)
+            else:
+                backend.increment(key)
+        return
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def key(cls, tablenames, *args):
+        """
+            Construct a cache key
+
+            @param tablenames: the names of all tables involved
+            @param args: the query, fields and select options
+
+            @return: the key, or None if the results cache is disabled
+        """
+
+        tablenames = sorted(set(tablenames))
+        versions = cls.versions(tablenames)
+        if versions is None:
+            return None
+
+        auth = current.auth
+        user = auth.user
+        if user:
+            realms = user.realms
+            if realms:
+                realms = sorted(realms.items())
+        else:
+            realms = None
+
+        def encode(arg):
+            # Expressions in lists are to be encoded as SQL, not repr
+            if isinstance(arg, (list, tuple)):
+                return "[%s]" % ",".join([encode(a) for a in arg])
+            else:
+                return str(arg)
+
+        items = [str(tablenames), str(versions), str(realms),
+                 str(current.T.accepted_language), str(auth.override)]
+        items.extend([encode(arg) for arg in args])
+
+        return "s3_select_%s" % hashlib.md5("|".join(items)).hexdigest()
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def get(cls, key):
+        """
+            Look up a select result (or count) in the cache
+
+            @param key: the cache key
+            @return: a copy of the cached result, or None if not found
+        """
+
+        backend = cls.backend()
+        if backend is None:
+            return None
+        try:
+            cached = backend.get(key)
+        except:
+            # Backend unavailable
+            return None
+        if cached is None or not isinstance(cached, dict):
+            return cached
+        output = dict(cached)
+        if "columns" in cached:
+            output["columns"] = dict((k, list(v))
+                                     for k, v in cached["columns"].items())
+        else:
+            output["rows"] = [Storage(row) for row in cached["rows"]]
+        return output
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def store(cls, key, output, expire=None):
+        """
+            Store a select result (or count) in the cache
+
+            @param key: the cache key
+            @param output: the select result
+            @param expire: expiry time in seconds
+        """
+
+        backend = cls.backend()
+        if backend is None:
+            return
+
+        if not expire or expire is True:
+            expire = cls.EXPIRE
+
+        if isinstance(output, dict):
+            cached = dict((k, v) for k, v in output.items() if k != "rfields")
+            if "columns" in output:
+                columns = output["columns"]
+                cached["columns"] = dict((k, list(v))
+                                         for k, v in columns.items())
+                weight = max(len(v) for v in columns.values()) + 1
+            else:
+                cached["rows"] = [Storage(row) for row in output["rows"]]
+                weight = len(cached["rows"]) + 1
+        else:
+            cached = output
+            weight = 1
+
+        if isinstance(backend, S3LRUCache):
+            backend.set(key, cached, expire, weight=weight)
+        else:
+            try:
+                backend.set(key, cached, expire)
+            except:
+                # Result not serializable or backend unavailable
+                pass
+        return
+
+# =============================================================================
+class S3Journal(object):
+    """
+        Change journal: a record of all creates, updates and deletes
+        (written by S3Audit, i.e. from CRUD forms, imports and
+        S3Resource.delete), to find changes without scanning the
+        modified_on field of every table
+
+        Activated by the deployment setting base.journal. Each journal
+        entry has a monotonic sequence number (the record ID of the
+        entry), so that consumers can find all changes since the last
+        known sequence number with a single range query on the primary
+        key (see changes). Entries older than base.journal_retention
+        days are removed by the s3_journal_prune task (see prune).
+
+        @note: sequence numbers are assigned at insert, so a transaction
+               which commits later can still add entries with lower
+               numbers than the last one seen by a concurrent consumer -
+               consumers which must not miss any changes should overlap
+               their range with the last few seconds of entries
+    """
+
+    TABLENAME = "s3_journal"
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def table(cls):
+        """
+            Get the journal table, define it if necessary
+
+            @return: the Table
+        """
+
+        db = current.db
+        tablename = cls.TABLENAME
+        if tablename in db:
+            return db[tablename]
+
+        settings = current.deployment_settings
+        current.s3db.configure(tablename, indexes=["timestmp"])
+        return db.define_table(tablename,
+                               Field("tablename", length=128),
+                               Field("record_id", "integer"),
+                               Field("uuid", length=128),
+                               # "create", "update" or "delete"
+                               Field("op", length=8),
+                               Field("timestmp", "datetime"),
+                               migrate=settings.get_base_migrate(),
+                               fake_migrate=settings.get_base_fake_migrate(),
+                               )
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def write(cls, tablename, record_id, op, uuid=None):
+        """
+            Add an entry to the journal (if enabled), in the same
+            transaction as the change
+
+            @param tablename: the table name
+            @param record_id: the record ID
+            @param op: the operation ("create", "update" or "delete")
+            @param uuid: the UUID of the record (looked up if not given)
+
+            @return: the sequence number of the entry, or None if
+                     the journal is disabled
+        """
+
+        if not current.deployment_settings.get_base_journal() or \
+           not record_id:
+            return None
+
+        if uuid is None:
+            table = current.s3db.table(tablename)
+            if table is not None and "uuid" in table.fields:
+                row = current.db(table._id == record_id).select(table.uuid,
+                                                                limitby=(0, 1)
+                                                                ).first()
+                if row:
+                    uuid = row.uuid
+
+        return cls.table().insert(tablename = tablename,
+                                  record_id = record_id,
+                                  uuid = uuid,
+                                  op = op,
+                                  timestmp = datetime.datetime.utcnow(),
+                                  )
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def sequence(cls):
+        """
+            Get the current (=highest) sequence number in the journal
+
+            @return: the sequence number, 0 if the journal is empty
+        """
+
+        table = cls.table()
+        maxid = table._id.max()
+        row = current.db(table._id > 0).select(maxid).first()
+        if row and row[maxid]:
+            return row[maxid]
+        return 0
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def changes(cls, since=0, tablenames=None, limit=None):
+        """
+            Get all journal entries after a sequence number
+
+            @param since: the last known sequence number
+            @param tablenames: limit to changes in these tables
+            @param limit: the maximum number of entries to return (use
+                          the sequence number of the last entry to
+                          continue)
+
+            @return: Rows (id=sequence number, tablename, record_id,
+                     uuid, op, timestmp), ordered by sequence number
+        """
+
+        table = cls.table()
+        query = (table._id > (since or 0))
+        if tablenames:
+            if len(tablenames) == 1:
+                query &= (table.tablename == tablenames[0])
+            else:
+                query &= (table.tablename.belongs(tablenames))
+        limitby = (0, limit) if limit else None
+        return current.db(query).select(table._id,
+                                        table.tablename,
+                                        table.record_id,
+                                        table.uuid,
+                                        table.op,
+                                        table.timestmp,
+                                        orderby=table._id,
+                                        limitby=limitby)
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def start(cls):
+        """
+            Get the time of the oldest entry in the journal, i.e. the
+            time since when the journal is complete
+
+            @return: datetime, or None if the journal is empty
+        """
+
+        table = cls.table()
+        oldest = table.timestmp.min()
+        row = current.db(table._id > 0).select(oldest).first()
+        return row[oldest] if row else None
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def latest(cls, tablenames, since=None):
+        """
+            Get the time of the latest change in each of the given tables
+
+            @param tablenames: the table names
+            @param since: only consider changes at or after this datetime
+
+            @return: dict {tablename: datetime}, containing only tables
+                     which have changed
+        """
+
+        if not tablenames:
+            return {}
+
+        table = cls.table()
+        if len(tablenames) == 1:
+            query = (table.tablename == list(tablenames)[0])
+        else:
+            query = (table.tablename.belongs(tablenames))
+        if since is not None:
+            query &= (table.timestmp >= since)
+        latest = table.timestmp.max()
+        rows = current.db(query).select(table.tablename,
+                                        latest,
+                                        groupby=table.tablename)
+        return dict((row[table.tablename], row[latest]) for row in rows)
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def prune(cls, retention=None):
+        """
+            Remove journal entries older than the retention period
+
+            @param retention: the retention period in days, defaults
+                              to the base.journal_retention setting
+
+            @return: the number of removed entries
+        """
+
+        if retention is None:
+            retention = current.deployment_settings.get_base_journal_retention()
+        if not retention:
+            return 0
+
+        table = cls.table()
+        cutoff = datetime.datetime.utcnow() - \
+                 datetime.timedelta(days=retention)
+        return current.db(table.timestmp < cutoff).delete()
+
+# =============================================================================
+class S3ApproximateCount(int):
+    """
+        Estimated number of records (from the query planner or table
+        statistics), can be used like an int, but is to be shown to the
+        user as "about N records"
+    """
+
+    approximate = True
+
+# =============================================================================
+class S3KeysetCursor(object):
+    """
+        Helper class for keyset (seek) pagination: instead of skipping
+        the first n rows with OFFSET, the next page is selected by
+        comparing the orderby fields (and the primary key) with the
+        values of the last row of the previous page.
+
+        The cursor is passed to the client as an opaque token, which
+        contains the index of the first row of the next page, the key
+        values of the last row of the previous page and a signature of
+        the query and orderby. If the token does not match the current
+        request, then the caller falls back to OFFSET.
+    """
+
+    # Field types supported for keys
+    KEYTYPES = ("id", "integer", "double", "string", "text",
+                "boolean", "date", "datetime", "time")
+
+    # -------------------------------------------------------------------------
+    def __init__(self, token=None):
+        """
+            Constructor
+
+            @param token: the cursor token (string)
+        """
+
+        self.start = None
+        self.signature = None
+        self.values = None
+
+        if token:
+            try:
+                data = json.loads(base64.urlsafe_b64decode(str(token)))
+                start, signature, values = data
+            except (ValueError, TypeError):
+                pass
+            else:
+                if isinstance(start, (int, long)) and \
+                   isinstance(values, list):
+                    self.start = start
+                    self.signature = signature
+                    self.values = [self.decode_value(v) for v in values]
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def keys(cls, table, orderby):
+        """
+            Get the key fields for the cursor from an orderby
+
+            @param table: the master table
+            @param orderby: list of tuples (Field, descending)
+
+            @return: list of tuples (Field, descending), with the primary
+                     key appended, or None if the orderby is not suitable
+                     for keyset pagination (e.g. fields in joined tables)
+        """
+
+        keys = []
+        pkey = str(table._id)
+        has_pkey = False
+        for field, descending in orderby:
+            if not isinstance(field, Field) or \
+               field.tablename != table._tablename:
+                return None
+            ftype = str(field.type)
+            if ftype not in cls.KEYTYPES and ftype[:9] != "reference":
+                return None
+            keys.append((field, descending))
+            if str(field) == pkey:
+                has_pkey = True
+                break
+        if not has_pkey:
+            keys.append((table._id, False))
+        return keys
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def sign(query, keys):
+        """
+            Compute the signature for query and keys
+
+            @param query: the filter query
+            @param keys: the key fields
+        """
+
+        keystr = ",".join(["%s%s" % (field, " desc" if descending else "")
+                           for field, descending in keys])
+        signature = s3_unicode("%s|%s" % (query, keystr)).encode("utf-8")
+        return hashlib.md5(signature).hexdigest()
+
+    # -------------------------------------------------------------------------
+    def query(self, start, signature, keys):
+        """
+            Get the seek query for the page starting at start
+
+            @param start: index of the first row of the page
+            @param signature: the signature for the current query and keys
+            @param keys: the key fields
+
+            @return: the seek query, or None if this cursor doesn't
+                     apply to the page
+        """
+
+        values = self.values
+        if self.start is None or self.start != start or \
+           self.signature != signature or \
+           values is None or len(values) != len(keys):
+            return None
+
+        # PostgreSQL sorts NULL after all other values, SQLite and MySQL
+        # before them
+        nulls_largest = current.db._dbname == "postgres"
+
+        query = None
+        equal = None
+        for (field, descending), value in zip(keys, values):
+            nulls_after = nulls_largest != descending
+            if value is None:
+                # Rows beyond NULL
+                if nulls_after:
+                    subquery = None
+                else:
+                    subquery = (field != None)
+            else:
+                if descending:
+                    subquery = (field < value)
+                else:
+                    subquery = (field > value)
+                if nulls_after and not field.notnull and field.type != "id":
+                    subquery |= (field == None)
+            if subquery is not None:
+                if equal is not None:
+                    subquery = equal & subquery
+                if query is None:
+                    query = subquery
+                else:
+                    query |= subquery
+            if equal is not None:
+                equal &= (field == value)
+            else:
+                equal = (field == value)
+        return query
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def encode(cls, start, signature, values):
+        """
+            Encode a cursor token
+
+            @param start: index of the first row of the next page
+            @param signature: the signature for the current query and keys
+            @param values: the key values of the last row of this page
+        """
+
+        values = [cls.encode_value(v) for v in values]
+        return base64.urlsafe_b64encode(json.dumps([start,
+                                                    signature,
+                                                    values]))
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def encode_value(value):
+        """
+            Encode a key value as JSON-serializable object
+
+            @param value: the value
+        """
+
+        if isinstance(value, datetime.datetime):
+            return {"dt": value.strftime("%Y-%m-%dT%H:%M:%S.%f")}
+        elif isinstance(value, datetime.date):
+            return {"d": value.strftime("%Y-%m-%d")}
+        elif isinstance(value, datetime.time):
+            return {"t": value.strftime("%H:%M:%S.%f")}
+        else:
+            return value
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def decode_value(value):
+        """
+            Decode a key value
+
+            @param value: the JSON-decoded value
+        """
+
+        if isinstance(value, dict):
+            strptime = datetime.datetime.strptime
+            try:
+                if "dt" in value:
+                    return strptime(value["dt"], "%Y-%m-%dT%H:%M:%S.%f")
+                elif "d" in value:
+                    return strptime(value["d"], "%Y-%m-%d").date()
+                elif "t" in value:
+                    return strptime(value["t"], "%H:%M:%S.%f").time()
+            except (ValueError, TypeError):
+                pass
+            return None
+        else:
+            return value
+
 # =============================================================================
 class S3FieldSelector(object):
     """ Helper class to construct a resource query """
@@ -4865,13 +5953,78 @@ class S3FieldPath(object):
 
         if not selector:
             raise SyntaxError("Invalid selector: %s" % selector)
+
+        # Look up the selector in the cache
+        key = None
+        if not tail and resource is not None:
+            cache = cls.cache()
+            key = (cls.context(resource), selector)
+            entry = cache.get(key)
+            if entry is not None and entry[0] is resource.table:
+                parser = entry[1]
+                # Make sure the components are attached to this resource
+                for alias in parser.aliases:
+                    if alias not in resource.components and \
+                       alias not in resource.links:
+                        cls._resolve_alias(resource, alias)
+                return parser
+
         tokens = re.split("(\.|\$)", selector)
         if tail:
             tokens.extend(tail)
         parser = cls(resource, None, tokens)
         parser.original = selector
+
+        if key is not None:
+            cache[key] = (resource.table, parser)
         return parser
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def cache():
+        """
+            Get the cache for resolved selectors
+
+            Since the DAL tables are instantiated for every request, the
+            cache is per-request, too (response.s3.selector_cache), and
+            gets cleared whenever the model configuration or components
+            change (see S3Model.configure and S3Model.add_component).
+
+            @return: the cache (dict)
+        """
+
+        s3 = current.response.s3
+        cache = s3.selector_cache
+        if cache is None:
+            cache = s3.selector_cache = {}
+        return cache
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def clear_cache():
+        """ Clear the cache for resolved selectors """
+
+        response = current.response
+        if response and response.s3:
+            response.s3.selector_cache = None
+        return
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def context(resource):
+        """
+            Get the component context of a resource, as part of the
+            cache key for resolved selectors
+
+            @param resource: the S3Resource
+        """
+
+        parent = resource.parent
+        return (resource.tablename,
+                resource.alias,
+                parent.tablename if parent else None,
+                resource.linked is not None)
+
     # -------------------------------------------------------------------------
     def __init__(self, resource, table, tokens):
         """
@@ -4901,6 +6054,9 @@ class S3FieldPath(object):
         self.distinct = False
         self.multiple = True
 
+        # Component aliases resolved against the resource
+        self.aliases = []
+
         head = tokens.pop(0)
         tail = None
 
@@ -4918,6 +6074,7 @@ class S3FieldPath(object):
             context = resource.get_config("context")
             if context and head in context:
                 tail = self.resolve(resource, context[head], tail=tokens)
+                self.aliases.extend(tail.aliases)
             else:
                 # unresolvable
                 pass
@@ -4932,6 +6089,8 @@ class S3FieldPath(object):
                     # a field expression in the component/linked table
                     if not resource:
                         resource = s3db.resource(table, components=[])
+                    elif head not in ("~", resource.alias):
+                        self.aliases.append(head)
                     ktable, j, l, m, d = self._resolve_alias(resource, head)
                     if j is not None and l is not None:
                         self.join[ktable._tablename] = j
@@ -5206,6 +6365,8 @@ class S3ResourceField(object):
         self.field = lf.field
 
         self.virtual = False
+        self.expression = None
+        self.batch = None
         self.represent = s3_unicode
         self.requires = None
 
@@ -5223,6 +6384,8 @@ class S3ResourceField(object):
         elif self.colname:
             self.virtual = True
             self.ftype = "virtual"
+            self.expression = self._sql_expression(self.tname, self.fname)
+            self.batch = self._batch_method(self.tname, self.fname)
         else:
             self.ftype = "context"
 
@@ -5249,6 +6412,85 @@ class S3ResourceField(object):
         self.label = label
         self.show = True
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _sql_expression(tablename, fieldname):
+        """
+            Get the SQL expression declared for a virtual field, which
+            allows filters for this field to be translated into DAL
+            queries rather than being applied to the extracted rows
+
+            SQL expressions for virtual fields can be declared per table:
+
+            s3db.configure(tablename,
+                           virtual_sql = {fieldname: expression})
+
+            where expression can be:
+
+            - the name of a real field which persists the value
+            - a Field or Expression (e.g. a subquery or CASE expression)
+            - a callable taking the Table and returning a Field/Expression
+
+            @param tablename: the table name
+            @param fieldname: the name of the virtual field
+
+            @return: the Field or Expression, or None if not declared
+        """
+
+        s3db = current.s3db
+
+        virtual_sql = s3db.get_config(tablename, "virtual_sql")
+        if not virtual_sql or fieldname not in virtual_sql:
+            return None
+
+        expression = virtual_sql[fieldname]
+        if isinstance(expression, basestring):
+            table = s3db.table(tablename, db_only=True)
+            if table is not None and expression in table.fields:
+                expression = ogetattr(table, expression)
+            else:
+                expression = None
+        elif not isinstance(expression, Expression) and \
+             callable(expression):
+            table = s3db.table(tablename, db_only=True)
+            if table is not None:
+                expression = expression(table)
+            else:
+                expression = None
+        if not isinstance(expression, Expression):
+            expression = None
+        return expression
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _batch_method(tablename, fieldname):
+        """
+            Get the batch method declared for a virtual field, which
+            allows select() to compute the field values for all
+            extracted records at once (e.g. with a single GROUP BY
+            query) instead of calling the virtual field method per row
+
+            Batch methods for virtual fields can be declared per table:
+
+            s3db.configure(tablename,
+                           virtual_batch = {fieldname: method})
+
+            where method is a function taking a list of record IDs and
+            returning a dict {record_id: value}. The per-row method (e.g.
+            Field.Lazy) remains in place for all other purposes.
+
+            @param tablename: the table name
+            @param fieldname: the name of the virtual field
+
+            @return: the batch method, or None if not declared
+        """
+
+        virtual_batch = current.s3db.get_config(tablename, "virtual_batch")
+        if not virtual_batch or fieldname not in virtual_batch:
+            return None
+        method = virtual_batch[fieldname]
+        return method if callable(method) else None
+
     # -------------------------------------------------------------------------
     def __repr__(self):
         """ String representation of this instance """
@@ -5501,7 +6743,7 @@ class S3ResourceQuery(object):
                 lfield = S3ResourceField(resource, l)
         except:
             lfield = None
-        if not lfield or lfield.field is None:
+        if not lfield or lfield.field is None and lfield.expression is None:
             return None, self
         else:
             return self, None
@@ -5566,10 +6808,13 @@ class S3ResourceQuery(object):
             except:
                 return None
             if rfield.virtual:
-                return None
+                if rfield.expression is None:
+                    return None
+                lfield = l.expr(rfield.expression)
             elif not rfield.field:
                 return False
-            lfield = l.expr(rfield.field)
+            else:
+                lfield = l.expr(rfield.field)
         elif isinstance(l, Field):
             lfield = l
         else:
@@ -5579,12 +6824,14 @@ class S3ResourceQuery(object):
                 rfield = S3ResourceField(resource, r.name)
             except:
                 return None
-            rfield = rfield.field
             if rfield.virtual:
-                return None
+                if rfield.expression is None:
+                    return None
+                rfield = r.expr(rfield.expression)
             elif not rfield.field:
                 return False
-            rfield = r.expr(rfield.field)
+            else:
+                rfield = r.expr(rfield.field)
         else:
             rfield = r
 
@@ -6408,6 +7655,9 @@ class S3URLQuery(object):
 class S3ResourceFilter(object):
     """ Class representing a resource filter """
 
+    # Number of rows to retrieve per batch when applying virtual filters
+    BATCH_SIZE = 500
+
     def __init__(self, resource, id=None, uid=None, filter=None, vars=None):
         """
             Constructor
@@ -6436,6 +7686,9 @@ class S3ResourceFilter(object):
         self.multiple = True
         self.distinct = False
 
+        # Filtered by record ID or UID
+        self.restricted = id is not None or uid is not None
+
         self.joins = Storage()
 
         table = resource.table
@@ -6588,7 +7841,17 @@ class S3ResourceFilter(object):
 
                 # Split DAL and virtual filters
                 self.rfltr, self.vfltr = transformed.split(resource)
-                
+
+                if current.response.s3.debug:
+                    from s3utils import s3_debug
+                    rfltr, vfltr = self.rfltr, self.vfltr
+                    s3_debug("S3ResourceFilter %s: SQL filter" %
+                             resource.tablename,
+                             rfltr.represent(resource) if rfltr else None)
+                    s3_debug("S3ResourceFilter %s: Python filter" %
+                             resource.tablename,
+                             vfltr.represent(resource) if vfltr else None)
+
             if self.rfltr:
                 # Add to query
                 query &= self.rfltr.query(self.resource)
@@ -6654,13 +7917,17 @@ class S3ResourceFilter(object):
 
     # -------------------------------------------------------------------------
     @staticmethod
-    def parse_bbox_query(resource, get_vars):
+    def parse_bbox_query(resource, get_vars, intersects=False):
         """
             Generate a Query from a URL boundary box query; supports multiple
             bboxes, but optimised for the usual case of just 1
 
             @param resource: the resource
             @param get_vars: the URL GET vars
+            @param intersects: without spatial database, match features
+                               by their bounds intersecting the bbox
+                               rather than their Lat/Lon inside the bbox
+                               (e.g. for polygons in map tiles)
         """
 
         tablenames = ("gis_location",
@@ -6724,6 +7991,16 @@ class S3ResourceFilter(object):
                                           (gtable.lon < float(maxLon)) & \
                                           (gtable.lat > float(minLat)) & \
                                           (gtable.lat < float(maxLat))
+                            if intersects and "lat_min" in gtable.fields:
+                                # Bounds intersecting the bbox, or Lat/Lon
+                                # inside the bbox if there are no bounds
+                                bounds = (gtable.lat_min <= float(maxLat)) & \
+                                         (gtable.lat_max >= float(minLat)) & \
+                                         (gtable.lon_min <= float(maxLon)) & \
+                                         (gtable.lon_max >= float(minLon))
+                                bbox_filter = bounds | \
+                                              ((gtable.lat_min == None) & \
+                                               bbox_filter)
                         if fname is not None:
                             # Need a join
                             join = (gtable.id == table[fname])
@@ -6780,12 +8057,93 @@ class S3ResourceFilter(object):
                     colnames=rows.colnames, compact=False)
 
     # -------------------------------------------------------------------------
-    def count(self, left=None, distinct=False):
+    def select(self, query, fields,
+               start=None,
+               limit=None,
+               count=False,
+               **attr):
+        """
+            Select rows matching the query and apply the effective virtual
+            filter to them in batches, so that only as many rows as needed
+            for the requested page are retrieved from the database
+
+            @param query: the DAL query
+            @param fields: the fields to select
+            @param start: index of the first matching record to select
+            @param limit: maximum number of records to select
+            @param count: scan all rows to count the matching records
+            @param attr: other keyword arguments for DAL select
+
+            @return: tuple (rows, totalrows), where totalrows is None
+                     unless count is True
+        """
+
+        db = current.db
+        resource = self.resource
+        vfltr = self.get_filter()
+
+        if vfltr is None:
+            limitby = resource.limitby(start=start, limit=limit)
+            rows = db(query).select(limitby=limitby, *fields, **attr)
+            return rows, None
+
+        if start is None or start < 0:
+            start = 0
+        if limit is not None:
+            last = start + max(limit, 0)
+        else:
+            last = None
+
+        # Stable order required for batches
+        table = resource.table
+        orderby = attr.get("orderby")
+        if not orderby:
+            attr["orderby"] = table._id
+        elif isinstance(orderby, (list, tuple)):
+            attr["orderby"] = list(orderby) + [table._id]
+        attr.pop("limitby", None)
+
+        batch_size = self.BATCH_SIZE
+        if last is not None and not count:
+            batch_size = max(batch_size, last)
+
+        result = []
+        append = result.append
+        colnames = None
+        matches = 0
+        offset = 0
+        while True:
+            rows = db(query).select(limitby=(offset, offset + batch_size),
+                                    *fields, **attr)
+            if colnames is None:
+                colnames = rows.colnames
+            for row in rows:
+                success = vfltr(resource, row, virtual=True)
+                if success or success is None:
+                    if matches >= start and (last is None or matches < last):
+                        append(row)
+                    matches += 1
+            if len(rows) < batch_size or \
+               not count and last is not None and matches >= last:
+                break
+            offset += batch_size
+
+        rows = Rows(db, result, colnames=colnames, compact=False)
+        return rows, matches if count else None
+
+    # -------------------------------------------------------------------------
+    def count(self, left=None, distinct=False, approximate=False):
         """
             Get the total number of matching records
 
             @param left: left outer joins
             @param distinct: count only distinct rows
+            @param approximate: allow to return an estimate from the query
+                                planner if the number of records exceeds
+                                the count_estimate threshold
+
+            @return: the number of records (an S3ApproximateCount if
+                     it is an estimate)
         """
 
         distinct |= self.distinct
@@ -6799,19 +8157,44 @@ class S3ResourceFilter(object):
 
         vfltr = self.get_filter()
 
-        if vfltr is None and not distinct:
+        left_joins = S3LeftJoins(tablename, left)
+        left_joins.add(self.get_left_joins())
+        left = left_joins.as_list()
+
+        # Estimate for large tables
+        if approximate and vfltr is None:
+            settings = current.deployment_settings
+            threshold = resource.get_config("count_estimate",
+                        settings.get_ui_count_estimate_threshold())
+            if threshold is not None:
+                estimate = self.estimate(left=left)
+                if estimate is not None and estimate >= threshold:
+                    return S3ApproximateCount(estimate)
+
+        # Look up the number in the cross-request cache
+        cache_key = None
+        if vfltr is None:
+            cache_expire = resource.get_config("select_cache")
+            if cache_expire:
+                cache_key = S3SelectCache.key([tablename] + left_joins.tables,
+                                              "count",
+                                              self.query,
+                                              left,
+                                              distinct)
+                if cache_key:
+                    numrows = S3SelectCache.get(cache_key)
+                    if numrows is not None:
+                        return numrows
 
-            left_joins = S3LeftJoins(resource.tablename, left)
-            left_joins.add(self.get_left_joins())
-            left = left_joins.as_list()
+        if vfltr is None and not distinct:
 
             cnt = table[table._id.name].count()
 
             row = current.db(self.query).select(cnt, left=left).first()
             if row:
-                return row[cnt]
+                numrows = row[cnt]
             else:
-                return 0
+                numrows = 0
 
         else:
             data = resource.select([table._id.name],
@@ -6819,7 +8202,67 @@ class S3ResourceFilter(object):
                                    # any rows but just count, hence:
                                    limit=1,
                                    count=True)
-            return data["numrows"]
+            numrows = data["numrows"]
+
+        if cache_key:
+            S3SelectCache.store(cache_key, numrows, cache_expire)
+        return numrows
+
+    # -------------------------------------------------------------------------
+    def estimate(self, left=None):
+        """
+            Get an estimate for the number of matching records from the
+            query planner (PostgreSQL) or the table statistics (SQLite),
+            without actually counting the records
+
+            @param left: left outer joins (list)
+
+            @return: the estimated number of records, or None if no
+                     estimate is available
+
+            @note: SQLite statistics (from ANALYZE) only give the total
+                   number of rows in the table, so they are only used if
+                   the resource is not filtered at all
+        """
+
+        resource = self.resource
+        table = resource.table
+
+        db = current.db
+        dbname = db._dbname
+
+        estimate = None
+        if dbname == "postgres":
+            sql = db(self.query)._select(table._id, left=left)
+            try:
+                rows = db.executesql("EXPLAIN %s" % sql.rstrip(";"))
+            except:
+                return None
+            if rows:
+                match = re.search(r"rows=(\d+)", rows[0][0])
+                if match:
+                    estimate = int(match.group(1))
+
+        elif dbname == "sqlite":
+            if self.restricted or self.queries or self.filters or \
+               resource.parent or left:
+                return None
+            try:
+                rows = db.executesql("SELECT stat FROM sqlite_stat1 "
+                                     "WHERE tbl=?;",
+                                     placeholders=(resource.tablename,))
+            except:
+                # No statistics available
+                return None
+            for row in rows:
+                try:
+                    numrows = int(row[0].split(" ", 1)[0])
+                except (ValueError, AttributeError):
+                    continue
+                if estimate is None or numrows > estimate:
+                    estimate = numrows
+
+        return estimate
 
     # -------------------------------------------------------------------------
     def __repr__(self):
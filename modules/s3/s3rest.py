@@ -63,7 +63,7 @@ from gluon.dal import Row
 from gluon.storage import Storage
 from gluon.tools import callback
 
-from s3resource import S3Resource
+from s3resource import S3Resource, S3SelectCache
 from s3utils import S3MarkupStripper, s3_unicode
 
 REGEX_FILTER = re.compile(".+\..+|.*\(.+\).*")
@@ -405,6 +405,9 @@ class S3RequestManager(object):
             record = Storage(vars=record, errors=Storage())
         if onaccept:
             callback(onaccept, record, tablename=tablename)
+
+        # Invalidate cached select results
+        S3SelectCache.invalidate(tablename)
         return
 
     # -------------------------------------------------------------------------
@@ -35,6 +35,7 @@ import datetime
 import os
 import re
 import sys
+import threading
 import time
 import HTMLParser
 
@@ -2155,4 +2156,110 @@ def s3_strip_markup(text):
         pass
     return text
 
+# =============================================================================
+class S3LRUCache(object):
+    """
+        Memory-bounded, thread-safe least-recently-used cache
+
+        Entries have a weight (e.g. the number of rows in a cached query
+        result), and the least recently used entries are evicted as soon
+        as the total weight of all entries exceeds the capacity of the
+        cache. Instances of this class can be shared between requests
+        (e.g. as class attribute), but not between processes.
+    """
+
+    def __init__(self, capacity=1000):
+        """
+            Constructor
+
+            @param capacity: the maximum total weight of all entries
+        """
+
+        self.capacity = capacity
+        self.weight = 0
+
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    def get(self, key, default=None):
+        """
+            Get an entry from the cache
+
+            @param key: the key
+            @param default: the default to return if the key is not
+                            in the cache or the entry has expired
+        """
+
+        with self.lock:
+            entries = self.entries
+            entry = entries.pop(key, None)
+            if entry is None:
+                return default
+            value, expires, weight = entry
+            if expires and expires < time.time():
+                self.weight -= weight
+                return default
+            # Re-insert as most recently used
+            entries[key] = entry
+        return value
+
+    # -------------------------------------------------------------------------
+    def set(self, key, value, expire=None, weight=1):
+        """
+            Add an entry to the cache
+
+            @param key: the key
+            @param value: the value
+            @param expire: time in seconds until the entry expires
+            @param weight: the weight of the entry
+        """
+
+        if weight > self.capacity:
+            # Would evict everything else => don't cache
+            self.delete(key)
+            return
+
+        expires = time.time() + expire if expire else None
+        with self.lock:
+            entries = self.entries
+            entry = entries.pop(key, None)
+            if entry is not None:
+                self.weight -= entry[2]
+            entries[key] = (value, expires, weight)
+            self.weight += weight
+            # Evict least recently used entries
+            while self.weight > self.capacity and entries:
+                k, entry = entries.popitem(last=False)
+                self.weight -= entry[2]
+        return
+
+    # -------------------------------------------------------------------------
+    def delete(self, key):
+        """
+            Remove an entry from the cache
+
+            @param key: the key
+        """
+
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is not None:
+                self.weight -= entry[2]
+        return
+
+    # -------------------------------------------------------------------------
+    def clear(self):
+        """ Remove all entries from the cache """
+
+        with self.lock:
+            self.entries.clear()
+            self.weight = 0
+        return
+
+    # -------------------------------------------------------------------------
+    def __len__(self):
+
+        return len(self.entries)
+
 # END =========================================================================
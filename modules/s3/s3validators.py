@@ -462,6 +462,7 @@ class IS_ONE_OF_EMPTY(Validator):
                  multiple=False,
                  zero="",
                  sort=True,
+                 lazy=None,
                  _and=None,
                  ):
         """
@@ -495,6 +496,10 @@ class IS_ONE_OF_EMPTY(Validator):
             @param multiple: allow multiple values (for list:reference types)
             @param zero: add this as label for the None-option (allow selection of "None")
             @param sort: sort options alphabetically by their label
+            @param lazy: do not build the options, but render a lookup
+                         widget in forms (S3OptionsLookupWidget) and validate
+                         values with a single query, None to decide
+                         automatically (settings.ui.lazy_options_threshold)
             @param _and: internal use
         """
 
@@ -559,6 +564,7 @@ class IS_ONE_OF_EMPTY(Validator):
         self.multiple = multiple
         self.zero = zero
         self.sort = sort
+        self.lazy = lazy
         self._and = _and
 
         self.filterby = filterby
@@ -600,11 +606,7 @@ class IS_ONE_OF_EMPTY(Validator):
         dbset = self.dbset
         db = dbset._db
 
-        ktablename = self.ktable
-        if ktablename not in db:
-            table = current.s3db.table(ktablename, db_only=True)
-        else:
-            table = db[ktablename]
+        table = self.lookup_table()
         if table:
             if self.fields == "all":
                 fields = [table[f] for f in table.fields if f not in ("wkt", "the_geom")]
@@ -618,80 +620,22 @@ class IS_ONE_OF_EMPTY(Validator):
                 #dd = dict(orderby=orderby, groupby=groupby, cache=(current.cache.ram, 60))
                 dd = dict(orderby=orderby, groupby=groupby)
 
-                method = "update" if self.updateable else "read"
-                query, left = self.accessible_query(method, table,
-                                                    instance_types=self.instance_types)
-
-                if "deleted" in table:
-                    query &= (table["deleted"] == False)
-
-                # Realms filter?
-                if self.realms:
-                    auth = current.auth
-                    if auth.is_logged_in() and \
-                       auth.get_system_roles().ADMIN in auth.user.realms:
-                        # Admin doesn't filter
-                        pass
-                    else:
-                        query &= auth.permission.realm_query(table, self.realms)
+                query, left = self.lookup_query(table)
 
                 all_fields = [str(f) for f in fields]
 
-                filterby = self.filterby
-                if filterby and filterby in table:
-                    filter_opts = self.filter_opts
-                    if filter_opts:
-                        if None in filter_opts:
-                            # Needs special handling (doesn't show up in 'belongs')
-                            _query = (table[filterby] == None)
-                            filter_opts = [f for f in filter_opts if f is not None]
-                            if filter_opts:
-                                _query = _query | (table[filterby].belongs(filter_opts))
-                            query &= _query
-                        else:
-                            query &= (table[filterby].belongs(filter_opts))
-                    if not self.orderby:
+                # Order by the filter fields
+                for filterby in (self.filterby, self.not_filterby):
+                    if filterby and filterby in table and not self.orderby:
                         filterby_field = table[filterby]
                         dd.update(orderby=filterby_field)
                         if str(filterby_field) not in all_fields:
                             fields.append(filterby_field)
                             all_fields.append(str(filterby_field))
 
-                not_filterby = self.not_filterby
-                if not_filterby and not_filterby in table:
-                    not_filter_opts = self.not_filter_opts
-                    if not_filter_opts:
-                        if None in not_filter_opts:
-                            # Needs special handling (doesn't show up in 'belongs')
-                            _query = (table[not_filterby] == None)
-                            not_filter_opts = [f for f in not_filter_opts if f is not None]
-                            if not_filter_opts:
-                                _query = _query | (table[not_filterby].belongs(not_filter_opts))
-                            query &= (~_query)
-                        else:
-                            query &= (~(table[not_filterby].belongs(not_filter_opts)))
-                    if not self.orderby:
-                        filterby_field = table[not_filterby]
-                        dd.update(orderby=filterby_field)
-                        if str(filterby_field) not in all_fields:
-                            fields.append(filterby_field)
-                            all_fields.append(str(filterby_field))
-
                 if left is not None:
-                    if self.left is not None:
-                        if not isinstance(left, list):
-                            left = [left]
-                        ljoins = [str(join) for join in self.left]
-                        for join in left:
-                            ljoin = str(join)
-                            if ljoin not in ljoins:
-                                self.left.append(join)
-                                ljoins.append(ljoin)
-                    else:
-                        self.left = left
-                if self.left is not None:
-                    dd.update(left=self.left)
-                    
+                    dd.update(left=left)
+
                 # Make sure we have all ORDERBY fields in the query
                 # (otherwise postgresql will complain)
                 fieldnames = [str(f) for f in fields]
@@ -711,36 +655,13 @@ class IS_ONE_OF_EMPTY(Validator):
                 dd = dict(orderby=orderby)
                 records = dbset.select(db[self.ktable].ALL, **dd)
             self.theset = [str(r[self.kfield]) for r in records]
-            label = self.label
-            try:
-                # Is callable
-                if hasattr(label, "bulk"):
-                    # S3Represent => use bulk option
-                    d = label.bulk(None,
-                                   rows=records,
-                                   list_type=False,
-                                   show_link=False)
-                    labels = [d.get(r[self.kfield], d[None]) for r in records]
-                else:
-                    # Standard representation function
-                    labels = map(label, records)
-            except TypeError:
-                if isinstance(label, str):
-                    labels = map(lambda r: label % dict(r), records)
-                elif isinstance(label, (list, tuple)):
-                    labels = map(lambda r: \
-                                 " ".join([r[l] for l in label if l in r]),
-                                 records)
-                elif "name" in table:
-                    labels = map(lambda r: r.name, records)
-                else:
-                    labels = map(lambda r: r[self.kfield], records)
+            labels = self.represent_rows(table, records)
             self.labels = labels
 
             if labels and self.sort:
 
                 items = zip(self.theset, self.labels)
-                
+
                 # Alternative variant that handles generator objects,
                 # doesn't seem necessary, retained here just in case:
                 #orig_labels = self.labels
@@ -762,6 +683,212 @@ class IS_ONE_OF_EMPTY(Validator):
             self.theset = None
             self.labels = None
 
+    # -------------------------------------------------------------------------
+    def lookup_table(self):
+        """
+            Get the referenced table
+
+            @return: the Table, or None if not defined
+        """
+
+        db = self.dbset._db
+
+        ktablename = self.ktable
+        if ktablename not in db:
+            table = current.s3db.table(ktablename, db_only=True)
+        else:
+            table = db[ktablename]
+        return table
+
+    # -------------------------------------------------------------------------
+    def lookup_query(self, table):
+        """
+            Get the query for the selectable records in the referenced
+            table (accessible, not deleted, realm and filterby rules)
+
+            @param table: the referenced table
+
+            @return: tuple (query, left)
+        """
+
+        method = "update" if self.updateable else "read"
+        query, left = self.accessible_query(method, table,
+                                            instance_types=self.instance_types)
+
+        if "deleted" in table:
+            query &= (table["deleted"] == False)
+
+        # Realms filter?
+        if self.realms:
+            auth = current.auth
+            if auth.is_logged_in() and \
+               auth.get_system_roles().ADMIN in auth.user.realms:
+                # Admin doesn't filter
+                pass
+            else:
+                query &= auth.permission.realm_query(table, self.realms)
+
+        filterby = self.filterby
+        if filterby and filterby in table:
+            filter_opts = self.filter_opts
+            if filter_opts:
+                if None in filter_opts:
+                    # Needs special handling (doesn't show up in 'belongs')
+                    _query = (table[filterby] == None)
+                    filter_opts = [f for f in filter_opts if f is not None]
+                    if filter_opts:
+                        _query = _query | (table[filterby].belongs(filter_opts))
+                    query &= _query
+                else:
+                    query &= (table[filterby].belongs(filter_opts))
+
+        not_filterby = self.not_filterby
+        if not_filterby and not_filterby in table:
+            not_filter_opts = self.not_filter_opts
+            if not_filter_opts:
+                if None in not_filter_opts:
+                    # Needs special handling (doesn't show up in 'belongs')
+                    _query = (table[not_filterby] == None)
+                    not_filter_opts = [f for f in not_filter_opts if f is not None]
+                    if not_filter_opts:
+                        _query = _query | (table[not_filterby].belongs(not_filter_opts))
+                    query &= (~_query)
+                else:
+                    query &= (~(table[not_filterby].belongs(not_filter_opts)))
+
+        if left is not None:
+            if self.left is not None:
+                if not isinstance(left, list):
+                    left = [left]
+                ljoins = [str(join) for join in self.left]
+                for join in left:
+                    ljoin = str(join)
+                    if ljoin not in ljoins:
+                        self.left.append(join)
+                        ljoins.append(ljoin)
+            else:
+                self.left = left
+
+        return query, self.left
+
+    # -------------------------------------------------------------------------
+    def represent_rows(self, table, records):
+        """
+            Get the option labels for records of the referenced table
+
+            @param table: the referenced table
+            @param records: the records (Rows)
+
+            @return: list of labels (in the order of the records)
+        """
+
+        label = self.label
+        try:
+            # Is callable
+            if hasattr(label, "bulk"):
+                # S3Represent => use bulk option
+                d = label.bulk(None,
+                               rows=records,
+                               list_type=False,
+                               show_link=False)
+                labels = [d.get(r[self.kfield], d[None]) for r in records]
+            else:
+                # Standard representation function
+                labels = map(label, records)
+        except TypeError:
+            if isinstance(label, str):
+                labels = map(lambda r: label % dict(r), records)
+            elif isinstance(label, (list, tuple)):
+                labels = map(lambda r: \
+                             " ".join([r[l] for l in label if l in r]),
+                             records)
+            elif "name" in table:
+                labels = map(lambda r: r.name, records)
+            else:
+                labels = map(lambda r: r[self.kfield], records)
+        return labels
+
+    # -------------------------------------------------------------------------
+    def is_lazy(self):
+        """
+            Check whether to use a lookup widget rather than building
+            the options (as configured for this validator, or if there
+            are more selectable records than the lazy options threshold)
+
+            @return: True|False
+        """
+
+        lazy = self.lazy
+        if lazy is None:
+            lazy = False
+            threshold = current.deployment_settings.get_ui_lazy_options_threshold()
+            table = self.lookup_table()
+            if threshold and table:
+                query, left = self.lookup_query(table)
+                rows = self.dbset(query).select(table._id,
+                                                left=left,
+                                                distinct=True,
+                                                limitby=(0, threshold + 1))
+                lazy = len(rows) > threshold
+            # Remember the result for this request
+            self.lazy = lazy
+        return lazy
+
+    # -------------------------------------------------------------------------
+    def lookup(self, term, limit=20):
+        """
+            Look up the selectable records matching a search term
+            (for S3OptionsLookupWidget)
+
+            @param term: the search term (matched against the label fields)
+            @param limit: the maximum number of items to return
+
+            @return: list of tuples (key, label), sorted by label
+        """
+
+        table = self.lookup_table()
+        if not table:
+            return []
+
+        query, left = self.lookup_query(table)
+
+        if self.fields == "all":
+            fields = [table[f] for f in table.fields
+                      if f not in ("wkt", "the_geom")]
+        else:
+            fieldnames = [f.split(".")[1] if "." in f else f
+                          for f in self.fields]
+            fields = [table[f] for f in fieldnames if f in table.fields]
+
+        term = s3_unicode(term).lower().strip() if term else None
+        if term:
+            if self.fields == "all" and "name" in table.fields:
+                search_fields = [table.name]
+            else:
+                search_fields = [f for f in fields
+                                 if f.type in ("string", "text")]
+                if not search_fields and "name" in table.fields:
+                    search_fields = [table.name]
+            if not search_fields:
+                return []
+            pattern = "%%%s%%" % term.encode("utf-8")
+            q = None
+            for field in search_fields:
+                if q is None:
+                    q = field.lower().like(pattern)
+                else:
+                    q |= field.lower().like(pattern)
+            query &= q
+
+        records = self.dbset(query).select(distinct=True,
+                                           left=left,
+                                           limitby=(0, limit),
+                                           *fields)
+        keys = [str(r[self.kfield]) for r in records]
+        items = zip(keys, self.represent_rows(table, records))
+        items.sort(key=lambda item: s3_unicode(item[1]).lower())
+        return items
+
     # -------------------------------------------------------------------------
     @classmethod
     def accessible_query(cls, method, table, instance_types=None):
@@ -853,6 +980,11 @@ class IS_ONE_OF_EMPTY(Validator):
                         return (values, None)
                     else:
                         return (value, self.error_message)
+                elif self.lazy:
+                    if self.validate_keys(values):
+                        return (values, None)
+                    else:
+                        return (value, self.error_message)
                 else:
                     field = table[self.kfield]
                     query = None
@@ -874,6 +1006,12 @@ class IS_ONE_OF_EMPTY(Validator):
                         return self._and(value)
                     else:
                         return (value, None)
+            elif self.lazy:
+                if value not in (None, "") and self.validate_keys([value]):
+                    if self._and:
+                        return self._and(value)
+                    else:
+                        return (value, None)
             else:
                 values = [value]
                 query = None
@@ -896,6 +1034,39 @@ class IS_ONE_OF_EMPTY(Validator):
 
         return (value, self.error_message)
 
+    # -------------------------------------------------------------------------
+    def validate_keys(self, values):
+        """
+            Check that all values are keys of selectable records (same
+            rules as for the lookup), using a single query rather than
+            building the set of options
+
+            @param values: list of key values
+
+            @return: True if all values are valid, otherwise False
+        """
+
+        keys = set(str(v) for v in values)
+        if not keys:
+            return True
+
+        table = self.lookup_table()
+        if not table:
+            return False
+        field = table[self.kfield]
+
+        query, left = self.lookup_query(table)
+        if len(keys) == 1:
+            query &= (field == list(keys)[0])
+        else:
+            query &= (field.belongs(keys))
+
+        rows = self.dbset(query).select(field,
+                                        left=left,
+                                        distinct=True,
+                                        limitby=(0, len(keys)))
+        return len(rows) == len(keys)
+
 
 # =============================================================================
 class IS_ONE_OF(IS_ONE_OF_EMPTY):
@@ -56,6 +56,7 @@ __all__ = ["S3ACLWidget",
            "S3LocationSelectorWidget",
            "S3LocationSelectorWidget2",
            "S3MultiSelectWidget",
+           "S3OptionsLookupWidget",
            "S3OrganisationAutocompleteWidget",
            "S3OrganisationHierarchyWidget",
            "S3PersonAutocompleteWidget",
@@ -72,6 +73,7 @@ __all__ = ["S3ACLWidget",
            "s3_comments_widget",
            "s3_grouped_checkboxes_widget",
            "s3_richtext_widget",
+           "options_lookup",
            "search_ac",
            ]
 
@@ -4601,6 +4603,92 @@ class S3MultiSelectWidget(MultipleOptionsWidget):
                        requires = field.requires
                        )
 
+# =============================================================================
+class S3OptionsLookupWidget(FormWidget):
+    """
+        Renders an IS_ONE_OF reference field as an INPUT field with
+        AJAX Autocomplete against the options_lookup method, i.e. only
+        the current value gets rendered, and further options are looked
+        up as the user types (for lazy IS_ONE_OF validators with too
+        many options for a dropdown)
+    """
+
+    def __init__(self,
+                 delay = 450,       # milliseconds
+                 min_length = 2,
+                 limit = 20):
+
+        self.delay = delay
+        self.min_length = min_length
+        self.limit = limit
+
+    def __call__(self, field, value, **attributes):
+
+        default = dict(
+            _type = "text",
+            value = (value != None and str(value)) or "",
+            )
+        attr = StringWidget._attributes(field, default, **attributes)
+
+        # Hide the real field
+        attr["_class"] = attr["_class"] + " hide"
+
+        if "_id" in attr:
+            real_input = attr["_id"]
+        else:
+            real_input = str(field).replace(".", "_")
+        dummy_input = "dummy_%s" % real_input
+
+        if value:
+            try:
+                value = long(value)
+            except ValueError:
+                pass
+            text = s3_unicode(field.represent(value))
+            if "<" in text:
+                text = s3_strip_markup(text)
+            represent = text
+        else:
+            represent = ""
+
+        request = current.request
+        url = URL(c=request.controller,
+                  f=request.function,
+                  args=["lookup_options"],
+                  vars={"field": str(field), "limit": self.limit},
+                  extension="json")
+
+        script = \
+'''$('#%(dummy)s').autocomplete({
+ source:'%(url)s',
+ delay:%(delay)s,
+ minLength:%(min_length)s,
+ search:function(){$('#%(dummy)s_throbber').removeClass('hide').show()},
+ response:function(){$('#%(dummy)s_throbber').hide()},
+ focus:function(event,ui){$('#%(dummy)s').val(ui.item.label);return false},
+ select:function(event,ui){
+  $('#%(dummy)s').val(ui.item.label)
+  $('#%(real)s').val(ui.item.id).change()
+  return false
+ }
+}).change(function(){
+ if(!$(this).val()){$('#%(real)s').val('').change()}
+})''' % dict(dummy=dummy_input,
+              real=real_input,
+              url=url,
+              delay=self.delay,
+              min_length=self.min_length)
+
+        current.response.s3.jquery_ready.append(script)
+        return TAG[""](INPUT(_id=dummy_input,
+                             _class="string",
+                             _value=represent.encode("utf-8")),
+                       DIV(_id="%s_throbber" % dummy_input,
+                           _class="throbber hide"),
+                       INPUT(**attr),
+                       requires = field.requires
+                       )
+
 # =============================================================================
 class S3OptionsMatrixWidget(FormWidget):
     """
@@ -5838,4 +5926,67 @@ def search_ac(r, **attr):
 
     return output
 
+# =============================================================================
+def options_lookup(r, **attr):
+    """
+        JSON lookup method for S3OptionsLookupWidget: searches the
+        selectable options of an IS_ONE_OF reference field in the
+        resource table (or one of its component tables), applying the
+        same rules as the validator (accessible_query, realms, filterby)
+
+        @param r: the S3Request
+        @param attr: request attributes
+    """
+
+    _vars = current.request.get_vars
+
+    # JQueryUI Autocomplete uses "term"
+    term = _vars.term or _vars.value or None
+
+    requires = None
+    fieldname = _vars.field
+    if fieldname and "." in fieldname:
+        tablename, fieldname = fieldname.split(".", 1)
+        resource = r.resource
+        if tablename == resource.tablename:
+            table = resource.table
+        else:
+            table = None
+            for component in resource.components.values():
+                if component.tablename == tablename:
+                    table = component.table
+                    break
+        if table is not None and fieldname in table.fields:
+            requires = table[fieldname].requires
+            if isinstance(requires, (list, tuple)):
+                requires = requires[0] if requires else None
+            if isinstance(requires, IS_EMPTY_OR):
+                requires = requires.other
+            if not isinstance(requires, IS_ONE_OF_EMPTY):
+                requires = None
+
+    if requires is None:
+        output = current.xml.json_message(
+                    False,
+                    400,
+                    "Invalid field: require a reference field of the resource")
+        raise HTTP(400, body=output)
+
+    MAX_SEARCH_RESULTS = current.deployment_settings.get_search_max_results()
+    try:
+        limit = int(_vars.limit or 20)
+    except ValueError:
+        limit = 20
+    limit = max(1, min(limit, MAX_SEARCH_RESULTS))
+
+    items = []
+    for key, label in requires.lookup(term, limit=limit):
+        label = s3_unicode(label)
+        if "<" in label:
+            label = s3_strip_markup(label)
+        items.append({"id": key, "label": label})
+
+    current.response.headers["Content-Type"] = "application/json"
+    return json.dumps(items)
+
 # END =========================================================================
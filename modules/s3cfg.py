@@ -32,6 +32,8 @@
 
 __all__ = ["S3Config"]
 
+import os
+
 try:
     # Python 2.7
     from collections import OrderedDict
@@ -345,6 +347,21 @@ class S3Config(Storage):
         """
         return self.auth.get("person_realm_member_org", False)
 
+    def get_auth_realm_cache(self):
+        """
+            Cache the realms and delegations of users between requests
+            (security policy 6 and above):
+                - "ram" to cache per process
+                - "memcache" to share the cache between instances (requires
+                  session_memcache)
+                - False to compute them from the OU hierarchy in every request
+        """
+        return self.auth.get("realm_cache", False)
+
+    def get_auth_realm_cache_size(self):
+        """ Maximum number of users in the per-process realm cache """
+        return self.auth.get("realm_cache_size", 1000)
+
     def get_auth_role_modules(self):
         """
             Which modules are includes in the Role Manager
@@ -390,6 +407,23 @@ class S3Config(Storage):
         return self.security.get("audit_read", False)
     def get_security_audit_write(self):
         return self.security.get("audit_write", False)
+    def get_security_audit_mode(self):
+        """
+            How to write audit records:
+                "sync" = immediately (default)
+                "batch" = all records of a request in one multi-row insert
+                          at the end of the request
+                "spool" = append to a local log file, which is moved into
+                          the audit table by a scheduler task
+        """
+        return self.security.get("audit_mode", "sync")
+    def get_security_audit_spool(self):
+        """
+            The log file to spool audit records to (audit_mode "spool")
+        """
+        return self.security.get("audit_spool",
+                                 os.path.join(current.request.folder,
+                                              "uploads", "audit.spool"))
     def get_security_policy(self):
         " Default is Simple Security Policy "
         return self.security.get("policy", 1)
@@ -400,6 +434,13 @@ class S3Config(Storage):
             False = owned by any authenticated user
         """
         return self.security.get("strict_ownership", True)
+    def get_security_acl_cache(self):
+        """
+            Resolve ACL lookups from a process-wide index of all ACLs
+            (reloaded whenever the ACLs have changed) rather than querying
+            the ACL table for each permission check
+        """
+        return self.security.get("acl_cache", True)
     def get_security_map(self):
         return self.security.get("map", False)
 
@@ -461,6 +502,53 @@ class S3Config(Storage):
         """
         return self.base.get("session_memcache", False)
 
+    def get_base_auto_indexes(self):
+        """
+            Create indexes for all foreign keys, deleted flags, modified_on
+            and ownership fields (in addition to the declared indexes, see
+            S3Model.create_indexes)
+        """
+        return self.base.get("auto_indexes", True)
+
+    def get_base_index_advisor(self):
+        """
+            Report filters and orderbys of S3Resource.select which lack a
+            supporting database index (to stderr, once per query shape)
+        """
+        return self.base.get("index_advisor", False)
+
+    def get_base_journal(self):
+        """
+            Record all creates, updates and deletes in the change journal
+            (S3Journal), for incremental sync, notifications and cache
+            invalidation
+        """
+        return self.base.get("journal", False)
+
+    def get_base_journal_retention(self):
+        """
+            Number of days to keep change journal entries, None to
+            keep them forever
+        """
+        return self.base.get("journal_retention", 30)
+
+    def get_base_select_cache(self):
+        """
+            Backend for the results cache of S3Resource.select (for tables
+            configured with select_cache):
+                - "ram" to cache per process
+                - "memcache" to share the cache between instances (requires
+                  session_memcache)
+                - False to disable the results cache
+        """
+        return self.base.get("select_cache", "ram")
+
+    def get_base_select_cache_size(self):
+        """
+            Maximum total number of rows in the per-process results cache
+        """
+        return self.base.get("select_cache_size", 10000)
+
     def get_base_solr_url(self):
         """
             URL to connect to solr server
@@ -574,6 +662,13 @@ class S3Config(Storage):
         """
         return self.gis.get("check_within_parent_boundaries", True)
 
+    def get_gis_cluster_limit(self):
+        """
+            Number of Features above which Point Layers get clustered on
+            the server (see S3MapClusters), None to cluster in the browser
+        """
+        return self.gis.get("cluster_limit", None)
+
     def get_gis_countries(self):
         """
             Which country codes should be accessible to the location selector?
@@ -737,6 +832,13 @@ class S3Config(Storage):
         """
         return self.gis.get("simplify_tolerance", 0.01)
 
+    def get_gis_feature_tiles(self):
+        """
+            Should Feature Layers with Polygons be loaded as tiles, with
+            the geometries simplified per zoom level (see S3MapTiles)?
+        """
+        return self.gis.get("feature_tiles", False)
+
     def get_gis_scaleline(self):
         """
             Should the Map display a ScaleLine control?
@@ -1104,6 +1206,33 @@ class S3Config(Storage):
         """
         return self.ui.get("report_auto_submit", 0)
 
+    def get_ui_count_estimate_threshold(self):
+        """
+            Number of records above which list views show an estimated
+            number of records ("about N records") from the database query
+            planner rather than counting them exactly, None to always
+            count exactly (can be overridden per table with the
+            "count_estimate" table setting)
+        """
+        return self.ui.get("count_estimate_threshold", None)
+
+    def get_ui_menu_cache(self):
+        """
+            Cache the rendered options menus process-wide, for all users
+            with the same roles and realms (re-rendered when the ACLs
+            change)
+        """
+        return self.ui.get("menu_cache", True)
+
+    def get_ui_lazy_options_threshold(self):
+        """
+            Number of selectable records above which IS_ONE_OF reference
+            fields render a search-as-you-type lookup widget instead of
+            a dropdown with all options, None to always render dropdowns
+            (can be overridden per field with IS_ONE_OF(lazy=True|False))
+        """
+        return self.ui.get("lazy_options_threshold", None)
+
     # =========================================================================
     # Messaging
     # -------------------------------------------------------------------------
@@ -69,6 +69,7 @@ class S3LocationModel(S3Model):
     """
 
     names = ["gis_location",
+             "gis_location_simplified",
              #"gis_location_error",
              "gis_location_id",
              "gis_country_id",
@@ -224,6 +225,14 @@ class S3LocationModel(S3Model):
                                    represent = lambda v: v or NONE,
                                    readable=False,
                                    writable=False),
+                             # Bounds: spatial pre-filter for
+                             # gis.query_features_by_bbox
+                             indexes = ["name",
+                                        "lat_min",
+                                        "lat_max",
+                                        "lon_min",
+                                        "lon_max",
+                                        ],
                              *meta_spatial_fields)
 
         # Default the owning role to Authenticated. This can be used to allow the site
@@ -332,6 +341,24 @@ class S3LocationModel(S3Model):
         add_component("org_site",
                       gis_location="location_id")
 
+        # ---------------------------------------------------------------------
+        # Simplified Geometries
+        #
+        # - the LineStrings/Polygons of Locations simplified at the
+        #   tolerances in s3gis.SIMPLIFY_TOLERANCES, to avoid simplifying
+        #   them at runtime for map layers and exports
+        # - maintained by gis_location_onaccept, rebuilt by
+        #   GIS.update_simplified (task gis_update_simplified)
+        #
+        tablename = "gis_location_simplified"
+        self.define_table(tablename,
+                          Field("location_id", "integer"),
+                          Field("tolerance", "double"),
+                          Field("wkt", "text"),
+                          Field("geojson", "text"),
+                          indexes = ["location_id"],
+                          )
+
         # ---------------------------------------------------------------------
         # Error
         # - needed for COT support
@@ -433,6 +460,17 @@ class S3LocationModel(S3Model):
                                       ))
             current.s3task.async("gis_update_location_tree",
                                  args=[feature])
+
+        if vars.get("wkt") and not auth.rollback:
+            if str(vars.get("gis_feature_type")) in ("2", "3", "5", "6", "7"):
+                # Update the Simplified Geometries (async if-possible)
+                current.s3task.async("gis_update_simplified",
+                                     args=[id])
+            else:
+                # Remove outdated Simplified Geometries
+                db = current.db
+                table = db.gis_location_simplified
+                db(table.location_id == id).delete()
         return
 
     # -------------------------------------------------------------------------
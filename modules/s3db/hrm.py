@@ -2302,6 +2302,9 @@ class S3HRSkillModel(S3Model):
                   onaccept=hrm_training_onaccept,
                   ondelete=hrm_training_onaccept,
                   search_method=training_search,
+                  virtual_batch={"job_title": hrm_training_job_titles,
+                                 "organisation": hrm_training_organisations,
+                                 },
                   deduplicate=self.hrm_training_duplicate,
                   report_options=Storage(
                     search=[
@@ -4226,6 +4229,41 @@ def hrm_training_job_title(row):
 
     return current.messages["NONE"]
     
+# -------------------------------------------------------------------------
+def hrm_training_job_titles(ids):
+    """
+        Which Job Titles(s) the trainees are active with
+        (batch version of hrm_training_job_title)
+
+        @param ids: the hrm_training record IDs
+        @return: dict {training_id: job titles}
+    """
+
+    s3db = current.s3db
+    ttable = s3db.hrm_training
+    table = s3db.hrm_human_resource
+    jtable = s3db.hrm_job_title
+    query = (ttable.id.belongs(ids)) & \
+            (table.person_id == ttable.person_id) & \
+            (table.status != 2) & \
+            (table.job_title_id == jtable.id)
+    rows = current.db(query).select(ttable.id,
+                                    jtable.name,
+                                    distinct=True,
+                                    orderby=jtable.name)
+    jobs = {}
+    for row in rows:
+        training_id = row[ttable.id]
+        if training_id in jobs:
+            jobs[training_id].append(row[jtable.name])
+        else:
+            jobs[training_id] = [row[jtable.name]]
+
+    NONE = current.messages["NONE"]
+    return dict((training_id, ", ".join(jobs[training_id])
+                              if training_id in jobs else NONE)
+                for training_id in ids)
+
 # =============================================================================
 def hrm_training_organisation(row):
     """
@@ -4258,6 +4296,50 @@ def hrm_training_organisation(row):
 
     return current.messages["NONE"]
     
+# -------------------------------------------------------------------------
+def hrm_training_organisations(ids):
+    """
+        Which Organisation(s)/Branch(es) the trainees are actively
+        affiliated with (batch version of hrm_training_organisation)
+
+        @param ids: the hrm_training record IDs
+        @return: dict {training_id: organisations}
+    """
+
+    s3db = current.s3db
+    ttable = s3db.hrm_training
+    table = s3db.hrm_human_resource
+    query = (ttable.id.belongs(ids)) & \
+            (table.person_id == ttable.person_id) & \
+            (table.status != 2)
+    rows = current.db(query).select(ttable.id,
+                                    table.organisation_id,
+                                    distinct=True)
+    orgs = {}
+    for row in rows:
+        training_id = row[ttable.id]
+        organisation_id = row[table.organisation_id]
+        if training_id in orgs:
+            orgs[training_id].append(organisation_id)
+        else:
+            orgs[training_id] = [organisation_id]
+
+    NONE = current.messages["NONE"]
+    if orgs:
+        represent = s3db.org_OrganisationRepresent()
+        org_ids = set()
+        for organisation_ids in orgs.values():
+            org_ids.update(organisation_ids)
+        labels = represent.bulk(list(org_ids), show_link=False)
+    output = {}
+    for training_id in ids:
+        if training_id in orgs:
+            output[training_id] = ", ".join([s3_unicode(labels.get(o, NONE))
+                                             for o in orgs[training_id]])
+        else:
+            output[training_id] = NONE
+    return output
+
 # =============================================================================
 def hrm_rheader(r, tabs=[],
                 profile = False):
@@ -75,6 +75,9 @@ __all__ = ["S3PersonEntity",
            "pr_get_descendants",
            "pr_ancestors",
            "pr_descendants",
+           # Ancestry
+           "pr_update_ancestry",
+           "pr_rebuild_ancestry",
            # Internal Path Tools
            "pr_rebuild_path",
            "pr_role_rebuild_path",
@@ -112,6 +115,7 @@ class S3PersonEntity(S3Model):
 
     names = ["pr_pentity",
              "pr_affiliation",
+             "pr_ancestry",
              "pr_person_user",
              "pr_role",
              "pr_role_types",
@@ -312,7 +316,8 @@ class S3PersonEntity(S3Model):
 
         # Resource configuration
         configure(tablename,
-                  onvalidation=self.pr_role_onvalidation)
+                  onvalidation=self.pr_role_onvalidation,
+                  onaccept=self.pr_role_onaccept)
 
         # Reusable fields
         role_id = S3ReusableField("role_id", table,
@@ -362,6 +367,23 @@ class S3PersonEntity(S3Model):
                   onaccept=self.pr_affiliation_onaccept,
                   ondelete=self.pr_affiliation_ondelete)
 
+        # ---------------------------------------------------------------------
+        # Ancestry
+        # - closure table of the OU hierarchy: one record per pair of
+        #   descendant (pe_id) and ancestor, with the shortest distance
+        #   between them (depth 1 = immediate OU parent)
+        # - maintained by pr_update_ancestry, rebuilt by pr_rebuild_ancestry
+        #
+        tablename = "pr_ancestry"
+        table = define_table(tablename,
+                             Field("pe_id", "integer"),
+                             Field("ancestor", "integer"),
+                             Field("depth", "integer"),
+                             indexes = ["pe_id",
+                                        "ancestor",
+                                        ],
+                             )
+
         # ---------------------------------------------------------------------
         # Pass names back to global scope (s3.*)
         #
@@ -565,6 +587,26 @@ class S3PersonEntity(S3Model):
                 current.s3db.pr_role_rebuild_path(role_id, clear=True)
         return
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def pr_role_onaccept(form):
+        """
+            Update the ancestry of all affiliates of a role (role type or
+            role owner may have changed)
+
+            @param form: the CRUD form
+        """
+
+        role_id = form.vars.id
+        if role_id:
+            atable = current.s3db.pr_affiliation
+            query = (atable.role_id == role_id) & \
+                    (atable.deleted != True)
+            rows = current.db(query).select(atable.pe_id)
+            if rows:
+                pr_update_ancestry([row.pe_id for row in rows])
+        return
+
     # -------------------------------------------------------------------------
     @staticmethod
     def pr_pentity_onaccept(form):
@@ -670,6 +712,12 @@ class S3OrgAuthModel(S3Model):
                                         ondelete="CASCADE"),
                                   *s3_meta_fields())
 
+        # Delegations change the realms of users
+        invalidate = lambda *args: S3RealmCache.invalidate()
+        self.configure(tablename,
+                       onaccept=invalidate,
+                       ondelete=invalidate)
+
         # ---------------------------------------------------------------------
         return dict()
 
@@ -795,6 +843,10 @@ class S3PersonModel(S3Model):
                                                                    T("By selecting this you agree that we may contact you."))),
                                    ),
                              s3_comments(),
+                             indexes = ["first_name",
+                                        "middle_name",
+                                        "last_name",
+                                        ],
                              *s3_meta_fields())
 
         # CRUD Strings
@@ -4995,7 +5047,16 @@ def pr_define_role(pe_id,
             if str(role_type) != str(OU):
                 data["path"] = None
             s3db.pr_role_rebuild_path(duplicate.id, clear=True)
-        duplicate.update_record(**data)
+            duplicate.update_record(**data)
+            # Update the ancestry of the affiliates
+            atable = s3db.pr_affiliation
+            query = (atable.role_id == duplicate.id) & \
+                    (atable.deleted != True)
+            rows = current.db(query).select(atable.pe_id)
+            if rows:
+                pr_update_ancestry([row.pe_id for row in rows])
+        else:
+            duplicate.update_record(**data)
         record_id = duplicate.id
     else:
         record_id = rtable.insert(**data)
@@ -5218,40 +5279,16 @@ def pr_get_path(pe_id):
 def pr_get_ancestors(pe_id):
     """
         Find all ancestor entities of a person entity in the OU hierarchy
-        (performs a path lookup where paths are available, otherwise rebuilds
-        paths).
+        (ancestry lookup).
 
         @param pe_id: the person entity ID
 
-        @return: a list of PE-IDs
+        @return: a list of PE-IDs (as strings)
     """
 
-    s3db = current.s3db
-    atable = s3db.pr_affiliation
-    rtable = s3db.pr_role
-    query = (atable.deleted != True) & \
-            (atable.role_id == rtable.id) & \
-            (atable.pe_id == pe_id) & \
-            (rtable.deleted != True) & \
-            (rtable.role_type == OU)
-
-    roles = current.db(query).select(rtable.id,
-                                     rtable.pe_id,
-                                     rtable.path,
-                                     rtable.role_type)
-    paths = []
-    append = paths.append
-    for role in roles:
-        path = S3MultiPath([role.pe_id])
-        if role.path is None:
-            ppath = pr_role_rebuild_path(role)
-        else:
-            ppath = S3MultiPath(role.path)
-        path.extend(role.pe_id, ppath, cut=pe_id)
-        append(path)
-    ancestors = S3MultiPath.all_nodes(paths)
-
-    return ancestors
+    table = pr_ancestry_table()
+    rows = current.db(table.pe_id == pe_id).select(table.ancestor)
+    return [str(row.ancestor) for row in rows]
 
 # =============================================================================
 def pr_realm(entity):
@@ -5264,16 +5301,11 @@ def pr_realm(entity):
     if not entity:
         return []
 
-    s3db = current.s3db
-    atable = s3db.pr_affiliation
-    rtable = s3db.pr_role
-    query = (atable.deleted != True) & \
-            (atable.role_id == rtable.id) & \
-            (atable.pe_id == entity) & \
-            (rtable.deleted != True) & \
-            (rtable.role_type == OU)
-    rows = current.db(query).select(rtable.pe_id)
-    realm = [row.pe_id for row in rows]
+    table = pr_ancestry_table()
+    query = (table.pe_id == entity) & \
+            (table.depth == 1)
+    rows = current.db(query).select(table.ancestor)
+    realm = [row.ancestor for row in rows]
     return realm
 
 # =============================================================================
@@ -5329,201 +5361,313 @@ def pr_realm_users(realm, roles=None, role_types=OU):
 def pr_ancestors(entities):
     """
         Find all ancestor entities of the given entities in the
-        OU hierarchy.
+        OU hierarchy (ancestry lookup).
 
-        @param entities:
+        @param entities: list of PE-IDs
 
-        @return: Storage of lists of PE-IDs
+        @return: Storage of lists of PE-IDs (as strings)
     """
 
     if not entities:
         return Storage()
 
-    s3db = current.s3db
-    atable = s3db.pr_affiliation
-    rtable = s3db.pr_role
-    query = (atable.deleted != True) & \
-            (atable.role_id == rtable.id) & \
-            (atable.pe_id.belongs(entities)) & \
-            (rtable.deleted != True) & \
-            (rtable.role_type == OU)
-    rows = current.db(query).select(rtable.id,
-                                    rtable.pe_id,
-                                    rtable.path,
-                                    rtable.role_type,
-                                    atable.pe_id)
+    table = pr_ancestry_table()
+    rows = current.db(table.pe_id.belongs(entities)).select(table.pe_id,
+                                                            table.ancestor)
     ancestors = Storage([(pe_id, []) for pe_id in entities])
-    r = rtable._tablename
-    a = atable._tablename
     for row in rows:
-        pe_id = row[a].pe_id
-        paths = ancestors[pe_id]
-        role = row[r]
-        path = S3MultiPath([role.pe_id])
-        if role.path is None:
-            ppath = pr_role_rebuild_path(role)
-        else:
-            ppath = S3MultiPath(role.path)
-        path.extend(role.pe_id, ppath, cut=pe_id)
-        paths.append(path)
-    for pe_id in ancestors:
-        ancestors[pe_id] = S3MultiPath.all_nodes(ancestors[pe_id])
+        pe_id = row.pe_id
+        if pe_id not in ancestors:
+            # Entities given as strings
+            pe_id = str(pe_id)
+        ancestors[pe_id].append(str(row.ancestor))
     return ancestors
 
 # =============================================================================
-def pr_descendants(pe_ids, skip=None, root=True):
+def pr_descendants(pe_ids):
     """
-        Find descendant entities of a person entity in the OU hierarchy
-        (performs a real search, not a path lookup), grouped by root PE
+        Find descendant entities of person entities in the OU hierarchy
+        (ancestry lookup), grouped by root PE
 
         @param pe_ids: set/list of pe_ids
-        @param skip: list of person entity IDs to skip during
-                     descending (internal)
-        @param root: this is the top-node (internal)
 
-        @return: a dict of lists of descendant PEs per root PE
+        @return: a dict of lists of descendant PEs per root PE (not
+                 including persons)
     """
 
-    if skip is None:
-        skip = set()
-
-    # We still need to support Py 2.6
-    #pe_ids = {i for i in pe_ids if i not in skip}
-    pe_ids = set(i for i in pe_ids if i not in skip)
+    pe_ids = set(pe_ids)
     if not pe_ids:
         return {}
 
     s3db = current.s3db
     etable = s3db.pr_pentity
-    rtable = s3db.pr_role
-    atable = s3db.pr_affiliation
+    table = pr_ancestry_table()
 
-    q = (rtable.pe_id.belongs(pe_ids)) \
-        if len(pe_ids) > 1 else (rtable.pe_id == list(pe_ids)[0])
-
-    query = (q & (rtable.role_type == OU) & (rtable.deleted != True)) & \
-            ((atable.role_id == rtable.id) & (atable.deleted != True)) & \
-            (etable.pe_id == atable.pe_id)
-
-    rows = current.db(query).select(rtable.pe_id,
-                                    atable.pe_id,
-                                    etable.instance_type)
-    r = rtable._tablename
-    e = etable._tablename
-    a = atable._tablename
-
-    nodes = set()
-    ogetattr = object.__getattribute__
+    q = (table.ancestor.belongs(pe_ids)) \
+        if len(pe_ids) > 1 else (table.ancestor == list(pe_ids)[0])
+    query = q & \
+            (etable.pe_id == table.pe_id) & \
+            (etable.instance_type != "pr_person")
+    rows = current.db(query).select(table.ancestor, table.pe_id)
 
     result = dict()
-    
-    skip.update(pe_ids)
     for row in rows:
-
-        parent = ogetattr(ogetattr(row, r), "pe_id")
-        child = ogetattr(ogetattr(row, a), "pe_id")
-        instance_type = ogetattr(ogetattr(row, e), "instance_type")
-        if instance_type != "pr_person":
-            if parent not in result:
-                result[parent] = []
-            result[parent].append(child)
-        if child not in skip:
-            nodes.add(child)
-
-    if nodes:
-        descendants = pr_descendants(nodes, skip=skip, root=False)
-        for child, nodes in descendants.iteritems():
-            for parent, children in result.iteritems():
-                if child in children:
-                    for node in nodes:
-                        if node not in children:
-                            children.append(node)
-    if root:
-        for child, nodes in result.iteritems():
-            for parent, children in result.iteritems():
-                if child in children:
-                    for node in nodes:
-                        if node not in children and node != parent:
-                            children.append(node)
-
+        parent = row[table.ancestor]
+        if parent not in result:
+            result[parent] = [row[table.pe_id]]
+        else:
+            result[parent].append(row[table.pe_id])
     return result
 
 # =============================================================================
-def pr_get_descendants(pe_ids, entity_types=None, skip=None, ids=True):
+def pr_get_descendants(pe_ids, entity_types=None):
     """
         Find descendant entities of a person entity in the OU hierarchy
-        (performs a real search, not a path lookup).
+        (ancestry lookup).
 
         @param pe_ids: person entity ID or list of IDs
         @param entity_types: optional filter to a specific entity_type
-        @param ids: whether to return a list of ids or nodes (internal)
-        @param skip: list of person entity IDs to skip during
-                     descending (internal)
 
         @return: a list of PE-IDs
     """
 
     if not pe_ids:
         return []
-    if type(pe_ids) is not set:
-        pe_ids = set(pe_ids) \
-                 if isinstance(pe_ids, (list, tuple)) else set([pe_ids])
+    if not isinstance(pe_ids, (list, tuple, set)):
+        pe_ids = [pe_ids]
 
     db = current.db
-    s3db = current.s3db
-    etable = s3db.pr_pentity
-    rtable = db.pr_role
-    atable = db.pr_affiliation
-
-    if skip is None:
-        skip = set()
-    skip.update(pe_ids)
+    table = pr_ancestry_table()
 
     if len(pe_ids) > 1:
-        q = (rtable.pe_id.belongs(pe_ids))
+        query = (table.ancestor.belongs(pe_ids))
     else:
-        q = (rtable.pe_id == list(pe_ids)[0])
-
-    query = ((rtable.deleted != True) & q & (rtable.role_type == OU)) & \
-            ((atable.deleted != True) & (atable.role_id == rtable.id))
+        query = (table.ancestor == list(pe_ids)[0])
 
     if entity_types is not None:
-        query &= (etable.pe_id == atable.pe_id)
-        rows = db(query).select(etable.pe_id, etable.instance_type)
-        # We still need to support Py 2.6
-        #result = {(r.pe_id, r.instance_type) for r in rows}
-        result = set((r.pe_id, r.instance_type) for r in rows)
-        # We still need to support Py 2.6
-        #node_ids = {i for i, t in result if i not in skip}
-        node_ids = set(i for i, t in result if i not in skip)
-    else:
-        rows = db(query).select(atable.pe_id)
-        # We still need to support Py 2.6
-        #result = {r.pe_id for r in rows}
-        result = set(r.pe_id for r in rows)
-        # We still need to support Py 2.6
-        #node_ids = {i for i in result if i not in skip}
-        node_ids = set(i for i in result if i not in skip)
-    # Recurse
-    if node_ids:
-        descendants = pr_get_descendants(node_ids,
-                                         skip=skip,
-                                         entity_types=entity_types,
-                                         ids=False)
-        result.update(descendants)
-
-    if ids:
-        if entity_types is not None:
-            if type(entity_types) is not set:
-                if not isinstance(entity_types, (tuple, list)):
-                    entity_types = set([entity_types])
-                else:
-                    entity_types = set(entity_types)
-            return [n[0] for n in result if n[1] in entity_types]
+        if not isinstance(entity_types, (list, tuple, set)):
+            entity_types = [entity_types]
+        etable = current.s3db.pr_pentity
+        query &= (etable.pe_id == table.pe_id) & \
+                 (etable.instance_type.belongs(entity_types))
+
+    rows = db(query).select(table.pe_id, distinct=True)
+    return [row[table.pe_id] for row in rows]
+
+# =============================================================================
+# Ancestry (closure table of the OU hierarchy)
+# =============================================================================
+#
+# Set to True once the ancestry table has been checked for
+# consistency with the OU hierarchy (once per process)
+ANCESTRY_CHECKED = False
+
+def pr_ancestry_table():
+    """
+        Get the ancestry table, (re-)building it if it is empty
+        but the OU hierarchy is not (e.g. after upgrading a database
+        which existed before the ancestry table was introduced)
+
+        @return: the pr_ancestry Table
+    """
+
+    global ANCESTRY_CHECKED
+
+    s3db = current.s3db
+    table = s3db.pr_ancestry
+    if not ANCESTRY_CHECKED:
+        db = current.db
+        if not db(table.id > 0).select(table.id, limitby=(0, 1)).first():
+            atable = s3db.pr_affiliation
+            rtable = s3db.pr_role
+            query = (atable.deleted != True) & \
+                    (atable.role_id == rtable.id) & \
+                    (rtable.deleted != True) & \
+                    (rtable.role_type == OU)
+            if db(query).select(atable.id, limitby=(0, 1)).first():
+                pr_rebuild_ancestry()
+        ANCESTRY_CHECKED = True
+    return table
+
+# =============================================================================
+def pr_ou_parents(pe_ids=None):
+    """
+        Get the immediate OU parents of person entities
+
+        @param pe_ids: list of PE-IDs, None for all entities
+
+        @return: dict {pe_id: set of parent PE-IDs}
+    """
+
+    s3db = current.s3db
+    atable = s3db.pr_affiliation
+    rtable = s3db.pr_role
+    query = (atable.deleted != True) & \
+            (atable.role_id == rtable.id) & \
+            (rtable.deleted != True) & \
+            (rtable.role_type == OU)
+    if pe_ids is not None:
+        query &= (atable.pe_id.belongs(pe_ids))
+    rows = current.db(query).select(atable.pe_id, rtable.pe_id)
+
+    parents = {}
+    for row in rows:
+        child = row[atable.pe_id]
+        parent = row[rtable.pe_id]
+        if child == parent:
+            continue
+        if child not in parents:
+            parents[child] = set([parent])
         else:
-            return list(result)
-    else:
-        return result
+            parents[child].add(parent)
+    return parents
+
+# =============================================================================
+def pr_compute_ancestry(pe_ids, parents, known=None):
+    """
+        Compute the ancestors of person entities in the OU hierarchy,
+        breadth-first along the immediate parents
+
+        @param pe_ids: the PE-IDs to compute the ancestors for
+        @param parents: dict of immediate parents {pe_id: set of PE-IDs},
+                        as returned from pr_ou_parents, must contain all
+                        entities which are not in known
+        @param known: dict of the known ancestors of entities outside
+                      of pe_ids {pe_id: {ancestor: depth}}, ascending
+                      stops at these entities
+
+        @return: dict {pe_id: {ancestor: depth}}
+    """
+
+    if known is None:
+        known = {}
+
+    ancestry = {}
+    for pe_id in pe_ids:
+        ancestors = {}
+        visited = set([pe_id])
+        nodes = parents.get(pe_id)
+        depth = 1
+        while nodes:
+            upper = set()
+            for node in nodes:
+                if node in visited:
+                    continue
+                visited.add(node)
+                if node not in ancestors or ancestors[node] > depth:
+                    ancestors[node] = depth
+                if node in known:
+                    for ancestor, d in known[node].items():
+                        if ancestor == pe_id:
+                            continue
+                        d += depth
+                        if ancestor not in ancestors or ancestors[ancestor] > d:
+                            ancestors[ancestor] = d
+                elif node in parents:
+                    upper |= parents[node]
+            nodes = upper
+            depth += 1
+        ancestry[pe_id] = ancestors
+    return ancestry
+
+# =============================================================================
+def pr_update_ancestry(pe_ids):
+    """
+        Update the ancestry of person entities after their OU affiliations
+        have changed, including the ancestry of all their descendants, and
+        clear the paths of all roles of these entities (triggers lazy
+        rebuild)
+
+        @param pe_ids: list of PE-IDs
+    """
+
+    pe_ids = set(int(pe_id) for pe_id in pe_ids if pe_id)
+    if not pe_ids:
+        return
+
+    db = current.db
+    s3db = current.s3db
+    table = pr_ancestry_table()
+
+    # The descendants of an entity do not change when its parents
+    # change => find all entities with affected ancestry
+    rows = db(table.ancestor.belongs(pe_ids)).select(table.pe_id,
+                                                     distinct=True)
+    affected = pe_ids | set(row.pe_id for row in rows)
+
+    # Clear the paths of all roles of the affected entities
+    rtable = s3db.pr_role
+    query = (rtable.pe_id.belongs(affected)) & \
+            (rtable.deleted != True)
+    db(query).update(path=None)
+
+    # Get the current parents of the affected entities
+    parents = pr_ou_parents(affected)
+
+    # Get the ancestors of all unaffected parents
+    outside = set()
+    for p in parents.values():
+        outside |= p
+    outside -= affected
+    known = dict((pe_id, {}) for pe_id in outside)
+    if outside:
+        rows = db(table.pe_id.belongs(outside)).select(table.pe_id,
+                                                       table.ancestor,
+                                                       table.depth)
+        for row in rows:
+            known[row.pe_id][row.ancestor] = row.depth
+
+    ancestry = pr_compute_ancestry(affected, parents, known=known)
+
+    # Get the current ancestry of the affected entities
+    rows = db(table.pe_id.belongs(affected)).select(table.pe_id,
+                                                    table.ancestor,
+                                                    table.depth)
+    current_ancestry = dict((pe_id, {}) for pe_id in affected)
+    for row in rows:
+        current_ancestry[row.pe_id][row.ancestor] = row.depth
+
+    # Replace the ancestry of all entities where it has changed
+    changed = [pe_id for pe_id in affected
+               if ancestry[pe_id] != current_ancestry[pe_id]]
+    if changed:
+        db(table.pe_id.belongs(changed)).delete()
+        items = [{"pe_id": pe_id, "ancestor": ancestor, "depth": depth}
+                 for pe_id in changed
+                 for ancestor, depth in ancestry[pe_id].items()]
+        if items:
+            table.bulk_insert(items)
+
+    # Affiliations (also with delegation roles) change the realms of users
+    S3RealmCache.invalidate()
+    return
+
+# =============================================================================
+def pr_rebuild_ancestry():
+    """
+        Rebuild the ancestry table from the OU hierarchy, e.g. after
+        bulk imports which have bypassed pr_add_affiliation and the
+        affiliation onaccept/ondelete callbacks
+
+        @return: the number of ancestry records
+    """
+
+    db = current.db
+    table = current.s3db.pr_ancestry
+
+    parents = pr_ou_parents()
+    ancestry = pr_compute_ancestry(parents.keys(), parents)
+
+    db(table.id > 0).delete()
+    items = [{"pe_id": pe_id, "ancestor": ancestor, "depth": depth}
+             for pe_id, ancestors in ancestry.items()
+             for ancestor, depth in ancestors.items()]
+    chunk_size = 1000
+    for i in xrange(0, len(items), chunk_size):
+        table.bulk_insert(items[i:i + chunk_size])
+
+    S3RealmCache.invalidate()
+    return len(items)
 
 # =============================================================================
 # Internal Path Tools
@@ -5538,21 +5682,26 @@ def pr_rebuild_path(pe_id, clear=False):
     """
 
     if isinstance(pe_id, Row):
-        pe_id = row.pe_id
+        pe_id = pe_id.pe_id
 
     rtable = current.s3db.pr_role
     query = (rtable.pe_id == pe_id) & \
             (rtable.role_type == OU) & \
             (rtable.deleted != True)
     db = current.db
-    db(query).update(path=None)
+    if clear:
+        # Update the ancestry (also clears the paths of all roles
+        # of this entity and its descendants)
+        pr_update_ancestry([pe_id])
+    else:
+        db(query).update(path=None)
     roles = db(query).select(rtable.id,
                              rtable.pe_id,
                              rtable.path,
                              rtable.role_type)
     for role in roles:
         if role.path is None:
-            pr_role_rebuild_path(role, clear=clear)
+            pr_role_rebuild_path(role)
     return
 
 # =============================================================================
@@ -5613,8 +5762,10 @@ def pr_role_rebuild_path(role_id, skip=[], clear=False):
 
     # Clear descendant paths, if requested (only necessary for writes)
     if clear:
+        htable = pr_ancestry_table()
+        descendants = db(htable.ancestor == pe_id)._select(htable.pe_id)
         query = (rtable.deleted != True) & \
-                (rtable.path.like("%%|%s|%%" % pe_id)) & \
+                (rtable.pe_id.belongs(descendants)) & \
                 (~(rtable.id.belongs(skip)))
         db(query).update(path=None)
 
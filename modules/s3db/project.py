@@ -246,6 +246,20 @@ class S3ProjectModel(S3Model):
                              s3_currency(readable = False if multi_budgets else True,
                                          writable = False if multi_budgets else True,
                                          ),
+                             # Totals from the project_organisation and
+                             # project_annual_budget components (computed)
+                             Field("total_organisation_amount", "double",
+                                   readable = False,
+                                   writable = False,
+                                   label = T("Total Funding Amount"),
+                                   represent = lambda v: \
+                                    IS_FLOAT_AMOUNT.represent(v, precision=2)),
+                             Field("total_annual_budget", "double",
+                                   readable = False,
+                                   writable = False,
+                                   label = T("Total Annual Budget"),
+                                   represent = lambda v: \
+                                    IS_FLOAT_AMOUNT.represent(v, precision=2)),
                              Field("objectives", "text",
                                    readable = mode_3w,
                                    writable = mode_3w,
@@ -255,6 +269,14 @@ class S3ProjectModel(S3Model):
                              s3_comments(comment=DIV(_class="tooltip",
                                                      _title="%s|%s" % (T("Comments"),
                                                                        T("Outcomes, Impact, Challenges")))),
+                             computed = {
+                                "total_organisation_amount":
+                                    S3Computed(self.project_total_organisation_amounts,
+                                               depends=["organisation.amount"]),
+                                "total_annual_budget":
+                                    S3Computed(self.project_total_annual_budgets,
+                                               depends=["annual_budget.amount"]),
+                                },
                              *s3_meta_fields())
 
         # CRUD Strings
@@ -417,11 +439,9 @@ class S3ProjectModel(S3Model):
             #append("drr.hfa")
         append((T("Themes"), "theme.name"))
         if multi_orgs:
-            table.total_organisation_amount = Field.Lazy(self.project_total_organisation_amount)
-            append((T("Total Funding Amount"), "total_organisation_amount"))
+            append("total_organisation_amount")
         if multi_budgets:
-            table.total_annual_budget = Field.Lazy(self.project_total_annual_budget)
-            append((T("Total Annual Budget"), "total_annual_budget"))
+            append("total_annual_budget")
         append("start_date")
         append("end_date")
 
@@ -643,40 +663,47 @@ class S3ProjectModel(S3Model):
 
     # -------------------------------------------------------------------------
     @staticmethod
-    def project_total_organisation_amount(row):
-        """ Total of project_organisation amounts for project"""
+    def project_total_organisation_amounts(ids):
+        """
+            Totals of project_organisation amounts for projects, computes
+            project_project.total_organisation_amount
 
-        if "project_project" in row:
-            project_id = row["project_project.id"]
-        elif "id" in row:
-            project_id = row["id"]
-        else:
-            return 0
+            @param ids: the project_project record IDs
+            @return: dict {project_id: total}
+        """
 
         table = current.s3db.project_organisation
         query = (table.deleted != True) & \
-                (table.project_id == project_id)
+                (table.project_id.belongs(ids))
         sum_field = table.amount.sum()
-        return current.db(query).select(sum_field).first()[sum_field]
-        
+        rows = current.db(query).select(table.project_id,
+                                        sum_field,
+                                        groupby=table.project_id)
+        totals = dict((row[table.project_id], row[sum_field]) for row in rows)
+        return dict((project_id, totals.get(project_id))
+                    for project_id in ids)
+
     # -------------------------------------------------------------------------
     @staticmethod
-    def project_total_annual_budget(row):
-        """ Total of all annual budgets for project"""
+    def project_total_annual_budgets(ids):
+        """
+            Totals of all annual budgets for projects, computes
+            project_project.total_annual_budget
 
-        if "project_project" in row:
-            project_id = row["project_project.id"]
-        elif "id" in row:
-            project_id = row["id"]
-        else:
-            return 0
+            @param ids: the project_project record IDs
+            @return: dict {project_id: total}
+        """
 
         table = current.s3db.project_annual_budget
         query = (table.deleted != True) & \
-                (table.project_id == project_id)
+                (table.project_id.belongs(ids))
         sum_field = table.amount.sum()
-        return current.db(query).select(sum_field).first()[sum_field] or \
-               current.messages["NONE"]
+        rows = current.db(query).select(table.project_id,
+                                        sum_field,
+                                        groupby=table.project_id)
+        totals = dict((row[table.project_id], row[sum_field]) for row in rows)
+        return dict((project_id, totals.get(project_id))
+                    for project_id in ids)
 
     # -------------------------------------------------------------------------
     @staticmethod
@@ -848,7 +875,7 @@ class S3ProjectModel(S3Model):
             if len(_countries) == 1:
                 country = _countries[0]
                 if country in countries:
-                    budget = project.project_project.total_annual_budget()
+                    budget = project.project_project.total_annual_budget or 0
                     theme = project.project_theme_project.theme_id
                     percentage = project.project_theme_project.percentage
                     countries[country][theme] += budget * percentage
@@ -859,7 +886,7 @@ class S3ProjectModel(S3Model):
                     for theme in themes:
                         countries[country][theme.id] = 0
                     # Add value for this record
-                    budget = project.project_project.total_annual_budget()
+                    budget = project.project_project.total_annual_budget or 0
                     theme = project.project_theme_project.theme_id
                     percentage = project.project_theme_project.percentage
                     countries[country][theme] += budget * percentage
@@ -8,7 +8,7 @@
 import unittest
 
 from gluon import current
-from s3layouts import homepage, S3AddResourceLink
+from s3layouts import homepage, M, S3AddResourceLink
 
 # =============================================================================
 class LayoutTests(unittest.TestCase):
@@ -68,6 +68,67 @@ class LayoutTests(unittest.TestCase):
         self.assertNotEqual(output, "")
         auth.s3_impersonate(None)
 
+    def testMenuRenderCache(self):
+
+        auth = current.auth
+        s3 = current.response.s3
+        acl = auth.permission
+
+        def menu():
+            return M(c="pr")(
+                        M("Persons", f="person")(
+                            M("New", m="create"),
+                            M("List All"),
+                        ),
+                        M("Groups", f="group"),
+                   )
+
+        acl_cache = acl.acl_cache
+        acl.acl_cache = True
+        s3.acl_dirty = False
+        try:
+            auth.s3_impersonate("admin@example.com")
+
+            # Uncached output
+            item = menu()
+            expected = item.xml()
+            self.assertNotEqual(expected, "")
+
+            # Cached output is the same
+            item = menu()
+            item.cache = True
+            key = item.cache_key()
+            self.assertNotEqual(key, None)
+            self.assertEqual(item.xml(), expected)
+            self.assertEqual(item.RENDER_CACHE.get(key), expected)
+
+            # ...and re-used for the same menu
+            item = menu()
+            item.cache = True
+            self.assertEqual(item.cache_key(), key)
+            item.RENDER_CACHE.set(key, "cached")
+            self.assertEqual(item.xml(), "cached")
+
+            # Different structure, different key
+            item = menu()
+            item.cache = True
+            item.append(M("Import", f="person", m="import"))
+            self.assertNotEqual(item.cache_key(), key)
+
+            # Different roles, different key
+            auth.s3_impersonate(None)
+            item = menu()
+            item.cache = True
+            self.assertNotEqual(item.cache_key(), key)
+
+            # No caching after changes to ACLs
+            s3.acl_dirty = True
+            self.assertEqual(item.cache_key(), None)
+        finally:
+            acl.acl_cache = acl_cache
+            s3.acl_dirty = False
+            auth.s3_impersonate(None)
+
 # =============================================================================
 def run_suite(*test_classes):
     """ Run the test suite """
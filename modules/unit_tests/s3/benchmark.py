@@ -43,6 +43,9 @@
 # If you get FAIL messages, then the overall performance of Sahana Eden in
 # your enviroment is likely to be completely unacceptable.
 #
+import os
+import subprocess
+import sys
 import unittest
 import timeit
 
@@ -124,6 +127,98 @@ class S3PerformanceTests(unittest.TestCase):
             print "S3Model.__getitem__(non-table) = %s µs" % mlt
             self.assertTrue(mlt<10)
 
+    def testS3ModelIndex(self):
+
+        print ""
+        index = S3Model.INDEX
+
+        def x():
+            S3Model.INDEX = None
+            S3Model.index()
+        mlt = timeit.Timer(x).timeit(number=100) * 10
+        print "S3Model.index (build) = %s ms" % mlt
+        S3Model.INDEX = index
+
+        # Lookup of a name which is not defined by any model
+        x = lambda: S3Model.table("pr_benchmark_no_table")
+        mlt = timeit.Timer(x).timeit(number=100000) * 10
+        print "S3Model.table(miss) = %s µs" % mlt
+        self.assertTrue(mlt<10)
+
+    def testTimeToFirstQuery(self):
+        """
+            Time from model loading to the first query for typical
+            controllers, each measured in a new process (=the first
+            request of a worker, where no models have been loaded yet,
+            see time_to_first_query)
+        """
+
+        request = current.request
+        web2py = os.path.join(os.getcwd(), "web2py.py")
+        script = os.path.join(request.folder,
+                              "modules", "unit_tests", "s3", "benchmark.py")
+
+        controllers = (("pr/person", "pr_person"),
+                       ("org/organisation", "org_organisation"),
+                       ("hrm/staff", "hrm_human_resource"),
+                       ("gis/location", "gis_location"),
+                       ("project/project", "project_project"),
+                       )
+
+        print ""
+        for controller, tablename in controllers:
+            command = [sys.executable, web2py, "-Q",
+                       "-S", request.application, "-M",
+                       "-R", script,
+                       "-A", "--ttfq", tablename]
+            mlt = None
+            for i in xrange(3):
+                process = subprocess.Popen(command, stdout=subprocess.PIPE)
+                output = process.communicate()[0]
+                try:
+                    result = float(output.strip().splitlines()[-1])
+                except (IndexError, ValueError):
+                    # Table not available in this configuration
+                    break
+                if mlt is None or result < mlt:
+                    mlt = result
+            if mlt is not None:
+                print "Time to first query (%s) = %s ms" % (controller, mlt)
+
+    def testS3PermissionACLIndex(self):
+        """
+            Permission checks for the main menu (one per module), with
+            and without the ACL index (see security.acl_cache)
+        """
+
+        auth = current.auth
+        s3 = current.response.s3
+        modules = current.deployment_settings.modules.keys()
+
+        auth.s3_impersonate("normaluser@example.com")
+        permission = auth.permission
+
+        def x():
+            for key in ("permissions", "restricted_tables"):
+                if key in s3:
+                    del s3[key]
+            s3.acl_queries = 0
+            for module in modules:
+                permission.accessible_url(c=module, f="index")
+
+        print ""
+        acl_cache = permission.acl_cache
+        for mode in (False, True):
+            permission.acl_cache = mode
+            s3.acl_dirty = False
+            s3.acl_stamp = None
+            mlt = timeit.Timer(x).timeit(number=10) * 100
+            print "S3Permission.accessible_url x %s (acl_cache=%s) = %s ms, %s ACL queries" % \
+                  (len(modules), mode, mlt, s3.acl_queries)
+        permission.acl_cache = acl_cache
+
+        auth.s3_impersonate(None)
+
     def testS3ModelConfigure(self):
 
         s3db = current.s3db
@@ -277,6 +372,28 @@ class S3PerformanceTests(unittest.TestCase):
 
         current.auth.override = False
 
+# =============================================================================
+def time_to_first_query(tablename):
+    """
+        Load the models for a table and run the first query, and print
+        the time this took (in ms); to be run in a new process, see
+        S3PerformanceTests.testTimeToFirstQuery
+
+        @param tablename: the table name
+    """
+
+    s3db = current.s3db
+    current.auth.override = True
+
+    start = timeit.default_timer()
+    table = s3db.table(tablename)
+    if table is not None:
+        resource = s3db.resource(table)
+        resource.select(["id"], limit=1)
+        print (timeit.default_timer() - start) * 1000
+
+    current.auth.override = False
+
 # =============================================================================
 def run_suite(*test_classes):
     """ Run the test suite """
@@ -292,8 +409,11 @@ def run_suite(*test_classes):
 
 if __name__ == "__main__":
 
-    run_suite(
-        S3PerformanceTests,
-    )
+    if len(sys.argv) > 2 and sys.argv[1] == "--ttfq":
+        time_to_first_query(sys.argv[2])
+    else:
+        run_suite(
+            S3PerformanceTests,
+        )
 
 # END ========================================================================
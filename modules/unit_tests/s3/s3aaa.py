@@ -9,7 +9,7 @@ import unittest
 
 from gluon import *
 from gluon.storage import Storage
-from s3.s3aaa import S3EntityRoleManager, S3Permission
+from s3.s3aaa import S3Audit, S3EntityRoleManager, S3Permission, S3RealmCache
 
 # =============================================================================
 class AuthUtilsTests(unittest.TestCase):
@@ -324,6 +324,74 @@ class SetRolesTests(unittest.TestCase):
             current.db.rollback()
             auth.s3_impersonate(None)
 
+    # -------------------------------------------------------------------------
+    def testSetRolesRealmCache(self):
+        """ Test set_roles with realm cache """
+
+        s3db = current.s3db
+        auth = current.auth
+        settings = current.deployment_settings
+
+        settings.security.policy = 7
+        auth.permission = S3Permission(auth)
+
+        realm_cache = settings.get_auth_realm_cache()
+        settings.auth.realm_cache = "ram"
+
+        try:
+            # Create a test role
+            role = auth.s3_create_role("Test Group", uid="TESTGROUP")
+
+            # Have two orgs, set org2 as OU descendant of org1
+            org1 = self.org1
+            org2 = self.org2
+            org3 = self.org3
+            s3db.pr_add_affiliation(org1, org2, role="TestOrgUnit")
+
+            # Assign normaluser the test role for org1
+            user_id = auth.s3_get_user_id("normaluser@example.com")
+            auth.s3_assign_role(user_id, role, for_pe=org1)
+
+            # Impersonate as normal user
+            auth.s3_impersonate("normaluser@example.com")
+            realm = auth.user.realms[role]
+            self.assertEqual(set(realm), set([org1, org2]))
+
+            # Realms are restored from the cache
+            auth.s3_set_roles()
+            self.assertEqual(set(auth.user.realms[role]), set([org1, org2]))
+            mtable = auth.settings.table_membership
+            query = (mtable.user_id == auth.user.id) & \
+                    (mtable.deleted != True)
+            rows = current.db(query).select(mtable.group_id, mtable.pe_id)
+            key = S3RealmCache.key(auth.user, 7, rows)
+            self.assertNotEqual(S3RealmCache.get(key), None)
+
+            # ...and kept out of the session
+            import cPickle
+            user = cPickle.loads(cPickle.dumps(auth.user))
+            self.assertEqual(user.realms, {})
+            self.assertEqual(user.id, auth.user.id)
+
+            # Affiliation changes take effect immediately
+            s3db.pr_add_affiliation(org2, org3, role="TestOrgUnit")
+            auth.s3_set_roles()
+            self.assertEqual(set(auth.user.realms[role]),
+                             set([org1, org2, org3]))
+
+            # Role assignments take effect immediately
+            auth.s3_retract_role(user_id, role, for_pe=org1)
+            auth.s3_set_roles()
+            self.assertFalse(role in auth.user.realms)
+
+        finally:
+            settings.auth.realm_cache = realm_cache
+            auth.s3_delete_role("TESTGROUP")
+            current.db.rollback()
+            # Do not keep the rolled-back hierarchy in the cache
+            S3RealmCache.invalidate()
+            auth.s3_impersonate(None)
+
     # -------------------------------------------------------------------------
     #def testPerformance(self):
 
@@ -1654,6 +1722,72 @@ class HasPermissionTests(unittest.TestCase):
             auth.s3_retract_role(user, self.dvi_reader, for_pe=self.org3)
             current.db.rollback()
 
+    # -------------------------------------------------------------------------
+    def testACLIndex(self):
+        """ Test permission checks with the process-wide ACL index """
+
+        db = current.db
+        auth = current.auth
+        s3 = current.response.s3
+
+        current.deployment_settings.security.policy = 5
+        auth.permission = S3Permission(auth)
+
+        acl = auth.permission
+        has_permission = auth.s3_has_permission
+
+        def check():
+            # Clear the per-request permission cache
+            for key in ("permissions", "restricted_tables"):
+                if key in s3:
+                    del s3[key]
+            s3.acl_queries = 0
+            return [has_permission("read", c="dvi", f="body", table="dvi_body"),
+                    has_permission("create", c="dvi", f="body", table="dvi_body"),
+                    has_permission("update", c="dvi", f="body", table="dvi_body",
+                                   record_id=self.record1),
+                    ]
+
+        def new_request():
+            s3.acl_dirty = False
+            s3.acl_stamp = None
+
+        auth.s3_impersonate("normaluser@example.com")
+        auth.s3_assign_role(auth.user.id, self.dvi_reader)
+        try:
+            # Permissions from the ACL table
+            acl.acl_cache = False
+            expected = check()
+            self.assertEqual(expected, [True, True, False])
+            self.assertTrue(s3.acl_queries > 0)
+
+            # Same permissions from the ACL index
+            acl.acl_cache = True
+            new_request()
+            self.assertEqual(check(), expected)
+            # Only the change check, and loading the index
+            self.assertTrue(s3.acl_queries <= 2)
+            self.assertEqual(check(), expected)
+            self.assertEqual(s3.acl_queries, 0)
+
+            # Updating an ACL falls back to the ACL table
+            acl.update_acl("TESTDVIREADER", c="dvi", f="body",
+                           uacl=acl.READ|acl.CREATE|acl.UPDATE,
+                           oacl=acl.READ|acl.CREATE|acl.UPDATE)
+            self.assertEqual(check(), [True, True, True])
+            self.assertTrue(s3.acl_queries > 0)
+
+            # ...and reloads the index in the next request
+            new_request()
+            self.assertEqual(check(), [True, True, True])
+            self.assertTrue(s3.acl_queries <= 2)
+
+        finally:
+            auth.s3_retract_role(auth.user.id, self.dvi_reader)
+            db.rollback()
+            # Do not keep the rolled-back ACL in the index
+            S3Permission.invalidate_acls()
+
     # -------------------------------------------------------------------------
     #def testPerformance(self):
 
@@ -2252,6 +2386,110 @@ class AccessibleQueryTests(unittest.TestCase):
             s3db.pr_remove_affiliation(self.org2, self.org3, role="TestOrgUnit")
             auth.s3_retract_role(user, self.dvi_reader, for_pe=self.org3)
 
+    # -------------------------------------------------------------------------
+    def testPermittedIDs(self):
+        """ Test bulk permission check for a list of records """
+
+        db = current.db
+        auth = current.auth
+        s3 = current.response.s3
+
+        current.deployment_settings.security.policy = 5
+        auth.permission = S3Permission(auth)
+
+        assertEqual = self.assertEqual
+
+        table = current.s3db.dvi_body
+        record_ids = [self.record1, self.record2, self.record3]
+        permitted_ids = auth.s3_permitted_ids
+
+        # Check anonymous
+        auth.s3_impersonate(None)
+        permitted = permitted_ids("read", table, record_ids,
+                                  c="dvi", f="body")
+        assertEqual(permitted, set())
+
+        # Test with TESTDVIREADER
+        auth.s3_impersonate("normaluser@example.com")
+        auth.s3_assign_role(auth.user.id, self.dvi_reader)
+        db(table.id == self.record1).update(owned_by_user=auth.user.id)
+        auth.permission.forget()
+
+        permitted = permitted_ids("read", table, record_ids,
+                                  c="dvi", f="body")
+        assertEqual(permitted, set(record_ids))
+        permitted = permitted_ids("update", table, record_ids,
+                                  c="dvi", f="body")
+        assertEqual(permitted, set([self.record1]))
+        permitted = permitted_ids("delete", "dvi_body", record_ids,
+                                  c="dvi", f="body")
+        assertEqual(permitted, set())
+
+        # Results are remembered for has_permission
+        key = "%s/dvi/body/dvi_body/%s" % (["update"], self.record2)
+        assertEqual(s3.permissions.get(key), False)
+        has_permission = auth.s3_has_permission
+        for record_id in record_ids:
+            assertEqual(has_permission("update", table,
+                                       record_id=record_id,
+                                       c="dvi", f="body"),
+                        record_id == self.record1)
+
+        # Empty list of records
+        assertEqual(permitted_ids("read", table, [], c="dvi", f="body"),
+                    set())
+
+        auth.s3_retract_role(auth.user.id, self.dvi_reader)
+
+    # -------------------------------------------------------------------------
+    def testQueryCache(self):
+        """ Test memoisation of accessible queries """
+
+        auth = current.auth
+        s3 = current.response.s3
+
+        current.deployment_settings.security.policy = 5
+        auth.permission = S3Permission(auth)
+
+        assertEqual = self.assertEqual
+
+        accessible_query = auth.s3_accessible_query
+        table = current.s3db.dvi_body
+
+        def new_request():
+            for key in ("accessible_queries", "acl_stamp"):
+                if key in s3:
+                    del s3[key]
+            s3.acl_dirty = False
+            s3.acl_queries = 0
+
+        auth.s3_impersonate("normaluser@example.com")
+        auth.s3_assign_role(auth.user.id, self.dvi_reader)
+        try:
+            new_request()
+            query = accessible_query("update", table, c="dvi", f="body")
+
+            # Same query object for the rest of the request
+            s3.acl_queries = 0
+            self.assertTrue(accessible_query("update", table,
+                                             c="dvi", f="body") is query)
+            assertEqual(s3.acl_queries, 0)
+
+            # Rebuilt in the next request, but from the cached ACLs
+            new_request()
+            cached = accessible_query("update", table, c="dvi", f="body")
+            self.assertFalse(cached is query)
+            assertEqual(str(cached), str(query))
+            # Only the ACL change check
+            self.assertTrue(s3.acl_queries <= 1)
+
+            # Different query for different roles
+            auth.s3_retract_role(auth.user.id, self.dvi_reader)
+            query = accessible_query("update", table, c="dvi", f="body")
+            assertEqual(str(query), "(dvi_body.id = 0)")
+        finally:
+            auth.s3_retract_role(auth.user.id, self.dvi_reader)
+
     # -------------------------------------------------------------------------
     #def testPerformance(self):
 
@@ -3892,6 +4130,91 @@ class EntityRoleManagerTests(unittest.TestCase):
     def tearDownClass(cls):
         pass
 
+# =============================================================================
+class AuditTests(unittest.TestCase):
+    """ Test audit trail writer modes """
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        settings = current.deployment_settings
+        self.audit_read = settings.get_security_audit_read()
+        self.audit_write = settings.get_security_audit_write()
+        settings.security.audit_read = True
+        settings.security.audit_write = True
+
+        self.audit = audit = S3Audit()
+        table = audit.table
+        self.query = (table.tablename == "s3_audit_test")
+
+    # -------------------------------------------------------------------------
+    def testBatchMode(self):
+        """ Test buffering of audit records """
+
+        db = current.db
+        audit = self.audit
+        query = self.query
+
+        # Tests do not run in web requests => set the mode explicitly
+        audit.mode = "batch"
+
+        audit("create", "s3", "audit_test", record=1)
+        audit("update", "s3", "audit_test", record=1)
+        audit("update", "s3", "audit_test", record=2)
+        self.assertEqual(db(query).count(), 0)
+        self.assertEqual(len(audit.buffer), 3)
+
+        # Flush the buffer
+        audit.flush()
+        self.assertEqual(audit.buffer, [])
+        table = audit.table
+        rows = db(query).select(table.method,
+                                table.record_id,
+                                orderby=table.id)
+        self.assertEqual([(row.method, row.record_id) for row in rows],
+                         [("create", 1), ("update", 1), ("update", 2)])
+
+    # -------------------------------------------------------------------------
+    def testSpoolMode(self):
+        """ Test spooling of audit records """
+
+        import os
+        import tempfile
+
+        db = current.db
+        audit = self.audit
+        query = self.query
+
+        folder = tempfile.mkdtemp()
+        audit.mode = "spool"
+        audit.spool_path = os.path.join(folder, "audit.spool")
+        try:
+            audit("create", "s3", "audit_test", record=3)
+            audit("read", "s3", "audit_test", record=3)
+            self.assertEqual(db(query).count(), 0)
+            with open(audit.spool_path) as spool:
+                self.assertEqual(len(spool.readlines()), 2)
+
+            # Drain the spool file (rolled back in tearDown)
+            self.assertEqual(audit.drain(commit=False), 2)
+            self.assertFalse(os.path.exists(audit.spool_path))
+            self.assertEqual(db(query).count(), 2)
+
+            # Nothing left to drain
+            self.assertEqual(audit.drain(commit=False), 0)
+        finally:
+            if os.path.exists(audit.spool_path):
+                os.remove(audit.spool_path)
+            os.rmdir(folder)
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        settings = current.deployment_settings
+        settings.security.audit_read = self.audit_read
+        settings.security.audit_write = self.audit_write
+        current.db.rollback()
+
 # =============================================================================
 def run_suite(*test_classes):
     """ Run the test suite """
@@ -3920,6 +4243,7 @@ if __name__ == "__main__":
         RealmEntityTests,
         LinkToPersonTests,
         EntityRoleManagerTests,
+        AuditTests,
     )
 
 # END ========================================================================
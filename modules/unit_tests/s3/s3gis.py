@@ -0,0 +1,484 @@
+# -*- coding: utf-8 -*-
+#
+# GIS Unit Tests
+#
+# To run this script use:
+# python web2py.py -S eden -M -R applications/eden/modules/unit_tests/s3/s3gis.py
+#
+import unittest
+
+from gluon import current
+
+# =============================================================================
+class SpatialQueryTests(unittest.TestCase):
+    """ Test spatial queries with the bounds pre-filter """
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        current.auth.override = True
+
+        table = current.s3db.gis_location
+
+        # Square polygon, 0.2 degrees wide
+        self.polygon = table.insert(name="SpatialQueryTestPolygon",
+                                    gis_feature_type=3,
+                                    wkt="POLYGON((30 10,30.2 10,30.2 10.2,30 10.2,30 10))",
+                                    lat=10.1,
+                                    lon=30.1,
+                                    lat_min=10.0,
+                                    lat_max=10.2,
+                                    lon_min=30.0,
+                                    lon_max=30.2,
+                                    )
+        # Point inside the polygon
+        self.inside = table.insert(name="SpatialQueryTestInside",
+                                   lat=10.05,
+                                   lon=30.05,
+                                   lat_min=10.05,
+                                   lat_max=10.05,
+                                   lon_min=30.05,
+                                   lon_max=30.05,
+                                   )
+        # Point inside the polygon, but without bounds
+        self.nobounds = table.insert(name="SpatialQueryTestNoBounds",
+                                     lat=10.15,
+                                     lon=30.15,
+                                     )
+        # Point outside the polygon
+        self.outside = table.insert(name="SpatialQueryTestOutside",
+                                    lat=11.0,
+                                    lon=31.0,
+                                    lat_min=11.0,
+                                    lat_max=11.0,
+                                    lon_min=31.0,
+                                    lon_max=31.0,
+                                    )
+
+    # -------------------------------------------------------------------------
+    def testFeaturesInPolygon(self):
+        """ Test finding locations within a polygon """
+
+        gis = current.gis
+
+        try:
+            import shapely
+        except ImportError:
+            return
+
+        rows = gis.get_features_in_polygon(self.polygon)
+        ids = [row.id for row in rows]
+
+        self.assertTrue(self.inside in ids)
+        self.assertTrue(self.nobounds in ids)
+        self.assertFalse(self.outside in ids)
+
+    # -------------------------------------------------------------------------
+    def testFeaturesInRadius(self):
+        """ Test finding locations within a radius """
+
+        gis = current.gis
+
+        # ~11 km north of the inside point
+        rows = gis.get_features_in_radius(10.15, 30.05, 12)
+        ids = [row.id for row in rows]
+
+        self.assertTrue(self.inside in ids)
+        self.assertTrue(self.nobounds in ids)
+        self.assertFalse(self.outside in ids)
+
+        rows = gis.get_features_in_radius(10.15, 30.05, 5)
+        ids = [row.id for row in rows]
+
+        self.assertFalse(self.inside in ids)
+        self.assertFalse(self.outside in ids)
+
+    # -------------------------------------------------------------------------
+    def testCircle(self):
+        """ Test the circle approximation """
+
+        gis = current.gis
+
+        wkt = gis.circle_to_wkt(10.0, 30.0, 10, segments=8)
+        self.assertTrue(wkt.startswith("POLYGON(("))
+
+        points = wkt[9:-2].split(",")
+        # Closed ring
+        self.assertEqual(len(points), 9)
+        self.assertEqual(points[0], points[-1])
+
+        # All points are on the circle
+        for point in points:
+            lon, lat = [float(v) for v in point.split(" ")]
+            distance = gis.greatCircleDistance(10.0, 30.0, lat, lon)
+            self.assertAlmostEqual(distance, 10, 2)
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        current.db.rollback()
+        current.auth.override = False
+
+# =============================================================================
+class MapTileTests(unittest.TestCase):
+    """ Test tiled GeoJSON export of map layers """
+
+    # -------------------------------------------------------------------------
+    def testTileBounds(self):
+        """ Test the bounds of tiles """
+
+        get_tile_bounds = current.gis.get_tile_bounds
+
+        lon_min, lat_min, lon_max, lat_max = get_tile_bounds(0, 0, 0)
+        self.assertEqual((lon_min, lon_max), (-180.0, 180.0))
+        self.assertAlmostEqual(lat_max, 85.0511, 4)
+        self.assertAlmostEqual(lat_min, -85.0511, 4)
+
+        lon_min, lat_min, lon_max, lat_max = get_tile_bounds(1, 1, 0)
+        self.assertEqual((lon_min, lon_max), (0.0, 180.0))
+        self.assertAlmostEqual(lat_min, 0.0, 6)
+        self.assertAlmostEqual(lat_max, 85.0511, 4)
+
+    # -------------------------------------------------------------------------
+    def testSimplifyTolerance(self):
+        """ Test the simplification tolerance per zoom level """
+
+        gis = current.gis
+        s3 = current.response.s3
+        settings = current.deployment_settings
+
+        tolerance, decimals = gis.get_simplify_tolerance()
+        self.assertEqual(tolerance, settings.get_gis_simplify_tolerance())
+        self.assertEqual(decimals, 4)
+
+        try:
+            s3.gis.tile_zoom = 2
+            low = gis.get_simplify_tolerance()
+            s3.gis.tile_zoom = 12
+            high = gis.get_simplify_tolerance()
+        finally:
+            s3.gis.tile_zoom = None
+        self.assertTrue(low[0] > high[0])
+        self.assertTrue(low[1] < high[1])
+
+    # -------------------------------------------------------------------------
+    def testBBoxIntersects(self):
+        """ Test bbox filter by intersection with the bounds """
+
+        from s3.s3resource import S3ResourceFilter
+
+        current.auth.override = True
+        try:
+            table = current.s3db.gis_location
+            record_id = table.insert(name="MapTileTestPolygon",
+                                     gis_feature_type=3,
+                                     lat=10.1,
+                                     lon=30.1,
+                                     lat_min=10.0,
+                                     lat_max=10.2,
+                                     lon_min=30.0,
+                                     lon_max=30.2,
+                                     )
+            resource = current.s3db.resource("gis_location", id=record_id)
+            # The centroid is not inside this bbox, but the bounds intersect
+            get_vars = {"bbox": "30.15,10.15,31,11"}
+
+            query = S3ResourceFilter.parse_bbox_query(resource, get_vars)
+            self.assertEqual(current.db(query & (table.id == record_id)).count(), 0)
+
+            query = S3ResourceFilter.parse_bbox_query(resource, get_vars,
+                                                      intersects=True)
+            self.assertEqual(current.db(query & (table.id == record_id)).count(), 1)
+        finally:
+            current.db.rollback()
+            current.auth.override = False
+
+    # -------------------------------------------------------------------------
+    def testTilePath(self):
+        """ Test that cached tiles are specific for the permissions """
+
+        from gluon.storage import Storage
+        from s3.s3gis import S3MapTiles
+        from s3.s3rest import S3Request
+
+        s3 = current.response.s3
+
+        r = S3Request(prefix="gis",
+                      name="location",
+                      c="gis",
+                      f="location",
+                      args=["tiles"],
+                      vars=Storage(format="geojson", z="1", x="1", y="0"))
+        tiles = S3MapTiles()
+
+        path = tiles.tile_path(r, 1, 1, 0)
+        self.assertTrue(path.endswith("1/1/0.geojson"))
+        self.assertNotEqual(s3.acl_stamp, None)
+
+        # Same request => same tile
+        self.assertEqual(tiles.tile_path(r, 1, 1, 0), path)
+
+        # Changed ACLs => different tile
+        acl_stamp = s3.acl_stamp
+        try:
+            s3.acl_stamp = ("MapTileTest",) + tuple(acl_stamp)
+            self.assertNotEqual(tiles.tile_path(r, 1, 1, 0), path)
+        finally:
+            s3.acl_stamp = acl_stamp
+
+# =============================================================================
+class MapClusterTests(unittest.TestCase):
+    """ Test server-side clustering of point layers """
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        current.auth.override = True
+
+        table = current.s3db.gis_location
+
+        # Three points close together, one far away
+        self.near = [table.insert(name="MapClusterTestNear",
+                                  lat=10.0 + i * 0.001,
+                                  lon=30.0 + i * 0.001,
+                                  )
+                     for i in (1, 2, 3)]
+        self.far = table.insert(name="MapClusterTestFar",
+                                lat=11.0,
+                                lon=31.0,
+                                )
+
+    # -------------------------------------------------------------------------
+    def testClusters(self):
+        """ Test grouping of points in grid cells """
+
+        from s3.s3gis import S3MapClusters
+
+        table = current.s3db.gis_location
+        resource = current.s3db.resource("gis_location",
+                                         filter=(table.name.like("MapClusterTest%")))
+
+        # Grid cells of ~0.05 degrees: near points clustered
+        clusters = S3MapClusters.clusters(resource, 10)
+        self.assertEqual(len(clusters), 2)
+        clusters = dict((c[0], c) for c in clusters)
+
+        count, lat, lon, record_id = clusters[3]
+        self.assertAlmostEqual(lat, 10.002, 6)
+        self.assertAlmostEqual(lon, 30.002, 6)
+        self.assertTrue(record_id in self.near)
+
+        count, lat, lon, record_id = clusters[1]
+        self.assertEqual(record_id, self.far)
+        self.assertAlmostEqual(lat, 11.0, 6)
+
+        # Grid cells of ~0.0003 degrees: no clusters
+        clusters = S3MapClusters.clusters(resource, 18)
+        self.assertEqual(len(clusters), 4)
+        self.assertEqual(set(c[0] for c in clusters), set([1]))
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        current.db.rollback()
+        current.auth.override = False
+
+# =============================================================================
+class SimplifiedGeometryTests(unittest.TestCase):
+    """ Test precomputed simplified geometries of Locations """
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        current.auth.override = True
+
+        table = current.s3db.gis_location
+        self.polygon = table.insert(name="SimplifiedGeometryTestPolygon",
+                                    gis_feature_type=3,
+                                    wkt="POLYGON((30 10,30.1 10.00001,30.2 10,30.2 10.2,30 10.2,30 10))",
+                                    )
+        self.point = table.insert(name="SimplifiedGeometryTestPoint",
+                                  gis_feature_type=1,
+                                  wkt="POINT(30 10)",
+                                  lat=10,
+                                  lon=30,
+                                  )
+
+    # -------------------------------------------------------------------------
+    def testUpdateSimplified(self):
+        """ Test precomputing and looking up simplified geometries """
+
+        try:
+            import shapely
+        except ImportError:
+            return
+
+        from s3.s3gis import SIMPLIFY_TOLERANCES
+
+        db = current.db
+        gis = current.gis
+        stable = current.s3db.gis_location_simplified
+
+        ids = [self.polygon, self.point]
+        count = gis.update_simplified(ids)
+        self.assertEqual(count, 1)
+
+        # All tolerances for the polygon, nothing for the point
+        query = (stable.location_id.belongs(ids))
+        rows = db(query).select(stable.location_id,
+                                stable.tolerance)
+        self.assertEqual(len(rows), len(SIMPLIFY_TOLERANCES))
+        self.assertEqual(set(row.location_id for row in rows),
+                         set([self.polygon]))
+
+        # Same result as the runtime simplification
+        geometries = gis.get_simplified(ids, tolerance=0.01, output="geojson")
+        expected = gis.simplify(db.gis_location[self.polygon].wkt,
+                                tolerance=0.01,
+                                output="geojson")
+        self.assertEqual(geometries[self.polygon], expected)
+        self.assertTrue(self.point in geometries)
+
+        # Precomputed geometry used where possible...
+        query = (stable.location_id == self.polygon)
+        db(query).update(geojson="PRECOMPUTED")
+        geometries = gis.get_simplified([self.polygon],
+                                        tolerance=0.05,
+                                        output="geojson")
+        self.assertEqual(geometries[self.polygon], "PRECOMPUTED")
+
+        # ...but not if more precision is required
+        geometries = gis.get_simplified([self.polygon],
+                                        tolerance=0.00001,
+                                        output="geojson")
+        self.assertNotEqual(geometries[self.polygon], "PRECOMPUTED")
+        geometries = gis.get_simplified([self.polygon],
+                                        tolerance=0.01,
+                                        decimals=6,
+                                        output="geojson")
+        self.assertNotEqual(geometries[self.polygon], "PRECOMPUTED")
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        current.db.rollback()
+        current.auth.override = False
+
+# =============================================================================
+class LocationTreeTests(unittest.TestCase):
+    """ Test set-based updates of the Location Hierarchy """
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        current.auth.override = True
+
+        table = current.s3db.gis_location
+
+        self.L0 = table.insert(name="LocationTreeTestL0",
+                               level="L0",
+                               lat=10.0,
+                               lon=30.0,
+                               )
+        self.L1 = table.insert(name="LocationTreeTestL1",
+                               level="L1",
+                               parent=self.L0,
+                               lat=11.0,
+                               lon=31.0,
+                               )
+        # Skipping L2
+        self.L3 = table.insert(name="LocationTreeTestL3",
+                               level="L3",
+                               parent=self.L1,
+                               inherited=True,
+                               )
+        # Specific location inheriting its Lat/Lon
+        self.specific = table.insert(name="LocationTreeTestSpecific",
+                                     parent=self.L3,
+                                     )
+
+    # -------------------------------------------------------------------------
+    def testUpdateDescendants(self):
+        """ Test updating all locations below a location """
+
+        db = current.db
+        gis = current.gis
+        table = db.gis_location
+
+        gis.update_location_roots(table.id == self.L0)
+        count = gis.update_location_descendants(self.L0)
+        self.assertEqual(count, 3)
+
+        row = db(table.id == self.L0).select(table.path,
+                                             table.L0,
+                                             limitby=(0, 1)).first()
+        self.assertEqual(row.path, str(self.L0))
+        self.assertEqual(row.L0, "LocationTreeTestL0")
+
+        row = db(table.id == self.specific).select(limitby=(0, 1)).first()
+        self.assertEqual(row.path, "%s/%s/%s/%s" % (self.L0,
+                                                     self.L1,
+                                                     self.L3,
+                                                     self.specific))
+        self.assertEqual(row.L0, "LocationTreeTestL0")
+        self.assertEqual(row.L1, "LocationTreeTestL1")
+        self.assertEqual(row.L2, None)
+        self.assertEqual(row.L3, "LocationTreeTestL3")
+        self.assertEqual(row.L4, None)
+        # Lat/Lon inherited via the L3
+        self.assertTrue(row.inherited)
+        self.assertEqual((row.lat, row.lon), (11.0, 31.0))
+        self.assertEqual(row.lat_min, 11.0)
+
+    # -------------------------------------------------------------------------
+    def testUpdateParent(self):
+        """ Test incremental update when a parent changes """
+
+        db = current.db
+        gis = current.gis
+        table = db.gis_location
+
+        gis.update_location_roots(table.id == self.L0)
+        gis.update_location_descendants(self.L0)
+
+        # Rename and move the L1
+        db(table.id == self.L1).update(name="LocationTreeTestL1Renamed",
+                                       lat=12.0,
+                                       lon=32.0,
+                                       )
+        gis.update_location_tree({"id": self.L1, "level": "L1"})
+
+        row = db(table.id == self.specific).select(limitby=(0, 1)).first()
+        self.assertEqual(row.L1, "LocationTreeTestL1Renamed")
+        self.assertEqual((row.lat, row.lon), (12.0, 32.0))
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        current.db.rollback()
+        current.auth.override = False
+
+# =============================================================================
+def run_suite(*test_classes):
+    """ Run the test suite """
+
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    for test_class in test_classes:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+    if suite is not None:
+        unittest.TextTestRunner(verbosity=2).run(suite)
+    return
+
+if __name__ == "__main__":
+
+    run_suite(
+        SpatialQueryTests,
+        MapTileTests,
+        MapClusterTests,
+        SimplifiedGeometryTests,
+        LocationTreeTests,
+    )
+
+# END ========================================================================
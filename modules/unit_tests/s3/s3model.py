@@ -6,13 +6,259 @@
 # python web2py.py -S eden -M -R applications/eden/tests/unit_tests/modules/s3/s3model.py
 #
 import unittest
+from gluon import current
 from gluon.dal import Query
 
+from s3.s3fields import S3Index
+
 # =============================================================================
 class S3ModelTests(unittest.TestCase):
 
     pass
 
+# =============================================================================
+class ComputedColumnTests(unittest.TestCase):
+    """ Test persisted computed columns """
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        current.auth.override = True
+
+        s3db = current.s3db
+        ptable = s3db.project_project
+        self.project_id = ptable.insert(name="ComputedColumnTestProject")
+
+    # -------------------------------------------------------------------------
+    def testIncrementalUpdate(self):
+        """ Test that computed columns follow writes to dependencies """
+
+        db = current.db
+        s3db = current.s3db
+        ptable = s3db.project_project
+        btable = s3db.project_annual_budget
+
+        self.assertTrue("project_project" in s3db.COMPUTED)
+
+        project_id = self.project_id
+        total = lambda: db(ptable.id == project_id).select(
+                            ptable.total_annual_budget).first().total_annual_budget
+
+        # Insert budgets
+        for year, amount in ((2012, 100.0), (2013, 50.0)):
+            record = {"project_id": project_id,
+                      "year": year,
+                      "amount": amount,
+                      "currency": "USD",
+                      }
+            record["id"] = btable.insert(**record)
+            s3db.update_super(btable, record)
+        self.assertEqual(total(), 150.0)
+
+        # Delete one budget
+        resource = s3db.resource("project_annual_budget",
+                                 id=record["id"])
+        resource.delete()
+        self.assertEqual(total(), 100.0)
+
+    # -------------------------------------------------------------------------
+    def testMoveToOtherParent(self):
+        """ Test that both parents are updated when a record is moved """
+
+        db = current.db
+        s3db = current.s3db
+        ptable = s3db.project_project
+        btable = s3db.project_annual_budget
+
+        project_id = self.project_id
+        other_id = ptable.insert(name="ComputedColumnTestProject2")
+        total = lambda record_id: db(ptable.id == record_id).select(
+                    ptable.total_annual_budget).first().total_annual_budget
+
+        record = {"project_id": project_id,
+                  "year": 2013,
+                  "amount": 80.0,
+                  "currency": "USD",
+                  }
+        record["id"] = btable.insert(**record)
+        s3db.update_super(btable, record)
+        self.assertEqual(total(project_id), 80.0)
+
+        # Move the budget to the other project
+        db(btable.id == record["id"]).update(project_id=other_id)
+        self.assertEqual(total(other_id), 80.0)
+        self.assertFalse(total(project_id))
+
+        # Updates which don't move the record don't affect other projects
+        db(btable.id == record["id"]).update(project_id=other_id,
+                                             amount=60.0)
+        record = db(btable.id == record["id"]).select().first()
+        s3db.update_super(btable, record)
+        self.assertEqual(total(other_id), 60.0)
+        self.assertFalse(total(project_id))
+
+    # -------------------------------------------------------------------------
+    def testComputedTables(self):
+        """ Test that only writes to relevant tables update computed columns """
+
+        s3db = current.s3db
+
+        tablenames = s3db.computed_tables()
+        for tablename in ("project_project",
+                          "project_organisation",
+                          "project_annual_budget"):
+            self.assertTrue(tablename in tablenames)
+        self.assertFalse("org_office" in tablenames)
+
+        # Unrelated tables have no dependents
+        dependents = s3db.computed_dependents("org_office", [1])
+        self.assertEqual(dependents, {})
+
+    # -------------------------------------------------------------------------
+    def testRebuild(self):
+        """ Test rebuild of computed columns """
+
+        db = current.db
+        s3db = current.s3db
+        ptable = s3db.project_project
+        btable = s3db.project_annual_budget
+
+        project_id = self.project_id
+        btable.insert(project_id=project_id,
+                      year=2013,
+                      amount=75.0,
+                      currency="USD")
+
+        # Not updated without onaccept
+        row = db(ptable.id == project_id).select(ptable.total_annual_budget,
+                                                 ptable.modified_on).first()
+        self.assertEqual(row.total_annual_budget, None)
+
+        updated = s3db.rebuild_computed("project_project",
+                                        record_ids=[project_id])
+        self.assertEqual(updated, 1)
+        rebuilt = db(ptable.id == project_id).select(ptable.total_annual_budget,
+                                                     ptable.modified_on).first()
+        self.assertEqual(rebuilt.total_annual_budget, 75.0)
+        # Not a change of the record
+        self.assertEqual(rebuilt.modified_on, row.modified_on)
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        current.db.rollback()
+        current.auth.override = False
+
+# =============================================================================
+class IndexTests(unittest.TestCase):
+    """ Test declarative index specifications """
+
+    # -------------------------------------------------------------------------
+    def testParse(self):
+        """ Test parsing of index specifications """
+
+        index = S3Index.parse("name")
+        self.assertEqual(index.fields, ("name",))
+
+        index = S3Index.parse(("pe_id", "ancestor"))
+        self.assertEqual(index.fields, ("pe_id", "ancestor"))
+        self.assertEqual(index.index_name("pr_ancestry"),
+                         "pr_ancestry_pe_id_ancestor__idx")
+
+        spec = S3Index("organisation_id", active=True)
+        self.assertTrue(S3Index.parse(spec) is spec)
+
+        # Long names are shortened
+        index = S3Index("a_very_long_field_name", "another_long_field_name")
+        name = index.index_name("some_rather_long_table_name")
+        self.assertTrue(len(name) <= 63)
+
+    # -------------------------------------------------------------------------
+    def testCovered(self):
+        """ Test detection of existing indexes """
+
+        existing = [("id",), ("pe_id", "ancestor")]
+
+        self.assertTrue(S3Index("pe_id").covered(existing))
+        self.assertTrue(S3Index("pe_id", "ancestor").covered(existing))
+        self.assertFalse(S3Index("ancestor").covered(existing))
+        self.assertFalse(S3Index("pe_id", unique=True).covered(existing))
+
+    # -------------------------------------------------------------------------
+    def testIndexes(self):
+        """ Test declared and automatic indexes of a table """
+
+        s3db = current.s3db
+
+        indexes = dict((index.fields, index)
+                       for index in s3db.indexes("pr_person"))
+
+        # Declared
+        self.assertTrue(("first_name",) in indexes)
+        self.assertTrue(("last_name",) in indexes)
+        # Automatic
+        self.assertTrue(("pe_id",) in indexes)
+        self.assertTrue(("deleted",) in indexes)
+        self.assertTrue(("owned_by_user",) in indexes)
+
+    # -------------------------------------------------------------------------
+    def testExisting(self):
+        """ Test reading existing indexes from the catalog """
+
+        table = current.s3db.pr_person
+        existing = S3Index.existing(table)
+        if existing is None:
+            # Database engine not supported
+            return
+        self.assertTrue(("id",) in existing)
+
+    # -------------------------------------------------------------------------
+    def testAdvise(self):
+        """ Test the index advisor """
+
+        import sys
+        from StringIO import StringIO
+
+        table = current.s3db.pr_person
+        if S3Index.existing(table) is None:
+            # Database engine not supported
+            return
+
+        advised = S3Index.ADVISED
+        shapes = (("filter", "pr_person", ("deleted", "preferred_name")),
+                  ("filter", "pr_person", ("deleted",)),
+                  ("orderby", "pr_person", ("preferred_name",)),
+                  )
+        for shape in shapes:
+            advised.discard(shape)
+
+        stderr = sys.stderr
+        sys.stderr = output = StringIO()
+        try:
+            # Filter and order by a column without index
+            query = (table.preferred_name == "Test") & (table.deleted != True)
+            orderby = table.preferred_name
+            reported = S3Index.advise(query, orderby=orderby)
+            # The deleted flag alone is not worth an index
+            reported.extend(S3Index.advise(table.deleted != True))
+            # Each shape is only reported once
+            reported.extend(S3Index.advise(query, orderby=orderby))
+        finally:
+            sys.stderr = stderr
+
+        self.assertEqual(reported,
+                         [("filter", "pr_person", ("preferred_name",)),
+                          ("orderby", "pr_person", ("preferred_name",)),
+                          ])
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].endswith(
+                        "no index for filter by pr_person(preferred_name)"))
+        self.assertTrue(lines[1].endswith(
+                        "no index for orderby by pr_person(preferred_name)"))
+        for shape in shapes:
+            self.assertTrue(shape in advised)
+
 # =============================================================================
 def run_suite(*test_classes):
     """ Run the test suite """
@@ -30,6 +276,8 @@ if __name__ == "__main__":
 
     run_suite(
         S3ModelTests,
+        ComputedColumnTests,
+        IndexTests,
     )
 
 # END ========================================================================
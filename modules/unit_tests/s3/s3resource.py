@@ -12,6 +12,7 @@ from gluon import *
 from gluon.storage import Storage
 from gluon.dal import Row
 from s3.s3resource import *
+from s3.s3aaa import S3Audit
 from s3.s3fields import s3_meta_fields
 
 # =============================================================================
@@ -227,6 +228,36 @@ class FieldSelectorResolutionTests(unittest.TestCase):
         
         self.assertTrue(distinct)
 
+    # -------------------------------------------------------------------------
+    def testResolvedSelectorCache(self):
+        """ Resolved selectors are re-used within the request """
+
+        s3db = current.s3db
+
+        resource = s3db.resource("org_office")
+        lf1 = S3FieldPath.resolve(resource, "organisation_id$name")
+        resource = s3db.resource("org_office")
+        lf2 = S3FieldPath.resolve(resource, "organisation_id$name")
+        self.assertTrue(lf1 is lf2)
+        self.assertEqual(lf2.colname, "org_organisation.name")
+
+        # Components get attached even if the selector is cached
+        resource = s3db.resource("pr_person")
+        cf1 = S3FieldPath.resolve(resource, "identity.value")
+        resource = s3db.resource("pr_person", components=[])
+        cf2 = S3FieldPath.resolve(resource, "identity.value")
+        self.assertTrue(cf1 is cf2)
+        self.assertTrue("identity" in resource.components)
+
+        # Configuration changes invalidate the cache
+        s3db.configure("org_office", virtual_sql={})
+        try:
+            resource = s3db.resource("org_office")
+            lf3 = S3FieldPath.resolve(resource, "organisation_id$name")
+            self.assertFalse(lf3 is lf2)
+        finally:
+            s3db.clear_config("org_office", "virtual_sql")
+
 # =============================================================================
 class ResourceFilterJoinTests(unittest.TestCase):
     """ Test query construction from S3ResourceQueries """
@@ -494,6 +525,41 @@ class ResourceFilterQueryTests(unittest.TestCase):
                     (org_organisation.id.like("%abc%")))
         self.assertEqual(str(query), str(expected))
 
+    # -------------------------------------------------------------------------
+    @unittest.skipIf(not current.deployment_settings.has_module("org"), "org module disabled")
+    def testVirtualFieldSQLExpression(self):
+        """ Test push-down of virtual field filters with SQL expression """
+
+        s3db = current.s3db
+
+        org_organisation = s3db.org_organisation
+
+        q = (S3FieldSelector("vsqltest") == "test")
+
+        # Without SQL expression => virtual filter
+        resource = s3db.resource("org_organisation", filter=q)
+        rfilter = resource.rfilter
+        query = rfilter.get_query()
+        expected = ((org_organisation.deleted != True) &
+                    (org_organisation.id > 0))
+        self.assertEqual(str(query), str(expected))
+        self.assertNotEqual(rfilter.get_filter(), None)
+
+        # With SQL expression => DAL query
+        s3db.configure("org_organisation",
+                       virtual_sql = {"vsqltest": "name"})
+        try:
+            resource = s3db.resource("org_organisation", filter=q)
+            rfilter = resource.rfilter
+            query = rfilter.get_query()
+            expected = (((org_organisation.deleted != True) &
+                         (org_organisation.id > 0)) &
+                        (org_organisation.name == "test"))
+            self.assertEqual(str(query), str(expected))
+            self.assertEqual(rfilter.get_filter(), None)
+        finally:
+            s3db.clear_config("org_organisation", "virtual_sql")
+
     # -------------------------------------------------------------------------
     @unittest.skipIf(not current.deployment_settings.has_module("project"), "project module disabled")
     def testMasterFilterConstruction(self):
@@ -1597,6 +1663,483 @@ class ResourceDataAccessTests(unittest.TestCase):
         current.db.rollback()
         current.auth.override = False
 
+# =============================================================================
+class ResourceKeysetPaginationTests(unittest.TestCase):
+    """ Test keyset pagination """
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        current.auth.override = True
+
+    # -------------------------------------------------------------------------
+    def testCursorEncodeDecode(self):
+        """ Test encoding and decoding of cursor tokens """
+
+        table = current.s3db.org_organisation
+
+        keys = S3KeysetCursor.keys(table, [(table.name, False)])
+        self.assertEqual(len(keys), 2)
+        self.assertEqual(str(keys[-1][0]), str(table._id))
+
+        now = datetime.datetime(2013, 10, 16, 23, 34, 49)
+        token = S3KeysetCursor.encode(25, "signature", ["Test", now, 3])
+
+        cursor = S3KeysetCursor(token)
+        self.assertEqual(cursor.start, 25)
+        self.assertEqual(cursor.signature, "signature")
+        self.assertEqual(cursor.values, ["Test", now, 3])
+
+        # Invalid tokens are ignored
+        cursor = S3KeysetCursor("invalid")
+        self.assertEqual(cursor.start, None)
+        self.assertEqual(cursor.query(0, "signature", keys), None)
+
+    # -------------------------------------------------------------------------
+    def testCursorQuery(self):
+        """ Test construction of the seek query """
+
+        table = current.s3db.org_organisation
+
+        keys = S3KeysetCursor.keys(table, [(table.name, True)])
+        token = S3KeysetCursor.encode(10, "signature", ["Test", 4])
+        cursor = S3KeysetCursor(token)
+
+        # Cursor doesn't match the page
+        self.assertEqual(cursor.query(20, "signature", keys), None)
+        self.assertEqual(cursor.query(10, "other", keys), None)
+
+        query = cursor.query(10, "signature", keys)
+        expected = (table.name < "Test") | \
+                   ((table.name == "Test") & (table.id > 4))
+        self.assertEqual(str(query), str(expected))
+
+    # -------------------------------------------------------------------------
+    def testCursorQueryNulls(self):
+        """ Test construction of the seek query for nullable keys """
+
+        table = current.s3db.org_organisation
+        nulls_largest = current.db._dbname == "postgres"
+
+        keys = S3KeysetCursor.keys(table, [(table.acronym, False)])
+
+        # Last value not NULL
+        token = S3KeysetCursor.encode(10, "signature", ["TST", 4])
+        query = S3KeysetCursor(token).query(10, "signature", keys)
+        if nulls_largest:
+            expected = ((table.acronym > "TST") | (table.acronym == None)) | \
+                       ((table.acronym == "TST") & (table.id > 4))
+        else:
+            expected = (table.acronym > "TST") | \
+                       ((table.acronym == "TST") & (table.id > 4))
+        self.assertEqual(str(query), str(expected))
+
+        # Last value NULL
+        token = S3KeysetCursor.encode(10, "signature", [None, 4])
+        query = S3KeysetCursor(token).query(10, "signature", keys)
+        if nulls_largest:
+            expected = (table.acronym == None) & (table.id > 4)
+        else:
+            expected = (table.acronym != None) | \
+                       ((table.acronym == None) & (table.id > 4))
+        self.assertEqual(str(query), str(expected))
+
+    # -------------------------------------------------------------------------
+    def testSelectWithCursorNulls(self):
+        """ Test that keyset pagination does not skip NULL keys """
+
+        s3db = current.s3db
+        table = s3db.org_organisation
+
+        try:
+            expected = set()
+            acronyms = ("KNTA", None, "KNTB", None, "KNTC")
+            for i, acronym in enumerate(acronyms):
+                record_id = table.insert(name="KeysetNullTestOrg%s" % i,
+                                         acronym=acronym)
+                expected.add(record_id)
+
+            from s3.s3resource import S3FieldSelector as FS
+            resource = s3db.resource("org_organisation")
+            resource.add_filter(FS("name").like("KeysetNullTestOrg%"))
+
+            for orderby in ("org_organisation.acronym",
+                            "org_organisation.acronym desc"):
+                ids = []
+                start = 0
+                cursor = ""
+                while cursor is not None:
+                    data = resource.select(["id"],
+                                           start=start,
+                                           limit=2,
+                                           orderby=orderby,
+                                           cursor=cursor)
+                    page = [row["org_organisation.id"] for row in data["rows"]]
+                    if not page:
+                        break
+                    ids.extend(page)
+                    start += len(page)
+                    cursor = data.get("cursor")
+                self.assertEqual(len(ids), len(acronyms))
+                self.assertEqual(set(ids), expected)
+        finally:
+            current.db.rollback()
+
+    # -------------------------------------------------------------------------
+    def testSelectWithCursor(self):
+        """ Test that keyset pagination yields the same pages as offset """
+
+        resource = current.s3db.resource("org_organisation")
+        fields = ["id", "name"]
+        orderby = "org_organisation.name"
+
+        data = resource.select(fields, start=0, limit=2, orderby=orderby)
+        expected = [row["org_organisation.id"] for row in data["rows"]]
+        data = resource.select(fields, start=2, limit=2, orderby=orderby)
+        expected += [row["org_organisation.id"] for row in data["rows"]]
+
+        data = resource.select(fields, start=0, limit=2, orderby=orderby,
+                               cursor="")
+        self.assertTrue("cursor" in data)
+        ids = [row["org_organisation.id"] for row in data["rows"]]
+        cursor = data["cursor"]
+        if cursor:
+            data = resource.select(fields, start=2, limit=2, orderby=orderby,
+                                   cursor=cursor)
+            ids += [row["org_organisation.id"] for row in data["rows"]]
+        self.assertEqual(ids, expected)
+
+    # -------------------------------------------------------------------------
+    def testIterSelect(self):
+        """ Test that iterselect yields the same records as select """
+
+        resource = current.s3db.resource("org_organisation")
+        fields = ["id", "name"]
+        orderby = "org_organisation.name"
+
+        data = resource.select(fields, limit=None, orderby=orderby)
+        expected = [row["org_organisation.id"] for row in data["rows"]]
+
+        rows = resource.iterselect(fields, chunk_size=2, orderby=orderby)
+        ids = [row["org_organisation.id"] for row in rows]
+        self.assertEqual(ids, expected)
+
+    # -------------------------------------------------------------------------
+    def testIterSelectFallback(self):
+        """ Test that iterselect seeks by record ID if keyset is not possible """
+
+        resource = current.s3db.resource("org_organisation")
+        fields = ["id", "name"]
+        orderby = "org_organisation_type.name"
+
+        data = resource.select(fields, limit=None, orderby=orderby)
+        expected = sorted([row["org_organisation.id"] for row in data["rows"]])
+
+        rows = resource.iterselect(fields, chunk_size=2, orderby=orderby)
+        ids = [row["org_organisation.id"] for row in rows]
+        self.assertEqual(ids, expected)
+
+        # Record IDs added for seeking must not show up in the output
+        rows = list(resource.iterselect(["name"],
+                                        chunk_size=2,
+                                        orderby=orderby,
+                                        represent=True))
+        self.assertEqual(len(rows), len(expected))
+        for row in rows:
+            self.assertFalse("org_organisation.id" in row)
+            self.assertFalse("_row" in row)
+
+    # -------------------------------------------------------------------------
+    def testRawColumns(self):
+        """ Test that raw_columns returns the same data as rows """
+
+        resource = current.s3db.resource("org_organisation")
+        fields = ["id", "name", "organisation_type_id"]
+        orderby = "org_organisation.name"
+
+        for represent in (False, True):
+            data = resource.select(fields,
+                                   limit=None,
+                                   orderby=orderby,
+                                   represent=represent)
+            rows = data["rows"]
+
+            data = resource.select(fields,
+                                   limit=None,
+                                   orderby=orderby,
+                                   represent=represent,
+                                   raw_columns=True)
+            self.assertFalse("rows" in data)
+            columns = data["columns"]
+
+            for colname in ("org_organisation.id",
+                            "org_organisation.name",
+                            "org_organisation.organisation_type_id"):
+                self.assertTrue(colname in columns)
+                expected = [row[colname] for row in rows]
+                self.assertEqual(columns[colname], expected)
+
+        chunks = list(resource.iterselect(fields,
+                                          chunk_size=2,
+                                          orderby=orderby,
+                                          raw_columns=True))
+        ids = []
+        for chunk in chunks:
+            ids.extend(chunk["org_organisation.id"])
+        data = resource.select(fields, limit=None, orderby=orderby)
+        expected = [row["org_organisation.id"] for row in data["rows"]]
+        self.assertEqual(ids, expected)
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        current.auth.override = False
+
+# =============================================================================
+class ResourceSelectCacheTests(unittest.TestCase):
+    """ Test the cross-request select results cache """
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        current.auth.override = True
+
+        s3db = current.s3db
+        s3db.configure("org_organisation", select_cache=60)
+
+        table = s3db.org_organisation
+        self.org_id = table.insert(name="SelectCacheTestOrg")
+
+    # -------------------------------------------------------------------------
+    def testCacheHitAndInvalidation(self):
+        """ Test that cached results are reused until the table changes """
+
+        s3db = current.s3db
+        table = s3db.org_organisation
+        fields = ["id", "name"]
+
+        query = (S3FieldSelector("id") == self.org_id)
+        resource = s3db.resource("org_organisation", filter=query)
+        data = resource.select(fields, limit=None)
+        self.assertEqual(data["rows"][0]["org_organisation.name"],
+                         "SelectCacheTestOrg")
+
+        # Change the record without invalidating the cache
+        current.db(table.id == self.org_id).update(name="Changed")
+        resource = s3db.resource("org_organisation", filter=query)
+        data = resource.select(fields, limit=None)
+        self.assertEqual(data["rows"][0]["org_organisation.name"],
+                         "SelectCacheTestOrg")
+        self.assertEqual(len(data["rfields"]), 2)
+
+        # Modifying the cached result must not affect the cache
+        data["rows"][0]["org_organisation.name"] = "Modified"
+        data = resource.select(fields, limit=None)
+        self.assertEqual(data["rows"][0]["org_organisation.name"],
+                         "SelectCacheTestOrg")
+
+        # Invalidate => fresh result
+        S3SelectCache.invalidate("org_organisation")
+        data = resource.select(fields, limit=None)
+        self.assertEqual(data["rows"][0]["org_organisation.name"],
+                         "Changed")
+
+    # -------------------------------------------------------------------------
+    def testCachedCount(self):
+        """ Test that cached counts are reused until the table changes """
+
+        s3db = current.s3db
+        table = s3db.org_organisation
+
+        query = (S3FieldSelector("name") == "SelectCacheTestOrg")
+        resource = s3db.resource("org_organisation", filter=query)
+        self.assertEqual(resource.count(), 1)
+
+        # Insert without invalidating the cache
+        table.insert(name="SelectCacheTestOrg")
+        resource = s3db.resource("org_organisation", filter=query)
+        self.assertEqual(resource.count(), 1)
+
+        # Invalidate => exact count
+        S3SelectCache.invalidate("org_organisation")
+        resource = s3db.resource("org_organisation", filter=query)
+        self.assertEqual(resource.count(), 2)
+
+    # -------------------------------------------------------------------------
+    def testApproximateCount(self):
+        """ Test approximate counts above the threshold """
+
+        s3db = current.s3db
+        s3db.configure("org_organisation", count_estimate=0)
+
+        resource = s3db.resource("org_organisation")
+        exact = resource.count()
+        self.assertFalse(getattr(exact, "approximate", False))
+
+        resource = s3db.resource("org_organisation")
+        numrows = resource.count(approximate=True)
+        if getattr(numrows, "approximate", False):
+            # Planner estimate available
+            self.assertTrue(isinstance(numrows, S3ApproximateCount))
+        else:
+            # No estimate available => exact count
+            self.assertEqual(numrows, exact)
+
+        # Exact count requested after approximate count
+        self.assertEqual(resource.count(), exact)
+
+    # -------------------------------------------------------------------------
+    def testApproximateDataTableCount(self):
+        """ Test approximate numbers of rows in data tables """
+
+        s3db = current.s3db
+        s3db.configure("org_organisation", count_estimate=0)
+
+        resource = s3db.resource("org_organisation")
+        exact = resource.count()
+
+        resource = s3db.resource("org_organisation")
+        dt, numrows, ids = resource.datatable(fields=["name"],
+                                              limit=2,
+                                              approximate=True)
+        if getattr(numrows, "approximate", False):
+            # Planner estimate available
+            self.assertTrue(isinstance(numrows, S3ApproximateCount))
+        else:
+            # No estimate available => exact count
+            self.assertEqual(numrows, exact)
+
+        # Exact count unless approximate is requested
+        resource = s3db.resource("org_organisation")
+        dt, numrows, ids = resource.datatable(fields=["name"], limit=2)
+        self.assertFalse(getattr(numrows, "approximate", False))
+        self.assertEqual(numrows, exact)
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        current.s3db.clear_config("org_organisation",
+                                  "select_cache",
+                                  "count_estimate")
+        current.db.rollback()
+        current.auth.override = False
+
+# =============================================================================
+class ResourceJournalTests(unittest.TestCase):
+    """ Test the change journal """
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+
+        current.auth.override = True
+
+        settings = current.deployment_settings
+        self.journal = settings.base.get("journal")
+        settings.base.journal = True
+
+    # -------------------------------------------------------------------------
+    def testChanges(self):
+        """ Test recording and retrieving changes """
+
+        db = current.db
+        s3db = current.s3db
+        table = s3db.org_organisation
+
+        since = S3Journal.sequence()
+
+        org_id = table.insert(name="JournalTestOrg")
+        current.audit("create", "org", "organisation", record=org_id)
+        record = db(table.id == org_id).select(table.uuid,
+                                               limitby=(0, 1)).first()
+
+        resource = s3db.resource("org_organisation", id=org_id)
+        resource.delete()
+
+        rows = S3Journal.changes(since=since,
+                                 tablenames=["org_organisation"])
+        self.assertEqual([row.op for row in rows], ["create", "delete"])
+        for row in rows:
+            self.assertEqual(row.record_id, org_id)
+            self.assertEqual(row.uuid, record.uuid)
+        self.assertTrue(rows.last().id > rows.first().id)
+        self.assertEqual(S3Journal.sequence(), rows.last().id)
+
+        # Continue from the last sequence number
+        rows = S3Journal.changes(since=rows.first().id,
+                                 tablenames=["org_organisation"])
+        self.assertEqual([row.op for row in rows], ["delete"])
+        rows = S3Journal.changes(since=S3Journal.sequence())
+        self.assertEqual(len(rows), 0)
+
+        # Latest change per table
+        recently = datetime.datetime.utcnow() - datetime.timedelta(minutes=10)
+        latest = S3Journal.latest(["org_organisation", "pr_person"],
+                                  since=recently)
+        self.assertTrue("org_organisation" in latest)
+
+    # -------------------------------------------------------------------------
+    def testAuditDisabled(self):
+        """ Test that changes are recorded even if auditing is disabled """
+
+        settings = current.deployment_settings
+        security = settings.security
+        audit_read = security.get("audit_read")
+        audit_write = security.get("audit_write")
+        security.audit_read = False
+        security.audit_write = False
+
+        try:
+            audit = S3Audit()
+            self.assertFalse(audit.table)
+
+            table = current.s3db.org_organisation
+            since = S3Journal.sequence()
+            org_id = table.insert(name="JournalTestOrg")
+            audit("create", "org", "organisation", record=org_id)
+            audit("read", "org", "organisation", record=org_id)
+
+            rows = S3Journal.changes(since=since,
+                                     tablenames=["org_organisation"])
+            self.assertEqual([(row.op, row.record_id) for row in rows],
+                             [("create", org_id)])
+        finally:
+            security.audit_read = audit_read
+            security.audit_write = audit_write
+
+    # -------------------------------------------------------------------------
+    def testDisabled(self):
+        """ Test that nothing is recorded while the journal is disabled """
+
+        current.deployment_settings.base.journal = False
+        self.assertEqual(S3Journal.write("org_organisation", 1, "update"),
+                         None)
+
+    # -------------------------------------------------------------------------
+    def testPrune(self):
+        """ Test removal of outdated entries """
+
+        db = current.db
+        table = S3Journal.table()
+
+        since = S3Journal.sequence()
+        S3Journal.write("org_organisation", 1, "update", uuid="JOURNALTEST")
+        S3Journal.write("org_organisation", 2, "update", uuid="JOURNALTEST")
+
+        old = datetime.datetime.utcnow() - datetime.timedelta(days=10)
+        db(table.id > since).update(timestmp=old)
+        S3Journal.write("org_organisation", 3, "update", uuid="JOURNALTEST")
+
+        S3Journal.prune(retention=5)
+        rows = S3Journal.changes(since=since)
+        self.assertEqual([row.record_id for row in rows], [3])
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        current.deployment_settings.base.journal = self.journal
+        current.db.rollback()
+        current.auth.override = False
+
 # =============================================================================
 class ResourceAxisFilterTests(unittest.TestCase):
     """ Test Axis Filters """
@@ -2027,6 +2570,42 @@ class ResourceExportTests(unittest.TestCase):
             current.db.rollback()
             auth.override = False
 
+    # -------------------------------------------------------------------------
+    def testExportCSVReadableFields(self):
+        """ Test that CSV export does not include unreadable fields """
+
+        from s3.s3export import S3Exporter
+
+        auth = current.auth
+        s3db = current.s3db
+
+        auth.override = True
+
+        table = s3db.org_organisation
+        readable = table.comments.readable
+        try:
+            record_id = table.insert(name="CSVExportTestOrganisation",
+                                     comments="CSVExportTestComment")
+            table.comments.readable = False
+
+            resource = s3db.resource("org_organisation", id=record_id)
+            try:
+                output = S3Exporter().csv(resource)
+            except HTTP, e:
+                output = "".join(e.body)
+
+            self.assertTrue("CSVExportTestOrganisation" in output)
+            self.assertFalse("CSVExportTestComment" in output)
+
+            header = output.splitlines()[0].split(",")
+            self.assertTrue("org_organisation.id" in header)
+            self.assertFalse("org_organisation.comments" in header)
+
+        finally:
+            table.comments.readable = readable
+            current.db.rollback()
+            auth.override = False
+
 # =============================================================================
 class ResourceImportTests(unittest.TestCase):
     """ Test XML imports into resources """
@@ -3119,6 +3698,108 @@ class ResourceLazyVirtualFieldsSupportTests(unittest.TestCase):
                              item["pr_person.first_name"],
                              item["pr_person.last_name"]))
 
+    # -------------------------------------------------------------------------
+    def testLazyVirtualFieldsBatch(self):
+        """
+            Test whether lazy virtual fields with batch methods are
+            computed once for all records
+        """
+
+        s3db = current.s3db
+        calls = []
+        def batch_name(ids):
+            calls.append(ids)
+            table = s3db.pr_person
+            rows = current.db(table.id.belongs(ids)).select(table.id,
+                                                            table.first_name,
+                                                            table.last_name)
+            return dict((row.id, "%s %s" % (row.first_name, row.last_name))
+                        for row in rows)
+        s3db.configure("pr_person", virtual_batch={"name": batch_name})
+
+        try:
+            self.record_id = None
+            resource = s3db.resource("pr_person")
+            data = resource.select(["id", "name", "first_name", "last_name"],
+                                   limit=3)
+            rows = data["rows"]
+
+            # Batch method called once, per-row method not called
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(self.record_id, None)
+            self.assertEqual(set(calls[0]),
+                             set([row["pr_person.id"] for row in rows]))
+
+            for item in rows:
+                self.assertEqual(item["pr_person.name"], "%s %s" % (
+                                 item["pr_person.first_name"],
+                                 item["pr_person.last_name"]))
+        finally:
+            s3db.clear_config("pr_person", "virtual_batch")
+
+    # -------------------------------------------------------------------------
+    def testLazyVirtualFieldsFilterIterSelect(self):
+        """
+            Test whether iterselect yields every record exactly once when
+            filtering by a lazy virtual field (across multiple chunks)
+        """
+
+        s3db = current.s3db
+
+        ptable = s3db.pr_person
+        try:
+            expected = []
+            for i in xrange(5):
+                person_id = ptable.insert(first_name="VFIterTest%s" % i,
+                                          last_name="Person")
+                expected.append(person_id)
+
+            from s3.s3resource import S3FieldSelector as FS
+            resource = s3db.resource("pr_person")
+            resource.add_filter(FS("name").like("VFIterTest%"))
+
+            rows = resource.iterselect(["id", "name"],
+                                       chunk_size=2,
+                                       orderby="pr_person.first_name")
+            ids = [row["pr_person.id"] for row in rows]
+            self.assertEqual(ids, sorted(expected))
+        finally:
+            current.db.rollback()
+
+    # -------------------------------------------------------------------------
+    def testLazyVirtualFieldsFilterIDs(self):
+        """
+            Test whether record IDs and total number of rows are correct
+            when filtering by a lazy virtual field
+        """
+
+        s3db = current.s3db
+
+        ptable = s3db.pr_person
+        try:
+            person_ids = {}
+            for first_name in ("VFIDTestC", "VFIDTestA", "VFIDTestB"):
+                person_ids[first_name] = ptable.insert(first_name=first_name,
+                                                       last_name="Person")
+
+            from s3.s3resource import S3FieldSelector as FS
+            resource = s3db.resource("pr_person")
+            resource.add_filter(FS("name").like("VFIDTest%"))
+
+            data = resource.select(["name", "first_name", "last_name"],
+                                   start=0,
+                                   limit=2,
+                                   count=True,
+                                   getids=True,
+                                   orderby="pr_person.first_name")
+
+            # IDs in orderby order, total number of matching rows
+            self.assertEqual(data["ids"], [person_ids["VFIDTestA"],
+                                           person_ids["VFIDTestB"]])
+            self.assertEqual(data["numrows"], 3)
+        finally:
+            current.db.rollback()
+
     # -------------------------------------------------------------------------
     def tearDown(self):
 
@@ -3795,6 +4476,9 @@ if __name__ == "__main__":
         ResourceDataObjectAPITests,
 
         ResourceDataAccessTests,
+        ResourceKeysetPaginationTests,
+        ResourceSelectCacheTests,
+        ResourceJournalTests,
         ResourceAxisFilterTests,
         ResourceDataTableFilterTests,
         ResourceGetTests,
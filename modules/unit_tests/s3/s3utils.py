@@ -178,6 +178,55 @@ class S3DataTableTests(unittest.TestCase):
                                           limit=2)
         self.assertEqual(len(table.rows), 1)
 
+# =============================================================================
+class S3LRUCacheTests(unittest.TestCase):
+    """ Tests for the LRU cache """
+
+    def testEviction(self):
+        """ Test that least recently used entries get evicted """
+
+        cache = S3LRUCache(capacity=3)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        # Access "a" => "b" is now the least recently used entry
+        self.assertEqual(cache.get("a"), 1)
+        cache.set("d", 4)
+        self.assertEqual(cache.get("b"), None)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.get("d"), 4)
+        self.assertEqual(len(cache), 3)
+
+    def testWeight(self):
+        """ Test that the cache is bounded by the total weight of entries """
+
+        cache = S3LRUCache(capacity=10)
+        cache.set("a", 1, weight=4)
+        cache.set("b", 2, weight=4)
+        cache.set("c", 3, weight=4)
+        self.assertEqual(cache.get("a"), None)
+        self.assertEqual(cache.weight, 8)
+
+        # Entries heavier than the capacity are not cached at all
+        cache.set("d", 4, weight=11)
+        self.assertEqual(cache.get("d"), None)
+        self.assertEqual(cache.get("b"), 2)
+
+    def testExpiry(self):
+        """ Test that expired entries are not returned """
+
+        cache = S3LRUCache(capacity=10)
+        cache.set("a", 1, expire=-1)
+        cache.set("b", 2, expire=60)
+        self.assertEqual(cache.get("a", "default"), "default")
+        self.assertEqual(cache.get("b"), 2)
+
+        cache.delete("b")
+        self.assertEqual(cache.get("b"), None)
+        self.assertEqual(cache.weight, 0)
+
 # =============================================================================
 def run_suite(*test_classes):
     """ Run the test suite """
@@ -197,6 +246,7 @@ if __name__ == "__main__":
         S3FKWrappersTests,
         S3SQLTableTests,
         S3DataTableTests,
+        S3LRUCacheTests,
     )
 
 # END ========================================================================
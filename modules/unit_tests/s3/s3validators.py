@@ -127,6 +127,66 @@ class ISONEOFLazyRepresentationTests(unittest.TestCase):
             self.assertEqual(options[str(org.id)], org.name)
         self.assertEqual(renderer.queries, 0) # using default query
 
+    # -------------------------------------------------------------------------
+    def testIsOneOfLazy(self):
+        """ Test lookup and validation without building the set """
+
+        db = current.db
+        table = current.s3db.org_organisation
+        ids = self.ids
+        validator = IS_ONE_OF(db(table.id.belongs(ids[:3])),
+                              "org_organisation.id",
+                              "%(name)s",
+                              lazy=True)
+        self.assertTrue(validator.is_lazy())
+
+        # Lookup
+        items = validator.lookup("isoneof")
+        self.assertEqual([item[0] for item in items],
+                         [str(org_id) for org_id in ids[:3]])
+        self.assertEqual(items[0][1], "ISONEOF0")
+        items = validator.lookup("ISONEOF1")
+        self.assertEqual(items, [(str(ids[1]), "ISONEOF1")])
+        self.assertEqual(len(validator.lookup("isoneof", limit=2)), 2)
+
+        # Validation
+        value, error = validator(str(ids[0]))
+        self.assertEqual(error, None)
+        value, error = validator(str(ids[4]))
+        self.assertNotEqual(error, None)
+        value, error = validator("")
+        self.assertNotEqual(error, None)
+        self.assertEqual(validator.theset, None)
+
+        validator = IS_ONE_OF(db(table.id.belongs(ids[:3])),
+                              "org_organisation.id",
+                              "%(name)s",
+                              multiple=True,
+                              lazy=True)
+        value, error = validator([ids[0], ids[2]])
+        self.assertEqual(error, None)
+        self.assertEqual(value, [str(ids[0]), str(ids[2])])
+        value, error = validator([ids[0], ids[4]])
+        self.assertNotEqual(error, None)
+        self.assertEqual(validator.theset, None)
+
+        # Automatic mode
+        settings = current.deployment_settings
+        threshold = settings.get_ui_lazy_options_threshold()
+        try:
+            settings.ui.lazy_options_threshold = 2
+            validator = IS_ONE_OF(db(table.id.belongs(ids[:3])),
+                                  "org_organisation.id",
+                                  "%(name)s")
+            self.assertTrue(validator.is_lazy())
+            settings.ui.lazy_options_threshold = 3
+            validator = IS_ONE_OF(db(table.id.belongs(ids[:3])),
+                                  "org_organisation.id",
+                                  "%(name)s")
+            self.assertFalse(validator.is_lazy())
+        finally:
+            settings.ui.lazy_options_threshold = threshold
+
     # -------------------------------------------------------------------------
     def tearDown(self):
 
@@ -144,6 +144,84 @@ class PRTests(unittest.TestCase):
         current.db.rollback()
         current.auth.override = False
 
+# =============================================================================
+class AncestryTests(unittest.TestCase):
+    """ Tests for the ancestry table of the OU hierarchy """
+
+    # -------------------------------------------------------------------------
+    def setUp(self):
+        """ Set up organisation records """
+
+        auth = current.auth
+        s3db = current.s3db
+
+        auth.override = True
+
+        otable = s3db.org_organisation
+        pe_ids = []
+        for i in xrange(4):
+            org = Storage(name="Test Ancestry Organisation %s" % i)
+            org_id = otable.insert(**org)
+            org.update(id=org_id)
+            s3db.update_super(otable, org)
+            pe_ids.append(s3db.pr_get_pe_id("org_organisation", org_id))
+        self.pe_ids = pe_ids
+
+    # -------------------------------------------------------------------------
+    def testAncestry(self):
+        """ Test incremental ancestry updates and ancestry lookups """
+
+        s3db = current.s3db
+
+        root, branch, subbranch, other = self.pe_ids
+
+        add = s3db.pr_add_affiliation
+        add(root, branch, role="Branches")
+        add(branch, subbranch, role="Branches")
+        add(root, other, role="Partners", role_type=9)
+
+        ancestors = s3db.pr_get_ancestors(subbranch)
+        self.assertEqual(set(ancestors), set([str(root), str(branch)]))
+        self.assertEqual(s3db.pr_realm(subbranch), [branch])
+        self.assertEqual(s3db.pr_get_ancestors(other), [])
+
+        descendants = s3db.pr_descendants([root, branch])
+        self.assertEqual(set(descendants[root]), set([branch, subbranch]))
+        self.assertEqual(descendants[branch], [subbranch])
+        self.assertFalse(subbranch in descendants)
+
+        descendants = s3db.pr_get_descendants(root,
+                                              entity_types="org_organisation")
+        self.assertEqual(set(descendants), set([branch, subbranch]))
+
+        # Moving the branch to another parent updates the sub-branch
+        s3db.pr_remove_affiliation(root, branch, role="Branches")
+        add(other, branch, role="Branches")
+
+        ancestors = s3db.pr_get_ancestors(subbranch)
+        self.assertEqual(set(ancestors), set([str(other), str(branch)]))
+        self.assertEqual(s3db.pr_get_descendants(root), [])
+
+        # Rebuild gives the same ancestry
+        table = s3db.pr_ancestry
+        query = (table.pe_id.belongs(self.pe_ids))
+        def ancestry():
+            rows = current.db(query).select(table.pe_id,
+                                            table.ancestor,
+                                            table.depth)
+            return set((row.pe_id, row.ancestor, row.depth) for row in rows)
+        before = ancestry()
+        s3db.pr_rebuild_ancestry()
+        after = ancestry()
+        self.assertEqual(before, after)
+        self.assertTrue((subbranch, other, 2) in after)
+
+    # -------------------------------------------------------------------------
+    def tearDown(self):
+
+        current.db.rollback()
+        current.auth.override = False
+
 # =============================================================================
 class PersonDeduplicateTests(unittest.TestCase):
     """ PR Tests """
@@ -513,6 +591,7 @@ if __name__ == "__main__":
 
     run_suite(
         PRTests,
+        AncestryTests,
         PersonDeduplicateTests,
         SavedSearchTests,
     )
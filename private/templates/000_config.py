@@ -121,6 +121,23 @@ settings.frontpage.rss = [
 # Enable session store in Memcache to allow sharing of sessions across instances
 #settings.base.session_memcache = '127.0.0.1:11211'
 
+# Backend for the results cache of tables configured with select_cache:
+# "ram" (per process) or "memcache" (shared, requires session_memcache)
+#settings.base.select_cache = "memcache"
+# Maximum number of rows to hold in the per-process results cache
+#settings.base.select_cache_size = 10000
+
+# Create indexes for all foreign keys and meta-fields (in addition to the
+# indexes declared in the models) when running the migration step?
+#settings.base.auto_indexes = False
+# Report queries which lack a supporting index (development/tuning only)
+#settings.base.index_advisor = True
+
+# Record all changes in the change journal (for incremental sync & notifications)
+#settings.base.journal = True
+# Number of days to keep journal entries
+#settings.base.journal_retention = 30
+
 # Instance Name - for management scripts
 #settings.base.instance_name = "test"
 
@@ -172,12 +189,34 @@ settings.frontpage.rss = [
 #settings.ui.autocomplete = True
 #settings.ui.read_label = "Details"
 #settings.ui.update_label = "Edit"
+# Show estimated record numbers in list views of tables with more than this
+# number of records (uses the query planner in PostgreSQL, or ANALYZE statistics
+# in SQLite)
+#settings.ui.count_estimate_threshold = 100000
+# Cache the rendered options menus (for all users with the same roles)?
+#settings.ui.menu_cache = False
+# Render reference fields with more than this number of options as lookup
+# (search-as-you-type) widgets rather than dropdowns
+#settings.ui.lazy_options_threshold = 500
 
 # Audit settings
 # - can be a callable for custom hooks (return True to also perform normal logging, or False otherwise)
 # NB Auditing (especially Reads) slows system down & consumes diskspace
 #settings.security.audit_write = False
 #settings.security.audit_read = False
+# How to write audit records:
+# "sync" immediately, "batch" in one multi-row insert at the end of each request,
+# or "spool" to a local log file (moved into the database by the s3_audit_drain task)
+#settings.security.audit_mode = "sync"
+#settings.security.audit_spool = "/path/to/audit.spool"
+
+# Cache the realms of users between requests (security policy 6 and above):
+# "ram" per process, or "memcache" to share the cache between processes
+#settings.auth.realm_cache = False
+
+# Resolve permission checks from a per-process index of all ACLs (reloaded
+# when the ACLs change) rather than querying the ACL table for each check
+#settings.security.acl_cache = True
 
 # =============================================================================
 # Import the settings from the Template
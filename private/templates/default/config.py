@@ -218,6 +218,12 @@ settings.L10n.decimal_separator = "."
 # lon<0 have a duplicate at lon+360
 # lon>0 have a duplicate at lon-360
 #settings.gis.duplicate_features = True
+# Uncomment to load Feature Layers with Polygons as tiles, with the
+# geometries simplified per zoom level (cached in the cache folder)
+#settings.gis.feature_tiles = True
+# Uncomment to cluster Point Layers on the server if they have more than
+# this number of Features in the visible area
+#settings.gis.cluster_limit = 1000
 # Uncomment to use CMS to provide Metadata on Map Layers
 #settings.gis.layer_metadata = True
 # Uncomment to hide Layer Properties tool
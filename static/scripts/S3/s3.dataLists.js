@@ -371,7 +371,8 @@ function dlInfiniteScroll(datalist) {
         maxitems = dl_data['maxitems'],
         totalitems = dl_data['totalitems'],
         pagesize = dl_data['pagesize'],
-        ajaxurl = dl_data['ajaxurl'];
+        ajaxurl = dl_data['ajaxurl'],
+        cursor = dl_data['cursor'];
 
     if (!pagination.hasClass('dl-scroll')) {
         // No infiniteScroll
@@ -425,12 +426,18 @@ function dlInfiniteScroll(datalist) {
                 var limit = Math.min(pagesize, maxindex - start);
                 // Construct Ajax URL
                 var url = dlURLAppend(ajaxurl, 'start=' + start + '&limit=' + limit);
+                if (cursor) {
+                    // Keyset pagination cursor
+                    url = dlURLAppend(url, 'cursor=' + encodeURIComponent(cursor));
+                }
                 return url;
             },
             maxPage: maxpage
 
         },
         function(data) {
+            // Update the keyset pagination cursor
+            cursor = $(data).last().data('cursor');
             $('.dl').each(function() {
                 $(this).find('.dl-row:last:in-viewport').each(function() {
                     if (!$(this).hasClass('autoretrieve')) {
@@ -838,6 +838,11 @@
                         fnSetKey(aoData, 'iDisplayLength', iRequestLength * iPipe);
                     }
                     var nonDefaultData = aoData.filter(isNonDefaultData);
+                    // Pass the keyset pagination cursor (if any), the server
+                    // falls back to offset if it doesn't match the request
+                    if (oCache.hasOwnProperty('lastJson') && oCache.lastJson.cursor) {
+                        nonDefaultData.push({name: 'cursor', value: oCache.lastJson.cursor});
+                    }
                     $.getJSON(sSource, nonDefaultData, function(json) {
                         // Callback processing
                         oCache.lastJson = $.extend(true, {}, json);
@@ -947,6 +952,16 @@
                     dt.fnDraw(false);
                 });
             },
+            'fnInfoCallback': function(oSettings, iStart, iEnd, iMax, iTotal, sPre) {
+                // Estimated number of records
+                var oCache = cache[t];
+                if (oCache && oCache.lastJson && oCache.lastJson.approximate) {
+                    return i18n.sInfoApproximate.replace('_START_', iStart)
+                                                .replace('_END_', iEnd)
+                                                .replace('_TOTAL_', iTotal);
+                }
+                return sPre;
+            },
             'fnServerData': fnAjaxCallback[t],
             'fnRowCallback': function(nRow, aData, iDisplayIndex) {
                 var actionCol = tableConfig['actionCol'];
@@ -1,185 +1,1520 @@
-/*
- Copyright 2008-2012 Allan Jardine, all rights reserved.
-
- This source file is free software, under either the GPL v2 license or a
- BSD style license, available at:
-   http://datatables.net/license_gpl2
-   http://datatables.net/license_bsd
-
- This source file is distributed in the hope that it will be useful, but 
- WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY 
- or FITNESS FOR A PARTICULAR PURPOSE. See the license files for details.
-
- For details please refer to: http://www.datatables.net
-*/
-(function(u,m,n){(function(f){"function"===typeof define&&define.amd?define(["jquery"],f):jQuery&&!jQuery.fn.dataTable&&f(jQuery)})(function(f){var l=function(b){function t(a,c){var d=l.defaults.columns,e=a.aoColumns.length,d=f.extend({},l.models.oColumn,d,{sSortingClass:a.oClasses.sSortable,sSortingClassJUI:a.oClasses.sSortJUI,nTh:c?c:m.createElement("th"),sTitle:d.sTitle?d.sTitle:c?c.innerHTML:"",aDataSort:d.aDataSort?d.aDataSort:[e],mData:d.mData?d.oDefaults:e});a.aoColumns.push(d);a.aoPreSearchCols[e]===
-n||null===a.aoPreSearchCols[e]?a.aoPreSearchCols[e]=f.extend({},l.models.oSearch):(d=a.aoPreSearchCols[e],d.bRegex===n&&(d.bRegex=!0),d.bSmart===n&&(d.bSmart=!0),d.bCaseInsensitive===n&&(d.bCaseInsensitive=!0));E(a,e,null)}function E(a,c,d){var e=a.aoColumns[c];d!==n&&null!==d&&(d.mDataProp&&!d.mData&&(d.mData=d.mDataProp),d.sType!==n&&(e.sType=d.sType,e._bAutoType=!1),f.extend(e,d),z(e,d,"sWidth","sWidthOrig"),d.iDataSort!==n&&(e.aDataSort=[d.iDataSort]),z(e,d,"aDataSort"));var k=e.mRender?ga(e.mRender):
-null,h=ga(e.mData);e.fnGetData=function(a,c){var d=h(a,c);return e.mRender&&c&&""!==c?k(d,c,a):d};e.fnSetData=na(e.mData);a.oFeatures.bSort||(e.bSortable=!1);!e.bSortable||-1==f.inArray("asc",e.asSorting)&&-1==f.inArray("desc",e.asSorting)?(e.sSortingClass=a.oClasses.sSortableNone,e.sSortingClassJUI=""):-1==f.inArray("asc",e.asSorting)&&-1==f.inArray("desc",e.asSorting)?(e.sSortingClass=a.oClasses.sSortable,e.sSortingClassJUI=a.oClasses.sSortJUI):-1!=f.inArray("asc",e.asSorting)&&-1==f.inArray("desc",
-e.asSorting)?(e.sSortingClass=a.oClasses.sSortableAsc,e.sSortingClassJUI=a.oClasses.sSortJUIAscAllowed):-1==f.inArray("asc",e.asSorting)&&-1!=f.inArray("desc",e.asSorting)&&(e.sSortingClass=a.oClasses.sSortableDesc,e.sSortingClassJUI=a.oClasses.sSortJUIDescAllowed)}function y(a){if(!1===a.oFeatures.bAutoWidth)return!1;xa(a);for(var c=0,d=a.aoColumns.length;c<d;c++)a.aoColumns[c].nTh.style.width=a.aoColumns[c].sWidth}function v(a,c){var d=W(a,"bVisible");return"number"===typeof d[c]?d[c]:null}function s(a,
-c){var d=W(a,"bVisible"),d=f.inArray(c,d);return-1!==d?d:null}function x(a){return W(a,"bVisible").length}function W(a,c){var d=[];f.map(a.aoColumns,function(a,k){a[c]&&d.push(k)});return d}function K(a){for(var c=l.ext.aTypes,d=c.length,e=0;e<d;e++){var k=c[e](a);if(null!==k)return k}return"string"}function D(a,c){for(var d=c.split(","),e=[],k=0,h=a.aoColumns.length;k<h;k++)for(var g=0;g<h;g++)if(a.aoColumns[k].sName==d[g]){e.push(g);break}return e}function P(a){for(var c="",d=0,e=a.aoColumns.length;d<
-e;d++)c+=a.aoColumns[d].sName+",";return c.length==e?"":c.slice(0,-1)}function U(a,c,d,e){var k,h,g,b,p;if(c)for(k=c.length-1;0<=k;k--){var r=c[k].aTargets;f.isArray(r)||aa(a,1,"aTargets must be an array of targets, not a "+typeof r);h=0;for(g=r.length;h<g;h++)if("number"===typeof r[h]&&0<=r[h]){for(;a.aoColumns.length<=r[h];)t(a);e(r[h],c[k])}else if("number"===typeof r[h]&&0>r[h])e(a.aoColumns.length+r[h],c[k]);else if("string"===typeof r[h])for(b=0,p=a.aoColumns.length;b<p;b++)("_all"==r[h]||f(a.aoColumns[b].nTh).hasClass(r[h]))&&
-e(b,c[k])}if(d)for(k=0,a=d.length;k<a;k++)e(k,d[k])}function L(a,c){var d;d=f.isArray(c)?c.slice():f.extend(!0,{},c);var e=a.aoData.length,k=f.extend(!0,{},l.models.oRow);k._aData=d;a.aoData.push(k);for(var h,k=0,g=a.aoColumns.length;k<g;k++)d=a.aoColumns[k],"function"===typeof d.fnRender&&d.bUseRendered&&null!==d.mData?S(a,e,k,X(a,e,k)):S(a,e,k,w(a,e,k)),d._bAutoType&&"string"!=d.sType&&(h=w(a,e,k,"type"),null!==h&&""!==h&&(h=K(h),null===d.sType?d.sType=h:d.sType!=h&&"html"!=d.sType&&(d.sType="string")));
-a.aiDisplayMaster.push(e);a.oFeatures.bDeferRender||r(a,e);return e}function ka(a){var c,d,e,k,h,g,b;if(a.bDeferLoading||null===a.sAjaxSource)for(c=a.nTBody.firstChild;c;){if("TR"==c.nodeName.toUpperCase())for(d=a.aoData.length,c._DT_RowIndex=d,a.aoData.push(f.extend(!0,{},l.models.oRow,{nTr:c})),a.aiDisplayMaster.push(d),h=c.firstChild,e=0;h;){g=h.nodeName.toUpperCase();if("TD"==g||"TH"==g)S(a,d,e,f.trim(h.innerHTML)),e++;h=h.nextSibling}c=c.nextSibling}k=oa(a);e=[];c=0;for(d=k.length;c<d;c++)for(h=
-k[c].firstChild;h;)g=h.nodeName.toUpperCase(),"TD"!=g&&"TH"!=g||e.push(h),h=h.nextSibling;d=0;for(k=a.aoColumns.length;d<k;d++){b=a.aoColumns[d];null===b.sTitle&&(b.sTitle=b.nTh.innerHTML);var p=b._bAutoType,r="function"===typeof b.fnRender,q=null!==b.sClass,n=b.bVisible,t,C;if(p||r||q||!n)for(g=0,c=a.aoData.length;g<c;g++)h=a.aoData[g],t=e[g*k+d],p&&"string"!=b.sType&&(C=w(a,g,d,"type"),""!==C&&(C=K(C),null===b.sType?b.sType=C:b.sType!=C&&"html"!=b.sType&&(b.sType="string"))),b.mRender?t.innerHTML=
-w(a,g,d,"display"):b.mData!==d&&(t.innerHTML=w(a,g,d,"display")),r&&(C=X(a,g,d),t.innerHTML=C,b.bUseRendered&&S(a,g,d,C)),q&&(t.className+=" "+b.sClass),n?h._anHidden[d]=null:(h._anHidden[d]=t,t.parentNode.removeChild(t)),b.fnCreatedCell&&b.fnCreatedCell.call(a.oInstance,t,w(a,g,d,"display"),h._aData,g,d)}if(0!==a.aoRowCreatedCallback.length)for(c=0,d=a.aoData.length;c<d;c++)h=a.aoData[c],Q(a,"aoRowCreatedCallback",null,[h.nTr,h._aData,c])}function ca(a,c){return c._DT_RowIndex!==n?c._DT_RowIndex:
-null}function ha(a,c,d){c=ia(a,c);var e=0;for(a=a.aoColumns.length;e<a;e++)if(c[e]===d)return e;return-1}function ja(a,c,d,e){for(var k=[],h=0,g=e.length;h<g;h++)k.push(w(a,c,e[h],d));return k}function w(a,c,d,e){var k=a.aoColumns[d];if((d=k.fnGetData(a.aoData[c]._aData,e))===n)return a.iDrawError!=a.iDraw&&null===k.sDefaultContent&&(aa(a,0,"Requested unknown parameter "+("function"==typeof k.mData?"{mData function}":"'"+k.mData+"'")+" from the data source for row "+c),a.iDrawError=a.iDraw),k.sDefaultContent;
-if(null===d&&null!==k.sDefaultContent)d=k.sDefaultContent;else if("function"===typeof d)return d();return"display"==e&&null===d?"":d}function S(a,c,d,e){a.aoColumns[d].fnSetData(a.aoData[c]._aData,e)}function ga(a){if(null===a)return function(a,c){return null};if("function"===typeof a)return function(c,e,k){return a(c,e,k)};if("string"!==typeof a||-1===a.indexOf(".")&&-1===a.indexOf("["))return function(c,e){return c[a]};var c=function(a,e,k){var h=k.split("."),g;if(""!==k){var b=0;for(g=h.length;b<
-g;b++){if(k=h[b].match(pa)){h[b]=h[b].replace(pa,"");""!==h[b]&&(a=a[h[b]]);g=[];h.splice(0,b+1);for(var h=h.join("."),b=0,f=a.length;b<f;b++)g.push(c(a[b],e,h));a=k[0].substring(1,k[0].length-1);a=""===a?g:g.join(a);break}if(null===a||a[h[b]]===n)return n;a=a[h[b]]}}return a};return function(d,e){return c(d,e,a)}}function na(a){if(null===a)return function(a,c){};if("function"===typeof a)return function(c,e){a(c,"set",e)};if("string"!==typeof a||-1===a.indexOf(".")&&-1===a.indexOf("["))return function(c,
-e){c[a]=e};var c=function(a,e,k){k=k.split(".");var h,g,b=0;for(g=k.length-1;b<g;b++){if(h=k[b].match(pa)){k[b]=k[b].replace(pa,"");a[k[b]]=[];h=k.slice();h.splice(0,b+1);g=h.join(".");for(var f=0,p=e.length;f<p;f++)h={},c(h,e[f],g),a[k[b]].push(h);return}if(null===a[k[b]]||a[k[b]]===n)a[k[b]]={};a=a[k[b]]}a[k[k.length-1].replace(pa,"")]=e};return function(d,e){return c(d,e,a)}}function T(a){for(var c=[],d=a.aoData.length,e=0;e<d;e++)c.push(a.aoData[e]._aData);return c}function qa(a){a.aoData.splice(0,
-a.aoData.length);a.aiDisplayMaster.splice(0,a.aiDisplayMaster.length);a.aiDisplay.splice(0,a.aiDisplay.length);M(a)}function ra(a,c){for(var d=-1,e=0,k=a.length;e<k;e++)a[e]==c?d=e:a[e]>c&&a[e]--; -1!=d&&a.splice(d,1)}function X(a,c,d){var e=a.aoColumns[d];return e.fnRender({iDataRow:c,iDataColumn:d,oSettings:a,aData:a.aoData[c]._aData,mDataProp:e.mData},w(a,c,d,"display"))}function r(a,c){var d=a.aoData[c],e;if(null===d.nTr){d.nTr=m.createElement("tr");d.nTr._DT_RowIndex=c;d._aData.DT_RowId&&(d.nTr.id=
-d._aData.DT_RowId);d._aData.DT_RowClass&&(d.nTr.className=d._aData.DT_RowClass);for(var k=0,h=a.aoColumns.length;k<h;k++){var g=a.aoColumns[k];e=m.createElement(g.sCellType);e.innerHTML="function"!==typeof g.fnRender||g.bUseRendered&&null!==g.mData?w(a,c,k,"display"):X(a,c,k);null!==g.sClass&&(e.className=g.sClass);g.bVisible?(d.nTr.appendChild(e),d._anHidden[k]=null):d._anHidden[k]=e;g.fnCreatedCell&&g.fnCreatedCell.call(a.oInstance,e,w(a,c,k,"display"),d._aData,c,k)}Q(a,"aoRowCreatedCallback",null,
-[d.nTr,d._aData,c])}}function p(a){var c,d,e;if(0!==f("th, td",a.nTHead).length)for(c=0,e=a.aoColumns.length;c<e;c++)d=a.aoColumns[c].nTh,d.setAttribute("role","columnheader"),a.aoColumns[c].bSortable&&(d.setAttribute("tabindex",a.iTabIndex),d.setAttribute("aria-controls",a.sTableId)),null!==a.aoColumns[c].sClass&&f(d).addClass(a.aoColumns[c].sClass),a.aoColumns[c].sTitle!=d.innerHTML&&(d.innerHTML=a.aoColumns[c].sTitle);else{var k=m.createElement("tr");c=0;for(e=a.aoColumns.length;c<e;c++)d=a.aoColumns[c].nTh,
-d.innerHTML=a.aoColumns[c].sTitle,d.setAttribute("tabindex","0"),null!==a.aoColumns[c].sClass&&f(d).addClass(a.aoColumns[c].sClass),k.appendChild(d);f(a.nTHead).html("")[0].appendChild(k);J(a.aoHeader,a.nTHead)}f(a.nTHead).children("tr").attr("role","row");if(a.bJUI)for(c=0,e=a.aoColumns.length;c<e;c++){d=a.aoColumns[c].nTh;k=m.createElement("div");k.className=a.oClasses.sSortJUIWrapper;f(d).contents().appendTo(k);var h=m.createElement("span");h.className=a.oClasses.sSortIcon;k.appendChild(h);d.appendChild(k)}if(a.oFeatures.bSort)for(c=
-0;c<a.aoColumns.length;c++)!1!==a.aoColumns[c].bSortable?ya(a,a.aoColumns[c].nTh,c):f(a.aoColumns[c].nTh).addClass(a.oClasses.sSortableNone);""!==a.oClasses.sFooterTH&&f(a.nTFoot).children("tr").children("th").addClass(a.oClasses.sFooterTH);if(null!==a.nTFoot)for(d=N(a,null,a.aoFooter),c=0,e=a.aoColumns.length;c<e;c++)d[c]&&(a.aoColumns[c].nTf=d[c],a.aoColumns[c].sClass&&f(d[c]).addClass(a.aoColumns[c].sClass))}function H(a,c,d){var e,k,h,g=[],b=[],f=a.aoColumns.length,p;d===n&&(d=!1);e=0;for(k=c.length;e<
-k;e++){g[e]=c[e].slice();g[e].nTr=c[e].nTr;for(h=f-1;0<=h;h--)a.aoColumns[h].bVisible||d||g[e].splice(h,1);b.push([])}e=0;for(k=g.length;e<k;e++){if(a=g[e].nTr)for(;h=a.firstChild;)a.removeChild(h);h=0;for(c=g[e].length;h<c;h++)if(p=f=1,b[e][h]===n){a.appendChild(g[e][h].cell);for(b[e][h]=1;g[e+f]!==n&&g[e][h].cell==g[e+f][h].cell;)b[e+f][h]=1,f++;for(;g[e][h+p]!==n&&g[e][h].cell==g[e][h+p].cell;){for(d=0;d<f;d++)b[e+d][h+p]=1;p++}g[e][h].cell.rowSpan=f;g[e][h].cell.colSpan=p}}}function C(a){var c=
-Q(a,"aoPreDrawCallback","preDraw",[a]);if(-1!==f.inArray(!1,c))ba(a,!1);else{var d,e,c=[],k=0,h=a.asStripeClasses.length;d=a.aoOpenRows.length;a.bDrawing=!0;a.iInitDisplayStart!==n&&-1!=a.iInitDisplayStart&&(a._iDisplayStart=a.oFeatures.bServerSide?a.iInitDisplayStart:a.iInitDisplayStart>=a.fnRecordsDisplay()?0:a.iInitDisplayStart,a.iInitDisplayStart=-1,M(a));if(a.bDeferLoading)a.bDeferLoading=!1,a.iDraw++;else if(!a.oFeatures.bServerSide)a.iDraw++;else if(!a.bDestroying&&!Fa(a))return;if(0!==a.aiDisplay.length){var g=
-a._iDisplayStart;e=a._iDisplayEnd;a.oFeatures.bServerSide&&(g=0,e=a.aoData.length);for(;g<e;g++){var b=a.aoData[a.aiDisplay[g]];null===b.nTr&&r(a,a.aiDisplay[g]);var p=b.nTr;if(0!==h){var l=a.asStripeClasses[k%h];b._sRowStripe!=l&&(f(p).removeClass(b._sRowStripe).addClass(l),b._sRowStripe=l)}Q(a,"aoRowCallback",null,[p,a.aoData[a.aiDisplay[g]]._aData,k,g]);c.push(p);k++;if(0!==d)for(b=0;b<d;b++)if(p==a.aoOpenRows[b].nParent){c.push(a.aoOpenRows[b].nTr);break}}}else c[0]=m.createElement("tr"),a.asStripeClasses[0]&&
-(c[0].className=a.asStripeClasses[0]),d=a.oLanguage,h=d.sZeroRecords,1!=a.iDraw||null===a.sAjaxSource||a.oFeatures.bServerSide?d.sEmptyTable&&0===a.fnRecordsTotal()&&(h=d.sEmptyTable):h=d.sLoadingRecords,d=m.createElement("td"),d.setAttribute("valign","top"),d.colSpan=x(a),d.className=a.oClasses.sRowEmpty,d.innerHTML=za(a,h),c[k].appendChild(d);Q(a,"aoHeaderCallback","header",[f(a.nTHead).children("tr")[0],T(a),a._iDisplayStart,a.fnDisplayEnd(),a.aiDisplay]);Q(a,"aoFooterCallback","footer",[f(a.nTFoot).children("tr")[0],
-T(a),a._iDisplayStart,a.fnDisplayEnd(),a.aiDisplay]);k=m.createDocumentFragment();d=m.createDocumentFragment();if(a.nTBody){h=a.nTBody.parentNode;d.appendChild(a.nTBody);if(!a.oScroll.bInfinite||!a._bInitComplete||a.bSorted||a.bFiltered)for(;d=a.nTBody.firstChild;)a.nTBody.removeChild(d);d=0;for(e=c.length;d<e;d++)k.appendChild(c[d]);a.nTBody.appendChild(k);null!==h&&h.appendChild(a.nTBody)}Q(a,"aoDrawCallback","draw",[a]);a.bSorted=!1;a.bFiltered=!1;a.bDrawing=!1;a.oFeatures.bServerSide&&(ba(a,!1),
-a._bInitComplete||sa(a))}}function q(a){a.oFeatures.bSort?la(a,a.oPreviousSearch):a.oFeatures.bFilter?G(a,a.oPreviousSearch):(M(a),C(a))}function Ga(a){var c=f("<div></div>")[0];a.nTable.parentNode.insertBefore(c,a.nTable);a.nTableWrapper=f('<div id="'+a.sTableId+'_wrapper" class="'+a.oClasses.sWrapper+'" role="grid"></div>')[0];a.nTableReinsertBefore=a.nTable.nextSibling;for(var d=a.nTableWrapper,e=a.sDom.split(""),k,h,g,b,p,r,q,t=0;t<e.length;t++){h=0;g=e[t];if("<"==g){b=f("<div></div>")[0];p=e[t+
-1];if("'"==p||'"'==p){r="";for(q=2;e[t+q]!=p;)r+=e[t+q],q++;"H"==r?r=a.oClasses.sJUIHeader:"F"==r&&(r=a.oClasses.sJUIFooter);-1!=r.indexOf(".")?(p=r.split("."),b.id=p[0].substr(1,p[0].length-1),b.className=p[1]):"#"==r.charAt(0)?b.id=r.substr(1,r.length-1):b.className=r;t+=q}d.appendChild(b);d=b}else if(">"==g)d=d.parentNode;else if("l"==g&&a.oFeatures.bPaginate&&a.oFeatures.bLengthChange)k=Ha(a),h=1;else if("f"==g&&a.oFeatures.bFilter)k=ta(a),h=1;else if("r"==g&&a.oFeatures.bProcessing)k=Ia(a),h=
-1;else if("t"==g)k=Ja(a),h=1;else if("i"==g&&a.oFeatures.bInfo)k=fa(a),h=1;else if("p"==g&&a.oFeatures.bPaginate)k=Ka(a),h=1;else if(0!==l.ext.aoFeatures.length)for(b=l.ext.aoFeatures,q=0,p=b.length;q<p;q++)if(g==b[q].cFeature){(k=b[q].fnInit(a))&&(h=1);break}1==h&&null!==k&&("object"!==typeof a.aanFeatures[g]&&(a.aanFeatures[g]=[]),a.aanFeatures[g].push(k),d.appendChild(k))}c.parentNode.replaceChild(a.nTableWrapper,c)}function J(a,c){var d=f(c).children("tr"),e,k,h,g,b,p,r,l,q,t;a.splice(0,a.length);
-h=0;for(p=d.length;h<p;h++)a.push([]);h=0;for(p=d.length;h<p;h++)for(e=d[h],k=e.firstChild;k;){if("TD"==k.nodeName.toUpperCase()||"TH"==k.nodeName.toUpperCase()){l=1*k.getAttribute("colspan");q=1*k.getAttribute("rowspan");l=l&&0!==l&&1!==l?l:1;q=q&&0!==q&&1!==q?q:1;g=0;for(b=a[h];b[g];)g++;r=g;t=1===l?!0:!1;for(b=0;b<l;b++)for(g=0;g<q;g++)a[h+g][r+b]={cell:k,unique:t},a[h+g].nTr=e}k=k.nextSibling}}function N(a,c,d){var e=[];d||(d=a.aoHeader,c&&(d=[],J(d,c)));c=0;for(var k=d.length;c<k;c++)for(var h=
-0,g=d[c].length;h<g;h++)!d[c][h].unique||e[h]&&a.bSortCellsTop||(e[h]=d[c][h].cell);return e}function Fa(a){if(a.bAjaxDataGet){a.iDraw++;ba(a,!0);var c=La(a);Aa(a,c);a.fnServerData.call(a.oInstance,a.sAjaxSource,c,function(c){Ma(a,c)},a);return!1}return!0}function La(a){var c=a.aoColumns.length,d=[],e,k,h,g;d.push({name:"sEcho",value:a.iDraw});d.push({name:"iColumns",value:c});d.push({name:"sColumns",value:P(a)});d.push({name:"iDisplayStart",value:a._iDisplayStart});d.push({name:"iDisplayLength",
-value:!1!==a.oFeatures.bPaginate?a._iDisplayLength:-1});for(h=0;h<c;h++)e=a.aoColumns[h].mData,d.push({name:"mDataProp_"+h,value:"function"===typeof e?"function":e});if(!1!==a.oFeatures.bFilter)for(d.push({name:"sSearch",value:a.oPreviousSearch.sSearch}),d.push({name:"bRegex",value:a.oPreviousSearch.bRegex}),h=0;h<c;h++)d.push({name:"sSearch_"+h,value:a.aoPreSearchCols[h].sSearch}),d.push({name:"bRegex_"+h,value:a.aoPreSearchCols[h].bRegex}),d.push({name:"bSearchable_"+h,value:a.aoColumns[h].bSearchable});
-if(!1!==a.oFeatures.bSort){var b=0;e=null!==a.aaSortingFixed?a.aaSortingFixed.concat(a.aaSorting):a.aaSorting.slice();for(h=0;h<e.length;h++)for(k=a.aoColumns[e[h][0]].aDataSort,g=0;g<k.length;g++)d.push({name:"iSortCol_"+b,value:k[g]}),d.push({name:"sSortDir_"+b,value:e[h][1]}),b++;d.push({name:"iSortingCols",value:b});for(h=0;h<c;h++)d.push({name:"bSortable_"+h,value:a.aoColumns[h].bSortable})}return d}function Aa(a,c){Q(a,"aoServerParams","serverParams",[c])}function Ma(a,c){if(c.sEcho!==n){if(1*
-c.sEcho<a.iDraw)return;a.iDraw=1*c.sEcho}(!a.oScroll.bInfinite||a.oScroll.bInfinite&&(a.bSorted||a.bFiltered))&&qa(a);a._iRecordsTotal=parseInt(c.iTotalRecords,10);a._iRecordsDisplay=parseInt(c.iTotalDisplayRecords,10);var d=P(a),d=c.sColumns!==n&&""!==d&&c.sColumns!=d,e;d&&(e=D(a,c.sColumns));for(var k=ga(a.sAjaxDataProp)(c),h=0,g=k.length;h<g;h++)if(d){for(var b=[],f=0,p=a.aoColumns.length;f<p;f++)b.push(k[h][e[f]]);L(a,b)}else L(a,k[h]);a.aiDisplay=a.aiDisplayMaster.slice();a.bAjaxDataGet=!1;C(a);
-a.bAjaxDataGet=!0;ba(a,!1)}function ta(a){var c=a.oPreviousSearch,d=a.oLanguage.sSearch,d=-1!==d.indexOf("_INPUT_")?d.replace("_INPUT_",'<input type="text" />'):""===d?'<input type="text" />':d+' <input type="text" />',e=m.createElement("div");e.className=a.oClasses.sFilter;e.innerHTML="<label>"+d+"</label>";a.aanFeatures.f||(e.id=a.sTableId+"_filter");d=f('input[type="text"]',e);e._DT_Input=d[0];d.val(c.sSearch.replace('"',"&quot;"));d.bind("keyup.DT",function(d){d=a.aanFeatures.f;for(var e=""===
-this.value?"":this.value,g=0,b=d.length;g<b;g++)d[g]!=f(this).parents("div.dataTables_filter")[0]&&f(d[g]._DT_Input).val(e);e!=c.sSearch&&G(a,{sSearch:e,bRegex:c.bRegex,bSmart:c.bSmart,bCaseInsensitive:c.bCaseInsensitive})});d.attr("aria-controls",a.sTableId).bind("keypress.DT",function(a){if(13==a.keyCode)return!1});return e}function G(a,c,d){var e=a.oPreviousSearch,k=a.aoPreSearchCols,h=function(a){e.sSearch=a.sSearch;e.bRegex=a.bRegex;e.bSmart=a.bSmart;e.bCaseInsensitive=a.bCaseInsensitive};if(a.oFeatures.bServerSide)h(c);
-else{R(a,c.sSearch,d,c.bRegex,c.bSmart,c.bCaseInsensitive);h(c);for(c=0;c<a.aoPreSearchCols.length;c++)da(a,k[c].sSearch,c,k[c].bRegex,k[c].bSmart,k[c].bCaseInsensitive);F(a)}a.bFiltered=!0;f(a.oInstance).trigger("filter",a);a._iDisplayStart=0;M(a);C(a);A(a,0)}function F(a){for(var c=l.ext.afnFiltering,d=W(a,"bSearchable"),e=0,k=c.length;e<k;e++)for(var h=0,g=0,b=a.aiDisplay.length;g<b;g++){var f=a.aiDisplay[g-h];c[e](a,ja(a,f,"filter",d),f)||(a.aiDisplay.splice(g-h,1),h++)}}function da(a,c,d,e,k,
-h){if(""!==c){var g=0;c=ea(c,e,k,h);for(e=a.aiDisplay.length-1;0<=e;e--)k=V(w(a,a.aiDisplay[e],d,"filter"),a.aoColumns[d].sType),c.test(k)||(a.aiDisplay.splice(e,1),g++)}}function R(a,c,d,e,k,h){e=ea(c,e,k,h);k=a.oPreviousSearch;d||(d=0);0!==l.ext.afnFiltering.length&&(d=1);if(0>=c.length)a.aiDisplay.splice(0,a.aiDisplay.length),a.aiDisplay=a.aiDisplayMaster.slice();else if(a.aiDisplay.length==a.aiDisplayMaster.length||k.sSearch.length>c.length||1==d||0!==c.indexOf(k.sSearch))for(a.aiDisplay.splice(0,
-a.aiDisplay.length),A(a,1),c=0;c<a.aiDisplayMaster.length;c++)e.test(a.asDataSearch[c])&&a.aiDisplay.push(a.aiDisplayMaster[c]);else for(c=d=0;c<a.asDataSearch.length;c++)e.test(a.asDataSearch[c])||(a.aiDisplay.splice(c-d,1),d++)}function A(a,c){if(!a.oFeatures.bServerSide){a.asDataSearch=[];for(var d=W(a,"bSearchable"),e=1===c?a.aiDisplayMaster:a.aiDisplay,k=0,h=e.length;k<h;k++)a.asDataSearch[k]=Y(a,ja(a,e[k],"filter",d))}}function Y(a,c){var d=c.join("  ");-1!==d.indexOf("&")&&(d=f("<div>").html(d).text());
-return d.replace(/[\n\r]/g," ")}function ea(a,c,d,e){if(d)return a=c?a.split(" "):ua(a).split(" "),a="^(?=.*?"+a.join(")(?=.*?")+").*$",RegExp(a,e?"i":"");a=c?a:ua(a);return RegExp(a,e?"i":"")}function V(a,c){return"function"===typeof l.ext.ofnSearch[c]?l.ext.ofnSearch[c](a):null===a?"":"html"==c?a.replace(/[\r\n]/g," ").replace(/<.*?>/g,""):"string"===typeof a?a.replace(/[\r\n]/g," "):a}function ua(a){return a.replace(RegExp("(\\/|\\.|\\*|\\+|\\?|\\||\\(|\\)|\\[|\\]|\\{|\\}|\\\\|\\$|\\^|\\-)","g"),
-"\\$1")}function fa(a){var c=m.createElement("div");c.className=a.oClasses.sInfo;a.aanFeatures.i||(a.aoDrawCallback.push({fn:Na,sName:"information"}),c.id=a.sTableId+"_info");a.nTable.setAttribute("aria-describedby",a.sTableId+"_info");return c}function Na(a){if(a.oFeatures.bInfo&&0!==a.aanFeatures.i.length){var c=a.oLanguage,d=a._iDisplayStart+1,e=a.fnDisplayEnd(),k=a.fnRecordsTotal(),h=a.fnRecordsDisplay(),g;g=0===h?c.sInfoEmpty:c.sInfo;h!=k&&(g+=" "+c.sInfoFiltered);g+=c.sInfoPostFix;g=za(a,g);
-null!==c.fnInfoCallback&&(g=c.fnInfoCallback.call(a.oInstance,a,d,e,k,h,g));a=a.aanFeatures.i;c=0;for(d=a.length;c<d;c++)f(a[c]).html(g)}}function za(a,c){var d=a.fnFormatNumber(a._iDisplayStart+1),e=a.fnDisplayEnd(),e=a.fnFormatNumber(e),k=a.fnRecordsDisplay(),k=a.fnFormatNumber(k),h=a.fnRecordsTotal(),h=a.fnFormatNumber(h);a.oScroll.bInfinite&&(d=a.fnFormatNumber(1));return c.replace(/_START_/g,d).replace(/_END_/g,e).replace(/_TOTAL_/g,k).replace(/_MAX_/g,h)}function va(a){var c,d,e=a.iInitDisplayStart;
-if(!1===a.bInitialised)setTimeout(function(){va(a)},200);else{Ga(a);p(a);H(a,a.aoHeader);a.nTFoot&&H(a,a.aoFooter);ba(a,!0);a.oFeatures.bAutoWidth&&xa(a);c=0;for(d=a.aoColumns.length;c<d;c++)null!==a.aoColumns[c].sWidth&&(a.aoColumns[c].nTh.style.width=B(a.aoColumns[c].sWidth));a.oFeatures.bSort?la(a):a.oFeatures.bFilter?G(a,a.oPreviousSearch):(a.aiDisplay=a.aiDisplayMaster.slice(),M(a),C(a));null===a.sAjaxSource||a.oFeatures.bServerSide?a.oFeatures.bServerSide||(ba(a,!1),sa(a)):(d=[],Aa(a,d),a.fnServerData.call(a.oInstance,
-a.sAjaxSource,d,function(d){var h=""!==a.sAjaxDataProp?ga(a.sAjaxDataProp)(d):d;for(c=0;c<h.length;c++)L(a,h[c]);a.iInitDisplayStart=e;a.oFeatures.bSort?la(a):(a.aiDisplay=a.aiDisplayMaster.slice(),M(a),C(a));ba(a,!1);sa(a,d)},a))}}function sa(a,c){a._bInitComplete=!0;Q(a,"aoInitComplete","init",[a,c])}function Ba(a){var c=l.defaults.oLanguage;!a.sEmptyTable&&(a.sZeroRecords&&"No data available in table"===c.sEmptyTable)&&z(a,a,"sZeroRecords","sEmptyTable");!a.sLoadingRecords&&(a.sZeroRecords&&"Loading..."===
-c.sLoadingRecords)&&z(a,a,"sZeroRecords","sLoadingRecords")}function Ha(a){if(a.oScroll.bInfinite)return null;var c='<select size="1" '+('name="'+a.sTableId+'_length"')+">",d,e,k=a.aLengthMenu;if(2==k.length&&"object"===typeof k[0]&&"object"===typeof k[1])for(d=0,e=k[0].length;d<e;d++)c+='<option value="'+k[0][d]+'">'+k[1][d]+"</option>";else for(d=0,e=k.length;d<e;d++)c+='<option value="'+k[d]+'">'+k[d]+"</option>";c+="</select>";k=m.createElement("div");a.aanFeatures.l||(k.id=a.sTableId+"_length");
-k.className=a.oClasses.sLength;k.innerHTML="<label>"+a.oLanguage.sLengthMenu.replace("_MENU_",c)+"</label>";f('select option[value="'+a._iDisplayLength+'"]',k).prop("selected",!0);f("select",k).bind("change.DT",function(c){c=f(this).val();var k=a.aanFeatures.l;d=0;for(e=k.length;d<e;d++)k[d]!=this.parentNode&&f("select",k[d]).val(c);a._iDisplayLength=parseInt(c,10);M(a);a.fnDisplayEnd()==a.fnRecordsDisplay()&&(a._iDisplayStart=a.fnDisplayEnd()-a._iDisplayLength,0>a._iDisplayStart&&(a._iDisplayStart=
-0));-1==a._iDisplayLength&&(a._iDisplayStart=0);C(a)});f("select",k).attr("aria-controls",a.sTableId);return k}function M(a){a._iDisplayEnd=!1===a.oFeatures.bPaginate?a.aiDisplay.length:a._iDisplayStart+a._iDisplayLength>a.aiDisplay.length||-1==a._iDisplayLength?a.aiDisplay.length:a._iDisplayStart+a._iDisplayLength}function Ka(a){if(a.oScroll.bInfinite)return null;var c=m.createElement("div");c.className=a.oClasses.sPaging+a.sPaginationType;l.ext.oPagination[a.sPaginationType].fnInit(a,c,function(a){M(a);
-C(a)});a.aanFeatures.p||a.aoDrawCallback.push({fn:function(a){l.ext.oPagination[a.sPaginationType].fnUpdate(a,function(a){M(a);C(a)})},sName:"pagination"});return c}function Ca(a,c){var d=a._iDisplayStart;if("number"===typeof c)a._iDisplayStart=c*a._iDisplayLength,a._iDisplayStart>a.fnRecordsDisplay()&&(a._iDisplayStart=0);else if("first"==c)a._iDisplayStart=0;else if("previous"==c)a._iDisplayStart=0<=a._iDisplayLength?a._iDisplayStart-a._iDisplayLength:0,0>a._iDisplayStart&&(a._iDisplayStart=0);
-else if("next"==c)0<=a._iDisplayLength?a._iDisplayStart+a._iDisplayLength<a.fnRecordsDisplay()&&(a._iDisplayStart+=a._iDisplayLength):a._iDisplayStart=0;else if("last"==c)if(0<=a._iDisplayLength){var e=parseInt((a.fnRecordsDisplay()-1)/a._iDisplayLength,10)+1;a._iDisplayStart=(e-1)*a._iDisplayLength}else a._iDisplayStart=0;else aa(a,0,"Unknown paging action: "+c);f(a.oInstance).trigger("page",a);return d!=a._iDisplayStart}function Ia(a){var c=m.createElement("div");a.aanFeatures.r||(c.id=a.sTableId+
-"_processing");c.innerHTML=a.oLanguage.sProcessing;c.className=a.oClasses.sProcessing;a.nTable.parentNode.insertBefore(c,a.nTable);return c}function ba(a,c){if(a.oFeatures.bProcessing)for(var d=a.aanFeatures.r,e=0,k=d.length;e<k;e++)d[e].style.visibility=c?"visible":"hidden";f(a.oInstance).trigger("processing",[a,c])}function Ja(a){if(""===a.oScroll.sX&&""===a.oScroll.sY)return a.nTable;var c=m.createElement("div"),d=m.createElement("div"),e=m.createElement("div"),k=m.createElement("div"),h=m.createElement("div"),
-g=m.createElement("div"),b=a.nTable.cloneNode(!1),p=a.nTable.cloneNode(!1),r=a.nTable.getElementsByTagName("thead")[0],l=0===a.nTable.getElementsByTagName("tfoot").length?null:a.nTable.getElementsByTagName("tfoot")[0],q=a.oClasses;d.appendChild(e);h.appendChild(g);k.appendChild(a.nTable);c.appendChild(d);c.appendChild(k);e.appendChild(b);b.appendChild(r);null!==l&&(c.appendChild(h),g.appendChild(p),p.appendChild(l));c.className=q.sScrollWrapper;d.className=q.sScrollHead;e.className=q.sScrollHeadInner;
-k.className=q.sScrollBody;h.className=q.sScrollFoot;g.className=q.sScrollFootInner;a.oScroll.bAutoCss&&(d.style.overflow="hidden",d.style.position="relative",h.style.overflow="hidden",k.style.overflow="auto");d.style.border="0";d.style.width="100%";h.style.border="0";e.style.width=""!==a.oScroll.sXInner?a.oScroll.sXInner:"100%";b.removeAttribute("id");b.style.marginLeft="0";a.nTable.style.marginLeft="0";null!==l&&(p.removeAttribute("id"),p.style.marginLeft="0");e=f(a.nTable).children("caption");0<
-e.length&&(e=e[0],"top"===e._captionSide?b.appendChild(e):"bottom"===e._captionSide&&l&&p.appendChild(e));""!==a.oScroll.sX&&(d.style.width=B(a.oScroll.sX),k.style.width=B(a.oScroll.sX),null!==l&&(h.style.width=B(a.oScroll.sX)),f(k).scroll(function(a){d.scrollLeft=this.scrollLeft;null!==l&&(h.scrollLeft=this.scrollLeft)}));""!==a.oScroll.sY&&(k.style.height=B(a.oScroll.sY));a.aoDrawCallback.push({fn:Oa,sName:"scrolling"});a.oScroll.bInfinite&&f(k).scroll(function(){!a.bDrawing&&0!==f(this).scrollTop()&&
-(f(this).scrollTop()+f(this).height()>f(a.nTable).height()-a.oScroll.iLoadGap&&a.fnDisplayEnd()<a.fnRecordsDisplay())&&(Ca(a,"next"),M(a),C(a))});a.nScrollHead=d;a.nScrollFoot=h;return c}function Oa(a){var c=a.nScrollHead.getElementsByTagName("div")[0],d=c.getElementsByTagName("table")[0],e=a.nTable.parentNode,k,h,b,p,r,l,q,t,n=[],C=[],A=null!==a.nTFoot?a.nScrollFoot.getElementsByTagName("div")[0]:null,m=null!==a.nTFoot?A.getElementsByTagName("table")[0]:null,H=a.oBrowser.bScrollOversize,y=function(a){q=
-a.style;q.paddingTop="0";q.paddingBottom="0";q.borderTopWidth="0";q.borderBottomWidth="0";q.height=0};f(a.nTable).children("thead, tfoot").remove();k=f(a.nTHead).clone()[0];a.nTable.insertBefore(k,a.nTable.childNodes[0]);b=a.nTHead.getElementsByTagName("tr");p=k.getElementsByTagName("tr");null!==a.nTFoot&&(r=f(a.nTFoot).clone()[0],a.nTable.insertBefore(r,a.nTable.childNodes[1]),l=a.nTFoot.getElementsByTagName("tr"),r=r.getElementsByTagName("tr"));""===a.oScroll.sX&&(e.style.width="100%",c.parentNode.style.width=
-"100%");var E=N(a,k);k=0;for(h=E.length;k<h;k++)t=v(a,k),E[k].style.width=a.aoColumns[t].sWidth;null!==a.nTFoot&&Z(function(a){a.style.width=""},r);a.oScroll.bCollapse&&""!==a.oScroll.sY&&(e.style.height=e.offsetHeight+a.nTHead.offsetHeight+"px");k=f(a.nTable).outerWidth();""===a.oScroll.sX?(a.nTable.style.width="100%",H&&(f("tbody",e).height()>e.offsetHeight||"scroll"==f(e).css("overflow-y"))&&(a.nTable.style.width=B(f(a.nTable).outerWidth()-a.oScroll.iBarWidth))):""!==a.oScroll.sXInner?a.nTable.style.width=
-B(a.oScroll.sXInner):k==f(e).width()&&f(e).height()<f(a.nTable).height()?(a.nTable.style.width=B(k-a.oScroll.iBarWidth),f(a.nTable).outerWidth()>k-a.oScroll.iBarWidth&&(a.nTable.style.width=B(k))):a.nTable.style.width=B(k);k=f(a.nTable).outerWidth();Z(y,p);Z(function(a){n.push(B(f(a).width()))},p);Z(function(a,c){a.style.width=n[c]},b);f(p).height(0);null!==a.nTFoot&&(Z(y,r),Z(function(a){C.push(B(f(a).width()))},r),Z(function(a,c){a.style.width=C[c]},l),f(r).height(0));Z(function(a,c){a.innerHTML=
-"";a.style.width=n[c]},p);null!==a.nTFoot&&Z(function(a,c){a.innerHTML="";a.style.width=C[c]},r);f(a.nTable).outerWidth()<k?(b=e.scrollHeight>e.offsetHeight||"scroll"==f(e).css("overflow-y")?k+a.oScroll.iBarWidth:k,H&&(e.scrollHeight>e.offsetHeight||"scroll"==f(e).css("overflow-y"))&&(a.nTable.style.width=B(b-a.oScroll.iBarWidth)),e.style.width=B(b),a.nScrollHead.style.width=B(b),null!==a.nTFoot&&(a.nScrollFoot.style.width=B(b)),""===a.oScroll.sX?aa(a,1,"The table cannot fit into the current element which will cause column misalignment. The table has been drawn at its minimum possible width."):
-""!==a.oScroll.sXInner&&aa(a,1,"The table cannot fit into the current element which will cause column misalignment. Increase the sScrollXInner value or remove it to allow automatic calculation")):(e.style.width=B("100%"),a.nScrollHead.style.width=B("100%"),null!==a.nTFoot&&(a.nScrollFoot.style.width=B("100%")));""===a.oScroll.sY&&H&&(e.style.height=B(a.nTable.offsetHeight+a.oScroll.iBarWidth));""!==a.oScroll.sY&&a.oScroll.bCollapse&&(e.style.height=B(a.oScroll.sY),H=""!==a.oScroll.sX&&a.nTable.offsetWidth>
-e.offsetWidth?a.oScroll.iBarWidth:0,a.nTable.offsetHeight<e.offsetHeight&&(e.style.height=B(a.nTable.offsetHeight+H)));H=f(a.nTable).outerWidth();d.style.width=B(H);c.style.width=B(H);d=f(a.nTable).height()>e.clientHeight||"scroll"==f(e).css("overflow-y");c.style.paddingRight=d?a.oScroll.iBarWidth+"px":"0px";null!==a.nTFoot&&(m.style.width=B(H),A.style.width=B(H),A.style.paddingRight=d?a.oScroll.iBarWidth+"px":"0px");f(e).scroll();if(a.bSorted||a.bFiltered)e.scrollTop=0}function Z(a,c,d){for(var e=
-0,k=0,h=c.length,b,f;k<h;){b=c[k].firstChild;for(f=d?d[k].firstChild:null;b;)1===b.nodeType&&(d?a(b,f,e):a(b,e),e++),b=b.nextSibling,f=d?f.nextSibling:null;k++}}function Pa(a,c){if(!a||null===a||""===a)return 0;c||(c=m.body);var d,e=m.createElement("div");e.style.width=B(a);c.appendChild(e);d=e.offsetWidth;c.removeChild(e);return d}function xa(a){var c=0,d,e=0,k=a.aoColumns.length,b,g,p=f("th",a.nTHead),r=a.nTable.getAttribute("width");g=a.nTable.parentNode;for(b=0;b<k;b++)a.aoColumns[b].bVisible&&
-(e++,null!==a.aoColumns[b].sWidth&&(d=Pa(a.aoColumns[b].sWidthOrig,g),null!==d&&(a.aoColumns[b].sWidth=B(d)),c++));if(k==p.length&&0===c&&e==k&&""===a.oScroll.sX&&""===a.oScroll.sY)for(b=0;b<a.aoColumns.length;b++)d=f(p[b]).width(),null!==d&&(a.aoColumns[b].sWidth=B(d));else{c=a.nTable.cloneNode(!1);b=a.nTHead.cloneNode(!0);e=m.createElement("tbody");d=m.createElement("tr");c.removeAttribute("id");c.appendChild(b);null!==a.nTFoot&&(c.appendChild(a.nTFoot.cloneNode(!0)),Z(function(a){a.style.width=
-""},c.getElementsByTagName("tr")));c.appendChild(e);e.appendChild(d);e=f("thead th",c);0===e.length&&(e=f("tbody tr:eq(0)>td",c));p=N(a,b);for(b=e=0;b<k;b++){var q=a.aoColumns[b];q.bVisible&&null!==q.sWidthOrig&&""!==q.sWidthOrig?p[b-e].style.width=B(q.sWidthOrig):q.bVisible?p[b-e].style.width="":e++}for(b=0;b<k;b++)a.aoColumns[b].bVisible&&(e=Qa(a,b),null!==e&&(e=e.cloneNode(!0),""!==a.aoColumns[b].sContentPadding&&(e.innerHTML+=a.aoColumns[b].sContentPadding),d.appendChild(e)));g.appendChild(c);
-""!==a.oScroll.sX&&""!==a.oScroll.sXInner?c.style.width=B(a.oScroll.sXInner):""!==a.oScroll.sX?(c.style.width="",f(c).width()<g.offsetWidth&&(c.style.width=B(g.offsetWidth))):""!==a.oScroll.sY?c.style.width=B(g.offsetWidth):r&&(c.style.width=B(r));c.style.visibility="hidden";Ra(a,c);k=f("tbody tr:eq(0)",c).children();0===k.length&&(k=N(a,f("thead",c)[0]));if(""!==a.oScroll.sX){for(b=e=g=0;b<a.aoColumns.length;b++)a.aoColumns[b].bVisible&&(g=null===a.aoColumns[b].sWidthOrig?g+f(k[e]).outerWidth():
-g+(parseInt(a.aoColumns[b].sWidth.replace("px",""),10)+(f(k[e]).outerWidth()-f(k[e]).width())),e++);c.style.width=B(g);a.nTable.style.width=B(g)}for(b=e=0;b<a.aoColumns.length;b++)a.aoColumns[b].bVisible&&(g=f(k[e]).width(),null!==g&&0<g&&(a.aoColumns[b].sWidth=B(g)),e++);k=f(c).css("width");a.nTable.style.width=-1!==k.indexOf("%")?k:B(f(c).outerWidth());c.parentNode.removeChild(c)}r&&(a.nTable.style.width=B(r))}function Ra(a,c){""===a.oScroll.sX&&""!==a.oScroll.sY?(f(c).width(),c.style.width=B(f(c).outerWidth()-
-a.oScroll.iBarWidth)):""!==a.oScroll.sX&&(c.style.width=B(f(c).outerWidth()))}function Qa(a,c){var d=Sa(a,c);if(0>d)return null;if(null===a.aoData[d].nTr){var e=m.createElement("td");e.innerHTML=w(a,d,c,"");return e}return ia(a,d)[c]}function Sa(a,c){for(var d=-1,e=-1,b=0;b<a.aoData.length;b++){var h=w(a,b,c,"display")+"",h=h.replace(/<.*?>/g,"");h.length>d&&(d=h.length,e=b)}return e}function B(a){if(null===a)return"0px";if("number"==typeof a)return 0>a?"0px":a+"px";var c=a.charCodeAt(a.length-1);
-return 48>c||57<c?a:a+"px"}function Ta(){var a=m.createElement("p"),c=a.style;c.width="100%";c.height="200px";c.padding="0px";var d=m.createElement("div"),c=d.style;c.position="absolute";c.top="0px";c.left="0px";c.visibility="hidden";c.width="200px";c.height="150px";c.padding="0px";c.overflow="hidden";d.appendChild(a);m.body.appendChild(d);c=a.offsetWidth;d.style.overflow="scroll";a=a.offsetWidth;c==a&&(a=d.clientWidth);m.body.removeChild(d);return c-a}function la(a,c){var d,e,b,h,g,p,r=[],q=[],t=
-l.ext.oSort,H=a.aoData,A=a.aoColumns,m=a.oLanguage.oAria;if(!a.oFeatures.bServerSide&&(0!==a.aaSorting.length||null!==a.aaSortingFixed)){r=null!==a.aaSortingFixed?a.aaSortingFixed.concat(a.aaSorting):a.aaSorting.slice();for(d=0;d<r.length;d++)if(e=r[d][0],b=s(a,e),h=a.aoColumns[e].sSortDataType,l.ext.afnSortData[h])if(g=l.ext.afnSortData[h].call(a.oInstance,a,e,b),g.length===H.length)for(b=0,h=H.length;b<h;b++)S(a,b,e,g[b]);else aa(a,0,"Returned data sort array (col "+e+") is the wrong length");d=
-0;for(e=a.aiDisplayMaster.length;d<e;d++)q[a.aiDisplayMaster[d]]=d;var y=r.length,E;d=0;for(e=H.length;d<e;d++)for(b=0;b<y;b++)for(E=A[r[b][0]].aDataSort,g=0,p=E.length;g<p;g++)h=A[E[g]].sType,h=t[(h?h:"string")+"-pre"],H[d]._aSortData[E[g]]=h?h(w(a,d,E[g],"sort")):w(a,d,E[g],"sort");a.aiDisplayMaster.sort(function(a,c){var d,e,b,k,g;for(d=0;d<y;d++)for(g=A[r[d][0]].aDataSort,e=0,b=g.length;e<b;e++)if(k=A[g[e]].sType,k=t[(k?k:"string")+"-"+r[d][1]](H[a]._aSortData[g[e]],H[c]._aSortData[g[e]]),0!==
-k)return k;return t["numeric-asc"](q[a],q[c])})}c!==n&&!c||a.oFeatures.bDeferRender||ma(a);d=0;for(e=a.aoColumns.length;d<e;d++)h=A[d].sTitle.replace(/<.*?>/g,""),b=A[d].nTh,b.removeAttribute("aria-sort"),b.removeAttribute("aria-label"),A[d].bSortable?0<r.length&&r[0][0]==d?(b.setAttribute("aria-sort","asc"==r[0][1]?"ascending":"descending"),b.setAttribute("aria-label",h+("asc"==(A[d].asSorting[r[0][2]+1]?A[d].asSorting[r[0][2]+1]:A[d].asSorting[0])?m.sSortAscending:m.sSortDescending))):b.setAttribute("aria-label",
-h+("asc"==A[d].asSorting[0]?m.sSortAscending:m.sSortDescending)):b.setAttribute("aria-label",h);a.bSorted=!0;f(a.oInstance).trigger("sort",a);a.oFeatures.bFilter?G(a,a.oPreviousSearch,1):(a.aiDisplay=a.aiDisplayMaster.slice(),a._iDisplayStart=0,M(a),C(a))}function ya(a,c,d,e){Ua(c,{},function(c){if(!1!==a.aoColumns[d].bSortable){var b=function(){var e,b;if(c.shiftKey){for(var h=!1,f=0;f<a.aaSorting.length;f++)if(a.aaSorting[f][0]==d){h=!0;e=a.aaSorting[f][0];b=a.aaSorting[f][2]+1;a.aoColumns[e].asSorting[b]?
-(a.aaSorting[f][1]=a.aoColumns[e].asSorting[b],a.aaSorting[f][2]=b):a.aaSorting.splice(f,1);break}!1===h&&a.aaSorting.push([d,a.aoColumns[d].asSorting[0],0])}else 1==a.aaSorting.length&&a.aaSorting[0][0]==d?(e=a.aaSorting[0][0],b=a.aaSorting[0][2]+1,a.aoColumns[e].asSorting[b]||(b=0),a.aaSorting[0][1]=a.aoColumns[e].asSorting[b],a.aaSorting[0][2]=b):(a.aaSorting.splice(0,a.aaSorting.length),a.aaSorting.push([d,a.aoColumns[d].asSorting[0],0]));la(a)};a.oFeatures.bProcessing?(ba(a,!0),setTimeout(function(){b();
-a.oFeatures.bServerSide||ba(a,!1)},0)):b();"function"==typeof e&&e(a)}})}function ma(a){var c,d,e,b,h,g=a.aoColumns.length,p=a.oClasses;for(c=0;c<g;c++)a.aoColumns[c].bSortable&&f(a.aoColumns[c].nTh).removeClass(p.sSortAsc+" "+p.sSortDesc+" "+a.aoColumns[c].sSortingClass);d=null!==a.aaSortingFixed?a.aaSortingFixed.concat(a.aaSorting):a.aaSorting.slice();for(c=0;c<a.aoColumns.length;c++)if(a.aoColumns[c].bSortable){h=a.aoColumns[c].sSortingClass;b=-1;for(e=0;e<d.length;e++)if(d[e][0]==c){h="asc"==
-d[e][1]?p.sSortAsc:p.sSortDesc;b=e;break}f(a.aoColumns[c].nTh).addClass(h);a.bJUI&&(h=f("span."+p.sSortIcon,a.aoColumns[c].nTh),h.removeClass(p.sSortJUIAsc+" "+p.sSortJUIDesc+" "+p.sSortJUI+" "+p.sSortJUIAscAllowed+" "+p.sSortJUIDescAllowed),h.addClass(-1==b?a.aoColumns[c].sSortingClassJUI:"asc"==d[b][1]?p.sSortJUIAsc:p.sSortJUIDesc))}else f(a.aoColumns[c].nTh).addClass(a.aoColumns[c].sSortingClass);h=p.sSortColumn;if(a.oFeatures.bSort&&a.oFeatures.bSortClasses){a=ia(a);b=[];for(c=0;c<g;c++)b.push("");
-c=0;for(e=1;c<d.length;c++)p=parseInt(d[c][0],10),b[p]=h+e,3>e&&e++;h=RegExp(h+"[123]");var r;c=0;for(d=a.length;c<d;c++)p=c%g,e=a[c].className,r=b[p],p=e.replace(h,r),p!=e?a[c].className=f.trim(p):0<r.length&&-1==e.indexOf(r)&&(a[c].className=e+" "+r)}}function Da(a){if(a.oFeatures.bStateSave&&!a.bDestroying){var c,d;c=a.oScroll.bInfinite;var e={iCreate:(new Date).getTime(),iStart:c?0:a._iDisplayStart,iEnd:c?a._iDisplayLength:a._iDisplayEnd,iLength:a._iDisplayLength,aaSorting:f.extend(!0,[],a.aaSorting),
-oSearch:f.extend(!0,{},a.oPreviousSearch),aoSearchCols:f.extend(!0,[],a.aoPreSearchCols),abVisCols:[]};c=0;for(d=a.aoColumns.length;c<d;c++)e.abVisCols.push(a.aoColumns[c].bVisible);Q(a,"aoStateSaveParams","stateSaveParams",[a,e]);a.fnStateSave.call(a.oInstance,a,e)}}function Va(a,c){if(a.oFeatures.bStateSave){var d=a.fnStateLoad.call(a.oInstance,a);if(d){var e=Q(a,"aoStateLoadParams","stateLoadParams",[a,d]);if(-1===f.inArray(!1,e)){a.oLoadedState=f.extend(!0,{},d);a._iDisplayStart=d.iStart;a.iInitDisplayStart=
-d.iStart;a._iDisplayEnd=d.iEnd;a._iDisplayLength=d.iLength;a.aaSorting=d.aaSorting.slice();a.saved_aaSorting=d.aaSorting.slice();f.extend(a.oPreviousSearch,d.oSearch);f.extend(!0,a.aoPreSearchCols,d.aoSearchCols);c.saved_aoColumns=[];for(e=0;e<d.abVisCols.length;e++)c.saved_aoColumns[e]={},c.saved_aoColumns[e].bVisible=d.abVisCols[e];Q(a,"aoStateLoaded","stateLoaded",[a,d])}}}}function I(a){for(var c=0;c<l.settings.length;c++)if(l.settings[c].nTable===a)return l.settings[c];return null}function oa(a){var c=
-[];a=a.aoData;for(var d=0,e=a.length;d<e;d++)null!==a[d].nTr&&c.push(a[d].nTr);return c}function ia(a,c){var d=[],e,b,h,g,f,p;b=0;var r=a.aoData.length;c!==n&&(b=c,r=c+1);for(h=b;h<r;h++)if(p=a.aoData[h],null!==p.nTr){b=[];for(e=p.nTr.firstChild;e;)g=e.nodeName.toLowerCase(),"td"!=g&&"th"!=g||b.push(e),e=e.nextSibling;g=e=0;for(f=a.aoColumns.length;g<f;g++)a.aoColumns[g].bVisible?d.push(b[g-e]):(d.push(p._anHidden[g]),e++)}return d}function aa(a,c,d){a=null===a?"DataTables warning: "+d:"DataTables warning (table id = '"+
-a.sTableId+"'): "+d;if(0===c)if("alert"==l.ext.sErrMode)alert(a);else throw Error(a);else u.console&&console.log&&console.log(a)}function z(a,c,d,e){e===n&&(e=d);c[d]!==n&&(a[e]=c[d])}function Wa(a,c){var d,e;for(e in c)c.hasOwnProperty(e)&&(d=c[e],"object"===typeof b[e]&&null!==d&&!1===f.isArray(d)?f.extend(!0,a[e],d):a[e]=d);return a}function Ua(a,c,d){f(a).bind("click.DT",c,function(c){a.blur();d(c)}).bind("keypress.DT",c,function(a){13===a.which&&d(a)}).bind("selectstart.DT",function(){return!1})}
-function O(a,c,d,e){d&&a[c].push({fn:d,sName:e})}function Q(a,c,d,e){c=a[c];for(var b=[],h=c.length-1;0<=h;h--)b.push(c[h].fn.apply(a.oInstance,e));null!==d&&f(a.oInstance).trigger(d,e);return b}function Xa(a){var c=f('<div style="position:absolute; top:0; left:0; height:1px; width:1px; overflow:hidden"><div style="position:absolute; top:1px; left:1px; width:100px; overflow:scroll;"><div id="DT_BrowserTest" style="width:100%; height:10px;"></div></div></div>')[0];m.body.appendChild(c);a.oBrowser.bScrollOversize=
-100===f("#DT_BrowserTest",c)[0].offsetWidth?!0:!1;m.body.removeChild(c)}function Ya(a){return function(){var c=[I(this[l.ext.iApiIndex])].concat(Array.prototype.slice.call(arguments));return l.ext.oApi[a].apply(this,c)}}var pa=/\[.*?\]$/,Za=u.JSON?JSON.stringify:function(a){var c=typeof a;if("object"!==c||null===a)return"string"===c&&(a='"'+a+'"'),a+"";var d,e,b=[],h=f.isArray(a);for(d in a)e=a[d],c=typeof e,"string"===c?e='"'+e+'"':"object"===c&&null!==e&&(e=Za(e)),b.push((h?"":'"'+d+'":')+e);return(h?
-"[":"{")+b+(h?"]":"}")};this.$=function(a,c){var d,e,b=[],h;e=I(this[l.ext.iApiIndex]);var g=e.aoData,p=e.aiDisplay,r=e.aiDisplayMaster;c||(c={});c=f.extend({},{filter:"none",order:"current",page:"all"},c);if("current"==c.page)for(d=e._iDisplayStart,e=e.fnDisplayEnd();d<e;d++)(h=g[p[d]].nTr)&&b.push(h);else if("current"==c.order&&"none"==c.filter)for(d=0,e=r.length;d<e;d++)(h=g[r[d]].nTr)&&b.push(h);else if("current"==c.order&&"applied"==c.filter)for(d=0,e=p.length;d<e;d++)(h=g[p[d]].nTr)&&b.push(h);
-else if("original"==c.order&&"none"==c.filter)for(d=0,e=g.length;d<e;d++)(h=g[d].nTr)&&b.push(h);else if("original"==c.order&&"applied"==c.filter)for(d=0,e=g.length;d<e;d++)h=g[d].nTr,-1!==f.inArray(d,p)&&h&&b.push(h);else aa(e,1,"Unknown selection options");b=f(b);d=b.filter(a);b=b.find(a);return f([].concat(f.makeArray(d),f.makeArray(b)))};this._=function(a,c){var d=[],e,b,h=this.$(a,c);e=0;for(b=h.length;e<b;e++)d.push(this.fnGetData(h[e]));return d};this.fnAddData=function(a,c){if(0===a.length)return[];
-var d=[],e,b=I(this[l.ext.iApiIndex]);if("object"===typeof a[0]&&null!==a[0])for(var h=0;h<a.length;h++){e=L(b,a[h]);if(-1==e)return d;d.push(e)}else{e=L(b,a);if(-1==e)return d;d.push(e)}b.aiDisplay=b.aiDisplayMaster.slice();(c===n||c)&&q(b);return d};this.fnAdjustColumnSizing=function(a){var c=I(this[l.ext.iApiIndex]);y(c);a===n||a?this.fnDraw(!1):""===c.oScroll.sX&&""===c.oScroll.sY||this.oApi._fnScrollDraw(c)};this.fnClearTable=function(a){var c=I(this[l.ext.iApiIndex]);qa(c);(a===n||a)&&C(c)};
-this.fnClose=function(a){for(var c=I(this[l.ext.iApiIndex]),d=0;d<c.aoOpenRows.length;d++)if(c.aoOpenRows[d].nParent==a)return(a=c.aoOpenRows[d].nTr.parentNode)&&a.removeChild(c.aoOpenRows[d].nTr),c.aoOpenRows.splice(d,1),0;return 1};this.fnDeleteRow=function(a,c,d){var e=I(this[l.ext.iApiIndex]),b,h;a="object"===typeof a?ca(e,a):a;var g=e.aoData.splice(a,1);b=0;for(h=e.aoData.length;b<h;b++)null!==e.aoData[b].nTr&&(e.aoData[b].nTr._DT_RowIndex=b);b=f.inArray(a,e.aiDisplay);e.asDataSearch.splice(b,
-1);ra(e.aiDisplayMaster,a);ra(e.aiDisplay,a);"function"===typeof c&&c.call(this,e,g);e._iDisplayStart>=e.fnRecordsDisplay()&&(e._iDisplayStart-=e._iDisplayLength,0>e._iDisplayStart&&(e._iDisplayStart=0));if(d===n||d)M(e),C(e);return g};this.fnDestroy=function(a){var c=I(this[l.ext.iApiIndex]),d=c.nTableWrapper.parentNode,e=c.nTBody,k,h;a=a===n?!1:a;c.bDestroying=!0;Q(c,"aoDestroyCallback","destroy",[c]);if(!a)for(k=0,h=c.aoColumns.length;k<h;k++)!1===c.aoColumns[k].bVisible&&this.fnSetColumnVis(k,
-!0);f(c.nTableWrapper).find("*").andSelf().unbind(".DT");f("tbody>tr>td."+c.oClasses.sRowEmpty,c.nTable).parent().remove();c.nTable!=c.nTHead.parentNode&&(f(c.nTable).children("thead").remove(),c.nTable.appendChild(c.nTHead));c.nTFoot&&c.nTable!=c.nTFoot.parentNode&&(f(c.nTable).children("tfoot").remove(),c.nTable.appendChild(c.nTFoot));c.nTable.parentNode.removeChild(c.nTable);f(c.nTableWrapper).remove();c.aaSorting=[];c.aaSortingFixed=[];ma(c);f(oa(c)).removeClass(c.asStripeClasses.join(" "));f("th, td",
-c.nTHead).removeClass([c.oClasses.sSortable,c.oClasses.sSortableAsc,c.oClasses.sSortableDesc,c.oClasses.sSortableNone].join(" "));c.bJUI&&(f("th span."+c.oClasses.sSortIcon+", td span."+c.oClasses.sSortIcon,c.nTHead).remove(),f("th, td",c.nTHead).each(function(){var a=f("div."+c.oClasses.sSortJUIWrapper,this),d=a.contents();f(this).append(d);a.remove()}));!a&&c.nTableReinsertBefore?d.insertBefore(c.nTable,c.nTableReinsertBefore):a||d.appendChild(c.nTable);k=0;for(h=c.aoData.length;k<h;k++)null!==
-c.aoData[k].nTr&&e.appendChild(c.aoData[k].nTr);!0===c.oFeatures.bAutoWidth&&(c.nTable.style.width=B(c.sDestroyWidth));if(h=c.asDestroyStripes.length)for(a=f(e).children("tr"),k=0;k<h;k++)a.filter(":nth-child("+h+"n + "+k+")").addClass(c.asDestroyStripes[k]);k=0;for(h=l.settings.length;k<h;k++)l.settings[k]==c&&l.settings.splice(k,1);b=c=null};this.fnDraw=function(a){var c=I(this[l.ext.iApiIndex]);!1===a?(M(c),C(c)):q(c)};this.fnFilter=function(a,c,d,e,b,h){var g=I(this[l.ext.iApiIndex]);if(g.oFeatures.bFilter){if(d===
-n||null===d)d=!1;if(e===n||null===e)e=!0;if(b===n||null===b)b=!0;if(h===n||null===h)h=!0;if(c===n||null===c){if(G(g,{sSearch:a+"",bRegex:d,bSmart:e,bCaseInsensitive:h},1),b&&g.aanFeatures.f)for(c=g.aanFeatures.f,d=0,e=c.length;d<e;d++)try{c[d]._DT_Input!=m.activeElement&&f(c[d]._DT_Input).val(a)}catch(p){f(c[d]._DT_Input).val(a)}}else f.extend(g.aoPreSearchCols[c],{sSearch:a+"",bRegex:d,bSmart:e,bCaseInsensitive:h}),G(g,g.oPreviousSearch,1)}};this.fnGetData=function(a,c){var d=I(this[l.ext.iApiIndex]);
-if(a!==n){var e=a;if("object"===typeof a){var b=a.nodeName.toLowerCase();"tr"===b?e=ca(d,a):"td"===b&&(e=ca(d,a.parentNode),c=ha(d,e,a))}return c!==n?w(d,e,c,""):d.aoData[e]!==n?d.aoData[e]._aData:null}return T(d)};this.fnGetNodes=function(a){var c=I(this[l.ext.iApiIndex]);return a!==n?c.aoData[a]!==n?c.aoData[a].nTr:null:oa(c)};this.fnGetPosition=function(a){var c=I(this[l.ext.iApiIndex]),d=a.nodeName.toUpperCase();return"TR"==d?ca(c,a):"TD"==d||"TH"==d?(d=ca(c,a.parentNode),a=ha(c,d,a),[d,s(c,a),
-a]):null};this.fnIsOpen=function(a){for(var c=I(this[l.ext.iApiIndex]),d=0;d<c.aoOpenRows.length;d++)if(c.aoOpenRows[d].nParent==a)return!0;return!1};this.fnOpen=function(a,c,d){var e=I(this[l.ext.iApiIndex]),b=oa(e);if(-1!==f.inArray(a,b)){this.fnClose(a);var b=m.createElement("tr"),h=m.createElement("td");b.appendChild(h);h.className=d;h.colSpan=x(e);"string"===typeof c?h.innerHTML=c:f(h).html(c);c=f("tr",e.nTBody);-1!=f.inArray(a,c)&&f(b).insertAfter(a);e.aoOpenRows.push({nTr:b,nParent:a});return b}};
-this.fnPageChange=function(a,c){var d=I(this[l.ext.iApiIndex]);Ca(d,a);M(d);(c===n||c)&&C(d)};this.fnSetColumnVis=function(a,c,d){var e=I(this[l.ext.iApiIndex]),b,h,g=e.aoColumns,f=e.aoData,p,r;if(g[a].bVisible!=c){if(c){for(b=h=0;b<a;b++)g[b].bVisible&&h++;r=h>=x(e);if(!r)for(b=a;b<g.length;b++)if(g[b].bVisible){p=b;break}b=0;for(h=f.length;b<h;b++)null!==f[b].nTr&&(r?f[b].nTr.appendChild(f[b]._anHidden[a]):f[b].nTr.insertBefore(f[b]._anHidden[a],ia(e,b)[p]))}else for(b=0,h=f.length;b<h;b++)null!==
-f[b].nTr&&(p=ia(e,b)[a],f[b]._anHidden[a]=p,p.parentNode.removeChild(p));g[a].bVisible=c;H(e,e.aoHeader);e.nTFoot&&H(e,e.aoFooter);b=0;for(h=e.aoOpenRows.length;b<h;b++)e.aoOpenRows[b].nTr.colSpan=x(e);if(d===n||d)y(e),C(e);Da(e)}};this.fnSettings=function(){return I(this[l.ext.iApiIndex])};this.fnSort=function(a){var c=I(this[l.ext.iApiIndex]);c.aaSorting=a;la(c)};this.fnSortListener=function(a,c,d){ya(I(this[l.ext.iApiIndex]),a,c,d)};this.fnUpdate=function(a,c,d,b,k){var h=I(this[l.ext.iApiIndex]);
-c="object"===typeof c?ca(h,c):c;if(f.isArray(a)&&d===n)for(h.aoData[c]._aData=a.slice(),d=0;d<h.aoColumns.length;d++)this.fnUpdate(w(h,c,d),c,d,!1,!1);else if(f.isPlainObject(a)&&d===n)for(h.aoData[c]._aData=f.extend(!0,{},a),d=0;d<h.aoColumns.length;d++)this.fnUpdate(w(h,c,d),c,d,!1,!1);else{S(h,c,d,a);a=w(h,c,d,"display");var g=h.aoColumns[d];null!==g.fnRender&&(a=X(h,c,d),g.bUseRendered&&S(h,c,d,a));null!==h.aoData[c].nTr&&(ia(h,c)[d].innerHTML=a)}d=f.inArray(c,h.aiDisplay);h.asDataSearch[d]=Y(h,
-ja(h,c,"filter",W(h,"bSearchable")));(k===n||k)&&y(h);(b===n||b)&&q(h);return 0};this.fnVersionCheck=l.ext.fnVersionCheck;this.oApi={_fnExternApiFunc:Ya,_fnInitialise:va,_fnInitComplete:sa,_fnLanguageCompat:Ba,_fnAddColumn:t,_fnColumnOptions:E,_fnAddData:L,_fnCreateTr:r,_fnGatherData:ka,_fnBuildHead:p,_fnDrawHead:H,_fnDraw:C,_fnReDraw:q,_fnAjaxUpdate:Fa,_fnAjaxParameters:La,_fnAjaxUpdateDraw:Ma,_fnServerParams:Aa,_fnAddOptionsHtml:Ga,_fnFeatureHtmlTable:Ja,_fnScrollDraw:Oa,_fnAdjustColumnSizing:y,
-_fnFeatureHtmlFilter:ta,_fnFilterComplete:G,_fnFilterCustom:F,_fnFilterColumn:da,_fnFilter:R,_fnBuildSearchArray:A,_fnBuildSearchRow:Y,_fnFilterCreateSearch:ea,_fnDataToSearch:V,_fnSort:la,_fnSortAttachListener:ya,_fnSortingClasses:ma,_fnFeatureHtmlPaginate:Ka,_fnPageChange:Ca,_fnFeatureHtmlInfo:fa,_fnUpdateInfo:Na,_fnFeatureHtmlLength:Ha,_fnFeatureHtmlProcessing:Ia,_fnProcessingDisplay:ba,_fnVisibleToColumnIndex:v,_fnColumnIndexToVisible:s,_fnNodeToDataIndex:ca,_fnVisbleColumns:x,_fnCalculateEnd:M,
-_fnConvertToWidth:Pa,_fnCalculateColumnWidths:xa,_fnScrollingWidthAdjust:Ra,_fnGetWidestNode:Qa,_fnGetMaxLenString:Sa,_fnStringToCss:B,_fnDetectType:K,_fnSettingsFromNode:I,_fnGetDataMaster:T,_fnGetTrNodes:oa,_fnGetTdNodes:ia,_fnEscapeRegex:ua,_fnDeleteIndex:ra,_fnReOrderIndex:D,_fnColumnOrdering:P,_fnLog:aa,_fnClearTable:qa,_fnSaveState:Da,_fnLoadState:Va,_fnCreateCookie:function(a,c,d,b,k){var h=new Date;h.setTime(h.getTime()+1E3*d);d=u.location.pathname.split("/");a=a+"_"+d.pop().replace(/[\/:]/g,
-"").toLowerCase();var g;null!==k?(g="function"===typeof f.parseJSON?f.parseJSON(c):eval("("+c+")"),c=k(a,g,h.toGMTString(),d.join("/")+"/")):c=a+"="+encodeURIComponent(c)+"; expires="+h.toGMTString()+"; path="+d.join("/")+"/";a=m.cookie.split(";");k=c.split(";")[0].length;h=[];if(4096<k+m.cookie.length+10){for(var p=0,r=a.length;p<r;p++)if(-1!=a[p].indexOf(b)){var q=a[p].split("=");try{(g=eval("("+decodeURIComponent(q[1])+")"))&&g.iCreate&&h.push({name:q[0],time:g.iCreate})}catch(l){}}for(h.sort(function(a,
-c){return c.time-a.time});4096<k+m.cookie.length+10;){if(0===h.length)return;b=h.pop();m.cookie=b.name+"=; expires=Thu, 01-Jan-1970 00:00:01 GMT; path="+d.join("/")+"/"}}m.cookie=c},_fnReadCookie:function(a){var c=u.location.pathname.split("/");a=a+"_"+c[c.length-1].replace(/[\/:]/g,"").toLowerCase()+"=";for(var c=m.cookie.split(";"),d=0;d<c.length;d++){for(var b=c[d];" "==b.charAt(0);)b=b.substring(1,b.length);if(0===b.indexOf(a))return decodeURIComponent(b.substring(a.length,b.length))}return null},
-_fnDetectHeader:J,_fnGetUniqueThs:N,_fnScrollBarWidth:Ta,_fnApplyToChildren:Z,_fnMap:z,_fnGetRowData:ja,_fnGetCellData:w,_fnSetCellData:S,_fnGetObjectDataFn:ga,_fnSetObjectDataFn:na,_fnApplyColumnDefs:U,_fnBindAction:Ua,_fnExtend:Wa,_fnCallbackReg:O,_fnCallbackFire:Q,_fnJsonString:Za,_fnRender:X,_fnNodeToColumnIndex:ha,_fnInfoMacros:za,_fnBrowserDetect:Xa,_fnGetColumns:W};f.extend(l.ext.oApi,this.oApi);for(var Ea in l.ext.oApi)Ea&&(this[Ea]=Ya(Ea));var wa=this;this.each(function(){var a=0,c,d,e;d=
-this.getAttribute("id");var k=!1,h=!1;if("table"!=this.nodeName.toLowerCase())aa(null,0,"Attempted to initialise DataTables on a node which is not a table: "+this.nodeName);else{a=0;for(c=l.settings.length;a<c;a++){if(l.settings[a].nTable==this){if(b===n||b.bRetrieve)return l.settings[a].oInstance;if(b.bDestroy){l.settings[a].oInstance.fnDestroy();break}else{aa(l.settings[a],0,"Cannot reinitialise DataTable.\n\nTo retrieve the DataTables object for this table, pass no arguments or see the docs for bRetrieve and bDestroy");
-return}}if(l.settings[a].sTableId==this.id){l.settings.splice(a,1);break}}if(null===d||""===d)this.id=d="DataTables_Table_"+l.ext._oExternConfig.iNextUnique++;var g=f.extend(!0,{},l.models.oSettings,{nTable:this,oApi:wa.oApi,oInit:b,sDestroyWidth:f(this).width(),sInstance:d,sTableId:d});l.settings.push(g);g.oInstance=1===wa.length?wa:f(this).dataTable();b||(b={});b.oLanguage&&Ba(b.oLanguage);b=Wa(f.extend(!0,{},l.defaults),b);z(g.oFeatures,b,"bPaginate");z(g.oFeatures,b,"bLengthChange");z(g.oFeatures,
-b,"bFilter");z(g.oFeatures,b,"bSort");z(g.oFeatures,b,"bInfo");z(g.oFeatures,b,"bProcessing");z(g.oFeatures,b,"bAutoWidth");z(g.oFeatures,b,"bSortClasses");z(g.oFeatures,b,"bServerSide");z(g.oFeatures,b,"bDeferRender");z(g.oScroll,b,"sScrollX","sX");z(g.oScroll,b,"sScrollXInner","sXInner");z(g.oScroll,b,"sScrollY","sY");z(g.oScroll,b,"bScrollCollapse","bCollapse");z(g.oScroll,b,"bScrollInfinite","bInfinite");z(g.oScroll,b,"iScrollLoadGap","iLoadGap");z(g.oScroll,b,"bScrollAutoCss","bAutoCss");z(g,
-b,"asStripeClasses");z(g,b,"asStripClasses","asStripeClasses");z(g,b,"fnServerData");z(g,b,"fnFormatNumber");z(g,b,"sServerMethod");z(g,b,"aaSorting");z(g,b,"aaSortingFixed");z(g,b,"aLengthMenu");z(g,b,"sPaginationType");z(g,b,"sAjaxSource");z(g,b,"sAjaxDataProp");z(g,b,"iCookieDuration");z(g,b,"sCookiePrefix");z(g,b,"sDom");z(g,b,"bSortCellsTop");z(g,b,"iTabIndex");z(g,b,"oSearch","oPreviousSearch");z(g,b,"aoSearchCols","aoPreSearchCols");z(g,b,"iDisplayLength","_iDisplayLength");z(g,b,"bJQueryUI",
-"bJUI");z(g,b,"fnCookieCallback");z(g,b,"fnStateLoad");z(g,b,"fnStateSave");z(g.oLanguage,b,"fnInfoCallback");O(g,"aoDrawCallback",b.fnDrawCallback,"user");O(g,"aoServerParams",b.fnServerParams,"user");O(g,"aoStateSaveParams",b.fnStateSaveParams,"user");O(g,"aoStateLoadParams",b.fnStateLoadParams,"user");O(g,"aoStateLoaded",b.fnStateLoaded,"user");O(g,"aoRowCallback",b.fnRowCallback,"user");O(g,"aoRowCreatedCallback",b.fnCreatedRow,"user");O(g,"aoHeaderCallback",b.fnHeaderCallback,"user");O(g,"aoFooterCallback",
-b.fnFooterCallback,"user");O(g,"aoInitComplete",b.fnInitComplete,"user");O(g,"aoPreDrawCallback",b.fnPreDrawCallback,"user");g.oFeatures.bServerSide&&g.oFeatures.bSort&&g.oFeatures.bSortClasses?O(g,"aoDrawCallback",ma,"server_side_sort_classes"):g.oFeatures.bDeferRender&&O(g,"aoDrawCallback",ma,"defer_sort_classes");b.bJQueryUI?(f.extend(g.oClasses,l.ext.oJUIClasses),b.sDom===l.defaults.sDom&&"lfrtip"===l.defaults.sDom&&(g.sDom='<"H"lfr>t<"F"ip>')):f.extend(g.oClasses,l.ext.oStdClasses);f(this).addClass(g.oClasses.sTable);
-if(""!==g.oScroll.sX||""!==g.oScroll.sY)g.oScroll.iBarWidth=Ta();g.iInitDisplayStart===n&&(g.iInitDisplayStart=b.iDisplayStart,g._iDisplayStart=b.iDisplayStart);b.bStateSave&&(g.oFeatures.bStateSave=!0,Va(g,b),O(g,"aoDrawCallback",Da,"state_save"));null!==b.iDeferLoading&&(g.bDeferLoading=!0,a=f.isArray(b.iDeferLoading),g._iRecordsDisplay=a?b.iDeferLoading[0]:b.iDeferLoading,g._iRecordsTotal=a?b.iDeferLoading[1]:b.iDeferLoading);null!==b.aaData&&(h=!0);""!==b.oLanguage.sUrl?(g.oLanguage.sUrl=b.oLanguage.sUrl,
-f.getJSON(g.oLanguage.sUrl,null,function(a){Ba(a);f.extend(!0,g.oLanguage,b.oLanguage,a);va(g)}),k=!0):f.extend(!0,g.oLanguage,b.oLanguage);null===b.asStripeClasses&&(g.asStripeClasses=[g.oClasses.sStripeOdd,g.oClasses.sStripeEven]);c=g.asStripeClasses.length;g.asDestroyStripes=[];if(c){d=!1;e=f(this).children("tbody").children("tr:lt("+c+")");for(a=0;a<c;a++)e.hasClass(g.asStripeClasses[a])&&(d=!0,g.asDestroyStripes.push(g.asStripeClasses[a]));d&&e.removeClass(g.asStripeClasses.join(" "))}d=[];a=
-this.getElementsByTagName("thead");0!==a.length&&(J(g.aoHeader,a[0]),d=N(g));if(null===b.aoColumns)for(e=[],a=0,c=d.length;a<c;a++)e.push(null);else e=b.aoColumns;a=0;for(c=e.length;a<c;a++)b.saved_aoColumns!==n&&b.saved_aoColumns.length==c&&(null===e[a]&&(e[a]={}),e[a].bVisible=b.saved_aoColumns[a].bVisible),t(g,d?d[a]:null);U(g,b.aoColumnDefs,e,function(a,c){E(g,a,c)});a=0;for(c=g.aaSorting.length;a<c;a++){g.aaSorting[a][0]>=g.aoColumns.length&&(g.aaSorting[a][0]=0);var p=g.aoColumns[g.aaSorting[a][0]];
-g.aaSorting[a][2]===n&&(g.aaSorting[a][2]=0);b.aaSorting===n&&g.saved_aaSorting===n&&(g.aaSorting[a][1]=p.asSorting[0]);d=0;for(e=p.asSorting.length;d<e;d++)if(g.aaSorting[a][1]==p.asSorting[d]){g.aaSorting[a][2]=d;break}}ma(g);Xa(g);a=f(this).children("caption").each(function(){this._captionSide=f(this).css("caption-side")});c=f(this).children("thead");0===c.length&&(c=[m.createElement("thead")],this.appendChild(c[0]));g.nTHead=c[0];c=f(this).children("tbody");0===c.length&&(c=[m.createElement("tbody")],
-this.appendChild(c[0]));g.nTBody=c[0];g.nTBody.setAttribute("role","alert");g.nTBody.setAttribute("aria-live","polite");g.nTBody.setAttribute("aria-relevant","all");c=f(this).children("tfoot");0===c.length&&(0<a.length&&(""!==g.oScroll.sX||""!==g.oScroll.sY))&&(c=[m.createElement("tfoot")],this.appendChild(c[0]));0<c.length&&(g.nTFoot=c[0],J(g.aoFooter,g.nTFoot));if(h)for(a=0;a<b.aaData.length;a++)L(g,b.aaData[a]);else ka(g);g.aiDisplay=g.aiDisplayMaster.slice();g.bInitialised=!0;!1===k&&va(g)}});
-wa=null;return this};l.fnVersionCheck=function(b){var f=function(b,f){for(;b.length<f;)b+="0";return b},n=l.ext.sVersion.split(".");b=b.split(".");for(var m="",v="",s=0,x=b.length;s<x;s++)m+=f(n[s],3),v+=f(b[s],3);return parseInt(m,10)>=parseInt(v,10)};l.fnIsDataTable=function(b){for(var f=l.settings,n=0;n<f.length;n++)if(f[n].nTable===b||f[n].nScrollHead===b||f[n].nScrollFoot===b)return!0;return!1};l.fnTables=function(b){var t=[];jQuery.each(l.settings,function(l,n){(!b||!0===b&&f(n.nTable).is(":visible"))&&
-t.push(n.nTable)});return t};l.version="1.9.4";l.settings=[];l.models={};l.models.ext={afnFiltering:[],afnSortData:[],aoFeatures:[],aTypes:[],fnVersionCheck:l.fnVersionCheck,iApiIndex:0,ofnSearch:{},oApi:{},oStdClasses:{},oJUIClasses:{},oPagination:{},oSort:{},sVersion:l.version,sErrMode:"alert",_oExternConfig:{iNextUnique:0}};l.models.oSearch={bCaseInsensitive:!0,sSearch:"",bRegex:!1,bSmart:!0};l.models.oRow={nTr:null,_aData:[],_aSortData:[],_anHidden:[],_sRowStripe:""};l.models.oColumn={aDataSort:null,
-asSorting:null,bSearchable:null,bSortable:null,bUseRendered:null,bVisible:null,_bAutoType:!0,fnCreatedCell:null,fnGetData:null,fnRender:null,fnSetData:null,mData:null,mRender:null,nTh:null,nTf:null,sClass:null,sContentPadding:null,sDefaultContent:null,sName:null,sSortDataType:"std",sSortingClass:null,sSortingClassJUI:null,sTitle:null,sType:null,sWidth:null,sWidthOrig:null};l.defaults={aaData:null,aaSorting:[[0,"asc"]],aaSortingFixed:null,aLengthMenu:[10,25,50,100],aoColumns:null,aoColumnDefs:null,
-aoSearchCols:[],asStripeClasses:null,bAutoWidth:!0,bDeferRender:!1,bDestroy:!1,bFilter:!0,bInfo:!0,bJQueryUI:!1,bLengthChange:!0,bPaginate:!0,bProcessing:!1,bRetrieve:!1,bScrollAutoCss:!0,bScrollCollapse:!1,bScrollInfinite:!1,bServerSide:!1,bSort:!0,bSortCellsTop:!1,bSortClasses:!0,bStateSave:!1,fnCookieCallback:null,fnCreatedRow:null,fnDrawCallback:null,fnFooterCallback:null,fnFormatNumber:function(b){if(1E3>b)return b;var f=b+"";b=f.split("");for(var l="",f=f.length,n=0;n<f;n++)0===n%3&&0!==n&&
-(l=this.oLanguage.sInfoThousands+l),l=b[f-n-1]+l;return l},fnHeaderCallback:null,fnInfoCallback:null,fnInitComplete:null,fnPreDrawCallback:null,fnRowCallback:null,fnServerData:function(b,l,n,m){m.jqXHR=f.ajax({url:b,data:l,success:function(b){b.sError&&m.oApi._fnLog(m,0,b.sError);f(m.oInstance).trigger("xhr",[m,b]);n(b)},dataType:"json",cache:!1,type:m.sServerMethod,error:function(b,f,l){"parsererror"==f&&m.oApi._fnLog(m,0,"DataTables warning: JSON data from server could not be parsed. This is caused by a JSON formatting error.")}})},
-fnServerParams:null,fnStateLoad:function(b){b=this.oApi._fnReadCookie(b.sCookiePrefix+b.sInstance);var l;try{l="function"===typeof f.parseJSON?f.parseJSON(b):eval("("+b+")")}catch(n){l=null}return l},fnStateLoadParams:null,fnStateLoaded:null,fnStateSave:function(b,f){this.oApi._fnCreateCookie(b.sCookiePrefix+b.sInstance,this.oApi._fnJsonString(f),b.iCookieDuration,b.sCookiePrefix,b.fnCookieCallback)},fnStateSaveParams:null,iCookieDuration:7200,iDeferLoading:null,iDisplayLength:10,iDisplayStart:0,
-iScrollLoadGap:100,iTabIndex:0,oLanguage:{oAria:{sSortAscending:": activate to sort column ascending",sSortDescending:": activate to sort column descending"},oPaginate:{sFirst:"First",sLast:"Last",sNext:"Next",sPrevious:"Previous"},sEmptyTable:"No data available in table",sInfo:"Showing _START_ to _END_ of _TOTAL_ entries",sInfoEmpty:"Showing 0 to 0 of 0 entries",sInfoFiltered:"(filtered from _MAX_ total entries)",sInfoPostFix:"",sInfoThousands:",",sLengthMenu:"Show _MENU_ entries",sLoadingRecords:"Loading...",
-sProcessing:"Processing...",sSearch:"Search:",sUrl:"",sZeroRecords:"No matching records found"},oSearch:f.extend({},l.models.oSearch),sAjaxDataProp:"aaData",sAjaxSource:null,sCookiePrefix:"SpryMedia_DataTables_",sDom:"lfrtip",sPaginationType:"two_button",sScrollX:"",sScrollXInner:"",sScrollY:"",sServerMethod:"GET"};l.defaults.columns={aDataSort:null,asSorting:["asc","desc"],bSearchable:!0,bSortable:!0,bUseRendered:!0,bVisible:!0,fnCreatedCell:null,fnRender:null,iDataSort:-1,mData:null,mRender:null,
-sCellType:"td",sClass:"",sContentPadding:"",sDefaultContent:null,sName:"",sSortDataType:"std",sTitle:null,sType:null,sWidth:null};l.models.oSettings={oFeatures:{bAutoWidth:null,bDeferRender:null,bFilter:null,bInfo:null,bLengthChange:null,bPaginate:null,bProcessing:null,bServerSide:null,bSort:null,bSortClasses:null,bStateSave:null},oScroll:{bAutoCss:null,bCollapse:null,bInfinite:null,iBarWidth:0,iLoadGap:null,sX:null,sXInner:null,sY:null},oLanguage:{fnInfoCallback:null},oBrowser:{bScrollOversize:!1},
-aanFeatures:[],aoData:[],aiDisplay:[],aiDisplayMaster:[],aoColumns:[],aoHeader:[],aoFooter:[],asDataSearch:[],oPreviousSearch:{},aoPreSearchCols:[],aaSorting:null,aaSortingFixed:null,asStripeClasses:null,asDestroyStripes:[],sDestroyWidth:0,aoRowCallback:[],aoHeaderCallback:[],aoFooterCallback:[],aoDrawCallback:[],aoRowCreatedCallback:[],aoPreDrawCallback:[],aoInitComplete:[],aoStateSaveParams:[],aoStateLoadParams:[],aoStateLoaded:[],sTableId:"",nTable:null,nTHead:null,nTFoot:null,nTBody:null,nTableWrapper:null,
-bDeferLoading:!1,bInitialised:!1,aoOpenRows:[],sDom:null,sPaginationType:"two_button",iCookieDuration:0,sCookiePrefix:"",fnCookieCallback:null,aoStateSave:[],aoStateLoad:[],oLoadedState:null,sAjaxSource:null,sAjaxDataProp:null,bAjaxDataGet:!0,jqXHR:null,fnServerData:null,aoServerParams:[],sServerMethod:null,fnFormatNumber:null,aLengthMenu:null,iDraw:0,bDrawing:!1,iDrawError:-1,_iDisplayLength:10,_iDisplayStart:0,_iDisplayEnd:10,_iRecordsTotal:0,_iRecordsDisplay:0,bJUI:null,oClasses:{},bFiltered:!1,
-bSorted:!1,bSortCellsTop:null,oInit:null,aoDestroyCallback:[],fnRecordsTotal:function(){return this.oFeatures.bServerSide?parseInt(this._iRecordsTotal,10):this.aiDisplayMaster.length},fnRecordsDisplay:function(){return this.oFeatures.bServerSide?parseInt(this._iRecordsDisplay,10):this.aiDisplay.length},fnDisplayEnd:function(){return this.oFeatures.bServerSide?!1===this.oFeatures.bPaginate||-1==this._iDisplayLength?this._iDisplayStart+this.aiDisplay.length:Math.min(this._iDisplayStart+this._iDisplayLength,
-this._iRecordsDisplay):this._iDisplayEnd},oInstance:null,sInstance:null,iTabIndex:0,nScrollHead:null,nScrollFoot:null};l.ext=f.extend(!0,{},l.models.ext);f.extend(l.ext.oStdClasses,{sTable:"dataTable",sPagePrevEnabled:"paginate_enabled_previous",sPagePrevDisabled:"paginate_disabled_previous",sPageNextEnabled:"paginate_enabled_next",sPageNextDisabled:"paginate_disabled_next",sPageJUINext:"",sPageJUIPrev:"",sPageButton:"paginate_button",sPageButtonActive:"paginate_active",sPageButtonStaticDisabled:"paginate_button paginate_button_disabled",
-sPageFirst:"first",sPagePrevious:"previous",sPageNext:"next",sPageLast:"last",sStripeOdd:"odd",sStripeEven:"even",sRowEmpty:"dataTables_empty",sWrapper:"dataTables_wrapper",sFilter:"dataTables_filter",sInfo:"dataTables_info",sPaging:"dataTables_paginate paging_",sLength:"dataTables_length",sProcessing:"dataTables_processing",sSortAsc:"sorting_asc",sSortDesc:"sorting_desc",sSortable:"sorting",sSortableAsc:"sorting_asc_disabled",sSortableDesc:"sorting_desc_disabled",sSortableNone:"sorting_disabled",
-sSortColumn:"sorting_",sSortJUIAsc:"",sSortJUIDesc:"",sSortJUI:"",sSortJUIAscAllowed:"",sSortJUIDescAllowed:"",sSortJUIWrapper:"",sSortIcon:"",sScrollWrapper:"dataTables_scroll",sScrollHead:"dataTables_scrollHead",sScrollHeadInner:"dataTables_scrollHeadInner",sScrollBody:"dataTables_scrollBody",sScrollFoot:"dataTables_scrollFoot",sScrollFootInner:"dataTables_scrollFootInner",sFooterTH:"",sJUIHeader:"",sJUIFooter:""});f.extend(l.ext.oJUIClasses,l.ext.oStdClasses,{sPagePrevEnabled:"fg-button ui-button ui-state-default ui-corner-left",
-sPagePrevDisabled:"fg-button ui-button ui-state-default ui-corner-left ui-state-disabled",sPageNextEnabled:"fg-button ui-button ui-state-default ui-corner-right",sPageNextDisabled:"fg-button ui-button ui-state-default ui-corner-right ui-state-disabled",sPageJUINext:"ui-icon ui-icon-circle-arrow-e",sPageJUIPrev:"ui-icon ui-icon-circle-arrow-w",sPageButton:"fg-button ui-button ui-state-default",sPageButtonActive:"fg-button ui-button ui-state-default ui-state-disabled",sPageButtonStaticDisabled:"fg-button ui-button ui-state-default ui-state-disabled",
-sPageFirst:"first ui-corner-tl ui-corner-bl",sPageLast:"last ui-corner-tr ui-corner-br",sPaging:"dataTables_paginate fg-buttonset ui-buttonset fg-buttonset-multi ui-buttonset-multi paging_",sSortAsc:"ui-state-default",sSortDesc:"ui-state-default",sSortable:"ui-state-default",sSortableAsc:"ui-state-default",sSortableDesc:"ui-state-default",sSortableNone:"ui-state-default",sSortJUIAsc:"css_right ui-icon ui-icon-triangle-1-n",sSortJUIDesc:"css_right ui-icon ui-icon-triangle-1-s",sSortJUI:"css_right ui-icon ui-icon-carat-2-n-s",
-sSortJUIAscAllowed:"css_right ui-icon ui-icon-carat-1-n",sSortJUIDescAllowed:"css_right ui-icon ui-icon-carat-1-s",sSortJUIWrapper:"DataTables_sort_wrapper",sSortIcon:"DataTables_sort_icon",sScrollHead:"dataTables_scrollHead ui-state-default",sScrollFoot:"dataTables_scrollFoot ui-state-default",sFooterTH:"ui-state-default",sJUIHeader:"fg-toolbar ui-toolbar ui-widget-header ui-corner-tl ui-corner-tr ui-helper-clearfix",sJUIFooter:"fg-toolbar ui-toolbar ui-widget-header ui-corner-bl ui-corner-br ui-helper-clearfix"});
-f.extend(l.ext.oPagination,{two_button:{fnInit:function(b,l,n){var m=b.oLanguage.oPaginate,v=function(f){b.oApi._fnPageChange(b,f.data.action)&&n(b)},m=b.bJUI?'<a class="'+b.oClasses.sPagePrevDisabled+'" tabindex="'+b.iTabIndex+'" role="button"><span class="'+b.oClasses.sPageJUIPrev+'"></span></a><a class="'+b.oClasses.sPageNextDisabled+'" tabindex="'+b.iTabIndex+'" role="button"><span class="'+b.oClasses.sPageJUINext+'"></span></a>':'<a class="'+b.oClasses.sPagePrevDisabled+'" tabindex="'+b.iTabIndex+
-'" role="button">'+m.sPrevious+'</a><a class="'+b.oClasses.sPageNextDisabled+'" tabindex="'+b.iTabIndex+'" role="button">'+m.sNext+"</a>";f(l).append(m);var s=f("a",l),m=s[0],s=s[1];b.oApi._fnBindAction(m,{action:"previous"},v);b.oApi._fnBindAction(s,{action:"next"},v);b.aanFeatures.p||(l.id=b.sTableId+"_paginate",m.id=b.sTableId+"_previous",s.id=b.sTableId+"_next",m.setAttribute("aria-controls",b.sTableId),s.setAttribute("aria-controls",b.sTableId))},fnUpdate:function(b,f){if(b.aanFeatures.p)for(var l=
-b.oClasses,n=b.aanFeatures.p,m,s=0,x=n.length;s<x;s++)if(m=n[s].firstChild)m.className=0===b._iDisplayStart?l.sPagePrevDisabled:l.sPagePrevEnabled,m=m.nextSibling,m.className=b.fnDisplayEnd()==b.fnRecordsDisplay()?l.sPageNextDisabled:l.sPageNextEnabled}},iFullNumbersShowPages:5,full_numbers:{fnInit:function(b,l,n){var m=b.oLanguage.oPaginate,v=b.oClasses,s=function(f){b.oApi._fnPageChange(b,f.data.action)&&n(b)};f(l).append('<a  tabindex="'+b.iTabIndex+'" class="'+v.sPageButton+" "+v.sPageFirst+'">'+
-m.sFirst+'</a><a  tabindex="'+b.iTabIndex+'" class="'+v.sPageButton+" "+v.sPagePrevious+'">'+m.sPrevious+'</a><span></span><a tabindex="'+b.iTabIndex+'" class="'+v.sPageButton+" "+v.sPageNext+'">'+m.sNext+'</a><a tabindex="'+b.iTabIndex+'" class="'+v.sPageButton+" "+v.sPageLast+'">'+m.sLast+"</a>");var x=f("a",l),m=x[0],v=x[1],u=x[2],x=x[3];b.oApi._fnBindAction(m,{action:"first"},s);b.oApi._fnBindAction(v,{action:"previous"},s);b.oApi._fnBindAction(u,{action:"next"},s);b.oApi._fnBindAction(x,{action:"last"},
-s);b.aanFeatures.p||(l.id=b.sTableId+"_paginate",m.id=b.sTableId+"_first",v.id=b.sTableId+"_previous",u.id=b.sTableId+"_next",x.id=b.sTableId+"_last")},fnUpdate:function(b,n){if(b.aanFeatures.p){var m=l.ext.oPagination.iFullNumbersShowPages,y=Math.floor(m/2),v=Math.ceil(b.fnRecordsDisplay()/b._iDisplayLength),s=Math.ceil(b._iDisplayStart/b._iDisplayLength)+1,x="",u,K=b.oClasses,D,P=b.aanFeatures.p,U=function(f){b.oApi._fnBindAction(this,{page:f+u-1},function(f){b.oApi._fnPageChange(b,f.data.page);
-n(b);f.preventDefault()})};-1===b._iDisplayLength?s=y=u=1:v<m?(u=1,y=v):s<=y?(u=1,y=m):s>=v-y?(u=v-m+1,y=v):(u=s-Math.ceil(m/2)+1,y=u+m-1);for(m=u;m<=y;m++)x+=s!==m?'<a tabindex="'+b.iTabIndex+'" class="'+K.sPageButton+'">'+b.fnFormatNumber(m)+"</a>":'<a tabindex="'+b.iTabIndex+'" class="'+K.sPageButtonActive+'">'+b.fnFormatNumber(m)+"</a>";m=0;for(y=P.length;m<y;m++)D=P[m],D.hasChildNodes()&&(f("span:eq(0)",D).html(x).children("a").each(U),D=D.getElementsByTagName("a"),D=[D[0],D[1],D[D.length-2],
-D[D.length-1]],f(D).removeClass(K.sPageButton+" "+K.sPageButtonActive+" "+K.sPageButtonStaticDisabled),f([D[0],D[1]]).addClass(1==s?K.sPageButtonStaticDisabled:K.sPageButton),f([D[2],D[3]]).addClass(0===v||s===v||-1===b._iDisplayLength?K.sPageButtonStaticDisabled:K.sPageButton))}}}});f.extend(l.ext.oSort,{"string-pre":function(b){"string"!=typeof b&&(b=null!==b&&b.toString?b.toString():"");return b.toLowerCase()},"string-asc":function(b,f){return b<f?-1:b>f?1:0},"string-desc":function(b,f){return b<
-f?1:b>f?-1:0},"html-pre":function(b){return b.replace(/<.*?>/g,"").toLowerCase()},"html-asc":function(b,f){return b<f?-1:b>f?1:0},"html-desc":function(b,f){return b<f?1:b>f?-1:0},"date-pre":function(b){b=Date.parse(b);if(isNaN(b)||""===b)b=Date.parse("01/01/1970 00:00:00");return b},"date-asc":function(b,f){return b-f},"date-desc":function(b,f){return f-b},"numeric-pre":function(b){return"-"==b||""===b?0:1*b},"numeric-asc":function(b,f){return b-f},"numeric-desc":function(b,f){return f-b}});f.extend(l.ext.aTypes,
-[function(b){if("number"===typeof b)return"numeric";if("string"!==typeof b)return null;var f,l=!1;f=b.charAt(0);if(-1=="0123456789-".indexOf(f))return null;for(var m=1;m<b.length;m++){f=b.charAt(m);if(-1=="0123456789.".indexOf(f))return null;if("."==f){if(l)return null;l=!0}}return"numeric"},function(b){var f=Date.parse(b);return null!==f&&!isNaN(f)||"string"===typeof b&&0===b.length?"date":null},function(b){return"string"===typeof b&&-1!=b.indexOf("<")&&-1!=b.indexOf(">")?"html":null}]);f.fn.DataTable=
-l;f.fn.dataTable=l;f.fn.dataTableSettings=l.settings;f.fn.dataTableExt=l.ext})})(window,document);
-jQuery.fn.dataTableExt.oApi.fnSetFilteringDelay=function(u,m){var n=this;m="undefined"==typeof m?250:m;this.each(function(f){$.fn.dataTableExt.iApiIndex=f;var l=null,b=null,t=$("input",n.fnSettings().aanFeatures.f);t.unbind("keyup").bind("keyup",function(){if(null===b||b!=t.val())window.clearTimeout(l),b=t.val(),l=window.setTimeout(function(){$.fn.dataTableExt.iApiIndex=f;n.fnFilter(t.val())},m)});return this});return this};
-jQuery.fn.dataTableExt.oSort["formatted-num-asc"]=function(u,m){var n=u.match(/\d/)?u.replace(/[^\d\-\.]/g,""):0,f=m.match(/\d/)?m.replace(/[^\d\-\.]/g,""):0;return parseFloat(n)-parseFloat(f)};jQuery.fn.dataTableExt.oSort["formatted-num-desc"]=function(u,m){var n=u.match(/\d/)?u.replace(/[^\d\-\.]/g,""):0,f=m.match(/\d/)?m.replace(/[^\d\-\.]/g,""):0;return parseFloat(f)-parseFloat(n)};
-(function(){var u,m,n=[],f=[],l=[],b=[],t=[],E=[],y=[],v=[],s=[],x=[],W=[],K=[],D=function(b,f,l){b=b.split("?");var m="";f=b[0]+"."+f;if(1<b.length)return l&&(m="&"+l),f+"?"+b[1]+m;l&&(m="?"+l);return f+m};S3.dataTables.formatRequest=function(b,p,l){var m=ka("#"+p),q=E[m].dataTableSettings[m];if(q){m="id="+p;p=$("#"+p+"_dataTable_filter");""!==p.val()&&(m+="&sFilter="+p.val());m+="&sSearch="+q.oPreviousSearch.sSearch;f=q.aoColumns;var n;p=0;for(n=f.length;p<n;p++)f[p].bSortable||(m+="&bSortable_"+
-p+"=false");q=null!==q.aaSortingFixed?q.aaSortingFixed.concat(q.aaSorting):q.aaSorting.slice();m+="&iSortingCols="+q.length;p=0;for(n=q.length;p<n;p++)m+="&iSortCol_"+p+"="+q[p][0],m+="&sSortDir_"+p+"="+q[p][1];l=D(l,b,m)}else l=D(l,b,"");window.open(l)};var P=function(b,f){var l=f.length,m=b.attr("class").split(/\s+/),q="";$.each(m,function(b,r){r.substr(0,l)==f&&(q=r)});return q},U=function(b){var f=$(".sublevel"+b.substr(6));f.each(function(){obj=$(this);if(obj.hasClass("group")&&obj.is(":visible")){var b=
-P(obj,"group_");U(b)}});f.hide();$(".arrow_e"+b).show();$(".arrow_s"+b).hide();$(".ui-icon-triangle-1-e").show();$(".ui-icon-triangle-1-s").hide();$("."+b).removeClass("activeRow")},L=function(b){var f=".sublevel"+b.substr(6);$(f).show();$(".arrow_e"+b).hide();$(".arrow_s"+b).show();$("#"+b+"_closed").hide();$("#"+b+"_open").show();$("."+b).addClass("activeRow");$(f+".spacer").show();b=$(f+":first");b.hasClass("spacer")&&(b=b.next());b.hasClass("collapsable")&&(b=P(b,"group_"))&&L(b)},ka=function(b){for(var f=
-S3.dataTables.id.length,l=0;l<f;l++)if(x[l]==b)return l;return-1};S3.dataTables.toggleDiv=function(b){$("#display"+b).toggle();$("#full"+b).toggle()};S3.dataTables.toggleRow=function(b){var f=".sublevel"+b.substr(6),l=$(f);l.is(":visible")?(U(b),l.hide(),$("#"+b+"_closed").show(),$("#"+b+"_open").hide(),$("#"+b+"_in").show(),$("#"+b+"_out").hide(),$(f+".spacer").show()):(l.show(),$("#"+b+"_closed").hide(),$("#"+b+"_open").show(),$("#"+b+"_in").hide(),$("#"+b+"_out").show())};var ca=function(b,f){var l=
-"",m="",q=$(f).attr("class").split(/\s+/);$.each(q,function(b,f){"level_"==f.substr(0,6)&&(l=f);"group_"==f.substr(0,6)&&(m=f)});ha(b,l,m)},ha=function(b,f,l){var m=f.substr(6);b=$(x[b]);P(b,"level_");b=b.attr("class").split(/\s+/);var q,n;$.each(b,function(b,f){"level_"==f.substr(0,6)&&f.substr(6)>=m&&(q=$(".activeRow."+f),$.each(q,function(b,f){n=P($(f),"group_");U(n)}))});L(l);$(".spacer.alwaysOpen").show();var t;$.each($(".activeRow"),function(b,f){n=P($(f),"group_");t=".sublevel"+n.substr(6);
-$(t+".spacer").show()})};S3.dataTables.accordionRow=ha;var ja=function(b,f,l){f=b.name;b=b.value;return"sSearch"==f&&""===b||(f.startsWith("sSearch_")&&""===b||f.startsWith("bRegex_")&&!b||f.startsWith("bSearchable_")&&b||f.startsWith("bSortable_")&&b)||f.startsWith("mDataProp_")&&(f=parseInt(f.substr(10),10),!isNaN(f)&&"number"==typeof b&&f==b)?!1:!0},w=function(b){var f=v[b].length;"Exclusive"==s[b]&&(f=K[b]-f);2==f?$(x[b]+" .pair-action").removeClass("hide"):$(x[b]+" .pair-action").addClass("hide")},
-S=function(b,f){for(var l=0,m=f.length;l<m;l++)if(b==f[l])return l;return-1},ga=function(b,f,l){if(0<f.rowActions.length)for(var m=0;m<l.length;m++)$("#"+l[m][0]).unbind("click").bind("click",l[m][1]);f.bulkActions&&$(".bulkcheckbox").unbind("change").change(function(f){var p=this.id.substr(6);f=S(p,v[b]);-1==f?(v[b].push(p),f=0):(v[b].splice(f,1),f=-1);p=$(this).parent().parent();w(b);na(b,p,f)})},na=function(b,f,t){"Inclusive"==s[b]&&($("#totalSelected").text(m.length),-1==t?($(f).removeClass("row_selected"),
-$(".bulkcheckbox",f).prop("checked",!1)):($(f).addClass("row_selected"),$(".bulkcheckbox",f).prop("checked",!0)));"Exclusive"==s[b]&&($("#totalSelected").text(parseInt($("#totalAvailable").text(),10)-m.length),-1==t?($(f).addClass("row_selected"),$(".bulkcheckbox",f).prop("checked",!0)):($(f).removeClass("row_selected"),$(".bulkcheckbox",f).prop("checked",!1)));l[b].bulkActions&&($(n[b][0]).val(s[b]),$(n[b][1]).val(v[b].join(",")),$(".dataTable-action").remove(),$(u).insertBefore("#bulk_select_options"),
-w(b))},T=function(b,f,l,m,q,n,t,v,s,u,x,y,D,G,F,w){var R="level_"+l,A="group_"+b+l+G;G="";for(var Y=1;Y<l;Y++)G+="<div style='float:left;width:10px;'>&nbsp;</div>";1<l&&(G=G+('<div id="'+A+'_closed" class="ui-icon ui-icon-triangle-1-e" style="float:left;"></div>')+('<div id="'+A+'_open" class="ui-icon ui-icon-triangle-1-s" style="float:left;display:none;"></div>'));l="";null!=n[f]?l=" ("+n[f]+")":(f=t+f,null!=n[f]&&(l=" ("+n[f]+")"));n=document.createElement("tr");n.className="group";if(y||D)$(n).addClass("headerRow").addClass(A).addClass(R),
-m&&$(n).addClass(m).addClass("collapsable");s?($(n).addClass("expandable"),D=t=s=f="","text"==u&&(t="\u2192",D="\u2193"),y?("icon"==u&&(f='class="ui-icon ui-icon-arrowthick-1-e" ',s='class="ui-icon ui-icon-arrowthick-1-s" '),u='<a id="'+A+'_in" href="javascript:S3.dataTables.toggleRow(\''+A+"');\" "+f+' style="float:right">'+t+"</a>",b='<a id="'+A+'_out" href="javascript:S3.dataTables.toggleRow(\''+A+"');\" "+s+' style="float:right; display:none">'+D+"</a>"):("icon"==u?(f='class="ui-icon ui-icon-arrowthick-1-e arrow_e'+
-A+'" ',s='class="ui-icon ui-icon-arrowthick-1-s arrow_s'+A+'" '):(f='class="arrow_e'+A+'" ',s='class="arrow_s'+A+'" '),u="<a href=\"javascript:S3.dataTables.accordionRow('"+b+"', '"+R+"', '"+A+"');\" "+f+' style="float:right">'+t+"</a>",b="<a href=\"javascript:S3.dataTables.accordionRow('"+b+"', '"+R+"', '"+A+"');\" "+s+' style="float:right; display:none">'+D+"</a>"),b=v+l+u+b):b=v+l;v=document.createElement("td");v.colSpan=q;v.innerHTML=G+b;n.appendChild(v);w?$(n).insertBefore(F):$(n).insertAfter(F);
-x&&(x=document.createElement("tr"),F=$(x),F.addClass("spacer"),m?F.addClass(m).addClass("collapsable"):F.addClass("alwaysOpen"),v=document.createElement("td"),v.colSpan=q,x.appendChild(v),F.insertAfter(n))},qa=function(b,f,m,n,q,t,v,s){var u=l[m];if("individual"==u.shrinkGroupedRows)var x=!0,y=!1;else"accordion"==u.shrinkGroupedRows?(x=!1,y=!0):y=x=!1;var D=u.groupSpacing,u=u.groupIcon,u=u.length>=s?u[s-1]:"icon",w=$(f+" tbody tr"),G=$(f+" thead tr")[0].getElementsByTagName("th").length,F="",E="",
-R=1,A=0,Y=0,ea="",V="level_"+s;$(f).addClass(V);for(f=0;f<w.length;f++)if(V=$(w[f]),!V.hasClass("spacer"))if(V.hasClass("group"))for(ea="sublevel"+P($(w[f]),"group_").substr(6),E=F="",V=0;V<t.length;V++)try{E+=b.aoData[b.aiDisplay[Y]]._aData[t[V]]+"_"}catch(ua){}else{var fa=b.aoData[b.aiDisplay[Y]]._aData[n];if(fa!=F){for(;v.length>A&&fa!=v[A][0];)F=v[A][1],T(m,F,s,ea,G,q,E,F,!1,u,D,x,y,R,w[f],!0),A++,R++;v.length>A?(F=v[A][1],T(m,F,s,ea,G,q,E,F,!0,u,D,x,y,R,w[f],!0),A++):T(m,fa,s,ea,G,q,E,fa,!0,
-u,D,x,y,R,w[f],!0);R++;F=fa}Y+=1;(x||y)&&V.hide()}for(;v.length>A;)F=v[A][1],T(m,F,s,ea,G,q,E,F,!1,u,D,x,y,R,w[w.length-1],!1),A++,R++},ra=function(b,f,l){var m=f.groupTitles,n=[];b="group-title-"+b;for(var t=m[0].length,v=0;v<t;v++)n[m[0][v][0]]=v;$.fn.dataTableExt.oSort[b+"-asc"]=function(b,f){return n[b]<n[f]?-1:n[b]>n[f]?1:0};$.fn.dataTableExt.oSort[b+"-desc"]=function(b,f){return n[b]<n[f]?1:n[b]>n[f]?-1:0};l[f.group[0][0]]={sType:b}},X=function(r,p,D){var C=$(r+"_configurations");if(0<C.length){var q=
-$.parseJSON(C.val()),C=[];l[p]=q;f[p]=C;0<q.groupTitles.length&&ra(p,q,C);fnActionCallBacks=[];for(var w=$(r).find("thead tr").first().children().length,J=0;J<w;J++)C[J]=null;1>q.rowActions.length&&(q.rowActions=S3.dataTables.Actions?S3.dataTables.Actions:[]);0<q.rowActions.length&&(C[q.actionCol]={sTitle:" ",bSortable:!1});q.bulkActions&&(C[q.bulkCol]={sTitle:'<select id="bulk_select_options"><option></option><option id="modeSelectionAll">Select All</option><option id="modeSelectionNone">Deselect All</option></select>',
-bSortable:!1});W[p]=[q.textMaxLength,q.textShrinkLength];if(0<q.group.length){for(var w=q.group,J=[],N=0;N<w.length;N++)J.push(w[N][0]);y[p]={bVisible:!1,aTargets:J}}else y[p]={bVisible:!1,aTargets:[]};if(q.bulkActions){w="";J=0;for(N=q.bulkActions.length;J<N;J++){var L=q.bulkActions[J],T,U,X="";L instanceof Array?(U=L[0],T=L[1],3==L.length&&(X=L[2])):T=U=L;w+='<input type="submit" id="submitSelection" class="'+X+'" name="'+T+'" value="'+U+'">&nbsp;'}u='<div class="dataTable-action">'+w+"</div>";
-m=$.parseJSON($(x[p]+"_dataTable_bulkSelection").val());null===m&&(m=[]);v[p]=m;s[p]="Inclusive";$(x[p]+"_dataTable_bulkSelectAll").val()&&(s[p]="Exclusive");n[p]=[x[p]+"_dataTable_bulkMode",x[p]+"_dataTable_bulkSelection"]}if("true"==q.pagination){var J=w=!0,ta=q.displayLength;0<$(x[p]+"_dataTable_cache").length?b[p]=$.parseJSON($(x[p]+"_dataTable_cache").val()):b[p]={iCacheLower:-1};var G=function(b,f,l){for(var m=0,p=b.length;m<p;m++)b[m].name==f&&(b[m].value=l)},F=function(b,f){for(var l=0,m=
-b.length;l<m;l++)if(b[l].name==f)return b[l].value;return null},N=function(f,l,m){var p=!1,n;if(this.hasOwnProperty("nTable")){n="#"+this.nTable.id;var q=ka(n);b[q]={lastRequest:[],iCacheLower:-1,iCacheUpper:-1};m({})}else{n="#"+this[0].id;q=ka(n);n=F(l,"iDisplayLength");var r;r=n==ta?6:49<n||-1==n?2:4;var v=F(l,"sEcho"),t=F(l,"iDisplayStart"),u=t+n,s=b[q];s.iDisplayStart=t;s.hasOwnProperty("lastJson")&&s.lastJson.hasOwnProperty("iTotalRecords")?K[q]=s.lastJson.iTotalRecords:K[q]=F(l,"iTotalRecords");
-s.hasOwnProperty("lastJson")&&s.lastJson.hasOwnProperty("iTotalDisplayRecords")&&s.lastJson.iTotalDisplayRecords<u&&(u=s.lastJson.iTotalDisplayRecords);-1!==s.iCacheUpper&&(-1==n||0>s.iCacheLower||t<s.iCacheLower||u>s.iCacheUpper)&&(p=!0);if(s.lastRequest&&!p)if(s.lastRequest.length)for(q=0,u=l.length;q<u;q++){if("iDisplayStart"!=l[q].name&&("iDisplayLength"!=l[q].name&&"sEcho"!=l[q].name)&&l[q].value!=s.lastRequest[q].value){p=!0;break}}else p=!0;s.lastRequest=l.slice();p?(t<s.iCacheLower&&(t-=n*
-(r-1),0>t&&(t=0)),s.iCacheLower=t,s.iDisplayLength=F(l,"iDisplayLength"),-1==n?(s.iCacheUpper=-1,G(l,"iDisplayStart","None"),G(l,"iDisplayLength","None")):(s.iCacheUpper=t+n*r,G(l,"iDisplayStart",t),G(l,"iDisplayLength",n*r)),l=l.filter(ja),$.getJSON(f,l,function(b){s.lastJson=$.extend(!0,{},b);s.iCacheLower!=s.iDisplayStart&&b.aaData.splice(0,s.iDisplayStart-s.iCacheLower);-1!==s.iDisplayLength&&b.aaData.splice(s.iDisplayLength,b.aaData.length);m(b)})):(json=$.extend(!0,{},s.lastJson),json.sEcho=
-v,-1!==n&&(json.aaData.splice(0,t-s.iCacheLower),json.aaData.splice(n,json.aaData.length)),m(json))}}}else J=w=!1,q.ajaxUrl=null,N=function(b,f,l){f=f.filter(ja);$.ajax({url:b,data:f,dataType:"json",cache:!1}).done(function(b,f){l&&l(b,f)}).fail(function(b,f,l){"parsererror"==f&&alert("DataTables warning: JSON data from server could not be parsed. This is caused by a JSON formatting error.")})};t[p]=N;var da;da=$(r).dataTable({aaSorting:q.aaSort,aaSortingFixed:q.group,aLengthMenu:q.lengthMenu,aoColumnDefs:[y[p]],
-aoColumns:C,bAutoWidth:!1,bDeferRender:!0,bDestroy:D,bFilter:"true"==q.bFilter,bProcessing:J,bServerSide:w,bSort:!0,sDom:q.sDom,iDisplayLength:q.displayLength,sPaginationType:q.paginationType,sAjaxSource:q.ajaxUrl,oLanguage:{oAria:{sSortAscending:": "+i18n.sSortAscending,sSortDescending:": "+i18n.sSortDescending},oPaginate:{sFirst:i18n.sFirst,sLast:i18n.sLast,sNext:i18n.sNext,sPrevious:i18n.sPrevious},sEmptyTable:i18n.sEmptyTable,sInfo:i18n.sInfo,sInfoEmpty:i18n.sInfoEmpty,sInfoFiltered:i18n.sInfoFiltered,
-sInfoThousands:i18n.sInfoThousands,sLengthMenu:i18n.sLengthMenu,sLoadingRecords:i18n.sLoadingRecords+"...",sProcessing:i18n.sProcessing+"...",sSearch:i18n.sSearch+":",sZeroRecords:i18n.sZeroRecords},fnHeaderCallback:function(b,f,l,m,n){$("#modeSelectionAll").on("click",function(b){s[p]="Exclusive";v[p]=[];da.fnDraw(!1)});$("#modeSelectionNone").on("click",function(b){s[p]="Inclusive";v[p]=[];da.fnDraw(!1)})},fnServerData:t[p],fnRowCallback:function(b,f,l){var m=q.actionCol,n=/>(.*)</i,r=n.exec(f[m]),
-r=null===r?f[m]:r[1];if(q.rowActions.length||q.bulkActions){var s="";if(q.rowActions.length)for(var t=q.rowActions,u=0;u<t.length;u++)if(!("restrict"in t[u]&&-1==S(r,t[u].restrict))){var x=t[u]._class,w=S3.Utf8.decode(t[u].label),n=/%5Bid%5D/g;t[u]._onclick?(n=t[u]._onclick.replace(n,r),s=s+'<a class="'+x+'" onclick="'+n+'">'+w+"</a>&nbsp;"):t[u]._jqclick?(s=s+'<span class="'+x+'" id="'+r+'">'+w+"</span>&nbsp;","undefined"!=typeof S3ActionCallBack&&fnActionCallBacks.push([r,S3ActionCallBack])):(t[u].icon&&
-(w='<img src="'+t[u].icon+'" alt="'+w+'" title="'+w+'">'),n=t[u].url.replace(n,r),s=s+'<a db_id="'+r+'" class="'+x+'" href="'+n+'" title="'+w+'">'+w+"</a>&nbsp;")}0<q.group.length&&q.group[0][0]<m&&(m-=1);$("td:eq("+m+")",b).addClass("actions").html(s)}q.bulkActions&&na(p,b,S(r,v[p]));m=q.rowStyles;if(m.length){var s=$(b),y;for(y in m)-1<S(r,m[y])&&s.addClass(y)}y=0;r=[];if(q.group.length)for(m=q.group,s=0;s<m.length;s++)r.push(m[s][0]);for(m=0;m<f.length;m++)-1==$.inArray(m,r)&&("<"!=f[m][0]&&f[m].length>
-W[p][0]&&(s="_"+p+l+m,t="<a href=\"javascript:S3.dataTables.toggleDiv('"+s+'\');" class="ui-icon ui-icon-zoomin" style="float:right"></a>',u='<div id="display'+s+'">'+t+f[m].substr(0,W[p][1])+"&hellip;</div>",t="<a href=\"javascript:S3.dataTables.toggleDiv('"+s+'\');" class="ui-icon ui-icon-zoomout" style="float:right"></a>',u+='<div  style="display:none" id="full'+s+'">'+t+f[m]+"</div>",$("td:eq("+y+")",b).html(u)),y++);return b},fnDrawCallback:function(b){ga(p,q,fnActionCallBacks);if(0!==b.aiDisplay.length){if(q.group.length){for(var f=
-q.group,l=0;l<f.length;l++){for(var m=[],n=0;n<l;n++)m.push(f[n][0]);qa(b,r,p,f[l][0],q.groupTotals.length>l?q.groupTotals[l]:[],m,q.groupTitles.length>l?q.groupTitles[l]:[],l+1)}f="accordion"==q.shrinkGroupedRows;if("individual"==q.shrinkGroupedRows||f){l=$(r+" tbody tr");m="";for(n=0;n<l.length;n++)obj=$(l[n]),obj.hasClass("headerRow")?(item=P(obj,"group_"),m="sublevel"+item.substr(6)):$(l[n]).addClass(m).addClass("collapsable");$(".collapsable").hide();f&&ha(p,"level_1","group_"+p+"11");$(".expandable").click(function(){ca(p,
-this)})}}1<Math.ceil(b.fnRecordsDisplay()/b._iDisplayLength)?$(r+"_paginate").css("display","block"):$(r+"_paginate").css("display","none")}}});da.fnSetFilteringDelay(450);S3.dataTables.Resize&&da.fnAdjustColumnSizing();E[p]=da}else E[p]=null};S3.dataTables.initDataTable=X;S3.dataTables.initAll=function(){if(S3.dataTables.id)for(var b=S3.dataTables.id.length,f=0;f<b;f++){var l="#"+S3.dataTables.id[f];x[f]=l;X(l,f,!1)}}})();
-$(document).ready(function(){S3.dataTables.initAll();var u=$("#gis_datatables_map-btn");if(u)u.on("click",function(){var m=u.attr("map");void 0==m&&(m="default_map");for(var m=S3.gis.maps[m],f=m.layers,l,b,t,E,y,v=0,s=f.length;v<s;v++)if(l=f[v],"search_results"==l.s3_layer_id){l.events.on({loadend:S3.gis.search_layer_loadend});E=l.strategies;b=0;for(t=E.length;b<t;b++)y=E[b],"OpenLayers.Strategy.AttributeCluster"==y.CLASS_NAME&&y.deactivate();l.setVisibility(!0)}m.s3.polygonButton&&m.s3.polygonButton.disable();
-m.s3.mapWin.show();$(".olMapViewport").removeClass("crosshair");u.parent().addClass("tab_here");$("#gis_datatables_list_tab").parent().removeClass("tab_here").addClass("tab_other");$("div.x-tool-close").click(function(b){u.parent().removeClass("tab_here").addClass("tab_other");$("#gis_datatables_list_tab").parent().removeClass("tab_other").addClass("tab_here")})});var m=$("#gis_search_map-btn");if(m)m.on("click",function(n){n.preventDefault();n=m.attr("map");void 0==n&&(n="default_map");n=S3.gis.maps[n];
-n.s3.polygonButton.enable();n.s3.mapWin.show();$(".olMapViewport").addClass("crosshair")})});$.fn.dataTableExt.oApi.fnReloadAjax=function(u,m){"undefined"!=m&&null!=m&&(u.sAjaxSource=m);this.oApi._fnProcessingDisplay(u,!0);var n=this;u.fnServerData(u.sAjaxSource,[],function(f){n.oApi._fnClearTable(u);n.fnDraw();n.oApi._fnProcessingDisplay(u,!1)},u)};
+(function(window,document,undefined){(function(factory){"use strict";if(typeof define==='function'&&define.amd)
+{define(['jquery'],factory);}
+else if(jQuery&&!jQuery.fn.dataTable)
+{factory(jQuery);}}
+(function($){"use strict";var DataTable=function(oInit)
+{function _fnAddColumn(oSettings,nTh)
+{var oDefaults=DataTable.defaults.columns;var iCol=oSettings.aoColumns.length;var oCol=$.extend({},DataTable.models.oColumn,oDefaults,{"sSortingClass":oSettings.oClasses.sSortable,"sSortingClassJUI":oSettings.oClasses.sSortJUI,"nTh":nTh?nTh:document.createElement('th'),"sTitle":oDefaults.sTitle?oDefaults.sTitle:nTh?nTh.innerHTML:'',"aDataSort":oDefaults.aDataSort?oDefaults.aDataSort:[iCol],"mData":oDefaults.mData?oDefaults.oDefaults:iCol});oSettings.aoColumns.push(oCol);if(oSettings.aoPreSearchCols[iCol]===undefined||oSettings.aoPreSearchCols[iCol]===null)
+{oSettings.aoPreSearchCols[iCol]=$.extend({},DataTable.models.oSearch);}
+else
+{var oPre=oSettings.aoPreSearchCols[iCol];if(oPre.bRegex===undefined)
+{oPre.bRegex=true;}
+if(oPre.bSmart===undefined)
+{oPre.bSmart=true;}
+if(oPre.bCaseInsensitive===undefined)
+{oPre.bCaseInsensitive=true;}}
+_fnColumnOptions(oSettings,iCol,null);}
+function _fnColumnOptions(oSettings,iCol,oOptions)
+{var oCol=oSettings.aoColumns[iCol];if(oOptions!==undefined&&oOptions!==null)
+{if(oOptions.mDataProp&&!oOptions.mData)
+{oOptions.mData=oOptions.mDataProp;}
+if(oOptions.sType!==undefined)
+{oCol.sType=oOptions.sType;oCol._bAutoType=false;}
+$.extend(oCol,oOptions);_fnMap(oCol,oOptions,"sWidth","sWidthOrig");if(oOptions.iDataSort!==undefined)
+{oCol.aDataSort=[oOptions.iDataSort];}
+_fnMap(oCol,oOptions,"aDataSort");}
+var mRender=oCol.mRender?_fnGetObjectDataFn(oCol.mRender):null;var mData=_fnGetObjectDataFn(oCol.mData);oCol.fnGetData=function(oData,sSpecific){var innerData=mData(oData,sSpecific);if(oCol.mRender&&(sSpecific&&sSpecific!==''))
+{return mRender(innerData,sSpecific,oData);}
+return innerData;};oCol.fnSetData=_fnSetObjectDataFn(oCol.mData);if(!oSettings.oFeatures.bSort)
+{oCol.bSortable=false;}
+if(!oCol.bSortable||($.inArray('asc',oCol.asSorting)==-1&&$.inArray('desc',oCol.asSorting)==-1))
+{oCol.sSortingClass=oSettings.oClasses.sSortableNone;oCol.sSortingClassJUI="";}
+else if($.inArray('asc',oCol.asSorting)==-1&&$.inArray('desc',oCol.asSorting)==-1)
+{oCol.sSortingClass=oSettings.oClasses.sSortable;oCol.sSortingClassJUI=oSettings.oClasses.sSortJUI;}
+else if($.inArray('asc',oCol.asSorting)!=-1&&$.inArray('desc',oCol.asSorting)==-1)
+{oCol.sSortingClass=oSettings.oClasses.sSortableAsc;oCol.sSortingClassJUI=oSettings.oClasses.sSortJUIAscAllowed;}
+else if($.inArray('asc',oCol.asSorting)==-1&&$.inArray('desc',oCol.asSorting)!=-1)
+{oCol.sSortingClass=oSettings.oClasses.sSortableDesc;oCol.sSortingClassJUI=oSettings.oClasses.sSortJUIDescAllowed;}}
+function _fnAdjustColumnSizing(oSettings)
+{if(oSettings.oFeatures.bAutoWidth===false)
+{return false;}
+_fnCalculateColumnWidths(oSettings);for(var i=0,iLen=oSettings.aoColumns.length;i<iLen;i++)
+{oSettings.aoColumns[i].nTh.style.width=oSettings.aoColumns[i].sWidth;}}
+function _fnVisibleToColumnIndex(oSettings,iMatch)
+{var aiVis=_fnGetColumns(oSettings,'bVisible');return typeof aiVis[iMatch]==='number'?aiVis[iMatch]:null;}
+function _fnColumnIndexToVisible(oSettings,iMatch)
+{var aiVis=_fnGetColumns(oSettings,'bVisible');var iPos=$.inArray(iMatch,aiVis);return iPos!==-1?iPos:null;}
+function _fnVisbleColumns(oSettings)
+{return _fnGetColumns(oSettings,'bVisible').length;}
+function _fnGetColumns(oSettings,sParam)
+{var a=[];$.map(oSettings.aoColumns,function(val,i){if(val[sParam]){a.push(i);}});return a;}
+function _fnDetectType(sData)
+{var aTypes=DataTable.ext.aTypes;var iLen=aTypes.length;for(var i=0;i<iLen;i++)
+{var sType=aTypes[i](sData);if(sType!==null)
+{return sType;}}
+return'string';}
+function _fnReOrderIndex(oSettings,sColumns)
+{var aColumns=sColumns.split(',');var aiReturn=[];for(var i=0,iLen=oSettings.aoColumns.length;i<iLen;i++)
+{for(var j=0;j<iLen;j++)
+{if(oSettings.aoColumns[i].sName==aColumns[j])
+{aiReturn.push(j);break;}}}
+return aiReturn;}
+function _fnColumnOrdering(oSettings)
+{var sNames='';for(var i=0,iLen=oSettings.aoColumns.length;i<iLen;i++)
+{sNames+=oSettings.aoColumns[i].sName+',';}
+if(sNames.length==iLen)
+{return"";}
+return sNames.slice(0,-1);}
+function _fnApplyColumnDefs(oSettings,aoColDefs,aoCols,fn)
+{var i,iLen,j,jLen,k,kLen;if(aoColDefs)
+{for(i=aoColDefs.length-1;i>=0;i--)
+{var aTargets=aoColDefs[i].aTargets;if(!$.isArray(aTargets))
+{_fnLog(oSettings,1,'aTargets must be an array of targets, not a '+(typeof aTargets));}
+for(j=0,jLen=aTargets.length;j<jLen;j++)
+{if(typeof aTargets[j]==='number'&&aTargets[j]>=0)
+{while(oSettings.aoColumns.length<=aTargets[j])
+{_fnAddColumn(oSettings);}
+fn(aTargets[j],aoColDefs[i]);}
+else if(typeof aTargets[j]==='number'&&aTargets[j]<0)
+{fn(oSettings.aoColumns.length+aTargets[j],aoColDefs[i]);}
+else if(typeof aTargets[j]==='string')
+{for(k=0,kLen=oSettings.aoColumns.length;k<kLen;k++)
+{if(aTargets[j]=="_all"||$(oSettings.aoColumns[k].nTh).hasClass(aTargets[j]))
+{fn(k,aoColDefs[i]);}}}}}}
+if(aoCols)
+{for(i=0,iLen=aoCols.length;i<iLen;i++)
+{fn(i,aoCols[i]);}}}
+function _fnAddData(oSettings,aDataSupplied)
+{var oCol;var aDataIn=($.isArray(aDataSupplied))?aDataSupplied.slice():$.extend(true,{},aDataSupplied);var iRow=oSettings.aoData.length;var oData=$.extend(true,{},DataTable.models.oRow);oData._aData=aDataIn;oSettings.aoData.push(oData);var nTd,sThisType;for(var i=0,iLen=oSettings.aoColumns.length;i<iLen;i++)
+{oCol=oSettings.aoColumns[i];if(typeof oCol.fnRender==='function'&&oCol.bUseRendered&&oCol.mData!==null)
+{_fnSetCellData(oSettings,iRow,i,_fnRender(oSettings,iRow,i));}
+else
+{_fnSetCellData(oSettings,iRow,i,_fnGetCellData(oSettings,iRow,i));}
+if(oCol._bAutoType&&oCol.sType!='string')
+{var sVarType=_fnGetCellData(oSettings,iRow,i,'type');if(sVarType!==null&&sVarType!=='')
+{sThisType=_fnDetectType(sVarType);if(oCol.sType===null)
+{oCol.sType=sThisType;}
+else if(oCol.sType!=sThisType&&oCol.sType!="html")
+{oCol.sType='string';}}}}
+oSettings.aiDisplayMaster.push(iRow);if(!oSettings.oFeatures.bDeferRender)
+{_fnCreateTr(oSettings,iRow);}
+return iRow;}
+function _fnGatherData(oSettings)
+{var iLoop,i,iLen,j,jLen,jInner,nTds,nTrs,nTd,nTr,aLocalData,iThisIndex,iRow,iRows,iColumn,iColumns,sNodeName,oCol,oData;if(oSettings.bDeferLoading||oSettings.sAjaxSource===null)
+{nTr=oSettings.nTBody.firstChild;while(nTr)
+{if(nTr.nodeName.toUpperCase()=="TR")
+{iThisIndex=oSettings.aoData.length;nTr._DT_RowIndex=iThisIndex;oSettings.aoData.push($.extend(true,{},DataTable.models.oRow,{"nTr":nTr}));oSettings.aiDisplayMaster.push(iThisIndex);nTd=nTr.firstChild;jInner=0;while(nTd)
+{sNodeName=nTd.nodeName.toUpperCase();if(sNodeName=="TD"||sNodeName=="TH")
+{_fnSetCellData(oSettings,iThisIndex,jInner,$.trim(nTd.innerHTML));jInner++;}
+nTd=nTd.nextSibling;}}
+nTr=nTr.nextSibling;}}
+nTrs=_fnGetTrNodes(oSettings);nTds=[];for(i=0,iLen=nTrs.length;i<iLen;i++)
+{nTd=nTrs[i].firstChild;while(nTd)
+{sNodeName=nTd.nodeName.toUpperCase();if(sNodeName=="TD"||sNodeName=="TH")
+{nTds.push(nTd);}
+nTd=nTd.nextSibling;}}
+for(iColumn=0,iColumns=oSettings.aoColumns.length;iColumn<iColumns;iColumn++)
+{oCol=oSettings.aoColumns[iColumn];if(oCol.sTitle===null)
+{oCol.sTitle=oCol.nTh.innerHTML;}
+var
+bAutoType=oCol._bAutoType,bRender=typeof oCol.fnRender==='function',bClass=oCol.sClass!==null,bVisible=oCol.bVisible,nCell,sThisType,sRendered,sValType;if(bAutoType||bRender||bClass||!bVisible)
+{for(iRow=0,iRows=oSettings.aoData.length;iRow<iRows;iRow++)
+{oData=oSettings.aoData[iRow];nCell=nTds[(iRow*iColumns)+iColumn];if(bAutoType&&oCol.sType!='string')
+{sValType=_fnGetCellData(oSettings,iRow,iColumn,'type');if(sValType!=='')
+{sThisType=_fnDetectType(sValType);if(oCol.sType===null)
+{oCol.sType=sThisType;}
+else if(oCol.sType!=sThisType&&oCol.sType!="html")
+{oCol.sType='string';}}}
+if(oCol.mRender)
+{nCell.innerHTML=_fnGetCellData(oSettings,iRow,iColumn,'display');}
+else if(oCol.mData!==iColumn)
+{nCell.innerHTML=_fnGetCellData(oSettings,iRow,iColumn,'display');}
+if(bRender)
+{sRendered=_fnRender(oSettings,iRow,iColumn);nCell.innerHTML=sRendered;if(oCol.bUseRendered)
+{_fnSetCellData(oSettings,iRow,iColumn,sRendered);}}
+if(bClass)
+{nCell.className+=' '+oCol.sClass;}
+if(!bVisible)
+{oData._anHidden[iColumn]=nCell;nCell.parentNode.removeChild(nCell);}
+else
+{oData._anHidden[iColumn]=null;}
+if(oCol.fnCreatedCell)
+{oCol.fnCreatedCell.call(oSettings.oInstance,nCell,_fnGetCellData(oSettings,iRow,iColumn,'display'),oData._aData,iRow,iColumn);}}}}
+if(oSettings.aoRowCreatedCallback.length!==0)
+{for(i=0,iLen=oSettings.aoData.length;i<iLen;i++)
+{oData=oSettings.aoData[i];_fnCallbackFire(oSettings,'aoRowCreatedCallback',null,[oData.nTr,oData._aData,i]);}}}
+function _fnNodeToDataIndex(oSettings,n)
+{return(n._DT_RowIndex!==undefined)?n._DT_RowIndex:null;}
+function _fnNodeToColumnIndex(oSettings,iRow,n)
+{var anCells=_fnGetTdNodes(oSettings,iRow);for(var i=0,iLen=oSettings.aoColumns.length;i<iLen;i++)
+{if(anCells[i]===n)
+{return i;}}
+return-1;}
+function _fnGetRowData(oSettings,iRow,sSpecific,aiColumns)
+{var out=[];for(var i=0,iLen=aiColumns.length;i<iLen;i++)
+{out.push(_fnGetCellData(oSettings,iRow,aiColumns[i],sSpecific));}
+return out;}
+function _fnGetCellData(oSettings,iRow,iCol,sSpecific)
+{var sData;var oCol=oSettings.aoColumns[iCol];var oData=oSettings.aoData[iRow]._aData;if((sData=oCol.fnGetData(oData,sSpecific))===undefined)
+{if(oSettings.iDrawError!=oSettings.iDraw&&oCol.sDefaultContent===null)
+{_fnLog(oSettings,0,"Requested unknown parameter "+
+(typeof oCol.mData=='function'?'{mData function}':"'"+oCol.mData+"'")+" from the data source for row "+iRow);oSettings.iDrawError=oSettings.iDraw;}
+return oCol.sDefaultContent;}
+if(sData===null&&oCol.sDefaultContent!==null)
+{sData=oCol.sDefaultContent;}
+else if(typeof sData==='function')
+{return sData();}
+if(sSpecific=='display'&&sData===null)
+{return'';}
+return sData;}
+function _fnSetCellData(oSettings,iRow,iCol,val)
+{var oCol=oSettings.aoColumns[iCol];var oData=oSettings.aoData[iRow]._aData;oCol.fnSetData(oData,val);}
+var __reArray=/\[.*?\]$/;function _fnGetObjectDataFn(mSource)
+{if(mSource===null)
+{return function(data,type){return null;};}
+else if(typeof mSource==='function')
+{return function(data,type,extra){return mSource(data,type,extra);};}
+else if(typeof mSource==='string'&&(mSource.indexOf('.')!==-1||mSource.indexOf('[')!==-1))
+{var fetchData=function(data,type,src){var a=src.split('.');var arrayNotation,out,innerSrc;if(src!=="")
+{for(var i=0,iLen=a.length;i<iLen;i++)
+{arrayNotation=a[i].match(__reArray);if(arrayNotation){a[i]=a[i].replace(__reArray,'');if(a[i]!==""){data=data[a[i]];}
+out=[];a.splice(0,i+1);innerSrc=a.join('.');for(var j=0,jLen=data.length;j<jLen;j++){out.push(fetchData(data[j],type,innerSrc));}
+var join=arrayNotation[0].substring(1,arrayNotation[0].length-1);data=(join==="")?out:out.join(join);break;}
+if(data===null||data[a[i]]===undefined)
+{return undefined;}
+data=data[a[i]];}}
+return data;};return function(data,type){return fetchData(data,type,mSource);};}
+else
+{return function(data,type){return data[mSource];};}}
+function _fnSetObjectDataFn(mSource)
+{if(mSource===null)
+{return function(data,val){};}
+else if(typeof mSource==='function')
+{return function(data,val){mSource(data,'set',val);};}
+else if(typeof mSource==='string'&&(mSource.indexOf('.')!==-1||mSource.indexOf('[')!==-1))
+{var setData=function(data,val,src){var a=src.split('.'),b;var arrayNotation,o,innerSrc;for(var i=0,iLen=a.length-1;i<iLen;i++)
+{arrayNotation=a[i].match(__reArray);if(arrayNotation)
+{a[i]=a[i].replace(__reArray,'');data[a[i]]=[];b=a.slice();b.splice(0,i+1);innerSrc=b.join('.');for(var j=0,jLen=val.length;j<jLen;j++)
+{o={};setData(o,val[j],innerSrc);data[a[i]].push(o);}
+return;}
+if(data[a[i]]===null||data[a[i]]===undefined)
+{data[a[i]]={};}
+data=data[a[i]];}
+data[a[a.length-1].replace(__reArray,'')]=val;};return function(data,val){return setData(data,val,mSource);};}
+else
+{return function(data,val){data[mSource]=val;};}}
+function _fnGetDataMaster(oSettings)
+{var aData=[];var iLen=oSettings.aoData.length;for(var i=0;i<iLen;i++)
+{aData.push(oSettings.aoData[i]._aData);}
+return aData;}
+function _fnClearTable(oSettings)
+{oSettings.aoData.splice(0,oSettings.aoData.length);oSettings.aiDisplayMaster.splice(0,oSettings.aiDisplayMaster.length);oSettings.aiDisplay.splice(0,oSettings.aiDisplay.length);_fnCalculateEnd(oSettings);}
+function _fnDeleteIndex(a,iTarget)
+{var iTargetIndex=-1;for(var i=0,iLen=a.length;i<iLen;i++)
+{if(a[i]==iTarget)
+{iTargetIndex=i;}
+else if(a[i]>iTarget)
+{a[i]--;}}
+if(iTargetIndex!=-1)
+{a.splice(iTargetIndex,1);}}
+function _fnRender(oSettings,iRow,iCol)
+{var oCol=oSettings.aoColumns[iCol];return oCol.fnRender({"iDataRow":iRow,"iDataColumn":iCol,"oSettings":oSettings,"aData":oSettings.aoData[iRow]._aData,"mDataProp":oCol.mData},_fnGetCellData(oSettings,iRow,iCol,'display'));}
+function _fnCreateTr(oSettings,iRow)
+{var oData=oSettings.aoData[iRow];var nTd;if(oData.nTr===null)
+{oData.nTr=document.createElement('tr');oData.nTr._DT_RowIndex=iRow;if(oData._aData.DT_RowId)
+{oData.nTr.id=oData._aData.DT_RowId;}
+if(oData._aData.DT_RowClass)
+{oData.nTr.className=oData._aData.DT_RowClass;}
+for(var i=0,iLen=oSettings.aoColumns.length;i<iLen;i++)
+{var oCol=oSettings.aoColumns[i];nTd=document.createElement(oCol.sCellType);nTd.innerHTML=(typeof oCol.fnRender==='function'&&(!oCol.bUseRendered||oCol.mData===null))?_fnRender(oSettings,iRow,i):_fnGetCellData(oSettings,iRow,i,'display');if(oCol.sClass!==null)
+{nTd.className=oCol.sClass;}
+if(oCol.bVisible)
+{oData.nTr.appendChild(nTd);oData._anHidden[i]=null;}
+else
+{oData._anHidden[i]=nTd;}
+if(oCol.fnCreatedCell)
+{oCol.fnCreatedCell.call(oSettings.oInstance,nTd,_fnGetCellData(oSettings,iRow,i,'display'),oData._aData,iRow,i);}}
+_fnCallbackFire(oSettings,'aoRowCreatedCallback',null,[oData.nTr,oData._aData,iRow]);}}
+function _fnBuildHead(oSettings)
+{var i,nTh,iLen,j,jLen;var iThs=$('th, td',oSettings.nTHead).length;var iCorrector=0;var jqChildren;if(iThs!==0)
+{for(i=0,iLen=oSettings.aoColumns.length;i<iLen;i++)
+{nTh=oSettings.aoColumns[i].nTh;nTh.setAttribute('role','columnheader');if(oSettings.aoColumns[i].bSortable)
+{nTh.setAttribute('tabindex',oSettings.iTabIndex);nTh.setAttribute('aria-controls',oSettings.sTableId);}
+if(oSettings.aoColumns[i].sClass!==null)
+{$(nTh).addClass(oSettings.aoColumns[i].sClass);}
+if(oSettings.aoColumns[i].sTitle!=nTh.innerHTML)
+{nTh.innerHTML=oSettings.aoColumns[i].sTitle;}}}
+else
+{var nTr=document.createElement("tr");for(i=0,iLen=oSettings.aoColumns.length;i<iLen;i++)
+{nTh=oSettings.aoColumns[i].nTh;nTh.innerHTML=oSettings.aoColumns[i].sTitle;nTh.setAttribute('tabindex','0');if(oSettings.aoColumns[i].sClass!==null)
+{$(nTh).addClass(oSettings.aoColumns[i].sClass);}
+nTr.appendChild(nTh);}
+$(oSettings.nTHead).html('')[0].appendChild(nTr);_fnDetectHeader(oSettings.aoHeader,oSettings.nTHead);}
+$(oSettings.nTHead).children('tr').attr('role','row');if(oSettings.bJUI)
+{for(i=0,iLen=oSettings.aoColumns.length;i<iLen;i++)
+{nTh=oSettings.aoColumns[i].nTh;var nDiv=document.createElement('div');nDiv.className=oSettings.oClasses.sSortJUIWrapper;$(nTh).contents().appendTo(nDiv);var nSpan=document.createElement('span');nSpan.className=oSettings.oClasses.sSortIcon;nDiv.appendChild(nSpan);nTh.appendChild(nDiv);}}
+if(oSettings.oFeatures.bSort)
+{for(i=0;i<oSettings.aoColumns.length;i++)
+{if(oSettings.aoColumns[i].bSortable!==false)
+{_fnSortAttachListener(oSettings,oSettings.aoColumns[i].nTh,i);}
+else
+{$(oSettings.aoColumns[i].nTh).addClass(oSettings.oClasses.sSortableNone);}}}
+if(oSettings.oClasses.sFooterTH!=="")
+{$(oSettings.nTFoot).children('tr').children('th').addClass(oSettings.oClasses.sFooterTH);}
+if(oSettings.nTFoot!==null)
+{var anCells=_fnGetUniqueThs(oSettings,null,oSettings.aoFooter);for(i=0,iLen=oSettings.aoColumns.length;i<iLen;i++)
+{if(anCells[i])
+{oSettings.aoColumns[i].nTf=anCells[i];if(oSettings.aoColumns[i].sClass)
+{$(anCells[i]).addClass(oSettings.aoColumns[i].sClass);}}}}}
+function _fnDrawHead(oSettings,aoSource,bIncludeHidden)
+{var i,iLen,j,jLen,k,kLen,n,nLocalTr;var aoLocal=[];var aApplied=[];var iColumns=oSettings.aoColumns.length;var iRowspan,iColspan;if(bIncludeHidden===undefined)
+{bIncludeHidden=false;}
+for(i=0,iLen=aoSource.length;i<iLen;i++)
+{aoLocal[i]=aoSource[i].slice();aoLocal[i].nTr=aoSource[i].nTr;for(j=iColumns-1;j>=0;j--)
+{if(!oSettings.aoColumns[j].bVisible&&!bIncludeHidden)
+{aoLocal[i].splice(j,1);}}
+aApplied.push([]);}
+for(i=0,iLen=aoLocal.length;i<iLen;i++)
+{nLocalTr=aoLocal[i].nTr;if(nLocalTr)
+{while((n=nLocalTr.firstChild))
+{nLocalTr.removeChild(n);}}
+for(j=0,jLen=aoLocal[i].length;j<jLen;j++)
+{iRowspan=1;iColspan=1;if(aApplied[i][j]===undefined)
+{nLocalTr.appendChild(aoLocal[i][j].cell);aApplied[i][j]=1;while(aoLocal[i+iRowspan]!==undefined&&aoLocal[i][j].cell==aoLocal[i+iRowspan][j].cell)
+{aApplied[i+iRowspan][j]=1;iRowspan++;}
+while(aoLocal[i][j+iColspan]!==undefined&&aoLocal[i][j].cell==aoLocal[i][j+iColspan].cell)
+{for(k=0;k<iRowspan;k++)
+{aApplied[i+k][j+iColspan]=1;}
+iColspan++;}
+aoLocal[i][j].cell.rowSpan=iRowspan;aoLocal[i][j].cell.colSpan=iColspan;}}}}
+function _fnDraw(oSettings)
+{var aPreDraw=_fnCallbackFire(oSettings,'aoPreDrawCallback','preDraw',[oSettings]);if($.inArray(false,aPreDraw)!==-1)
+{_fnProcessingDisplay(oSettings,false);return;}
+var i,iLen,n;var anRows=[];var iRowCount=0;var iStripes=oSettings.asStripeClasses.length;var iOpenRows=oSettings.aoOpenRows.length;oSettings.bDrawing=true;if(oSettings.iInitDisplayStart!==undefined&&oSettings.iInitDisplayStart!=-1)
+{if(oSettings.oFeatures.bServerSide)
+{oSettings._iDisplayStart=oSettings.iInitDisplayStart;}
+else
+{oSettings._iDisplayStart=(oSettings.iInitDisplayStart>=oSettings.fnRecordsDisplay())?0:oSettings.iInitDisplayStart;}
+oSettings.iInitDisplayStart=-1;_fnCalculateEnd(oSettings);}
+if(oSettings.bDeferLoading)
+{oSettings.bDeferLoading=false;oSettings.iDraw++;}
+else if(!oSettings.oFeatures.bServerSide)
+{oSettings.iDraw++;}
+else if(!oSettings.bDestroying&&!_fnAjaxUpdate(oSettings))
+{return;}
+if(oSettings.aiDisplay.length!==0)
+{var iStart=oSettings._iDisplayStart;var iEnd=oSettings._iDisplayEnd;if(oSettings.oFeatures.bServerSide)
+{iStart=0;iEnd=oSettings.aoData.length;}
+for(var j=iStart;j<iEnd;j++)
+{var aoData=oSettings.aoData[oSettings.aiDisplay[j]];if(aoData.nTr===null)
+{_fnCreateTr(oSettings,oSettings.aiDisplay[j]);}
+var nRow=aoData.nTr;if(iStripes!==0)
+{var sStripe=oSettings.asStripeClasses[iRowCount%iStripes];if(aoData._sRowStripe!=sStripe)
+{$(nRow).removeClass(aoData._sRowStripe).addClass(sStripe);aoData._sRowStripe=sStripe;}}
+_fnCallbackFire(oSettings,'aoRowCallback',null,[nRow,oSettings.aoData[oSettings.aiDisplay[j]]._aData,iRowCount,j]);anRows.push(nRow);iRowCount++;if(iOpenRows!==0)
+{for(var k=0;k<iOpenRows;k++)
+{if(nRow==oSettings.aoOpenRows[k].nParent)
+{anRows.push(oSettings.aoOpenRows[k].nTr);break;}}}}}
+else
+{anRows[0]=document.createElement('tr');if(oSettings.asStripeClasses[0])
+{anRows[0].className=oSettings.asStripeClasses[0];}
+var oLang=oSettings.oLanguage;var sZero=oLang.sZeroRecords;if(oSettings.iDraw==1&&oSettings.sAjaxSource!==null&&!oSettings.oFeatures.bServerSide)
+{sZero=oLang.sLoadingRecords;}
+else if(oLang.sEmptyTable&&oSettings.fnRecordsTotal()===0)
+{sZero=oLang.sEmptyTable;}
+var nTd=document.createElement('td');nTd.setAttribute('valign',"top");nTd.colSpan=_fnVisbleColumns(oSettings);nTd.className=oSettings.oClasses.sRowEmpty;nTd.innerHTML=_fnInfoMacros(oSettings,sZero);anRows[iRowCount].appendChild(nTd);}
+_fnCallbackFire(oSettings,'aoHeaderCallback','header',[$(oSettings.nTHead).children('tr')[0],_fnGetDataMaster(oSettings),oSettings._iDisplayStart,oSettings.fnDisplayEnd(),oSettings.aiDisplay]);_fnCallbackFire(oSettings,'aoFooterCallback','footer',[$(oSettings.nTFoot).children('tr')[0],_fnGetDataMaster(oSettings),oSettings._iDisplayStart,oSettings.fnDisplayEnd(),oSettings.aiDisplay]);var
+nAddFrag=document.createDocumentFragment(),nRemoveFrag=document.createDocumentFragment(),nBodyPar,nTrs;if(oSettings.nTBody)
+{nBodyPar=oSettings.nTBody.parentNode;nRemoveFrag.appendChild(oSettings.nTBody);if(!oSettings.oScroll.bInfinite||!oSettings._bInitComplete||oSettings.bSorted||oSettings.bFiltered)
+{while((n=oSettings.nTBody.firstChild))
+{oSettings.nTBody.removeChild(n);}}
+for(i=0,iLen=anRows.length;i<iLen;i++)
+{nAddFrag.appendChild(anRows[i]);}
+oSettings.nTBody.appendChild(nAddFrag);if(nBodyPar!==null)
+{nBodyPar.appendChild(oSettings.nTBody);}}
+_fnCallbackFire(oSettings,'aoDrawCallback','draw',[oSettings]);oSettings.bSorted=false;oSettings.bFiltered=false;oSettings.bDrawing=false;if(oSettings.oFeatures.bServerSide)
+{_fnProcessingDisplay(oSettings,false);if(!oSettings._bInitComplete)
+{_fnInitComplete(oSettings);}}}
+function _fnReDraw(oSettings)
+{if(oSettings.oFeatures.bSort)
+{_fnSort(oSettings,oSettings.oPreviousSearch);}
+else if(oSettings.oFeatures.bFilter)
+{_fnFilterComplete(oSettings,oSettings.oPreviousSearch);}
+else
+{_fnCalculateEnd(oSettings);_fnDraw(oSettings);}}
+function _fnAddOptionsHtml(oSettings)
+{var nHolding=$('<div></div>')[0];oSettings.nTable.parentNode.insertBefore(nHolding,oSettings.nTable);oSettings.nTableWrapper=$('<div id="'+oSettings.sTableId+'_wrapper" class="'+oSettings.oClasses.sWrapper+'" role="grid"></div>')[0];oSettings.nTableReinsertBefore=oSettings.nTable.nextSibling;var nInsertNode=oSettings.nTableWrapper;var aDom=oSettings.sDom.split('');var nTmp,iPushFeature,cOption,nNewNode,cNext,sAttr,j;for(var i=0;i<aDom.length;i++)
+{iPushFeature=0;cOption=aDom[i];if(cOption=='<')
+{nNewNode=$('<div></div>')[0];cNext=aDom[i+1];if(cNext=="'"||cNext=='"')
+{sAttr="";j=2;while(aDom[i+j]!=cNext)
+{sAttr+=aDom[i+j];j++;}
+if(sAttr=="H")
+{sAttr=oSettings.oClasses.sJUIHeader;}
+else if(sAttr=="F")
+{sAttr=oSettings.oClasses.sJUIFooter;}
+if(sAttr.indexOf('.')!=-1)
+{var aSplit=sAttr.split('.');nNewNode.id=aSplit[0].substr(1,aSplit[0].length-1);nNewNode.className=aSplit[1];}
+else if(sAttr.charAt(0)=="#")
+{nNewNode.id=sAttr.substr(1,sAttr.length-1);}
+else
+{nNewNode.className=sAttr;}
+i+=j;}
+nInsertNode.appendChild(nNewNode);nInsertNode=nNewNode;}
+else if(cOption=='>')
+{nInsertNode=nInsertNode.parentNode;}
+else if(cOption=='l'&&oSettings.oFeatures.bPaginate&&oSettings.oFeatures.bLengthChange)
+{nTmp=_fnFeatureHtmlLength(oSettings);iPushFeature=1;}
+else if(cOption=='f'&&oSettings.oFeatures.bFilter)
+{nTmp=_fnFeatureHtmlFilter(oSettings);iPushFeature=1;}
+else if(cOption=='r'&&oSettings.oFeatures.bProcessing)
+{nTmp=_fnFeatureHtmlProcessing(oSettings);iPushFeature=1;}
+else if(cOption=='t')
+{nTmp=_fnFeatureHtmlTable(oSettings);iPushFeature=1;}
+else if(cOption=='i'&&oSettings.oFeatures.bInfo)
+{nTmp=_fnFeatureHtmlInfo(oSettings);iPushFeature=1;}
+else if(cOption=='p'&&oSettings.oFeatures.bPaginate)
+{nTmp=_fnFeatureHtmlPaginate(oSettings);iPushFeature=1;}
+else if(DataTable.ext.aoFeatures.length!==0)
+{var aoFeatures=DataTable.ext.aoFeatures;for(var k=0,kLen=aoFeatures.length;k<kLen;k++)
+{if(cOption==aoFeatures[k].cFeature)
+{nTmp=aoFeatures[k].fnInit(oSettings);if(nTmp)
+{iPushFeature=1;}
+break;}}}
+if(iPushFeature==1&&nTmp!==null)
+{if(typeof oSettings.aanFeatures[cOption]!=='object')
+{oSettings.aanFeatures[cOption]=[];}
+oSettings.aanFeatures[cOption].push(nTmp);nInsertNode.appendChild(nTmp);}}
+nHolding.parentNode.replaceChild(oSettings.nTableWrapper,nHolding);}
+function _fnDetectHeader(aLayout,nThead)
+{var nTrs=$(nThead).children('tr');var nTr,nCell;var i,k,l,iLen,jLen,iColShifted,iColumn,iColspan,iRowspan;var bUnique;var fnShiftCol=function(a,i,j){var k=a[i];while(k[j]){j++;}
+return j;};aLayout.splice(0,aLayout.length);for(i=0,iLen=nTrs.length;i<iLen;i++)
+{aLayout.push([]);}
+for(i=0,iLen=nTrs.length;i<iLen;i++)
+{nTr=nTrs[i];iColumn=0;nCell=nTr.firstChild;while(nCell){if(nCell.nodeName.toUpperCase()=="TD"||nCell.nodeName.toUpperCase()=="TH")
+{iColspan=nCell.getAttribute('colspan')*1;iRowspan=nCell.getAttribute('rowspan')*1;iColspan=(!iColspan||iColspan===0||iColspan===1)?1:iColspan;iRowspan=(!iRowspan||iRowspan===0||iRowspan===1)?1:iRowspan;iColShifted=fnShiftCol(aLayout,i,iColumn);bUnique=iColspan===1?true:false;for(l=0;l<iColspan;l++)
+{for(k=0;k<iRowspan;k++)
+{aLayout[i+k][iColShifted+l]={"cell":nCell,"unique":bUnique};aLayout[i+k].nTr=nTr;}}}
+nCell=nCell.nextSibling;}}}
+function _fnGetUniqueThs(oSettings,nHeader,aLayout)
+{var aReturn=[];if(!aLayout)
+{aLayout=oSettings.aoHeader;if(nHeader)
+{aLayout=[];_fnDetectHeader(aLayout,nHeader);}}
+for(var i=0,iLen=aLayout.length;i<iLen;i++)
+{for(var j=0,jLen=aLayout[i].length;j<jLen;j++)
+{if(aLayout[i][j].unique&&(!aReturn[j]||!oSettings.bSortCellsTop))
+{aReturn[j]=aLayout[i][j].cell;}}}
+return aReturn;}
+function _fnAjaxUpdate(oSettings)
+{if(oSettings.bAjaxDataGet)
+{oSettings.iDraw++;_fnProcessingDisplay(oSettings,true);var iColumns=oSettings.aoColumns.length;var aoData=_fnAjaxParameters(oSettings);_fnServerParams(oSettings,aoData);oSettings.fnServerData.call(oSettings.oInstance,oSettings.sAjaxSource,aoData,function(json){_fnAjaxUpdateDraw(oSettings,json);},oSettings);return false;}
+else
+{return true;}}
+function _fnAjaxParameters(oSettings)
+{var iColumns=oSettings.aoColumns.length;var aoData=[],mDataProp,aaSort,aDataSort;var i,j;aoData.push({"name":"sEcho","value":oSettings.iDraw});aoData.push({"name":"iColumns","value":iColumns});aoData.push({"name":"sColumns","value":_fnColumnOrdering(oSettings)});aoData.push({"name":"iDisplayStart","value":oSettings._iDisplayStart});aoData.push({"name":"iDisplayLength","value":oSettings.oFeatures.bPaginate!==false?oSettings._iDisplayLength:-1});for(i=0;i<iColumns;i++)
+{mDataProp=oSettings.aoColumns[i].mData;aoData.push({"name":"mDataProp_"+i,"value":typeof(mDataProp)==="function"?'function':mDataProp});}
+if(oSettings.oFeatures.bFilter!==false)
+{aoData.push({"name":"sSearch","value":oSettings.oPreviousSearch.sSearch});aoData.push({"name":"bRegex","value":oSettings.oPreviousSearch.bRegex});for(i=0;i<iColumns;i++)
+{aoData.push({"name":"sSearch_"+i,"value":oSettings.aoPreSearchCols[i].sSearch});aoData.push({"name":"bRegex_"+i,"value":oSettings.aoPreSearchCols[i].bRegex});aoData.push({"name":"bSearchable_"+i,"value":oSettings.aoColumns[i].bSearchable});}}
+if(oSettings.oFeatures.bSort!==false)
+{var iCounter=0;aaSort=(oSettings.aaSortingFixed!==null)?oSettings.aaSortingFixed.concat(oSettings.aaSorting):oSettings.aaSorting.slice();for(i=0;i<aaSort.length;i++)
+{aDataSort=oSettings.aoColumns[aaSort[i][0]].aDataSort;for(j=0;j<aDataSort.length;j++)
+{aoData.push({"name":"iSortCol_"+iCounter,"value":aDataSort[j]});aoData.push({"name":"sSortDir_"+iCounter,"value":aaSort[i][1]});iCounter++;}}
+aoData.push({"name":"iSortingCols","value":iCounter});for(i=0;i<iColumns;i++)
+{aoData.push({"name":"bSortable_"+i,"value":oSettings.aoColumns[i].bSortable});}}
+return aoData;}
+function _fnServerParams(oSettings,aoData)
+{_fnCallbackFire(oSettings,'aoServerParams','serverParams',[aoData]);}
+function _fnAjaxUpdateDraw(oSettings,json)
+{if(json.sEcho!==undefined)
+{if(json.sEcho*1<oSettings.iDraw)
+{return;}
+else
+{oSettings.iDraw=json.sEcho*1;}}
+if(!oSettings.oScroll.bInfinite||(oSettings.oScroll.bInfinite&&(oSettings.bSorted||oSettings.bFiltered)))
+{_fnClearTable(oSettings);}
+oSettings._iRecordsTotal=parseInt(json.iTotalRecords,10);oSettings._iRecordsDisplay=parseInt(json.iTotalDisplayRecords,10);var sOrdering=_fnColumnOrdering(oSettings);var bReOrder=(json.sColumns!==undefined&&sOrdering!==""&&json.sColumns!=sOrdering);var aiIndex;if(bReOrder)
+{aiIndex=_fnReOrderIndex(oSettings,json.sColumns);}
+var aData=_fnGetObjectDataFn(oSettings.sAjaxDataProp)(json);for(var i=0,iLen=aData.length;i<iLen;i++)
+{if(bReOrder)
+{var aDataSorted=[];for(var j=0,jLen=oSettings.aoColumns.length;j<jLen;j++)
+{aDataSorted.push(aData[i][aiIndex[j]]);}
+_fnAddData(oSettings,aDataSorted);}
+else
+{_fnAddData(oSettings,aData[i]);}}
+oSettings.aiDisplay=oSettings.aiDisplayMaster.slice();oSettings.bAjaxDataGet=false;_fnDraw(oSettings);oSettings.bAjaxDataGet=true;_fnProcessingDisplay(oSettings,false);}
+function _fnFeatureHtmlFilter(oSettings)
+{var oPreviousSearch=oSettings.oPreviousSearch;var sSearchStr=oSettings.oLanguage.sSearch;sSearchStr=(sSearchStr.indexOf('_INPUT_')!==-1)?sSearchStr.replace('_INPUT_','<input type="text" />'):sSearchStr===""?'<input type="text" />':sSearchStr+' <input type="text" />';var nFilter=document.createElement('div');nFilter.className=oSettings.oClasses.sFilter;nFilter.innerHTML='<label>'+sSearchStr+'</label>';if(!oSettings.aanFeatures.f)
+{nFilter.id=oSettings.sTableId+'_filter';}
+var jqFilter=$('input[type="text"]',nFilter);nFilter._DT_Input=jqFilter[0];jqFilter.val(oPreviousSearch.sSearch.replace('"','&quot;'));jqFilter.bind('keyup.DT',function(e){var n=oSettings.aanFeatures.f;var val=this.value===""?"":this.value;for(var i=0,iLen=n.length;i<iLen;i++)
+{if(n[i]!=$(this).parents('div.dataTables_filter')[0])
+{$(n[i]._DT_Input).val(val);}}
+if(val!=oPreviousSearch.sSearch)
+{_fnFilterComplete(oSettings,{"sSearch":val,"bRegex":oPreviousSearch.bRegex,"bSmart":oPreviousSearch.bSmart,"bCaseInsensitive":oPreviousSearch.bCaseInsensitive});}});jqFilter.attr('aria-controls',oSettings.sTableId).bind('keypress.DT',function(e){if(e.keyCode==13)
+{return false;}});return nFilter;}
+function _fnFilterComplete(oSettings,oInput,iForce)
+{var oPrevSearch=oSettings.oPreviousSearch;var aoPrevSearch=oSettings.aoPreSearchCols;var fnSaveFilter=function(oFilter){oPrevSearch.sSearch=oFilter.sSearch;oPrevSearch.bRegex=oFilter.bRegex;oPrevSearch.bSmart=oFilter.bSmart;oPrevSearch.bCaseInsensitive=oFilter.bCaseInsensitive;};if(!oSettings.oFeatures.bServerSide)
+{_fnFilter(oSettings,oInput.sSearch,iForce,oInput.bRegex,oInput.bSmart,oInput.bCaseInsensitive);fnSaveFilter(oInput);for(var i=0;i<oSettings.aoPreSearchCols.length;i++)
+{_fnFilterColumn(oSettings,aoPrevSearch[i].sSearch,i,aoPrevSearch[i].bRegex,aoPrevSearch[i].bSmart,aoPrevSearch[i].bCaseInsensitive);}
+_fnFilterCustom(oSettings);}
+else
+{fnSaveFilter(oInput);}
+oSettings.bFiltered=true;$(oSettings.oInstance).trigger('filter',oSettings);oSettings._iDisplayStart=0;_fnCalculateEnd(oSettings);_fnDraw(oSettings);_fnBuildSearchArray(oSettings,0);}
+function _fnFilterCustom(oSettings)
+{var afnFilters=DataTable.ext.afnFiltering;var aiFilterColumns=_fnGetColumns(oSettings,'bSearchable');for(var i=0,iLen=afnFilters.length;i<iLen;i++)
+{var iCorrector=0;for(var j=0,jLen=oSettings.aiDisplay.length;j<jLen;j++)
+{var iDisIndex=oSettings.aiDisplay[j-iCorrector];var bTest=afnFilters[i](oSettings,_fnGetRowData(oSettings,iDisIndex,'filter',aiFilterColumns),iDisIndex);if(!bTest)
+{oSettings.aiDisplay.splice(j-iCorrector,1);iCorrector++;}}}}
+function _fnFilterColumn(oSettings,sInput,iColumn,bRegex,bSmart,bCaseInsensitive)
+{if(sInput==="")
+{return;}
+var iIndexCorrector=0;var rpSearch=_fnFilterCreateSearch(sInput,bRegex,bSmart,bCaseInsensitive);for(var i=oSettings.aiDisplay.length-1;i>=0;i--)
+{var sData=_fnDataToSearch(_fnGetCellData(oSettings,oSettings.aiDisplay[i],iColumn,'filter'),oSettings.aoColumns[iColumn].sType);if(!rpSearch.test(sData))
+{oSettings.aiDisplay.splice(i,1);iIndexCorrector++;}}}
+function _fnFilter(oSettings,sInput,iForce,bRegex,bSmart,bCaseInsensitive)
+{var i;var rpSearch=_fnFilterCreateSearch(sInput,bRegex,bSmart,bCaseInsensitive);var oPrevSearch=oSettings.oPreviousSearch;if(!iForce)
+{iForce=0;}
+if(DataTable.ext.afnFiltering.length!==0)
+{iForce=1;}
+if(sInput.length<=0)
+{oSettings.aiDisplay.splice(0,oSettings.aiDisplay.length);oSettings.aiDisplay=oSettings.aiDisplayMaster.slice();}
+else
+{if(oSettings.aiDisplay.length==oSettings.aiDisplayMaster.length||oPrevSearch.sSearch.length>sInput.length||iForce==1||sInput.indexOf(oPrevSearch.sSearch)!==0)
+{oSettings.aiDisplay.splice(0,oSettings.aiDisplay.length);_fnBuildSearchArray(oSettings,1);for(i=0;i<oSettings.aiDisplayMaster.length;i++)
+{if(rpSearch.test(oSettings.asDataSearch[i]))
+{oSettings.aiDisplay.push(oSettings.aiDisplayMaster[i]);}}}
+else
+{var iIndexCorrector=0;for(i=0;i<oSettings.asDataSearch.length;i++)
+{if(!rpSearch.test(oSettings.asDataSearch[i]))
+{oSettings.aiDisplay.splice(i-iIndexCorrector,1);iIndexCorrector++;}}}}}
+function _fnBuildSearchArray(oSettings,iMaster)
+{if(!oSettings.oFeatures.bServerSide)
+{oSettings.asDataSearch=[];var aiFilterColumns=_fnGetColumns(oSettings,'bSearchable');var aiIndex=(iMaster===1)?oSettings.aiDisplayMaster:oSettings.aiDisplay;for(var i=0,iLen=aiIndex.length;i<iLen;i++)
+{oSettings.asDataSearch[i]=_fnBuildSearchRow(oSettings,_fnGetRowData(oSettings,aiIndex[i],'filter',aiFilterColumns));}}}
+function _fnBuildSearchRow(oSettings,aData)
+{var sSearch=aData.join('  ');if(sSearch.indexOf('&')!==-1)
+{sSearch=$('<div>').html(sSearch).text();}
+return sSearch.replace(/[\n\r]/g," ");}
+function _fnFilterCreateSearch(sSearch,bRegex,bSmart,bCaseInsensitive)
+{var asSearch,sRegExpString;if(bSmart)
+{asSearch=bRegex?sSearch.split(' '):_fnEscapeRegex(sSearch).split(' ');sRegExpString='^(?=.*?'+asSearch.join(')(?=.*?')+').*$';return new RegExp(sRegExpString,bCaseInsensitive?"i":"");}
+else
+{sSearch=bRegex?sSearch:_fnEscapeRegex(sSearch);return new RegExp(sSearch,bCaseInsensitive?"i":"");}}
+function _fnDataToSearch(sData,sType)
+{if(typeof DataTable.ext.ofnSearch[sType]==="function")
+{return DataTable.ext.ofnSearch[sType](sData);}
+else if(sData===null)
+{return'';}
+else if(sType=="html")
+{return sData.replace(/[\r\n]/g," ").replace(/<.*?>/g,"");}
+else if(typeof sData==="string")
+{return sData.replace(/[\r\n]/g," ");}
+return sData;}
+function _fnEscapeRegex(sVal)
+{var acEscape=['/','.','*','+','?','|','(',')','[',']','{','}','\\','$','^','-'];var reReplace=new RegExp('(\\'+acEscape.join('|\\')+')','g');return sVal.replace(reReplace,'\\$1');}
+function _fnFeatureHtmlInfo(oSettings)
+{var nInfo=document.createElement('div');nInfo.className=oSettings.oClasses.sInfo;if(!oSettings.aanFeatures.i)
+{oSettings.aoDrawCallback.push({"fn":_fnUpdateInfo,"sName":"information"});nInfo.id=oSettings.sTableId+'_info';}
+oSettings.nTable.setAttribute('aria-describedby',oSettings.sTableId+'_info');return nInfo;}
+function _fnUpdateInfo(oSettings)
+{if(!oSettings.oFeatures.bInfo||oSettings.aanFeatures.i.length===0)
+{return;}
+var
+oLang=oSettings.oLanguage,iStart=oSettings._iDisplayStart+1,iEnd=oSettings.fnDisplayEnd(),iMax=oSettings.fnRecordsTotal(),iTotal=oSettings.fnRecordsDisplay(),sOut;if(iTotal===0)
+{sOut=oLang.sInfoEmpty;}
+else{sOut=oLang.sInfo;}
+if(iTotal!=iMax)
+{sOut+=' '+oLang.sInfoFiltered;}
+sOut+=oLang.sInfoPostFix;sOut=_fnInfoMacros(oSettings,sOut);if(oLang.fnInfoCallback!==null)
+{sOut=oLang.fnInfoCallback.call(oSettings.oInstance,oSettings,iStart,iEnd,iMax,iTotal,sOut);}
+var n=oSettings.aanFeatures.i;for(var i=0,iLen=n.length;i<iLen;i++)
+{$(n[i]).html(sOut);}}
+function _fnInfoMacros(oSettings,str)
+{var
+iStart=oSettings._iDisplayStart+1,sStart=oSettings.fnFormatNumber(iStart),iEnd=oSettings.fnDisplayEnd(),sEnd=oSettings.fnFormatNumber(iEnd),iTotal=oSettings.fnRecordsDisplay(),sTotal=oSettings.fnFormatNumber(iTotal),iMax=oSettings.fnRecordsTotal(),sMax=oSettings.fnFormatNumber(iMax);if(oSettings.oScroll.bInfinite)
+{sStart=oSettings.fnFormatNumber(1);}
+return str.replace(/_START_/g,sStart).replace(/_END_/g,sEnd).replace(/_TOTAL_/g,sTotal).replace(/_MAX_/g,sMax);}
+function _fnInitialise(oSettings)
+{var i,iLen,iAjaxStart=oSettings.iInitDisplayStart;if(oSettings.bInitialised===false)
+{setTimeout(function(){_fnInitialise(oSettings);},200);return;}
+_fnAddOptionsHtml(oSettings);_fnBuildHead(oSettings);_fnDrawHead(oSettings,oSettings.aoHeader);if(oSettings.nTFoot)
+{_fnDrawHead(oSettings,oSettings.aoFooter);}
+_fnProcessingDisplay(oSettings,true);if(oSettings.oFeatures.bAutoWidth)
+{_fnCalculateColumnWidths(oSettings);}
+for(i=0,iLen=oSettings.aoColumns.length;i<iLen;i++)
+{if(oSettings.aoColumns[i].sWidth!==null)
+{oSettings.aoColumns[i].nTh.style.width=_fnStringToCss(oSettings.aoColumns[i].sWidth);}}
+if(oSettings.oFeatures.bSort)
+{_fnSort(oSettings);}
+else if(oSettings.oFeatures.bFilter)
+{_fnFilterComplete(oSettings,oSettings.oPreviousSearch);}
+else
+{oSettings.aiDisplay=oSettings.aiDisplayMaster.slice();_fnCalculateEnd(oSettings);_fnDraw(oSettings);}
+if(oSettings.sAjaxSource!==null&&!oSettings.oFeatures.bServerSide)
+{var aoData=[];_fnServerParams(oSettings,aoData);oSettings.fnServerData.call(oSettings.oInstance,oSettings.sAjaxSource,aoData,function(json){var aData=(oSettings.sAjaxDataProp!=="")?_fnGetObjectDataFn(oSettings.sAjaxDataProp)(json):json;for(i=0;i<aData.length;i++)
+{_fnAddData(oSettings,aData[i]);}
+oSettings.iInitDisplayStart=iAjaxStart;if(oSettings.oFeatures.bSort)
+{_fnSort(oSettings);}
+else
+{oSettings.aiDisplay=oSettings.aiDisplayMaster.slice();_fnCalculateEnd(oSettings);_fnDraw(oSettings);}
+_fnProcessingDisplay(oSettings,false);_fnInitComplete(oSettings,json);},oSettings);return;}
+if(!oSettings.oFeatures.bServerSide)
+{_fnProcessingDisplay(oSettings,false);_fnInitComplete(oSettings);}}
+function _fnInitComplete(oSettings,json)
+{oSettings._bInitComplete=true;_fnCallbackFire(oSettings,'aoInitComplete','init',[oSettings,json]);}
+function _fnLanguageCompat(oLanguage)
+{var oDefaults=DataTable.defaults.oLanguage;if(!oLanguage.sEmptyTable&&oLanguage.sZeroRecords&&oDefaults.sEmptyTable==="No data available in table")
+{_fnMap(oLanguage,oLanguage,'sZeroRecords','sEmptyTable');}
+if(!oLanguage.sLoadingRecords&&oLanguage.sZeroRecords&&oDefaults.sLoadingRecords==="Loading...")
+{_fnMap(oLanguage,oLanguage,'sZeroRecords','sLoadingRecords');}}
+function _fnFeatureHtmlLength(oSettings)
+{if(oSettings.oScroll.bInfinite)
+{return null;}
+var sName='name="'+oSettings.sTableId+'_length"';var sStdMenu='<select size="1" '+sName+'>';var i,iLen;var aLengthMenu=oSettings.aLengthMenu;if(aLengthMenu.length==2&&typeof aLengthMenu[0]==='object'&&typeof aLengthMenu[1]==='object')
+{for(i=0,iLen=aLengthMenu[0].length;i<iLen;i++)
+{sStdMenu+='<option value="'+aLengthMenu[0][i]+'">'+aLengthMenu[1][i]+'</option>';}}
+else
+{for(i=0,iLen=aLengthMenu.length;i<iLen;i++)
+{sStdMenu+='<option value="'+aLengthMenu[i]+'">'+aLengthMenu[i]+'</option>';}}
+sStdMenu+='</select>';var nLength=document.createElement('div');if(!oSettings.aanFeatures.l)
+{nLength.id=oSettings.sTableId+'_length';}
+nLength.className=oSettings.oClasses.sLength;nLength.innerHTML='<label>'+oSettings.oLanguage.sLengthMenu.replace('_MENU_',sStdMenu)+'</label>';$('select option[value="'+oSettings._iDisplayLength+'"]',nLength).prop("selected",true);$('select',nLength).bind('change.DT',function(e){var iVal=$(this).val();var n=oSettings.aanFeatures.l;for(i=0,iLen=n.length;i<iLen;i++)
+{if(n[i]!=this.parentNode)
+{$('select',n[i]).val(iVal);}}
+oSettings._iDisplayLength=parseInt(iVal,10);_fnCalculateEnd(oSettings);if(oSettings.fnDisplayEnd()==oSettings.fnRecordsDisplay())
+{oSettings._iDisplayStart=oSettings.fnDisplayEnd()-oSettings._iDisplayLength;if(oSettings._iDisplayStart<0)
+{oSettings._iDisplayStart=0;}}
+if(oSettings._iDisplayLength==-1)
+{oSettings._iDisplayStart=0;}
+_fnDraw(oSettings);});$('select',nLength).attr('aria-controls',oSettings.sTableId);return nLength;}
+function _fnCalculateEnd(oSettings)
+{if(oSettings.oFeatures.bPaginate===false)
+{oSettings._iDisplayEnd=oSettings.aiDisplay.length;}
+else
+{if(oSettings._iDisplayStart+oSettings._iDisplayLength>oSettings.aiDisplay.length||oSettings._iDisplayLength==-1)
+{oSettings._iDisplayEnd=oSettings.aiDisplay.length;}
+else
+{oSettings._iDisplayEnd=oSettings._iDisplayStart+oSettings._iDisplayLength;}}}
+function _fnFeatureHtmlPaginate(oSettings)
+{if(oSettings.oScroll.bInfinite)
+{return null;}
+var nPaginate=document.createElement('div');nPaginate.className=oSettings.oClasses.sPaging+oSettings.sPaginationType;DataTable.ext.oPagination[oSettings.sPaginationType].fnInit(oSettings,nPaginate,function(oSettings){_fnCalculateEnd(oSettings);_fnDraw(oSettings);});if(!oSettings.aanFeatures.p)
+{oSettings.aoDrawCallback.push({"fn":function(oSettings){DataTable.ext.oPagination[oSettings.sPaginationType].fnUpdate(oSettings,function(oSettings){_fnCalculateEnd(oSettings);_fnDraw(oSettings);});},"sName":"pagination"});}
+return nPaginate;}
+function _fnPageChange(oSettings,mAction)
+{var iOldStart=oSettings._iDisplayStart;if(typeof mAction==="number")
+{oSettings._iDisplayStart=mAction*oSettings._iDisplayLength;if(oSettings._iDisplayStart>oSettings.fnRecordsDisplay())
+{oSettings._iDisplayStart=0;}}
+else if(mAction=="first")
+{oSettings._iDisplayStart=0;}
+else if(mAction=="previous")
+{oSettings._iDisplayStart=oSettings._iDisplayLength>=0?oSettings._iDisplayStart-oSettings._iDisplayLength:0;if(oSettings._iDisplayStart<0)
+{oSettings._iDisplayStart=0;}}
+else if(mAction=="next")
+{if(oSettings._iDisplayLength>=0)
+{if(oSettings._iDisplayStart+oSettings._iDisplayLength<oSettings.fnRecordsDisplay())
+{oSettings._iDisplayStart+=oSettings._iDisplayLength;}}
+else
+{oSettings._iDisplayStart=0;}}
+else if(mAction=="last")
+{if(oSettings._iDisplayLength>=0)
+{var iPages=parseInt((oSettings.fnRecordsDisplay()-1)/oSettings._iDisplayLength,10)+1;oSettings._iDisplayStart=(iPages-1)*oSettings._iDisplayLength;}
+else
+{oSettings._iDisplayStart=0;}}
+else
+{_fnLog(oSettings,0,"Unknown paging action: "+mAction);}
+$(oSettings.oInstance).trigger('page',oSettings);return iOldStart!=oSettings._iDisplayStart;}
+function _fnFeatureHtmlProcessing(oSettings)
+{var nProcessing=document.createElement('div');if(!oSettings.aanFeatures.r)
+{nProcessing.id=oSettings.sTableId+'_processing';}
+nProcessing.innerHTML=oSettings.oLanguage.sProcessing;nProcessing.className=oSettings.oClasses.sProcessing;oSettings.nTable.parentNode.insertBefore(nProcessing,oSettings.nTable);return nProcessing;}
+function _fnProcessingDisplay(oSettings,bShow)
+{if(oSettings.oFeatures.bProcessing)
+{var an=oSettings.aanFeatures.r;for(var i=0,iLen=an.length;i<iLen;i++)
+{an[i].style.visibility=bShow?"visible":"hidden";}}
+$(oSettings.oInstance).trigger('processing',[oSettings,bShow]);}
+function _fnFeatureHtmlTable(oSettings)
+{if(oSettings.oScroll.sX===""&&oSettings.oScroll.sY==="")
+{return oSettings.nTable;}
+var
+nScroller=document.createElement('div'),nScrollHead=document.createElement('div'),nScrollHeadInner=document.createElement('div'),nScrollBody=document.createElement('div'),nScrollFoot=document.createElement('div'),nScrollFootInner=document.createElement('div'),nScrollHeadTable=oSettings.nTable.cloneNode(false),nScrollFootTable=oSettings.nTable.cloneNode(false),nThead=oSettings.nTable.getElementsByTagName('thead')[0],nTfoot=oSettings.nTable.getElementsByTagName('tfoot').length===0?null:oSettings.nTable.getElementsByTagName('tfoot')[0],oClasses=oSettings.oClasses;nScrollHead.appendChild(nScrollHeadInner);nScrollFoot.appendChild(nScrollFootInner);nScrollBody.appendChild(oSettings.nTable);nScroller.appendChild(nScrollHead);nScroller.appendChild(nScrollBody);nScrollHeadInner.appendChild(nScrollHeadTable);nScrollHeadTable.appendChild(nThead);if(nTfoot!==null)
+{nScroller.appendChild(nScrollFoot);nScrollFootInner.appendChild(nScrollFootTable);nScrollFootTable.appendChild(nTfoot);}
+nScroller.className=oClasses.sScrollWrapper;nScrollHead.className=oClasses.sScrollHead;nScrollHeadInner.className=oClasses.sScrollHeadInner;nScrollBody.className=oClasses.sScrollBody;nScrollFoot.className=oClasses.sScrollFoot;nScrollFootInner.className=oClasses.sScrollFootInner;if(oSettings.oScroll.bAutoCss)
+{nScrollHead.style.overflow="hidden";nScrollHead.style.position="relative";nScrollFoot.style.overflow="hidden";nScrollBody.style.overflow="auto";}
+nScrollHead.style.border="0";nScrollHead.style.width="100%";nScrollFoot.style.border="0";nScrollHeadInner.style.width=oSettings.oScroll.sXInner!==""?oSettings.oScroll.sXInner:"100%";nScrollHeadTable.removeAttribute('id');nScrollHeadTable.style.marginLeft="0";oSettings.nTable.style.marginLeft="0";if(nTfoot!==null)
+{nScrollFootTable.removeAttribute('id');nScrollFootTable.style.marginLeft="0";}
+var nCaption=$(oSettings.nTable).children('caption');if(nCaption.length>0)
+{nCaption=nCaption[0];if(nCaption._captionSide==="top")
+{nScrollHeadTable.appendChild(nCaption);}
+else if(nCaption._captionSide==="bottom"&&nTfoot)
+{nScrollFootTable.appendChild(nCaption);}}
+if(oSettings.oScroll.sX!=="")
+{nScrollHead.style.width=_fnStringToCss(oSettings.oScroll.sX);nScrollBody.style.width=_fnStringToCss(oSettings.oScroll.sX);if(nTfoot!==null)
+{nScrollFoot.style.width=_fnStringToCss(oSettings.oScroll.sX);}
+$(nScrollBody).scroll(function(e){nScrollHead.scrollLeft=this.scrollLeft;if(nTfoot!==null)
+{nScrollFoot.scrollLeft=this.scrollLeft;}});}
+if(oSettings.oScroll.sY!=="")
+{nScrollBody.style.height=_fnStringToCss(oSettings.oScroll.sY);}
+oSettings.aoDrawCallback.push({"fn":_fnScrollDraw,"sName":"scrolling"});if(oSettings.oScroll.bInfinite)
+{$(nScrollBody).scroll(function(){if(!oSettings.bDrawing&&$(this).scrollTop()!==0)
+{if($(this).scrollTop()+$(this).height()>$(oSettings.nTable).height()-oSettings.oScroll.iLoadGap)
+{if(oSettings.fnDisplayEnd()<oSettings.fnRecordsDisplay())
+{_fnPageChange(oSettings,'next');_fnCalculateEnd(oSettings);_fnDraw(oSettings);}}}});}
+oSettings.nScrollHead=nScrollHead;oSettings.nScrollFoot=nScrollFoot;return nScroller;}
+function _fnScrollDraw(o)
+{var
+nScrollHeadInner=o.nScrollHead.getElementsByTagName('div')[0],nScrollHeadTable=nScrollHeadInner.getElementsByTagName('table')[0],nScrollBody=o.nTable.parentNode,i,iLen,j,jLen,anHeadToSize,anHeadSizers,anFootSizers,anFootToSize,oStyle,iVis,nTheadSize,nTfootSize,iWidth,aApplied=[],aAppliedFooter=[],iSanityWidth,nScrollFootInner=(o.nTFoot!==null)?o.nScrollFoot.getElementsByTagName('div')[0]:null,nScrollFootTable=(o.nTFoot!==null)?nScrollFootInner.getElementsByTagName('table')[0]:null,ie67=o.oBrowser.bScrollOversize,zeroOut=function(nSizer){oStyle=nSizer.style;oStyle.paddingTop="0";oStyle.paddingBottom="0";oStyle.borderTopWidth="0";oStyle.borderBottomWidth="0";oStyle.height=0;};$(o.nTable).children('thead, tfoot').remove();nTheadSize=$(o.nTHead).clone()[0];o.nTable.insertBefore(nTheadSize,o.nTable.childNodes[0]);anHeadToSize=o.nTHead.getElementsByTagName('tr');anHeadSizers=nTheadSize.getElementsByTagName('tr');if(o.nTFoot!==null)
+{nTfootSize=$(o.nTFoot).clone()[0];o.nTable.insertBefore(nTfootSize,o.nTable.childNodes[1]);anFootToSize=o.nTFoot.getElementsByTagName('tr');anFootSizers=nTfootSize.getElementsByTagName('tr');}
+if(o.oScroll.sX==="")
+{nScrollBody.style.width='100%';nScrollHeadInner.parentNode.style.width='100%';}
+var nThs=_fnGetUniqueThs(o,nTheadSize);for(i=0,iLen=nThs.length;i<iLen;i++)
+{iVis=_fnVisibleToColumnIndex(o,i);nThs[i].style.width=o.aoColumns[iVis].sWidth;}
+if(o.nTFoot!==null)
+{_fnApplyToChildren(function(n){n.style.width="";},anFootSizers);}
+if(o.oScroll.bCollapse&&o.oScroll.sY!=="")
+{nScrollBody.style.height=(nScrollBody.offsetHeight+o.nTHead.offsetHeight)+"px";}
+iSanityWidth=$(o.nTable).outerWidth();if(o.oScroll.sX==="")
+{o.nTable.style.width="100%";if(ie67&&($('tbody',nScrollBody).height()>nScrollBody.offsetHeight||$(nScrollBody).css('overflow-y')=="scroll"))
+{o.nTable.style.width=_fnStringToCss($(o.nTable).outerWidth()-o.oScroll.iBarWidth);}}
+else
+{if(o.oScroll.sXInner!=="")
+{o.nTable.style.width=_fnStringToCss(o.oScroll.sXInner);}
+else if(iSanityWidth==$(nScrollBody).width()&&$(nScrollBody).height()<$(o.nTable).height())
+{o.nTable.style.width=_fnStringToCss(iSanityWidth-o.oScroll.iBarWidth);if($(o.nTable).outerWidth()>iSanityWidth-o.oScroll.iBarWidth)
+{o.nTable.style.width=_fnStringToCss(iSanityWidth);}}
+else
+{o.nTable.style.width=_fnStringToCss(iSanityWidth);}}
+iSanityWidth=$(o.nTable).outerWidth();_fnApplyToChildren(zeroOut,anHeadSizers);_fnApplyToChildren(function(nSizer){aApplied.push(_fnStringToCss($(nSizer).width()));},anHeadSizers);_fnApplyToChildren(function(nToSize,i){nToSize.style.width=aApplied[i];},anHeadToSize);$(anHeadSizers).height(0);if(o.nTFoot!==null)
+{_fnApplyToChildren(zeroOut,anFootSizers);_fnApplyToChildren(function(nSizer){aAppliedFooter.push(_fnStringToCss($(nSizer).width()));},anFootSizers);_fnApplyToChildren(function(nToSize,i){nToSize.style.width=aAppliedFooter[i];},anFootToSize);$(anFootSizers).height(0);}
+_fnApplyToChildren(function(nSizer,i){nSizer.innerHTML="";nSizer.style.width=aApplied[i];},anHeadSizers);if(o.nTFoot!==null)
+{_fnApplyToChildren(function(nSizer,i){nSizer.innerHTML="";nSizer.style.width=aAppliedFooter[i];},anFootSizers);}
+if($(o.nTable).outerWidth()<iSanityWidth)
+{var iCorrection=((nScrollBody.scrollHeight>nScrollBody.offsetHeight||$(nScrollBody).css('overflow-y')=="scroll"))?iSanityWidth+o.oScroll.iBarWidth:iSanityWidth;if(ie67&&(nScrollBody.scrollHeight>nScrollBody.offsetHeight||$(nScrollBody).css('overflow-y')=="scroll"))
+{o.nTable.style.width=_fnStringToCss(iCorrection-o.oScroll.iBarWidth);}
+nScrollBody.style.width=_fnStringToCss(iCorrection);o.nScrollHead.style.width=_fnStringToCss(iCorrection);if(o.nTFoot!==null)
+{o.nScrollFoot.style.width=_fnStringToCss(iCorrection);}
+if(o.oScroll.sX==="")
+{_fnLog(o,1,"The table cannot fit into the current element which will cause column"+" misalignment. The table has been drawn at its minimum possible width.");}
+else if(o.oScroll.sXInner!=="")
+{_fnLog(o,1,"The table cannot fit into the current element which will cause column"+" misalignment. Increase the sScrollXInner value or remove it to allow automatic"+" calculation");}}
+else
+{nScrollBody.style.width=_fnStringToCss('100%');o.nScrollHead.style.width=_fnStringToCss('100%');if(o.nTFoot!==null)
+{o.nScrollFoot.style.width=_fnStringToCss('100%');}}
+if(o.oScroll.sY==="")
+{if(ie67)
+{nScrollBody.style.height=_fnStringToCss(o.nTable.offsetHeight+o.oScroll.iBarWidth);}}
+if(o.oScroll.sY!==""&&o.oScroll.bCollapse)
+{nScrollBody.style.height=_fnStringToCss(o.oScroll.sY);var iExtra=(o.oScroll.sX!==""&&o.nTable.offsetWidth>nScrollBody.offsetWidth)?o.oScroll.iBarWidth:0;if(o.nTable.offsetHeight<nScrollBody.offsetHeight)
+{nScrollBody.style.height=_fnStringToCss(o.nTable.offsetHeight+iExtra);}}
+var iOuterWidth=$(o.nTable).outerWidth();nScrollHeadTable.style.width=_fnStringToCss(iOuterWidth);nScrollHeadInner.style.width=_fnStringToCss(iOuterWidth);var bScrolling=$(o.nTable).height()>nScrollBody.clientHeight||$(nScrollBody).css('overflow-y')=="scroll";nScrollHeadInner.style.paddingRight=bScrolling?o.oScroll.iBarWidth+"px":"0px";if(o.nTFoot!==null)
+{nScrollFootTable.style.width=_fnStringToCss(iOuterWidth);nScrollFootInner.style.width=_fnStringToCss(iOuterWidth);nScrollFootInner.style.paddingRight=bScrolling?o.oScroll.iBarWidth+"px":"0px";}
+$(nScrollBody).scroll();if(o.bSorted||o.bFiltered)
+{nScrollBody.scrollTop=0;}}
+function _fnApplyToChildren(fn,an1,an2)
+{var index=0,i=0,iLen=an1.length;var nNode1,nNode2;while(i<iLen)
+{nNode1=an1[i].firstChild;nNode2=an2?an2[i].firstChild:null;while(nNode1)
+{if(nNode1.nodeType===1)
+{if(an2)
+{fn(nNode1,nNode2,index);}
+else
+{fn(nNode1,index);}
+index++;}
+nNode1=nNode1.nextSibling;nNode2=an2?nNode2.nextSibling:null;}
+i++;}}
+function _fnConvertToWidth(sWidth,nParent)
+{if(!sWidth||sWidth===null||sWidth==='')
+{return 0;}
+if(!nParent)
+{nParent=document.body;}
+var iWidth;var nTmp=document.createElement("div");nTmp.style.width=_fnStringToCss(sWidth);nParent.appendChild(nTmp);iWidth=nTmp.offsetWidth;nParent.removeChild(nTmp);return(iWidth);}
+function _fnCalculateColumnWidths(oSettings)
+{var iTableWidth=oSettings.nTable.offsetWidth;var iUserInputs=0;var iTmpWidth;var iVisibleColumns=0;var iColums=oSettings.aoColumns.length;var i,iIndex,iCorrector,iWidth;var oHeaders=$('th',oSettings.nTHead);var widthAttr=oSettings.nTable.getAttribute('width');var nWrapper=oSettings.nTable.parentNode;for(i=0;i<iColums;i++)
+{if(oSettings.aoColumns[i].bVisible)
+{iVisibleColumns++;if(oSettings.aoColumns[i].sWidth!==null)
+{iTmpWidth=_fnConvertToWidth(oSettings.aoColumns[i].sWidthOrig,nWrapper);if(iTmpWidth!==null)
+{oSettings.aoColumns[i].sWidth=_fnStringToCss(iTmpWidth);}
+iUserInputs++;}}}
+if(iColums==oHeaders.length&&iUserInputs===0&&iVisibleColumns==iColums&&oSettings.oScroll.sX===""&&oSettings.oScroll.sY==="")
+{for(i=0;i<oSettings.aoColumns.length;i++)
+{iTmpWidth=$(oHeaders[i]).width();if(iTmpWidth!==null)
+{oSettings.aoColumns[i].sWidth=_fnStringToCss(iTmpWidth);}}}
+else
+{var
+nCalcTmp=oSettings.nTable.cloneNode(false),nTheadClone=oSettings.nTHead.cloneNode(true),nBody=document.createElement('tbody'),nTr=document.createElement('tr'),nDivSizing;nCalcTmp.removeAttribute("id");nCalcTmp.appendChild(nTheadClone);if(oSettings.nTFoot!==null)
+{nCalcTmp.appendChild(oSettings.nTFoot.cloneNode(true));_fnApplyToChildren(function(n){n.style.width="";},nCalcTmp.getElementsByTagName('tr'));}
+nCalcTmp.appendChild(nBody);nBody.appendChild(nTr);var jqColSizing=$('thead th',nCalcTmp);if(jqColSizing.length===0)
+{jqColSizing=$('tbody tr:eq(0)>td',nCalcTmp);}
+var nThs=_fnGetUniqueThs(oSettings,nTheadClone);iCorrector=0;for(i=0;i<iColums;i++)
+{var oColumn=oSettings.aoColumns[i];if(oColumn.bVisible&&oColumn.sWidthOrig!==null&&oColumn.sWidthOrig!=="")
+{nThs[i-iCorrector].style.width=_fnStringToCss(oColumn.sWidthOrig);}
+else if(oColumn.bVisible)
+{nThs[i-iCorrector].style.width="";}
+else
+{iCorrector++;}}
+for(i=0;i<iColums;i++)
+{if(oSettings.aoColumns[i].bVisible)
+{var nTd=_fnGetWidestNode(oSettings,i);if(nTd!==null)
+{nTd=nTd.cloneNode(true);if(oSettings.aoColumns[i].sContentPadding!=="")
+{nTd.innerHTML+=oSettings.aoColumns[i].sContentPadding;}
+nTr.appendChild(nTd);}}}
+nWrapper.appendChild(nCalcTmp);if(oSettings.oScroll.sX!==""&&oSettings.oScroll.sXInner!=="")
+{nCalcTmp.style.width=_fnStringToCss(oSettings.oScroll.sXInner);}
+else if(oSettings.oScroll.sX!=="")
+{nCalcTmp.style.width="";if($(nCalcTmp).width()<nWrapper.offsetWidth)
+{nCalcTmp.style.width=_fnStringToCss(nWrapper.offsetWidth);}}
+else if(oSettings.oScroll.sY!=="")
+{nCalcTmp.style.width=_fnStringToCss(nWrapper.offsetWidth);}
+else if(widthAttr)
+{nCalcTmp.style.width=_fnStringToCss(widthAttr);}
+nCalcTmp.style.visibility="hidden";_fnScrollingWidthAdjust(oSettings,nCalcTmp);var oNodes=$("tbody tr:eq(0)",nCalcTmp).children();if(oNodes.length===0)
+{oNodes=_fnGetUniqueThs(oSettings,$('thead',nCalcTmp)[0]);}
+if(oSettings.oScroll.sX!=="")
+{var iTotal=0;iCorrector=0;for(i=0;i<oSettings.aoColumns.length;i++)
+{if(oSettings.aoColumns[i].bVisible)
+{if(oSettings.aoColumns[i].sWidthOrig===null)
+{iTotal+=$(oNodes[iCorrector]).outerWidth();}
+else
+{iTotal+=parseInt(oSettings.aoColumns[i].sWidth.replace('px',''),10)+
+($(oNodes[iCorrector]).outerWidth()-$(oNodes[iCorrector]).width());}
+iCorrector++;}}
+nCalcTmp.style.width=_fnStringToCss(iTotal);oSettings.nTable.style.width=_fnStringToCss(iTotal);}
+iCorrector=0;for(i=0;i<oSettings.aoColumns.length;i++)
+{if(oSettings.aoColumns[i].bVisible)
+{iWidth=$(oNodes[iCorrector]).width();if(iWidth!==null&&iWidth>0)
+{oSettings.aoColumns[i].sWidth=_fnStringToCss(iWidth);}
+iCorrector++;}}
+var cssWidth=$(nCalcTmp).css('width');oSettings.nTable.style.width=(cssWidth.indexOf('%')!==-1)?cssWidth:_fnStringToCss($(nCalcTmp).outerWidth());nCalcTmp.parentNode.removeChild(nCalcTmp);}
+if(widthAttr)
+{oSettings.nTable.style.width=_fnStringToCss(widthAttr);}}
+function _fnScrollingWidthAdjust(oSettings,n)
+{if(oSettings.oScroll.sX===""&&oSettings.oScroll.sY!=="")
+{var iOrigWidth=$(n).width();n.style.width=_fnStringToCss($(n).outerWidth()-oSettings.oScroll.iBarWidth);}
+else if(oSettings.oScroll.sX!=="")
+{n.style.width=_fnStringToCss($(n).outerWidth());}}
+function _fnGetWidestNode(oSettings,iCol)
+{var iMaxIndex=_fnGetMaxLenString(oSettings,iCol);if(iMaxIndex<0)
+{return null;}
+if(oSettings.aoData[iMaxIndex].nTr===null)
+{var n=document.createElement('td');n.innerHTML=_fnGetCellData(oSettings,iMaxIndex,iCol,'');return n;}
+return _fnGetTdNodes(oSettings,iMaxIndex)[iCol];}
+function _fnGetMaxLenString(oSettings,iCol)
+{var iMax=-1;var iMaxIndex=-1;for(var i=0;i<oSettings.aoData.length;i++)
+{var s=_fnGetCellData(oSettings,i,iCol,'display')+"";s=s.replace(/<.*?>/g,"");if(s.length>iMax)
+{iMax=s.length;iMaxIndex=i;}}
+return iMaxIndex;}
+function _fnStringToCss(s)
+{if(s===null)
+{return"0px";}
+if(typeof s=='number')
+{if(s<0)
+{return"0px";}
+return s+"px";}
+var c=s.charCodeAt(s.length-1);if(c<0x30||c>0x39)
+{return s;}
+return s+"px";}
+function _fnScrollBarWidth()
+{var inner=document.createElement('p');var style=inner.style;style.width="100%";style.height="200px";style.padding="0px";var outer=document.createElement('div');style=outer.style;style.position="absolute";style.top="0px";style.left="0px";style.visibility="hidden";style.width="200px";style.height="150px";style.padding="0px";style.overflow="hidden";outer.appendChild(inner);document.body.appendChild(outer);var w1=inner.offsetWidth;outer.style.overflow='scroll';var w2=inner.offsetWidth;if(w1==w2)
+{w2=outer.clientWidth;}
+document.body.removeChild(outer);return(w1-w2);}
+function _fnSort(oSettings,bApplyClasses)
+{var
+i,iLen,j,jLen,k,kLen,sDataType,nTh,aaSort=[],aiOrig=[],oSort=DataTable.ext.oSort,aoData=oSettings.aoData,aoColumns=oSettings.aoColumns,oAria=oSettings.oLanguage.oAria;if(!oSettings.oFeatures.bServerSide&&(oSettings.aaSorting.length!==0||oSettings.aaSortingFixed!==null))
+{aaSort=(oSettings.aaSortingFixed!==null)?oSettings.aaSortingFixed.concat(oSettings.aaSorting):oSettings.aaSorting.slice();for(i=0;i<aaSort.length;i++)
+{var iColumn=aaSort[i][0];var iVisColumn=_fnColumnIndexToVisible(oSettings,iColumn);sDataType=oSettings.aoColumns[iColumn].sSortDataType;if(DataTable.ext.afnSortData[sDataType])
+{var aData=DataTable.ext.afnSortData[sDataType].call(oSettings.oInstance,oSettings,iColumn,iVisColumn);if(aData.length===aoData.length)
+{for(j=0,jLen=aoData.length;j<jLen;j++)
+{_fnSetCellData(oSettings,j,iColumn,aData[j]);}}
+else
+{_fnLog(oSettings,0,"Returned data sort array (col "+iColumn+") is the wrong length");}}}
+for(i=0,iLen=oSettings.aiDisplayMaster.length;i<iLen;i++)
+{aiOrig[oSettings.aiDisplayMaster[i]]=i;}
+var iSortLen=aaSort.length;var fnSortFormat,aDataSort;for(i=0,iLen=aoData.length;i<iLen;i++)
+{for(j=0;j<iSortLen;j++)
+{aDataSort=aoColumns[aaSort[j][0]].aDataSort;for(k=0,kLen=aDataSort.length;k<kLen;k++)
+{sDataType=aoColumns[aDataSort[k]].sType;fnSortFormat=oSort[(sDataType?sDataType:'string')+"-pre"];aoData[i]._aSortData[aDataSort[k]]=fnSortFormat?fnSortFormat(_fnGetCellData(oSettings,i,aDataSort[k],'sort')):_fnGetCellData(oSettings,i,aDataSort[k],'sort');}}}
+oSettings.aiDisplayMaster.sort(function(a,b){var k,l,lLen,iTest,aDataSort,sDataType;for(k=0;k<iSortLen;k++)
+{aDataSort=aoColumns[aaSort[k][0]].aDataSort;for(l=0,lLen=aDataSort.length;l<lLen;l++)
+{sDataType=aoColumns[aDataSort[l]].sType;iTest=oSort[(sDataType?sDataType:'string')+"-"+aaSort[k][1]](aoData[a]._aSortData[aDataSort[l]],aoData[b]._aSortData[aDataSort[l]]);if(iTest!==0)
+{return iTest;}}}
+return oSort['numeric-asc'](aiOrig[a],aiOrig[b]);});}
+if((bApplyClasses===undefined||bApplyClasses)&&!oSettings.oFeatures.bDeferRender)
+{_fnSortingClasses(oSettings);}
+for(i=0,iLen=oSettings.aoColumns.length;i<iLen;i++)
+{var sTitle=aoColumns[i].sTitle.replace(/<.*?>/g,"");nTh=aoColumns[i].nTh;nTh.removeAttribute('aria-sort');nTh.removeAttribute('aria-label');if(aoColumns[i].bSortable)
+{if(aaSort.length>0&&aaSort[0][0]==i)
+{nTh.setAttribute('aria-sort',aaSort[0][1]=="asc"?"ascending":"descending");var nextSort=(aoColumns[i].asSorting[aaSort[0][2]+1])?aoColumns[i].asSorting[aaSort[0][2]+1]:aoColumns[i].asSorting[0];nTh.setAttribute('aria-label',sTitle+
+(nextSort=="asc"?oAria.sSortAscending:oAria.sSortDescending));}
+else
+{nTh.setAttribute('aria-label',sTitle+
+(aoColumns[i].asSorting[0]=="asc"?oAria.sSortAscending:oAria.sSortDescending));}}
+else
+{nTh.setAttribute('aria-label',sTitle);}}
+oSettings.bSorted=true;$(oSettings.oInstance).trigger('sort',oSettings);if(oSettings.oFeatures.bFilter)
+{_fnFilterComplete(oSettings,oSettings.oPreviousSearch,1);}
+else
+{oSettings.aiDisplay=oSettings.aiDisplayMaster.slice();oSettings._iDisplayStart=0;_fnCalculateEnd(oSettings);_fnDraw(oSettings);}}
+function _fnSortAttachListener(oSettings,nNode,iDataIndex,fnCallback)
+{_fnBindAction(nNode,{},function(e){if(oSettings.aoColumns[iDataIndex].bSortable===false)
+{return;}
+var fnInnerSorting=function(){var iColumn,iNextSort;if(e.shiftKey)
+{var bFound=false;for(var i=0;i<oSettings.aaSorting.length;i++)
+{if(oSettings.aaSorting[i][0]==iDataIndex)
+{bFound=true;iColumn=oSettings.aaSorting[i][0];iNextSort=oSettings.aaSorting[i][2]+1;if(!oSettings.aoColumns[iColumn].asSorting[iNextSort])
+{oSettings.aaSorting.splice(i,1);}
+else
+{oSettings.aaSorting[i][1]=oSettings.aoColumns[iColumn].asSorting[iNextSort];oSettings.aaSorting[i][2]=iNextSort;}
+break;}}
+if(bFound===false)
+{oSettings.aaSorting.push([iDataIndex,oSettings.aoColumns[iDataIndex].asSorting[0],0]);}}
+else
+{if(oSettings.aaSorting.length==1&&oSettings.aaSorting[0][0]==iDataIndex)
+{iColumn=oSettings.aaSorting[0][0];iNextSort=oSettings.aaSorting[0][2]+1;if(!oSettings.aoColumns[iColumn].asSorting[iNextSort])
+{iNextSort=0;}
+oSettings.aaSorting[0][1]=oSettings.aoColumns[iColumn].asSorting[iNextSort];oSettings.aaSorting[0][2]=iNextSort;}
+else
+{oSettings.aaSorting.splice(0,oSettings.aaSorting.length);oSettings.aaSorting.push([iDataIndex,oSettings.aoColumns[iDataIndex].asSorting[0],0]);}}
+_fnSort(oSettings);};if(!oSettings.oFeatures.bProcessing)
+{fnInnerSorting();}
+else
+{_fnProcessingDisplay(oSettings,true);setTimeout(function(){fnInnerSorting();if(!oSettings.oFeatures.bServerSide)
+{_fnProcessingDisplay(oSettings,false);}},0);}
+if(typeof fnCallback=='function')
+{fnCallback(oSettings);}});}
+function _fnSortingClasses(oSettings)
+{var i,iLen,j,jLen,iFound;var aaSort,sClass;var iColumns=oSettings.aoColumns.length;var oClasses=oSettings.oClasses;for(i=0;i<iColumns;i++)
+{if(oSettings.aoColumns[i].bSortable)
+{$(oSettings.aoColumns[i].nTh).removeClass(oClasses.sSortAsc+" "+oClasses.sSortDesc+" "+oSettings.aoColumns[i].sSortingClass);}}
+if(oSettings.aaSortingFixed!==null)
+{aaSort=oSettings.aaSortingFixed.concat(oSettings.aaSorting);}
+else
+{aaSort=oSettings.aaSorting.slice();}
+for(i=0;i<oSettings.aoColumns.length;i++)
+{if(oSettings.aoColumns[i].bSortable)
+{sClass=oSettings.aoColumns[i].sSortingClass;iFound=-1;for(j=0;j<aaSort.length;j++)
+{if(aaSort[j][0]==i)
+{sClass=(aaSort[j][1]=="asc")?oClasses.sSortAsc:oClasses.sSortDesc;iFound=j;break;}}
+$(oSettings.aoColumns[i].nTh).addClass(sClass);if(oSettings.bJUI)
+{var jqSpan=$("span."+oClasses.sSortIcon,oSettings.aoColumns[i].nTh);jqSpan.removeClass(oClasses.sSortJUIAsc+" "+oClasses.sSortJUIDesc+" "+
+oClasses.sSortJUI+" "+oClasses.sSortJUIAscAllowed+" "+oClasses.sSortJUIDescAllowed);var sSpanClass;if(iFound==-1)
+{sSpanClass=oSettings.aoColumns[i].sSortingClassJUI;}
+else if(aaSort[iFound][1]=="asc")
+{sSpanClass=oClasses.sSortJUIAsc;}
+else
+{sSpanClass=oClasses.sSortJUIDesc;}
+jqSpan.addClass(sSpanClass);}}
+else
+{$(oSettings.aoColumns[i].nTh).addClass(oSettings.aoColumns[i].sSortingClass);}}
+sClass=oClasses.sSortColumn;if(oSettings.oFeatures.bSort&&oSettings.oFeatures.bSortClasses)
+{var nTds=_fnGetTdNodes(oSettings);var iClass,iTargetCol;var asClasses=[];for(i=0;i<iColumns;i++)
+{asClasses.push("");}
+for(i=0,iClass=1;i<aaSort.length;i++)
+{iTargetCol=parseInt(aaSort[i][0],10);asClasses[iTargetCol]=sClass+iClass;if(iClass<3)
+{iClass++;}}
+var reClass=new RegExp(sClass+"[123]");var sTmpClass,sCurrentClass,sNewClass;for(i=0,iLen=nTds.length;i<iLen;i++)
+{iTargetCol=i%iColumns;sCurrentClass=nTds[i].className;sNewClass=asClasses[iTargetCol];sTmpClass=sCurrentClass.replace(reClass,sNewClass);if(sTmpClass!=sCurrentClass)
+{nTds[i].className=$.trim(sTmpClass);}
+else if(sNewClass.length>0&&sCurrentClass.indexOf(sNewClass)==-1)
+{nTds[i].className=sCurrentClass+" "+sNewClass;}}}}
+function _fnSaveState(oSettings)
+{if(!oSettings.oFeatures.bStateSave||oSettings.bDestroying)
+{return;}
+var i,iLen,bInfinite=oSettings.oScroll.bInfinite;var oState={"iCreate":new Date().getTime(),"iStart":(bInfinite?0:oSettings._iDisplayStart),"iEnd":(bInfinite?oSettings._iDisplayLength:oSettings._iDisplayEnd),"iLength":oSettings._iDisplayLength,"aaSorting":$.extend(true,[],oSettings.aaSorting),"oSearch":$.extend(true,{},oSettings.oPreviousSearch),"aoSearchCols":$.extend(true,[],oSettings.aoPreSearchCols),"abVisCols":[]};for(i=0,iLen=oSettings.aoColumns.length;i<iLen;i++)
+{oState.abVisCols.push(oSettings.aoColumns[i].bVisible);}
+_fnCallbackFire(oSettings,"aoStateSaveParams",'stateSaveParams',[oSettings,oState]);oSettings.fnStateSave.call(oSettings.oInstance,oSettings,oState);}
+function _fnLoadState(oSettings,oInit)
+{if(!oSettings.oFeatures.bStateSave)
+{return;}
+var oData=oSettings.fnStateLoad.call(oSettings.oInstance,oSettings);if(!oData)
+{return;}
+var abStateLoad=_fnCallbackFire(oSettings,'aoStateLoadParams','stateLoadParams',[oSettings,oData]);if($.inArray(false,abStateLoad)!==-1)
+{return;}
+oSettings.oLoadedState=$.extend(true,{},oData);oSettings._iDisplayStart=oData.iStart;oSettings.iInitDisplayStart=oData.iStart;oSettings._iDisplayEnd=oData.iEnd;oSettings._iDisplayLength=oData.iLength;oSettings.aaSorting=oData.aaSorting.slice();oSettings.saved_aaSorting=oData.aaSorting.slice();$.extend(oSettings.oPreviousSearch,oData.oSearch);$.extend(true,oSettings.aoPreSearchCols,oData.aoSearchCols);oInit.saved_aoColumns=[];for(var i=0;i<oData.abVisCols.length;i++)
+{oInit.saved_aoColumns[i]={};oInit.saved_aoColumns[i].bVisible=oData.abVisCols[i];}
+_fnCallbackFire(oSettings,'aoStateLoaded','stateLoaded',[oSettings,oData]);}
+function _fnCreateCookie(sName,sValue,iSecs,sBaseName,fnCallback)
+{var date=new Date();date.setTime(date.getTime()+(iSecs*1000));var aParts=window.location.pathname.split('/');var sNameFile=sName+'_'+aParts.pop().replace(/[\/:]/g,"").toLowerCase();var sFullCookie,oData;if(fnCallback!==null)
+{oData=(typeof $.parseJSON==='function')?$.parseJSON(sValue):eval('('+sValue+')');sFullCookie=fnCallback(sNameFile,oData,date.toGMTString(),aParts.join('/')+"/");}
+else
+{sFullCookie=sNameFile+"="+encodeURIComponent(sValue)+"; expires="+date.toGMTString()+"; path="+aParts.join('/')+"/";}
+var
+aCookies=document.cookie.split(';'),iNewCookieLen=sFullCookie.split(';')[0].length,aOldCookies=[];if(iNewCookieLen+document.cookie.length+10>4096)
+{for(var i=0,iLen=aCookies.length;i<iLen;i++)
+{if(aCookies[i].indexOf(sBaseName)!=-1)
+{var aSplitCookie=aCookies[i].split('=');try{oData=eval('('+decodeURIComponent(aSplitCookie[1])+')');if(oData&&oData.iCreate)
+{aOldCookies.push({"name":aSplitCookie[0],"time":oData.iCreate});}}
+catch(e){}}}
+aOldCookies.sort(function(a,b){return b.time-a.time;});while(iNewCookieLen+document.cookie.length+10>4096){if(aOldCookies.length===0){return;}
+var old=aOldCookies.pop();document.cookie=old.name+"=; expires=Thu, 01-Jan-1970 00:00:01 GMT; path="+
+aParts.join('/')+"/";}}
+document.cookie=sFullCookie;}
+function _fnReadCookie(sName)
+{var
+aParts=window.location.pathname.split('/'),sNameEQ=sName+'_'+aParts[aParts.length-1].replace(/[\/:]/g,"").toLowerCase()+'=',sCookieContents=document.cookie.split(';');for(var i=0;i<sCookieContents.length;i++)
+{var c=sCookieContents[i];while(c.charAt(0)==' ')
+{c=c.substring(1,c.length);}
+if(c.indexOf(sNameEQ)===0)
+{return decodeURIComponent(c.substring(sNameEQ.length,c.length));}}
+return null;}
+function _fnSettingsFromNode(nTable)
+{for(var i=0;i<DataTable.settings.length;i++)
+{if(DataTable.settings[i].nTable===nTable)
+{return DataTable.settings[i];}}
+return null;}
+function _fnGetTrNodes(oSettings)
+{var aNodes=[];var aoData=oSettings.aoData;for(var i=0,iLen=aoData.length;i<iLen;i++)
+{if(aoData[i].nTr!==null)
+{aNodes.push(aoData[i].nTr);}}
+return aNodes;}
+function _fnGetTdNodes(oSettings,iIndividualRow)
+{var anReturn=[];var iCorrector;var anTds,nTd;var iRow,iRows=oSettings.aoData.length,iColumn,iColumns,oData,sNodeName,iStart=0,iEnd=iRows;if(iIndividualRow!==undefined)
+{iStart=iIndividualRow;iEnd=iIndividualRow+1;}
+for(iRow=iStart;iRow<iEnd;iRow++)
+{oData=oSettings.aoData[iRow];if(oData.nTr!==null)
+{anTds=[];nTd=oData.nTr.firstChild;while(nTd)
+{sNodeName=nTd.nodeName.toLowerCase();if(sNodeName=='td'||sNodeName=='th')
+{anTds.push(nTd);}
+nTd=nTd.nextSibling;}
+iCorrector=0;for(iColumn=0,iColumns=oSettings.aoColumns.length;iColumn<iColumns;iColumn++)
+{if(oSettings.aoColumns[iColumn].bVisible)
+{anReturn.push(anTds[iColumn-iCorrector]);}
+else
+{anReturn.push(oData._anHidden[iColumn]);iCorrector++;}}}}
+return anReturn;}
+function _fnLog(oSettings,iLevel,sMesg)
+{var sAlert=(oSettings===null)?"DataTables warning: "+sMesg:"DataTables warning (table id = '"+oSettings.sTableId+"'): "+sMesg;if(iLevel===0)
+{if(DataTable.ext.sErrMode=='alert')
+{alert(sAlert);}
+else
+{throw new Error(sAlert);}
+return;}
+else if(window.console&&console.log)
+{console.log(sAlert);}}
+function _fnMap(oRet,oSrc,sName,sMappedName)
+{if(sMappedName===undefined)
+{sMappedName=sName;}
+if(oSrc[sName]!==undefined)
+{oRet[sMappedName]=oSrc[sName];}}
+function _fnExtend(oOut,oExtender)
+{var val;for(var prop in oExtender)
+{if(oExtender.hasOwnProperty(prop))
+{val=oExtender[prop];if(typeof oInit[prop]==='object'&&val!==null&&$.isArray(val)===false)
+{$.extend(true,oOut[prop],val);}
+else
+{oOut[prop]=val;}}}
+return oOut;}
+function _fnBindAction(n,oData,fn)
+{$(n).bind('click.DT',oData,function(e){n.blur();fn(e);}).bind('keypress.DT',oData,function(e){if(e.which===13){fn(e);}}).bind('selectstart.DT',function(){return false;});}
+function _fnCallbackReg(oSettings,sStore,fn,sName)
+{if(fn)
+{oSettings[sStore].push({"fn":fn,"sName":sName});}}
+function _fnCallbackFire(oSettings,sStore,sTrigger,aArgs)
+{var aoStore=oSettings[sStore];var aRet=[];for(var i=aoStore.length-1;i>=0;i--)
+{aRet.push(aoStore[i].fn.apply(oSettings.oInstance,aArgs));}
+if(sTrigger!==null)
+{$(oSettings.oInstance).trigger(sTrigger,aArgs);}
+return aRet;}
+var _fnJsonString=(window.JSON)?JSON.stringify:function(o)
+{var sType=typeof o;if(sType!=="object"||o===null)
+{if(sType==="string")
+{o='"'+o+'"';}
+return o+"";}
+var
+sProp,mValue,json=[],bArr=$.isArray(o);for(sProp in o)
+{mValue=o[sProp];sType=typeof mValue;if(sType==="string")
+{mValue='"'+mValue+'"';}
+else if(sType==="object"&&mValue!==null)
+{mValue=_fnJsonString(mValue);}
+json.push((bArr?"":'"'+sProp+'":')+mValue);}
+return(bArr?"[":"{")+json+(bArr?"]":"}");};function _fnBrowserDetect(oSettings)
+{var n=$('<div style="position:absolute; top:0; left:0; height:1px; width:1px; overflow:hidden">'+'<div style="position:absolute; top:1px; left:1px; width:100px; overflow:scroll;">'+'<div id="DT_BrowserTest" style="width:100%; height:10px;"></div>'+'</div>'+'</div>')[0];document.body.appendChild(n);oSettings.oBrowser.bScrollOversize=$('#DT_BrowserTest',n)[0].offsetWidth===100?true:false;document.body.removeChild(n);}
+this.$=function(sSelector,oOpts)
+{var i,iLen,a=[],tr;var oSettings=_fnSettingsFromNode(this[DataTable.ext.iApiIndex]);var aoData=oSettings.aoData;var aiDisplay=oSettings.aiDisplay;var aiDisplayMaster=oSettings.aiDisplayMaster;if(!oOpts)
+{oOpts={};}
+oOpts=$.extend({},{"filter":"none","order":"current","page":"all"},oOpts);if(oOpts.page=='current')
+{for(i=oSettings._iDisplayStart,iLen=oSettings.fnDisplayEnd();i<iLen;i++)
+{tr=aoData[aiDisplay[i]].nTr;if(tr)
+{a.push(tr);}}}
+else if(oOpts.order=="current"&&oOpts.filter=="none")
+{for(i=0,iLen=aiDisplayMaster.length;i<iLen;i++)
+{tr=aoData[aiDisplayMaster[i]].nTr;if(tr)
+{a.push(tr);}}}
+else if(oOpts.order=="current"&&oOpts.filter=="applied")
+{for(i=0,iLen=aiDisplay.length;i<iLen;i++)
+{tr=aoData[aiDisplay[i]].nTr;if(tr)
+{a.push(tr);}}}
+else if(oOpts.order=="original"&&oOpts.filter=="none")
+{for(i=0,iLen=aoData.length;i<iLen;i++)
+{tr=aoData[i].nTr;if(tr)
+{a.push(tr);}}}
+else if(oOpts.order=="original"&&oOpts.filter=="applied")
+{for(i=0,iLen=aoData.length;i<iLen;i++)
+{tr=aoData[i].nTr;if($.inArray(i,aiDisplay)!==-1&&tr)
+{a.push(tr);}}}
+else
+{_fnLog(oSettings,1,"Unknown selection options");}
+var jqA=$(a);var jqTRs=jqA.filter(sSelector);var jqDescendants=jqA.find(sSelector);return $([].concat($.makeArray(jqTRs),$.makeArray(jqDescendants)));};this._=function(sSelector,oOpts)
+{var aOut=[];var i,iLen,iIndex;var aTrs=this.$(sSelector,oOpts);for(i=0,iLen=aTrs.length;i<iLen;i++)
+{aOut.push(this.fnGetData(aTrs[i]));}
+return aOut;};this.fnAddData=function(mData,bRedraw)
+{if(mData.length===0)
+{return[];}
+var aiReturn=[];var iTest;var oSettings=_fnSettingsFromNode(this[DataTable.ext.iApiIndex]);if(typeof mData[0]==="object"&&mData[0]!==null)
+{for(var i=0;i<mData.length;i++)
+{iTest=_fnAddData(oSettings,mData[i]);if(iTest==-1)
+{return aiReturn;}
+aiReturn.push(iTest);}}
+else
+{iTest=_fnAddData(oSettings,mData);if(iTest==-1)
+{return aiReturn;}
+aiReturn.push(iTest);}
+oSettings.aiDisplay=oSettings.aiDisplayMaster.slice();if(bRedraw===undefined||bRedraw)
+{_fnReDraw(oSettings);}
+return aiReturn;};this.fnAdjustColumnSizing=function(bRedraw)
+{var oSettings=_fnSettingsFromNode(this[DataTable.ext.iApiIndex]);_fnAdjustColumnSizing(oSettings);if(bRedraw===undefined||bRedraw)
+{this.fnDraw(false);}
+else if(oSettings.oScroll.sX!==""||oSettings.oScroll.sY!=="")
+{this.oApi._fnScrollDraw(oSettings);}};this.fnClearTable=function(bRedraw)
+{var oSettings=_fnSettingsFromNode(this[DataTable.ext.iApiIndex]);_fnClearTable(oSettings);if(bRedraw===undefined||bRedraw)
+{_fnDraw(oSettings);}};this.fnClose=function(nTr)
+{var oSettings=_fnSettingsFromNode(this[DataTable.ext.iApiIndex]);for(var i=0;i<oSettings.aoOpenRows.length;i++)
+{if(oSettings.aoOpenRows[i].nParent==nTr)
+{var nTrParent=oSettings.aoOpenRows[i].nTr.parentNode;if(nTrParent)
+{nTrParent.removeChild(oSettings.aoOpenRows[i].nTr);}
+oSettings.aoOpenRows.splice(i,1);return 0;}}
+return 1;};this.fnDeleteRow=function(mTarget,fnCallBack,bRedraw)
+{var oSettings=_fnSettingsFromNode(this[DataTable.ext.iApiIndex]);var i,iLen,iAODataIndex;iAODataIndex=(typeof mTarget==='object')?_fnNodeToDataIndex(oSettings,mTarget):mTarget;var oData=oSettings.aoData.splice(iAODataIndex,1);for(i=0,iLen=oSettings.aoData.length;i<iLen;i++)
+{if(oSettings.aoData[i].nTr!==null)
+{oSettings.aoData[i].nTr._DT_RowIndex=i;}}
+var iDisplayIndex=$.inArray(iAODataIndex,oSettings.aiDisplay);oSettings.asDataSearch.splice(iDisplayIndex,1);_fnDeleteIndex(oSettings.aiDisplayMaster,iAODataIndex);_fnDeleteIndex(oSettings.aiDisplay,iAODataIndex);if(typeof fnCallBack==="function")
+{fnCallBack.call(this,oSettings,oData);}
+if(oSettings._iDisplayStart>=oSettings.fnRecordsDisplay())
+{oSettings._iDisplayStart-=oSettings._iDisplayLength;if(oSettings._iDisplayStart<0)
+{oSettings._iDisplayStart=0;}}
+if(bRedraw===undefined||bRedraw)
+{_fnCalculateEnd(oSettings);_fnDraw(oSettings);}
+return oData;};this.fnDestroy=function(bRemove)
+{var oSettings=_fnSettingsFromNode(this[DataTable.ext.iApiIndex]);var nOrig=oSettings.nTableWrapper.parentNode;var nBody=oSettings.nTBody;var i,iLen;bRemove=(bRemove===undefined)?false:bRemove;oSettings.bDestroying=true;_fnCallbackFire(oSettings,"aoDestroyCallback","destroy",[oSettings]);if(!bRemove)
+{for(i=0,iLen=oSettings.aoColumns.length;i<iLen;i++)
+{if(oSettings.aoColumns[i].bVisible===false)
+{this.fnSetColumnVis(i,true);}}}
+$(oSettings.nTableWrapper).find('*').andSelf().unbind('.DT');$('tbody>tr>td.'+oSettings.oClasses.sRowEmpty,oSettings.nTable).parent().remove();if(oSettings.nTable!=oSettings.nTHead.parentNode)
+{$(oSettings.nTable).children('thead').remove();oSettings.nTable.appendChild(oSettings.nTHead);}
+if(oSettings.nTFoot&&oSettings.nTable!=oSettings.nTFoot.parentNode)
+{$(oSettings.nTable).children('tfoot').remove();oSettings.nTable.appendChild(oSettings.nTFoot);}
+oSettings.nTable.parentNode.removeChild(oSettings.nTable);$(oSettings.nTableWrapper).remove();oSettings.aaSorting=[];oSettings.aaSortingFixed=[];_fnSortingClasses(oSettings);$(_fnGetTrNodes(oSettings)).removeClass(oSettings.asStripeClasses.join(' '));$('th, td',oSettings.nTHead).removeClass([oSettings.oClasses.sSortable,oSettings.oClasses.sSortableAsc,oSettings.oClasses.sSortableDesc,oSettings.oClasses.sSortableNone].join(' '));if(oSettings.bJUI)
+{$('th span.'+oSettings.oClasses.sSortIcon
++', td span.'+oSettings.oClasses.sSortIcon,oSettings.nTHead).remove();$('th, td',oSettings.nTHead).each(function(){var jqWrapper=$('div.'+oSettings.oClasses.sSortJUIWrapper,this);var kids=jqWrapper.contents();$(this).append(kids);jqWrapper.remove();});}
+if(!bRemove&&oSettings.nTableReinsertBefore)
+{nOrig.insertBefore(oSettings.nTable,oSettings.nTableReinsertBefore);}
+else if(!bRemove)
+{nOrig.appendChild(oSettings.nTable);}
+for(i=0,iLen=oSettings.aoData.length;i<iLen;i++)
+{if(oSettings.aoData[i].nTr!==null)
+{nBody.appendChild(oSettings.aoData[i].nTr);}}
+if(oSettings.oFeatures.bAutoWidth===true)
+{oSettings.nTable.style.width=_fnStringToCss(oSettings.sDestroyWidth);}
+iLen=oSettings.asDestroyStripes.length;if(iLen)
+{var anRows=$(nBody).children('tr');for(i=0;i<iLen;i++)
+{anRows.filter(':nth-child('+iLen+'n + '+i+')').addClass(oSettings.asDestroyStripes[i]);}}
+for(i=0,iLen=DataTable.settings.length;i<iLen;i++)
+{if(DataTable.settings[i]==oSettings)
+{DataTable.settings.splice(i,1);}}
+oSettings=null;oInit=null;};this.fnDraw=function(bComplete)
+{var oSettings=_fnSettingsFromNode(this[DataTable.ext.iApiIndex]);if(bComplete===false)
+{_fnCalculateEnd(oSettings);_fnDraw(oSettings);}
+else
+{_fnReDraw(oSettings);}};this.fnFilter=function(sInput,iColumn,bRegex,bSmart,bShowGlobal,bCaseInsensitive)
+{var oSettings=_fnSettingsFromNode(this[DataTable.ext.iApiIndex]);if(!oSettings.oFeatures.bFilter)
+{return;}
+if(bRegex===undefined||bRegex===null)
+{bRegex=false;}
+if(bSmart===undefined||bSmart===null)
+{bSmart=true;}
+if(bShowGlobal===undefined||bShowGlobal===null)
+{bShowGlobal=true;}
+if(bCaseInsensitive===undefined||bCaseInsensitive===null)
+{bCaseInsensitive=true;}
+if(iColumn===undefined||iColumn===null)
+{_fnFilterComplete(oSettings,{"sSearch":sInput+"","bRegex":bRegex,"bSmart":bSmart,"bCaseInsensitive":bCaseInsensitive},1);if(bShowGlobal&&oSettings.aanFeatures.f)
+{var n=oSettings.aanFeatures.f;for(var i=0,iLen=n.length;i<iLen;i++)
+{try{if(n[i]._DT_Input!=document.activeElement)
+{$(n[i]._DT_Input).val(sInput);}}
+catch(e){$(n[i]._DT_Input).val(sInput);}}}}
+else
+{$.extend(oSettings.aoPreSearchCols[iColumn],{"sSearch":sInput+"","bRegex":bRegex,"bSmart":bSmart,"bCaseInsensitive":bCaseInsensitive});_fnFilterComplete(oSettings,oSettings.oPreviousSearch,1);}};this.fnGetData=function(mRow,iCol)
+{var oSettings=_fnSettingsFromNode(this[DataTable.ext.iApiIndex]);if(mRow!==undefined)
+{var iRow=mRow;if(typeof mRow==='object')
+{var sNode=mRow.nodeName.toLowerCase();if(sNode==="tr")
+{iRow=_fnNodeToDataIndex(oSettings,mRow);}
+else if(sNode==="td")
+{iRow=_fnNodeToDataIndex(oSettings,mRow.parentNode);iCol=_fnNodeToColumnIndex(oSettings,iRow,mRow);}}
+if(iCol!==undefined)
+{return _fnGetCellData(oSettings,iRow,iCol,'');}
+return(oSettings.aoData[iRow]!==undefined)?oSettings.aoData[iRow]._aData:null;}
+return _fnGetDataMaster(oSettings);};this.fnGetNodes=function(iRow)
+{var oSettings=_fnSettingsFromNode(this[DataTable.ext.iApiIndex]);if(iRow!==undefined){return(oSettings.aoData[iRow]!==undefined)?oSettings.aoData[iRow].nTr:null;}
+return _fnGetTrNodes(oSettings);};this.fnGetPosition=function(nNode)
+{var oSettings=_fnSettingsFromNode(this[DataTable.ext.iApiIndex]);var sNodeName=nNode.nodeName.toUpperCase();if(sNodeName=="TR")
+{return _fnNodeToDataIndex(oSettings,nNode);}
+else if(sNodeName=="TD"||sNodeName=="TH")
+{var iDataIndex=_fnNodeToDataIndex(oSettings,nNode.parentNode);var iColumnIndex=_fnNodeToColumnIndex(oSettings,iDataIndex,nNode);return[iDataIndex,_fnColumnIndexToVisible(oSettings,iColumnIndex),iColumnIndex];}
+return null;};this.fnIsOpen=function(nTr)
+{var oSettings=_fnSettingsFromNode(this[DataTable.ext.iApiIndex]);var aoOpenRows=oSettings.aoOpenRows;for(var i=0;i<oSettings.aoOpenRows.length;i++)
+{if(oSettings.aoOpenRows[i].nParent==nTr)
+{return true;}}
+return false;};this.fnOpen=function(nTr,mHtml,sClass)
+{var oSettings=_fnSettingsFromNode(this[DataTable.ext.iApiIndex]);var nTableRows=_fnGetTrNodes(oSettings);if($.inArray(nTr,nTableRows)===-1)
+{return;}
+this.fnClose(nTr);var nNewRow=document.createElement("tr");var nNewCell=document.createElement("td");nNewRow.appendChild(nNewCell);nNewCell.className=sClass;nNewCell.colSpan=_fnVisbleColumns(oSettings);if(typeof mHtml==="string")
+{nNewCell.innerHTML=mHtml;}
+else
+{$(nNewCell).html(mHtml);}
+var nTrs=$('tr',oSettings.nTBody);if($.inArray(nTr,nTrs)!=-1)
+{$(nNewRow).insertAfter(nTr);}
+oSettings.aoOpenRows.push({"nTr":nNewRow,"nParent":nTr});return nNewRow;};this.fnPageChange=function(mAction,bRedraw)
+{var oSettings=_fnSettingsFromNode(this[DataTable.ext.iApiIndex]);_fnPageChange(oSettings,mAction);_fnCalculateEnd(oSettings);if(bRedraw===undefined||bRedraw)
+{_fnDraw(oSettings);}};this.fnSetColumnVis=function(iCol,bShow,bRedraw)
+{var oSettings=_fnSettingsFromNode(this[DataTable.ext.iApiIndex]);var i,iLen;var aoColumns=oSettings.aoColumns;var aoData=oSettings.aoData;var nTd,bAppend,iBefore;if(aoColumns[iCol].bVisible==bShow)
+{return;}
+if(bShow)
+{var iInsert=0;for(i=0;i<iCol;i++)
+{if(aoColumns[i].bVisible)
+{iInsert++;}}
+bAppend=(iInsert>=_fnVisbleColumns(oSettings));if(!bAppend)
+{for(i=iCol;i<aoColumns.length;i++)
+{if(aoColumns[i].bVisible)
+{iBefore=i;break;}}}
+for(i=0,iLen=aoData.length;i<iLen;i++)
+{if(aoData[i].nTr!==null)
+{if(bAppend)
+{aoData[i].nTr.appendChild(aoData[i]._anHidden[iCol]);}
+else
+{aoData[i].nTr.insertBefore(aoData[i]._anHidden[iCol],_fnGetTdNodes(oSettings,i)[iBefore]);}}}}
+else
+{for(i=0,iLen=aoData.length;i<iLen;i++)
+{if(aoData[i].nTr!==null)
+{nTd=_fnGetTdNodes(oSettings,i)[iCol];aoData[i]._anHidden[iCol]=nTd;nTd.parentNode.removeChild(nTd);}}}
+aoColumns[iCol].bVisible=bShow;_fnDrawHead(oSettings,oSettings.aoHeader);if(oSettings.nTFoot)
+{_fnDrawHead(oSettings,oSettings.aoFooter);}
+for(i=0,iLen=oSettings.aoOpenRows.length;i<iLen;i++)
+{oSettings.aoOpenRows[i].nTr.colSpan=_fnVisbleColumns(oSettings);}
+if(bRedraw===undefined||bRedraw)
+{_fnAdjustColumnSizing(oSettings);_fnDraw(oSettings);}
+_fnSaveState(oSettings);};this.fnSettings=function()
+{return _fnSettingsFromNode(this[DataTable.ext.iApiIndex]);};this.fnSort=function(aaSort)
+{var oSettings=_fnSettingsFromNode(this[DataTable.ext.iApiIndex]);oSettings.aaSorting=aaSort;_fnSort(oSettings);};this.fnSortListener=function(nNode,iColumn,fnCallback)
+{_fnSortAttachListener(_fnSettingsFromNode(this[DataTable.ext.iApiIndex]),nNode,iColumn,fnCallback);};this.fnUpdate=function(mData,mRow,iColumn,bRedraw,bAction)
+{var oSettings=_fnSettingsFromNode(this[DataTable.ext.iApiIndex]);var i,iLen,sDisplay;var iRow=(typeof mRow==='object')?_fnNodeToDataIndex(oSettings,mRow):mRow;if($.isArray(mData)&&iColumn===undefined)
+{oSettings.aoData[iRow]._aData=mData.slice();for(i=0;i<oSettings.aoColumns.length;i++)
+{this.fnUpdate(_fnGetCellData(oSettings,iRow,i),iRow,i,false,false);}}
+else if($.isPlainObject(mData)&&iColumn===undefined)
+{oSettings.aoData[iRow]._aData=$.extend(true,{},mData);for(i=0;i<oSettings.aoColumns.length;i++)
+{this.fnUpdate(_fnGetCellData(oSettings,iRow,i),iRow,i,false,false);}}
+else
+{_fnSetCellData(oSettings,iRow,iColumn,mData);sDisplay=_fnGetCellData(oSettings,iRow,iColumn,'display');var oCol=oSettings.aoColumns[iColumn];if(oCol.fnRender!==null)
+{sDisplay=_fnRender(oSettings,iRow,iColumn);if(oCol.bUseRendered)
+{_fnSetCellData(oSettings,iRow,iColumn,sDisplay);}}
+if(oSettings.aoData[iRow].nTr!==null)
+{_fnGetTdNodes(oSettings,iRow)[iColumn].innerHTML=sDisplay;}}
+var iDisplayIndex=$.inArray(iRow,oSettings.aiDisplay);oSettings.asDataSearch[iDisplayIndex]=_fnBuildSearchRow(oSettings,_fnGetRowData(oSettings,iRow,'filter',_fnGetColumns(oSettings,'bSearchable')));if(bAction===undefined||bAction)
+{_fnAdjustColumnSizing(oSettings);}
+if(bRedraw===undefined||bRedraw)
+{_fnReDraw(oSettings);}
+return 0;};this.fnVersionCheck=DataTable.ext.fnVersionCheck;function _fnExternApiFunc(sFunc)
+{return function(){var aArgs=[_fnSettingsFromNode(this[DataTable.ext.iApiIndex])].concat(Array.prototype.slice.call(arguments));return DataTable.ext.oApi[sFunc].apply(this,aArgs);};}
+this.oApi={"_fnExternApiFunc":_fnExternApiFunc,"_fnInitialise":_fnInitialise,"_fnInitComplete":_fnInitComplete,"_fnLanguageCompat":_fnLanguageCompat,"_fnAddColumn":_fnAddColumn,"_fnColumnOptions":_fnColumnOptions,"_fnAddData":_fnAddData,"_fnCreateTr":_fnCreateTr,"_fnGatherData":_fnGatherData,"_fnBuildHead":_fnBuildHead,"_fnDrawHead":_fnDrawHead,"_fnDraw":_fnDraw,"_fnReDraw":_fnReDraw,"_fnAjaxUpdate":_fnAjaxUpdate,"_fnAjaxParameters":_fnAjaxParameters,"_fnAjaxUpdateDraw":_fnAjaxUpdateDraw,"_fnServerParams":_fnServerParams,"_fnAddOptionsHtml":_fnAddOptionsHtml,"_fnFeatureHtmlTable":_fnFeatureHtmlTable,"_fnScrollDraw":_fnScrollDraw,"_fnAdjustColumnSizing":_fnAdjustColumnSizing,"_fnFeatureHtmlFilter":_fnFeatureHtmlFilter,"_fnFilterComplete":_fnFilterComplete,"_fnFilterCustom":_fnFilterCustom,"_fnFilterColumn":_fnFilterColumn,"_fnFilter":_fnFilter,"_fnBuildSearchArray":_fnBuildSearchArray,"_fnBuildSearchRow":_fnBuildSearchRow,"_fnFilterCreateSearch":_fnFilterCreateSearch,"_fnDataToSearch":_fnDataToSearch,"_fnSort":_fnSort,"_fnSortAttachListener":_fnSortAttachListener,"_fnSortingClasses":_fnSortingClasses,"_fnFeatureHtmlPaginate":_fnFeatureHtmlPaginate,"_fnPageChange":_fnPageChange,"_fnFeatureHtmlInfo":_fnFeatureHtmlInfo,"_fnUpdateInfo":_fnUpdateInfo,"_fnFeatureHtmlLength":_fnFeatureHtmlLength,"_fnFeatureHtmlProcessing":_fnFeatureHtmlProcessing,"_fnProcessingDisplay":_fnProcessingDisplay,"_fnVisibleToColumnIndex":_fnVisibleToColumnIndex,"_fnColumnIndexToVisible":_fnColumnIndexToVisible,"_fnNodeToDataIndex":_fnNodeToDataIndex,"_fnVisbleColumns":_fnVisbleColumns,"_fnCalculateEnd":_fnCalculateEnd,"_fnConvertToWidth":_fnConvertToWidth,"_fnCalculateColumnWidths":_fnCalculateColumnWidths,"_fnScrollingWidthAdjust":_fnScrollingWidthAdjust,"_fnGetWidestNode":_fnGetWidestNode,"_fnGetMaxLenString":_fnGetMaxLenString,"_fnStringToCss":_fnStringToCss,"_fnDetectType":_fnDetectType,"_fnSettingsFromNode":_fnSettingsFromNode,"_fnGetDataMaster":_fnGetDataMaster,"_fnGetTrNodes":_fnGetTrNodes,"_fnGetTdNodes":_fnGetTdNodes,"_fnEscapeRegex":_fnEscapeRegex,"_fnDeleteIndex":_fnDeleteIndex,"_fnReOrderIndex":_fnReOrderIndex,"_fnColumnOrdering":_fnColumnOrdering,"_fnLog":_fnLog,"_fnClearTable":_fnClearTable,"_fnSaveState":_fnSaveState,"_fnLoadState":_fnLoadState,"_fnCreateCookie":_fnCreateCookie,"_fnReadCookie":_fnReadCookie,"_fnDetectHeader":_fnDetectHeader,"_fnGetUniqueThs":_fnGetUniqueThs,"_fnScrollBarWidth":_fnScrollBarWidth,"_fnApplyToChildren":_fnApplyToChildren,"_fnMap":_fnMap,"_fnGetRowData":_fnGetRowData,"_fnGetCellData":_fnGetCellData,"_fnSetCellData":_fnSetCellData,"_fnGetObjectDataFn":_fnGetObjectDataFn,"_fnSetObjectDataFn":_fnSetObjectDataFn,"_fnApplyColumnDefs":_fnApplyColumnDefs,"_fnBindAction":_fnBindAction,"_fnExtend":_fnExtend,"_fnCallbackReg":_fnCallbackReg,"_fnCallbackFire":_fnCallbackFire,"_fnJsonString":_fnJsonString,"_fnRender":_fnRender,"_fnNodeToColumnIndex":_fnNodeToColumnIndex,"_fnInfoMacros":_fnInfoMacros,"_fnBrowserDetect":_fnBrowserDetect,"_fnGetColumns":_fnGetColumns};$.extend(DataTable.ext.oApi,this.oApi);for(var sFunc in DataTable.ext.oApi)
+{if(sFunc)
+{this[sFunc]=_fnExternApiFunc(sFunc);}}
+var _that=this;this.each(function(){var i=0,iLen,j,jLen,k,kLen;var sId=this.getAttribute('id');var bInitHandedOff=false;var bUsePassedData=false;if(this.nodeName.toLowerCase()!='table')
+{_fnLog(null,0,"Attempted to initialise DataTables on a node which is not a "+"table: "+this.nodeName);return;}
+for(i=0,iLen=DataTable.settings.length;i<iLen;i++)
+{if(DataTable.settings[i].nTable==this)
+{if(oInit===undefined||oInit.bRetrieve)
+{return DataTable.settings[i].oInstance;}
+else if(oInit.bDestroy)
+{DataTable.settings[i].oInstance.fnDestroy();break;}
+else
+{_fnLog(DataTable.settings[i],0,"Cannot reinitialise DataTable.\n\n"+"To retrieve the DataTables object for this table, pass no arguments or see "+"the docs for bRetrieve and bDestroy");return;}}
+if(DataTable.settings[i].sTableId==this.id)
+{DataTable.settings.splice(i,1);break;}}
+if(sId===null||sId==="")
+{sId="DataTables_Table_"+(DataTable.ext._oExternConfig.iNextUnique++);this.id=sId;}
+var oSettings=$.extend(true,{},DataTable.models.oSettings,{"nTable":this,"oApi":_that.oApi,"oInit":oInit,"sDestroyWidth":$(this).width(),"sInstance":sId,"sTableId":sId});DataTable.settings.push(oSettings);oSettings.oInstance=(_that.length===1)?_that:$(this).dataTable();if(!oInit)
+{oInit={};}
+if(oInit.oLanguage)
+{_fnLanguageCompat(oInit.oLanguage);}
+oInit=_fnExtend($.extend(true,{},DataTable.defaults),oInit);_fnMap(oSettings.oFeatures,oInit,"bPaginate");_fnMap(oSettings.oFeatures,oInit,"bLengthChange");_fnMap(oSettings.oFeatures,oInit,"bFilter");_fnMap(oSettings.oFeatures,oInit,"bSort");_fnMap(oSettings.oFeatures,oInit,"bInfo");_fnMap(oSettings.oFeatures,oInit,"bProcessing");_fnMap(oSettings.oFeatures,oInit,"bAutoWidth");_fnMap(oSettings.oFeatures,oInit,"bSortClasses");_fnMap(oSettings.oFeatures,oInit,"bServerSide");_fnMap(oSettings.oFeatures,oInit,"bDeferRender");_fnMap(oSettings.oScroll,oInit,"sScrollX","sX");_fnMap(oSettings.oScroll,oInit,"sScrollXInner","sXInner");_fnMap(oSettings.oScroll,oInit,"sScrollY","sY");_fnMap(oSettings.oScroll,oInit,"bScrollCollapse","bCollapse");_fnMap(oSettings.oScroll,oInit,"bScrollInfinite","bInfinite");_fnMap(oSettings.oScroll,oInit,"iScrollLoadGap","iLoadGap");_fnMap(oSettings.oScroll,oInit,"bScrollAutoCss","bAutoCss");_fnMap(oSettings,oInit,"asStripeClasses");_fnMap(oSettings,oInit,"asStripClasses","asStripeClasses");_fnMap(oSettings,oInit,"fnServerData");_fnMap(oSettings,oInit,"fnFormatNumber");_fnMap(oSettings,oInit,"sServerMethod");_fnMap(oSettings,oInit,"aaSorting");_fnMap(oSettings,oInit,"aaSortingFixed");_fnMap(oSettings,oInit,"aLengthMenu");_fnMap(oSettings,oInit,"sPaginationType");_fnMap(oSettings,oInit,"sAjaxSource");_fnMap(oSettings,oInit,"sAjaxDataProp");_fnMap(oSettings,oInit,"iCookieDuration");_fnMap(oSettings,oInit,"sCookiePrefix");_fnMap(oSettings,oInit,"sDom");_fnMap(oSettings,oInit,"bSortCellsTop");_fnMap(oSettings,oInit,"iTabIndex");_fnMap(oSettings,oInit,"oSearch","oPreviousSearch");_fnMap(oSettings,oInit,"aoSearchCols","aoPreSearchCols");_fnMap(oSettings,oInit,"iDisplayLength","_iDisplayLength");_fnMap(oSettings,oInit,"bJQueryUI","bJUI");_fnMap(oSettings,oInit,"fnCookieCallback");_fnMap(oSettings,oInit,"fnStateLoad");_fnMap(oSettings,oInit,"fnStateSave");_fnMap(oSettings.oLanguage,oInit,"fnInfoCallback");_fnCallbackReg(oSettings,'aoDrawCallback',oInit.fnDrawCallback,'user');_fnCallbackReg(oSettings,'aoServerParams',oInit.fnServerParams,'user');_fnCallbackReg(oSettings,'aoStateSaveParams',oInit.fnStateSaveParams,'user');_fnCallbackReg(oSettings,'aoStateLoadParams',oInit.fnStateLoadParams,'user');_fnCallbackReg(oSettings,'aoStateLoaded',oInit.fnStateLoaded,'user');_fnCallbackReg(oSettings,'aoRowCallback',oInit.fnRowCallback,'user');_fnCallbackReg(oSettings,'aoRowCreatedCallback',oInit.fnCreatedRow,'user');_fnCallbackReg(oSettings,'aoHeaderCallback',oInit.fnHeaderCallback,'user');_fnCallbackReg(oSettings,'aoFooterCallback',oInit.fnFooterCallback,'user');_fnCallbackReg(oSettings,'aoInitComplete',oInit.fnInitComplete,'user');_fnCallbackReg(oSettings,'aoPreDrawCallback',oInit.fnPreDrawCallback,'user');if(oSettings.oFeatures.bServerSide&&oSettings.oFeatures.bSort&&oSettings.oFeatures.bSortClasses)
+{_fnCallbackReg(oSettings,'aoDrawCallback',_fnSortingClasses,'server_side_sort_classes');}
+else if(oSettings.oFeatures.bDeferRender)
+{_fnCallbackReg(oSettings,'aoDrawCallback',_fnSortingClasses,'defer_sort_classes');}
+if(oInit.bJQueryUI)
+{$.extend(oSettings.oClasses,DataTable.ext.oJUIClasses);if(oInit.sDom===DataTable.defaults.sDom&&DataTable.defaults.sDom==="lfrtip")
+{oSettings.sDom='<"H"lfr>t<"F"ip>';}}
+else
+{$.extend(oSettings.oClasses,DataTable.ext.oStdClasses);}
+$(this).addClass(oSettings.oClasses.sTable);if(oSettings.oScroll.sX!==""||oSettings.oScroll.sY!=="")
+{oSettings.oScroll.iBarWidth=_fnScrollBarWidth();}
+if(oSettings.iInitDisplayStart===undefined)
+{oSettings.iInitDisplayStart=oInit.iDisplayStart;oSettings._iDisplayStart=oInit.iDisplayStart;}
+if(oInit.bStateSave)
+{oSettings.oFeatures.bStateSave=true;_fnLoadState(oSettings,oInit);_fnCallbackReg(oSettings,'aoDrawCallback',_fnSaveState,'state_save');}
+if(oInit.iDeferLoading!==null)
+{oSettings.bDeferLoading=true;var tmp=$.isArray(oInit.iDeferLoading);oSettings._iRecordsDisplay=tmp?oInit.iDeferLoading[0]:oInit.iDeferLoading;oSettings._iRecordsTotal=tmp?oInit.iDeferLoading[1]:oInit.iDeferLoading;}
+if(oInit.aaData!==null)
+{bUsePassedData=true;}
+if(oInit.oLanguage.sUrl!=="")
+{oSettings.oLanguage.sUrl=oInit.oLanguage.sUrl;$.getJSON(oSettings.oLanguage.sUrl,null,function(json){_fnLanguageCompat(json);$.extend(true,oSettings.oLanguage,oInit.oLanguage,json);_fnInitialise(oSettings);});bInitHandedOff=true;}
+else
+{$.extend(true,oSettings.oLanguage,oInit.oLanguage);}
+if(oInit.asStripeClasses===null)
+{oSettings.asStripeClasses=[oSettings.oClasses.sStripeOdd,oSettings.oClasses.sStripeEven];}
+iLen=oSettings.asStripeClasses.length;oSettings.asDestroyStripes=[];if(iLen)
+{var bStripeRemove=false;var anRows=$(this).children('tbody').children('tr:lt('+iLen+')');for(i=0;i<iLen;i++)
+{if(anRows.hasClass(oSettings.asStripeClasses[i]))
+{bStripeRemove=true;oSettings.asDestroyStripes.push(oSettings.asStripeClasses[i]);}}
+if(bStripeRemove)
+{anRows.removeClass(oSettings.asStripeClasses.join(' '));}}
+var anThs=[];var aoColumnsInit;var nThead=this.getElementsByTagName('thead');if(nThead.length!==0)
+{_fnDetectHeader(oSettings.aoHeader,nThead[0]);anThs=_fnGetUniqueThs(oSettings);}
+if(oInit.aoColumns===null)
+{aoColumnsInit=[];for(i=0,iLen=anThs.length;i<iLen;i++)
+{aoColumnsInit.push(null);}}
+else
+{aoColumnsInit=oInit.aoColumns;}
+for(i=0,iLen=aoColumnsInit.length;i<iLen;i++)
+{if(oInit.saved_aoColumns!==undefined&&oInit.saved_aoColumns.length==iLen)
+{if(aoColumnsInit[i]===null)
+{aoColumnsInit[i]={};}
+aoColumnsInit[i].bVisible=oInit.saved_aoColumns[i].bVisible;}
+_fnAddColumn(oSettings,anThs?anThs[i]:null);}
+_fnApplyColumnDefs(oSettings,oInit.aoColumnDefs,aoColumnsInit,function(iCol,oDef){_fnColumnOptions(oSettings,iCol,oDef);});for(i=0,iLen=oSettings.aaSorting.length;i<iLen;i++)
+{if(oSettings.aaSorting[i][0]>=oSettings.aoColumns.length)
+{oSettings.aaSorting[i][0]=0;}
+var oColumn=oSettings.aoColumns[oSettings.aaSorting[i][0]];if(oSettings.aaSorting[i][2]===undefined)
+{oSettings.aaSorting[i][2]=0;}
+if(oInit.aaSorting===undefined&&oSettings.saved_aaSorting===undefined)
+{oSettings.aaSorting[i][1]=oColumn.asSorting[0];}
+for(j=0,jLen=oColumn.asSorting.length;j<jLen;j++)
+{if(oSettings.aaSorting[i][1]==oColumn.asSorting[j])
+{oSettings.aaSorting[i][2]=j;break;}}}
+_fnSortingClasses(oSettings);_fnBrowserDetect(oSettings);var captions=$(this).children('caption').each(function(){this._captionSide=$(this).css('caption-side');});var thead=$(this).children('thead');if(thead.length===0)
+{thead=[document.createElement('thead')];this.appendChild(thead[0]);}
+oSettings.nTHead=thead[0];var tbody=$(this).children('tbody');if(tbody.length===0)
+{tbody=[document.createElement('tbody')];this.appendChild(tbody[0]);}
+oSettings.nTBody=tbody[0];oSettings.nTBody.setAttribute("role","alert");oSettings.nTBody.setAttribute("aria-live","polite");oSettings.nTBody.setAttribute("aria-relevant","all");var tfoot=$(this).children('tfoot');if(tfoot.length===0&&captions.length>0&&(oSettings.oScroll.sX!==""||oSettings.oScroll.sY!==""))
+{tfoot=[document.createElement('tfoot')];this.appendChild(tfoot[0]);}
+if(tfoot.length>0)
+{oSettings.nTFoot=tfoot[0];_fnDetectHeader(oSettings.aoFooter,oSettings.nTFoot);}
+if(bUsePassedData)
+{for(i=0;i<oInit.aaData.length;i++)
+{_fnAddData(oSettings,oInit.aaData[i]);}}
+else
+{_fnGatherData(oSettings);}
+oSettings.aiDisplay=oSettings.aiDisplayMaster.slice();oSettings.bInitialised=true;if(bInitHandedOff===false)
+{_fnInitialise(oSettings);}});_that=null;return this;};DataTable.fnVersionCheck=function(sVersion)
+{var fnZPad=function(Zpad,count)
+{while(Zpad.length<count){Zpad+='0';}
+return Zpad;};var aThis=DataTable.ext.sVersion.split('.');var aThat=sVersion.split('.');var sThis='',sThat='';for(var i=0,iLen=aThat.length;i<iLen;i++)
+{sThis+=fnZPad(aThis[i],3);sThat+=fnZPad(aThat[i],3);}
+return parseInt(sThis,10)>=parseInt(sThat,10);};DataTable.fnIsDataTable=function(nTable)
+{var o=DataTable.settings;for(var i=0;i<o.length;i++)
+{if(o[i].nTable===nTable||o[i].nScrollHead===nTable||o[i].nScrollFoot===nTable)
+{return true;}}
+return false;};DataTable.fnTables=function(bVisible)
+{var out=[];jQuery.each(DataTable.settings,function(i,o){if(!bVisible||(bVisible===true&&$(o.nTable).is(':visible')))
+{out.push(o.nTable);}});return out;};DataTable.version="1.9.4";DataTable.settings=[];DataTable.models={};DataTable.models.ext={"afnFiltering":[],"afnSortData":[],"aoFeatures":[],"aTypes":[],"fnVersionCheck":DataTable.fnVersionCheck,"iApiIndex":0,"ofnSearch":{},"oApi":{},"oStdClasses":{},"oJUIClasses":{},"oPagination":{},"oSort":{},"sVersion":DataTable.version,"sErrMode":"alert","_oExternConfig":{"iNextUnique":0}};DataTable.models.oSearch={"bCaseInsensitive":true,"sSearch":"","bRegex":false,"bSmart":true};DataTable.models.oRow={"nTr":null,"_aData":[],"_aSortData":[],"_anHidden":[],"_sRowStripe":""};DataTable.models.oColumn={"aDataSort":null,"asSorting":null,"bSearchable":null,"bSortable":null,"bUseRendered":null,"bVisible":null,"_bAutoType":true,"fnCreatedCell":null,"fnGetData":null,"fnRender":null,"fnSetData":null,"mData":null,"mRender":null,"nTh":null,"nTf":null,"sClass":null,"sContentPadding":null,"sDefaultContent":null,"sName":null,"sSortDataType":'std',"sSortingClass":null,"sSortingClassJUI":null,"sTitle":null,"sType":null,"sWidth":null,"sWidthOrig":null};DataTable.defaults={"aaData":null,"aaSorting":[[0,'asc']],"aaSortingFixed":null,"aLengthMenu":[10,25,50,100],"aoColumns":null,"aoColumnDefs":null,"aoSearchCols":[],"asStripeClasses":null,"bAutoWidth":true,"bDeferRender":false,"bDestroy":false,"bFilter":true,"bInfo":true,"bJQueryUI":false,"bLengthChange":true,"bPaginate":true,"bProcessing":false,"bRetrieve":false,"bScrollAutoCss":true,"bScrollCollapse":false,"bScrollInfinite":false,"bServerSide":false,"bSort":true,"bSortCellsTop":false,"bSortClasses":true,"bStateSave":false,"fnCookieCallback":null,"fnCreatedRow":null,"fnDrawCallback":null,"fnFooterCallback":null,"fnFormatNumber":function(iIn){if(iIn<1000)
+{return iIn;}
+var s=(iIn+""),a=s.split(""),out="",iLen=s.length;for(var i=0;i<iLen;i++)
+{if(i%3===0&&i!==0)
+{out=this.oLanguage.sInfoThousands+out;}
+out=a[iLen-i-1]+out;}
+return out;},"fnHeaderCallback":null,"fnInfoCallback":null,"fnInitComplete":null,"fnPreDrawCallback":null,"fnRowCallback":null,"fnServerData":function(sUrl,aoData,fnCallback,oSettings){oSettings.jqXHR=$.ajax({"url":sUrl,"data":aoData,"success":function(json){if(json.sError){oSettings.oApi._fnLog(oSettings,0,json.sError);}
+$(oSettings.oInstance).trigger('xhr',[oSettings,json]);fnCallback(json);},"dataType":"json","cache":false,"type":oSettings.sServerMethod,"error":function(xhr,error,thrown){if(error=="parsererror"){oSettings.oApi._fnLog(oSettings,0,"DataTables warning: JSON data from "+"server could not be parsed. This is caused by a JSON formatting error.");}}});},"fnServerParams":null,"fnStateLoad":function(oSettings){var sData=this.oApi._fnReadCookie(oSettings.sCookiePrefix+oSettings.sInstance);var oData;try{oData=(typeof $.parseJSON==='function')?$.parseJSON(sData):eval('('+sData+')');}catch(e){oData=null;}
+return oData;},"fnStateLoadParams":null,"fnStateLoaded":null,"fnStateSave":function(oSettings,oData){this.oApi._fnCreateCookie(oSettings.sCookiePrefix+oSettings.sInstance,this.oApi._fnJsonString(oData),oSettings.iCookieDuration,oSettings.sCookiePrefix,oSettings.fnCookieCallback);},"fnStateSaveParams":null,"iCookieDuration":7200,"iDeferLoading":null,"iDisplayLength":10,"iDisplayStart":0,"iScrollLoadGap":100,"iTabIndex":0,"oLanguage":{"oAria":{"sSortAscending":": activate to sort column ascending","sSortDescending":": activate to sort column descending"},"oPaginate":{"sFirst":"First","sLast":"Last","sNext":"Next","sPrevious":"Previous"},"sEmptyTable":"No data available in table","sInfo":"Showing _START_ to _END_ of _TOTAL_ entries","sInfoEmpty":"Showing 0 to 0 of 0 entries","sInfoFiltered":"(filtered from _MAX_ total entries)","sInfoPostFix":"","sInfoThousands":",","sLengthMenu":"Show _MENU_ entries","sLoadingRecords":"Loading...","sProcessing":"Processing...","sSearch":"Search:","sUrl":"","sZeroRecords":"No matching records found"},"oSearch":$.extend({},DataTable.models.oSearch),"sAjaxDataProp":"aaData","sAjaxSource":null,"sCookiePrefix":"SpryMedia_DataTables_","sDom":"lfrtip","sPaginationType":"two_button","sScrollX":"","sScrollXInner":"","sScrollY":"","sServerMethod":"GET"};DataTable.defaults.columns={"aDataSort":null,"asSorting":['asc','desc'],"bSearchable":true,"bSortable":true,"bUseRendered":true,"bVisible":true,"fnCreatedCell":null,"fnRender":null,"iDataSort":-1,"mData":null,"mRender":null,"sCellType":"td","sClass":"","sContentPadding":"","sDefaultContent":null,"sName":"","sSortDataType":"std","sTitle":null,"sType":null,"sWidth":null};DataTable.models.oSettings={"oFeatures":{"bAutoWidth":null,"bDeferRender":null,"bFilter":null,"bInfo":null,"bLengthChange":null,"bPaginate":null,"bProcessing":null,"bServerSide":null,"bSort":null,"bSortClasses":null,"bStateSave":null},"oScroll":{"bAutoCss":null,"bCollapse":null,"bInfinite":null,"iBarWidth":0,"iLoadGap":null,"sX":null,"sXInner":null,"sY":null},"oLanguage":{"fnInfoCallback":null},"oBrowser":{"bScrollOversize":false},"aanFeatures":[],"aoData":[],"aiDisplay":[],"aiDisplayMaster":[],"aoColumns":[],"aoHeader":[],"aoFooter":[],"asDataSearch":[],"oPreviousSearch":{},"aoPreSearchCols":[],"aaSorting":null,"aaSortingFixed":null,"asStripeClasses":null,"asDestroyStripes":[],"sDestroyWidth":0,"aoRowCallback":[],"aoHeaderCallback":[],"aoFooterCallback":[],"aoDrawCallback":[],"aoRowCreatedCallback":[],"aoPreDrawCallback":[],"aoInitComplete":[],"aoStateSaveParams":[],"aoStateLoadParams":[],"aoStateLoaded":[],"sTableId":"","nTable":null,"nTHead":null,"nTFoot":null,"nTBody":null,"nTableWrapper":null,"bDeferLoading":false,"bInitialised":false,"aoOpenRows":[],"sDom":null,"sPaginationType":"two_button","iCookieDuration":0,"sCookiePrefix":"","fnCookieCallback":null,"aoStateSave":[],"aoStateLoad":[],"oLoadedState":null,"sAjaxSource":null,"sAjaxDataProp":null,"bAjaxDataGet":true,"jqXHR":null,"fnServerData":null,"aoServerParams":[],"sServerMethod":null,"fnFormatNumber":null,"aLengthMenu":null,"iDraw":0,"bDrawing":false,"iDrawError":-1,"_iDisplayLength":10,"_iDisplayStart":0,"_iDisplayEnd":10,"_iRecordsTotal":0,"_iRecordsDisplay":0,"bJUI":null,"oClasses":{},"bFiltered":false,"bSorted":false,"bSortCellsTop":null,"oInit":null,"aoDestroyCallback":[],"fnRecordsTotal":function()
+{if(this.oFeatures.bServerSide){return parseInt(this._iRecordsTotal,10);}else{return this.aiDisplayMaster.length;}},"fnRecordsDisplay":function()
+{if(this.oFeatures.bServerSide){return parseInt(this._iRecordsDisplay,10);}else{return this.aiDisplay.length;}},"fnDisplayEnd":function()
+{if(this.oFeatures.bServerSide){if(this.oFeatures.bPaginate===false||this._iDisplayLength==-1){return this._iDisplayStart+this.aiDisplay.length;}else{return Math.min(this._iDisplayStart+this._iDisplayLength,this._iRecordsDisplay);}}else{return this._iDisplayEnd;}},"oInstance":null,"sInstance":null,"iTabIndex":0,"nScrollHead":null,"nScrollFoot":null};DataTable.ext=$.extend(true,{},DataTable.models.ext);$.extend(DataTable.ext.oStdClasses,{"sTable":"dataTable","sPagePrevEnabled":"paginate_enabled_previous","sPagePrevDisabled":"paginate_disabled_previous","sPageNextEnabled":"paginate_enabled_next","sPageNextDisabled":"paginate_disabled_next","sPageJUINext":"","sPageJUIPrev":"","sPageButton":"paginate_button","sPageButtonActive":"paginate_active","sPageButtonStaticDisabled":"paginate_button paginate_button_disabled","sPageFirst":"first","sPagePrevious":"previous","sPageNext":"next","sPageLast":"last","sStripeOdd":"odd","sStripeEven":"even","sRowEmpty":"dataTables_empty","sWrapper":"dataTables_wrapper","sFilter":"dataTables_filter","sInfo":"dataTables_info","sPaging":"dataTables_paginate paging_","sLength":"dataTables_length","sProcessing":"dataTables_processing","sSortAsc":"sorting_asc","sSortDesc":"sorting_desc","sSortable":"sorting","sSortableAsc":"sorting_asc_disabled","sSortableDesc":"sorting_desc_disabled","sSortableNone":"sorting_disabled","sSortColumn":"sorting_","sSortJUIAsc":"","sSortJUIDesc":"","sSortJUI":"","sSortJUIAscAllowed":"","sSortJUIDescAllowed":"","sSortJUIWrapper":"","sSortIcon":"","sScrollWrapper":"dataTables_scroll","sScrollHead":"dataTables_scrollHead","sScrollHeadInner":"dataTables_scrollHeadInner","sScrollBody":"dataTables_scrollBody","sScrollFoot":"dataTables_scrollFoot","sScrollFootInner":"dataTables_scrollFootInner","sFooterTH":"","sJUIHeader":"","sJUIFooter":""});$.extend(DataTable.ext.oJUIClasses,DataTable.ext.oStdClasses,{"sPagePrevEnabled":"fg-button ui-button ui-state-default ui-corner-left","sPagePrevDisabled":"fg-button ui-button ui-state-default ui-corner-left ui-state-disabled","sPageNextEnabled":"fg-button ui-button ui-state-default ui-corner-right","sPageNextDisabled":"fg-button ui-button ui-state-default ui-corner-right ui-state-disabled","sPageJUINext":"ui-icon ui-icon-circle-arrow-e","sPageJUIPrev":"ui-icon ui-icon-circle-arrow-w","sPageButton":"fg-button ui-button ui-state-default","sPageButtonActive":"fg-button ui-button ui-state-default ui-state-disabled","sPageButtonStaticDisabled":"fg-button ui-button ui-state-default ui-state-disabled","sPageFirst":"first ui-corner-tl ui-corner-bl","sPageLast":"last ui-corner-tr ui-corner-br","sPaging":"dataTables_paginate fg-buttonset ui-buttonset fg-buttonset-multi "+"ui-buttonset-multi paging_","sSortAsc":"ui-state-default","sSortDesc":"ui-state-default","sSortable":"ui-state-default","sSortableAsc":"ui-state-default","sSortableDesc":"ui-state-default","sSortableNone":"ui-state-default","sSortJUIAsc":"css_right ui-icon ui-icon-triangle-1-n","sSortJUIDesc":"css_right ui-icon ui-icon-triangle-1-s","sSortJUI":"css_right ui-icon ui-icon-carat-2-n-s","sSortJUIAscAllowed":"css_right ui-icon ui-icon-carat-1-n","sSortJUIDescAllowed":"css_right ui-icon ui-icon-carat-1-s","sSortJUIWrapper":"DataTables_sort_wrapper","sSortIcon":"DataTables_sort_icon","sScrollHead":"dataTables_scrollHead ui-state-default","sScrollFoot":"dataTables_scrollFoot ui-state-default","sFooterTH":"ui-state-default","sJUIHeader":"fg-toolbar ui-toolbar ui-widget-header ui-corner-tl ui-corner-tr ui-helper-clearfix","sJUIFooter":"fg-toolbar ui-toolbar ui-widget-header ui-corner-bl ui-corner-br ui-helper-clearfix"});$.extend(DataTable.ext.oPagination,{"two_button":{"fnInit":function(oSettings,nPaging,fnCallbackDraw)
+{var oLang=oSettings.oLanguage.oPaginate;var oClasses=oSettings.oClasses;var fnClickHandler=function(e){if(oSettings.oApi._fnPageChange(oSettings,e.data.action))
+{fnCallbackDraw(oSettings);}};var sAppend=(!oSettings.bJUI)?'<a class="'+oSettings.oClasses.sPagePrevDisabled+'" tabindex="'+oSettings.iTabIndex+'" role="button">'+oLang.sPrevious+'</a>'+'<a class="'+oSettings.oClasses.sPageNextDisabled+'" tabindex="'+oSettings.iTabIndex+'" role="button">'+oLang.sNext+'</a>':'<a class="'+oSettings.oClasses.sPagePrevDisabled+'" tabindex="'+oSettings.iTabIndex+'" role="button"><span class="'+oSettings.oClasses.sPageJUIPrev+'"></span></a>'+'<a class="'+oSettings.oClasses.sPageNextDisabled+'" tabindex="'+oSettings.iTabIndex+'" role="button"><span class="'+oSettings.oClasses.sPageJUINext+'"></span></a>';$(nPaging).append(sAppend);var els=$('a',nPaging);var nPrevious=els[0],nNext=els[1];oSettings.oApi._fnBindAction(nPrevious,{action:"previous"},fnClickHandler);oSettings.oApi._fnBindAction(nNext,{action:"next"},fnClickHandler);if(!oSettings.aanFeatures.p)
+{nPaging.id=oSettings.sTableId+'_paginate';nPrevious.id=oSettings.sTableId+'_previous';nNext.id=oSettings.sTableId+'_next';nPrevious.setAttribute('aria-controls',oSettings.sTableId);nNext.setAttribute('aria-controls',oSettings.sTableId);}},"fnUpdate":function(oSettings,fnCallbackDraw)
+{if(!oSettings.aanFeatures.p)
+{return;}
+var oClasses=oSettings.oClasses;var an=oSettings.aanFeatures.p;var nNode;for(var i=0,iLen=an.length;i<iLen;i++)
+{nNode=an[i].firstChild;if(nNode)
+{nNode.className=(oSettings._iDisplayStart===0)?oClasses.sPagePrevDisabled:oClasses.sPagePrevEnabled;nNode=nNode.nextSibling;nNode.className=(oSettings.fnDisplayEnd()==oSettings.fnRecordsDisplay())?oClasses.sPageNextDisabled:oClasses.sPageNextEnabled;}}}},"iFullNumbersShowPages":5,"full_numbers":{"fnInit":function(oSettings,nPaging,fnCallbackDraw)
+{var oLang=oSettings.oLanguage.oPaginate;var oClasses=oSettings.oClasses;var fnClickHandler=function(e){if(oSettings.oApi._fnPageChange(oSettings,e.data.action))
+{fnCallbackDraw(oSettings);}};$(nPaging).append('<a  tabindex="'+oSettings.iTabIndex+'" class="'+oClasses.sPageButton+" "+oClasses.sPageFirst+'">'+oLang.sFirst+'</a>'+'<a  tabindex="'+oSettings.iTabIndex+'" class="'+oClasses.sPageButton+" "+oClasses.sPagePrevious+'">'+oLang.sPrevious+'</a>'+'<span></span>'+'<a tabindex="'+oSettings.iTabIndex+'" class="'+oClasses.sPageButton+" "+oClasses.sPageNext+'">'+oLang.sNext+'</a>'+'<a tabindex="'+oSettings.iTabIndex+'" class="'+oClasses.sPageButton+" "+oClasses.sPageLast+'">'+oLang.sLast+'</a>');var els=$('a',nPaging);var nFirst=els[0],nPrev=els[1],nNext=els[2],nLast=els[3];oSettings.oApi._fnBindAction(nFirst,{action:"first"},fnClickHandler);oSettings.oApi._fnBindAction(nPrev,{action:"previous"},fnClickHandler);oSettings.oApi._fnBindAction(nNext,{action:"next"},fnClickHandler);oSettings.oApi._fnBindAction(nLast,{action:"last"},fnClickHandler);if(!oSettings.aanFeatures.p)
+{nPaging.id=oSettings.sTableId+'_paginate';nFirst.id=oSettings.sTableId+'_first';nPrev.id=oSettings.sTableId+'_previous';nNext.id=oSettings.sTableId+'_next';nLast.id=oSettings.sTableId+'_last';}},"fnUpdate":function(oSettings,fnCallbackDraw)
+{if(!oSettings.aanFeatures.p)
+{return;}
+var iPageCount=DataTable.ext.oPagination.iFullNumbersShowPages;var iPageCountHalf=Math.floor(iPageCount/2);var iPages=Math.ceil((oSettings.fnRecordsDisplay())/oSettings._iDisplayLength);var iCurrentPage=Math.ceil(oSettings._iDisplayStart/oSettings._iDisplayLength)+1;var sList="";var iStartButton,iEndButton,i,iLen;var oClasses=oSettings.oClasses;var anButtons,anStatic,nPaginateList,nNode;var an=oSettings.aanFeatures.p;var fnBind=function(j){oSettings.oApi._fnBindAction(this,{"page":j+iStartButton-1},function(e){oSettings.oApi._fnPageChange(oSettings,e.data.page);fnCallbackDraw(oSettings);e.preventDefault();});};if(oSettings._iDisplayLength===-1)
+{iStartButton=1;iEndButton=1;iCurrentPage=1;}
+else if(iPages<iPageCount)
+{iStartButton=1;iEndButton=iPages;}
+else if(iCurrentPage<=iPageCountHalf)
+{iStartButton=1;iEndButton=iPageCount;}
+else if(iCurrentPage>=(iPages-iPageCountHalf))
+{iStartButton=iPages-iPageCount+1;iEndButton=iPages;}
+else
+{iStartButton=iCurrentPage-Math.ceil(iPageCount/2)+1;iEndButton=iStartButton+iPageCount-1;}
+for(i=iStartButton;i<=iEndButton;i++)
+{sList+=(iCurrentPage!==i)?'<a tabindex="'+oSettings.iTabIndex+'" class="'+oClasses.sPageButton+'">'+oSettings.fnFormatNumber(i)+'</a>':'<a tabindex="'+oSettings.iTabIndex+'" class="'+oClasses.sPageButtonActive+'">'+oSettings.fnFormatNumber(i)+'</a>';}
+for(i=0,iLen=an.length;i<iLen;i++)
+{nNode=an[i];if(!nNode.hasChildNodes())
+{continue;}
+$('span:eq(0)',nNode).html(sList).children('a').each(fnBind);anButtons=nNode.getElementsByTagName('a');anStatic=[anButtons[0],anButtons[1],anButtons[anButtons.length-2],anButtons[anButtons.length-1]];$(anStatic).removeClass(oClasses.sPageButton+" "+oClasses.sPageButtonActive+" "+oClasses.sPageButtonStaticDisabled);$([anStatic[0],anStatic[1]]).addClass((iCurrentPage==1)?oClasses.sPageButtonStaticDisabled:oClasses.sPageButton);$([anStatic[2],anStatic[3]]).addClass((iPages===0||iCurrentPage===iPages||oSettings._iDisplayLength===-1)?oClasses.sPageButtonStaticDisabled:oClasses.sPageButton);}}}});$.extend(DataTable.ext.oSort,{"string-pre":function(a)
+{if(typeof a!='string'){a=(a!==null&&a.toString)?a.toString():'';}
+return a.toLowerCase();},"string-asc":function(x,y)
+{return((x<y)?-1:((x>y)?1:0));},"string-desc":function(x,y)
+{return((x<y)?1:((x>y)?-1:0));},"html-pre":function(a)
+{return a.replace(/<.*?>/g,"").toLowerCase();},"html-asc":function(x,y)
+{return((x<y)?-1:((x>y)?1:0));},"html-desc":function(x,y)
+{return((x<y)?1:((x>y)?-1:0));},"date-pre":function(a)
+{var x=Date.parse(a);if(isNaN(x)||x==="")
+{x=Date.parse("01/01/1970 00:00:00");}
+return x;},"date-asc":function(x,y)
+{return x-y;},"date-desc":function(x,y)
+{return y-x;},"numeric-pre":function(a)
+{return(a=="-"||a==="")?0:a*1;},"numeric-asc":function(x,y)
+{return x-y;},"numeric-desc":function(x,y)
+{return y-x;}});$.extend(DataTable.ext.aTypes,[function(sData)
+{if(typeof sData==='number')
+{return'numeric';}
+else if(typeof sData!=='string')
+{return null;}
+var sValidFirstChars="0123456789-";var sValidChars="0123456789.";var Char;var bDecimal=false;Char=sData.charAt(0);if(sValidFirstChars.indexOf(Char)==-1)
+{return null;}
+for(var i=1;i<sData.length;i++)
+{Char=sData.charAt(i);if(sValidChars.indexOf(Char)==-1)
+{return null;}
+if(Char==".")
+{if(bDecimal)
+{return null;}
+bDecimal=true;}}
+return'numeric';},function(sData)
+{var iParse=Date.parse(sData);if((iParse!==null&&!isNaN(iParse))||(typeof sData==='string'&&sData.length===0))
+{return'date';}
+return null;},function(sData)
+{if(typeof sData==='string'&&sData.indexOf('<')!=-1&&sData.indexOf('>')!=-1)
+{return'html';}
+return null;}]);$.fn.DataTable=DataTable;$.fn.dataTable=DataTable;$.fn.dataTableSettings=DataTable.settings;$.fn.dataTableExt=DataTable.ext;}));}(window,document));jQuery.fn.dataTableExt.oApi.fnSetFilteringDelay=function(oSettings,iDelay){var
+_that=this,iDelay=(typeof iDelay=='undefined')?250:iDelay;this.each(function(i){$.fn.dataTableExt.iApiIndex=i;var
+$this=this,oTimerId=null,sPreviousSearch=null,anControl=$('input',_that.fnSettings().aanFeatures.f);anControl.unbind('keyup').bind('keyup',function(){var $$this=$this;if(sPreviousSearch===null||sPreviousSearch!=anControl.val()){window.clearTimeout(oTimerId);sPreviousSearch=anControl.val();oTimerId=window.setTimeout(function(){$.fn.dataTableExt.iApiIndex=i;_that.fnFilter(anControl.val());},iDelay);}});return this;});return this;}
+jQuery.fn.dataTableExt.oSort['formatted-num-asc']=function(a,b){var x=a.match(/\d/)?a.replace(/[^\d\-\.]/g,""):0;var y=b.match(/\d/)?b.replace(/[^\d\-\.]/g,""):0;return parseFloat(x)-parseFloat(y);};jQuery.fn.dataTableExt.oSort['formatted-num-desc']=function(a,b){var x=a.match(/\d/)?a.replace(/[^\d\-\.]/g,""):0;var y=b.match(/\d/)?b.replace(/[^\d\-\.]/g,""):0;return parseFloat(y)-parseFloat(x);};$.fn.dataTableExt.oApi.fnReloadAjax=function(oSettings,sNewSource){if(sNewSource!='undefined'&&sNewSource!=null){oSettings.sAjaxSource=sNewSource;}
+this.oApi._fnProcessingDisplay(oSettings,true);var that=this;oSettings.fnServerData(oSettings.sAjaxSource,[],function(json){that.oApi._fnClearTable(oSettings);that.fnDraw();that.oApi._fnProcessingDisplay(oSettings,false);},oSettings);}
+(function(){var bulk_action_controls;var selected;var aHiddenFieldsID=[];var aoColumns=[];var aoTableConfig=[];var cache=[];var fnAjaxCallback=[];var oDataTable=[];var oGroupColumns=[];var selectedRows=[];var selectionMode=[];var tableId=[];var textDisplay=[];var totalRecords=[];var appendUrlQuery=function(url,extension,query){var parts=url.split('?'),q='';var newurl=parts[0]+'.'+extension;if(parts.length>1){if(query){q='&'+query;}
+return(newurl+'?'+parts[1]+q);}else{if(query){q='?'+query;}
+return(newurl+q);}}
+var formatRequest=function(representation,tableid,url){var t=tableIdReverse('#'+tableid);var dt=oDataTable[t];var oSetting=dt.dataTableSettings[t];if(oSetting){var argData='id='+tableid;var serverFilterArgs=$('#'+tableid+'_dataTable_filter');if(serverFilterArgs.val()!==''){argData+='&sFilter='+serverFilterArgs.val();}
+argData+='&sSearch='+oSetting.oPreviousSearch['sSearch'];aoColumns=oSetting.aoColumns;var i,len;for(i=0,len=aoColumns.length;i<len;i++){if(!aoColumns[i].bSortable){argData+='&bSortable_'+i+'=false';}}
+var aaSort=(oSetting.aaSortingFixed!==null)?oSetting.aaSortingFixed.concat(oSetting.aaSorting):oSetting.aaSorting.slice();argData+='&iSortingCols='+aaSort.length;for(i=0,len=aaSort.length;i<len;i++){argData+='&iSortCol_'+i+'='+aaSort[i][0];argData+='&sSortDir_'+i+'='+aaSort[i][1];}
+url=appendUrlQuery(url,representation,argData);}else{url=appendUrlQuery(url,representation,'');}
+window.open(url);}
+S3.dataTables.formatRequest=formatRequest;var getElementClass=function(tagObj,prefix){var pLen=prefix.length;var classList=tagObj.attr('class').split(/\s+/);var className='';$.each(classList,function(index,item){if(item.substr(0,pLen)==prefix){className=item;return;}});return className;}
+var hideSubRows=function(groupid){var sublevel=$('.sublevel'+groupid.substr(6));sublevel.each(function(){obj=$(this);if(obj.hasClass('group')&&obj.is(':visible')){var objGroupid=getElementClass(obj,'group_');hideSubRows(objGroupid);}});sublevel.hide();$('.arrow_e'+groupid).show();$('.arrow_s'+groupid).hide();$('.ui-icon-triangle-1-e').show();$('.ui-icon-triangle-1-s').hide();$('.'+groupid).removeClass('activeRow');}
+var showSubRows=function(groupid){var sublevel='.sublevel'+groupid.substr(6);$(sublevel).show();$('.arrow_e'+groupid).hide();$('.arrow_s'+groupid).show();$('#'+groupid+'_closed').hide();$('#'+groupid+'_open').show();$('.'+groupid).addClass('activeRow');$(sublevel+'.spacer').show();var firstObj=$(sublevel+':first');if(firstObj.hasClass('spacer')){firstObj=firstObj.next();}
+if(firstObj.hasClass('collapsable')){var groupLevel=getElementClass(firstObj,'group_');if(groupLevel){showSubRows(groupLevel);}}}
+var tableIdReverse=function(id){var tableCnt=S3.dataTables.id.length;for(var t=0;t<tableCnt;t++){if(tableId[t]==id){return t;}}
+return-1;}
+var toggleDiv=function(divId){$('#display'+divId).toggle();$('#full'+divId).toggle();}
+S3.dataTables.toggleDiv=toggleDiv;var toggleRow=function(groupid){var _sublevel='.sublevel'+groupid.substr(6);var sublevel=$(_sublevel);if(sublevel.is(':visible')){hideSubRows(groupid);sublevel.hide();$('#'+groupid+'_closed').show();$('#'+groupid+'_open').hide();$('#'+groupid+'_in').show();$('#'+groupid+'_out').hide();$(_sublevel+'.spacer').show();}else{sublevel.show();$('#'+groupid+'_closed').hide();$('#'+groupid+'_open').show();$('#'+groupid+'_in').hide();$('#'+groupid+'_out').show();}}
+S3.dataTables.toggleRow=toggleRow;var thisAccordionRow=function(t,obj){var level='';var groupid='';var classList=$(obj).attr('class').split(/\s+/);$.each(classList,function(index,rootClass){if(rootClass.substr(0,6)=='level_'){level=rootClass;}
+if(rootClass.substr(0,6)=='group_'){groupid=rootClass;}});accordionRow(t,level,groupid);}
+var accordionRow=function(t,level,groupid){var lvlOpened=level.substr(6);var theTableObj=$(tableId[t]);var groupLevel=getElementClass(theTableObj,'level_');var classList=theTableObj.attr('class').split(/\s+/);var activeRow,rowClass;$.each(classList,function(index,groupLevel){if(groupLevel.substr(0,6)=='level_'){var lvlNo=groupLevel.substr(6);if(lvlNo>=lvlOpened){activeRow=$('.activeRow.'+groupLevel);$.each(activeRow,function(index,itemClass){rowClass=getElementClass($(itemClass),'group_');hideSubRows(rowClass);});}}});showSubRows(groupid);$('.spacer.alwaysOpen').show();var sublevel;$.each($('.activeRow'),function(index,itemClass){rowClass=getElementClass($(itemClass),'group_');sublevel='.sublevel'+rowClass.substr(6);$(sublevel+'.spacer').show();});}
+S3.dataTables.accordionRow=accordionRow;var isNonDefaultData=function(element,index,array){var name=element.name;var value=element.value;if((name=='sSearch'&&value==='')||(name.startsWith('sSearch_')&&value==='')||(name.startsWith('bRegex_')&&!value)||(name.startsWith('bSearchable_')&&value)||(name.startsWith('bSortable_')&&value)){return false;}
+if(name.startsWith('mDataProp_')){var n=parseInt(name.substr('mDataProp_'.length),10);if(!isNaN(n)&&typeof value=='number'&&n==value){return false;}}
+return true;}
+var togglePairActions=function(t){var s=selectedRows[t].length;if(selectionMode[t]=='Exclusive'){s=totalRecords[t]-s;}
+if(s==2){$(tableId[t]+' .pair-action').removeClass('hide');}else{$(tableId[t]+' .pair-action').addClass('hide');}}
+var inList=function(id,list){for(var cnt=0,lLen=list.length;cnt<lLen;cnt++){if(id==list[cnt]){return cnt;}}
+return-1;}
+var bindButtons=function(t,tableConfig,fnActionCallBacks){if(tableConfig['rowActions'].length>0){for(var i=0;i<fnActionCallBacks.length;i++){var currentID='#'+fnActionCallBacks[i][0];$(currentID).unbind('click').bind('click',fnActionCallBacks[i][1]);}}
+if(tableConfig['bulkActions']){$('.bulkcheckbox').unbind('change').change(function(event){var id=this.id.substr(6);var posn=inList(id,selectedRows[t]);if(posn==-1){selectedRows[t].push(id);posn=0;}else{selectedRows[t].splice(posn,1);posn=-1;}
+var row=$(this).parent().parent();togglePairActions(t);setSelectionClass(t,row,posn);});}}
+var setSelectionClass=function(t,row,index){if(selectionMode[t]=='Inclusive'){$('#totalSelected').text(selected.length);if(index==-1){$(row).removeClass('row_selected');$('.bulkcheckbox',row).prop('checked',false);}else{$(row).addClass('row_selected');$('.bulkcheckbox',row).prop('checked',true);}}
+if(selectionMode[t]=='Exclusive'){$('#totalSelected').text(parseInt($('#totalAvailable').text(),10)-selected.length);if(index==-1){$(row).addClass('row_selected');$('.bulkcheckbox',row).prop('checked',true);}else{$(row).removeClass('row_selected');$('.bulkcheckbox',row).prop('checked',false);}}
+if(aoTableConfig[t]['bulkActions']){$(aHiddenFieldsID[t][0]).val(selectionMode[t]);$(aHiddenFieldsID[t][1]).val(selectedRows[t].join(','));$('.dataTable-action').remove();$(bulk_action_controls).insertBefore('#bulk_select_options');togglePairActions(t);};}
+var addNewGroup=function(t,sGroup,level,sublevel,iColspan,groupTotals,groupPrefix,groupTitle,addIcons,iconGroupType,insertSpace,shrink,accordion,groupCnt,row,before){var levelClass='level_'+level;var groupClass='group_'+t+level+groupCnt;var levelDisplay='';for(var lvl=1;lvl<level;lvl++){levelDisplay+="<div style='float:left;width:10px;'>&nbsp;</div>";}
+if(level>1){levelDisplay+='<div id="'+groupClass+'_closed" class="ui-icon ui-icon-triangle-1-e" style="float:left;"></div>';levelDisplay+='<div id="'+groupClass+'_open" class="ui-icon ui-icon-triangle-1-s" style="float:left;display:none;"></div>';}
+var groupCount='';if(groupTotals[sGroup]!=null){groupCount=' ('+groupTotals[sGroup]+')';}else{var index=groupPrefix+sGroup;if(groupTotals[index]!=null){groupCount=' ('+groupTotals[index]+')';}}
+var nGroup=document.createElement('tr');nGroup.className='group';if(shrink||accordion){$(nGroup).addClass('headerRow').addClass(groupClass).addClass(levelClass);if(sublevel){$(nGroup).addClass(sublevel).addClass('collapsable');}}
+if(addIcons){$(nGroup).addClass('expandable');var iconClassOpen='';var iconClassClose='';var iconTextOpen='';var iconTextClose='';var iconin;var iconout;if(iconGroupType=='text'){iconTextOpen='→';iconTextClose='↓';}
+if(shrink){if(iconGroupType=='icon'){iconClassOpen='class="ui-icon ui-icon-arrowthick-1-e" ';iconClassClose='class="ui-icon ui-icon-arrowthick-1-s" ';}
+iconin='<a id="'+groupClass+'_in" href="javascript:S3.dataTables.toggleRow(\''+groupClass+'\');" '+iconClassOpen+' style="float:right">'+iconTextOpen+'</a>';iconout='<a id="'+groupClass+'_out" href="javascript:S3.dataTables.toggleRow(\''+groupClass+'\');" '+iconClassClose+' style="float:right; display:none">'+iconTextClose+'</a>';}else{if(iconGroupType=='icon'){iconClassOpen='class="ui-icon ui-icon-arrowthick-1-e arrow_e'+groupClass+'" ';iconClassClose='class="ui-icon ui-icon-arrowthick-1-s arrow_s'+groupClass+'" ';}else{iconClassOpen='class="arrow_e'+groupClass+'" ';iconClassClose='class="arrow_s'+groupClass+'" ';}
+iconin='<a href="javascript:S3.dataTables.accordionRow(\''+t+'\', \''+levelClass+'\', \''+groupClass+'\');" '+iconClassOpen+' style="float:right">'+iconTextOpen+'</a>';iconout='<a href="javascript:S3.dataTables.accordionRow(\''+t+'\', \''+levelClass+'\', \''+groupClass+'\');" '+iconClassClose+' style="float:right; display:none">'+iconTextClose+'</a>';}
+var htmlText=groupTitle+groupCount+iconin+iconout;}else{var htmlText=groupTitle+groupCount;}
+var nCell=document.createElement('td');nCell.colSpan=iColspan;nCell.innerHTML=levelDisplay+htmlText;nGroup.appendChild(nCell);if(before){$(nGroup).insertBefore(row);}else{$(nGroup).insertAfter(row);}
+if(insertSpace){var nSpace=document.createElement('tr');var _nSpace=$(nSpace);_nSpace.addClass('spacer');if(sublevel){_nSpace.addClass(sublevel).addClass('collapsable');}else{_nSpace.addClass('alwaysOpen');}
+nCell=document.createElement('td');nCell.colSpan=iColspan;nSpace.appendChild(nCell);_nSpace.insertAfter(nGroup);}}
+var buildGroups=function(oSettings,id,t,group,groupTotals,prefixID,groupTitles,level){var tableConfig=aoTableConfig[t];if(tableConfig['shrinkGroupedRows']=='individual'){var shrink=true;var accordion=false;}else if(tableConfig['shrinkGroupedRows']=='accordion'){var shrink=false;var accordion=true;}else{var shrink=false;var accordion=false;}
+var insertSpace=tableConfig['groupSpacing'];var iconGroupTypeList=tableConfig['groupIcon'];if(iconGroupTypeList.length>=level){var iconGroupType=iconGroupTypeList[level-1];}else{var iconGroupType='icon';}
+var nTrs=$(id+' tbody tr');var iColspan=$(id+' thead tr')[0].getElementsByTagName('th').length;var sLastGroup='';var groupPrefix='';var groupCnt=1;var groupTitleCnt=0;var dataCnt=0;var sublevel='';var levelClass='level_'+level;var title;$(id).addClass(levelClass);for(var i=0;i<nTrs.length;i++){var row=$(nTrs[i]);if(row.hasClass('spacer')){continue;}
+if(row.hasClass('group')){var item=getElementClass($(nTrs[i]),'group_');sublevel='sublevel'+item.substr(6);sLastGroup='';groupPrefix='';for(var gpCnt=0;gpCnt<prefixID.length;gpCnt++){try{groupPrefix+=oSettings.aoData[oSettings.aiDisplay[dataCnt]]._aData[prefixID[gpCnt]]+'_';}catch(err){}}
+continue;}
+var sGroup=oSettings.aoData[oSettings.aiDisplay[dataCnt]]._aData[group];if(sGroup!=sLastGroup){while(groupTitles.length>groupTitleCnt&&sGroup!=groupTitles[groupTitleCnt][0]){title=groupTitles[groupTitleCnt][1];addNewGroup(t,title,level,sublevel,iColspan,groupTotals,groupPrefix,title,false,iconGroupType,insertSpace,shrink,accordion,groupCnt,nTrs[i],true);groupTitleCnt++;groupCnt++;}
+if(groupTitles.length>groupTitleCnt){title=groupTitles[groupTitleCnt][1];addNewGroup(t,title,level,sublevel,iColspan,groupTotals,groupPrefix,title,true,iconGroupType,insertSpace,shrink,accordion,groupCnt,nTrs[i],true);groupTitleCnt++;}else{addNewGroup(t,sGroup,level,sublevel,iColspan,groupTotals,groupPrefix,sGroup,true,iconGroupType,insertSpace,shrink,accordion,groupCnt,nTrs[i],true);}
+groupCnt++;sLastGroup=sGroup;}
+dataCnt+=1;if(shrink||accordion){row.hide();}}
+while(groupTitles.length>groupTitleCnt){title=groupTitles[groupTitleCnt][1];addNewGroup(t,title,level,sublevel,iColspan,groupTotals,groupPrefix,title,false,iconGroupType,insertSpace,shrink,accordion,groupCnt,nTrs[nTrs.length-1],false);groupTitleCnt++;groupCnt++;}}
+var setSpecialSortRules=function(t,tableConfig,tableColumns){var titles=tableConfig['groupTitles'];var order=[];var fname='group-title-'+t;var limit=titles[0].length;for(var cnt=0;cnt<limit;cnt++){var title=titles[0][cnt][0];order[title]=cnt;}
+$.fn.dataTableExt.oSort[fname+'-asc']=function(x,y){return((order[x]<order[y])?-1:((order[x]>order[y])?1:0));};$.fn.dataTableExt.oSort[fname+'-desc']=function(x,y){return((order[x]<order[y])?1:((order[x]>order[y])?-1:0));};tableColumns[tableConfig['group'][0][0]]={'sType':fname};}
+var initDataTable=function(id,t,bDestroy){var config_id=$(id+'_configurations');if(config_id.length>0){var tableConfig=$.parseJSON(config_id.val());}else{oDataTable[t]=null;return;}
+var tableColumns=[];aoTableConfig[t]=tableConfig;aoColumns[t]=tableColumns;if(tableConfig['groupTitles'].length>0){setSpecialSortRules(t,tableConfig,tableColumns);}
+fnActionCallBacks=[];var columnCount=$(id).find('thead tr').first().children().length;for(var c=0;c<columnCount;c++){tableColumns[c]=null;}
+if(tableConfig['rowActions'].length<1){if(S3.dataTables.Actions){tableConfig['rowActions']=S3.dataTables.Actions;}else{tableConfig['rowActions']=[];}}
+if(tableConfig['rowActions'].length>0){tableColumns[tableConfig['actionCol']]={'sTitle':' ','bSortable':false};}
+if(tableConfig['bulkActions']){tableColumns[tableConfig['bulkCol']]={'sTitle':'<select id="bulk_select_options"><option></option><option id="modeSelectionAll">Select All</option><option id="modeSelectionNone">Deselect All</option></select>','bSortable':false};}
+textDisplay[t]=[tableConfig['textMaxLength'],tableConfig['textShrinkLength']];if(tableConfig['group'].length>0){var groupList=tableConfig['group'];var gList=[];for(var gCnt=0;gCnt<groupList.length;gCnt++){gList.push(groupList[gCnt][0]);}
+oGroupColumns[t]={'bVisible':false,'aTargets':gList};}else{oGroupColumns[t]={'bVisible':false,'aTargets':[]};}
+if(tableConfig['bulkActions']){var bulk_submit='';for(var i=0,iLen=tableConfig['bulkActions'].length;i<iLen;i++){var bulk_action=tableConfig['bulkActions'][i],name,value,cls='';if(bulk_action instanceof Array){value=bulk_action[0];name=bulk_action[1];if(bulk_action.length==3){cls=bulk_action[2];}}else{value=bulk_action;name=value;}
+bulk_submit+='<input type="submit" id="submitSelection" class="'+cls+'" name="'+name+'" value="'+value+'">&nbsp;';}
+bulk_action_controls='<div class="dataTable-action">'+bulk_submit+'</div>';selected=$.parseJSON($(tableId[t]+'_dataTable_bulkSelection').val());if(selected===null)
+selected=[];selectedRows[t]=selected;selectionMode[t]='Inclusive';if($(tableId[t]+'_dataTable_bulkSelectAll').val()){selectionMode[t]='Exclusive';}
+aHiddenFieldsID[t]=[tableId[t]+'_dataTable_bulkMode',tableId[t]+'_dataTable_bulkSelection'];}
+if(tableConfig['pagination']=='true'){var bServerSide=true;var bProcessing=true;var iDisplayLength=tableConfig['displayLength'];var aoData=[{name:'iDisplayLength',value:iDisplayLength},{name:'iDisplayStart',value:0},{name:'sEcho',value:1}];if($(tableId[t]+'_dataTable_cache').length>0){cache[t]=$.parseJSON($(tableId[t]+'_dataTable_cache').val());}else{cache[t]={iCacheLower:-1};}
+function fnSetKey(aoData,sKey,mValue){for(var i=0,iLen=aoData.length;i<iLen;i++){if(aoData[i].name==sKey){aoData[i].value=mValue;}}}
+function fnGetKey(aoData,sKey){for(var i=0,iLen=aoData.length;i<iLen;i++){if(aoData[i].name==sKey){return aoData[i].value;}}
+return null;}
+var fnDataTablesPipeline=function(sSource,aoData,fnCallback){var bNeedServer=false;var table;if(this.hasOwnProperty('nTable')){table='#'+this.nTable.id;var t=tableIdReverse(table);cache[t]={lastRequest:[],iCacheLower:-1,iCacheUpper:-1};fnCallback({});return;}else{table='#'+this[0].id;}
+var t=tableIdReverse(table);var iRequestLength=fnGetKey(aoData,'iDisplayLength');var iPipe;if(iRequestLength==iDisplayLength){iPipe=6;}else if(iRequestLength>49||iRequestLength==-1){iPipe=2;}else{iPipe=4;}
+var sEcho=fnGetKey(aoData,'sEcho');var iRequestStart=fnGetKey(aoData,'iDisplayStart');var iRequestEnd=iRequestStart+iRequestLength;var oCache=cache[t];oCache.iDisplayStart=iRequestStart;if(oCache.hasOwnProperty('lastJson')&&oCache.lastJson.hasOwnProperty('iTotalRecords')){totalRecords[t]=oCache.lastJson.iTotalRecords;}else{totalRecords[t]=fnGetKey(aoData,'iTotalRecords');}
+if(oCache.hasOwnProperty('lastJson')&&oCache.lastJson.hasOwnProperty('iTotalDisplayRecords')){if(oCache.lastJson.iTotalDisplayRecords<iRequestEnd){iRequestEnd=oCache.lastJson.iTotalDisplayRecords;}}
+if(oCache.iCacheUpper!==-1&&(iRequestLength==-1||oCache.iCacheLower<0||iRequestStart<oCache.iCacheLower||iRequestEnd>oCache.iCacheUpper)){bNeedServer=true;}
+if(oCache.lastRequest&&!bNeedServer){if(!oCache.lastRequest.length){bNeedServer=true;}else{for(var i=0,iLen=aoData.length;i<iLen;i++){if(aoData[i].name!='iDisplayStart'&&aoData[i].name!='iDisplayLength'&&aoData[i].name!='sEcho'){if(aoData[i].value!=oCache.lastRequest[i].value){bNeedServer=true;break;}}}}}
+oCache.lastRequest=aoData.slice();if(bNeedServer){if(iRequestStart<oCache.iCacheLower){iRequestStart=iRequestStart-(iRequestLength*(iPipe-1));if(iRequestStart<0){iRequestStart=0;}}
+oCache.iCacheLower=iRequestStart;oCache.iDisplayLength=fnGetKey(aoData,'iDisplayLength');if(iRequestLength==-1){oCache.iCacheUpper=-1;fnSetKey(aoData,'iDisplayStart','None');fnSetKey(aoData,'iDisplayLength','None');}else{oCache.iCacheUpper=iRequestStart+(iRequestLength*iPipe);fnSetKey(aoData,'iDisplayStart',iRequestStart);fnSetKey(aoData,'iDisplayLength',iRequestLength*iPipe);}
+var nonDefaultData=aoData.filter(isNonDefaultData);if(oCache.hasOwnProperty('lastJson')&&oCache.lastJson.cursor){nonDefaultData.push({name:'cursor',value:oCache.lastJson.cursor});}
+$.getJSON(sSource,nonDefaultData,function(json){oCache.lastJson=$.extend(true,{},json);if(oCache.iCacheLower!=oCache.iDisplayStart){json.aaData.splice(0,oCache.iDisplayStart-oCache.iCacheLower);}
+if(oCache.iDisplayLength!==-1){json.aaData.splice(oCache.iDisplayLength,json.aaData.length);}
+fnCallback(json);});}else{json=$.extend(true,{},oCache.lastJson);json.sEcho=sEcho;if(iRequestLength!==-1){json.aaData.splice(0,iRequestStart-oCache.iCacheLower);json.aaData.splice(iRequestLength,json.aaData.length);}
+fnCallback(json);}};fnAjaxCallback[t]=fnDataTablesPipeline;}else{var bServerSide=false;var bProcessing=false;tableConfig['ajaxUrl']=null;var fnDataTablesPipeline=function(url,data,callback){var nonDefaultData=data.filter(isNonDefaultData);$.ajax({'url':url,'data':nonDefaultData,'dataType':'json','cache':false}).done(function(data,status){if(callback){callback(data,status);}}).fail(function(jqXHR,textStatus,errorThrown){if(textStatus=='parsererror'){alert('DataTables warning: JSON data from server could not be parsed. '+'This is caused by a JSON formatting error.');}});};fnAjaxCallback[t]=fnDataTablesPipeline;}
+var dt;dt=$(id).dataTable({'aaSorting':tableConfig['aaSort'],'aaSortingFixed':tableConfig['group'],'aLengthMenu':tableConfig['lengthMenu'],'aoColumnDefs':[oGroupColumns[t]],'aoColumns':tableColumns,'bAutoWidth':false,'bDeferRender':true,'bDestroy':bDestroy,'bFilter':tableConfig['bFilter']=='true','bProcessing':bProcessing,'bServerSide':bServerSide,'bSort':true,'sDom':tableConfig['sDom'],'iDisplayLength':tableConfig['displayLength'],'sPaginationType':tableConfig['paginationType'],'sAjaxSource':tableConfig['ajaxUrl'],'oLanguage':{'oAria':{'sSortAscending':': '+i18n.sSortAscending,'sSortDescending':': '+i18n.sSortDescending},'oPaginate':{'sFirst':i18n.sFirst,'sLast':i18n.sLast,'sNext':i18n.sNext,'sPrevious':i18n.sPrevious},'sEmptyTable':i18n.sEmptyTable,'sInfo':i18n.sInfo,'sInfoEmpty':i18n.sInfoEmpty,'sInfoFiltered':i18n.sInfoFiltered,'sInfoThousands':i18n.sInfoThousands,'sLengthMenu':i18n.sLengthMenu,'sLoadingRecords':i18n.sLoadingRecords+'...','sProcessing':i18n.sProcessing+'...','sSearch':i18n.sSearch+':','sZeroRecords':i18n.sZeroRecords},'fnHeaderCallback':function(nHead,aasData,iStart,iEnd,aiDisplay){$('#modeSelectionAll').on('click',function(event){selectionMode[t]='Exclusive';selectedRows[t]=[];dt.fnDraw(false);});$('#modeSelectionNone').on('click',function(event){selectionMode[t]='Inclusive';selectedRows[t]=[];dt.fnDraw(false);});},'fnInfoCallback':function(oSettings,iStart,iEnd,iMax,iTotal,sPre){var oCache=cache[t];if(oCache&&oCache.lastJson&&oCache.lastJson.approximate){return i18n.sInfoApproximate.replace('_START_',iStart).replace('_END_',iEnd).replace('_TOTAL_',iTotal);}
+return sPre;},'fnServerData':fnAjaxCallback[t],'fnRowCallback':function(nRow,aData,iDisplayIndex){var actionCol=tableConfig['actionCol'];var re=/>(.*)</i;var result=re.exec(aData[actionCol]);var action_id;if(result===null){action_id=aData[actionCol];}else{action_id=result[1];}
+if(tableConfig['rowActions'].length||tableConfig['bulkActions']){var Buttons='';if(tableConfig['rowActions'].length){var Actions=tableConfig['rowActions'];for(var i=0;i<Actions.length;i++){if('restrict'in Actions[i]){if(inList(action_id,Actions[i].restrict)==-1){continue;}}
+var c=Actions[i]._class;var label=S3.Utf8.decode(Actions[i].label);re=/%5Bid%5D/g;if(Actions[i]._onclick){var oc=Actions[i]._onclick.replace(re,action_id);Buttons=Buttons+'<a class="'+c+'" onclick="'+oc+'">'+label+'</a>'+'&nbsp;';}else if(Actions[i]._jqclick){Buttons=Buttons+'<span class="'+c+'" id="'+action_id+'">'+label+'</span>'+'&nbsp;';if(typeof S3ActionCallBack!='undefined'){fnActionCallBacks.push([action_id,S3ActionCallBack]);}}else{if(Actions[i].icon){label='<img src="'+Actions[i].icon+'" alt="'+label+'" title="'+label+'">';}
+var url=Actions[i].url.replace(re,action_id);Buttons=Buttons+'<a db_id="'+action_id+'" class="'+c+'" href="'+url+'" title="'+label+'">'+label+'</a>'+'&nbsp;';}}}
+if((tableConfig['group'].length>0)&&(tableConfig['group'][0][0]<actionCol)){actionCol-=1;}
+$('td:eq('+actionCol+')',nRow).addClass('actions').html(Buttons);}
+if(tableConfig['bulkActions']){setSelectionClass(t,nRow,inList(action_id,selectedRows[t]));}
+var styles=tableConfig['rowStyles'];if(styles.length){var row=$(nRow);var style;for(style in styles){if(inList(action_id,styles[style])>-1){row.addClass(style);}}}
+var tdposn=0;var gList=[];if(tableConfig['group'].length){var groupList=tableConfig['group'];for(var gCnt=0;gCnt<groupList.length;gCnt++){gList.push(groupList[gCnt][0]);}}
+for(var j=0;j<aData.length;j++){if($.inArray(j,gList)!=-1){continue;}
+if(aData[j][0]=='<'){tdposn++;continue;}
+if(aData[j].length>textDisplay[t][0]){var uniqueid='_'+t+iDisplayIndex+j;var icon='<a href="javascript:S3.dataTables.toggleDiv(\''+uniqueid+'\');" class="ui-icon ui-icon-zoomin" style="float:right"></a>';var display='<div id="display'+uniqueid+'">'+icon+aData[j].substr(0,textDisplay[t][1])+"&hellip;</div>";icon='<a href="javascript:S3.dataTables.toggleDiv(\''+uniqueid+'\');" class="ui-icon ui-icon-zoomout" style="float:right"></a>';display+='<div  style="display:none" id="full'+uniqueid+'">'+icon+aData[j]+"</div>";$('td:eq('+tdposn+')',nRow).html(display);}
+tdposn++;}
+return nRow;},'fnDrawCallback':function(oSettings){bindButtons(t,tableConfig,fnActionCallBacks);if(oSettings.aiDisplay.length===0){return;}
+if(tableConfig['group'].length){var groupList=tableConfig['group'];for(var gCnt=0;gCnt<groupList.length;gCnt++){var prefixID=[];for(var pixidCnt=0;pixidCnt<gCnt;pixidCnt++){prefixID.push(groupList[pixidCnt][0]);}
+var group=groupList[gCnt];if(tableConfig['groupTotals'].length>gCnt){var groupTotals=tableConfig['groupTotals'][gCnt];}else{var groupTotals=[];}
+if(tableConfig['groupTitles'].length>gCnt){var groupTitles=tableConfig['groupTitles'][gCnt];}else{var groupTitles=[];}
+buildGroups(oSettings,id,t,group[0],groupTotals,prefixID,groupTitles,gCnt+1);}
+var shrink=tableConfig['shrinkGroupedRows']=='individual';var accordion=tableConfig['shrinkGroupedRows']=='accordion';if(shrink||accordion){var nTrs=$(id+' tbody tr');var sublevel='';for(var i=0;i<nTrs.length;i++){obj=$(nTrs[i]);if(obj.hasClass('headerRow')){item=getElementClass(obj,'group_');sublevel='sublevel'+item.substr(6);}else{$(nTrs[i]).addClass(sublevel).addClass('collapsable');}}
+$('.collapsable').hide();if(accordion){accordionRow(t,'level_1','group_'+t+'11');}
+$('.expandable').click(function(){thisAccordionRow(t,this);});}}
+if(Math.ceil((oSettings.fnRecordsDisplay())/oSettings._iDisplayLength)>1){$(id+'_paginate').css('display','block');}else{$(id+'_paginate').css('display','none');}}});dt.fnSetFilteringDelay(450);if(S3.dataTables.Resize){dt.fnAdjustColumnSizing();}
+oDataTable[t]=dt;}
+S3.dataTables.initDataTable=initDataTable;var initAll=function(){if(S3.dataTables.id){var tableCnt=S3.dataTables.id.length;for(var t=0;t<tableCnt;t++){var id='#'+S3.dataTables.id[t];tableId[t]=id;initDataTable(id,t,false);}}}
+S3.dataTables.initAll=initAll;}());$(document).ready(function(){S3.dataTables.initAll();var dt_mapButton=$('#gis_datatables_map-btn');if(dt_mapButton){dt_mapButton.on('click',function(){var map_id=dt_mapButton.attr('map');if(undefined==map_id){map_id='default_map';}
+var map=S3.gis.maps[map_id];var layers=map.layers;var layer,j,jlen,strategies,strategy;for(var i=0,len=layers.length;i<len;i++){layer=layers[i];if(layer.s3_layer_id=='search_results'){layer.events.on({'loadend':S3.gis.search_layer_loadend});strategies=layer.strategies;for(j=0,jlen=strategies.length;j<jlen;j++){strategy=strategies[j];if(strategy.CLASS_NAME=='OpenLayers.Strategy.AttributeCluster'){strategy.deactivate();}}
+layer.setVisibility(true);}};if(map.s3.polygonButton){map.s3.polygonButton.disable();}
+map.s3.mapWin.show();$('.olMapViewport').removeClass('crosshair');dt_mapButton.parent().addClass('tab_here');$('#gis_datatables_list_tab').parent().removeClass('tab_here').addClass('tab_other');$('div.x-tool-close').click(function(evt){dt_mapButton.parent().removeClass('tab_here').addClass('tab_other');$('#gis_datatables_list_tab').parent().removeClass('tab_other').addClass('tab_here');});});}
+var search_mapButton=$('#gis_search_map-btn');if(search_mapButton){search_mapButton.on('click',function(evt){evt.preventDefault();var map_id=search_mapButton.attr('map');if(undefined==map_id){map_id='default_map';}
+var map=S3.gis.maps[map_id];map.s3.polygonButton.enable();map.s3.mapWin.show();$('.olMapViewport').addClass('crosshair');});}});
\ No newline at end of file
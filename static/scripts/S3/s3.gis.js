@@ -1491,6 +1491,209 @@ OpenLayers.ProxyHost = S3.Ap.concat('/gis/proxy?url=');
         return draftLayer;
     }
 
+    /**
+     * Tile zoom level (0-22) matching the current resolution of a map
+     */
+    var getTileZoom = function(map) {
+        var inches = OpenLayers.INCHES_PER_UNIT;
+        var degrees = map.getResolution() * inches[map.getUnits()] / inches['degrees'];
+        var zoom = Math.round(Math.log(360 / (256 * degrees)) / Math.LN2);
+        return Math.max(0, Math.min(zoom, 22));
+    }
+
+    /**
+     * Strategy to load a GeoJSON Layer as tiles (z/x/y) from S3MapTiles
+     * - the geometries are simplified per zoom level, so all features
+     *   get reloaded when the zoom level changes
+     * - features contained in multiple tiles are added only once
+     */
+    var TileStrategy = OpenLayers.Class(OpenLayers.Strategy, {
+
+        // URL of the tiles (z/x/y get appended as URL vars)
+        url: null,
+        // Zoom level of the loaded tiles
+        zoom: null,
+        // Tiles requested for this zoom level
+        tiles: null,
+        // IDs of the features added for this zoom level
+        fids: null,
+        // Number of pending requests
+        pending: 0,
+
+        activate: function() {
+            var activated = OpenLayers.Strategy.prototype.activate.call(this);
+            if (activated) {
+                this.layer.events.on({
+                    moveend: this.update,
+                    refresh: this.reload,
+                    visibilitychanged: this.update,
+                    scope: this
+                });
+                this.update();
+            }
+            return activated;
+        },
+
+        deactivate: function() {
+            var deactivated = OpenLayers.Strategy.prototype.deactivate.call(this);
+            if (deactivated) {
+                this.layer.events.un({
+                    moveend: this.update,
+                    refresh: this.reload,
+                    visibilitychanged: this.update,
+                    scope: this
+                });
+            }
+            return deactivated;
+        },
+
+        reload: function() {
+            // Force reload of all tiles (e.g. Refresh strategy)
+            this.zoom = null;
+            this.update();
+        },
+
+        getZoom: function(map) {
+            // Tile zoom level matching the map resolution
+            return getTileZoom(map);
+        },
+
+        update: function() {
+            var layer = this.layer;
+            if (!layer.visibility) {
+                return;
+            }
+            var map = layer.map;
+            var extent = map.getExtent();
+            if (!extent) {
+                return;
+            }
+            var zoom = this.getZoom(map);
+            if (zoom !== this.zoom) {
+                this.zoom = zoom;
+                this.tiles = {};
+                this.fids = {};
+                layer.destroyFeatures();
+            }
+            extent = extent.clone().transform(map.getProjectionObject(), proj4326);
+
+            var n = Math.pow(2, zoom);
+            var tileX = function(lon) {
+                var x = Math.floor((lon + 180) / 360 * n);
+                return Math.max(0, Math.min(x, n - 1));
+            };
+            var tileY = function(lat) {
+                lat = Math.max(Math.min(lat, 85.0511), -85.0511) * Math.PI / 180;
+                var y = Math.floor((1 - Math.log(Math.tan(lat) + 1 / Math.cos(lat)) / Math.PI) / 2 * n);
+                return Math.max(0, Math.min(y, n - 1));
+            };
+            var x0 = tileX(extent.left),
+                x1 = tileX(extent.right),
+                y0 = tileY(extent.top),
+                y1 = tileY(extent.bottom);
+            var tiles = this.tiles;
+            var x, y, key;
+            for (x=x0; x <= x1; x++) {
+                for (y=y0; y <= y1; y++) {
+                    key = x + '/' + y;
+                    if (!tiles[key]) {
+                        tiles[key] = true;
+                        this.loadTile(zoom, x, y);
+                    }
+                }
+            }
+        },
+
+        loadTile: function(zoom, x, y) {
+            var layer = this.layer;
+            if (this.pending === 0) {
+                layer.events.triggerEvent('loadstart');
+            }
+            this.pending++;
+            OpenLayers.Request.GET({
+                url: this.url + '&z=' + zoom + '&x=' + x + '&y=' + y,
+                scope: this,
+                callback: function(request) {
+                    this.pending--;
+                    if (zoom === this.zoom && request.status == 200) {
+                        this.addFeatures(request.responseText);
+                    }
+                    if (this.pending === 0) {
+                        layer.events.triggerEvent('loadend');
+                    }
+                }
+            });
+        },
+
+        addFeatures: function(text) {
+            var layer = this.layer;
+            var features = format_geojson.read(text);
+            if (!features || !features.length) {
+                return;
+            }
+            var mapProjection = layer.map.getProjectionObject();
+            var reproject = !mapProjection.equals(layer.projection);
+            var fids = this.fids;
+            var add = [];
+            var feature, fid;
+            for (var i=0, len=features.length; i < len; i++) {
+                feature = features[i];
+                fid = feature.fid || feature.attributes.id;
+                if (fid) {
+                    if (fids[fid]) {
+                        // Already added from another tile
+                        continue;
+                    }
+                    fids[fid] = true;
+                }
+                if (reproject && feature.geometry) {
+                    feature.geometry.transform(layer.projection, mapProjection);
+                }
+                add.push(feature);
+            }
+            if (add.length) {
+                layer.addFeatures(add);
+            }
+        },
+
+        CLASS_NAME: 'S3.gis.TileStrategy'
+    });
+
+    /**
+     * BBOX Strategy to load a Point Layer clustered on the server by
+     * S3MapClusters
+     * - passes the zoom level, so features get reloaded whenever the
+     *   resolution changes (resFactor 1)
+     */
+    var ServerClusterStrategy = OpenLayers.Class(OpenLayers.Strategy.BBOX, {
+
+        resFactor: 1,
+
+        triggerRead: function(options) {
+            var protocol = this.layer.protocol;
+            protocol.params = OpenLayers.Util.extend(protocol.params || {}, {
+                zoom: getTileZoom(this.layer.map)
+            });
+            return OpenLayers.Strategy.BBOX.prototype.triggerRead.apply(this, arguments);
+        },
+
+        CLASS_NAME: 'S3.gis.ServerClusterStrategy'
+    });
+
+    // Mark the clusters from S3MapClusters as clustered features
+    var onServerClustersAdded = function(event) {
+        var features = event.features;
+        var feature;
+        for (var i = 0, len = features.length; i < len; i++) {
+            feature = features[i];
+            if (feature.attributes.count > 1) {
+                // Placeholder for styling
+                feature.cluster = [{attributes: {}}];
+                feature.s3_cluster = true;
+            }
+        }
+    }
+
     // GeoJSON
     // Used also by internal Feature Layers, Feature Queries, Feature Resources
     // & GeoRSS feeds
@@ -1582,15 +1785,35 @@ OpenLayers.ProxyHost = S3.Ap.concat('/gis/proxy?url=');
         var marker_url = response[1];
 
         // Strategies
-        var strategies = [
-            // Need to be uniquely instantiated
-            new OpenLayers.Strategy.BBOX({
-                // load features for a wider area than the visible extent to reduce calls
-                ratio: 1.5
-                // don't fetch features after every resolution change
-                //resFactor: 1
-            })
-        ]
+        if (undefined != layer.tiles) {
+            // Tiles with geometries simplified per zoom level
+            var strategies = [
+                new TileStrategy({
+                    url: layer.tiles
+                })
+            ]
+            // Polygons: no clustering
+            cluster_threshold = 0;
+        } else if (undefined != layer.clusters) {
+            // Points clustered on the server
+            url = layer.clusters;
+            var strategies = [
+                new ServerClusterStrategy({
+                    ratio: 1.5
+                })
+            ]
+            cluster_threshold = 0;
+        } else {
+            var strategies = [
+                // Need to be uniquely instantiated
+                new OpenLayers.Strategy.BBOX({
+                    // load features for a wider area than the visible extent to reduce calls
+                    ratio: 1.5
+                    // don't fetch features after every resolution change
+                    //resFactor: 1
+                })
+            ]
+        }
         if (refresh) {
             strategies.push(new OpenLayers.Strategy.Refresh({
                 force: true,
@@ -1646,6 +1869,11 @@ OpenLayers.ProxyHost = S3.Ap.concat('/gis/proxy?url=');
             'loadend': layer_loadend,
             'visibilitychanged': layer_visibilitychanged  
         });
+        if (undefined != layer.clusters) {
+            geojsonLayer.events.on({
+                'beforefeaturesadded': onServerClustersAdded
+            });
+        }
         map.addLayer(geojsonLayer);
         // Ensure Highlight & Popup Controls act on this layer
         map.s3.layers_all.push(geojsonLayer);
@@ -2993,7 +3221,12 @@ OpenLayers.ProxyHost = S3.Ap.concat('/gis/proxy?url=');
             var titleField = 'name';
         }
         var contents, data_link, name, popup_url;
-        if (feature.cluster) {
+        if (feature.s3_cluster) {
+            // Cluster from the server: records not loaded
+            var map_id = map.s3.id;
+            contents = i18n.gis_cluster_multiple + ' (' + feature.attributes.count + ')';
+            contents += "<div align='center'><a href='javascript:S3.gis.zoomToSelectedFeature(" + "\"" + map_id + "\", " + centerPoint.lon + "," + centerPoint.lat + ", 3)'>" + i18n.gis_zoomin + '</a></div>';
+        } else if (feature.cluster) {
             // Cluster
             var cluster = feature.cluster;
             contents = i18n.gis_cluster_multiple + ':<ul>';
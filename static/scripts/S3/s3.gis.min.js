@@ -1,106 +1,403 @@
-S3.gis.maps={};S3.gis.proj4326=new OpenLayers.Projection("EPSG:4326");OpenLayers.ImgPath=S3.Ap.concat("/static/img/gis/openlayers/");OpenLayers.IMAGE_RELOAD_ATTEMPTS=3;OpenLayers.Util.onImageLoadErrorColor="transparent";OpenLayers.ProxyHost=S3.Ap.concat("/gis/proxy?url=");
-(function(){function Y(b){var a=this.map.getResolution(),c=Math.round((b.left-this.maxExtent.left)/(a*this.tileSize.w));b=Math.round((this.maxExtent.top-b.top)/(a*this.tileSize.h));var a=this.map.getZoom(),d=Math.pow(2,a);if(0>b||b>=d)return OpenLayers.Util.getImagesLocation()+"404.png";c=a+"/"+(c%d+d)%d+"/"+b+"."+this.type;b=this.url;b instanceof Array&&(b=this.selectUrl(c,b));return b+c}function Z(b){b=b.feature;if(!b.cluster){var a=b.layer.map,c=a.s3.lastFeature,d=a.s3.tooltipPopup;if(null===b.popup){null!==
-d&&void 0!==d&&(a.removePopup(d),d.destroy(),null!==c&&delete c.popup,d=null);var c=b.geometry.getBounds().getCenterLonLat(),f=b.attributes,e;void 0!=f.popup?e=f.popup:void 0!=f.name?e=f.name:void 0!=b.layer.title&&(e=f[b.layer.title],e="object"==typeof e?e.value:e);e&&(d=new OpenLayers.Popup("activetooltip",c,new OpenLayers.Size(80,12),e,!1));null!==d&&void 0!==d&&(d.contentDiv.style.backgroundColor="ffffcb",d.contentDiv.style.overflow="hidden",d.contentDiv.style.padding="3px",d.contentDiv.style.margin=
-"10px",d.closeOnMove=!0,d.autoSize=!0,d.opacity=0.7,b.popup=d,a.addPopup(d))}}}function K(b){b=b.feature;if(null!==b&&null!==b.popup){var a=b.layer.map;a.removePopup(b.popup);b.popup.destroy();delete b.popup;a.s3.tooltipPopup=null;a.s3.lastFeature=null}}function L(b,a,c){0===b.indexOf("http://")&&(b=OpenLayers.ProxyHost+encodeURIComponent(b));$.ajax({url:b,dataType:"html"}).done(function(b){try{$("#"+a).html(b)}catch(c){}}).fail(function(b,c,e){msg="UNAUTHORIZED"==e?i18n.gis_requires_login:b.responseText;
-$("#"+a+"_contentDiv").html(msg)}).always(function(){c.updateSize()})}function C(b){K(b);b=b.feature;var a=b.layer,c=a.s3_layer_type,d=a.map,f=b.geometry.getBounds().getCenterLonLat(),e=S3.uid(),a=void 0!=a.title?a.title:"name",g,k,m;if(b.cluster){var l=b.cluster;g=i18n.gis_cluster_multiple+":<ul>";for(var n=l.length,r=d.s3.id,p=0;p<n;p++){var h=l[p].attributes,c=void 0!=h.popup?h.popup.split("<br />",1)[0]:h[a];g=void 0!=h.url?g+("<li><a href='javascript:S3.gis.loadClusterPopup(\""+r+'", "'+h.url+
-'", "'+e+"\")'>"+c+"</a></li>"):g+("<li>"+c+"</li>")}g+="</ul>";g+="<div align='center'><a href='javascript:S3.gis.zoomToSelectedFeature(\""+r+'", '+f.lon+","+f.lat+", 3)'>"+i18n.gis_zoomin+"</a></div>"}else if("kml"==c){h=b.attributes;if(void 0!=b.style.balloonStyle)g=b.style.balloonStyle.replace(/{([^{}]*)}/g,function(a,b){var c=h[b];return"string"===typeof c||"number"===typeof c?c:a});else{l=typeof h[a];c="object"==l?h[a].value:h[a];g="<h3>"+c+"</h3>";for(var c=b.layer.body.split(" "),t,a=0;a<
-c.length;a++)l=typeof h[c[a]],"object"==l?(l=h[c[a]].displayName,""===l&&(l=c[a]),n=h[c[a]].value,t='<div class="gis_popup_row"><div class="gis_popup_label">'+l+':</div><div class="gis_popup_cell">'+n+"</div></div>"):t=void 0!=h[c[a]]?'<div class="gis_popup_row">'+h[c[a]]+"</div>":"",g+=t}-1!=g.search("<script")&&(g="Content contained Javascript! Escaped content below.<br />"+g.replace(/</g,"<"))}else if("gpx"!=c)if("shapefile"==c)h=b.attributes,g="<div>",$.each(h,function(a,b){"id_orig"==a&&(a="id");
-t='<div class="gis_popup_row"><div class="gis_popup_label">'+a+':</div><div class="gis_popup_cell">'+b+"</div></div>";g+=t}),g+="</div>";else if("wfs"==c)h=b.attributes,c=h[a],g="<h3>"+c+"</h3>",$.each(h,function(a,b){t='<div class="gis_popup_row"><div class="gis_popup_label">'+a+':</div><div class="gis_popup_val">'+b+"</div></div>";g+=t});else if(void 0!=b.attributes.url)m=b.attributes.url,g=i18n.gis_loading+"...<div class='throbber'></div>";else{h=b.attributes;c=void 0==h.name?"":"<h3>"+h.name+
-"</h3>";a=void 0==h.description?"":"<p>"+h.description+"</p>";l=void 0==h.link?"":'<a href="'+h.link+'" target="_blank">'+h.link+"</a>";if(void 0==h.data)n="";else if(0===h.data.indexOf("http://")){k=!0;var s=S3.uid(),n='<div id="'+s+'">'+i18n.gis_loading+"...<div class='throbber'></div></div>"}else n="<p>"+h.data+"</p>";r=void 0==h.image?"":0===h.image.indexOf("http://")?'<img src="'+h.image+'" height=300 width=300>':"";g=c+a+l+n+r}f=new OpenLayers.Popup.FramedCloud(e,f,new OpenLayers.Size(400,400),
-g,null,!0,aa);void 0!=m?L(m,e+"_contentDiv",f):k&&L(b.attributes.data,s,f);b.popup=f;d.addPopup(f)}function E(b){b=b.feature;b.popup&&(b.layer.map.removePopup(b.popup),b.popup.destroy(),delete b.popup)}function aa(b){for(b=this.map;b.popups.length;)b.removePopup(b.popups[0])}function ba(b,a){var c=a.geometry.getCentroid(),d=a.geometry.getBounds(),f=Math.abs((d.right-d.left)/2),e=0,g="up";window.resizeInterval=window.setInterval(function(){16<e&&clearInterval(window.resizeInterval);var d=0.03*f/f;
-switch(e){case 4:case 12:g="down";break;case 8:g="up"}"up"!==g&&(d=-Math.abs(d));a.geometry.resize(1+d,c);b.s3.draftLayer.drawFeature(a);e++},50,c,f)}function ca(b){b&&S3.gis.googleEarthPanel.earth.getFeatures().appendChild(b)}function da(b){var a={},c=b.getCenter();c.transform(b.getProjectionObject(),u);a.lon=c.lon;a.lat=c.lat;a.zoom=b.getZoom();var d=[],f,e,g=b.baseLayer.s3_layer_id;Ext.iterate(b.layers,function(a,b,c){f=a.s3_layer_id;e={id:f};a.visibility&&(e.visible=a.visibility);f==g&&(e.base=
-!0);a.s3_style&&(e.style=a.s3_style);d.push(e)});a.layers=d;var k=[];Ext.iterate(b.s3.plugins,function(a,b,c){a.getState&&k.push(a.getState())});a.plugins=k;return a}var H=new OpenLayers.Format.GeoJSON;H.ignoreExtraDims=!0;var M=S3.Ap.concat("/static/img/markers/"),u=S3.gis.proj4326;S3.gis.show_map=function(b,a){b||(b="default_map");void 0==a&&(a=S3.gis.options[b]);var c=a.projection,d=new OpenLayers.Projection("EPSG:"+c);a.projection_current=d;900913==c?(a.maxExtent=new OpenLayers.Bounds(-2.003750834E7,
--2.003750834E7,2.003750834E7,2.003750834E7),a.maxResolution=156543.0339,a.units="m"):4326==c?(a.maxExtent=new OpenLayers.Bounds(-180,-90,180,90),a.maxResolution=1.40625,a.units="degrees"):(c=a.maxExtent.split(","),a.maxExtent=new OpenLayers.Bounds(c[0],c[1],c[2],c[3]),a.maxResolution="auto");var f,c=a.lat,e=a.lon;c&&e?(c=new OpenLayers.LonLat(e,c),c.transform(u,d)):(f=OpenLayers.Bounds.fromArray(a.bbox).transform(u,d),c=f.getCenterLonLat());a.center=c;d=ea(b,a);d.Z_INDEX_BASE.Popup=800;a.renderTo=
-"map_panel";fa(d);f&&d.zoomToExtent(f);return d};var I=function(b){b=b.object;var a=b.getDataExtent();if(a){var c=b.map,d=c.getProjectionObject();a.transform(d,u);var f=a.toArray(),a=f[0],e=f[1],g=f[2],f=f[3],k=(0.05-(g-a))/2;0<k&&(a-=k,g+=k);k=(0.05-(f-e))/2;0<k&&(e-=k,f+=k);a=new OpenLayers.Bounds(a-0.007,e-0.007,g+0.007,f+0.007);a.transform(u,d);c.zoomToExtent(a)}d=b.strategies;a=0;for(e=d.length;a<e;a++)if(c=d[a],"OpenLayers.Strategy.AttributeCluster"==c.CLASS_NAME){c.activate();c.features=b.features;
-c.recluster();break}b.events.un({loadend:I})};S3.gis.search_layer_loadend=I;S3.gis.refreshLayer=function(b,a){var c=S3.gis.maps,d,f,e,g,k,m,l,n,r,p;for(d in c)for(f=c[d],e=f.layers,g=0,k=e.length;g<k;g++)if(m=e[g],m.s3_layer_id==b&&(l=m.protocol.url,l=S3.search.filterURL(l,a),m.protocol.options.url=l,f.s3.mapWin.isVisible())){m.events.on({loadend:I});l=m.strategies;r=l.length;for(n=0;n<r;n++)if(p=l[n],"OpenLayers.Strategy.AttributeCluster"==p.CLASS_NAME){p.deactivate();break}if(m.visibility)for(n=
-0;n<r;n++){if(p=l[n],"OpenLayers.Strategy.Refresh"==p.CLASS_NAME){p.refresh();break}}else m.setVisibility(!0)}};var ea=function(b,a){var c=new OpenLayers.Map("center",{controls:[],displayProjection:u,projection:a.projection_current,fallThrough:i18n.gis_name_map?!0:!1,theme:null,maxResolution:a.maxResolution,maxExtent:a.maxExtent,numZoomLevels:a.numZoomLevels,units:a.units});S3.gis.maps[b]=c;c.s3={};c.s3.id=b;c.s3.options=a;c.s3.plugins=[];c.registerPlugin=function(a){a.map=this;this.s3.plugins.push(a)};
-ga(c);ha(c);return c},fa=function(b){var a=b.s3,c=a.options,d=new GeoExt.MapPanel({xtype:"gx_mappanel",map:b,center:c.center,zoom:c.zoom,plugins:[]});a.mapPanel=d;var f={};f.map=d;a.portal=f;if(c.legend||c.layers_wms)for(var f=b.layers,d=d.layers.data.items,e=0;e<f.length;e++)f[e].legendURL&&(d[e].data.legendURL=f[e].legendURL),f[e].legendTitle&&(d[e].data.title=f[e].legendTitle),f[e].queryable&&(d[e].data.queryable=1);f=ia(b);d=[f];c.wms_browser_url&&(e=ja(b))&&d.push(e);c.legend&&("float"==c.legend?
-ka(b):(e=new GeoExt.LegendPanel({title:i18n.gis_legend,defaults:{},autoScroll:!0,collapsible:!0,collapseMode:"mini"}),d.push(e)));for(var e=a.plugins,g=0,k=e.length;g<k;++g)e[g].setup(b),e[g].addToMapWindow(d);a.west_panel_items=d;c.window?N(b):O(b);var m=a.westPanelContainer;m.fireEvent("collapse");window.setTimeout(function(){m.fireEvent("expand")},300);f.root.eachChild(function(){this.eachChild(function(){if(this.isLeaf())this.on("checkchange",function(a,b){b||J(this.layer)});else this.eachChild(function(){if(this.isLeaf())this.on("checkchange",
-function(a,b){b||J(this.layer)})})})});Ext.QuickTips.init()},O=function(b){var a=b.s3,c=a.options,d=P(b);b=Q(b);c=new Ext.Panel({renderTo:c.renderTo,autoWidth:!0,titleCollapse:!0,height:c.map_height,layout:"border",items:[d,b]});a.mapWin=c};S3.gis.addMapPanel=O;var N=function(b){var a=b.s3,c=a.options,d=P(b);b=Q(b);d=new Ext.Window({cls:"gis-map-window",collapsible:!1,constrain:!0,closable:!c.windowNotClosable,closeAction:"hide",autoScroll:!0,maximizable:c.maximizable,titleCollapse:!1,height:c.map_height,
-width:c.map_width,layout:"border",items:[d,b]});d.on("beforehide",function(a){a.maximized&&a.restore()});c.windowHide||(d.show(),d.maximize());a.mapWin=d};S3.gis.addMapWindow=N;var P=function(b){b=b.s3;var a=b.options.west_collapsed||!1,c=new Ext.Panel({header:!1,border:!1,split:!0,items:b.west_panel_items});autoWidth=Ext.isChrome?!1:!0;a=new Ext.Panel({cls:"gis_west",region:"west",header:!1,border:!0,autoWidth:autoWidth,width:250,collapsible:!0,collapseMode:"mini",collapsed:a,items:[c]});return b.westPanelContainer=
-a},Q=function(b){var a=b.s3,c=a.options;if(c.toolbar){var d,f=b.s3,e=f.options;d=new Ext.Toolbar({height:34});d.map=b;f.portal.toolbar=d;var g=new GeoExt.Action({control:new OpenLayers.Control.ZoomToMaxExtent,map:b,iconCls:"zoomfull",tooltip:i18n.gis_zoomfull}),k=new GeoExt.Action({control:new OpenLayers.Control.ZoomBox({out:!0}),map:b,iconCls:"zoomout",tooltip:i18n.gis_zoomout,toggleGroup:"controls"}),m=new GeoExt.Action({control:new OpenLayers.Control.ZoomBox,map:b,iconCls:"zoomin",tooltip:i18n.gis_zoominbutton,
-toggleGroup:"controls"}),l,n,r;"active"==e.draw_polygon?(r=!0,n=l=f=!1):("active"==e.draw_line?(f=!0,l=n=!1):"active"==e.draw_feature?(n=!0,l=f=!1):(l=!0,n=f=!1),r=!1);d.add(g);navigator.geolocation&&la(d);void 0===e.nav&&(g=new GeoExt.Action({control:new OpenLayers.Control.Navigation,map:b,iconCls:"pan-off",tooltip:i18n.gis_pan,allowDepress:!0,toggleGroup:"controls",pressed:l}),d.add(k),d.add(m),d.add(g),d.addSeparator(),m=new OpenLayers.Control.NavigationHistory,d.map.addControl(m),m.activate(),
-k=new Ext.Toolbar.Button({iconCls:"back",tooltip:i18n.gis_navPrevious,handler:m.previous.trigger}),m=new Ext.Toolbar.Button({iconCls:"next",tooltip:i18n.gis_navNext,handler:m.next.trigger}),d.addButton(k),d.addButton(m));e.save&&ma(d);d.addSeparator();na(d);e.mgrs_url&&oa(d);if(e.draw_feature||e.draw_polygon)d.addSeparator(),e.draw_feature&&R(b,d,n),e.draw_line&&S(b,d,f,!0),e.draw_polygon&&T(b,d,r,!0);i18n.gis_get_feature_info&&(f=new gxp.plugins.WMSGetFeatureInfo({actionTarget:"toolbar",outputTarget:"map",
-outputConfig:{width:400,height:200},toggleGroup:"controls",infoActionTip:i18n.gis_get_feature_info,popupTitle:i18n.gis_feature_info}),f.target=b.s3,f.addActions());i18n.gis_potlatch&&pa(d);e.Google&&e.Google.StreetviewButton&&qa(d);try{e.Google.Earth&&google&ra(d)}catch(p){}i18n.gis_search&&(e=Math.min(350,!1===e.nav?e.map_width-500:e.map_width-680),b=new GeoExt.ux.GeoNamesSearchCombo({map:b,width:e,listWidth:e,minChars:2,emptyText:i18n.gis_search}),d.addSeparator(),d.add(b));b=new Ext.BoxComponent({cls:"layer_throbber hide"});
-d.add(b)}else c.draw_feature&&(e="active"==c.draw_feature?!0:!1,R(b,null,e)),c.draw_line&&(e="active"==c.draw_line?!0:!1,S(b,null,e)),c.draw_polygon&&(e="active"==c.draw_polygon?!0:!1,T(b,null,e,!0)),c.save&&sa(b),b=b.s3,e=b.id,$("#"+e+" .layer_throbber").length||(f='<div class="layer_throbber float hide',b.options.save&&(f+=" save"),f+='"></div>',$("#"+e).append(f));b=new Ext.Panel({layout:"card",region:"center",cls:"mappnlcntr",defaults:{border:!1},items:[a.mapPanel],activeItem:0,tbar:d,scope:this});
-a.mapPanelContainer=b;c.Google&&c.Google.Earth&&(c=new gxp.GoogleEarthPanel({mapPanel:a.mapPanel}),b.items.items.push(c),a.googleEarthPanel=c,S3.gis.googleEarthPanel=c);return b},ia=function(b){GeoExt.tree.LayerNodeUIS3=Ext.extend(GeoExt.tree.LayerNodeUI,{onClick:function(a){if(a.getTarget(".x-tree-node-cb",1)){var b=this.node,c=this.node.attributes,d=c.checkedGroup;d&&"baselayer"!==d?(d=!c.checked,c.checked=d,b.ui.checkbox.checked=d,b.layer.setVisibility(d),this.enforceOneVisible()):this.toggleCheck(this.isChecked())}else GeoExt.tree.LayerNodeUI.superclass.onClick.apply(this,
-arguments)},enforceOneVisible:function(){var a=this.node.attributes,b=a.checkedGroup;if(b&&"baselayer"!==b){var c=this.node.layer,d=this.node.getOwnerTree().getChecked();Ext.each(d,function(d){var f=d.layer;d.hidden||d.attributes.checkedGroup!==b||f!=c&&a.checked&&f.setVisibility(!1)})}}});GeoExt.tree.LayerNodeS3=Ext.extend(GeoExt.tree.LayerNode,{constructor:function(a){this.defaultUI=GeoExt.tree.LayerNodeUIS3;GeoExt.tree.LayerNodeS3.superclass.constructor.apply(this,arguments)}});Ext.tree.TreePanel.nodeTypes.gx_layer=
-GeoExt.tree.LayerNodeS3;var a=b.s3,c=a.options,d=c.hide_overlays?!1:!0,f=c.folders_closed?!1:!0,e=c.folders_radio?!0:!1,g=c.wms_browser_url||c.legend&&"float"!=c.legend?!0:!1,k=a.mapPanel.layers,m=[],l={click:function(a){var b=a.attributes;if("baselayer"==b.checkedGroup)a.ui.toggleCheck(!a.ui.isChecked());else{var c=!b.checked;b.checked=c;a.ui.checkbox.checked=c;a.layer.setVisibility(c)}}},n=function(){var b=a.westPanelContainer;b.fireEvent("collapse");window.setTimeout(function(){b.fireEvent("expand")},
-300)},r={collapse:function(a){n()},expand:function(a){n()}};!c.hide_base&&m.push({text:i18n.gis_base_layers,nodeType:"gx_baselayercontainer",layerStore:k,loader:{baseAttrs:{listeners:l},filter:function(a){a=a.getLayer();return!0===a.displayInLayerSwitcher&&!0===a.isBaseLayer&&(void 0===a.dir||""===a.dir)}},leaf:!1,listeners:r,singleClickExpand:!0,expanded:f});d&&m.push({text:i18n.gis_overlays,nodeType:"gx_overlaylayercontainer",layerStore:k,loader:{baseAttrs:{listeners:l},filter:function(a){a=a.getLayer();
-return!0===a.displayInLayerSwitcher&&!1===a.isBaseLayer&&(void 0===a.dir||""===a.dir)}},leaf:!1,listeners:r,singleClickExpand:!0,expanded:f});var d=b.s3.dirs,p=d.length;if(p){GeoExt.tree.LayerLoaderS3=function(a){Ext.apply(this,a);GeoExt.tree.LayerLoaderS3.superclass.constructor.call(this)};Ext.extend(GeoExt.tree.LayerLoaderS3,GeoExt.tree.LayerLoader,{load:function(a,b){if(this.fireEvent("beforeload",this,a)){for(this.removeStoreHandlers();a.firstChild;)a.removeChild(a.firstChild);this.uiProviders||
-(this.uiProviders=a.getOwnerTree().getLoader().uiProviders);this.store||(this.store=GeoExt.MapPanel.guess().layers);this.store.each(function(b){this.addLayerNode(a,b)},this);this.addStoreHandlers(a);var c=a.attributes.children,d=c.length;if(d)for(var f,e,g=0;g<d;g++)f=c[g],f=new Ext.tree.TreePanel.nodeTypes[f.nodeType](f),(e=a.item(0))?a.insertBefore(f,e):a.appendChild(f);"function"==typeof b&&b();this.fireEvent("load",this,a)}}});var h,t,s,u,D,c={},w,v,y;for(w=0;w<p;w++)for(s=d[w],u=s.split("/"),
-D=u.length,v=0;v<D;v++)t=0==v?c:t[h],h=u[v],t.hasOwnProperty(h)||(t[h]={});for(s in c){h=c[s];t=[];for(y in h)h={listeners:l},e&&(h.checkedGroup=y),h=new GeoExt.tree.LayerLoaderS3({baseAttrs:h,filter:function(a,b){return function(c){if("undefined"!==c.data.layer.dir)return c.data.layer.dir===a+"/"+b}}(s,y)}),h={text:y,nodeType:"gx_layercontainer",layerStore:k,children:[],loader:h,leaf:!1,listeners:r,singleClickExpand:!0,expanded:f},t.push(h);h={listeners:l};e&&(h.checkedGroup=s);h=new GeoExt.tree.LayerLoaderS3({baseAttrs:h,
-filter:function(a){return function(b){if("undefined"!==b.data.layer.dir)return b.data.layer.dir===a}}(s)});h={text:s,nodeType:"gx_layercontainer",layerStore:k,children:t,loader:h,leaf:!1,listeners:r,singleClickExpand:!0,expanded:f};m.push(h)}}f=new Ext.tree.AsyncTreeNode({expanded:!0,children:m});e=i18n.gis_properties||i18n.gis_uploadlayer?new Ext.Toolbar:null;g=new Ext.tree.TreePanel({title:i18n.gis_layers,loaderloader:new Ext.tree.TreeLoader({applyLoader:!1}),root:f,rootVisible:!1,split:!0,collapsible:g,
-collapseMode:"mini",lines:!1,tbar:e,enableDD:!1});new Ext.tree.TreeSorter(g,{sortType:function(a,b){return"gx_baselayercontainer"==b.attributes.nodeType?" ":"gx_overlaylayercontainer"==b.attributes.nodeType?"!":b.text}});i18n.gis_uploadlayer&&ta(b,g);i18n.gis_properties&&ua(b,g);return g},ja=function(b){var a=b.s3.options,c=new Ext.tree.AsyncTreeNode({expanded:!0,loader:new GeoExt.tree.WMSCapabilitiesLoader({url:OpenLayers.ProxyHost+a.wms_browser_url,layerOptions:{buffer:1,singleTile:!1,ratio:1,wrapDateLine:!0},
-layerParams:{TRANSPARENT:"TRUE"},createNode:function(a){a.checked=a.leaf?!1:void 0;return GeoExt.tree.WMSCapabilitiesLoader.prototype.createNode.apply(this,[a])}})});return new Ext.tree.TreePanel({title:a.wms_browser_name,root:c,rootVisible:!1,split:!0,autoScroll:!0,collapsible:!0,collapseMode:"mini",lines:!1,listeners:{checkchange:function(a,c){!0===c?b.addLayer(a.attributes.layer):b.removeLayer(a.attributes.layer)}}})},z=function(b){var a=b.object;b=a.map.s3;$("#"+b.id+" .layer_throbber").show().removeClass("hide");
-a=a.s3_layer_id;b=b.layers_loading;b.pop(a);b.push(a)},J=function(b){var a=b.map.s3,c=a.layers_loading;c.pop(b.s3_layer_id);0===c.length&&$("#"+a.id+" .layer_throbber").hide().addClass("hide")},A=function(b){J(b.object)},B=function(b){U(b.object.map)},ga=function(b){var a=b.s3,c=a.options;a.layers_all=[];a.dirs=[];a.layers_loading=[];if(c.layers_osm)for(var d=c.layers_osm,a=d.length;0<a;a--)va(b,d[a-1]);try{google&wa(b)}catch(f){}c.Bing&&xa(b);if(c.layers_tms)for(d=c.layers_tms,a=d.length;0<a;a--)ya(b,
-d[a-1]);if(c.layers_wms)for(d=c.layers_wms,a=d.length;0<a;a--)za(b,d[a-1]);if(c.layers_xyz)for(d=c.layers_xyz,a=d.length;0<a;a--)Aa(b,d[a-1]);c.EmptyLayer&&(a=new OpenLayers.Layer(c.EmptyLayer.name,{isBaseLayer:!0,displayInLayerSwitcher:!0,s3_layer_id:c.EmptyLayer.id,s3_layer_type:"empty"}),b.addLayer(a),c.EmptyLayer.base&&b.setBaseLayer(a));if(c.layers_js)for(d=c.layers_js,a=d.length;0<a;a--)eval(b,d[a-1]);if(c.layers_theme)for(d=c.layers_theme,a=d.length;0<a;a--)x(b,d[a-1]);if(c.layers_geojson)for(d=
-c.layers_geojson,a=d.length;0<a;a--)x(b,d[a-1]);if(c.layers_gpx)for(d=c.layers_gpx,a=d.length;0<a;a--)Ba(b,d[a-1]);if(c.layers_arcrest)for(d=c.layers_arcrest,a=d.length;0<a;a--)Ca(b,d[a-1]);c.CoordinateGrid&&Da(b);if(c.layers_georss)for(d=c.layers_georss,a=d.length;0<a;a--)x(b,d[a-1]);if(c.layers_kml)for(d=c.layers_kml,a=d.length;0<a;a--)Ea(b,d[a-1]);c.OWM&&Fa(b);if(c.layers_shapefile)for(d=c.layers_shapefile,a=d.length;0<a;a--)x(b,d[a-1]);if(c.layers_wfs)for(d=c.layers_wfs,a=d.length;0<a;a--)Ga(b,
-d[a-1]);if(c.feature_queries)for(d=c.feature_queries,a=d.length;0<a;a--)x(b,d[a-1]);if(c.feature_resources)for(d=c.feature_resources,a=d.length;0<a;a--)x(b,d[a-1]);if(c.layers_feature)for(d=c.layers_feature,a=d.length;0<a;a--)x(b,d[a-1]);if(c.features||c.draw_feature||c.draw_polygon||navigator.geolocation)var e=Ha(b);if(c.features)for(c=c.features,b=b.getProjectionObject(),a=0;a<c.length;a++)d=H.parseFeature(c[a]),d.geometry.transform(u,b),e.addFeatures([d])},Ca=function(b,a){var c=a.name,d=[a.url],
-f=void 0!=a.layers?a.layers.join():0;if(void 0!=a.dir){var e=a.dir;-1==$.inArray(e,b.s3.dirs)&&b.s3.dirs.push(e)}else e="";var g=void 0!=a.visibility?a.visibility:!0,c=new OpenLayers.Layer.ArcGIS93Rest(c,d,{layers:"show:"+f,isBaseLayer:void 0!=a.base?a.base:!1,transparent:void 0!=a.transparent?a.transparent:!0,dir:e,s3_layer_id:a.id,s3_layer_type:"arcrest"});c.setVisibility(g);b.addLayer(c);a._base&&b.setBaseLayer(c)},xa=function(b){var a=b.s3.options.Bing,c=a.ApiKey,d;a.Aerial&&(d=new OpenLayers.Layer.Bing({key:c,
-type:"Aerial",name:a.Aerial.name,s3_layer_id:a.Aerial.id,s3_layer_type:"bing"}),b.addLayer(d),"aerial"==a.Base&&b.setBaseLayer(d));a.Road&&(d=new OpenLayers.Layer.Bing({key:c,type:"Road",name:a.Road.name,s3_layer_id:a.Road.id,s3_layer_type:"bing"}),b.addLayer(d),"road"==a.Base&&b.setBaseLayer(d));a.Hybrid&&(d=new OpenLayers.Layer.Bing({key:c,type:"AerialWithLabels",name:a.Hybrid.name,s3_layer_id:a.Hybrid.id,s3_layer_type:"bing"}),b.addLayer(d),"hybrid"==a.Base&&b.setBaseLayer(d))},Da=function(b){var a=
-b.s3.options.CoordinateGrid;b.addLayer(new OpenLayers.Layer.cdauth.CoordinateGrid(null,{name:a.name,shortName:"grid",visibility:a.visibility,s3_layer_id:a.id,s3_layer_type:"coordinate"}))},Ha=function(b){var a=b.s3.options;if(a.draw_polygon&&!a.draw_feature)var c;else c=a.marker_default;a=F(b,{marker:c});a=new OpenLayers.Layer.Vector(i18n.gis_draft_layer,{displayInLayerSwitcher:!1,legendURL:a[1],styleMap:a[0]});a.setVisibility(!0);b.addLayer(a);return b.s3.draftLayer=a},x=function(b,a){var c=a.name,
-d=a.url,f=void 0!=a.refresh?a.refresh:900;if(void 0!=a.dir){var e=a.dir;-1==$.inArray(e,b.s3.dirs)&&b.s3.dirs.push(e)}else e="";var g=void 0!=a.visibility?a.visibility:!0,k=void 0!=a.cluster_attribute?a.cluster_attribute:"colour",m=void 0!=a.cluster_distance?a.cluster_distance:20,l=void 0!=a.cluster_threshold?a.cluster_threshold:2,n=void 0!=a.projection?a.projection:4326,n=4326==n?u:new OpenLayers.Projection("EPSG:"+n),r=void 0!=a.type?a.type:"feature",p='<div class="gis_layer_legend"><div class="gis_legend_title">'+
-c+"</div>";void 0!=a.desc&&(p+='<div class="gis_legend_desc">'+a.desc+"</div>");if(void 0!=a.src||void 0!=a.src_url){var h='<div class="gis_legend_src">';void 0!=a.src_url?(h+='<a href="'+a.src_url+'" target="_blank">',h=void 0!=a.src?h+a.src:h+a.src_url,h+="</a>"):h+=a.src;p+=h+"</div>"}var p=p+"</div>",t=F(b,a),h=t[0],t=t[1],s=[new OpenLayers.Strategy.BBOX({ratio:1.5})];f&&s.push(new OpenLayers.Strategy.Refresh({force:!0,interval:1E3*f}));l&&s.push(new OpenLayers.Strategy.AttributeCluster({attribute:k,
-distance:m,threshold:l}));c=new OpenLayers.Layer.Vector(c,{dir:e,projection:n,protocol:new OpenLayers.Protocol.HTTP({url:d,format:H}),strategies:s,legendURL:t,styleMap:h,s3_layer_id:a.id,s3_layer_type:r,s3_style:a.style});c.legendTitle=p;c.setVisibility(g);c.events.on({featureselected:C,featureunselected:E,loadstart:z,loadend:A,visibilitychanged:B});b.addLayer(c);b.s3.layers_all.push(c)},wa=function(b){var a=b.s3.options.Google,c;a.MapMaker||a.MapMakerHybrid?(a.Satellite&&(c=new OpenLayers.Layer.Google(a.Satellite.name,
-{type:G_SATELLITE_MAP,sphericalMercator:!0,s3_layer_id:a.Satellite.id,s3_layer_type:"google"}),b.addLayer(c),"satellite"==a.Base&&b.setBaseLayer(c)),a.Maps&&(c=new OpenLayers.Layer.Google(a.Maps.name,{type:G_NORMAL_MAP,sphericalMercator:!0,s3_layer_id:a.Maps.id,s3_layer_type:"google"}),b.addLayer(c),"maps"==a.Base&&b.setBaseLayer(c)),a.Hybrid&&(c=new OpenLayers.Layer.Google(a.Hybrid.name,{type:G_HYBRID_MAP,sphericalMercator:!0,s3_layer_id:a.Hybrid.id,s3_layer_type:"google"}),b.addLayer(c),"maps"==
-a.Base&&b.setBaseLayer(c)),a.Terrain&&(c=new OpenLayers.Layer.Google(a.Terrain.name,{type:G_PHYSICAL_MAP,sphericalMercator:!0,s3_layer_id:a.Terrain.id,s3_layer_type:"google"}),b.addLayer(c),"terrain"==a.Base&&b.setBaseLayer(c)),a.MapMaker&&(c=new OpenLayers.Layer.Google(a.MapMaker.name,{type:G_MAPMAKER_NORMAL_MAP,sphericalMercator:!0,s3_layer_id:c.id,s3_layer_type:"google"}),b.addLayer(c),"mapmaker"==a.Base&&b.setBaseLayer(c)),a.MapMakerHybrid&&(c=new OpenLayers.Layer.Google(a.MapMakerHybrid.name,
-{type:G_MAPMAKER_HYBRID_MAP,sphericalMercator:!0,s3_layer_id:c.id,s3_layer_type:"google"}),b.addLayer(c),"mapmakerhybrid"==a.Base&&b.setBaseLayer(c))):(a.Satellite&&(c=new OpenLayers.Layer.Google(a.Satellite.name,{type:"satellite",numZoomLevels:22,s3_layer_id:a.Satellite.id,s3_layer_type:"google"}),b.addLayer(c),"satellite"==a.Base&&b.setBaseLayer(c)),a.Maps&&(c=new OpenLayers.Layer.Google(a.Maps.name,{numZoomLevels:20,s3_layer_id:a.Maps.id,s3_layer_type:"google"}),b.addLayer(c),"maps"==a.Base&&b.setBaseLayer(c)),
-a.Hybrid&&(c=new OpenLayers.Layer.Google(a.Hybrid.name,{type:"hybrid",numZoomLevels:20,s3_layer_id:a.Hybrid.id,s3_layer_type:"google"}),b.addLayer(c),"hybrid"==a.Base&&b.setBaseLayer(c)),a.Terrain&&(c=new OpenLayers.Layer.Google(a.Terrain.name,{type:"terrain",s3_layer_id:a.Terrain.id,s3_layer_type:"google"}),b.addLayer(c),"terrain"==a.Base&&b.setBaseLayer(c)))},Ba=function(b,a){var c=a.name,d=a.url,f=a.marker,e=M+f.i,g=f.h,k=f.w,m=void 0!=a.waypoints?a.waypoints:!0,l=void 0!=a.tracks?a.tracks:!0,
-n=void 0!=a.routes?a.routes:!0,f=void 0!=a.visibility?a.visibility:!0;if(void 0!=a.dir){var r=a.dir;-1==$.inArray(r,b.s3.dirs)&&b.s3.dirs.push(r)}else r="";var p=void 0!=a.opacity?a.opacity:1,h=void 0!=a.cluster_distance?a.cluster_distance:20,t=void 0!=a.cluster_threshold?a.cluster_threshold:2,s=OpenLayers.Util.extend({},OpenLayers.Feature.Vector.style["default"]);m?(s.graphicOpacity=p,s.graphicWidth=k,s.graphicHeight=g,s.graphicXOffset=-(k/2),s.graphicYOffset=-g,s.externalGraphic=e):s.externalGraphic=
-"";s.strokeColor="blue";s.strokeWidth=6;s.strokeOpacity=p;c=new OpenLayers.Layer.Vector(c,{dir:r,projection:u,strategies:[new OpenLayers.Strategy.Fixed,new OpenLayers.Strategy.Cluster({distance:h,threshold:t})],legendURL:e,s3_layer_id:a.id,s3_layer_type:"gpx",style:s,protocol:new OpenLayers.Protocol.HTTP({url:d,format:new OpenLayers.Format.GPX({extractAttributes:!0,extractWaypoints:m,extractTracks:l,extractRoutes:n})})});c.setVisibility(f);c.events.on({featureselected:C,featureunselected:E,loadstart:z,
-loadend:A,visibilitychanged:B});b.addLayer(c);b.s3.layers_all.push(c)},Ea=function(b,a){var c=b.s3,d=a.name,f=a.url,e=void 0!=a.title?a.title:"name",g=void 0!=a.body?a.body:"description",k=void 0!=a.refresh?a.refresh:900,m=void 0!=a.visibility?a.visibility:!0;if(void 0!=a.dir){var l=a.dir;-1==$.inArray(l,c.dirs)&&c.dirs.push(l)}else l="";var n=void 0!=a.cluster_distance?a.cluster_distance:20,r=void 0!=a.cluster_threshold?a.cluster_threshold:2,p=F(b,a)[0],h=new OpenLayers.Format.KML({extractStyles:!0,
-extractAttributes:!0,maxDepth:2}),t=[new OpenLayers.Strategy.Fixed];k&&t.push(new OpenLayers.Strategy.Refresh({force:!0,interval:1E3*k}));r&&t.push(new OpenLayers.Strategy.Cluster({distance:n,threshold:r}));d=new OpenLayers.Layer.Vector(d,{dir:l,projection:u,protocol:new OpenLayers.Protocol.HTTP({url:f,format:h}),strategies:t,styleMap:p,s3_layer_id:a.id,s3_layer_type:"kml",s3_style:a.style});d.title=e;d.body=g;d.setVisibility(m);d.events.on({featureselected:C,featureunselected:E,loadstart:z,loadend:A,
-visibilitychanged:B});b.addLayer(d);c.layers_all.push(d)},va=function(b,a){var c=a.name,d=[a.url1];void 0!=a.url2&&d.push(a.url2);void 0!=a.url3&&d.push(a.url3);var f=void 0!=a.visibility?a.visibility:!0;if(void 0!=a.dir){var e=a.dir;-1==$.inArray(e,b.s3.dirs)&&b.s3.dirs.push(e)}else e="";c=new OpenLayers.Layer.TMS(c,d,{dir:e,type:"png",getURL:Y,displayOutsideMaxExtent:!0,numZoomLevels:void 0!=a.zoomLevels?a.zoomLevels:19,isBaseLayer:void 0!=a.base?a.base:!0,s3_layer_id:a.id,s3_layer_type:"openstreetmap"});
-void 0!=a.attribution&&(c.attribution=a.attribution);c.setVisibility(f);b.addLayer(c);a._base&&b.setBaseLayer(c)},Fa=function(b){var a=b.s3.options.OWM,c;a.station&&(c=new OpenLayers.Layer.Vector.OWMStations(a.station.name,{dir:a.station.dir,s3_layer_id:a.station.id,s3_layer_type:"openweathermap"}),c.setVisibility(a.station.visibility),c.events.on({featureselected:c.onSelect,featureunselected:c.onUnselect,loadstart:z,loadend:A,visibilitychanged:B}),b.addLayer(c),b.s3.layers_all.push(c));a.city&&(c=
-new OpenLayers.Layer.Vector.OWMWeather(a.city.name,{dir:a.city.dir,s3_layer_id:a.city.id,s3_layer_type:"openweathermap"}),c.setVisibility(a.city.visibility),c.events.on({featureselected:c.onSelect,featureunselected:c.onUnselect,loadstart:z,loadend:A,visibilitychanged:B}),b.addLayer(c),b.s3.layers_all.push(c))},ya=function(b,a){var c=a.name,d=[a.url];void 0!=a.url2&&d.push(a.url2);void 0!=a.url3&&d.push(a.url3);var f=a.layername,e=void 0!=a.zoomLevels?a.zoomLevels:19;if(void 0!=a.dir){var g=a.dir;
--1==$.inArray(g,b.s3.dirs)&&b.s3.dirs.push(g)}else g="";c=new OpenLayers.Layer.TMS(c,d,{dir:g,s3_layer_id:a.id,s3_layer_type:"tms",layername:f,type:void 0!=a.format?a.format:"png",numZoomLevels:e});void 0!=a.attribution&&(c.attribution=a.attribution);b.addLayer(c);a._base&&b.setBaseLayer(c)},Ga=function(b,a){var c=a.name,d=a.url;void 0!=a.username&&void 0!=a.password&&(d=d.replace("://","://"+a.username+":"+a.password+"@"));var f=a.title,e=a.featureType,g=void 0!=a.featureNS?a.featureNS:null,k=void 0!=
-a.schema?a.schema:null,m=void 0!=a.version?a.version:"1.1.0",l=void 0!=a.geometryName?a.geometryName:"the_geom",n=void 0!=a.visibility?a.visibility:!0;if(void 0!=a.dir){var r=a.dir;-1==$.inArray(r,b.s3.dirs)&&b.s3.dirs.push(r)}else r="";var p=void 0!=a.cluster_attribute?a.cluster_attribute:"colour",h=void 0!=a.cluster_distance?a.cluster_distance:20,t=void 0!=a.cluster_threshold?a.cluster_threshold:2,s=void 0!=a.refresh?a.refresh:!1,G=[new OpenLayers.Strategy.BBOX({ratio:1.5})];s&&G.push(new OpenLayers.Strategy.Refresh({force:!0,
-interval:1E3*s}));t&&G.push(new OpenLayers.Strategy.AttributeCluster({attribute:p,distance:h,threshold:t}));void 0!=a.projection?(p=a.projection,h="EPSG:"+p):(p="4326",h="EPSG:4326");e=new OpenLayers.Protocol.WFS({version:m,srsName:h,url:d,featureType:e,featureNS:g,geometryName:l,schema:k});d='<div class="gis_layer_legend"><div class="gis_legend_title">'+c+"</div>";void 0!=a.desc&&(d+='<div class="gis_legend_desc">'+a.desc+"</div>");if(void 0!=a.src||void 0!=a.src_url)g='<div class="gis_legend_src">',
-void 0!=a.src_url?(g+='<a href="'+a.src_url+'" target="_blank">',g=void 0!=a.src?g+a.src:g+a.src_url,g+="</a>"):g+=a.src,d+=g+"</div>";d+="</div>";k=F(b,a);g=k[0];k=k[1];p="4326"==p?u:new OpenLayers.Projection("EPSG:"+p);c=new OpenLayers.Layer.Vector(c,{maxFeatures:1E3,strategies:G,dir:r,legendURL:k,projection:p,protocol:e,styleMap:g,s3_layer_id:a.id,s3_layer_type:"wfs",s3_style:a.style});c.legendTitle=d;c.title=f;c.setVisibility(n);c.events.on({featureselected:C,featureunselected:E,loadstart:z,loadend:A,
-visibilitychanged:B});b.addLayer(c);b.s3.layers_all.push(c)},za=function(b,a){var c=a.name,d=a.url;a.username&&a.password&&(d=d.replace("://","://"+a.username+":"+a.password+"@"));var f=a.layers,e=void 0!=a.visibility?a.visibility:!0;if(void 0!=a.dir){var g=a.dir;-1==$.inArray(g,b.s3.dirs)&&b.s3.dirs.push(g)}else g="";var k=void 0!=a.base?a.base:!1,m=void 0!=a.transparent?a.transparent:!0,l=void 0!=a.format?a.format:"image/png",n=void 0!=a.version?a.version:"1.1.1",r=a.map?a.map:"",p=a.style?a.style:
-"",h=void 0!=a.bgcolor?"0x"+a.bgcolor:"",t=void 0!=a.buffer?a.buffer:0,s=void 0!=a.tiled?a.tiled:!1,u=void 0!=a.opacity?a.opacity:1,D=void 0!=a.queryable?a.queryable:1,w='<div class="gis_layer_legend"><div class="gis_legend_title">'+c+"</div>";void 0!=a.desc&&(w+='<div class="gis_legend_desc">'+a.desc+"</div>");if(b.s3.options.metadata){if(void 0!=a.post_id)if(i18n.gis_metadata)var v=i18n.gis_metadata,y=S3.Ap.concat("/cms/page/"+a.post_id);else v=i18n.gis_metadata_edit,y=S3.Ap.concat("/cms/post/"+
-a.post_id+"/update?layer_id="+a.id);else i18n.gis_metadata_create?(v=i18n.gis_metadata_create,y=S3.Ap.concat("/cms/post/create?layer_id="+a.id)):v="";v&&(w+='<div class="gis_legend_src"><a href="'+y+'" target="_blank">'+v+"</a></div>")}else if(void 0!=a.src||void 0!=a.src_url)v='<div class="gis_legend_src">',void 0!=a.src_url?(v+='<a href="'+a.src_url+'" target="_blank">',v=void 0!=a.src?v+a.src:v+a.src_url,v+="</a>"):v+=a.src,v+="</div>",w+=v;w+="</div>";if(void 0!=a.legendURL)var x=a.legendURL;
-c=new OpenLayers.Layer.WMS(c,d,{layers:f,transparent:m},{dir:g,wrapDateLine:!0,isBaseLayer:k,s3_layer_id:a.id,s3_layer_type:"wms",queryable:D,visibility:e});r&&(c.params.MAP=r);l&&(c.params.FORMAT=l);n&&(c.params.VERSION=n);p&&(c.params.STYLES=p);h&&(c.params.BGCOLOR=h);s&&(c.params.TILED=!0,c.params.TILESORIGIN=[b.maxExtent.left,b.maxExtent.bottom]);k||(c.opacity=u,c.buffer=t?t:0);c.legendTitle=w;x&&(c.legendURL=x);c.events.on({loadstart:z,loadend:A,visibilitychanged:B});b.addLayer(c);a._base&&b.setBaseLayer(c)},
-Aa=function(b,a){var c=a.name,d=[a.url];void 0!=a.url2&&d.push(a.url2);void 0!=a.url3&&d.push(a.url3);var f=a.layername,e=void 0!=a.zoomLevels?a.zoomLevels:19;if(void 0!=a.dir){var g=a.dir;-1==$.inArray(g,b.s3.dirs)&&b.s3.dirs.push(g)}else g="";c=new OpenLayers.Layer.XYZ(c,d,{dir:g,s3_layer_id:a.id,s3_layer_type:"xyz",layername:f,type:void 0!=a.format?a.format:"png",numZoomLevels:e});void 0!=a.attribution&&(c.attribution=a.attribution);b.addLayer(c);a._base&&b.setBaseLayer(c)},ha=function(b){var a=
-b.s3.options,c=new OpenLayers.Control.Navigation;a.no_zoom_wheel&&(c.zoomWheelEnabled=!1);b.addControl(c);void 0==a.zoomcontrol&&b.addControl(new OpenLayers.Control.Zoom);b.addControl(new OpenLayers.Control.ArgParser);b.addControl(new OpenLayers.Control.Attribution);void 0==a.scaleline&&b.addControl(new OpenLayers.Control.ScaleLine);"mgrs"==a.mouse_position?b.addControl(new OpenLayers.Control.MGRSMousePosition):a.mouse_position&&b.addControl(new OpenLayers.Control.MousePosition);void 0==a.permalink&&
-b.addControl(new OpenLayers.Control.Permalink);if(void 0==a.overview){var a={},c=b.options,d;for(d in c)"controls"!=d&&(a[d]=c[d]);b.addControl(new OpenLayers.Control.OverviewMap({mapOptions:a}))}Ia(b)},Ia=function(b){OpenLayers.Handler.FeatureS3=OpenLayers.Class(OpenLayers.Handler.Feature,{dblclick:function(a){this.map.zoomTo(this.map.zoom+1,a.xy);return!1},CLASS_NAME:"OpenLayers.Handler.FeatureS3"});var a=b.s3.layers_all,c=new OpenLayers.Control.SelectFeature(a,{toggle:!0});c.handlers.feature=new OpenLayers.Handler.FeatureS3(c,
-c.layer,c.callbacks,{geometryTypes:c.geometryTypes});a=new OpenLayers.Control.SelectFeature(a,{hover:!0,highlightOnly:!0,eventListeners:{featurehighlighted:Z,featureunhighlighted:K}});b.addControl(a);b.addControl(c);a.activate();c.activate()};S3.gis.loadClusterPopup=function(b,a,c){var d="#"+c+"_contentDiv",f=$(d);f.html(i18n.gis_loading+"...<div class='throbber'></div>");var e=S3.gis.maps[b];$.get(a,function(a){f.html(a);e.popups[0].updateSize();a=$(d+" .dropdown-toggle");a.length&&(f.parent().css("overflow",
-"visible").parent().css("overflow","visible"),a.dropdown())},"html")};S3.gis.zoomToSelectedFeature=function(b,a,c,d){b=S3.gis.maps[b];a=new OpenLayers.LonLat(a,c);d=b.getZoom()+d;b.setCenter(a,d);for(d=0;d<b.popups.length;d++)b.removePopup(b.popups[d])};var la=function(b){var a=b.map,c=a.s3.draftLayer,d={fillColor:"#000",fillOpacity:0.1,strokeWidth:0},f=new OpenLayers.Control.Geolocate({geolocationOptions:{enableHighAccuracy:!1,maximumAge:0,timeout:7E3}});a.addControl(f);f.events.register("locationupdated",
-this,function(b){c.removeAllFeatures();var f=new OpenLayers.Feature.Vector(OpenLayers.Geometry.Polygon.createRegularPolygon(new OpenLayers.Geometry.Point(b.point.x,b.point.y),b.position.coords.accuracy/2,40,0),{},d);c.addFeatures([new OpenLayers.Feature.Vector(b.point,{},{graphicName:"cross",strokeColor:"#f00",strokeWidth:2,fillOpacity:0,pointRadius:10}),f]);a.zoomToExtent(c.getDataExtent());ba(a,f)});f.events.register("locationfailed",this,function(){OpenLayers.Console.log("Location detection failed")});
-var e=new Ext.Toolbar.Button({iconCls:"geolocation",tooltip:i18n.gis_geoLocate,handler:function(){c.removeAllFeatures();f.activate()}});b.addButton(e)},ra=function(b){var a=b.map,c=a.s3,d=new Ext.Toolbar.Button({iconCls:"googleearth",tooltip:c.options.Google.Earth,enableToggle:!0,toggleHandler:function(b,d){!0===d?(c.mapPanelContainer.getLayout().setActiveItem(1),c.mapWin.items.items[0].collapse(),c.googleEarthPanel.on("pluginready",function(){var b=a.s3.options.layers_feature;if(b)for(var c=0;c<
-b.length;c++){var d=b[c];if(void 0!=d.visibility?d.visibility:1)d=S3.public_url+d.url.replace("geojson","kml"),google.earth.fetchKml(a.s3.googleEarthPanel.earth,d,ca)}})):(c.mapPanelContainer.getLayout().setActiveItem(0),c.mapWin.items.items[0].expand())}});b.addSeparator();b.addButton(d)},qa=function(b){var a=b.map;StreetviewClicker=new (OpenLayers.Class(OpenLayers.Control,{defaults:{pixelTolerance:1,stopSingle:!0},initialize:function(a){this.handlerOptions=OpenLayers.Util.extend({},this.defaults);
-OpenLayers.Control.prototype.initialize.apply(this,arguments);this.handler=new OpenLayers.Handler.Click(this,{click:this.trigger},this.handlerOptions)},trigger:function(b){(b=a.getLonLatFromViewPortPx(b.xy))||(b=a.getCenter());a.s3.sv_popup&&a.s3.sv_popup.anc&&a.s3.sv_popup.close();a.s3.sv_popup=new GeoExt.Popup({title:a.s3.options.Google.StreetviewTitle,location:b,width:300,height:300,collapsible:!0,map:a.s3.mapPanel,items:[new gxp.GoogleStreetViewPanel]});a.s3.sv_popup.show()}}))({autoactivate:!1});
-a.addControl(StreetviewClicker);var c=new Ext.Toolbar.Button({iconCls:"streetview",tooltip:a.s3.options.Google.StreetviewButton,allowDepress:!0,enableToggle:!0,toggleGroup:"controls",toggleHandler:function(a,b){!0===b?StreetviewClicker.activate():StreetviewClicker.deactivate()}});b.addSeparator();b.addButton(c)},na=function(b){var a=b.map,c=new OpenLayers.Style;c.addRules([new OpenLayers.Rule({symbolizer:{Point:{pointRadius:5,graphicName:"circle",fillColor:"white",fillOpacity:1,strokeWidth:1,strokeOpacity:1,
-strokeColor:"#f5902e"},Line:{strokeWidth:3,strokeOpacity:1,strokeColor:"#f5902e",strokeDashstyle:"dash"},Polygon:{strokeWidth:2,strokeOpacity:1,strokeColor:"#f5902e",fillColor:"white",fillOpacity:0.5}}})]);var c=new OpenLayers.StyleMap({"default":c}),d=new OpenLayers.Control.Measure(OpenLayers.Handler.Path,{geodesic:!0,persist:!0,handlerOptions:{layerOptions:{styleMap:c}}});d.events.on({measure:function(a){alert(i18n.gis_length_message+" "+a.measure.toFixed(2)+" "+a.units)}});d=new GeoExt.Action({control:d,
-map:a,iconCls:"measure-off",tooltip:i18n.gis_length_tooltip,allowDepress:!0,enableToggle:!0,toggleGroup:"controls"});b.add(d);!1===a.s3.options.area&&(c=new OpenLayers.Control.Measure(OpenLayers.Handler.Polygon,{geodesic:!0,persist:!0,handlerOptions:{layerOptions:{styleMap:c}}}),c.events.on({measure:function(a){alert(i18n.gis_area_message+" "+a.measure.toFixed(2)+" "+a.units+"2")}}),a=new GeoExt.Action({control:c,map:a,iconCls:"measure-area",tooltip:i18n.gis_area_tooltip,allowDepress:!0,enableToggle:!0,
-toggleGroup:"controls"}),b.add(a))},ka=function(b,a){var c=b.s3.id;$("#"+c).append('<div class="map_legend_div"><div class="map_legend_tab right"></div><div class="map_legend_panel"></div></div>');a=new GeoExt.LegendPanel({title:i18n.gis_legend,autoScroll:!0,border:!1});var d=$("#"+c+" .map_legend_panel"),d=Ext.get(d[0]);a.render(d);$("#"+c+" .map_legend_tab").click(function(){if($(this).hasClass("right")){var a=b.s3.id,c=$("#"+a+" .map_legend_panel").outerWidth();$("#"+a+" .map_legend_div").animate({marginRight:"-"+
-c+"px"});$("#"+a+" .map_legend_tab").removeClass("right").addClass("left")}else U(b)})},U=function(b){b=b.s3.id;$("#"+b+" .map_legend_div").animate({marginRight:0});$("#"+b+" .map_legend_tab").removeClass("left").addClass("right")},R=function(b,a,c){OpenLayers.Handler.PointS3=OpenLayers.Class(OpenLayers.Handler.Point,{dblclick:function(a){return!0},CLASS_NAME:"OpenLayers.Handler.PointS3"});var d=b.s3.draftLayer,f=new OpenLayers.Control.DrawFeature(d,OpenLayers.Handler.PointS3,{featureAdded:function(a){b.s3.lastDraftFeature?
-b.s3.lastDraftFeature.destroy():1<d.features.length&&d.features[0].destroy();var c=$("#gis_location_lon");if(c.length){var f=a.geometry.getBounds().getCenterLonLat();f.transform(b.getProjectionObject(),u);c.val(f.lon);$("#gis_location_lat").val(f.lat);$("#gis_location_wkt").val("")}b.s3.lastDraftFeature=a}});if(a){var e=new GeoExt.Action({control:f,handler:function(){e.items[0].pressed?$(".olMapViewport").addClass("crosshair"):$(".olMapViewport").removeClass("crosshair")},map:b,iconCls:"drawpoint-off",
-tooltip:i18n.gis_draw_feature,allowDepress:!0,enableToggle:!0,toggleGroup:"controls",pressed:c});a.add(e);b.s3.pointButton=e}else b.addControl(f),c&&(f.activate(),$(".olMapViewport").addClass("crosshair"))},S=function(b,a,c){var d=b.s3.draftLayer,f=new OpenLayers.Control.DrawFeature(d,OpenLayers.Handler.Path,{featureAdded:function(a){b.s3.lastDraftFeature?b.s3.lastDraftFeature.destroy():1<d.features.length&&d.features[0].destroy();b.s3.lastDraftFeature=a}});if(a){var e=new GeoExt.Action({control:f,
-handler:function(){e.items[0].pressed?$(".olMapViewport").addClass("crosshair"):$(".olMapViewport").removeClass("crosshair")},map:b,iconCls:"drawline-off",tooltip:i18n.gis_draw_line,allowDepress:!0,enableToggle:!0,toggleGroup:"controls",pressed:c,activateOnEnable:!0,deactivateOnDisable:!0});a.add(e);b.s3.lineButton=e}else b.addControl(f),c&&(f.activate(),$(".olMapViewport").addClass("crosshair"))},T=function(b,a,c,d){var f=b.s3.draftLayer;d=new OpenLayers.Control.DrawFeature(f,d?OpenLayers.Handler.Polygon:
-OpenLayers.Handler.RegularPolygon,{handlerOptions:d?{sides:4,snapAngle:90}:{},featureAdded:function(a){b.s3.lastDraftFeature?b.s3.lastDraftFeature.destroy():1<f.features.length&&f.features[0].destroy();var c=$("#gis_location_wkt");if(c.length){var d=a.geometry.transform(b.getProjectionObject(),u).toString();c.val(d);$("#gis_location_lat").val("");$("#gis_location_lon").val("")}else c=$("#gis_search_polygon_input"),c.length&&(d=a.geometry.transform(b.getProjectionObject(),u).toString(),c.val(d).trigger("change"));
-b.s3.lastDraftFeature=a}});if(a){var e=new GeoExt.Action({control:d,handler:function(){e.items[0].pressed?$(".olMapViewport").addClass("crosshair"):$(".olMapViewport").removeClass("crosshair")},map:b,iconCls:"drawpolygon-off",tooltip:i18n.gis_draw_polygon,allowDepress:!0,enableToggle:!0,toggleGroup:"controls",pressed:c,activateOnEnable:!0,deactivateOnDisable:!0});a.add(e);b.s3.polygonButton=e}else b.addControl(d),c&&(d.activate(),$(".olMapViewport").addClass("crosshair"))},pa=function(b){var a=b.map,
-c=new Ext.Toolbar.Button({iconCls:"potlatch",tooltip:i18n.gis_potlatch,handler:function(){var b=a.getZoom();if(14>b)alert(i18n.gis_osm_zoom_closer);else{var c=a.getCenter();c.transform(a.getProjectionObject(),u);b=S3.Ap.concat("/gis/potlatch2/potlatch2.html")+"?lat="+c.lat+"&lon="+c.lon+"&zoom="+b;window.open(b)}}});b.addSeparator();b.addButton(c)},ma=function(b){var a=new Ext.Toolbar.Button({iconCls:"save",tooltip:i18n.gis_save,handler:function(){V(b.map)}});b.addSeparator();b.addButton(a)},sa=function(b){var a=
-b.s3,c=a.id;if(!$("#"+c+" .map_save_panel").length){var d='<div class="fleft"><div class="map_save_name">';(a=a.options.config_name)&&(d+=a);d='<div class="map_save_panel off">'+(d+"</div></div>")+'<div class="btn map_save_button"><div class="map_save_label">'+i18n.gis_save_map+"</div></div></div>";$("#"+c).append(d);a&&$("#"+c+" .map_save_panel").removeClass("off");$("#"+c+" .map_save_button").click(function(){W(b)})}},W=function(b){var a=b.s3.id;$("#"+a+" .map_save_panel").removeClass("off");$("#"+
-a+" .map_save_panel .saved").remove();$("#"+a+" .map_save_panel .fleft").show();$("#"+a+" .map_save_label").html(i18n.save);X(b)},X=function(b){var a=b.s3,c=a.id,d=a.options,f=d.config_id,e=d.config_name?d.config_name:"",g=$("#"+c+" .map_save_button"),k=c+"_save",a=$("#"+k);a.length||(a='<div class="hint">'+('<label for="'+k+'">'+i18n.gis_name_map+"</label>")+('<input id="'+k+'" value="'+e+'">')+"</div>",f='<div class="new_map"><input type="checkbox" class="checkbox"'+(f?"":' disabled="disabled" checked="checked"')+
-">"+i18n.gis_new_map+"</div>",$("#"+c+" .map_save_panel .fleft").html(a+f),$("#"+c+" .map_save_panel label").labelOver("over"));g.unbind("click").click(function(){V(b);var a=$("#"+c+"_save").val();$("#"+c+" .map_save_name").html(a);d.config_name=a;a=d.pe_id?"?~.pe_id__belongs="+d.pe_id:"";a='<div class="saved"><p><i>'+i18n.saved+'</i></p><p><a href="'+S3.Ap.concat("/gis/config")+a+'">'+i18n.gis_my_maps+"</a></p></div>";$("#"+c+" .map_save_panel .fleft").hide().before(a);$("#"+c+" .map_save_panel .checkbox").prop("checked",
-!1).prop("disabled",!1);g.unbind("click").click(function(){W(b)})});var m=$("#"+c+" .map_save_panel");$("html").unbind("click.cancelSave").bind("click.cancelSave",function(){m.addClass("off");g.unbind("click").click(function(){m.removeClass("off").unbind("click");X(b)})});m.click(function(a){a.stopPropagation()})},V=function(b){var a=da(b),c=Ext.util.JSON.encode,d=c(a.layers),c=c(a.plugins),a={lat:a.lat,lon:a.lon,zoom:a.zoom,layers:d,plugins:c};b=b.s3;var f=b.options;f.pe_id&&(a.pe_id=f.pe_id);d=
-b.id;c=$("#"+d+"_save");b=f.config_id;c.length?(a.name=c.val(),d=b?!$("#"+d+' .map_save_panel input[type="checkbox"]').prop("checked"):!1):d=b?!0:!1;b=d?S3.Ap.concat("/gis/config/"+b+".url/update"):S3.Ap.concat("/gis/config.url/create");Ext.Ajax.request({url:b,method:"POST",success:function(a,b){var c=Ext.decode(a.responseText).message.split("=",2)[1];if(c){f.config_id=c;if(history.pushState)if(document.location.search)for(var d=document.location.search.split("?")[1].split("&"),l=[],n=0;n<d.length;n++){if(l=
-d[n].split("="),"config"==decodeURIComponent(l[0])&&decodeURIComponent(l[1])!=c){d[n]="config="+c;d=document.location.pathname+"?"+d.join("&");window.history.pushState({},document.title,d);break}}else if(document.location.pathname==S3.Ap.concat("/gis/index")||document.location.pathname==S3.Ap.concat("/gis/map_viewing_client"))d=document.location.pathname+"?config="+c,window.history.pushState({},document.title,d);d=S3.Ap.concat("/gis/config/",c,"/layer_entity");$("#gis_menu_config").attr("href",d)}},
-params:a})},oa=function(b){var a=b.map,c=a.s3.options;selectPdfControl=new OpenLayers.Control;OpenLayers.Util.extend(selectPdfControl,{draw:function(){this.box=new OpenLayers.Handler.Box(this,{done:this.getPdf});this.box.activate()},response:function(a){this.w.destroy();a=(new OpenLayers.Format.GML).read(a.responseText);var b=a.length+" pdfs. <br /><ul>";if(a.length)for(var c=0;c<a.length;c++)var d=a[c],b=b+("<li><a href='"+a[c].attributes.url+"'>"+(d.attributes.utm_zone+d.attributes.grid_zone+d.attributes.grid_square+
-d.attributes.easting+d.attributes.northing)+"</a></li>");this.w=new Ext.Window({html:b+"</ul>",width:300,title:"Results",height:200});this.w.show()},getPdf:function(b){var d=a.getProjectionObject(),g=a.getLonLatFromPixel(new OpenLayers.Pixel(b.left,b.bottom)).transform(d,u);b=a.getLonLatFromPixel(new OpenLayers.Pixel(b.right,b.top)).transform(d,u);bbox=(new OpenLayers.Bounds(g.lon,g.lat,b.lon,b.lat)).toBBOX();OpenLayers.Request.GET({url:c.mgrs_url+"&bbox="+bbox,callback:OpenLayers.Function.bind(this.response,
-this)});this.w=new Ext.Window({html:"Searching "+c.mgrs_name+", please wait.",width:200,title:"Please Wait."});this.w.show()}});var d="Select "+c.mgrs_name,d=new GeoExt.Action({text:d,control:selectPdfControl,map:a,allowDepress:!1,toggleGroup:"controls",tooltip:d});b.addSeparator();b.add(d)},ta=function(b,a){var c=new gxp.plugins.AddLayers({actionTarget:"treepanel.tbar",addActionTip:"Add layers",addActionMenuText:"Add layers",addServerText:"Add a New Server",doneText:"Done",upload:{url:null},uploadText:i18n.gis_uploadlayer,
-relativeUploadOnly:!1}),d=new GeoExt.data.LayerStore;c.target=a;a.proxy=OpenLayers.ProxyHost;a.layerSources={};a.layerSources.local=new gxp.plugins.LayerSource({title:"local",store:d});c.addActions()[0].enable();c=new gxp.plugins.RemoveLayer({actionTarget:"treepanel.tbar",removeActionTip:"Remove layer"});c.target=a;a.mapPanel=b.s3.mapPanel;c.addActions()},ua=function(b,a){var c=b.s3.propertiesWindow,d=new Ext.Toolbar.Button({iconCls:"gxp-icon-layerproperties",tooltip:i18n.gis_properties,handler:function(){var d=
-a.root.findChildBy(function(a){return a.isSelected()?a.leaf?!0:!1:!1},null,!0);if(d){var e=d.layer.s3_layer_type,g=S3.Ap.concat("/gis/layer_"+e+".plain?layer_"+e+".layer_id="+d.layer.s3_layer_id+"&update=1");Ext.Ajax.request({url:g,method:"GET",success:function(a,g){c&&c.close();var l;"feature"==e?(l=new Ext.TabPanel({activeTab:0,items:[{title:"Layer Properties",html:a.responseText},{title:"Filter",id:"s3_gis_layer_filter_tab",html:""}]}),l.items.items[1].on("activate",function(){var a;Ext.iterate(b.s3.layers_feature,
-function(b,c,e){b.id==d.layer.s3_layer_id&&(a=b.url.replace(/.geojson.+/,"/search.plain"))});Ext.get("s3_gis_layer_filter_tab").load({url:a,discardUrl:!1,callback:function(){S3.addTooltips();S3.search.select_letter_label()},text:"Loading...",timeout:30,scripts:!1})})):l=new Ext.Panel({title:"Layer Properties",html:a.responseText});c=new Ext.Window({width:400,layout:"fit",items:[l]});c.show();$("#plain form").submit(function(){var a=$('#plain input[name="id"]').val(),a=S3.Ap.concat("/gis/layer_"+e+
-"/"+a+".plain/update"),b=$("#plain input"),c=[];Ext.iterate(b,function(a,b,d){b.id&&-1!=b.id.indexOf("gis_layer_")&&c.push(b.id)});b=[];for(i=0;i<c.length;i++)(q=$("#"+c[i]).serialize())&&b.push(q);(q=$('#plain input[name="id"]').serialize())&&b.push(q);(q=$('#plain input[name="_formkey"]').serialize())&&b.push(q);(q=$('#plain input[name="_formname"]').serialize())&&b.push(q);0<b.length&&(b=b.join("&"),$.ajax({type:"POST",url:a,data:b}).done(function(a){$("#plain").html(a)}));return!1});S3.addTooltips();
-S3.autocomplete("role","admin","group","gis_layer_"+e+"_role_required")}})}}});a.getTopToolbar().add(d)},F=function(b,a){if(void 0!=a.marker)var c=a.marker,d=M+c.i,f=c.h,e=c.w;else d="";var g=a.opacity||1,k=a.style,c=new OpenLayers.Style({label:"${label}",labelAlign:"cm",pointRadius:"${radius}",fillColor:"${fill}",fillOpacity:"${fillOpacity}",strokeColor:"${stroke}",strokeWidth:"${strokeWidth}",strokeOpacity:"${strokeOpacity}",graphicWidth:"${graphicWidth}",graphicHeight:"${graphicHeight}",graphicXOffset:"${graphicXOffset}",
-graphicYOffset:"${graphicYOffset}",graphicOpacity:g,graphicName:"${graphicName}",externalGraphic:"${externalGraphic}"},{context:{graphicWidth:function(a){var b=1;a.cluster||(a.attributes.marker_width?b=a.attributes.marker_width:void 0!=e&&(b=e));return b},graphicHeight:function(a){var b=1;a.cluster||(a.attributes.marker_height?b=a.attributes.marker_height:void 0!=f&&(b=f));return b},graphicXOffset:function(a){var b=-1;a.cluster||(a.attributes.marker_width?b=-(a.attributes.marker_width/2):void 0!=
-e&&(b=-(e/2)));return b},graphicYOffset:function(a){var b=-1;a.cluster||(a.attributes.marker_height?b=-a.attributes.marker_height:void 0!=f&&(b=-f));return b},graphicName:function(a){var b="circle";a.cluster||(a.attributes.shape?b=a.attributes.shape:k&&!m&&void 0!=k.graphic&&(b=k.graphic));return b},externalGraphic:function(a){var b="";if(!a.cluster)if(a.attributes.marker_url)b=a.attributes.marker_url;else if(k)m||void 0!=k.externalGraphic&&(b=S3.Ap.concat("/static/"+k.externalGraphic));else return d;
-return b},radius:function(a){var b=10;a.cluster?b=Math.min(a.attributes.count/2,8)+10:a.attributes.size?b=a.attributes.size:k&&!m&&(b=k.size);return b},fill:function(a){var b;a.cluster?b=a.cluster[0].attributes.colour?a.cluster[0].attributes.colour:"#8087ff":a.attributes.colour?b=a.attributes.colour:k?(m||(b=k.fill),b=void 0!=b?"#"+b:"#000000"):b="#f5902e";return b},fillOpacity:function(a){var b;a.cluster?b=a.cluster[0].attributes.opacity?a.cluster[0].attributes.opacity:g:a.attributes.opacity?b=a.attributes.opacity:
-k&&!m&&(b=k.fillOpacity);return b||g},stroke:function(a){var b;a.cluster?b=a.cluster[0].attributes.colour?a.cluster[0].attributes.colour:"#2b2f76":a.attributes.colour?b=a.attributes.colour:k?(m||(b=k.stroke||k.fill),b=void 0!=b?"#"+b:"#000000"):b="#f5902e";return b},strokeOpacity:function(a){var b;a.cluster?b=a.cluster[0].attributes.opacity?a.cluster[0].attributes.opacity:g:a.attributes.opacity?b=a.attributes.opacity:k&&!m&&(b=k.strokeOpacity);return b||g},strokeWidth:function(a){var b=2;a.cluster?
-a.cluster[0].attributes.strokeWidth&&(b=a.cluster[0].attributes.strokeWidth):k&&!m&&(b=k.strokeWidth);return b||2},label:function(a){var b;a.cluster?1<a.attributes.count&&(b=a.attributes.count):a.layer&&void 0!=a.layer.s3_style&&(a=a.layer.s3_style,!m&&a.show_label&&(b=a.label));return b||""}}}),m="[object Array]"===Object.prototype.toString.call(k)?!0:!1;if(m){var l=[],n,r,p,h,t,s,u,x,w,v,y,z,A,B,C;$.each(k,function(a,b){n=void 0!=b.prop?b.prop:"value";void 0!=b.cat?(t=b.cat,h=b.label||t,r=new OpenLayers.Filter.Comparison({type:OpenLayers.Filter.Comparison.EQUAL_TO,
-property:n,value:t})):(h=b.label||b.low+"-"+b.high,r=new OpenLayers.Filter.Comparison({type:OpenLayers.Filter.Comparison.BETWEEN,property:n,lowerBoundary:b.low,upperBoundary:b.high}));if(void 0!=b.externalGraphic){s=S3.Ap.concat("/static/"+b.externalGraphic);var c=new Image;c.src=s;u=c.height;x=c.width;w=-(x/2);v=-u}else s="",x=u=1,v=w=-1;void 0!=b.fill?y="#"+b.fill:void 0!=b.stroke&&(y="#"+b.stroke);z=void 0!=b.fillOpacity?b.fillOpacity:g;B=void 0!=b.strokeOpacity?b.strokeOpacity:1;graphic=void 0!=
-b.graphic?b.graphic:"square";A=void 0!=b.size?b.size:10;C=void 0!=b.strokeWidth?b.strokeWidth:2;p=new OpenLayers.Rule({filter:r,symbolizer:{externalGraphic:s,fillColor:y,fillOpacity:z,strokeColor:y,strokeOpacity:B,strokeWidth:C,graphicName:graphic,graphicHeight:u,graphicWidth:x,graphicXOffset:w,graphicYOffset:v,pointRadius:A},title:h});l.push(p)});0!=a.cluster_threshold&&(p=new OpenLayers.Rule({elseFilter:!0,title:" "}),l.push(p));c.addRules(l)}return[new OpenLayers.StyleMap({"default":c,select:1!=
-g?{graphicOpacity:1}:{fillColor:"#ffdc33",strokeColor:"#ff9933"}}),d]}})();
+S3.gis.maps={};S3.gis.proj4326=new OpenLayers.Projection('EPSG:4326');OpenLayers.ImgPath=S3.Ap.concat('/static/img/gis/openlayers/');OpenLayers.IMAGE_RELOAD_ATTEMPTS=3;OpenLayers.Util.onImageLoadErrorColor='transparent';OpenLayers.ProxyHost=S3.Ap.concat('/gis/proxy?url=');(function(){var format_geojson=new OpenLayers.Format.GeoJSON();format_geojson.ignoreExtraDims=true;var marker_url_path=S3.Ap.concat('/static/img/markers/');var proj4326=S3.gis.proj4326;var DEFAULT_FILL='#f5902e';var cluster_distance_default=20;var cluster_threshold_default=2;S3.gis.show_map=function(map_id,options){if(!map_id){map_id='default_map';}
+if(undefined==options){options=S3.gis.options[map_id];}
+var projection=options.projection;var projection_current=new OpenLayers.Projection('EPSG:'+projection);options.projection_current=projection_current;if(projection==900913){options.maxExtent=new OpenLayers.Bounds(-20037508.34,-20037508.34,20037508.34,20037508.34);options.maxResolution=156543.0339;options.units='m';}else if(projection==4326){options.maxExtent=new OpenLayers.Bounds(-180,-90,180,90);options.maxResolution=1.40625;options.units='degrees';}else{var maxExtent=options.maxExtent.split(',');options.maxExtent=new OpenLayers.Bounds(maxExtent[0],maxExtent[1],maxExtent[2],maxExtent[3]);options.maxResolution='auto';}
+var bounds;var lat=options.lat;var lon=options.lon;if(lat&&lon){var center=new OpenLayers.LonLat(lon,lat);center.transform(proj4326,projection_current);}else{bounds=OpenLayers.Bounds.fromArray(options.bbox).transform(proj4326,projection_current);var center=bounds.getCenterLonLat();}
+options.center=center;var map=addMap(map_id,options);map.Z_INDEX_BASE.Popup=800;options.renderTo='map_panel';addMapUI(map);if(bounds){map.zoomToExtent(bounds);}
+return map;};var search_layer_loadend=function(event){var layer=event.object;var bounds=layer.getDataExtent();if(bounds){var min_size=0.05;var map=layer.map;var current_projection=map.getProjectionObject();bounds.transform(current_projection,proj4326);var bbox=bounds.toArray();var lon_min=bbox[0],lat_min=bbox[1],lon_max=bbox[2],lat_max=bbox[3];var delta=(min_size-(lon_max-lon_min))/2;if(delta>0){lon_min-=delta;lon_max+=delta;}
+delta=(min_size-(lat_max-lat_min))/2;if(delta>0){lat_min-=delta;lat_max+=delta;}
+var inset=0.007;lon_min-=inset;lon_max+=inset;lat_min-=inset;lat_max+=inset;bounds=new OpenLayers.Bounds(lon_min,lat_min,lon_max,lat_max);bounds.transform(proj4326,current_projection);map.zoomToExtent(bounds);}
+var strategy,strategies=layer.strategies;for(var i=0,len=strategies.length;i<len;i++){strategy=strategies[i];if(strategy.CLASS_NAME=='OpenLayers.Strategy.AttributeCluster'){strategy.activate();strategy.features=layer.features;strategy.recluster();break;}}
+layer.events.un({'loadend':search_layer_loadend});}
+S3.gis.search_layer_loadend=search_layer_loadend;S3.gis.refreshLayer=function(layer_id,queries){var maps=S3.gis.maps;var map_id,map,layers,i,len,layer,url,strategies,j,jlen,strategy;for(map_id in maps){map=maps[map_id];layers=map.layers;for(i=0,len=layers.length;i<len;i++){layer=layers[i];if(layer.s3_layer_id==layer_id){url=layer.protocol.url;url=S3.search.filterURL(url,queries);layer.protocol.options.url=url;if(map.s3.mapWin.isVisible()){layer.events.on({'loadend':search_layer_loadend});strategies=layer.strategies;jlen=strategies.length;for(j=0;j<jlen;j++){strategy=strategies[j];if(strategy.CLASS_NAME=='OpenLayers.Strategy.AttributeCluster'){strategy.deactivate();break;}}
+if(layer.visibility){for(j=0;j<jlen;j++){strategy=strategies[j];if(strategy.CLASS_NAME=='OpenLayers.Strategy.Refresh'){strategy.refresh();break;}}}else{layer.setVisibility(true);}}}}}}
+var addMap=function(map_id,options){if(i18n.gis_name_map){var fallThrough=true;}else{var fallThrough=false;}
+var map_options={controls:[],displayProjection:proj4326,projection:options.projection_current,fallThrough:fallThrough,theme:null,maxResolution:options.maxResolution,maxExtent:options.maxExtent,numZoomLevels:options.numZoomLevels,units:options.units};var map=new OpenLayers.Map('center',map_options);S3.gis.maps[map_id]=map;map.s3={};map.s3.id=map_id;map.s3.options=options;map.s3.plugins=[];map.registerPlugin=function(plugin){plugin.map=this;this.s3.plugins.push(plugin);}
+addLayers(map);addControls(map);return map;}
+var addMapUI=function(map){var s3=map.s3;var options=s3.options;var mapPanel=new GeoExt.MapPanel({xtype:'gx_mappanel',map:map,center:options.center,zoom:options.zoom,plugins:[]});s3.mapPanel=mapPanel;var portal={};portal.map=mapPanel;s3.portal=portal;if(options.legend||options.layers_wms){var layers=map.layers;var mp_items=mapPanel.layers.data.items;for(var i=0;i<layers.length;i++){if(layers[i].legendURL){mp_items[i].data.legendURL=layers[i].legendURL;}
+if(layers[i].legendTitle){mp_items[i].data.title=layers[i].legendTitle;}
+if(layers[i].queryable){mp_items[i].data.queryable=1;}}}
+var layerTree=addLayerTree(map);var west_panel_items=[layerTree];if(options.wms_browser_url){var wmsBrowser=addWMSBrowser(map);if(wmsBrowser){west_panel_items.push(wmsBrowser);}}
+if(options.legend){if(options.legend=='float'){addLegendPanel(map);}else{var legendPanel=new GeoExt.LegendPanel({title:i18n.gis_legend,defaults:{},autoScroll:true,collapsible:true,collapseMode:'mini'});west_panel_items.push(legendPanel);}}
+var plugins=s3.plugins;for(var j=0,len=plugins.length;j<len;++j){plugins[j].setup(map);plugins[j].addToMapWindow(west_panel_items);}
+s3.west_panel_items=west_panel_items;if(options.window){addMapWindow(map);}else{addMapPanel(map);}
+var westPanelContainer=s3.westPanelContainer;westPanelContainer.fireEvent('collapse');window.setTimeout(function(){westPanelContainer.fireEvent('expand')},300);layerTree.root.eachChild(function(){this.eachChild(function(){if(this.isLeaf()){this.on('checkchange',function(event,checked){if(!checked){hideThrobber(this.layer);}});}else{this.eachChild(function(){if(this.isLeaf()){this.on('checkchange',function(event,checked){if(!checked){hideThrobber(this.layer);}});}});}});});Ext.QuickTips.init();}
+var addMapPanel=function(map){var s3=map.s3;var options=s3.options;var westPanelContainer=addWestPanel(map);var mapPanelContainer=addMapPanelContainer(map);var mapWin=new Ext.Panel({renderTo:options.renderTo,autoWidth:true,titleCollapse:true,height:options.map_height,layout:'border',items:[westPanelContainer,mapPanelContainer]});s3.mapWin=mapWin;}
+S3.gis.addMapPanel=addMapPanel;var addMapWindow=function(map){var s3=map.s3;var options=s3.options;var westPanelContainer=addWestPanel(map);var mapPanelContainer=addMapPanelContainer(map);var mapWin=new Ext.Window({cls:'gis-map-window',collapsible:false,constrain:true,closable:!options.windowNotClosable,closeAction:'hide',autoScroll:true,maximizable:options.maximizable,titleCollapse:false,height:options.map_height,width:options.map_width,layout:'border',items:[westPanelContainer,mapPanelContainer]});mapWin.on("beforehide",function(mw){if(mw.maximized){mw.restore();}});if(!options.windowHide){mapWin.show();mapWin.maximize();}
+s3.mapWin=mapWin;}
+S3.gis.addMapWindow=addMapWindow;var addWestPanel=function(map){var s3=map.s3;var west_collapsed=s3.options.west_collapsed||false;var mapWestPanel=new Ext.Panel({header:false,border:false,split:true,items:s3.west_panel_items});if(Ext.isChrome){autoWidth=false;}else{autoWidth=true;}
+var westPanelContainer=new Ext.Panel({cls:'gis_west',region:'west',header:false,border:true,autoWidth:autoWidth,width:250,collapsible:true,collapseMode:'mini',collapsed:west_collapsed,items:[mapWestPanel]});s3.westPanelContainer=westPanelContainer;return westPanelContainer;}
+var addMapPanelContainer=function(map){var s3=map.s3;var options=s3.options;if(options.toolbar){var toolbar=addToolbar(map);}else{if(options.draw_feature){if(options.draw_feature=='active'){var active=true;}else{var active=false;}
+addPointControl(map,null,active);}
+if(options.draw_line){if(options.draw_line=='active'){var active=true;}else{var active=false;}
+addLineControl(map,null,active);}
+if(options.draw_polygon){if(options.draw_polygon=='active'){var active=true;}else{var active=false;}
+addPolygonControl(map,null,active,true);}
+if(options.save){addSavePanel(map);}
+addThrobber(map);}
+var mapPanelContainer=new Ext.Panel({layout:'card',region:'center',cls:'mappnlcntr',defaults:{border:false},items:[s3.mapPanel],activeItem:0,tbar:toolbar,scope:this});s3.mapPanelContainer=mapPanelContainer;if(options.Google&&options.Google.Earth){var googleEarthPanel=new gxp.GoogleEarthPanel({mapPanel:s3.mapPanel});mapPanelContainer.items.items.push(googleEarthPanel);s3.googleEarthPanel=googleEarthPanel;S3.gis.googleEarthPanel=googleEarthPanel;}
+return mapPanelContainer;}
+var addLayerTree=function(map){GeoExt.tree.LayerNodeUIS3=Ext.extend(GeoExt.tree.LayerNodeUI,{onClick:function(e){if(e.getTarget('.x-tree-node-cb',1)){var node=this.node;var attributes=this.node.attributes;var group=attributes.checkedGroup;if(group&&group!=='baselayer'){var checked=!attributes.checked;attributes.checked=checked;node.ui.checkbox.checked=checked;node.layer.setVisibility(checked);this.enforceOneVisible();}else{this.toggleCheck(this.isChecked());}}else{GeoExt.tree.LayerNodeUI.superclass.onClick.apply(this,arguments);}},enforceOneVisible:function(){var attributes=this.node.attributes;var group=attributes.checkedGroup;if(group&&group!=='baselayer'){var layer=this.node.layer;var checkedNodes=this.node.getOwnerTree().getChecked();Ext.each(checkedNodes,function(n){var l=n.layer;if(!n.hidden&&n.attributes.checkedGroup===group){if(l!=layer&&attributes.checked){l.setVisibility(false);}}});}}});GeoExt.tree.LayerNodeS3=Ext.extend(GeoExt.tree.LayerNode,{constructor:function(config){this.defaultUI=GeoExt.tree.LayerNodeUIS3;GeoExt.tree.LayerNodeS3.superclass.constructor.apply(this,arguments);}});Ext.tree.TreePanel.nodeTypes.gx_layer=GeoExt.tree.LayerNodeS3;var s3=map.s3;var options=s3.options;if(options.hide_base){var base=false;}else{var base=true;}
+if(options.hide_overlays){var overlays=false;}else{var overlays=true;}
+if(options.folders_closed){var expanded=false;}else{var expanded=true;}
+if(options.folders_radio){var folders_radio=true;}else{var folders_radio=false;}
+if(options.wms_browser_url||(options.legend&&options.legend!='float')){var collapsible=true;}else{var collapsible=false;}
+var layerStore=s3.mapPanel.layers;var nodesArr=[];var leaf_listeners={click:function(node){var attributes=node.attributes;if(attributes.checkedGroup=='baselayer'){node.ui.toggleCheck(!node.ui.isChecked())}else{var checked=!attributes.checked;attributes.checked=checked;node.ui.checkbox.checked=checked;node.layer.setVisibility(checked);}}};var updateLayout=function(){var westPanelContainer=s3.westPanelContainer;westPanelContainer.fireEvent('collapse');window.setTimeout(function(){westPanelContainer.fireEvent('expand')},300);};var folder_listeners={collapse:function(node){updateLayout()},expand:function(node){updateLayout()}};if(base){var layerTreeBase={text:i18n.gis_base_layers,nodeType:'gx_baselayercontainer',layerStore:layerStore,loader:{baseAttrs:{listeners:leaf_listeners},filter:function(record){var layer=record.getLayer();return layer.displayInLayerSwitcher===true&&layer.isBaseLayer===true&&(layer.dir===undefined||layer.dir==='');}},leaf:false,listeners:folder_listeners,singleClickExpand:true,expanded:expanded};nodesArr.push(layerTreeBase)}
+if(overlays){var layerTreeOverlays={text:i18n.gis_overlays,nodeType:'gx_overlaylayercontainer',layerStore:layerStore,loader:{baseAttrs:{listeners:leaf_listeners},filter:function(record){var layer=record.getLayer();return layer.displayInLayerSwitcher===true&&layer.isBaseLayer===false&&(layer.dir===undefined||layer.dir==='');}},leaf:false,listeners:folder_listeners,singleClickExpand:true,expanded:expanded};nodesArr.push(layerTreeOverlays)}
+var dirs=map.s3.dirs
+var len=dirs.length;if(len){GeoExt.tree.LayerLoaderS3=function(config){Ext.apply(this,config);GeoExt.tree.LayerLoaderS3.superclass.constructor.call(this);};Ext.extend(GeoExt.tree.LayerLoaderS3,GeoExt.tree.LayerLoader,{load:function(node,callback){if(this.fireEvent('beforeload',this,node)){this.removeStoreHandlers();while(node.firstChild){node.removeChild(node.firstChild);}
+if(!this.uiProviders){this.uiProviders=node.getOwnerTree().getLoader().uiProviders;}
+if(!this.store){this.store=GeoExt.MapPanel.guess().layers;}
+this.store.each(function(record){this.addLayerNode(node,record);},this);this.addStoreHandlers(node);var children=node.attributes.children;var len=children.length;if(len){var child,dir,sibling;for(var i=0;i<len;i++){dir=children[i];child=new Ext.tree.TreePanel.nodeTypes[dir.nodeType](dir)
+sibling=node.item(0);if(sibling){node.insertBefore(child,sibling);}else{node.appendChild(child);}}}
+if(typeof callback=='function'){callback();}
+this.fireEvent('load',this,node);}}});var baseAttrs,child,children,dir,_dir,_dirs,_dirslength,folder,folders={},_folders,i,j,loader,parent,sub;for(i=0;i<len;i++){dir=dirs[i];_dirs=dir.split('/');_dirslength=_dirs.length;for(j=0;j<_dirslength;j++){if(j==0){_folders=folders;}else{parent=folder;_folders=_folders[parent];}
+folder=_dirs[j];if(!_folders.hasOwnProperty(folder)){_folders[folder]={};}}}
+for(dir in folders){_dir=folders[dir];children=[]
+for(sub in _dir){baseAttrs={listeners:leaf_listeners}
+if(folders_radio){baseAttrs['checkedGroup']=sub;}
+loader=new GeoExt.tree.LayerLoaderS3({baseAttrs:baseAttrs,filter:(function(dir,sub){return function(read){if(read.data.layer.dir!=='undefined')
+return read.data.layer.dir===dir+'/'+sub;};})(dir,sub)});child={text:sub,nodeType:'gx_layercontainer',layerStore:layerStore,children:[],loader:loader,leaf:false,listeners:folder_listeners,singleClickExpand:true,expanded:expanded};children.push(child);}
+baseAttrs={listeners:leaf_listeners}
+if(folders_radio){baseAttrs['checkedGroup']=dir;}
+loader=new GeoExt.tree.LayerLoaderS3({baseAttrs:baseAttrs,filter:(function(dir){return function(read){if(read.data.layer.dir!=='undefined')
+return read.data.layer.dir===dir;};})(dir)});child={text:dir,nodeType:'gx_layercontainer',layerStore:layerStore,children:children,loader:loader,leaf:false,listeners:folder_listeners,singleClickExpand:true,expanded:expanded};nodesArr.push(child);}}
+var treeRoot=new Ext.tree.AsyncTreeNode({expanded:true,children:nodesArr});if(i18n.gis_properties||i18n.gis_uploadlayer){var tbar=new Ext.Toolbar();}else{var tbar=null;}
+var layerTree=new Ext.tree.TreePanel({title:i18n.gis_layers,loaderloader:new Ext.tree.TreeLoader({applyLoader:false}),root:treeRoot,rootVisible:false,split:true,collapsible:collapsible,collapseMode:'mini',lines:false,tbar:tbar,enableDD:false});new Ext.tree.TreeSorter(layerTree,{sortType:function(value,node){if(node.attributes.nodeType=='gx_baselayercontainer'){return' ';}else if(node.attributes.nodeType=='gx_overlaylayercontainer'){return'!';}else{return node.text;}}});if(i18n.gis_uploadlayer){addRemoveLayersControl(map,layerTree);}
+if(i18n.gis_properties){addLayerPropertiesButton(map,layerTree);}
+return layerTree;}
+var addWMSBrowser=function(map){var options=map.s3.options;var root=new Ext.tree.AsyncTreeNode({expanded:true,loader:new GeoExt.tree.WMSCapabilitiesLoader({url:OpenLayers.ProxyHost+options.wms_browser_url,layerOptions:{buffer:1,singleTile:false,ratio:1,wrapDateLine:true},layerParams:{'TRANSPARENT':'TRUE'},createNode:function(attr){attr.checked=attr.leaf?false:undefined;return GeoExt.tree.WMSCapabilitiesLoader.prototype.createNode.apply(this,[attr]);}})});var wmsBrowser=new Ext.tree.TreePanel({title:options.wms_browser_name,root:root,rootVisible:false,split:true,autoScroll:true,collapsible:true,collapseMode:'mini',lines:false,listeners:{'checkchange':function(node,checked){if(checked===true){map.addLayer(node.attributes.layer);}else{map.removeLayer(node.attributes.layer);}}}});return wmsBrowser;}
+var layer_loadstart=function(event){var layer=event.object;var s3=layer.map.s3;$('#'+s3.id+' .layer_throbber').show().removeClass('hide');var layer_id=layer.s3_layer_id;var layers_loading=s3.layers_loading;layers_loading.pop(layer_id);layers_loading.push(layer_id);}
+var hideThrobber=function(layer){var s3=layer.map.s3;var layers_loading=s3.layers_loading;layers_loading.pop(layer.s3_layer_id);if(layers_loading.length===0){$('#'+s3.id+' .layer_throbber').hide().addClass('hide');}}
+var layer_loadend=function(event){hideThrobber(event.object);}
+var layer_visibilitychanged=function(event){showLegend(event.object.map);}
+var addLayers=function(map){var s3=map.s3;var options=s3.options;s3.layers_all=[];s3.dirs=[];s3.layers_loading=[];var i;if(options.layers_osm){var layers_osm=options.layers_osm;for(i=layers_osm.length;i>0;i--){addOSMLayer(map,layers_osm[i-1]);}}
+try{google&addGoogleLayers(map);}catch(e){}
+if(options.Bing){addBingLayers(map);}
+if(options.layers_tms){var layers_tms=options.layers_tms;for(i=layers_tms.length;i>0;i--){addTMSLayer(map,layers_tms[i-1]);}}
+if(options.layers_wms){var layers_wms=options.layers_wms;for(i=layers_wms.length;i>0;i--){addWMSLayer(map,layers_wms[i-1]);}}
+if(options.layers_xyz){var layers_xyz=options.layers_xyz;for(i=layers_xyz.length;i>0;i--){addXYZLayer(map,layers_xyz[i-1]);}}
+if(options.EmptyLayer){var layer=new OpenLayers.Layer(options.EmptyLayer.name,{isBaseLayer:true,displayInLayerSwitcher:true,s3_layer_id:options.EmptyLayer.id,s3_layer_type:'empty'});map.addLayer(layer);if(options.EmptyLayer.base){map.setBaseLayer(layer);}}
+if(options.layers_js){var layers_js=options.layers_js;for(i=layers_js.length;i>0;i--){eval(map,layers_js[i-1]);}}
+if(options.layers_theme){var layers_theme=options.layers_theme;for(i=layers_theme.length;i>0;i--){addGeoJSONLayer(map,layers_theme[i-1]);}}
+if(options.layers_geojson){var layers_geojson=options.layers_geojson;for(i=layers_geojson.length;i>0;i--){addGeoJSONLayer(map,layers_geojson[i-1]);}}
+if(options.layers_gpx){var layers_gpx=options.layers_gpx;for(i=layers_gpx.length;i>0;i--){addGPXLayer(map,layers_gpx[i-1]);}}
+if(options.layers_arcrest){var layers_arcrest=options.layers_arcrest;for(i=layers_arcrest.length;i>0;i--){addArcRESTLayer(map,layers_arcrest[i-1]);}}
+if(options.CoordinateGrid){addCoordinateGrid(map);}
+if(options.layers_georss){var layers_georss=options.layers_georss;for(i=layers_georss.length;i>0;i--){addGeoJSONLayer(map,layers_georss[i-1]);}}
+if(options.layers_kml){var layers_kml=options.layers_kml;for(i=layers_kml.length;i>0;i--){addKMLLayer(map,layers_kml[i-1]);}}
+if(options.OWM){addOWMLayers(map);}
+if(options.layers_shapefile){var layers_shapefile=options.layers_shapefile;for(i=layers_shapefile.length;i>0;i--){addGeoJSONLayer(map,layers_shapefile[i-1]);}}
+if(options.layers_wfs){var layers_wfs=options.layers_wfs;for(i=layers_wfs.length;i>0;i--){addWFSLayer(map,layers_wfs[i-1]);}}
+if(options.feature_queries){var feature_queries=options.feature_queries;for(i=feature_queries.length;i>0;i--){addGeoJSONLayer(map,feature_queries[i-1]);}}
+if(options.feature_resources){var feature_resources=options.feature_resources;for(i=feature_resources.length;i>0;i--){addGeoJSONLayer(map,feature_resources[i-1]);}}
+if(options.layers_feature){var layers_feature=options.layers_feature;for(i=layers_feature.length;i>0;i--){addGeoJSONLayer(map,layers_feature[i-1]);}}
+if(options.features||options.draw_feature||options.draw_polygon||navigator.geolocation){var draftLayer=addDraftLayer(map);}
+if(options.features){var features=options.features;var current_projection=map.getProjectionObject();for(i=0;i<features.length;i++){var feature=format_geojson.parseFeature(features[i]);feature.geometry.transform(proj4326,current_projection);draftLayer.addFeatures([feature]);}}}
+var addArcRESTLayer=function(map,layer){var name=layer.name;var url=[layer.url];if(undefined!=layer.layers){var layers=layer.layers.join();}else{var layers=0;}
+if(undefined!=layer.dir){var dir=layer.dir;if($.inArray(dir,map.s3.dirs)==-1){map.s3.dirs.push(dir);}}else{var dir='';}
+if(undefined!=layer.base){var isBaseLayer=layer.base;}else{var isBaseLayer=false;}
+if(undefined!=layer.transparent){var transparent=layer.transparent;}else{var transparent=true;}
+if(undefined!=layer.visibility){var visibility=layer.visibility;}else{var visibility=true;}
+var arcRESTLayer=new OpenLayers.Layer.ArcGIS93Rest(name,url,{layers:'show:'+layers,isBaseLayer:isBaseLayer,transparent:transparent,dir:dir,s3_layer_id:layer.id,s3_layer_type:'arcrest'});arcRESTLayer.setVisibility(visibility);map.addLayer(arcRESTLayer);if(layer._base){map.setBaseLayer(arcRESTLayer);}}
+var addBingLayers=function(map){var bing=map.s3.options.Bing;var ApiKey=bing.ApiKey;var layer;if(bing.Aerial){layer=new OpenLayers.Layer.Bing({key:ApiKey,type:'Aerial',name:bing.Aerial.name,s3_layer_id:bing.Aerial.id,s3_layer_type:'bing'});map.addLayer(layer);if(bing.Base=='aerial'){map.setBaseLayer(layer);}}
+if(bing.Road){layer=new OpenLayers.Layer.Bing({key:ApiKey,type:'Road',name:bing.Road.name,s3_layer_id:bing.Road.id,s3_layer_type:'bing'});map.addLayer(layer);if(bing.Base=='road'){map.setBaseLayer(layer);}}
+if(bing.Hybrid){layer=new OpenLayers.Layer.Bing({key:ApiKey,type:'AerialWithLabels',name:bing.Hybrid.name,s3_layer_id:bing.Hybrid.id,s3_layer_type:'bing'});map.addLayer(layer);if(bing.Base=='hybrid'){map.setBaseLayer(layer);}}}
+var addCoordinateGrid=function(map){var CoordinateGrid=map.s3.options.CoordinateGrid;map.addLayer(new OpenLayers.Layer.cdauth.CoordinateGrid(null,{name:CoordinateGrid.name,shortName:'grid',visibility:CoordinateGrid.visibility,s3_layer_id:CoordinateGrid.id,s3_layer_type:'coordinate'}));}
+var addDraftLayer=function(map){var options=map.s3.options;if((options.draw_polygon)&&(!options.draw_feature)){var marker;}else{var marker=options.marker_default;}
+var layer={'marker':marker}
+var response=createStyleMap(map,layer);var featureStyleMap=response[0];var marker_url=response[1];var draftLayer=new OpenLayers.Layer.Vector(i18n.gis_draft_layer,{displayInLayerSwitcher:false,legendURL:marker_url,styleMap:featureStyleMap});draftLayer.setVisibility(true);map.addLayer(draftLayer);map.s3.draftLayer=draftLayer;return draftLayer;}
+var getTileZoom=function(map){var inches=OpenLayers.INCHES_PER_UNIT;var degrees=map.getResolution()*inches[map.getUnits()]/inches['degrees'];var zoom=Math.round(Math.log(360/(256*degrees))/Math.LN2);return Math.max(0,Math.min(zoom,22));}
+var TileStrategy=OpenLayers.Class(OpenLayers.Strategy,{url:null,zoom:null,tiles:null,fids:null,pending:0,activate:function(){var activated=OpenLayers.Strategy.prototype.activate.call(this);if(activated){this.layer.events.on({moveend:this.update,refresh:this.reload,visibilitychanged:this.update,scope:this});this.update();}
+return activated;},deactivate:function(){var deactivated=OpenLayers.Strategy.prototype.deactivate.call(this);if(deactivated){this.layer.events.un({moveend:this.update,refresh:this.reload,visibilitychanged:this.update,scope:this});}
+return deactivated;},reload:function(){this.zoom=null;this.update();},getZoom:function(map){return getTileZoom(map);},update:function(){var layer=this.layer;if(!layer.visibility){return;}
+var map=layer.map;var extent=map.getExtent();if(!extent){return;}
+var zoom=this.getZoom(map);if(zoom!==this.zoom){this.zoom=zoom;this.tiles={};this.fids={};layer.destroyFeatures();}
+extent=extent.clone().transform(map.getProjectionObject(),proj4326);var n=Math.pow(2,zoom);var tileX=function(lon){var x=Math.floor((lon+180)/360*n);return Math.max(0,Math.min(x,n-1));};var tileY=function(lat){lat=Math.max(Math.min(lat,85.0511),-85.0511)*Math.PI/180;var y=Math.floor((1-Math.log(Math.tan(lat)+1/Math.cos(lat))/Math.PI)/2*n);return Math.max(0,Math.min(y,n-1));};var x0=tileX(extent.left),x1=tileX(extent.right),y0=tileY(extent.top),y1=tileY(extent.bottom);var tiles=this.tiles;var x,y,key;for(x=x0;x<=x1;x++){for(y=y0;y<=y1;y++){key=x+'/'+y;if(!tiles[key]){tiles[key]=true;this.loadTile(zoom,x,y);}}}},loadTile:function(zoom,x,y){var layer=this.layer;if(this.pending===0){layer.events.triggerEvent('loadstart');}
+this.pending++;OpenLayers.Request.GET({url:this.url+'&z='+zoom+'&x='+x+'&y='+y,scope:this,callback:function(request){this.pending--;if(zoom===this.zoom&&request.status==200){this.addFeatures(request.responseText);}
+if(this.pending===0){layer.events.triggerEvent('loadend');}}});},addFeatures:function(text){var layer=this.layer;var features=format_geojson.read(text);if(!features||!features.length){return;}
+var mapProjection=layer.map.getProjectionObject();var reproject=!mapProjection.equals(layer.projection);var fids=this.fids;var add=[];var feature,fid;for(var i=0,len=features.length;i<len;i++){feature=features[i];fid=feature.fid||feature.attributes.id;if(fid){if(fids[fid]){continue;}
+fids[fid]=true;}
+if(reproject&&feature.geometry){feature.geometry.transform(layer.projection,mapProjection);}
+add.push(feature);}
+if(add.length){layer.addFeatures(add);}},CLASS_NAME:'S3.gis.TileStrategy'});var ServerClusterStrategy=OpenLayers.Class(OpenLayers.Strategy.BBOX,{resFactor:1,triggerRead:function(options){var protocol=this.layer.protocol;protocol.params=OpenLayers.Util.extend(protocol.params||{},{zoom:getTileZoom(this.layer.map)});return OpenLayers.Strategy.BBOX.prototype.triggerRead.apply(this,arguments);},CLASS_NAME:'S3.gis.ServerClusterStrategy'});var onServerClustersAdded=function(event){var features=event.features;var feature;for(var i=0,len=features.length;i<len;i++){feature=features[i];if(feature.attributes.count>1){feature.cluster=[{attributes:{}}];feature.s3_cluster=true;}}}
+var addGeoJSONLayer=function(map,layer){var name=layer.name;var url=layer.url;if(undefined!=layer.refresh){var refresh=layer.refresh;}else{var refresh=900;}
+if(undefined!=layer.dir){var dir=layer.dir;if($.inArray(dir,map.s3.dirs)==-1){map.s3.dirs.push(dir);}}else{var dir='';}
+if(undefined!=layer.visibility){var visibility=layer.visibility;}else{var visibility=true;}
+if(undefined!=layer.cluster_attribute){var cluster_attribute=layer.cluster_attribute;}else{var cluster_attribute='colour';}
+if(undefined!=layer.cluster_distance){var cluster_distance=layer.cluster_distance;}else{var cluster_distance=cluster_distance_default;}
+if(undefined!=layer.cluster_threshold){var cluster_threshold=layer.cluster_threshold;}else{var cluster_threshold=cluster_threshold_default;}
+if(undefined!=layer.projection){var projection=layer.projection;}else{var projection=4326;}
+if(4326==projection){projection=proj4326;}else{projection=new OpenLayers.Projection('EPSG:'+projection);}
+if(undefined!=layer.type){var layer_type=layer.type;}else{var layer_type='feature';}
+var legendTitle='<div class="gis_layer_legend"><div class="gis_legend_title">'+name+'</div>';if(undefined!=layer.desc){legendTitle+='<div class="gis_legend_desc">'+layer.desc+'</div>';}
+if((undefined!=layer.src)||(undefined!=layer.src_url)){var source='<div class="gis_legend_src">';if(undefined!=layer.src_url){source+='<a href="'+layer.src_url+'" target="_blank">'
+if(undefined!=layer.src){source+=layer.src;}else{source+=layer.src_url;}
+source+='</a>';}else{source+=layer.src;}
+source+='</div>';legendTitle+=source;}
+legendTitle+='</div>';var response=createStyleMap(map,layer);var featureStyleMap=response[0];var marker_url=response[1];if(undefined!=layer.tiles){var strategies=[new TileStrategy({url:layer.tiles})]
+cluster_threshold=0;}else if(undefined!=layer.clusters){url=layer.clusters;var strategies=[new ServerClusterStrategy({ratio:1.5})]
+cluster_threshold=0;}else{var strategies=[new OpenLayers.Strategy.BBOX({ratio:1.5})]}
+if(refresh){strategies.push(new OpenLayers.Strategy.Refresh({force:true,interval:refresh*1000}));}
+if(cluster_threshold){strategies.push(new OpenLayers.Strategy.AttributeCluster({attribute:cluster_attribute,distance:cluster_distance,threshold:cluster_threshold}))}
+var geojsonLayer=new OpenLayers.Layer.Vector(name,{dir:dir,projection:projection,protocol:new OpenLayers.Protocol.HTTP({url:url,format:format_geojson}),strategies:strategies,legendURL:marker_url,styleMap:featureStyleMap,s3_layer_id:layer.id,s3_layer_type:layer_type,s3_style:layer.style});geojsonLayer.legendTitle=legendTitle;geojsonLayer.setVisibility(visibility);geojsonLayer.events.on({'featureselected':onFeatureSelect,'featureunselected':onFeatureUnselect,'loadstart':layer_loadstart,'loadend':layer_loadend,'visibilitychanged':layer_visibilitychanged});if(undefined!=layer.clusters){geojsonLayer.events.on({'beforefeaturesadded':onServerClustersAdded});}
+map.addLayer(geojsonLayer);map.s3.layers_all.push(geojsonLayer);}
+var addGoogleLayers=function(map){var google=map.s3.options.Google;var layer;if(google.MapMaker||google.MapMakerHybrid){if(google.Satellite){layer=new OpenLayers.Layer.Google(google.Satellite.name,{type:G_SATELLITE_MAP,sphericalMercator:true,s3_layer_id:google.Satellite.id,s3_layer_type:'google'});map.addLayer(layer);if(google.Base=='satellite'){map.setBaseLayer(layer);}}
+if(google.Maps){layer=new OpenLayers.Layer.Google(google.Maps.name,{type:G_NORMAL_MAP,sphericalMercator:true,s3_layer_id:google.Maps.id,s3_layer_type:'google'});map.addLayer(layer);if(google.Base=='maps'){map.setBaseLayer(layer);}}
+if(google.Hybrid){layer=new OpenLayers.Layer.Google(google.Hybrid.name,{type:G_HYBRID_MAP,sphericalMercator:true,s3_layer_id:google.Hybrid.id,s3_layer_type:'google'});map.addLayer(layer);if(google.Base=='maps'){map.setBaseLayer(layer);}}
+if(google.Terrain){layer=new OpenLayers.Layer.Google(google.Terrain.name,{type:G_PHYSICAL_MAP,sphericalMercator:true,s3_layer_id:google.Terrain.id,s3_layer_type:'google'});map.addLayer(layer);if(google.Base=='terrain'){map.setBaseLayer(layer);}}
+if(google.MapMaker){layer=new OpenLayers.Layer.Google(google.MapMaker.name,{type:G_MAPMAKER_NORMAL_MAP,sphericalMercator:true,s3_layer_id:layer.id,s3_layer_type:'google'});map.addLayer(layer);if(google.Base=='mapmaker'){map.setBaseLayer(layer);}}
+if(google.MapMakerHybrid){layer=new OpenLayers.Layer.Google(google.MapMakerHybrid.name,{type:G_MAPMAKER_HYBRID_MAP,sphericalMercator:true,s3_layer_id:layer.id,s3_layer_type:'google'});map.addLayer(layer);if(google.Base=='mapmakerhybrid'){map.setBaseLayer(layer);}}}else{if(google.Satellite){layer=new OpenLayers.Layer.Google(google.Satellite.name,{type:'satellite',numZoomLevels:22,s3_layer_id:google.Satellite.id,s3_layer_type:'google'});map.addLayer(layer);if(google.Base=='satellite'){map.setBaseLayer(layer);}}
+if(google.Maps){layer=new OpenLayers.Layer.Google(google.Maps.name,{numZoomLevels:20,s3_layer_id:google.Maps.id,s3_layer_type:'google'});map.addLayer(layer);if(google.Base=='maps'){map.setBaseLayer(layer);}}
+if(google.Hybrid){layer=new OpenLayers.Layer.Google(google.Hybrid.name,{type:'hybrid',numZoomLevels:20,s3_layer_id:google.Hybrid.id,s3_layer_type:'google'});map.addLayer(layer);if(google.Base=='hybrid'){map.setBaseLayer(layer);}}
+if(google.Terrain){layer=new OpenLayers.Layer.Google(google.Terrain.name,{type:'terrain',s3_layer_id:google.Terrain.id,s3_layer_type:'google'});map.addLayer(layer);if(google.Base=='terrain'){map.setBaseLayer(layer);}}}}
+var addGPXLayer=function(map,layer){var name=layer.name;var url=layer.url;var marker=layer.marker;var marker_url=marker_url_path+marker.i;var marker_height=marker.h;var marker_width=marker.w;if(undefined!=layer.waypoints){var waypoints=layer.waypoints;}else{var waypoints=true;}
+if(undefined!=layer.tracks){var tracks=layer.tracks;}else{var tracks=true;}
+if(undefined!=layer.routes){var routes=layer.routes;}else{var routes=true;}
+if(undefined!=layer.visibility){var visibility=layer.visibility;}else{var visibility=true;}
+if(undefined!=layer.dir){var dir=layer.dir;if($.inArray(dir,map.s3.dirs)==-1){map.s3.dirs.push(dir);}}else{var dir='';}
+if(undefined!=layer.opacity){var opacity=layer.opacity;}else{var opacity=1;}
+if(undefined!=layer.cluster_distance){var cluster_distance=layer.cluster_distance;}else{var cluster_distance=cluster_distance_default;}
+if(undefined!=layer.cluster_threshold){var cluster_threshold=layer.cluster_threshold;}else{var cluster_threshold=cluster_threshold_default;}
+var style_marker=OpenLayers.Util.extend({},OpenLayers.Feature.Vector.style['default']);if(waypoints){style_marker.graphicOpacity=opacity;style_marker.graphicWidth=marker_width;style_marker.graphicHeight=marker_height;style_marker.graphicXOffset=-(marker_width/2);style_marker.graphicYOffset=-marker_height;style_marker.externalGraphic=marker_url;}else{style_marker.externalGraphic='';}
+style_marker.strokeColor='blue';style_marker.strokeWidth=6;style_marker.strokeOpacity=opacity;var gpxLayer=new OpenLayers.Layer.Vector(name,{dir:dir,projection:proj4326,strategies:[new OpenLayers.Strategy.Fixed(),new OpenLayers.Strategy.Cluster({distance:cluster_distance,threshold:cluster_threshold})],legendURL:marker_url,s3_layer_id:layer.id,s3_layer_type:'gpx',style:style_marker,protocol:new OpenLayers.Protocol.HTTP({url:url,format:new OpenLayers.Format.GPX({extractAttributes:true,extractWaypoints:waypoints,extractTracks:tracks,extractRoutes:routes})})});gpxLayer.setVisibility(visibility);gpxLayer.events.on({'featureselected':onFeatureSelect,'featureunselected':onFeatureUnselect,'loadstart':layer_loadstart,'loadend':layer_loadend,'visibilitychanged':layer_visibilitychanged});map.addLayer(gpxLayer);map.s3.layers_all.push(gpxLayer);}
+var addKMLLayer=function(map,layer){var s3=map.s3;var name=layer.name;var url=layer.url;if(undefined!=layer.title){var title=layer.title;}else{var title='name';}
+if(undefined!=layer.body){var body=layer.body;}else{var body='description';}
+if(undefined!=layer.refresh){var refresh=layer.refresh;}else{var refresh=900;}
+if(undefined!=layer.visibility){var visibility=layer.visibility;}else{var visibility=true;}
+if(undefined!=layer.dir){var dir=layer.dir;if($.inArray(dir,s3.dirs)==-1){s3.dirs.push(dir);}}else{var dir='';}
+if(undefined!=layer.cluster_distance){var cluster_distance=layer.cluster_distance;}else{var cluster_distance=cluster_distance_default;}
+if(undefined!=layer.cluster_threshold){var cluster_threshold=layer.cluster_threshold;}else{var cluster_threshold=cluster_threshold_default;}
+var response=createStyleMap(map,layer);var featureStyleMap=response[0];var format=new OpenLayers.Format.KML({extractStyles:true,extractAttributes:true,maxDepth:2});var strategies=[new OpenLayers.Strategy.Fixed()]
+if(refresh){strategies.push(new OpenLayers.Strategy.Refresh({force:true,interval:refresh*1000}));}
+if(cluster_threshold){strategies.push(new OpenLayers.Strategy.Cluster({distance:cluster_distance,threshold:cluster_threshold}))}
+var kmlLayer=new OpenLayers.Layer.Vector(name,{dir:dir,projection:proj4326,protocol:new OpenLayers.Protocol.HTTP({url:url,format:format}),strategies:strategies,styleMap:featureStyleMap,s3_layer_id:layer.id,s3_layer_type:'kml',s3_style:layer.style});kmlLayer.title=title;kmlLayer.body=body;kmlLayer.setVisibility(visibility);kmlLayer.events.on({'featureselected':onFeatureSelect,'featureunselected':onFeatureUnselect,'loadstart':layer_loadstart,'loadend':layer_loadend,'visibilitychanged':layer_visibilitychanged});map.addLayer(kmlLayer);s3.layers_all.push(kmlLayer);}
+var addOSMLayer=function(map,layer){var name=layer.name;var url=[layer.url1];if(undefined!=layer.url2){url.push(layer.url2);}
+if(undefined!=layer.url3){url.push(layer.url3);}
+if(undefined!=layer.visibility){var visibility=layer.visibility;}else{var visibility=true;}
+if(undefined!=layer.dir){var dir=layer.dir;if($.inArray(dir,map.s3.dirs)==-1){map.s3.dirs.push(dir);}}else{var dir='';}
+if(undefined!=layer.base){var isBaseLayer=layer.base;}else{var isBaseLayer=true;}
+if(undefined!=layer.zoomLevels){var numZoomLevels=layer.zoomLevels;}else{var numZoomLevels=19;}
+var osmLayer=new OpenLayers.Layer.TMS(name,url,{dir:dir,type:'png',getURL:osm_getTileURL,displayOutsideMaxExtent:true,numZoomLevels:numZoomLevels,isBaseLayer:isBaseLayer,s3_layer_id:layer.id,s3_layer_type:'openstreetmap'});if(undefined!=layer.attribution){osmLayer.attribution=layer.attribution;}
+osmLayer.setVisibility(visibility);map.addLayer(osmLayer);if(layer._base){map.setBaseLayer(osmLayer);}}
+function osm_getTileURL(bounds){var res=this.map.getResolution();var x=Math.round((bounds.left-this.maxExtent.left)/(res*this.tileSize.w));var y=Math.round((this.maxExtent.top-bounds.top)/(res*this.tileSize.h));var z=this.map.getZoom();var limit=Math.pow(2,z);if(y<0||y>=limit){return OpenLayers.Util.getImagesLocation()+'404.png';}else{x=((x%limit)+limit)%limit;var path=z+'/'+x+'/'+y+'.'+this.type;var url=this.url;if(url instanceof Array){url=this.selectUrl(path,url);}
+return url+path;}}
+var addOWMLayers=function(map){var owm=map.s3.options.OWM;var layer;if(owm.station){layer=new OpenLayers.Layer.Vector.OWMStations(owm.station.name,{dir:owm.station.dir,s3_layer_id:owm.station.id,s3_layer_type:'openweathermap'});layer.setVisibility(owm.station.visibility);layer.events.on({'featureselected':layer.onSelect,'featureunselected':layer.onUnselect,'loadstart':layer_loadstart,'loadend':layer_loadend,'visibilitychanged':layer_visibilitychanged});map.addLayer(layer);map.s3.layers_all.push(layer);}
+if(owm.city){layer=new OpenLayers.Layer.Vector.OWMWeather(owm.city.name,{dir:owm.city.dir,s3_layer_id:owm.city.id,s3_layer_type:'openweathermap'});layer.setVisibility(owm.city.visibility);layer.events.on({'featureselected':layer.onSelect,'featureunselected':layer.onUnselect,'loadstart':layer_loadstart,'loadend':layer_loadend,'visibilitychanged':layer_visibilitychanged});map.addLayer(layer);map.s3.layers_all.push(layer);}}
+var addTMSLayer=function(map,layer){var name=layer.name;var url=[layer.url];if(undefined!=layer.url2){url.push(layer.url2);}
+if(undefined!=layer.url3){url.push(layer.url3);}
+var layername=layer.layername;if(undefined!=layer.zoomLevels){var numZoomLevels=layer.zoomLevels;}else{var numZoomLevels=19;}
+if(undefined!=layer.dir){var dir=layer.dir;if($.inArray(dir,map.s3.dirs)==-1){map.s3.dirs.push(dir);}}else{var dir='';}
+if(undefined!=layer.format){var format=layer.format;}else{var format='png';}
+var tmsLayer=new OpenLayers.Layer.TMS(name,url,{dir:dir,s3_layer_id:layer.id,s3_layer_type:'tms',layername:layername,type:format,numZoomLevels:numZoomLevels});if(undefined!=layer.attribution){tmsLayer.attribution=layer.attribution;}
+map.addLayer(tmsLayer);if(layer._base){map.setBaseLayer(tmsLayer);}}
+var addWFSLayer=function(map,layer){var name=layer.name;var url=layer.url;if((undefined!=layer.username)&&(undefined!=layer.password)){var username=layer.username;var password=layer.password;url=url.replace('://','://'+username+':'+password+'@');}
+var title=layer.title;var featureType=layer.featureType;if(undefined!=layer.featureNS){var featureNS=layer.featureNS;}else{var featureNS=null;}
+if(undefined!=layer.schema){var schema=layer.schema;}else{var schema=null;}
+if(undefined!=layer.version){var version=layer.version;}else{var version='1.1.0';}
+if(undefined!=layer.geometryName){var geometryName=layer.geometryName;}else{var geometryName='the_geom';}
+if(undefined!=layer.visibility){var visibility=layer.visibility;}else{var visibility=true;}
+if(undefined!=layer.dir){var dir=layer.dir;if($.inArray(dir,map.s3.dirs)==-1){map.s3.dirs.push(dir);}}else{var dir='';}
+if(undefined!=layer.cluster_attribute){var cluster_attribute=layer.cluster_attribute;}else{var cluster_attribute='colour';}
+if(undefined!=layer.cluster_distance){var cluster_distance=layer.cluster_distance;}else{var cluster_distance=cluster_distance_default;}
+if(undefined!=layer.cluster_threshold){var cluster_threshold=layer.cluster_threshold;}else{var cluster_threshold=cluster_threshold_default;}
+if(undefined!=layer.refresh){var refresh=layer.refresh;}else{var refresh=false;}
+var strategies=[new OpenLayers.Strategy.BBOX({ratio:1.5})]
+if(refresh){strategies.push(new OpenLayers.Strategy.Refresh({force:true,interval:refresh*1000}));}
+if(cluster_threshold){strategies.push(new OpenLayers.Strategy.AttributeCluster({attribute:cluster_attribute,distance:cluster_distance,threshold:cluster_threshold}))}
+if(undefined!=layer.projection){var projection=layer.projection;var srsName='EPSG:'+projection;}else{var projection='4326';var srsName='EPSG:4326';}
+var protocol=new OpenLayers.Protocol.WFS({version:version,srsName:srsName,url:url,featureType:featureType,featureNS:featureNS,geometryName:geometryName,schema:schema});var legendTitle='<div class="gis_layer_legend"><div class="gis_legend_title">'+name+'</div>';if(undefined!=layer.desc){legendTitle+='<div class="gis_legend_desc">'+layer.desc+'</div>';}
+if((undefined!=layer.src)||(undefined!=layer.src_url)){var source='<div class="gis_legend_src">';if(undefined!=layer.src_url){source+='<a href="'+layer.src_url+'" target="_blank">'
+if(undefined!=layer.src){source+=layer.src;}else{source+=layer.src_url;}
+source+='</a>';}else{source+=layer.src;}
+source+='</div>';legendTitle+=source;}
+legendTitle+='</div>';var response=createStyleMap(map,layer);var featureStyleMap=response[0];var marker_url=response[1];if('4326'==projection){projection=proj4326;}else{projection=new OpenLayers.Projection('EPSG:'+projection);}
+var wfsLayer=new OpenLayers.Layer.Vector(name,{maxFeatures:1000,strategies:strategies,dir:dir,legendURL:marker_url,projection:projection,protocol:protocol,styleMap:featureStyleMap,s3_layer_id:layer.id,s3_layer_type:'wfs',s3_style:layer.style});wfsLayer.legendTitle=legendTitle;wfsLayer.title=title;wfsLayer.setVisibility(visibility);wfsLayer.events.on({'featureselected':onFeatureSelect,'featureunselected':onFeatureUnselect,'loadstart':layer_loadstart,'loadend':layer_loadend,'visibilitychanged':layer_visibilitychanged});map.addLayer(wfsLayer);map.s3.layers_all.push(wfsLayer);}
+var addWMSLayer=function(map,layer){var name=layer.name;var url=layer.url;if(layer.username&&layer.password){var username=layer.username;var password=layer.password;url=url.replace('://','://'+username+':'+password+'@');}
+var layers=layer.layers;if(undefined!=layer.visibility){var visibility=layer.visibility;}else{var visibility=true;}
+if(undefined!=layer.dir){var dir=layer.dir;if($.inArray(dir,map.s3.dirs)==-1){map.s3.dirs.push(dir);}}else{var dir='';}
+if(undefined!=layer.base){var isBaseLayer=layer.base;}else{var isBaseLayer=false;}
+if(undefined!=layer.transparent){var transparent=layer.transparent;}else{var transparent=true;}
+if(undefined!=layer.format){var format=layer.format;}else{var format='image/png';}
+if(undefined!=layer.version){var version=layer.version;}else{var version='1.1.1';}
+if(layer.map){var wms_map=layer.map;}else{var wms_map='';}
+if(layer.style){var style=layer.style;}else{var style='';}
+if(undefined!=layer.bgcolor){var bgcolor='0x'+layer.bgcolor;}else{var bgcolor='';}
+if(undefined!=layer.buffer){var buffer=layer.buffer;}else{var buffer=0;}
+if(undefined!=layer.tiled){var tiled=layer.tiled;}else{var tiled=false;}
+if(undefined!=layer.opacity){var opacity=layer.opacity;}else{var opacity=1;}
+if(undefined!=layer.queryable){var queryable=layer.queryable;}else{var queryable=1;}
+var legendTitle='<div class="gis_layer_legend"><div class="gis_legend_title">'+name+'</div>';if(undefined!=layer.desc){legendTitle+='<div class="gis_legend_desc">'+layer.desc+'</div>';}
+if(map.s3.options.metadata){if(undefined!=layer.post_id){if(i18n.gis_metadata){var label=i18n.gis_metadata;var murl=S3.Ap.concat('/cms/page/'+layer.post_id);}else{var label=i18n.gis_metadata_edit;var murl=S3.Ap.concat('/cms/post/'+layer.post_id+'/update?layer_id='+layer.id);}}else if(i18n.gis_metadata_create){var label=i18n.gis_metadata_create;var murl=S3.Ap.concat('/cms/post/create?layer_id='+layer.id);}else{var label='';}
+if(label){source='<div class="gis_legend_src"><a href="'+murl+'" target="_blank">'+label+'</a></div>';legendTitle+=source;}}else if((undefined!=layer.src)||(undefined!=layer.src_url)){var source='<div class="gis_legend_src">';if(undefined!=layer.src_url){source+='<a href="'+layer.src_url+'" target="_blank">';if(undefined!=layer.src){source+=layer.src;}else{source+=layer.src_url;}
+source+='</a>';}else{source+=layer.src;}
+source+='</div>';legendTitle+=source;}
+legendTitle+='</div>';if(undefined!=layer.legendURL){var legendURL=layer.legendURL;}else{var legendURL;}
+var wmsLayer=new OpenLayers.Layer.WMS(name,url,{layers:layers,transparent:transparent},{dir:dir,wrapDateLine:true,isBaseLayer:isBaseLayer,s3_layer_id:layer.id,s3_layer_type:'wms',queryable:queryable,visibility:visibility});if(wms_map){wmsLayer.params.MAP=wms_map;}
+if(format){wmsLayer.params.FORMAT=format;}
+if(version){wmsLayer.params.VERSION=version;}
+if(style){wmsLayer.params.STYLES=style;}
+if(bgcolor){wmsLayer.params.BGCOLOR=bgcolor;}
+if(tiled){wmsLayer.params.TILED=true;wmsLayer.params.TILESORIGIN=[map.maxExtent.left,map.maxExtent.bottom];}
+if(!isBaseLayer){wmsLayer.opacity=opacity;if(buffer){wmsLayer.buffer=buffer;}else{wmsLayer.buffer=0;}}
+wmsLayer.legendTitle=legendTitle;if(legendURL){wmsLayer.legendURL=legendURL;}
+wmsLayer.events.on({'loadstart':layer_loadstart,'loadend':layer_loadend,'visibilitychanged':layer_visibilitychanged});map.addLayer(wmsLayer);if(layer._base){map.setBaseLayer(wmsLayer);}}
+var addXYZLayer=function(map,layer){var name=layer.name;var url=[layer.url];if(undefined!=layer.url2){url.push(layer.url2);}
+if(undefined!=layer.url3){url.push(layer.url3);}
+var layername=layer.layername;if(undefined!=layer.zoomLevels){var numZoomLevels=layer.zoomLevels;}else{var numZoomLevels=19;}
+if(undefined!=layer.dir){var dir=layer.dir;if($.inArray(dir,map.s3.dirs)==-1){map.s3.dirs.push(dir);}}else{var dir='';}
+if(undefined!=layer.format){var format=layer.format;}else{var format='png';}
+var xyzLayer=new OpenLayers.Layer.XYZ(name,url,{dir:dir,s3_layer_id:layer.id,s3_layer_type:'xyz',layername:layername,type:format,numZoomLevels:numZoomLevels});if(undefined!=layer.attribution){xyzLayer.attribution=layer.attribution;}
+map.addLayer(xyzLayer);if(layer._base){map.setBaseLayer(xyzLayer);}}
+var addControls=function(map){var options=map.s3.options;var navControl=new OpenLayers.Control.Navigation();if(options.no_zoom_wheel){navControl.zoomWheelEnabled=false;}
+map.addControl(navControl);if(options.zoomcontrol==undefined){map.addControl(new OpenLayers.Control.Zoom());}
+map.addControl(new OpenLayers.Control.ArgParser());map.addControl(new OpenLayers.Control.Attribution());if(options.scaleline==undefined){map.addControl(new OpenLayers.Control.ScaleLine());}
+if(options.mouse_position=='mgrs'){map.addControl(new OpenLayers.Control.MGRSMousePosition());}else if(options.mouse_position){map.addControl(new OpenLayers.Control.MousePosition());}
+if(options.permalink==undefined){map.addControl(new OpenLayers.Control.Permalink());}
+if(options.overview==undefined){var ov_options={};var map_options=map.options;var prop;for(prop in map_options){if(prop!='controls'){ov_options[prop]=map_options[prop];}}
+map.addControl(new OpenLayers.Control.OverviewMap({mapOptions:ov_options}));}
+addPopupControls(map);}
+var addPopupControls=function(map){OpenLayers.Handler.FeatureS3=OpenLayers.Class(OpenLayers.Handler.Feature,{dblclick:function(evt){this.map.zoomTo(this.map.zoom+1,evt.xy);return false;},CLASS_NAME:'OpenLayers.Handler.FeatureS3'});var layers_all=map.s3.layers_all;var popupControl=new OpenLayers.Control.SelectFeature(layers_all,{toggle:true});popupControl.handlers.feature=new OpenLayers.Handler.FeatureS3(popupControl,popupControl.layer,popupControl.callbacks,{geometryTypes:popupControl.geometryTypes});var highlightControl=new OpenLayers.Control.SelectFeature(layers_all,{hover:true,highlightOnly:true,eventListeners:{featurehighlighted:tooltipSelect,featureunhighlighted:tooltipUnselect}});map.addControl(highlightControl);map.addControl(popupControl);highlightControl.activate();popupControl.activate();}
+function tooltipSelect(event){var feature=event.feature;if(feature.cluster){}else{var map=feature.layer.map;var lastFeature=map.s3.lastFeature;var tooltipPopup=map.s3.tooltipPopup;if(feature.popup!==null){return;}
+if((tooltipPopup!==null)&&(tooltipPopup!==undefined)){map.removePopup(tooltipPopup);tooltipPopup.destroy();if(lastFeature!==null){delete lastFeature.popup;}
+tooltipPopup=null;}
+lastFeature=feature;var centerPoint=feature.geometry.getBounds().getCenterLonLat();var attributes=feature.attributes;var tooltip;if(undefined!=attributes.popup){tooltip=attributes.popup;}else if(undefined!=attributes.name){tooltip=attributes.name;}else if(undefined!=feature.layer.title){var a=attributes[feature.layer.title];var type=typeof a;if('object'==type){tooltip=a.value;}else{tooltip=a;}}
+if(tooltip){tooltipPopup=new OpenLayers.Popup('activetooltip',centerPoint,new OpenLayers.Size(80,12),tooltip,false);}
+if((tooltipPopup!==null)&&(tooltipPopup!==undefined)){tooltipPopup.contentDiv.style.backgroundColor='ffffcb';tooltipPopup.contentDiv.style.overflow='hidden';tooltipPopup.contentDiv.style.padding='3px';tooltipPopup.contentDiv.style.margin='10px';tooltipPopup.closeOnMove=true;tooltipPopup.autoSize=true;tooltipPopup.opacity=0.7;feature.popup=tooltipPopup;map.addPopup(tooltipPopup);}}}
+function tooltipUnselect(event){var feature=event.feature;if(feature!==null&&feature.popup!==null){var map=feature.layer.map;map.removePopup(feature.popup);feature.popup.destroy();delete feature.popup;map.s3.tooltipPopup=null;map.s3.lastFeature=null;}}
+function loadClusterPopup(map_id,url,id){var selector='#'+id+'_contentDiv';var div=$(selector);var contents=i18n.gis_loading+"...<div class='throbber'></div>";div.html(contents);var map=S3.gis.maps[map_id];$.get(url,function(data){div.html(data);map.popups[0].updateSize();var dropdowns=$(selector+' .dropdown-toggle');if(dropdowns.length){div.parent().css('overflow','visible').parent().css('overflow','visible');dropdowns.dropdown();}},'html');}
+S3.gis.loadClusterPopup=loadClusterPopup;function zoomToSelectedFeature(map_id,lon,lat,zoomfactor){var map=S3.gis.maps[map_id];var lonlat=new OpenLayers.LonLat(lon,lat);var currZoom=map.getZoom();var newZoom=currZoom+zoomfactor;map.setCenter(lonlat,newZoom);for(var i=0;i<map.popups.length;i++){map.removePopup(map.popups[i]);}}
+S3.gis.zoomToSelectedFeature=zoomToSelectedFeature;function loadDetails(url,id,popup){if(url.indexOf('http://')===0){url=OpenLayers.ProxyHost+encodeURIComponent(url);}
+$.ajax({'url':url,'dataType':'html'}).done(function(data){try{$('#'+id).html(data);}catch(e){}}).fail(function(jqXHR,textStatus,errorThrown){if(errorThrown=='UNAUTHORIZED'){msg=i18n.gis_requires_login;}else{msg=jqXHR.responseText;}
+$('#'+id+'_contentDiv').html(msg);}).always(function(){popup.updateSize();});}
+function onFeatureSelect(event){tooltipUnselect(event);var feature=event.feature;var layer=feature.layer
+var layer_type=layer.s3_layer_type;var map=layer.map;var centerPoint=feature.geometry.getBounds().getCenterLonLat();var popup_id=S3.uid();if(undefined!=layer.title){var titleField=layer.title;}else{var titleField='name';}
+var contents,data_link,name,popup_url;if(feature.s3_cluster){var map_id=map.s3.id;contents=i18n.gis_cluster_multiple+' ('+feature.attributes.count+')';contents+="<div align='center'><a href='javascript:S3.gis.zoomToSelectedFeature("+"\""+map_id+"\", "+centerPoint.lon+","+centerPoint.lat+", 3)'>"+i18n.gis_zoomin+'</a></div>';}else if(feature.cluster){var cluster=feature.cluster;contents=i18n.gis_cluster_multiple+':<ul>';var length=cluster.length;var map_id=map.s3.id;for(var i=0;i<length;i++){var attributes=cluster[i].attributes;if(undefined!=attributes.popup){name=attributes.popup.split('<br />',1)[0];}else{name=attributes[titleField];}
+if(undefined!=attributes.url){contents+="<li><a href='javascript:S3.gis.loadClusterPopup("+"\""+map_id+"\", \""+attributes.url+"\", \""+popup_id+"\""+")'>"+name+"</a></li>";}else{contents+='<li>'+name+'</li>';}}
+contents+='</ul>';contents+="<div align='center'><a href='javascript:S3.gis.zoomToSelectedFeature("+"\""+map_id+"\", "+centerPoint.lon+","+centerPoint.lat+", 3)'>"+i18n.gis_zoomin+'</a></div>';}else{if(layer_type=='kml'){var attributes=feature.attributes;if(undefined!=feature.style.balloonStyle){var balloonStyle=feature.style.balloonStyle;contents=balloonStyle.replace(/{([^{}]*)}/g,function(a,b){var r=attributes[b];return typeof r==='string'||typeof r==='number'?r:a;});}else{var type=typeof attributes[titleField];var title;if('object'==type){title=attributes[titleField].value;}else{title=attributes[titleField];}
+contents='<h3>'+title+'</h3>';var body=feature.layer.body.split(' ');var label,row,value;for(var j=0;j<body.length;j++){type=typeof attributes[body[j]];if('object'==type){label=attributes[body[j]].displayName;if(label===''){label=body[j];}
+value=attributes[body[j]].value;row='<div class="gis_popup_row"><div class="gis_popup_label">'+label+':</div><div class="gis_popup_cell">'+value+'</div></div>';}else if(undefined!=attributes[body[j]]){row='<div class="gis_popup_row">'+attributes[body[j]]+'</div>';}else{row='';}
+contents+=row;}}
+if(contents.search('<script')!=-1){contents='Content contained Javascript! Escaped content below.<br />'+contents.replace(/</g,'<');}}else if(layer_type=='gpx'){}else if(layer_type=='shapefile'){var attributes=feature.attributes;contents='<div>';var label,prop,row,value;$.each(attributes,function(label,value){if(label=='id_orig'){label='id';}
+row='<div class="gis_popup_row"><div class="gis_popup_label">'+label+':</div><div class="gis_popup_cell">'+value+'</div></div>';contents+=row;});contents+='</div>';}else if(layer_type=='wfs'){var attributes=feature.attributes;var title=attributes[titleField];contents='<h3>'+title+'</h3>';var row;$.each(attributes,function(label,value){row='<div class="gis_popup_row"><div class="gis_popup_label">'+label+':</div><div class="gis_popup_val">'+value+'</div></div>';contents+=row;});}else{if(undefined!=feature.attributes.url){popup_url=feature.attributes.url;contents=i18n.gis_loading+"...<div class='throbber'></div>";}else{var attributes=feature.attributes;if(undefined==attributes.name){name='';}else{name='<h3>'+attributes.name+'</h3>';}
+var description;if(undefined==attributes.description){description='';}else{description='<p>'+attributes.description+'</p>';}
+var link;if(undefined==attributes.link){link='';}else{link='<a href="'+attributes.link+'" target="_blank">'+attributes.link+'</a>';}
+var data;if(undefined==attributes.data){data='';}else if(attributes.data.indexOf('http://')===0){data_link=true;var data_id=S3.uid();data='<div id="'+data_id+'">'+i18n.gis_loading+"...<div class='throbber'></div>"+'</div>';}else{data='<p>'+attributes.data+'</p>';}
+var image;if(undefined==attributes.image){image='';}else if(attributes.image.indexOf('http://')===0){image='<img src="'+attributes.image+'" height=300 width=300>';}else{image='';}
+contents=name+description+link+data+image;}}}
+var popup=new OpenLayers.Popup.FramedCloud(popup_id,centerPoint,new OpenLayers.Size(400,400),contents,null,true,onPopupClose);if(undefined!=popup_url){loadDetails(popup_url,popup_id+'_contentDiv',popup);}else if(data_link){loadDetails(feature.attributes.data,data_id,popup);}
+feature.popup=popup;map.addPopup(popup);}
+function onFeatureUnselect(event){var feature=event.feature;if(feature.popup){feature.layer.map.removePopup(feature.popup);feature.popup.destroy();delete feature.popup;}}
+function onPopupClose(event){var map=this.map;while(map.popups.length){map.removePopup(map.popups[0]);}}
+var addToolbar=function(map){var s3=map.s3;var options=s3.options;var toolbar=new Ext.Toolbar({height:34})
+toolbar.map=map;s3.portal.toolbar=toolbar;var zoomfull=new GeoExt.Action({control:new OpenLayers.Control.ZoomToMaxExtent(),map:map,iconCls:'zoomfull',tooltip:i18n.gis_zoomfull});var zoomout=new GeoExt.Action({control:new OpenLayers.Control.ZoomBox({out:true}),map:map,iconCls:'zoomout',tooltip:i18n.gis_zoomout,toggleGroup:'controls'});var zoomin=new GeoExt.Action({control:new OpenLayers.Control.ZoomBox(),map:map,iconCls:'zoomin',tooltip:i18n.gis_zoominbutton,toggleGroup:'controls'});var line_pressed,pan_pressed,point_pressed,polygon_pressed;if(options.draw_polygon=='active'){polygon_pressed=true;line_pressed=false;pan_pressed=false;point_pressed=false;}else if(options.draw_line=='active'){line_pressed=true;point_pressed=false;pan_pressed=false;polygon_pressed=false;}else if(options.draw_feature=='active'){point_pressed=true;line_pressed=false;pan_pressed=false;polygon_pressed=false;}else{pan_pressed=true;line_pressed=false;point_pressed=false;polygon_pressed=false;}
+toolbar.add(zoomfull);if(navigator.geolocation){addGeolocateControl(toolbar);}
+if(undefined===options.nav){var panButton=new GeoExt.Action({control:new OpenLayers.Control.Navigation(),map:map,iconCls:'pan-off',tooltip:i18n.gis_pan,allowDepress:true,toggleGroup:'controls',pressed:pan_pressed});toolbar.add(zoomout);toolbar.add(zoomin);toolbar.add(panButton);toolbar.addSeparator();addNavigationControl(toolbar);}
+if(options.save){addSaveButton(toolbar);}
+toolbar.addSeparator();addMeasureControls(toolbar);if(options.mgrs_url){addPdfControl(toolbar);}
+if(options.draw_feature||options.draw_polygon){toolbar.addSeparator();if(options.draw_feature){addPointControl(map,toolbar,point_pressed);}
+if(options.draw_line){addLineControl(map,toolbar,line_pressed,true);}
+if(options.draw_polygon){addPolygonControl(map,toolbar,polygon_pressed,true);}}
+if(i18n.gis_get_feature_info){addWMSGetFeatureInfoControl(map);}
+if(i18n.gis_potlatch){addPotlatchButton(toolbar);}
+if(options.Google&&options.Google.StreetviewButton){addGoogleStreetviewControl(toolbar);}
+try{if(options.Google.Earth){google&addGoogleEarthControl(toolbar);}}catch(e){}
+if(i18n.gis_search){if(false===options.nav){var max_width=options.map_width-500;}else{var max_width=options.map_width-680;}
+var width=Math.min(350,max_width);var mapSearch=new GeoExt.ux.GeoNamesSearchCombo({map:map,width:width,listWidth:width,minChars:2,emptyText:i18n.gis_search});toolbar.addSeparator();toolbar.add(mapSearch);}
+var throbber=new Ext.BoxComponent({cls:'layer_throbber hide'});toolbar.add(throbber);return toolbar;}
+var addGeolocateControl=function(toolbar){var map=toolbar.map;var draftLayer=map.s3.draftLayer;var style={fillColor:'#000',fillOpacity:0.1,strokeWidth:0};var geolocateControl=new OpenLayers.Control.Geolocate({geolocationOptions:{enableHighAccuracy:false,maximumAge:0,timeout:7000}});map.addControl(geolocateControl);geolocateControl.events.register('locationupdated',this,function(e){draftLayer.removeAllFeatures();var circle=new OpenLayers.Feature.Vector(OpenLayers.Geometry.Polygon.createRegularPolygon(new OpenLayers.Geometry.Point(e.point.x,e.point.y),e.position.coords.accuracy/2,40,0),{},style);draftLayer.addFeatures([new OpenLayers.Feature.Vector(e.point,{},{graphicName:'cross',strokeColor:'#f00',strokeWidth:2,fillOpacity:0,pointRadius:10}),circle]);map.zoomToExtent(draftLayer.getDataExtent());pulsate(map,circle);});geolocateControl.events.register('locationfailed',this,function(){OpenLayers.Console.log('Location detection failed');});var geoLocateButton=new Ext.Toolbar.Button({iconCls:'geolocation',tooltip:i18n.gis_geoLocate,handler:function(){draftLayer.removeAllFeatures();geolocateControl.activate();}});toolbar.addButton(geoLocateButton);}
+function pulsate(map,feature){var point=feature.geometry.getCentroid(),bounds=feature.geometry.getBounds(),radius=Math.abs((bounds.right-bounds.left)/2),count=0,grow='up';var resize=function(){if(count>16){clearInterval(window.resizeInterval);}
+var interval=radius*0.03;var ratio=interval/radius;switch(count){case 4:case 12:grow='down';break;case 8:grow='up';break;}
+if(grow!=='up'){ratio=-Math.abs(ratio);}
+feature.geometry.resize(1+ratio,point);map.s3.draftLayer.drawFeature(feature);count++;};window.resizeInterval=window.setInterval(resize,50,point,radius);}
+var addGoogleEarthControl=function(toolbar){var map=toolbar.map;var s3=map.s3;var googleEarthButton=new Ext.Toolbar.Button({iconCls:'googleearth',tooltip:s3.options.Google.Earth,enableToggle:true,toggleHandler:function(button,state){if(state===true){s3.mapPanelContainer.getLayout().setActiveItem(1);s3.mapWin.items.items[0].collapse();s3.googleEarthPanel.on('pluginready',function(){addGoogleEarthKmlLayers(map);});}else{s3.mapPanelContainer.getLayout().setActiveItem(0);s3.mapWin.items.items[0].expand();}}});toolbar.addSeparator();toolbar.addButton(googleEarthButton);}
+function addGoogleEarthKmlLayers(map){var layers_feature=map.s3.options.layers_feature;if(layers_feature){for(var i=0;i<layers_feature.length;i++){var layer=layers_feature[i];var visibility;if(undefined!=layer.visibility){visibility=layer.visibility;}else{visibility=true;}
+if(visibility){var url=S3.public_url+layer.url.replace('geojson','kml');google.earth.fetchKml(map.s3.googleEarthPanel.earth,url,googleEarthKmlLoaded);}}}}
+function googleEarthKmlLoaded(object){if(!object){return;}
+S3.gis.googleEarthPanel.earth.getFeatures().appendChild(object);}
+var addGoogleStreetviewControl=function(toolbar){var map=toolbar.map;var Clicker=OpenLayers.Class(OpenLayers.Control,{defaults:{pixelTolerance:1,stopSingle:true},initialize:function(options){this.handlerOptions=OpenLayers.Util.extend({},this.defaults);OpenLayers.Control.prototype.initialize.apply(this,arguments);this.handler=new OpenLayers.Handler.Click(this,{click:this.trigger},this.handlerOptions);},trigger:function(event){openStreetviewPopup(map,map.getLonLatFromViewPortPx(event.xy));}});StreetviewClicker=new Clicker({autoactivate:false});map.addControl(StreetviewClicker);var googleStreetviewButton=new Ext.Toolbar.Button({iconCls:'streetview',tooltip:map.s3.options.Google.StreetviewButton,allowDepress:true,enableToggle:true,toggleGroup:'controls',toggleHandler:function(button,state){if(state===true){StreetviewClicker.activate();}else{StreetviewClicker.deactivate();}}});toolbar.addSeparator();toolbar.addButton(googleStreetviewButton);}
+function openStreetviewPopup(map,location){if(!location){location=map.getCenter();}
+if(map.s3.sv_popup&&map.s3.sv_popup.anc){map.s3.sv_popup.close();}
+map.s3.sv_popup=new GeoExt.Popup({title:map.s3.options.Google.StreetviewTitle,location:location,width:300,height:300,collapsible:true,map:map.s3.mapPanel,items:[new gxp.GoogleStreetViewPanel()]});map.s3.sv_popup.show();}
+var addMeasureControls=function(toolbar){var map=toolbar.map;var measureSymbolizers={'Point':{pointRadius:5,graphicName:'circle',fillColor:'white',fillOpacity:1,strokeWidth:1,strokeOpacity:1,strokeColor:'#f5902e'},'Line':{strokeWidth:3,strokeOpacity:1,strokeColor:'#f5902e',strokeDashstyle:'dash'},'Polygon':{strokeWidth:2,strokeOpacity:1,strokeColor:'#f5902e',fillColor:'white',fillOpacity:0.5}};var styleMeasure=new OpenLayers.Style();styleMeasure.addRules([new OpenLayers.Rule({symbolizer:measureSymbolizers})]);var styleMapMeasure=new OpenLayers.StyleMap({'default':styleMeasure});var length=new OpenLayers.Control.Measure(OpenLayers.Handler.Path,{geodesic:true,persist:true,handlerOptions:{layerOptions:{styleMap:styleMapMeasure}}});length.events.on({'measure':function(evt){alert(i18n.gis_length_message+' '+evt.measure.toFixed(2)+' '+evt.units);}});var lengthButton=new GeoExt.Action({control:length,map:map,iconCls:'measure-off',tooltip:i18n.gis_length_tooltip,allowDepress:true,enableToggle:true,toggleGroup:'controls'});toolbar.add(lengthButton);if(false===map.s3.options.area){var area=new OpenLayers.Control.Measure(OpenLayers.Handler.Polygon,{geodesic:true,persist:true,handlerOptions:{layerOptions:{styleMap:styleMapMeasure}}});area.events.on({'measure':function(evt){alert(i18n.gis_area_message+' '+evt.measure.toFixed(2)+' '+evt.units+'2');}});var areaButton=new GeoExt.Action({control:area,map:map,iconCls:'measure-area',tooltip:i18n.gis_area_tooltip,allowDepress:true,enableToggle:true,toggleGroup:'controls'});toolbar.add(areaButton);}}
+var addLegendPanel=function(map,legendPanel){var map_id=map.s3.id;var div='<div class="map_legend_div"><div class="map_legend_tab right"></div><div class="map_legend_panel"></div></div>';$('#'+map_id).append(div);var legendPanel=new GeoExt.LegendPanel({title:i18n.gis_legend,autoScroll:true,border:false});var jquery_obj=$('#'+map_id+' .map_legend_panel');var el=Ext.get(jquery_obj[0]);legendPanel.render(el);$('#'+map_id+' .map_legend_tab').click(function(){if($(this).hasClass('right')){hideLegend(map);}else{showLegend(map);}});}
+var hideLegend=function(map){var map_id=map.s3.id;var outerWidth=$('#'+map_id+' .map_legend_panel').outerWidth();$('#'+map_id+' .map_legend_div').animate({marginRight:'-'+outerWidth+'px'});$('#'+map_id+' .map_legend_tab').removeClass('right').addClass('left');}
+var showLegend=function(map){var map_id=map.s3.id;$('#'+map_id+' .map_legend_div').animate({marginRight:0});$('#'+map_id+' .map_legend_tab').removeClass('left').addClass('right');}
+var addNavigationControl=function(toolbar){var nav=new OpenLayers.Control.NavigationHistory();toolbar.map.addControl(nav);nav.activate();var navPreviousButton=new Ext.Toolbar.Button({iconCls:'back',tooltip:i18n.gis_navPrevious,handler:nav.previous.trigger});var navNextButton=new Ext.Toolbar.Button({iconCls:'next',tooltip:i18n.gis_navNext,handler:nav.next.trigger});toolbar.addButton(navPreviousButton);toolbar.addButton(navNextButton);}
+var addPointControl=function(map,toolbar,active){OpenLayers.Handler.PointS3=OpenLayers.Class(OpenLayers.Handler.Point,{dblclick:function(evt){return true;},CLASS_NAME:'OpenLayers.Handler.PointS3'});var draftLayer=map.s3.draftLayer;var control=new OpenLayers.Control.DrawFeature(draftLayer,OpenLayers.Handler.PointS3,{'featureAdded':function(feature){if(map.s3.lastDraftFeature){map.s3.lastDraftFeature.destroy();}else if(draftLayer.features.length>1){draftLayer.features[0].destroy();}
+var lon_field=$('#gis_location_lon');if(lon_field.length){var centerPoint=feature.geometry.getBounds().getCenterLonLat();centerPoint.transform(map.getProjectionObject(),proj4326);lon_field.val(centerPoint.lon);$('#gis_location_lat').val(centerPoint.lat);$('#gis_location_wkt').val('');}
+map.s3.lastDraftFeature=feature;}});if(toolbar){var pointButton=new GeoExt.Action({control:control,handler:function(){if(pointButton.items[0].pressed){$('.olMapViewport').addClass('crosshair');}else{$('.olMapViewport').removeClass('crosshair');}},map:map,iconCls:'drawpoint-off',tooltip:i18n.gis_draw_feature,allowDepress:true,enableToggle:true,toggleGroup:'controls',pressed:active});toolbar.add(pointButton);map.s3.pointButton=pointButton;}else{map.addControl(control);if(active){control.activate();$('.olMapViewport').addClass('crosshair');}}}
+var addLineControl=function(map,toolbar,active){var draftLayer=map.s3.draftLayer;var control=new OpenLayers.Control.DrawFeature(draftLayer,OpenLayers.Handler.Path,{'featureAdded':function(feature){if(map.s3.lastDraftFeature){map.s3.lastDraftFeature.destroy();}else if(draftLayer.features.length>1){draftLayer.features[0].destroy();}
+map.s3.lastDraftFeature=feature;}});if(toolbar){var lineButton=new GeoExt.Action({control:control,handler:function(){if(lineButton.items[0].pressed){$('.olMapViewport').addClass('crosshair');}else{$('.olMapViewport').removeClass('crosshair');}},map:map,iconCls:'drawline-off',tooltip:i18n.gis_draw_line,allowDepress:true,enableToggle:true,toggleGroup:'controls',pressed:active,activateOnEnable:true,deactivateOnDisable:true});toolbar.add(lineButton);map.s3.lineButton=lineButton;}else{map.addControl(control);if(active){control.activate();$('.olMapViewport').addClass('crosshair');}}}
+var addPolygonControl=function(map,toolbar,active,not_regular){var draftLayer=map.s3.draftLayer;var control=new OpenLayers.Control.DrawFeature(draftLayer,not_regular?OpenLayers.Handler.Polygon:OpenLayers.Handler.RegularPolygon,{handlerOptions:not_regular?{sides:4,snapAngle:90}:{},'featureAdded':function(feature){if(map.s3.lastDraftFeature){map.s3.lastDraftFeature.destroy();}else if(draftLayer.features.length>1){draftLayer.features[0].destroy();}
+var wkt_field=$('#gis_location_wkt');if(wkt_field.length){var WKT=feature.geometry.transform(map.getProjectionObject(),proj4326).toString();wkt_field.val(WKT);$('#gis_location_lat').val('');$('#gis_location_lon').val('');}else{var wkt_search_field=$('#gis_search_polygon_input');if(wkt_search_field.length){var WKT=feature.geometry.transform(map.getProjectionObject(),proj4326).toString();wkt_search_field.val(WKT).trigger('change');}}
+map.s3.lastDraftFeature=feature;}});if(toolbar){var polygonButton=new GeoExt.Action({control:control,handler:function(){if(polygonButton.items[0].pressed){$('.olMapViewport').addClass('crosshair');}else{$('.olMapViewport').removeClass('crosshair');}},map:map,iconCls:'drawpolygon-off',tooltip:i18n.gis_draw_polygon,allowDepress:true,enableToggle:true,toggleGroup:'controls',pressed:active,activateOnEnable:true,deactivateOnDisable:true});toolbar.add(polygonButton);map.s3.polygonButton=polygonButton;}else{map.addControl(control);if(active){control.activate();$('.olMapViewport').addClass('crosshair');}}}
+var addPotlatchButton=function(toolbar){var map=toolbar.map;var potlatchButton=new Ext.Toolbar.Button({iconCls:'potlatch',tooltip:i18n.gis_potlatch,handler:function(){var zoom_current=map.getZoom();if(zoom_current<14){alert(i18n.gis_osm_zoom_closer);}else{var lonlat=map.getCenter();lonlat.transform(map.getProjectionObject(),proj4326);var url=S3.Ap.concat('/gis/potlatch2/potlatch2.html')+'?lat='+lonlat.lat+'&lon='+lonlat.lon+'&zoom='+zoom_current;window.open(url);}}});toolbar.addSeparator();toolbar.addButton(potlatchButton);}
+var addSaveButton=function(toolbar){var saveButton=new Ext.Toolbar.Button({iconCls:'save',tooltip:i18n.gis_save,handler:function(){saveConfig(toolbar.map);}});toolbar.addSeparator();toolbar.addButton(saveButton);}
+var addThrobber=function(map){var s3=map.s3;var map_id=s3.id;if($('#'+map_id+' .layer_throbber').length){return;}
+var div='<div class="layer_throbber float hide';if(s3.options.save){div+=' save';}
+div+='"></div>';$('#'+map_id).append(div);}
+var addSavePanel=function(map){var s3=map.s3;var map_id=s3.id;if($('#'+map_id+' .map_save_panel').length){return;}
+var name_display='<div class="fleft"><div class="map_save_name">';var config_name=s3.options.config_name;if(config_name){name_display+=config_name;}
+name_display+='</div></div>';var div='<div class="map_save_panel off">'+name_display+'<div class="btn map_save_button"><div class="map_save_label">'+i18n.gis_save_map+'</div></div></div>';$('#'+map_id).append(div);if(config_name){$('#'+map_id+' .map_save_panel').removeClass('off');}
+$('#'+map_id+' .map_save_button').click(function(){saveClickHandler(map);});}
+var saveClickHandler=function(map){var map_id=map.s3.id;$('#'+map_id+' .map_save_panel').removeClass('off');$('#'+map_id+' .map_save_panel .saved').remove();$('#'+map_id+' .map_save_panel .fleft').show();$('#'+map_id+' .map_save_label').html(i18n.save);nameConfig(map);}
+var nameConfig=function(map){var s3=map.s3;var map_id=s3.id;var options=s3.options;var config_id=options.config_id;if(options.config_name){var name=options.config_name;}else{var name='';}
+var save_button=$('#'+map_id+' .map_save_button');var input_id=map_id+'_save';var name_input=$('#'+input_id);if(!name_input.length){var name_input='<input id="'+input_id+'" value="'+name+'">';var hint='<label for="'+input_id+'">'+i18n.gis_name_map+'</label>';name_input='<div class="hint">'+hint+name_input+'</div>';if(config_id){var disabled=''}else{var disabled=' disabled="disabled" checked="checked"'}
+var checkbox='<div class="new_map"><input type="checkbox" class="checkbox"'+disabled+'>'+i18n.gis_new_map+'</div>';$('#'+map_id+' .map_save_panel .fleft').html(name_input+checkbox);$('#'+map_id+' .map_save_panel label').labelOver('over');}
+save_button.unbind('click').click(function(){saveConfig(map);var name=$('#'+map_id+'_save').val();$('#'+map_id+' .map_save_name').html(name);options.config_name=name;if(options.pe_id){var pe_url='?~.pe_id__belongs='+options.pe_id;}else{var pe_url='';}
+var div='<div class="saved"><p><i>'+i18n.saved+'</i></p><p><a href="'+S3.Ap.concat('/gis/config')+pe_url+'">'+i18n.gis_my_maps+'</a></p></div>';$('#'+map_id+' .map_save_panel .fleft').hide().before(div);$('#'+map_id+' .map_save_panel .checkbox').prop('checked',false).prop('disabled',false);save_button.unbind('click').click(function(){saveClickHandler(map);});});var savePanel=$('#'+map_id+' .map_save_panel');$('html').unbind('click.cancelSave').bind('click.cancelSave',function(){savePanel.addClass('off');save_button.unbind('click').click(function(){savePanel.removeClass('off').unbind('click');nameConfig(map);});});savePanel.click(function(event){event.stopPropagation();});}
+var saveConfig=function(map){var state=getState(map);var encode=Ext.util.JSON.encode;var layersStr=encode(state.layers);var pluginsStr=encode(state.plugins);var json_data={lat:state.lat,lon:state.lon,zoom:state.zoom,layers:layersStr,plugins:pluginsStr}
+var s3=map.s3;var options=s3.options;if(options.pe_id){json_data['pe_id']=options.pe_id;}
+var map_id=s3.id;var name_input=$('#'+map_id+'_save');var config_id=options.config_id;if(name_input.length){json_data['name']=name_input.val();if(config_id){var update=!$('#'+map_id+' .map_save_panel input[type="checkbox"]').prop('checked');}else{var update=false;}}else if(config_id){var update=true;}else{var update=false;}
+var url;if(update){url=S3.Ap.concat('/gis/config/'+config_id+'.url/update');}else{url=S3.Ap.concat('/gis/config.url/create');}
+Ext.Ajax.request({url:url,method:'POST',success:function(response,opts){var obj=Ext.decode(response.responseText);var id=obj.message.split('=',2)[1];if(id){options.config_id=id;if(history.pushState){if(document.location.search){var pairs=document.location.search.split('?')[1].split('&');var pair=[];for(var i=0;i<pairs.length;i++){pair=pairs[i].split('=');if((decodeURIComponent(pair[0])=='config')&&decodeURIComponent(pair[1])!=id){pairs[i]='config='+id;var url=document.location.pathname+'?'+pairs.join('&');window.history.pushState({},document.title,url);break;}}}else if((document.location.pathname==S3.Ap.concat('/gis/index'))||(document.location.pathname==S3.Ap.concat('/gis/map_viewing_client'))){var url=document.location.pathname+'?config='+id;window.history.pushState({},document.title,url);}}
+var url=S3.Ap.concat('/gis/config/',id,'/layer_entity');$('#gis_menu_config').attr('href',url);}},params:json_data});}
+function getState(map){var state={};var lonlat=map.getCenter();lonlat.transform(map.getProjectionObject(),proj4326);state.lon=lonlat.lon;state.lat=lonlat.lat;state.zoom=map.getZoom();var layers=[];var id,layer_config;var base_id=map.baseLayer.s3_layer_id;Ext.iterate(map.layers,function(key,val,obj){id=key.s3_layer_id;layer_config={id:id};if(key.visibility){layer_config['visible']=key.visibility;}
+if(id==base_id){layer_config['base']=true;}
+if(key.s3_style){layer_config['style']=key.s3_style;}
+layers.push(layer_config);});state.layers=layers;var plugins=[];Ext.iterate(map.s3.plugins,function(key,val,obj){if(key.getState){plugins.push(key.getState());}});state.plugins=plugins;return state;}
+var addPdfControl=function(toolbar){var map=toolbar.map;var options=map.s3.options;selectPdfControl=new OpenLayers.Control();OpenLayers.Util.extend(selectPdfControl,{draw:function(){this.box=new OpenLayers.Handler.Box(this,{'done':this.getPdf});this.box.activate();},response:function(req){this.w.destroy();var gml=new OpenLayers.Format.GML();var features=gml.read(req.responseText);var html=features.length+' pdfs. <br /><ul>';if(features.length){for(var i=0;i<features.length;i++){var f=features[i];var text=f.attributes.utm_zone+f.attributes.grid_zone+f.attributes.grid_square+f.attributes.easting+f.attributes.northing;html+="<li><a href='"+features[i].attributes.url+"'>"+text+'</a></li>';}}
+html+='</ul>';this.w=new Ext.Window({'html':html,width:300,'title':'Results',height:200});this.w.show();},getPdf:function(bounds){var current_projection=map.getProjectionObject()
+var ll=map.getLonLatFromPixel(new OpenLayers.Pixel(bounds.left,bounds.bottom)).transform(current_projection,proj4326);var ur=map.getLonLatFromPixel(new OpenLayers.Pixel(bounds.right,bounds.top)).transform(current_projection,proj4326);var boundsgeog=new OpenLayers.Bounds(ll.lon,ll.lat,ur.lon,ur.lat);bbox=boundsgeog.toBBOX();OpenLayers.Request.GET({url:options.mgrs_url+'&bbox='+bbox,callback:OpenLayers.Function.bind(this.response,this)});this.w=new Ext.Window({'html':'Searching '+options.mgrs_name+', please wait.',width:200,'title':'Please Wait.'});this.w.show();}});var tooltip='Select '+options.mgrs_name;var mgrsButton=new GeoExt.Action({text:tooltip,control:selectPdfControl,map:map,allowDepress:false,toggleGroup:'controls',tooltip:tooltip});toolbar.addSeparator();toolbar.add(mgrsButton);}
+var addWMSGetFeatureInfoControl=function(map){var wmsGetFeatureInfo=new gxp.plugins.WMSGetFeatureInfo({actionTarget:'toolbar',outputTarget:'map',outputConfig:{width:400,height:200},toggleGroup:'controls',infoActionTip:i18n.gis_get_feature_info,popupTitle:i18n.gis_feature_info});wmsGetFeatureInfo.target=map.s3;wmsGetFeatureInfo.addActions();}
+var addRemoveLayersControl=function(map,layerTree){var addLayersControl=new gxp.plugins.AddLayers({actionTarget:'treepanel.tbar',addActionTip:'Add layers',addActionMenuText:'Add layers',addServerText:'Add a New Server',doneText:'Done',upload:{url:null},uploadText:i18n.gis_uploadlayer,relativeUploadOnly:false});var store=new GeoExt.data.LayerStore();addLayersControl.target=layerTree;layerTree.proxy=OpenLayers.ProxyHost;layerTree.layerSources={};layerTree.layerSources['local']=new gxp.plugins.LayerSource({title:'local',store:store});var actions=addLayersControl.addActions();actions[0].enable();var removeLayerControl=new gxp.plugins.RemoveLayer({actionTarget:'treepanel.tbar',removeActionTip:'Remove layer'});removeLayerControl.target=layerTree;layerTree.mapPanel=map.s3.mapPanel;removeLayerControl.addActions();}
+var addLayerPropertiesButton=function(map,layerTree){var propertiesWindow=map.s3.propertiesWindow;var layerPropertiesButton=new Ext.Toolbar.Button({iconCls:'gxp-icon-layerproperties',tooltip:i18n.gis_properties,handler:function(){function isSelected(node){var selected=node.isSelected();if(selected){if(!node.leaf){return false;}else{return true;}}else{return false;}}
+var node=layerTree.root.findChildBy(isSelected,null,true);if(node){var layer_type=node.layer.s3_layer_type;var url=S3.Ap.concat('/gis/layer_'+layer_type+'.plain?layer_'+layer_type+'.layer_id='+node.layer.s3_layer_id+'&update=1');Ext.Ajax.request({url:url,method:'GET',success:function(response,opts){if(propertiesWindow){propertiesWindow.close();}
+var tabPanel;if(layer_type=='feature'){tabPanel=new Ext.TabPanel({activeTab:0,items:[{title:'Layer Properties',html:response.responseText},{title:'Filter',id:'s3_gis_layer_filter_tab',html:''}]});tabPanel.items.items[1].on('activate',function(){var search_url;Ext.iterate(map.s3.layers_feature,function(key,val,obj){if(key.id==node.layer.s3_layer_id){search_url=key.url.replace(/.geojson.+/,'/search.plain');}});Ext.get('s3_gis_layer_filter_tab').load({url:search_url,discardUrl:false,callback:function(){S3.addTooltips();S3.search.select_letter_label();},text:'Loading...',timeout:30,scripts:false});});}else{tabPanel=new Ext.Panel({title:'Layer Properties',html:response.responseText});}
+propertiesWindow=new Ext.Window({width:400,layout:'fit',items:[tabPanel]});propertiesWindow.show();$('#plain form').submit(function(){var id=$('#plain input[name="id"]').val();var update_url=S3.Ap.concat('/gis/layer_'+layer_type+'/'+id+'.plain/update');var fields=$('#plain input');var ids=[];Ext.iterate(fields,function(key,val,obj){if(val.id&&(val.id.indexOf('gis_layer_')!=-1)){ids.push(val.id);}});var pcs=[];for(i=0;i<ids.length;i++){q=$('#'+ids[i]).serialize();if(q){pcs.push(q);}}
+q=$('#plain input[name="id"]').serialize();if(q){pcs.push(q);}
+q=$('#plain input[name="_formkey"]').serialize();if(q){pcs.push(q);}
+q=$('#plain input[name="_formname"]').serialize();if(q){pcs.push(q);}
+if(pcs.length>0){var query=pcs.join("&");$.ajax({type:'POST',url:update_url,data:query}).done(function(msg){$('#plain').html(msg);});}
+return false;});S3.addTooltips();S3.autocomplete('role','admin','group','gis_layer_'+layer_type+'_role_required');}});}}});var toolbar=layerTree.getTopToolbar();toolbar.add(layerPropertiesButton);}
+var createStyleMap=function(map,layer){if(undefined!=layer.marker){var marker=layer.marker;var marker_url=marker_url_path+marker.i;var marker_height=marker.h;var marker_width=marker.w;}else{var marker_url='';}
+var opacity=layer.opacity||1;var style=layer.style;var options=map.s3.options;var scaleImage=function(){var image=this;var max_h=options.max_h||35;var max_w=options.max_w||30;var scaleRatio=image.height/image.width;var w=Math.min(image.width,max_w);var h=w*scaleRatio;if(h>max_h){h=max_h;scaleRatio=w/h;w=w*scaleRatio;}
+image.height=h;image.width=w;};var styleArray={label:'${label}',labelAlign:'cm',pointRadius:'${radius}',fillColor:'${fill}',fillOpacity:'${fillOpacity}',strokeColor:'${stroke}',strokeWidth:'${strokeWidth}',strokeOpacity:'${strokeOpacity}',graphicWidth:'${graphicWidth}',graphicHeight:'${graphicHeight}',graphicXOffset:'${graphicXOffset}',graphicYOffset:'${graphicYOffset}',graphicOpacity:opacity,graphicName:'${graphicName}',externalGraphic:'${externalGraphic}'};var styleOptions={context:{graphicWidth:function(feature){var pix=1;if(feature.cluster){}else if(feature.attributes.marker_width){pix=feature.attributes.marker_width;}else{if(undefined!=marker_width){pix=marker_width;}}
+return pix;},graphicHeight:function(feature){var pix=1;if(feature.cluster){}else if(feature.attributes.marker_height){pix=feature.attributes.marker_height;}else{if(undefined!=marker_height){pix=marker_height;}}
+return pix;},graphicXOffset:function(feature){var pix=-1;if(feature.cluster){}else if(feature.attributes.marker_width){pix=-(feature.attributes.marker_width/2);}else{if(undefined!=marker_width){pix=-(marker_width/2);}}
+return pix;},graphicYOffset:function(feature){var pix=-1;if(feature.cluster){}else if(feature.attributes.marker_height){pix=-feature.attributes.marker_height;}else{if(undefined!=marker_height){pix=-marker_height;}}
+return pix;},graphicName:function(feature){var graphic='circle';if(feature.cluster){}else if(feature.attributes.shape){graphic=feature.attributes.shape;}else if(style){if(!style_array){if(undefined!=style.graphic){graphic=style.graphic;}}else{}}
+return graphic;},externalGraphic:function(feature){var url='';if(feature.cluster){}else if(feature.attributes.marker_url){url=feature.attributes.marker_url;}else if(style){if(!style_array){if(undefined!=style.externalGraphic){url=S3.Ap.concat('/static/'+style.externalGraphic);}}else{}}else{return marker_url;}
+return url;},radius:function(feature){var pix=10;if(feature.cluster){pix=Math.min(feature.attributes.count/2,8)+10;}else if(feature.attributes.size){pix=feature.attributes.size;}else if(style){if(!style_array){pix=style.size;}else{}}
+return pix;},fill:function(feature){var color;if(feature.cluster){if(feature.cluster[0].attributes.colour){color=feature.cluster[0].attributes.colour;}else{color='#8087ff';}}else if(feature.attributes.colour){color=feature.attributes.colour;}else if(style){if(!style_array){color=style.fill;}else{}
+if(undefined!=color){color='#'+color;}else{color='#000000';}}else{color=DEFAULT_FILL;}
+return color;},fillOpacity:function(feature){var fillOpacity;if(feature.cluster){if(feature.cluster[0].attributes.opacity){fillOpacity=feature.cluster[0].attributes.opacity;}else{fillOpacity=opacity;}}else if(feature.attributes.opacity){fillOpacity=feature.attributes.opacity;}else if(style){if(!style_array){fillOpacity=style.fillOpacity;}else{}}
+return fillOpacity||opacity;},stroke:function(feature){var color;if(feature.cluster){if(feature.cluster[0].attributes.colour){color=feature.cluster[0].attributes.colour;}else{color='#2b2f76';}}else if(feature.attributes.colour){color=feature.attributes.colour;}else if(style){if(!style_array){color=style.stroke||style.fill;}else{}
+if(undefined!=color){color='#'+color;}else{color='#000000';}}else{color=DEFAULT_FILL;}
+return color;},strokeOpacity:function(feature){var strokeOpacity;if(feature.cluster){if(feature.cluster[0].attributes.opacity){strokeOpacity=feature.cluster[0].attributes.opacity;}else{strokeOpacity=opacity;}}else if(feature.attributes.opacity){strokeOpacity=feature.attributes.opacity;}else if(style){if(!style_array){strokeOpacity=style.strokeOpacity;}else{}}
+return strokeOpacity||opacity;},strokeWidth:function(feature){var width=2;if(feature.cluster){if(feature.cluster[0].attributes.strokeWidth){width=feature.cluster[0].attributes.strokeWidth;}}else if(style){if(!style_array){width=style.strokeWidth;}else{}}
+return width||2;},label:function(feature){var label;if(feature.cluster){if(feature.attributes.count>1){label=feature.attributes.count;}}else if(feature.layer&&(undefined!=feature.layer.s3_style)){var style=feature.layer.s3_style;if(!style_array){if(style.show_label){label=style.label;}}else{}}
+return label||'';}}};var featureStyle=new OpenLayers.Style(styleArray,styleOptions);if(Object.prototype.toString.call(style)==='[object Array]'){var style_array=true;}else{var style_array=false;}
+if(style_array){var rules=[];var prop,filter,rule,symbolizer,title,value,externalGraphic,graphicHeight,graphicWidth,graphicXOffset,graphicYOffset,fill,fillOpacity,size,strokeOpacity,strokeWidth;$.each(style,function(index,elem){if(undefined!=elem.prop){prop=elem.prop;}else{prop='value';}
+if(undefined!=elem.cat){value=elem.cat;title=elem.label||value;filter=new OpenLayers.Filter.Comparison({type:OpenLayers.Filter.Comparison.EQUAL_TO,property:prop,value:value});}else{title=elem.label||(elem.low+'-'+elem.high);filter=new OpenLayers.Filter.Comparison({type:OpenLayers.Filter.Comparison.BETWEEN,property:prop,lowerBoundary:elem.low,upperBoundary:elem.high});}
+if(undefined!=elem.externalGraphic){externalGraphic=S3.Ap.concat('/static/'+elem.externalGraphic);var image=new Image();image.src=externalGraphic;graphicHeight=image.height;graphicWidth=image.width;graphicXOffset=-(graphicWidth/2);graphicYOffset=-graphicHeight;}else{externalGraphic='';graphicHeight=1;graphicWidth=1;graphicXOffset=-1;graphicYOffset=-1;}
+if(undefined!=elem.fill){fill='#'+elem.fill;}else if(undefined!=elem.stroke){fill='#'+elem.stroke;}
+if(undefined!=elem.fillOpacity){fillOpacity=elem.fillOpacity;}else{fillOpacity=opacity;}
+if(undefined!=elem.strokeOpacity){strokeOpacity=elem.strokeOpacity;}else{strokeOpacity=1;}
+if(undefined!=elem.graphic){graphic=elem.graphic;}else{graphic='square';}
+if(undefined!=elem.size){size=elem.size;}else{size=10;}
+if(undefined!=elem.strokeWidth){strokeWidth=elem.strokeWidth;}else{strokeWidth=2;}
+rule=new OpenLayers.Rule({filter:filter,symbolizer:{externalGraphic:externalGraphic,fillColor:fill,fillOpacity:fillOpacity,strokeColor:fill,strokeOpacity:strokeOpacity,strokeWidth:strokeWidth,graphicName:graphic,graphicHeight:graphicHeight,graphicWidth:graphicWidth,graphicXOffset:graphicXOffset,graphicYOffset:graphicYOffset,pointRadius:size},title:title});rules.push(rule);});if(layer.cluster_threshold!=0){rule=new OpenLayers.Rule({elseFilter:true,title:' '});rules.push(rule);}
+featureStyle.addRules(rules);}
+if(opacity!=1){var selectStyle={graphicOpacity:1};}else{var selectStyle={fillColor:'#ffdc33',strokeColor:'#ff9933'};}
+var featureStyleMap=new OpenLayers.StyleMap({'default':featureStyle,'select':selectStyle});return[featureStyleMap,marker_url];}}());
\ No newline at end of file
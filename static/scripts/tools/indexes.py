@@ -9,31 +9,16 @@
 #
 # - normally run from fabfile.py as part of the upgrade cycle for instances
 #
+# - the indexes are declared in the models (define_table(..., indexes=[...]),
+#   see S3Index), plus automatic indexes for foreign keys, the deleted flag,
+#   modified_on and the ownership fields (settings.base.auto_indexes)
+#
 
-tablename = "pr_person"
-field = "first_name"
-try:
-    db.executesql("CREATE INDEX %s__idx on %s(%s);" % (field, tablename, field))
-except:
-    # Index already present
-    pass
-field = "middle_name"
-try:
-    db.executesql("CREATE INDEX %s__idx on %s(%s);" % (field, tablename, field))
-except:
-    # Index already present
-    pass
-field = "last_name"
-try:
-    db.executesql("CREATE INDEX %s__idx on %s(%s);" % (field, tablename, field))
-except:
-    # Index already present
-    pass
+s3db.load_all_models()
+if settings.get_base_journal():
+    s3base.S3Journal.table()
 
-tablename = "gis_location"
-field = "name"
-try:
-    db.executesql("CREATE INDEX %s__idx on %s(%s);" % (field, tablename, field))
-except:
-    # Index already present
-    pass
+created = s3db.create_indexes()
+for name in created:
+    print "Created index %s" % name
+print "%s indexes created" % len(created)
@@ -0,0 +1,12 @@
+#!/usr/bin/python
+
+# Script to rebuild the ancestry table of the OU hierarchy (pr_ancestry),
+# e.g. after bulk imports or database edits which bypassed
+# pr_add_affiliation/pr_remove_affiliation and the affiliation callbacks
+#
+# Needs to be run in the web2py environment
+# python web2py.py -S eden -M -R applications/eden/static/scripts/tools/rebuild_ancestry.py
+
+updated = s3db.pr_rebuild_ancestry()
+print "pr_ancestry: %s records" % updated
+db.commit()
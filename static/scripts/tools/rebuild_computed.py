@@ -0,0 +1,25 @@
+#!/usr/bin/python
+
+# Script to (re-)compute persisted computed columns, e.g. to backfill
+# the values after adding a computed column, or after bulk updates
+# which bypassed the onaccept/ondelete hooks
+#
+# Needs to be run in the web2py environment
+# python web2py.py -S eden -M -R applications/eden/static/scripts/tools/rebuild_computed.py
+#
+# To rebuild only certain tables, add the table names as arguments:
+# python web2py.py -S eden -M -R applications/eden/static/scripts/tools/rebuild_computed.py -A project_project
+
+import sys
+
+# Load all Models
+s3db.load_all_models()
+
+tablenames = sys.argv[1:]
+if not tablenames:
+    tablenames = sorted(s3db.COMPUTED)
+
+for tablename in tablenames:
+    updated = s3db.rebuild_computed(tablename)
+    print "%s: %s records updated" % (tablename, updated)
+    db.commit()
@@ -0,0 +1,17 @@
+#!/usr/bin/python
+
+# Script to rebuild the Location Hierarchy (Materialized path, Lx &
+# inherited Lat/Lon of all gis_location records), e.g. after bulk imports
+# of Admin Boundaries, and report the throughput
+#
+# Needs to be run in the web2py environment
+# python web2py.py -S eden -M -R applications/eden/static/scripts/tools/rebuild_location_tree.py
+
+import time
+
+start = time.time()
+count = gis.update_location_tree()
+db.commit()
+duration = time.time() - start
+print "gis_location: %s records in %.1fs (%.0f/s)" % \
+      (count, duration, count / duration if duration else count)